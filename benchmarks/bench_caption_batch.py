@@ -0,0 +1,96 @@
+"""Throughput benchmark: render_subtitles_batch vs. render_subtitle in a loop.
+
+Generates synthetic SRT files and renders them twice, once by calling
+``render_subtitle`` for each file and once through ``render_subtitles_batch``.
+Requires FFmpeg with libass on PATH.
+
+Usage:
+    python benchmarks/bench_caption_batch.py --files 24 --cues 40 --workers 4
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.caption.captionApi import RenderConfig, render_subtitle  # noqa: E402
+from audio_visualizer.caption.captionBatch import (  # noqa: E402
+    BatchRenderItem,
+    render_subtitles_batch,
+)
+
+_WORDS = (
+    "the quick brown fox jumps over a lazy dog while the band plays "
+    "a slow song for everyone in the room tonight"
+).split()
+
+
+def _format_time(ms: int) -> str:
+    hours, rem = divmod(ms, 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    seconds, millis = divmod(rem, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{millis:03d}"
+
+
+def _write_srt(path: Path, cues: int, seed: int) -> None:
+    blocks = []
+    for index in range(cues):
+        start = index * 1500
+        words = [_WORDS[(seed + index + k) % len(_WORDS)] for k in range(6 + index % 5)]
+        blocks.append(
+            f"{index + 1}\n{_format_time(start)} --> {_format_time(start + 1400)}\n"
+            f"{' '.join(words)}\n"
+        )
+    path.write_text("\n".join(blocks), encoding="utf-8")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=12)
+    parser.add_argument("--cues", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-duration", type=float, default=4.0,
+                        help="Clamp each render to this many seconds (0 = full length)")
+    parser.add_argument("--preset", default="modern_box")
+    args = parser.parse_args()
+
+    config = RenderConfig(preset=args.preset, max_duration_sec=args.max_duration)
+
+    with tempfile.TemporaryDirectory(prefix="bench_caption_batch_") as temp_dir:
+        root = Path(temp_dir)
+        inputs = []
+        for index in range(args.files):
+            path = root / "in" / f"clip_{index:03d}.srt"
+            path.parent.mkdir(exist_ok=True)
+            _write_srt(path, args.cues, index)
+            inputs.append(path)
+
+        loop_dir = root / "loop"
+        loop_dir.mkdir()
+        start = time.perf_counter()
+        loop_ok = 0
+        for path in inputs:
+            result = render_subtitle(path, loop_dir / f"{path.stem}.mov", config=config)
+            loop_ok += int(result.success)
+        loop_sec = time.perf_counter() - start
+
+        batch_dir = root / "batch"
+        items = [BatchRenderItem(path, batch_dir / f"{path.stem}.mov") for path in inputs]
+        batch = render_subtitles_batch(items, config=config, max_workers=args.workers)
+
+    print(f"files={args.files} cues={args.cues} workers={args.workers}")
+    print(f"{'mode':<22}{'ok':>6}{'seconds':>10}{'files/s':>10}")
+    print(f"{'render_subtitle loop':<22}{loop_ok:>6}{loop_sec:>10.2f}"
+          f"{args.files / loop_sec:>10.2f}")
+    print(f"{'render_subtitles_batch':<22}{batch.succeeded:>6}{batch.elapsed_sec:>10.2f}"
+          f"{args.files / batch.elapsed_sec:>10.2f}")
+    print(f"speedup: {loop_sec / batch.elapsed_sec:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
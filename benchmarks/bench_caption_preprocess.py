@@ -0,0 +1,134 @@
+"""Preprocessing benchmark: compiled event pipeline vs. the staged passes.
+
+Generates a large karaoke-style SRT and builds the working ASS twice, once
+with one full pass over the events per stage (markdown, ``apply_style``,
+``apply_animation``, ``compute_size``) as the pipeline used to run, and
+once with ``prepare_working_ass``. Both outputs must be byte-identical.
+No FFmpeg is needed.
+
+Usage:
+    python benchmarks/bench_caption_preprocess.py --events 20000 --animation word_highlight
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.caption.animations import AnimationRegistry  # noqa: E402
+from audio_visualizer.caption.captionApi import RenderConfig, prepare_working_ass  # noqa: E402
+from audio_visualizer.caption.core.config import PresetConfig  # noqa: E402
+from audio_visualizer.caption.core.markdownToAss import markdown_to_ass  # noqa: E402
+from audio_visualizer.caption.core.sizing import SizeCalculator  # noqa: E402
+from audio_visualizer.caption.core.style import StyleBuilder  # noqa: E402
+from audio_visualizer.caption.core.subtitle import SubtitleFile  # noqa: E402
+from audio_visualizer.caption.presets.defaults import get_builtin_preset  # noqa: E402
+from audio_visualizer.caption.rendering.progressTracker import ProgressTracker  # noqa: E402
+from audio_visualizer.events import AppEventEmitter  # noqa: E402
+
+_WORDS = (
+    "the quick brown fox jumps over a lazy dog while the band plays "
+    "a slow song for everyone in the room tonight don't stop"
+).split()
+
+
+def _format_time(ms: int) -> str:
+    hours, rem = divmod(ms, 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    seconds, millis = divmod(rem, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{millis:03d}"
+
+
+def _write_srt(path: Path, events: int) -> None:
+    rng = random.Random(1)
+    blocks = []
+    for index in range(events):
+        words = [rng.choice(_WORDS) for _ in range(rng.randint(4, 14))]
+        if index % 7 == 0:
+            words[1] = f"**{words[1]}**"
+        if index % 5 == 0:
+            words[2] = f"=={words[2]}=="
+        start = index * 1500
+        blocks.append(
+            f"{index + 1}\n{_format_time(start)} --> {_format_time(start + 1400)}\n"
+            f"{' '.join(words)}\n"
+        )
+    path.write_text("\n".join(blocks), encoding="utf-8")
+
+
+def _prepare_staged(input_path, ass_path, preset, config, font) -> None:
+    subtitle = SubtitleFile.load(input_path)
+    for event in subtitle.subs.events:
+        if event.text:
+            event.text = markdown_to_ass(event.text)
+    subtitle.apply_style(StyleBuilder(preset).build("Default"), preset, font=font)
+    animation = None
+    if preset.animation:
+        animation = AnimationRegistry.create(preset.animation.type, preset.animation.params)
+        subtitle.apply_animation(animation)
+    size_calc = SizeCalculator(preset, safety_scale=config.safety_scale, font=font)
+    size = size_calc.compute_size(subtitle.subs)
+    position = size_calc.compute_anchor_position(size)
+    subtitle.apply_center_positioning(position, size)
+    subtitle.set_play_resolution(size)
+    subtitle.save(ass_path)
+    if animation is not None and animation.supports_placeholder_substitution():
+        content = ass_path.read_text(encoding="utf-8")
+        ass_path.write_text(animation.substitute_placeholders(content, position), encoding="utf-8")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--preset", default="modern_box")
+    parser.add_argument("--animation", default="word_highlight",
+                        help="Animation type to apply (empty = preset default)")
+    args = parser.parse_args()
+
+    data = get_builtin_preset(args.preset)
+    if args.animation:
+        data["animation"] = {
+            **AnimationRegistry.get_defaults(args.animation),
+            "type": args.animation,
+        }
+    preset = PresetConfig.from_dict(data)
+    config = RenderConfig(preset=args.preset)
+    font = SizeCalculator(preset).font
+
+    with tempfile.TemporaryDirectory(prefix="bench_caption_preprocess_") as temp_dir:
+        root = Path(temp_dir)
+        input_path = root / "input.srt"
+        _write_srt(input_path, args.events)
+
+        start = time.perf_counter()
+        _prepare_staged(input_path, root / "staged.ass", preset, config, font)
+        staged_sec = time.perf_counter() - start
+
+        start = time.perf_counter()
+        prepare_working_ass(
+            input_path=input_path,
+            ass_path=root / "compiled.ass",
+            config=config,
+            preset=preset,
+            progress=ProgressTracker(AppEventEmitter(), enabled=False),
+            font=font,
+        )
+        compiled_sec = time.perf_counter() - start
+
+        identical = (root / "staged.ass").read_bytes() == (root / "compiled.ass").read_bytes()
+
+    print(f"events={args.events} preset={args.preset} animation={preset.animation.type}")
+    print(f"{'mode':<12}{'seconds':>10}{'events/s':>12}")
+    print(f"{'staged':<12}{staged_sec:>10.2f}{args.events / staged_sec:>12.0f}")
+    print(f"{'compiled':<12}{compiled_sec:>10.2f}{args.events / compiled_sec:>12.0f}")
+    print(f"speedup: {staged_sec / compiled_sec:.2f}x  byte-identical: {identical}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Cold vs. warm preset and font loading.
+
+Creates a preset directory with many preset files and times
+``PresetLoader().load()`` plus measurement-font loading (``SizeCalculator``)
+for a preset found by directory search. The cold numbers come from a fresh
+interpreter, so they include module imports; the warm numbers are repeat
+loads in the same process.
+
+Usage:
+    python benchmarks/bench_caption_presets.py --presets 200 --repeat 200
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+_PROBE = """
+import sys, time
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+from audio_visualizer.caption.core.sizing import SizeCalculator
+from audio_visualizer.caption.presets.loader import PresetLoader
+imported = time.perf_counter()
+preset = PresetLoader(preset_dirs=[__import__("pathlib").Path({preset_dir!r})]).load({name!r})
+SizeCalculator(preset)
+done = time.perf_counter()
+print(imported - start, done - imported)
+"""
+
+
+def _write_presets(preset_dir: Path, count: int) -> None:
+    for index in range(count):
+        data = {
+            "font_size": 40 + index % 30,
+            "padding": [10, 20, 10, 20],
+            "max_width_px": 900 + index,
+            "animation": {"type": "fade", "in_ms": 100, "out_ms": 100},
+        }
+        (preset_dir / f"preset_{index:04d}.json").write_text(json.dumps(data), encoding="utf-8")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--presets", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_caption_presets_") as temp_dir:
+        preset_dir = Path(temp_dir)
+        _write_presets(preset_dir, args.presets)
+        name = f"preset_{args.presets - 1:04d}"
+
+        probe = _PROBE.format(src=str(ROOT / "src"), preset_dir=str(preset_dir), name=name)
+        output = subprocess.run(
+            [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+        ).stdout.split()
+        import_sec, cold_sec = (float(value) for value in output)
+
+        from audio_visualizer.caption.core.sizing import SizeCalculator
+        from audio_visualizer.caption.presets.loader import PresetLoader
+
+        loader = PresetLoader(preset_dirs=[preset_dir])
+        SizeCalculator(loader.load(name))
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            SizeCalculator(loader.load(name))
+        warm_sec = (time.perf_counter() - start) / args.repeat
+
+    print(f"presets={args.presets} repeat={args.repeat}")
+    print(f"imports (cold process):     {import_sec * 1000:8.2f} ms")
+    print(f"cold preset + font load:    {cold_sec * 1000:8.2f} ms")
+    print(f"warm preset + font load:    {warm_sec * 1000:8.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""Loading long transcripts: JSON bundles vs. columnar bundles.
+
+Generates a podcast-length bundle (a word every ``1 / --wps`` seconds,
+eight words per subtitle, UUID ids, confidences, two speakers), writes it
+as a JSON bundle and as a columnar ``.avbundle``, then times and measures
+the peak Python allocations (tracemalloc, in a separate run) of:
+
+* ``read_bundle`` itself (the JSON parse + normalize vs. opening the map),
+* the caption renderer load (``SubtitleFile.load_bundle``),
+* the SRT editor load (``SubtitleDocument.load_bundle``).
+
+It also checks that the columnar bundle materializes to the same
+normalized bundle as the JSON file.
+
+Usage:
+    python benchmarks/bench_columnar_bundle.py --hours 3 --wps 2.8
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.caption.core.subtitle import SubtitleFile  # noqa: E402
+from audio_visualizer.srt.io.bundleReader import read_bundle  # noqa: E402
+from audio_visualizer.srt.io.columnarBundle import convert_json_to_columnar  # noqa: E402
+from audio_visualizer.ui.tabs.srtEdit.document import SubtitleDocument  # noqa: E402
+
+_WORDS = "so the thing is we kind of went back and forth about whether it really mattered".split()
+
+
+def _make_bundle(hours: float, wps: float, seed: int) -> dict:
+    rng = random.Random(seed)
+    step = 1.0 / wps
+    n_words = int(hours * 3600 * wps)
+    subtitles = []
+    flat = []
+    for first in range(0, n_words, 8):
+        sub_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        speaker = f"SPEAKER_{(first // 400) % 2:02d}"
+        words = []
+        for i in range(first, min(first + 8, n_words)):
+            word = {
+                "id": str(uuid.UUID(int=rng.getrandbits(128))),
+                "subtitle_id": sub_id,
+                "text": rng.choice(_WORDS),
+                "start": round(i * step, 3),
+                "end": round(i * step + step * 0.8, 3),
+                "confidence": round(rng.uniform(0.5, 1.0), 4),
+                "speaker_label": speaker,
+            }
+            words.append(word)
+            flat.append(word)
+        text = " ".join(w["text"] for w in words)
+        subtitles.append({
+            "id": sub_id,
+            "start": words[0]["start"],
+            "end": words[-1]["end"],
+            "text": text,
+            "original_text": text,
+            "words": words,
+            "speaker_label": speaker,
+            "source_media_path": "/media/podcast_episode.mp3",
+            "model_name": "large-v3",
+            "device": "cuda",
+            "compute_type": "float16",
+        })
+    return {
+        "tool_version": "0.7.0",
+        "input_file": "/media/podcast_episode.mp3",
+        "device_used": "cuda",
+        "compute_type_used": "float16",
+        "model_name": "large-v3",
+        "config": None,
+        "subtitles": subtitles,
+        "words": flat,
+    }
+
+
+def _measure(fn, path: Path, repeat: int):
+    """Best wall time over *repeat* runs, then peak allocations of one run."""
+    seconds = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn(path)
+        seconds = min(seconds, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    fn(path)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 1e6
+
+
+def _load_document(path: Path) -> SubtitleDocument:
+    doc = SubtitleDocument()
+    doc.load_bundle(str(path))
+    return doc
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=3.0, help="Transcript length")
+    parser.add_argument("--wps", type=float, default=2.8, help="Words per second")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per load (best is reported)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "podcast.bundle.json"
+        columnar_path = Path(tmp) / "podcast.avbundle"
+        raw = _make_bundle(args.hours, args.wps, args.seed)
+        json_path.write_text(json.dumps(raw, ensure_ascii=False, indent=2), encoding="utf-8")
+        n_subs, n_words = len(raw["subtitles"]), len(raw["words"])
+        del raw
+        start = time.perf_counter()
+        convert_json_to_columnar(json_path, columnar_path)
+        convert_s = time.perf_counter() - start
+        print(f"input: {args.hours:g} h, {n_subs} subtitles, {n_words} words; "
+              f"JSON {json_path.stat().st_size / 1e6:.1f} MB, columnar {columnar_path.stat().st_size / 1e6:.1f} MB "
+              f"(converted in {convert_s:.2f}s)")
+
+        rows = []
+        for label, fn in (
+            ("read_bundle", read_bundle),
+            ("caption SubtitleFile.load_bundle", SubtitleFile.load_bundle),
+            ("editor SubtitleDocument.load_bundle", _load_document),
+        ):
+            json_s, json_mb = _measure(fn, json_path, args.repeat)
+            col_s, col_mb = _measure(fn, columnar_path, args.repeat)
+            rows.append((label, json_s, json_mb, col_s, col_mb))
+
+        same = read_bundle(json_path) == read_bundle(columnar_path).to_dict()
+
+    print(f"{'':38} {'JSON':>18} {'columnar':>18}")
+    for label, json_s, json_mb, col_s, col_mb in rows:
+        print(f"{label:38} {json_s:7.3f}s {json_mb:7.1f} MB {col_s:7.3f}s {col_mb:7.1f} MB  "
+              f"({json_s / max(col_s, 1e-9):.1f}x)")
+    print(f"lossless round trip: {'ok' if same else 'MISMATCH'}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,146 @@
+"""Correction import throughput: per-call connections vs. pooled and batched writes.
+
+Generates corrections like the SRT editor records them and writes them
+three ways:
+
+* the previous ``record_correction`` path: a fresh connection (and PRAGMAs)
+  for a duplicate lookup, then another one for the insert;
+* ``record_correction`` on the pooled per-thread connection;
+* ``record_corrections`` writing everything in one transaction.
+
+The per-call paths commit once per row, so they run on ``--sample`` rows
+and are reported per row and extrapolated to the full import.  The batch
+import is then repeated to time duplicate detection through the unique
+index, and the row counts are checked.
+
+Usage:
+    python benchmarks/bench_correction_db.py --rows 100000 --sample 2000
+"""
+
+import argparse
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.core.correctionDb import CorrectionDatabase  # noqa: E402
+
+_WORDS = "the quick brown fox jumps over a lazy dog gonna wanna kinda hello world".split()
+
+
+def _make_corrections(count: int, seed: int):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        words = [rng.choice(_WORDS) for _ in range(rng.randint(4, 10))]
+        original = " ".join(words)
+        words[rng.randrange(len(words))] = rng.choice(_WORDS).upper()
+        rows.append({
+            "source_media_path": f"/media/episode_{i % 50:02d}.wav",
+            "time_start_ms": i * 1500,
+            "time_end_ms": i * 1500 + 1200,
+            "original_text": original,
+            "corrected_text": " ".join(words) + ".",
+            "speaker_label": f"SPEAKER_{i % 3:02d}",
+            "model_name": "large-v3",
+            "bundle_entry_id": f"entry-{i}",
+        })
+    return rows
+
+
+def _legacy_connect(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(path), timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _legacy_record(path: Path, c: dict) -> None:
+    """The previous record_correction: lookup connection, then insert connection."""
+    params = (
+        c["source_media_path"], c["time_start_ms"], c["time_end_ms"], c["original_text"],
+        c["corrected_text"], c.get("speaker_label"), c.get("model_name"), c.get("lora_name"),
+        c.get("confidence"), c.get("bundle_entry_id"),
+    )
+    conn = _legacy_connect(path)
+    try:
+        row = conn.execute(
+            "SELECT id FROM corrections WHERE source_media_path = ? AND time_start_ms = ? "
+            "AND time_end_ms = ? AND original_text = ? AND corrected_text = ? "
+            "AND speaker_label IS ? AND model_name IS ? AND lora_name IS ? "
+            "AND confidence IS ? AND bundle_entry_id IS ? LIMIT 1",
+            params,
+        ).fetchone()
+    finally:
+        conn.close()
+    if row is not None:
+        return
+    conn = _legacy_connect(path)
+    try:
+        conn.execute(
+            "INSERT INTO corrections (source_media_path, time_start_ms, time_end_ms, "
+            "original_text, corrected_text, speaker_label, model_name, lora_name, "
+            "confidence, bundle_entry_id, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            params + (datetime.now(timezone.utc).isoformat(),),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Corrections to import")
+    parser.add_argument("--sample", type=int, default=2000, help="Rows for the per-call paths")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rows = _make_corrections(args.rows, args.seed)
+    sample = rows[: args.sample]
+    print(f"input: {len(rows)} corrections, per-call paths timed on {len(sample)}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = Path(tmp) / "legacy.db"
+        CorrectionDatabase(legacy_path).close()
+        start = time.perf_counter()
+        for c in sample:
+            _legacy_record(legacy_path, c)
+        legacy_s = (time.perf_counter() - start) / len(sample)
+
+        pooled_db = CorrectionDatabase(Path(tmp) / "pooled.db")
+        start = time.perf_counter()
+        for c in sample:
+            pooled_db.record_correction(**c)
+        pooled_s = (time.perf_counter() - start) / len(sample)
+        pooled_db.close()
+
+        db = CorrectionDatabase(Path(tmp) / "batch.db")
+        start = time.perf_counter()
+        inserted = db.record_corrections(rows)
+        batch_s = time.perf_counter() - start
+        start = time.perf_counter()
+        repeated = db.record_corrections(rows)
+        repeat_s = time.perf_counter() - start
+        count = db.correction_count()
+        db.close()
+
+    n = len(rows)
+    print(f"per-call connections  {legacy_s * 1e3:8.3f} ms/row  (~{legacy_s * n:8.1f}s for {n})")
+    print(f"pooled connection     {pooled_s * 1e3:8.3f} ms/row  (~{pooled_s * n:8.1f}s for {n})")
+    print(f"batched transaction   {batch_s / n * 1e3:8.4f} ms/row  ({batch_s:8.2f}s for {n}, "
+          f"{legacy_s * n / batch_s:,.0f}x vs per-call)")
+    print(f"re-import duplicates  {repeat_s:8.2f}s  (inserted {repeated})")
+    ok = inserted == n and repeated == 0 and count == n
+    print(f"row counts {'ok' if ok else 'WRONG'}: inserted {inserted}, stored {count}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,198 @@
+"""LoRA training data loading: per-epoch feature extraction vs. the feature cache.
+
+Writes ``--clips`` synthetic training clips (1-8 s of noise-modulated tones
+at 16 kHz), then measures data loading for ``--epochs`` epochs two ways:
+
+* uncached: every item decodes its WAV and recomputes log-mel features,
+  as the trainer's dataset did before the cache;
+* cached: ``precompute_features`` fills the memory-mapped shard once
+  (timed separately, with ``--workers`` processes), then every item reads
+  its features from the shard.
+
+The feature extractor is transformers' ``WhisperFeatureExtractor`` when
+transformers is installed, otherwise a NumPy implementation of Whisper's
+80-bin log-mel front end.  With torch and transformers installed,
+``--train`` also times CPU training epochs of a tiny randomly initialised
+Whisper model on both datasets through a prefetching DataLoader.
+
+Usage:
+    python benchmarks/bench_lora_feature_cache.py --clips 400 --epochs 3
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+import numpy as np  # noqa: E402
+
+from audio_visualizer.core.clipExport import write_wav  # noqa: E402
+from audio_visualizer.srt.training.featureCache import compute_features, precompute_features  # noqa: E402
+from audio_visualizer.srt.training.loraTrainer import _load_audio_file  # noqa: E402
+
+
+class NumpyLogMel:
+    """Whisper's log-mel front end (n_fft 400, hop 160, 80 mels, 30 s) in NumPy."""
+
+    def __init__(self, n_mels: int = 80, sampling_rate: int = 16000):
+        self.n_fft, self.hop_length, self.n_mels, self.sampling_rate = 400, 160, n_mels, sampling_rate
+        self.n_samples = 30 * sampling_rate
+        self.window = np.hanning(self.n_fft + 1)[:-1].astype(np.float32)
+        self.mel_filters = self._mel_filters()
+
+    def _mel_filters(self):
+        def hz_to_mel(hz):
+            return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+        mels = np.linspace(hz_to_mel(0.0), hz_to_mel(self.sampling_rate / 2), self.n_mels + 2)
+        hz = 700.0 * (10 ** (mels / 2595.0) - 1.0)
+        bins = np.fft.rfftfreq(self.n_fft, 1.0 / self.sampling_rate)
+        filters = np.zeros((self.n_mels, len(bins)), dtype=np.float32)
+        for m in range(self.n_mels):
+            lo, mid, hi = hz[m], hz[m + 1], hz[m + 2]
+            filters[m] = np.maximum(0.0, np.minimum((bins - lo) / (mid - lo), (hi - bins) / (hi - mid)))
+        return filters
+
+    def to_dict(self):
+        return {"feature_size": self.n_mels, "hop_length": self.hop_length, "n_fft": self.n_fft,
+                "sampling_rate": self.sampling_rate, "mel_filters": self.mel_filters}
+
+    def __call__(self, audio, sampling_rate, return_tensors="np"):
+        padded = np.zeros(self.n_samples + self.n_fft, dtype=np.float32)
+        clip = np.asarray(audio, dtype=np.float32)[:self.n_samples]
+        padded[self.n_fft // 2:self.n_fft // 2 + len(clip)] = clip
+        frames = np.lib.stride_tricks.sliding_window_view(padded, self.n_fft)[::self.hop_length][:-1]
+        power = np.abs(np.fft.rfft(frames * self.window, axis=1)) ** 2
+        log_spec = np.log10(np.maximum(self.mel_filters @ power.T, 1e-10))
+        log_spec = np.maximum(log_spec, log_spec.max() - 8.0)
+        return SimpleNamespace(input_features=((log_spec + 4.0) / 4.0)[None])
+
+
+def _make_extractor():
+    try:
+        from transformers import WhisperFeatureExtractor
+    except ImportError:
+        return NumpyLogMel(), "NumPy log-mel stand-in"
+    return WhisperFeatureExtractor(), "transformers WhisperFeatureExtractor"
+
+
+def _write_clips(directory: Path, count: int, seed: int):
+    rng = np.random.default_rng(seed)
+    paths = []
+    for i in range(count):
+        t = np.arange(int(16000 * rng.uniform(1.0, 8.0))) / 16000
+        signal = np.sin(2 * np.pi * rng.uniform(100, 400) * t) * (1 + 0.3 * rng.standard_normal(len(t)))
+        path = directory / f"clip_{i:05d}.wav"
+        write_wav(path, (signal * 8000).astype("<i2").tobytes(), 16000, 1, 2)
+        paths.append(str(path))
+    return paths
+
+
+def _train_epochs(dataset, epochs: int, workers: int) -> float:
+    """Seconds per epoch of a tiny Whisper model on CPU."""
+    import torch
+    from torch.utils.data import DataLoader
+    from transformers import WhisperConfig, WhisperForConditionalGeneration
+
+    torch.manual_seed(0)
+    config = WhisperConfig(
+        d_model=64, encoder_layers=1, decoder_layers=1, encoder_attention_heads=2,
+        decoder_attention_heads=2, encoder_ffn_dim=128, decoder_ffn_dim=128, vocab_size=64,
+    )
+    model = WhisperForConditionalGeneration(config)
+    optimizer = torch.optim.AdamW(model.parameters(), lr=1e-4)
+    loader = DataLoader(
+        dataset, batch_size=8, shuffle=True, num_workers=workers,
+        persistent_workers=workers > 0, prefetch_factor=4 if workers > 0 else None,
+    )
+    start = time.perf_counter()
+    for _ in range(epochs):
+        for batch in loader:
+            loss = model(input_features=batch["input_features"], labels=batch["labels"]).loss
+            loss.backward()
+            optimizer.step()
+            optimizer.zero_grad()
+    return (time.perf_counter() - start) / epochs
+
+
+class _UncachedDataset:
+    """The pre-cache behaviour: decode and extract features on every access."""
+
+    def __init__(self, paths, extractor):
+        self.paths, self.extractor = paths, extractor
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __getitem__(self, idx):
+        import torch
+
+        features = compute_features(self.extractor, _load_audio_file(self.paths[idx]))
+        return {"input_features": torch.from_numpy(features), "labels": torch.tensor([1, 2, 3, 4])}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clips", type=int, default=400, help="Training clips")
+    parser.add_argument("--epochs", type=int, default=3, help="Epochs to time")
+    parser.add_argument("--workers", type=int, default=0, help="Precompute processes (0 = one per CPU)")
+    parser.add_argument("--train", action="store_true", help="Also time tiny-model CPU training epochs")
+    parser.add_argument("--loader-workers", type=int, default=2, help="DataLoader workers for --train")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    extractor, extractor_name = _make_extractor()
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_clips(Path(tmp), args.clips, args.seed)
+        print(f"input: {args.clips} clips, {extractor_name}")
+
+        start = time.perf_counter()
+        for _ in range(args.epochs):
+            for path in paths:
+                compute_features(extractor, _load_audio_file(path))
+        uncached = (time.perf_counter() - start) / args.epochs
+
+        start = time.perf_counter()
+        shard, keys = precompute_features(
+            paths, extractor, Path(tmp) / "cache", load_audio=_load_audio_file, workers=args.workers or None
+        )
+        precompute = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(args.epochs):
+            for key in keys:
+                shard.get(key)
+        cached = (time.perf_counter() - start) / args.epochs
+        shard_mb = (shard.directory / "features.f32").stat().st_size / 1e6
+        exact = all(
+            np.array_equal(shard.get(key), compute_features(extractor, _load_audio_file(path)))
+            for path, key in list(zip(paths, keys))[:: max(1, len(paths) // 20)]
+        )
+
+        print(f"precompute (once): {precompute:.2f}s, shard {shard_mb:.1f} MB "
+              f"(full 30 s matrices would be {len(keys) * 80 * 3000 * 4 / 1e6:.0f} MB)")
+        print(f"{'per epoch':24} {'seconds':>9} {'clips/s':>10}")
+        for label, seconds in (("uncached (decode+mel)", uncached), ("cached (mmap)", cached)):
+            print(f"{label:24} {seconds:9.3f} {args.clips / seconds:10.0f}")
+        total_uncached = uncached * args.epochs
+        total_cached = precompute + cached * args.epochs
+        print(f"data loading over {args.epochs} epochs: {total_uncached:.2f}s -> {total_cached:.2f}s "
+              f"({total_uncached / total_cached:.1f}x)")
+        print(f"cached features exact: {'ok' if exact else 'MISMATCH'}")
+
+        if args.train:
+            from audio_visualizer.srt.training.featureCache import CachedFeatureDataset
+
+            cached_ds = CachedFeatureDataset(shard, keys, [[1, 2, 3, 4]] * len(keys))
+            for label, dataset in (("uncached", _UncachedDataset(paths, extractor)), ("cached", cached_ds)):
+                seconds = _train_epochs(dataset, args.epochs, args.loader_workers)
+                print(f"tiny-model CPU epoch, {label}: {seconds:.2f}s")
+    return 0 if exact else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
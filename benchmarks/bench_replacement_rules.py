@@ -0,0 +1,95 @@
+"""Replacement-rule throughput: rule-by-rule loop vs. ReplacementRuleEngine.
+
+Generates a correction-database style rule set (mostly literal word fixes
+plus some regexes) and a transcript whose lines occasionally contain the
+misheard words, then applies the rules to every line with the previous
+per-rule ``re.sub``/``str.replace`` loop and with the compiled engine,
+checking both give the same text.
+
+Usage:
+    python benchmarks/bench_replacement_rules.py --rules 3000 --lines 20000
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.core.replacementRules import ReplacementRuleEngine  # noqa: E402
+
+_LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def _sequential(text, rules):
+    for rule in rules:
+        pattern = rule["pattern"]
+        if rule["is_regex"]:
+            try:
+                text = re.sub(pattern, rule["replacement"], text)
+            except re.error:
+                pass
+        else:
+            text = text.replace(pattern, rule["replacement"])
+    return text
+
+
+def _make_inputs(rule_count: int, regex_count: int, line_count: int, seed: int):
+    rng = random.Random(seed)
+
+    def word():
+        return "".join(rng.choice(_LETTERS) for _ in range(rng.randint(3, 9)))
+
+    misheard = sorted({word() for _ in range(rule_count)})
+    rules = [{"pattern": w, "replacement": w.capitalize(), "is_regex": False} for w in misheard]
+    for _ in range(regex_count):
+        rules.append({"pattern": rf"\b{word()}(s|ed)?\b", "replacement": r"\g<0>!", "is_regex": True})
+    rules.sort(key=lambda r: r["pattern"])  # list_replacement_rules order
+
+    vocab = [word() for _ in range(5000)]
+    lines = []
+    for _ in range(line_count):
+        words = [rng.choice(vocab) for _ in range(rng.randint(4, 10))]
+        if rng.random() < 0.1:
+            words[rng.randrange(len(words))] = rng.choice(misheard)
+        lines.append(" ".join(words))
+    return rules, lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rules", type=int, default=3000, help="Literal rules")
+    parser.add_argument("--regex-rules", type=int, default=50)
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rules, lines = _make_inputs(args.rules, args.regex_rules, args.lines, args.seed)
+    print(f"input: {len(rules)} rules ({args.regex_rules} regex), {len(lines)} lines")
+
+    start = time.perf_counter()
+    engine = ReplacementRuleEngine(rules)
+    compile_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    got = [engine.apply(line) for line in lines]
+    engine_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    want = [_sequential(line, rules) for line in lines]
+    loop_s = time.perf_counter() - start
+
+    changed = sum(1 for a, b in zip(lines, want) if a != b)
+    print(f"rule-by-rule {loop_s:8.3f}s  {len(lines) / loop_s:10.0f} lines/s")
+    print(f"engine       {engine_s:8.3f}s  {len(lines) / engine_s:10.0f} lines/s  "
+          f"(compile {compile_s:.3f}s)  x{loop_s / engine_s:.1f}")
+    print(f"{changed} lines changed, results {'identical' if got == want else 'DIFFER'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
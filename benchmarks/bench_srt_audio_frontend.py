@@ -0,0 +1,122 @@
+"""Per-stage timings of the SRT audio front end: temp WAV vs. in-memory decode.
+
+Generates a long compressed test file (tone bursts separated by silence),
+then times the stages that run before and around transcription:
+
+* legacy: FFmpeg to a temp WAV, ffprobe for duration, FFmpeg silencedetect
+  on the WAV, and a second decode of the WAV (what faster-whisper does when
+  given a path)
+* in-memory: one PyAV decode to a 16 kHz float32 array, duration from the
+  sample count, NumPy silence detection on the array
+
+Transcription itself is not timed; both paths hand Whisper the same samples.
+
+Usage:
+    python benchmarks/bench_srt_audio_frontend.py --minutes 30
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.srt.io.audioHelpers import (  # noqa: E402
+    decode_audio_16k_mono,
+    detect_silences,
+    detect_silences_ffmpeg,
+    to_wav_16k_mono,
+)
+from audio_visualizer.srt.io.systemHelpers import probe_duration_seconds  # noqa: E402
+
+
+def _make_input(path: Path, minutes: float) -> None:
+    seconds = int(minutes * 60)
+    # 4 s tone, 1 s silence, repeated; stereo 44.1 kHz AAC like typical sources
+    expr = "0.3*sin(2*PI*330*t)*lt(mod(t\\,5)\\,4)"
+    subprocess.run(
+        [
+            "ffmpeg", "-v", "error", "-y",
+            "-f", "lavfi", "-i", f"aevalsrc={expr}|{expr}:s=44100:d={seconds}",
+            "-c:a", "aac", "-b:a", "96k", str(path),
+        ],
+        check=True,
+    )
+
+
+def _timed(stages, name, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    stages.append((name, time.perf_counter() - start))
+    return result
+
+
+def _legacy(input_path: Path, tmp_dir: str, min_dur: float, threshold: float):
+    stages = []
+    fd, wav = tempfile.mkstemp(suffix=".wav", dir=tmp_dir)
+    os.close(fd)
+    try:
+        _timed(stages, "ffmpeg -> temp wav", to_wav_16k_mono, str(input_path), wav)
+        _timed(stages, "ffprobe duration", probe_duration_seconds, wav)
+        silences = _timed(
+            stages, "silencedetect (wav)", detect_silences_ffmpeg, wav,
+            min_silence_dur=min_dur, silence_threshold_db=threshold,
+        )
+        _timed(stages, "whisper re-decode wav", decode_audio_16k_mono, wav)
+    finally:
+        os.remove(wav)
+    return stages, silences
+
+
+def _in_memory(input_path: Path, min_dur: float, threshold: float):
+    stages = []
+    audio = _timed(stages, "pyav decode", decode_audio_16k_mono, str(input_path))
+    _timed(stages, "duration", lambda: audio.duration)
+    silences = _timed(
+        stages, "silence detection (numpy)", detect_silences, audio,
+        min_silence_dur=min_dur, silence_threshold_db=threshold,
+    )
+    return stages, silences
+
+
+def _report(label, stages):
+    total = sum(seconds for _, seconds in stages)
+    print(f"{label}: {total:.2f}s")
+    for name, seconds in stages:
+        print(f"  {name:<28s} {seconds:8.3f}s")
+    return total
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=30.0)
+    parser.add_argument("--min-silence", type=float, default=0.5)
+    parser.add_argument("--threshold-db", type=float, default=-35.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_srt_audio_") as tmp_dir:
+        input_path = Path(tmp_dir) / "input.m4a"
+        _make_input(input_path, args.minutes)
+
+        legacy_stages, legacy_silences = _legacy(
+            input_path, tmp_dir, args.min_silence, args.threshold_db
+        )
+        memory_stages, memory_silences = _in_memory(
+            input_path, args.min_silence, args.threshold_db
+        )
+
+    print(f"input: {args.minutes:g} min stereo AAC")
+    legacy_total = _report("legacy", legacy_stages)
+    memory_total = _report("in-memory", memory_stages)
+    print(f"speedup: {legacy_total / max(memory_total, 1e-9):.2f}x")
+    print(f"silences: legacy={len(legacy_silences)} in-memory={len(memory_silences)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,162 @@
+"""Wall time of a multi-file SRT batch: sequential loop vs. staged pipeline.
+
+Generates a folder of short compressed clips, then runs every clip through
+the full SRT pipeline twice:
+
+* sequential: ``transcribe_file`` per clip (decode, infer, write in turn)
+* staged: ``run_staged_batch`` with decode prefetched on a thread pool and
+  post-processing/writing on a finish thread while the model runs
+
+By default the model is a stand-in that sleeps for ``--infer-rtf`` times the
+clip duration, so the benchmark isolates pipeline overlap from model speed.
+Pass ``--model`` to use faster-whisper instead.
+
+Usage:
+    python benchmarks/bench_srt_batch_pipeline.py --clips 40 --seconds 20
+    python benchmarks/bench_srt_batch_pipeline.py --clips 20 --model tiny
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.srt.core.batchPipeline import run_staged_batch  # noqa: E402
+from audio_visualizer.srt.models import ResolvedConfig  # noqa: E402
+from audio_visualizer.srt.srtApi import (  # noqa: E402
+    TranscriptionResult,
+    begin_transcribe_file,
+    prepare_audio,
+    transcribe_file,
+)
+
+SAMPLE_RATE = 16000
+
+
+class _SleepModel:
+    """Returns one segment per clip after sleeping ``rtf`` x audio duration."""
+
+    def __init__(self, rtf: float):
+        self.rtf = rtf
+
+    def transcribe(self, audio, **_kwargs):
+        duration = len(audio) / SAMPLE_RATE
+        time.sleep(duration * self.rtf)
+        words = [SimpleNamespace(start=0.0, end=duration / 2, word="Hello"),
+                 SimpleNamespace(start=duration / 2, end=duration, word="world.")]
+        segment = SimpleNamespace(start=0.0, end=duration, text="Hello world.", words=words)
+        return iter([segment]), SimpleNamespace(language="en")
+
+
+def _make_clips(folder: Path, count: int, seconds: float) -> list:
+    expr = "0.3*sin(2*PI*330*t)*lt(mod(t\\,5)\\,4)"
+    paths = []
+    for i in range(count):
+        path = folder / f"clip_{i:03d}.m4a"
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error", "-y",
+                "-f", "lavfi", "-i", f"aevalsrc={expr}|{expr}:s=44100:d={seconds}",
+                "-c:a", "aac", "-b:a", "96k", str(path),
+            ],
+            check=True,
+        )
+        paths.append(path)
+    return paths
+
+
+def _job_kwargs(clip: Path, out_dir: Path, model, cfg) -> dict:
+    return dict(
+        input_path=clip,
+        output_path=out_dir / f"{clip.stem}.srt",
+        fmt="srt",
+        cfg=cfg,
+        model=model,
+        device_used="cpu",
+        compute_type_used="int8",
+        word_level=True,
+    )
+
+
+def _run_sequential(clips, out_dir, model, cfg) -> float:
+    start = time.perf_counter()
+    for clip in clips:
+        result = transcribe_file(**_job_kwargs(clip, out_dir, model, cfg))
+        assert result.success, result.error
+    return time.perf_counter() - start
+
+
+def _run_staged(clips, out_dir, model, cfg, workers: int, window: int) -> float:
+    def prefetch(clip):
+        return prepare_audio(clip, cfg=cfg)
+
+    def infer(_index, clip, prepared):
+        return begin_transcribe_file(**_job_kwargs(clip, out_dir, model, cfg), prepared=prepared)
+
+    def on_error(clip, exc):
+        return TranscriptionResult(
+            success=False, input_path=clip, output_path=out_dir, subtitles=[], segments=[],
+            device_used="cpu", compute_type_used="int8", error=str(exc),
+        )
+
+    start = time.perf_counter()
+    outcome = run_staged_batch(
+        clips, prefetch=prefetch, infer=infer, on_error=on_error,
+        prefetch_workers=workers, max_prefetched=window,
+    )
+    wall = time.perf_counter() - start
+    failed = [r for r in outcome.results if not r.success]
+    assert not failed, failed[0].error
+    return wall
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clips", type=int, default=40)
+    parser.add_argument("--seconds", type=float, default=20.0)
+    parser.add_argument("--infer-rtf", type=float, default=0.05,
+                        help="Stand-in model cost in seconds per audio second")
+    parser.add_argument("--model", default=None, help="faster-whisper model name (default: stand-in)")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--prefetch-workers", type=int, default=2)
+    parser.add_argument("--window", type=int, default=2)
+    args = parser.parse_args()
+
+    if args.model:
+        from audio_visualizer.srt.srtApi import load_model
+
+        model, device, compute_type = load_model(args.model, args.device, strict_cuda=False)
+        print(f"model: {args.model} on {device} ({compute_type})")
+    else:
+        model = _SleepModel(args.infer_rtf)
+        print(f"model: stand-in, {args.infer_rtf:.3f} s per audio second")
+
+    cfg = ResolvedConfig()
+    with tempfile.TemporaryDirectory(prefix="bench_srt_batch_") as tmp:
+        tmp_dir = Path(tmp)
+        clip_dir = tmp_dir / "clips"
+        clip_dir.mkdir()
+        clips = _make_clips(clip_dir, args.clips, args.seconds)
+        audio_seconds = args.clips * args.seconds
+        print(f"input: {args.clips} clips x {args.seconds:.0f}s")
+
+        for name, run in (
+            ("sequential", lambda out: _run_sequential(clips, out, model, cfg)),
+            ("staged", lambda out: _run_staged(clips, out, model, cfg, args.prefetch_workers, args.window)),
+        ):
+            out_dir = tmp_dir / name
+            out_dir.mkdir()
+            wall = run(out_dir)
+            print(f"{name:<11} {wall:7.2f}s  RTF {wall / audio_seconds:.4f}  "
+                  f"{args.clips / wall:.2f} files/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,216 @@
+"""Subtitle chunking and timing polish: string pipeline vs. word table.
+
+Builds a synthetic transcript of ``--words`` words (punctuation, pauses
+and detected silences included), then times, for the chosen preset:
+
+* chunking -- ``chunk_words_to_subtitles`` against the string
+  implementation it replaced (per silence run: join and normalize the run
+  text, split it recursively by re-joining, re-normalizing and re-wrapping
+  the text at every tier, map blocks back to words, merge short blocks);
+* polish -- ``hygiene_and_polish`` on the chunked blocks against the
+  previous implementation (re-normalizing every block's text for each
+  comparison and wrapping every block).
+
+Both pairs must produce identical subtitles.
+
+Usage:
+    python benchmarks/bench_srt_chunking.py --words 100000 --preset yt
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.srt.config import PRESETS, apply_overrides  # noqa: E402
+from audio_visualizer.srt.core.intervalIndex import as_interval_index  # noqa: E402
+from audio_visualizer.srt.core.subtitleGeneration import (  # noqa: E402
+    apply_silence_alignment,
+    chunk_words_to_subtitles,
+    hygiene_and_polish,
+    map_text_blocks_to_word_spans,
+    split_words_on_silence,
+    subs_text,
+    words_to_text,
+)
+from audio_visualizer.srt.core.textProcessing import (  # noqa: E402
+    block_fits,
+    enforce_timing,
+    normalize_spaces,
+    split_on_delims,
+    wrap_fallback_blocks,
+    wrap_text_lines,
+)
+from audio_visualizer.srt.models import ResolvedConfig, SubtitleBlock, WordItem  # noqa: E402
+
+_VOCAB = (
+    "the quick brown fox jumps over a lazy dog and then it said hello to everyone here "
+    "we were talking about what happens next in the story because nobody really knew "
+    "well, so, yes; right: no. maybe? really! okay... Dr. e.g. U.S."
+).split()
+
+
+# ------------------------------------------------------------
+# String reference implementations (the pre-table code)
+# ------------------------------------------------------------
+
+def _string_split_text_into_blocks(text, max_chars, max_lines, allow_commas, allow_medium, prefer):
+    text = normalize_spaces(text)
+    if not text:
+        return []
+    tiers = [".?!"] + ([";:"] if allow_medium else []) + ([","] if allow_commas else [])
+
+    def refine(chunk, tier):
+        chunk = normalize_spaces(chunk)
+        if not chunk:
+            return []
+        if block_fits(chunk, max_chars, max_lines) and not (prefer and tier == 0):
+            return [chunk]
+        if tier >= len(tiers):
+            return wrap_fallback_blocks(chunk, max_chars, max_lines)
+        parts = split_on_delims(chunk, tiers[tier])
+        if len(parts) <= 1:
+            return refine(chunk, tier + 1)
+        return [block for p in parts for block in refine(p, tier + 1)]
+
+    safe = []
+    for block in refine(text, 0):
+        if block_fits(block, max_chars, max_lines):
+            safe.append(block)
+        else:
+            safe.extend(wrap_fallback_blocks(block, max_chars, max_lines))
+    return safe
+
+
+def _string_chunk_words(words, cfg, silences):
+    f = cfg.formatting
+    subs = []
+    for run in split_words_on_silence(words, silences):
+        parts = _string_split_text_into_blocks(
+            words_to_text(run), f.max_chars, f.max_lines, f.allow_commas, f.allow_medium, f.prefer_punct_splits
+        )
+        timed = enforce_timing(map_text_blocks_to_word_spans(parts, run), f.min_dur, f.max_dur, split_long=False)
+        for s, e, text in timed:
+            subs.append(SubtitleBlock(float(s), float(e), wrap_text_lines(text, f.max_chars)[:f.max_lines]))
+    return subs
+
+
+def _string_hygiene(subs, *, min_gap, pad, silence_intervals):
+    cleaned = []
+    for sb in subs:
+        txt = subs_text(sb)
+        if txt:
+            s = max(0.0, float(sb.start))
+            cleaned.append(SubtitleBlock(s, max(s + 0.001, float(sb.end)), wrap_text_lines(txt, 10_000), sb.speaker))
+    if not cleaned:
+        return []
+    cleaned.sort(key=lambda x: (x.start, x.end))
+    index = as_interval_index(silence_intervals) if silence_intervals else None
+    merged = []
+    for sb in cleaned:
+        if merged and subs_text(merged[-1]) == subs_text(sb) and merged[-1].speaker == sb.speaker:
+            if index and index.first_within(merged[-1].end, sb.start):
+                merged.append(sb)
+            else:
+                merged[-1].end = max(merged[-1].end, sb.end)
+        else:
+            merged.append(sb)
+    out = []
+    for i, sb in enumerate(merged):
+        prev_end = out[-1].end if out else None
+        next_start = merged[i + 1].start if i + 1 < len(merged) else None
+        s, e = sb.start, sb.end
+        if pad > 0:
+            s = max(prev_end + min_gap, s - pad) if prev_end is not None else max(0.0, s - pad)
+            e = min(next_start - min_gap, e + pad) if next_start is not None else e + pad
+        if prev_end is not None and (not index or not index.first_within(prev_end, s)):
+            if s < prev_end + min_gap:
+                s = prev_end + min_gap
+                if e < s + 0.001:
+                    e = s + 0.001
+        if next_start is not None and (not index or not index.first_within(e, next_start)):
+            if e > next_start - min_gap:
+                e = max(s + 0.001, next_start - min_gap)
+        out.append(SubtitleBlock(s, e, sb.lines, sb.speaker))
+    final, last_end = [], 0.0
+    for sb in out:
+        s = max(last_end, sb.start)
+        e = max(s + 0.001, sb.end)
+        final.append(SubtitleBlock(s, e, sb.lines, sb.speaker))
+        last_end = e
+    return final
+
+
+# ------------------------------------------------------------
+# Synthetic transcript
+# ------------------------------------------------------------
+
+def _transcript(count: int, seed: int):
+    rng = random.Random(seed)
+    words, silences, t = [], [], 0.0
+    for _ in range(count):
+        dur = rng.uniform(0.1, 0.5)
+        words.append(WordItem(start=round(t, 3), end=round(t + dur, 3), text=rng.choice(_VOCAB)))
+        t += dur
+        if rng.random() < 0.03:
+            pause = rng.uniform(0.4, 1.5)
+            silences.append((round(t + 0.05, 3), round(t + pause - 0.05, 3)))
+            t += pause
+        else:
+            t += rng.uniform(0.0, 0.08)
+    return words, silences
+
+
+def _timed(fn, repeat):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _key(subs):
+    return [(sb.start, sb.end, sb.lines, sb.speaker) for sb in subs]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=100_000, help="Transcript length in words")
+    parser.add_argument("--preset", default="yt", choices=sorted(PRESETS), help="Formatting preset")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    cfg = apply_overrides(ResolvedConfig(), PRESETS[args.preset])
+    f = cfg.formatting
+    words, silences = _transcript(args.words, args.seed)
+    print(f"input: {len(words)} words, {len(silences)} silences, preset {args.preset}")
+
+    old_chunk, old_subs = _timed(lambda: _string_chunk_words(words, cfg, silences), args.repeat)
+    new_chunk, new_subs = _timed(lambda: chunk_words_to_subtitles(words, cfg, silences), args.repeat)
+    aligned = apply_silence_alignment(new_subs, silences)
+
+    def polish(fn):
+        return fn([SubtitleBlock(sb.start, sb.end, sb.lines) for sb in aligned],
+                  min_gap=f.min_gap, pad=0.15, silence_intervals=silences)
+
+    old_polish, old_out = _timed(lambda: polish(_string_hygiene), args.repeat)
+    new_polish, new_out = _timed(lambda: polish(hygiene_and_polish), args.repeat)
+
+    exact = _key(old_subs) == _key(new_subs) and _key(old_out) == _key(new_out)
+    print(f"{'stage':10} {'string':>9} {'table':>9} {'speedup':>8}")
+    for label, old, new in (("chunk", old_chunk, new_chunk), ("polish", old_polish, new_polish),
+                            ("total", old_chunk + old_polish, new_chunk + new_polish)):
+        print(f"{label:10} {old:8.3f}s {new:8.3f}s {old / new:7.1f}x")
+    print(f"{len(new_subs)} subtitles, {len(new_out)} after polish; identical output: {'ok' if exact else 'MISMATCH'}")
+    return 0 if exact else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
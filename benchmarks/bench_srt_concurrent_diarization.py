@@ -0,0 +1,180 @@
+"""Speaker diarization: after transcription vs. alongside it.
+
+Runs the SRT pipeline in transcript mode with ``diarize=True`` twice on the
+same decoded audio: once with diarization after transcription
+(``diarization_memory_mb=0``) and once with diarization in a worker
+process while the model transcribes.  The Whisper model and pyannote are
+replaced by stand-ins that take ``--transcribe-seconds`` and
+``--diarize-seconds`` (sleeping, or spinning the CPU with ``--cpu``), so
+the benchmark measures the pipeline's scheduling rather than the models,
+and runs without torch/pyannote installed.
+
+Reported per run: wall time, transcription time, diarization time, and
+how long ``finish`` waited for diarization after transcription ended.
+
+Usage:
+    python benchmarks/bench_srt_concurrent_diarization.py --transcribe-seconds 6 --diarize-seconds 4
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+import numpy as np  # noqa: E402
+
+from audio_visualizer.srt.core import pipeline as pipeline_module  # noqa: E402
+from audio_visualizer.srt.io.audioHelpers import DecodedAudio  # noqa: E402
+from audio_visualizer.srt.models import PipelineMode, ResolvedConfig  # noqa: E402
+from audio_visualizer.srt.srtApi import transcribe_file  # noqa: E402
+
+_STAND_INS = {
+    "torch/__init__.py": '''
+class _Tensor:
+    def __init__(self, array):
+        self.array = array
+
+    def unsqueeze(self, _dim):
+        return self
+
+
+def from_numpy(array):
+    return _Tensor(array)
+''',
+    "pyannote/__init__.py": "",
+    "pyannote/audio/__init__.py": '''
+import os
+import time
+
+
+def _work(seconds, cpu):
+    end = time.perf_counter() + seconds
+    if not cpu:
+        time.sleep(seconds)
+    while time.perf_counter() < end:
+        pass
+
+
+class _Segment:
+    def __init__(self, start, end):
+        self.start, self.end = start, end
+
+
+class _Annotation:
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def itertracks(self, yield_label=False):
+        t = 0.0
+        while t < self.seconds:
+            yield _Segment(t, min(t + 30.0, self.seconds)), None, "SPEAKER_%02d" % (int(t // 30) % 2)
+            t += 30.0
+
+
+class Pipeline:
+    @classmethod
+    def from_pretrained(cls, _name, use_auth_token=None):
+        return cls()
+
+    def __call__(self, audio):
+        _work(float(os.environ["BENCH_DIARIZE_SECONDS"]), os.environ.get("BENCH_CPU") == "1")
+        return _Annotation(len(audio["waveform"].array) / audio["sample_rate"])
+''',
+}
+
+
+def _work(seconds: float, cpu: bool) -> None:
+    end = time.perf_counter() + seconds
+    if not cpu:
+        time.sleep(seconds)
+    while time.perf_counter() < end:
+        pass
+
+
+class _StandInModel:
+    """Yields one segment per 30 s of audio, spread over ``seconds``."""
+
+    def __init__(self, duration: float, seconds: float, cpu: bool):
+        self.duration, self.seconds, self.cpu = duration, seconds, cpu
+
+    def transcribe(self, *_args, **_kwargs):
+        starts = np.arange(0.0, self.duration, 30.0)
+
+        def gen():
+            for start in starts:
+                _work(self.seconds / len(starts), self.cpu)
+                words = [
+                    SimpleNamespace(start=start + i, end=start + i + 0.8, word=f" word{i}.")
+                    for i in range(0, 24, 2)
+                ]
+                yield SimpleNamespace(start=start, end=start + 23.0, text="", words=words)
+        return gen(), SimpleNamespace(language="en")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=30.0, help="Audio length")
+    parser.add_argument("--transcribe-seconds", type=float, default=6.0, help="Stand-in model time")
+    parser.add_argument("--diarize-seconds", type=float, default=4.0, help="Stand-in pyannote time")
+    parser.add_argument("--cpu", action="store_true", help="Spin the CPU instead of sleeping")
+    args = parser.parse_args()
+
+    duration = args.minutes * 60
+    audio = DecodedAudio(samples=np.zeros(int(duration * 16000), dtype=np.float32))
+    pipeline_module.ffmpeg_ok = lambda: True
+    pipeline_module.decode_audio_16k_mono = lambda _path: audio
+    pipeline_module.detect_silences = lambda *_args, **_kwargs: []
+    pipeline_module._open_correction_db = lambda: None
+    os.environ["BENCH_DIARIZE_SECONDS"] = str(args.diarize_seconds)
+    os.environ["BENCH_CPU"] = "1" if args.cpu else "0"
+
+    print(f"input: {args.minutes:g} min of audio; stand-in transcription {args.transcribe_seconds:g}s, "
+          f"diarization {args.diarize_seconds:g}s ({'CPU-bound' if args.cpu else 'sleeping'}), "
+          f"{os.cpu_count()} CPU(s)")
+    with tempfile.TemporaryDirectory() as tmp:
+        site = Path(tmp) / "site"
+        for rel, source in _STAND_INS.items():
+            (site / rel).parent.mkdir(parents=True, exist_ok=True)
+            (site / rel).write_text(source, encoding="utf-8")
+        sys.path.insert(0, str(site))
+
+        speakers = {}
+        for label, memory_mb in (("after transcription", 0), ("alongside (worker)", 1e9)):
+            bundle = Path(tmp) / f"{memory_mb:g}.json"
+            start = time.perf_counter()
+            result = transcribe_file(
+                input_path=Path(tmp) / "input.wav",
+                output_path=Path(tmp) / f"{memory_mb:g}.srt",
+                fmt="srt",
+                cfg=ResolvedConfig(),
+                model=_StandInModel(duration, args.transcribe_seconds, args.cpu),
+                device_used="cpu",
+                compute_type_used="int8",
+                mode=PipelineMode.TRANSCRIPT,
+                diarize=True,
+                hf_token="benchmark",
+                json_bundle_path=bundle,
+                diarization_memory_mb=memory_mb,
+            )
+            wall = time.perf_counter() - start
+            if not result.success:
+                print(f"{label}: failed: {result.error}")
+                return 1
+            t = result.timings
+            speakers[label] = bundle.read_text(encoding="utf-8").count("SPEAKER_")
+            print(f"{label:22} wall {wall:6.2f}s  transcribe {t['transcribe']:6.2f}s  "
+                  f"diarize {t['diarize']:6.2f}s  waited {t.get('diarize_wait', t['diarize']):6.2f}s")
+
+    same = len(set(speakers.values())) == 1
+    print(f"same speaker labels: {'ok' if same else 'MISMATCH'}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,120 @@
+"""Speed and accuracy of cue-to-word alignment on synthetic transcripts.
+
+Builds a Whisper-style word list with known timing and a subtitle file
+derived from it with realistic edits (casing and punctuation, substituted,
+dropped and inserted words), then times ``align_cues_to_whisper_words`` at
+several transcript sizes and checks the word timings against the truth.
+
+Usage:
+    python benchmarks/bench_srt_cue_alignment.py --words 50000
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.srt.core.alignment import align_cues_to_whisper_words  # noqa: E402
+from audio_visualizer.srt.models import SubtitleBlock, WordItem  # noqa: E402
+
+_SYLLABLES = ["ka", "lo", "mi", "ran", "te", "vo", "sun", "dre", "pa", "lin", "or", "ex"]
+
+
+def _vocabulary(rng: random.Random, size: int) -> list:
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 4))))
+    return sorted(words)
+
+
+def _make_transcript(count: int, seed: int, edit_rate: float):
+    """Return (whisper_words, cues, truth) where truth maps (cue, token) -> start."""
+    rng = random.Random(seed)
+    vocab = _vocabulary(rng, 3000)
+    weights = [1.0 / (rank + 1) for rank in range(len(vocab))]  # Zipf-like
+    spoken = rng.choices(vocab, weights=weights, k=count)
+
+    whisper = []
+    t = 0.0
+    for word in spoken:
+        duration = rng.uniform(0.15, 0.45)
+        whisper.append(WordItem(t, t + duration, word))
+        t += duration + rng.uniform(0.02, 0.3)
+
+    cues, truth = [], {}
+    i = 0
+    while i < count:
+        size = rng.randint(5, 10)
+        tokens, starts = [], []
+        for w in whisper[i:i + size]:
+            roll = rng.random()
+            if roll < edit_rate:  # word missing from the subtitle
+                continue
+            if roll < 2 * edit_rate:  # subtitle has a different word
+                tokens.append(rng.choice(vocab))
+                starts.append(None)
+                continue
+            text = w.text.capitalize() if rng.random() < 0.1 else w.text
+            if rng.random() < 0.1:
+                text += rng.choice([",", ".", "?", "!"])
+            tokens.append(text)
+            starts.append(w.start)
+            if rng.random() < edit_rate:  # extra subtitle word
+                tokens.append(rng.choice(vocab))
+                starts.append(None)
+        if tokens:
+            span = whisper[i:i + size]
+            cue_index = len(cues)
+            cues.append(SubtitleBlock(
+                start=max(0.0, span[0].start + rng.uniform(-0.2, 0.2)),
+                end=span[-1].end + rng.uniform(-0.2, 0.2),
+                lines=[" ".join(tokens)],
+            ))
+            for k, start in enumerate(starts):
+                if start is not None:
+                    truth[(cue_index, k)] = start
+        i += size
+    return whisper, cues, truth
+
+
+def _run(count: int, seed: int, edit_rate: float) -> None:
+    whisper, cues, truth = _make_transcript(count, seed, edit_rate)
+    start = time.perf_counter()
+    aligned = align_cues_to_whisper_words(cues, whisper)
+    wall = time.perf_counter() - start
+
+    statuses = Counter(cue.alignment_status for cue in aligned)
+    exact = sum(
+        1 for (c, k), t in truth.items()
+        if k < len(aligned[c].words) and abs(aligned[c].words[k].start - t) < 1e-6
+    )
+    print(
+        f"{count:>7} words {len(cues):>6} cues  {wall:7.3f}s  "
+        f"{count / wall / 1000:7.1f}k words/s  "
+        f"timing exact {exact / len(truth):6.1%}  "
+        f"matched {statuses['matched']} partial {statuses['partial']} "
+        f"estimated {statuses['estimated']}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=50000)
+    parser.add_argument("--edit-rate", type=float, default=0.03,
+                        help="Probability of each dropped / substituted / inserted word")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    sizes = sorted({min(args.words, n) for n in (5000, 10000, 25000)} | {args.words})
+    for count in sizes:
+        _run(count, args.seed, args.edit_rate)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
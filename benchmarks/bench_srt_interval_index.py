@@ -0,0 +1,201 @@
+"""Timing helpers on long transcripts: linear interval scans vs. IntervalIndex.
+
+Builds a synthetic recording of ``--hours`` length with word timing,
+detected silences, subtitle blocks and diarization turns, then times each
+helper that looks intervals up per word/subtitle/segment against the
+linear-scan implementation it replaced, and checks that both return the
+same result.
+
+Usage:
+    python benchmarks/bench_srt_interval_index.py --hours 3
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.srt.core.diarization import assign_speakers  # noqa: E402
+from audio_visualizer.srt.core.subtitleGeneration import (  # noqa: E402
+    apply_silence_alignment,
+    silence_between,
+    split_words_on_silence,
+)
+from audio_visualizer.srt.models import SubtitleBlock, WordItem  # noqa: E402
+from audio_visualizer.ui.tabs.srtEdit.document import SubtitleDocument, SubtitleEntry  # noqa: E402
+from audio_visualizer.ui.tabs.srtEdit.resync import silence_snap  # noqa: E402
+
+
+# ------------------------------------------------------------
+# Linear-scan reference implementations (the pre-index code)
+# ------------------------------------------------------------
+
+def _linear_split_words_on_silence(words, silences):
+    runs, cur = [], [words[0]]
+    for w in words[1:]:
+        if silence_between(cur[-1].end, w.start, silences) is not None:
+            runs.append(cur)
+            cur = [w]
+        else:
+            cur.append(w)
+    runs.append(cur)
+    return runs
+
+
+def _linear_apply_silence_alignment(subs, silences):
+    aligned = []
+    for i, sb in enumerate(subs):
+        s, e = sb.start, sb.end
+        for ss, ee in silences:
+            if ss <= s <= ee:
+                s = ee
+            if ss <= e <= ee:
+                e = ss
+        if i + 1 < len(subs):
+            gap = silence_between(e, subs[i + 1].start, silences)
+            if gap is not None:
+                e = min(e, gap[0])
+                subs[i + 1].start = max(subs[i + 1].start, gap[1])
+        if e < s + 0.001:
+            e = s + 0.001
+        aligned.append(SubtitleBlock(s, e, sb.lines, sb.speaker))
+    return aligned
+
+
+def _linear_assign_speakers(segments, diarization):
+    for seg in segments:
+        best_label, best_overlap = None, 0.0
+        for d_start, d_end, label in diarization:
+            overlap = max(0.0, min(seg.end, d_end) - max(seg.start, d_start))
+            if overlap > best_overlap:
+                best_overlap, best_label = overlap, label
+        seg.speaker = best_label
+    return segments
+
+
+def _linear_silence_snap(document, silence_intervals, snap_threshold_ms=200):
+    edges = sorted(
+        int(round(t * 1000)) for s, e in silence_intervals for t in (s, e)
+    )
+
+    def nearest(time_ms):
+        best, best_dist = None, snap_threshold_ms + 1
+        for edge in edges:
+            dist = abs(edge - time_ms)
+            if dist < best_dist:
+                best, best_dist = edge, dist
+        return best if best_dist <= snap_threshold_ms else None
+
+    changes = []
+    for i, entry in enumerate(document.entries):
+        new_start = nearest(entry.start_ms)
+        new_end = nearest(entry.end_ms)
+        new_start = entry.start_ms if new_start is None else new_start
+        new_end = entry.end_ms if new_end is None else new_end
+        if new_end <= new_start:
+            new_end = new_start + 1
+        if new_start != entry.start_ms or new_end != entry.end_ms:
+            changes.append((i, entry.start_ms, entry.end_ms, new_start, new_end))
+    return changes
+
+
+# ------------------------------------------------------------
+# Synthetic recording
+# ------------------------------------------------------------
+
+def _make_recording(hours: float, seed: int):
+    rng = random.Random(seed)
+    duration = hours * 3600.0
+    words, silences = [], []
+    t = 0.0
+    while t < duration:
+        length = rng.uniform(0.15, 0.5)
+        words.append(WordItem(t, t + length, "word"))
+        t += length
+        if rng.random() < 0.12:  # pause long enough to be detected
+            pause = rng.uniform(0.25, 1.5)
+            silences.append((t + 0.02, t + pause - 0.02))
+            t += pause
+        else:
+            t += rng.uniform(0.0, 0.12)
+
+    subs = []
+    for i in range(0, len(words), 8):
+        chunk = words[i:i + 8]
+        subs.append((chunk[0].start + rng.uniform(-0.1, 0.1), chunk[-1].end + rng.uniform(-0.1, 0.1)))
+
+    turns, t = [], 0.0
+    while t < duration:
+        length = rng.uniform(2.0, 25.0)
+        turns.append((t, t + length + rng.uniform(0.0, 0.8), f"SPEAKER_{rng.randrange(4):02d}"))
+        t += length
+    return words, silences, subs, turns
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def _document(subs):
+    doc = SubtitleDocument()
+    for i, (s, e) in enumerate(subs):
+        doc._entries.append(SubtitleEntry(index=i + 1, start_ms=int(s * 1000), end_ms=int(e * 1000), text="x"))
+    return doc
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--skip-linear", action="store_true",
+                        help="Only time the indexed helpers (linear scans are slow on long inputs)")
+    args = parser.parse_args()
+
+    words, silences, subs, turns = _make_recording(args.hours, args.seed)
+    print(f"input: {args.hours:g} h, {len(words)} words, {len(silences)} silences, "
+          f"{len(subs)} subtitles, {len(turns)} speaker turns")
+
+    def blocks():
+        return [SubtitleBlock(s, e, ["x"]) for s, e in subs]
+
+    def segments():
+        return [SimpleNamespace(start=s, end=e) for s, e in subs]
+
+    cases = [
+        ("split_words_on_silence",
+         lambda: split_words_on_silence(words, silences),
+         lambda: _linear_split_words_on_silence(words, silences),
+         lambda runs: [len(r) for r in runs]),
+        ("apply_silence_alignment",
+         lambda: apply_silence_alignment(blocks(), silences),
+         lambda: _linear_apply_silence_alignment(blocks(), silences),
+         lambda out: [(b.start, b.end) for b in out]),
+        ("assign_speakers",
+         lambda: assign_speakers(segments(), turns),
+         lambda: _linear_assign_speakers(segments(), turns),
+         lambda out: [seg.speaker for seg in out]),
+        ("silence_snap",
+         lambda: silence_snap(_document(subs), silences),
+         lambda: _linear_silence_snap(_document(subs), silences),
+         lambda out: out),
+    ]
+    for name, indexed, linear, key in cases:
+        t_index, got = _timed(indexed)
+        line = f"{name:<24} indexed {t_index:8.4f}s"
+        if not args.skip_linear:
+            t_linear, want = _timed(linear)
+            same = "identical" if key(got) == key(want) else "MISMATCH"
+            line += f"  linear {t_linear:8.3f}s  x{t_linear / t_index:7.1f}  {same}"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,177 @@
+"""Subtitle output: one writer per format vs. the single-pass multi-format writer.
+
+Builds ``--blocks`` synthetic subtitle blocks (speakers, long lines that
+wrap) with transcription segments carrying word timing, then writes SRT,
+VTT, ASS, TXT and the JSON bundle two ways:
+
+* separate: each format builds its full content as a string and writes it
+  with ``atomic_write_text``, re-normalizing and re-wrapping every block
+  (the pre-change writers); the bundle scans every segment per subtitle
+  for its words;
+* multi: ``write_subtitle_outputs`` formats each block once and streams
+  all five files, then renames them into place.
+
+The four text formats are timed on their own first, then all five
+together.  Both writers must produce byte-identical files (bundle ids are
+made deterministic for the comparison).
+
+Usage:
+    python benchmarks/bench_srt_output_writers.py --blocks 50000
+"""
+
+import argparse
+import dataclasses
+import itertools
+import json
+import random
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.srt.core.textProcessing import normalize_spaces  # noqa: E402
+from audio_visualizer.srt.io.outputWriters import (  # noqa: E402
+    ASS_HEADER,
+    VTT_HEADER,
+    atomic_write_text,
+    format_ass_dialogue,
+    format_srt_entry,
+    format_txt_line,
+    format_vtt_cue,
+    write_subtitle_outputs,
+)
+from audio_visualizer.srt.models import ResolvedConfig, SubtitleBlock  # noqa: E402
+
+_VOCAB = "the quick brown fox jumps over a lazy dog and then it said hello to everyone here".split()
+_FORMATS = ("srt", "vtt", "ass", "txt", "json")
+
+
+# ------------------------------------------------------------
+# Separate-writer reference (the pre-change code)
+# ------------------------------------------------------------
+
+def _scan_subtitles(subs, segments, meta):
+    seg_words = {}
+    for seg in segments:
+        if seg.words:
+            seg_words[int(round(float(seg.start) * 1000))] = seg.words
+    subtitles, flat = [], []
+    for sb in subs:
+        sub_id = str(uuid.uuid4())
+        text = normalize_spaces(" ".join(sb.lines))
+        sub_key = int(round(sb.start * 1000))
+        matched = []
+        for key, seg_list in seg_words.items():
+            if abs(key - sub_key) < 500:
+                matched = seg_list
+                break
+        words = []
+        for w in matched:
+            entry = {"id": str(uuid.uuid4()), "subtitle_id": sub_id, "text": w.word.strip(),
+                     "start": float(w.start), "end": float(w.end)}
+            if w.probability is not None:
+                entry["confidence"] = float(w.probability)
+            words.append(entry)
+            flat.append(entry)
+        sub = {"id": sub_id, "start": sb.start, "end": sb.end, "text": text, "words": words,
+               "original_text": text, "source_media_path": meta["input_file"], "model_name": meta["model_name"],
+               "device": meta["device_used"], "compute_type": meta["compute_type_used"]}
+        if sb.speaker:
+            sub["speaker_label"] = sb.speaker
+        subtitles.append(sub)
+    return subtitles, flat
+
+
+def _separate(subs, segments, paths, meta, max_chars, max_lines):
+    kw = {"max_chars": max_chars, "max_lines": max_lines}
+    srt = [format_srt_entry(i, sb, **kw) for i, sb in enumerate(subs, start=1)]
+    atomic_write_text(paths["srt"], "\n".join(srt).strip() + "\n")
+    vtt = [VTT_HEADER] + [format_vtt_cue(sb, **kw) for sb in subs]
+    atomic_write_text(paths["vtt"], "\n".join(vtt).rstrip() + "\n")
+    ass = [ASS_HEADER] + [format_ass_dialogue(sb, **kw) for sb in subs]
+    atomic_write_text(paths["ass"], "\n".join(ass).rstrip() + "\n")
+    atomic_write_text(paths["txt"], "\n".join(format_txt_line(sb) for sb in subs).strip() + "\n")
+    if "json" not in paths:
+        return
+    subtitles, flat = _scan_subtitles(subs, segments, meta)
+    payload = {"tool_version": meta["tool_version"], "input_file": meta["input_file"],
+               "device_used": meta["device_used"], "compute_type_used": meta["compute_type_used"],
+               "model_name": meta["model_name"], "config": dataclasses.asdict(meta["cfg"]),
+               "subtitles": subtitles, "words": flat}
+    atomic_write_text(paths["json"], json.dumps(payload, ensure_ascii=False, indent=2))
+
+
+# ------------------------------------------------------------
+# Synthetic output
+# ------------------------------------------------------------
+
+def _blocks(count: int, seed: int):
+    rng = random.Random(seed)
+    subs, segments, t = [], [], 0.0
+    for i in range(count):
+        dur = rng.uniform(0.8, 4.0)
+        text = " ".join(rng.choice(_VOCAB) for _ in range(rng.randint(2, 14)))
+        subs.append(SubtitleBlock(round(t, 3), round(t + dur, 3), [text], rng.choice([None, "SPEAKER_00", "SPEAKER_01"])))
+        if i % 2 == 0:
+            words = [SimpleNamespace(start=t + k * 0.3, end=t + k * 0.3 + 0.25, word=" " + w, probability=0.9)
+                     for k, w in enumerate(text.split()[:6])]
+            segments.append(SimpleNamespace(start=t, end=t + dur, words=words))
+        t += dur + rng.uniform(0.05, 0.6)
+    return subs, segments
+
+
+def _reset_ids():
+    counter = itertools.count()
+    uuid.uuid4 = lambda: uuid.UUID(int=next(counter))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blocks", type=int, default=50_000, help="Subtitle blocks")
+    parser.add_argument("--max-chars", type=int, default=42)
+    parser.add_argument("--max-lines", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--text-only", action="store_true",
+                        help="Skip the bundle run (the separate bundle scan is quadratic in blocks)")
+    args = parser.parse_args()
+
+    subs, segments = _blocks(args.blocks, args.seed)
+    meta = {"input_file": "input.wav", "device_used": "cpu", "compute_type_used": "int8",
+            "cfg": ResolvedConfig(), "tool_version": "bench", "model_name": "small"}
+    print(f"input: {len(subs)} blocks, {len(segments)} segments with words")
+
+    print(f"{'formats':22} {'separate':>9} {'multi':>9} {'speedup':>8} {'MB':>6}  identical")
+    exact = True
+    for label, formats in (("srt+vtt+ass+txt", _FORMATS[:4]), ("all five (with bundle)", _FORMATS)):
+        if label.startswith("all") and args.text_only:
+            break
+        with tempfile.TemporaryDirectory() as tmp:
+            old = {fmt: Path(tmp) / f"separate.{fmt}" for fmt in formats}
+            new = {fmt: Path(tmp) / f"multi.{fmt}" for fmt in formats}
+
+            _reset_ids()
+            start = time.perf_counter()
+            _separate(subs, segments, old, meta, args.max_chars, args.max_lines)
+            separate = time.perf_counter() - start
+
+            _reset_ids()
+            start = time.perf_counter()
+            write_subtitle_outputs(subs, list(new.items()), max_chars=args.max_chars, max_lines=args.max_lines,
+                                   segments=segments, **meta)
+            multi = time.perf_counter() - start
+
+            same = all(old[fmt].read_bytes() == new[fmt].read_bytes() for fmt in formats)
+            total_mb = sum(path.stat().st_size for path in new.values()) / 1e6
+        exact = exact and same
+        print(f"{label:22} {separate:8.3f}s {multi:8.3f}s {separate / multi:7.1f}x {total_mb:6.1f}  "
+              f"{'ok' if same else 'MISMATCH'}")
+    return 0 if exact else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
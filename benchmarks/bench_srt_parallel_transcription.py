@@ -0,0 +1,96 @@
+"""Real-time factor of sequential vs. chunk-parallel Whisper transcription.
+
+Transcribes one input with faster-whisper three ways and reports the
+real-time factor (processing seconds per audio second) of each, plus how
+far the parallel segment boundaries drift from the sequential run:
+
+* sequential: one ``model.transcribe`` call over the whole file
+* batched: ``BatchedInferencePipeline`` over silence-cut chunks
+* replicas: chunks on a thread pool against a ``num_workers`` model
+
+Requires faster-whisper (and downloads the model on first use).
+
+Usage:
+    python benchmarks/bench_srt_parallel_transcription.py input.mp3 --model small --workers 4
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.srt.core.parallelTranscription import (  # noqa: E402
+    replica_model_options,
+    transcribe_parallel,
+)
+from audio_visualizer.srt.core.whisperWrapper import init_whisper_model_internal  # noqa: E402
+from audio_visualizer.srt.io.audioHelpers import decode_audio_16k_mono, detect_silences  # noqa: E402
+
+
+def _boundary_drift(reference, segments):
+    """Return (max, mean) distance from each reference boundary to the nearest parallel one."""
+    if not reference or not segments:
+        return float("nan"), float("nan")
+    ours = sorted(t for s in segments for t in (float(s.start), float(s.end)))
+    drifts = []
+    for seg in reference:
+        for t in (float(seg.start), float(seg.end)):
+            drifts.append(min(abs(t - o) for o in ours))
+    return max(drifts), sum(drifts) / len(drifts)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", type=Path)
+    parser.add_argument("--model", default="small")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--chunk-sec", type=float, default=30.0)
+    parser.add_argument("--language", default=None)
+    args = parser.parse_args()
+
+    audio = decode_audio_16k_mono(str(args.input))
+    silences = detect_silences(audio, min_silence_dur=0.2, silence_threshold_db=-35.0)
+    options = dict(language=args.language, word_timestamps=True, vad_filter=False)
+    print(f"input: {audio.duration:.1f}s, {len(silences)} silences")
+
+    model, device, compute_type = init_whisper_model_internal(args.model, args.device, strict_cuda=False)
+    print(f"model: {args.model} on {device} ({compute_type})")
+
+    start = time.perf_counter()
+    segments_iter, _info = model.transcribe(audio.samples, **options)
+    reference = list(segments_iter)
+    wall = time.perf_counter() - start
+    print(f"sequential: RTF {wall / audio.duration:.3f} ({len(reference)} segments)")
+
+    segments, stats = transcribe_parallel(
+        model, audio, silences=silences, mode="batched", workers=args.workers,
+        chunk_sec=args.chunk_sec, **options,
+    )
+    drift_max, drift_mean = _boundary_drift(reference, segments)
+    print(
+        f"batched:    RTF {stats.real_time_factor:.3f} ({len(segments)} segments, "
+        f"{stats.chunks} chunks, drift max {drift_max:.2f}s mean {drift_mean:.2f}s)"
+    )
+
+    del model
+    model, _device, _compute = init_whisper_model_internal(
+        args.model, args.device, strict_cuda=False, **replica_model_options(args.workers)
+    )
+    segments, stats = transcribe_parallel(
+        model, audio, silences=silences, mode="replicas", workers=args.workers,
+        chunk_sec=args.chunk_sec, **options,
+    )
+    drift_max, drift_mean = _boundary_drift(reference, segments)
+    print(
+        f"replicas:   RTF {stats.real_time_factor:.3f} ({len(segments)} segments, "
+        f"{stats.chunks} chunks, drift max {drift_max:.2f}s mean {drift_mean:.2f}s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,164 @@
+"""Review navigation: word scans vs. the review index.
+
+Builds ``--words`` synthetic words grouped into subtitles (confidences,
+speakers, a share of ``estimated`` alignments), then answers ``--queries``
+random review queries two ways:
+
+* scan: walk the ``SubtitleEntry`` words from the cursor in Python, the
+  way navigation had to before (next/previous word below 0.5 confidence,
+  next speaker change, next estimated subtitle, word at a time);
+* index: ``ReviewIndex`` segment-tree lookups.
+
+Index build time is reported separately, along with the cost of one
+in-place speaker/word-timing update.  Both must return identical results.
+
+Usage:
+    python benchmarks/bench_srt_review_index.py --words 500000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.srt.core.reviewIndex import ReviewIndex  # noqa: E402
+from audio_visualizer.srt.models import WordItem  # noqa: E402
+from audio_visualizer.ui.tabs.srtEdit.document import SubtitleEntry  # noqa: E402
+
+
+# ------------------------------------------------------------
+# Linear-scan reference
+# ------------------------------------------------------------
+
+def _scan_next_low(entries, e, w, threshold):
+    for i in range(e, len(entries)):
+        words = entries[i].words
+        for j in range(w + 1 if i == e else 0, len(words)):
+            conf = words[j].confidence
+            if conf is not None and conf < threshold:
+                return i, j
+    return None
+
+
+def _scan_prev_low(entries, e, w, threshold):
+    for i in range(e, -1, -1):
+        words = entries[i].words
+        for j in range((w if i == e else len(words)) - 1, -1, -1):
+            conf = words[j].confidence
+            if conf is not None and conf < threshold:
+                return i, j
+    return None
+
+
+def _scan_next_speaker_change(entries, e):
+    for i in range(max(e + 1, 1), len(entries)):
+        if entries[i].speaker != entries[i - 1].speaker:
+            return i
+    return -1
+
+
+def _scan_next_estimated(entries, e):
+    for i in range(e + 1, len(entries)):
+        if entries[i].alignment_status == "estimated":
+            return i
+    return -1
+
+
+def _scan_word_at(entries, t):
+    found = None
+    for i, entry in enumerate(entries):
+        for j, word in enumerate(entry.words):
+            if word.start <= t:
+                found = (i, j)
+    return found
+
+
+# ------------------------------------------------------------
+# Synthetic transcript
+# ------------------------------------------------------------
+
+def _entries(word_count: int, seed: int, low_share: float):
+    rng = random.Random(seed)
+    entries, t, made = [], 0.0, 0
+    speaker = "SPEAKER_00"
+    while made < word_count:
+        n = min(rng.randint(3, 12), word_count - made)
+        words = []
+        for _ in range(n):
+            conf = rng.uniform(0.0, 0.5) if rng.random() < low_share else rng.uniform(0.5, 1.0)
+            words.append(WordItem(start=round(t, 3), end=round(t + 0.2, 3), text="w", confidence=conf))
+            t += 0.25
+        if rng.random() < 0.05:
+            speaker = rng.choice(["SPEAKER_00", "SPEAKER_01", "SPEAKER_02"])
+        entries.append(SubtitleEntry(
+            index=len(entries) + 1, start_ms=int(words[0].start * 1000), end_ms=int(t * 1000), text="",
+            speaker=speaker, words=words,
+            alignment_status="estimated" if rng.random() < 0.002 else "matched",
+        ))
+        made += n
+        t += 0.4
+    return entries
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=500_000, help="Transcript length in words")
+    parser.add_argument("--queries", type=int, default=200, help="Random cursors per query kind")
+    parser.add_argument("--low-share", type=float, default=0.0005,
+                        help="Share of words below 0.5 confidence (sparse = long scans)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    entries = _entries(args.words, args.seed, args.low_share)
+    rng = random.Random(args.seed + 1)
+    cursors = [rng.randrange(len(entries)) for _ in range(args.queries)]
+    times = [rng.uniform(0, entries[-1].words[-1].end) for _ in range(args.queries)]
+    print(f"input: {args.words} words in {len(entries)} subtitles, {args.queries} queries per kind")
+
+    start = time.perf_counter()
+    index = ReviewIndex.from_entries(entries)
+    build = time.perf_counter() - start
+    print(f"index build: {build:.3f}s ({index.low_confidence_count(0.5)} words below 0.5)")
+
+    def ref_of(pos):
+        return index.word_ref(pos) if pos >= 0 else None
+
+    kinds = (
+        ("next low conf", lambda c: _scan_next_low(entries, c, 0, 0.5),
+         lambda c: ref_of(index.next_low_confidence(index.word_position(c, 0), 0.5)), cursors),
+        ("prev low conf", lambda c: _scan_prev_low(entries, c, 0, 0.5),
+         lambda c: ref_of(index.prev_low_confidence(index.word_position(c, 0), 0.5)), cursors),
+        ("speaker change", lambda c: _scan_next_speaker_change(entries, c),
+         index.next_speaker_change, cursors),
+        ("estimated", lambda c: _scan_next_estimated(entries, c), index.next_estimated, cursors),
+        ("word at time", lambda t: _scan_word_at(entries, t), lambda t: ref_of(index.word_at(t)), times),
+    )
+    print(f"{'query':15} {'scan/q':>10} {'index/q':>10} {'speedup':>9}  identical")
+    exact = True
+    for label, scan, lookup, inputs in kinds:
+        start = time.perf_counter()
+        expected = [scan(x) for x in inputs]
+        scan_time = (time.perf_counter() - start) / len(inputs)
+        start = time.perf_counter()
+        got = [lookup(x) for x in inputs]
+        index_time = (time.perf_counter() - start) / len(inputs)
+        same = expected == got
+        exact = exact and same
+        print(f"{label:15} {scan_time * 1e6:8.1f}us {index_time * 1e6:8.1f}us {scan_time / index_time:8.0f}x  "
+              f"{'ok' if same else 'MISMATCH'}")
+
+    start = time.perf_counter()
+    for c in cursors:
+        index.set_speaker(c, "SPEAKER_03")
+        index.update_word(c, 0, entries[c].words[0].start)
+    update = (time.perf_counter() - start) / len(cursors)
+    print(f"in-place speaker + word update: {update * 1e6:.1f}us (vs {build:.3f}s rebuild)")
+    return 0 if exact else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,141 @@
+"""Time to first subtitle on disk: write-at-end vs. streaming output.
+
+Feeds a synthetic long recording (word timing plus detected silences)
+through ``transcribe_file`` with a stand-in model that yields segments at
+``--infer-rtf`` times real time.  A watcher thread records when the output
+(or, when streaming, its ``.partial`` file) first contains a subtitle, and the total run time is compared to see
+what the incremental chunking costs.  The final files must be identical.
+
+Usage:
+    python benchmarks/bench_srt_streaming_output.py --minutes 60 --infer-rtf 0.002
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.srt.core.pipeline import PreparedAudio  # noqa: E402
+from audio_visualizer.srt.io.audioHelpers import DecodedAudio  # noqa: E402
+from audio_visualizer.srt.models import ResolvedConfig  # noqa: E402
+from audio_visualizer.srt.srtApi import begin_transcribe_file  # noqa: E402
+
+_VOCAB = "the quick brown fox jumps over a lazy dog. Hello, world! yes no maybe".split()
+
+
+def _make_recording(minutes: float, seed: int):
+    rng = random.Random(seed)
+    duration = minutes * 60.0
+    segments, silences, t = [], [], 0.0
+    while t < duration:
+        words = []
+        for _ in range(rng.randint(6, 14)):
+            length = rng.uniform(0.15, 0.5)
+            words.append(SimpleNamespace(start=t, end=t + length, word=" " + rng.choice(_VOCAB)))
+            t += length
+            if rng.random() < 0.12:
+                pause = rng.uniform(0.3, 1.5)
+                silences.append((t + 0.02, t + pause - 0.02))
+                t += pause
+            else:
+                t += rng.uniform(0.0, 0.12)
+        segments.append(SimpleNamespace(start=words[0].start, end=words[-1].end,
+                                        text="".join(w.word for w in words), words=words))
+    return segments, silences, t
+
+
+class _PacedModel:
+    """Yields the prepared segments, sleeping ``rtf`` x each segment's length."""
+
+    def __init__(self, segments, rtf: float):
+        self.segments = segments
+        self.rtf = rtf
+
+    def transcribe(self, _audio, **_kwargs):
+        def gen():
+            for seg in self.segments:
+                time.sleep((seg.end - seg.start) * self.rtf)
+                yield seg
+        return gen(), SimpleNamespace(language="en")
+
+
+def _run(output: Path, segments, silences, duration, rtf, stream: bool):
+    prepared = PreparedAudio(
+        input_path=output.with_suffix(".wav"),
+        audio=DecodedAudio(samples=np.zeros(int(duration * 16000), dtype=np.float32)),
+        silences=silences,
+    )
+    first = {}
+    done = threading.Event()
+    watched = output.with_suffix(output.suffix + ".partial") if stream else output
+
+    def watch(start):
+        while not done.is_set():
+            try:
+                if watched.stat().st_size > 0 and "t" not in first:
+                    first["t"] = time.perf_counter() - start
+            except OSError:
+                pass
+            time.sleep(0.005)
+
+    start = time.perf_counter()
+    watcher = threading.Thread(target=watch, args=(start,), daemon=True)
+    watcher.start()
+    finish = begin_transcribe_file(
+        input_path=prepared.input_path,
+        output_path=output,
+        fmt="srt",
+        cfg=ResolvedConfig(),
+        model=_PacedModel(segments, rtf),
+        device_used="cpu",
+        compute_type_used="int8",
+        prepared=prepared,
+        stream_output=stream,
+    )
+    result = finish()
+    total = time.perf_counter() - start
+    done.set()
+    watcher.join()
+    if not result.success:
+        raise RuntimeError(result.error)
+    return first.get("t", total), total
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=60.0, help="Recording length")
+    parser.add_argument("--infer-rtf", type=float, default=0.002,
+                        help="Stand-in model time per second of audio")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    segments, silences, duration = _make_recording(args.minutes, args.seed)
+    print(f"input: {args.minutes:g} min, {len(segments)} segments, {len(silences)} silences, "
+          f"stand-in model RTF {args.infer_rtf:g}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        batch_first, batch_total = _run(tmp_path / "batch.srt", segments, silences, duration,
+                                        args.infer_rtf, stream=False)
+        stream_first, stream_total = _run(tmp_path / "stream.srt", segments, silences, duration,
+                                          args.infer_rtf, stream=True)
+        same = (tmp_path / "batch.srt").read_bytes() == (tmp_path / "stream.srt").read_bytes()
+
+    print(f"write at end  first subtitle {batch_first:8.3f}s  total {batch_total:8.3f}s")
+    print(f"streaming     first subtitle {stream_first:8.3f}s  total {stream_total:8.3f}s  "
+          f"(overhead {stream_total - batch_total:+.3f}s)")
+    print(f"final outputs {'identical' if same else 'DIFFER'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
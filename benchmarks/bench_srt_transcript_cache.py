@@ -0,0 +1,133 @@
+"""Re-running SRT generation with new formatting: no cache vs. TranscriptCache.
+
+Generates one clip, transcribes it once, then re-runs it with several
+formatting variants (line length and line count):
+
+* uncached: every re-run transcribes again
+* cached: the first run fills a ``TranscriptCache`` and the re-runs reuse
+  the stored segments, so only decoding, chunking and writing remain
+
+The model is a stand-in that sleeps for ``--infer-rtf`` times the clip
+duration and emits one word every 0.4 s, so the benchmark measures what
+the cache saves independently of model speed.
+
+Usage:
+    python benchmarks/bench_srt_transcript_cache.py --seconds 300 --infer-rtf 0.05
+"""
+
+import argparse
+import dataclasses
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.srt.io.transcriptCache import TranscriptCache  # noqa: E402
+from audio_visualizer.srt.models import ResolvedConfig  # noqa: E402
+from audio_visualizer.srt.srtApi import transcribe_file  # noqa: E402
+
+SAMPLE_RATE = 16000
+
+
+class _SleepModel:
+    """Sleeps ``rtf`` x audio duration, then returns a word every 0.4 s."""
+
+    def __init__(self, rtf: float):
+        self.rtf = rtf
+        self.calls = 0
+
+    def transcribe(self, audio, **_kwargs):
+        self.calls += 1
+        duration = len(audio) / SAMPLE_RATE
+        time.sleep(duration * self.rtf)
+        segments, t = [], 0.0
+        while t + 4.0 <= duration:
+            words = [SimpleNamespace(start=t + i * 0.4, end=t + i * 0.4 + 0.35,
+                                     word=f" word{i}", probability=0.9) for i in range(10)]
+            segments.append(SimpleNamespace(start=t, end=t + 4.0, text="".join(w.word for w in words),
+                                            words=words))
+            t += 4.0
+        return iter(segments), SimpleNamespace(language="en")
+
+
+def _make_clip(path: Path, seconds: float) -> None:
+    expr = "0.3*sin(2*PI*330*t)*lt(mod(t\\,5)\\,4)"
+    subprocess.run(
+        [
+            "ffmpeg", "-v", "error", "-y",
+            "-f", "lavfi", "-i", f"aevalsrc={expr}:s=44100:d={seconds}",
+            "-c:a", "aac", "-b:a", "96k", str(path),
+        ],
+        check=True,
+    )
+
+
+def _variants():
+    for max_chars, max_lines in ((42, 2), (32, 2), (42, 1), (24, 1)):
+        cfg = ResolvedConfig()
+        cfg.formatting = dataclasses.replace(cfg.formatting, max_chars=max_chars, max_lines=max_lines)
+        yield cfg
+
+
+def _run_all(clip: Path, out_dir: Path, model, cache) -> float:
+    start = time.perf_counter()
+    for i, cfg in enumerate(_variants()):
+        result = transcribe_file(
+            input_path=clip,
+            output_path=out_dir / f"variant_{i}.srt",
+            fmt="srt",
+            cfg=cfg,
+            model=model,
+            device_used="cpu",
+            compute_type_used="int8",
+            transcript_cache=cache,
+            model_name="stand-in",
+        )
+        if not result.success:
+            raise RuntimeError(result.error)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=300.0, help="Clip length")
+    parser.add_argument("--infer-rtf", type=float, default=0.05,
+                        help="Stand-in model time per second of audio")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        clip = tmp_path / "clip.m4a"
+        _make_clip(clip, args.seconds)
+        variants = len(list(_variants()))
+        print(f"input: {args.seconds:g}s clip, {variants} formatting variants, "
+              f"stand-in model RTF {args.infer_rtf:g}")
+
+        uncached = _SleepModel(args.infer_rtf)
+        (tmp_path / "uncached").mkdir()
+        t_uncached = _run_all(clip, tmp_path / "uncached", uncached, None)
+
+        cached = _SleepModel(args.infer_rtf)
+        cache = TranscriptCache(tmp_path / "cache")
+        (tmp_path / "cached").mkdir()
+        t_cached = _run_all(clip, tmp_path / "cached", cached, cache)
+
+        same = all(
+            (tmp_path / "uncached" / f"variant_{i}.srt").read_bytes()
+            == (tmp_path / "cached" / f"variant_{i}.srt").read_bytes()
+            for i in range(variants)
+        )
+        print(f"uncached {t_uncached:8.3f}s  model calls {uncached.calls}")
+        print(f"cached   {t_cached:8.3f}s  model calls {cached.calls}  x{t_uncached / t_cached:.1f}  "
+              f"(cache {cache.size_bytes() / 1024:.0f} KiB)")
+        print(f"outputs {'identical' if same else 'DIFFER'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
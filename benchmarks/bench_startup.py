@@ -0,0 +1,176 @@
+"""Startup: time to first window and time to first transcription.
+
+Every measurement runs in a fresh interpreter so import caches do not
+carry over:
+
+* import costs: each module on the window path and each heavy optional
+  dependency imported alone (``startup.measure_import``);
+* first window: ``QApplication`` + ``MainWindow`` shown offscreen, with
+  the app's lazy imports (``lazy``) and with the modules they defer
+  (numpy, urllib.request, docx) imported up front the way the window path
+  used to (``eager``), plus which heavy modules were loaded by then;
+* first transcription (with ``--input``): seconds from the user pressing
+  Generate to the first segment, ``cold`` (model loaded on demand) vs
+  ``warm`` (``run_warmup`` ran while the window sat idle for ``--idle``
+  seconds).  Both runs must produce identical text.
+
+The first-transcription half needs faster-whisper and a locally cached
+model; it is skipped with a note otherwise.
+
+Usage:
+    python benchmarks/bench_startup.py --runs 5 --input speech.wav --model base
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.startup import HEAVY_MODULES  # noqa: E402
+
+WINDOW_MODULES = (
+    "PySide6.QtWidgets",
+    "audio_visualizer.visualizers.utilities",
+    "audio_visualizer.updater",
+    "audio_visualizer.ui.mainWindow",
+)
+# What the window path imported eagerly before the lazy proxies
+EAGER_MODULES = ("numpy", "urllib.request", "docx")
+
+
+# ------------------------------------------------------------
+# Child programs (run with a fresh interpreter)
+# ------------------------------------------------------------
+
+_IMPORT_CHILD = """
+import json, sys
+from audio_visualizer import startup
+cost = startup.measure_import(sys.argv[1])
+print(json.dumps({"seconds": cost.seconds, "error": cost.error}))
+"""
+
+_WINDOW_CHILD = """
+import json, sys
+from audio_visualizer import startup
+for name in sys.argv[1:]:
+    startup.measure_import(name)
+from PySide6.QtWidgets import QApplication
+app = QApplication([])
+startup.mark("qt_app")
+from audio_visualizer.ui.mainWindow import MainWindow
+window = MainWindow()
+startup.mark("window_built")
+window._startup_warmup_tasks = []
+window.show()
+app.processEvents()
+marks = startup.startup_marks()
+print(json.dumps({"seconds": marks.get("window_shown", startup.mark("window_shown")),
+                  "heavy": startup.loaded_heavy_modules()}))
+"""
+
+_TRANSCRIBE_CHILD = """
+import json, sys, threading, time
+from audio_visualizer import startup
+from audio_visualizer.srt import srtApi
+path, model_name, idle, warm = sys.argv[1], sys.argv[2], float(sys.argv[3]), sys.argv[4] == "1"
+if warm:
+    threading.Thread(target=startup.run_warmup,
+                     args=(["whisper"], {"whisper": {"model_name": model_name, "device": "cpu"}}),
+                     daemon=True).start()
+time.sleep(idle)
+start = time.perf_counter()
+model, _, _ = srtApi.load_model(model_name, "cpu", False)
+segments, _ = model.transcribe(path, beam_size=1, vad_filter=False)
+first = None
+texts = []
+for seg in segments:
+    if first is None:
+        first = time.perf_counter() - start
+    texts.append(seg.text)
+print(json.dumps({"first": first, "total": time.perf_counter() - start, "text": "".join(texts)}))
+"""
+
+
+def _child(code: str, *args: str) -> dict:
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")]))
+    out = subprocess.run([sys.executable, "-c", code, *args], capture_output=True, text=True, env=env)
+    if out.returncode != 0:
+        lines = out.stderr.strip().splitlines() or ["exit code %d" % out.returncode]
+        return {"error": lines[-1]}
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _median(values):
+    return statistics.median(values) if values else float("nan")
+
+
+def _import_table(runs: int) -> None:
+    print(f"{'module':42} {'import':>10}")
+    for name in WINDOW_MODULES + HEAVY_MODULES + ("docx", "urllib.request"):
+        results = [_child(_IMPORT_CHILD, name) for _ in range(runs)]
+        errors = [r.get("error") for r in results if r.get("error")]
+        if errors:
+            print(f"{name:42} {'n/a':>10}  ({errors[0]})")
+        else:
+            print(f"{name:42} {_median([r['seconds'] for r in results]) * 1000:8.1f}ms")
+
+
+def _first_window(runs: int) -> bool:
+    ok = True
+    print(f"\n{'first window':12} {'median':>10}  heavy modules loaded")
+    for label, pre in (("eager", EAGER_MODULES), ("lazy", ())):
+        results = [_child(_WINDOW_CHILD, *pre) for _ in range(runs)]
+        failed = [r["error"] for r in results if "error" in r]
+        if failed:
+            print(f"{label:12} {'n/a':>10}  ({failed[0]})")
+            continue
+        heavy = sorted({m for r in results for m in r["heavy"]})
+        print(f"{label:12} {_median([r['seconds'] for r in results]) * 1000:8.1f}ms  {', '.join(heavy) or '-'}")
+        if label == "lazy" and heavy:
+            ok = False
+    return ok
+
+
+def _first_transcription(args) -> bool:
+    print(f"\n{'transcription':14} {'first seg':>10} {'total':>9}")
+    texts = {}
+    for label, warm in (("cold", "0"), ("warm", "1")):
+        results = [_child(_TRANSCRIBE_CHILD, str(args.input), args.model, str(args.idle), warm)
+                   for _ in range(args.runs)]
+        failed = [r["error"] for r in results if "error" in r]
+        if failed:
+            print(f"{label:14} {'n/a':>10}  ({failed[0]})")
+            return True
+        texts[label] = {r["text"] for r in results}
+        print(f"{label:14} {_median([r['first'] for r in results]):9.2f}s "
+              f"{_median([r['total'] for r in results]):8.2f}s")
+    same = texts["cold"] == texts["warm"] and len(texts["cold"]) == 1
+    print(f"identical text: {'ok' if same else 'MISMATCH'}")
+    return same
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement")
+    parser.add_argument("--input", type=Path, default=None, help="Audio file for the transcription timing")
+    parser.add_argument("--model", default="base")
+    parser.add_argument("--idle", type=float, default=3.0,
+                        help="Seconds between window shown and pressing Generate")
+    args = parser.parse_args()
+
+    _import_table(args.runs)
+    ok = _first_window(args.runs)
+    if args.input is not None:
+        ok = _first_transcription(args) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+"""Training clip export: per-clip extraction vs. grouped single-pass extraction.
+
+Generates a few long MP3 recordings and a set of correction-sized clip
+ranges spread across them, then cuts every clip with the previous
+per-clip path (open, seek, new resampler, decode, per clip) and with
+``export_clips`` (one decode pass per source, sources in parallel),
+comparing clip lengths with the requested ranges.
+
+Usage:
+    python benchmarks/bench_training_clip_export.py --sources 3 --minutes 20 --clips 1500
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from audio_visualizer.core.clipExport import ClipRequest, export_clips, write_wav  # noqa: E402
+
+
+def _legacy_extract(source_path, output_path, start_ms, end_ms, sample_rate=16000):
+    """The previous per-clip extraction."""
+    import av
+
+    start_sec = start_ms / 1000.0
+    end_sec = end_ms / 1000.0
+    container = av.open(source_path)
+    try:
+        audio_stream = container.streams.audio[0]
+        seek_ts = int(start_sec / audio_stream.time_base)
+        container.seek(max(0, seek_ts - 1), stream=audio_stream)
+        resampler = av.AudioResampler(format="s16", layout="mono", rate=sample_rate)
+        samples = []
+        for frame in container.decode(audio=0):
+            frame_start = float(frame.pts * audio_stream.time_base)
+            frame_end = frame_start + (frame.samples / frame.sample_rate)
+            if frame_end < start_sec:
+                continue
+            if frame_start > end_sec:
+                break
+            for r_frame in resampler.resample(frame):
+                raw = bytes(r_frame.planes[0])
+                r_start = float(r_frame.pts * audio_stream.time_base) if r_frame.pts is not None else frame_start
+                r_end = r_start + (r_frame.samples / r_frame.sample_rate)
+                if r_start < start_sec:
+                    raw = raw[int((start_sec - r_start) * r_frame.sample_rate) * 2:]
+                if r_end > end_sec:
+                    raw = raw[:int((end_sec - max(r_start, start_sec)) * r_frame.sample_rate) * 2]
+                if raw:
+                    samples.append(raw)
+    finally:
+        container.close()
+    write_wav(output_path, b"".join(samples), sample_rate, 1, 2)
+
+
+def _frames(path: Path) -> int:
+    with wave.open(str(path)) as w:
+        return w.getnframes()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sources", type=int, default=3, help="Long recordings")
+    parser.add_argument("--minutes", type=float, default=20.0, help="Length of each recording")
+    parser.add_argument("--clips", type=int, default=1500, help="Clips across all recordings")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    length_ms = int(args.minutes * 60_000)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        sources = []
+        for i in range(args.sources):
+            path = tmp_path / f"source_{i}.mp3"
+            subprocess.run(
+                ["ffmpeg", "-loglevel", "error", "-f", "lavfi",
+                 "-i", f"anoisesrc=d={args.minutes * 60}:c=pink:r=44100:a=0.3:seed={i + 1}",
+                 "-ac", "2", "-b:a", "128k", str(path)],
+                check=True,
+            )
+            sources.append(str(path))
+        ranges = []
+        for _ in range(args.clips):
+            start = rng.randrange(0, length_ms - 8000)
+            ranges.append((rng.choice(sources), start, start + rng.randint(1000, 8000)))
+        print(f"input: {args.sources} x {args.minutes:g} min MP3, {len(ranges)} clips")
+
+        legacy_dir = tmp_path / "legacy"
+        legacy_dir.mkdir()
+        start = time.perf_counter()
+        for i, (source, start_ms, end_ms) in enumerate(ranges):
+            _legacy_extract(source, legacy_dir / f"clip_{i:05d}.wav", start_ms, end_ms)
+        legacy_s = time.perf_counter() - start
+
+        timings = {}
+        for workers in sorted({1, args.workers}):
+            out_dir = tmp_path / f"grouped_{workers}"
+            out_dir.mkdir()
+            requests = [
+                ClipRequest(i, source, start_ms, end_ms, out_dir / f"clip_{i:05d}.wav")
+                for i, (source, start_ms, end_ms) in enumerate(ranges)
+            ]
+            start = time.perf_counter()
+            errors = export_clips(requests, workers=workers)
+            timings[workers] = time.perf_counter() - start
+            failed = [i for i, e in errors.items() if e is not None]
+            if failed:
+                print(f"grouped extraction failed for {len(failed)} clips: {errors[failed[0]]}")
+                return 1
+
+        expected = [(end_ms - start_ms) * 16 for _source, start_ms, end_ms in ranges]
+        legacy_err = max(abs(_frames(legacy_dir / f"clip_{i:05d}.wav") - n) for i, n in enumerate(expected))
+        grouped_err = max(
+            abs(_frames(tmp_path / "grouped_1" / f"clip_{i:05d}.wav") - n) for i, n in enumerate(expected)
+        )
+
+    print(f"per-clip extraction   {legacy_s:8.2f}s  ({len(ranges) / legacy_s:7.1f} clips/s)")
+    for workers, seconds in timings.items():
+        print(f"grouped, {workers} worker(s)  {seconds:8.2f}s  ({len(ranges) / seconds:7.1f} clips/s, "
+              f"{legacy_s / seconds:.1f}x)")
+    print(f"max clip length error: per-clip {legacy_err} samples, grouped {grouped_err} samples")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -21,6 +21,9 @@ _EXPORTS: Dict[str, Tuple[str, str]] = {
     "RenderResult": (".captionApi", "RenderResult"),
     "list_presets": (".captionApi", "list_presets"),
     "list_animations": (".captionApi", "list_animations"),
+    "render_subtitles_batch": (".captionBatch", "render_subtitles_batch"),
+    "BatchRenderItem": (".captionBatch", "BatchRenderItem"),
+    "BatchRenderResult": (".captionBatch", "BatchRenderResult"),
     # Core
     "PresetConfig": (".core.config", "PresetConfig"),
     "AnimationConfig": (".core.config", "AnimationConfig"),
@@ -20,6 +20,10 @@ import pysubs2
 from .baseAnimation import BaseAnimation
 from .registry import AnimationRegistry
 
+_WORD_TOKEN_RE = re.compile(r"\w+(?:'\w+)?[^\w\s]*|[^\w\s]+", re.UNICODE)
+_WORD_START_RE = re.compile(r"^\w", re.UNICODE)
+_NON_WORD_RE = re.compile(r"[^\w']", re.UNICODE)
+
 
 @AnimationRegistry.register
 class WordHighlightAnimation(BaseAnimation):
@@ -126,20 +130,17 @@ class WordHighlightAnimation(BaseAnimation):
     @staticmethod
     def _tokenize(text: str) -> List[str]:
         """Tokenize text into words, punctuation, and newlines."""
-        text = text.replace(r"\N", "\n")
+        lines = text.replace(r"\N", "\n").split("\n")
         parts: List[str] = []
-        for i, line in enumerate(text.split("\n")):
-            words = re.findall(
-                r"\w+(?:'\w+)?[^\w\s]*|[^\w\s]+", line, flags=re.UNICODE
-            )
-            parts.extend(words)
-            if i < len(text.split("\n")) - 1:
+        for i, line in enumerate(lines):
+            parts.extend(_WORD_TOKEN_RE.findall(line))
+            if i < len(lines) - 1:
                 parts.append("\n")
         return parts
 
     @staticmethod
     def _is_word(token: str) -> bool:
-        return token != "\n" and bool(re.match(r"^\w", token, re.UNICODE))
+        return token != "\n" and _WORD_START_RE.match(token) is not None
 
     # -- Timing allocation ------------------------------------------------
 
@@ -236,7 +237,7 @@ class WordHighlightAnimation(BaseAnimation):
                     out += " "
 
             if i in word_set:
-                clean = re.sub(r"[^\w']", "", token, flags=re.UNICODE).lower()
+                clean = _NON_WORD_RE.sub("", token).lower()
                 is_emphasis = clean in emphasis_words
 
                 t_start = cumulative_ms
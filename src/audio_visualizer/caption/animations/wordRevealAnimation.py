@@ -12,6 +12,10 @@ import pysubs2
 from .baseAnimation import BaseAnimation
 from .registry import AnimationRegistry
 
+# Word + optional trailing punctuation, OR standalone punctuation
+_WORD_TOKEN_RE = re.compile(r"\w+(?:'\w+)?[^\w\s]*|[^\w\s]+", re.UNICODE)
+_WORD_START_RE = re.compile(r"^\w", re.UNICODE)
+
 
 @AnimationRegistry.register
 class WordRevealAnimation(BaseAnimation):
@@ -150,13 +154,12 @@ class WordRevealAnimation(BaseAnimation):
         Example: "Hello, world!" -> ["Hello,", "world!"]
         Example: "Wait... what?" -> ["Wait...", "what?"]
         """
-        # Match: word + optional trailing punctuation, OR standalone punctuation
-        return re.findall(r"\w+(?:'\w+)?[^\w\s]*|[^\w\s]+", text, flags=re.UNICODE)
+        return _WORD_TOKEN_RE.findall(text)
 
     @staticmethod
     def _is_word_token(token: str) -> bool:
         """Check if token is a word (not newline or punctuation)."""
-        return token != "\n" and bool(re.match(r"^\w", token, flags=re.UNICODE))
+        return token != "\n" and _WORD_START_RE.match(token) is not None
 
     def _allocate_timing(
         self,
@@ -22,18 +22,25 @@ Example:
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional, Union
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 from audio_visualizer.events import AppEvent, AppEventEmitter, EventLevel, EventType
 
 from .animations import AnimationRegistry
-from .core.sizing import SizeCalculator
+from .core.eventPipeline import EventPipeline
+from .core.sizing import OverlaySize, SizeCalculator
 from .core.style import StyleBuilder
 from .core.subtitle import SubtitleFile
 from .presets.loader import PresetLoader
 from .rendering.ffmpegRenderer import FFmpegRenderer
 from .rendering.progressTracker import ProgressTracker
 
+if TYPE_CHECKING:
+    import pysubs2
+    from PIL import ImageFont
+
+    from .core.config import PresetConfig
+
 
 @dataclass
 class RenderConfig:
@@ -46,6 +53,7 @@ class RenderConfig:
     apply_animation: bool = True
     reskin: bool = False  # For ASS files: apply preset style
     max_duration_sec: float = 0.0  # 0 = no limit; >0 clamps render duration
+    single_pass_delivery: bool = True  # Emit overlay + delivery MP4 in one FFmpeg pass
 
 
 @dataclass
@@ -58,6 +66,119 @@ class RenderResult:
     height: int = 0
     duration_ms: int = 0
     error: Optional[str] = None
+    delivery_path: Optional[Path] = None
+
+
+@dataclass
+class PreparedSubtitle:
+    """A working ASS file ready to hand to the FFmpeg renderer."""
+
+    ass_path: Path
+    size: OverlaySize
+    end_ms: int
+    duration_sec: float
+
+
+def prepare_working_ass(
+    input_path: Path,
+    ass_path: Path,
+    config: RenderConfig,
+    preset: "PresetConfig",
+    progress: ProgressTracker,
+    style: Optional["pysubs2.SSAStyle"] = None,
+    font: Optional["ImageFont.FreeTypeFont"] = None,
+) -> PreparedSubtitle:
+    """
+    Load a subtitle file and write the styled, animated, positioned ASS.
+
+    This is the preprocessing half of :func:`render_subtitle`. Callers that
+    render many files with the same preset can pass a pre-built ``style`` and
+    a pre-loaded ``font`` so they are not rebuilt for every file.
+
+    Args:
+        input_path: Path to input subtitle file (.srt, .ass, .json or .avbundle)
+        ass_path: Destination for the working ASS file
+        config: Render configuration
+        preset: Resolved preset configuration
+        progress: Progress tracker for stage messages
+        style: Optional pre-built "Default" style (copied before use)
+        font: Optional pre-loaded measurement font for ``preset``
+
+    Returns:
+        PreparedSubtitle describing the working ASS file
+    """
+    ext = input_path.suffix.lower().lstrip(".")
+
+    progress.step(f"Loading: {input_path.name}")
+
+    # Load subtitle (SubtitleFile.load handles .json and .avbundle bundles)
+    subtitle = SubtitleFile.load(input_path)
+    if subtitle.has_word_timing:
+        progress.step(
+            f"Loaded {len(subtitle.subs.events)} subtitle events "
+            f"with precise word timing from bundle"
+        )
+    else:
+        progress.step(f"Loaded {len(subtitle.subs.events)} subtitle events")
+
+    # Determine if we should apply animation
+    apply_animation = config.apply_animation
+
+    # Build style
+    progress.step("Building ASS style from preset...")
+    if style is None:
+        style = StyleBuilder(preset).build("Default")
+    else:
+        style = style.copy()
+
+    animation = None
+    if apply_animation and preset.animation:
+        progress.step(f"Applying animation: {preset.animation.type}")
+        animation = AnimationRegistry.create(
+            preset.animation.type, preset.animation.params
+        )
+
+    # Markdown, style (for SRT or when reskinning), animation and
+    # measurement run as one pass over the events
+    progress.step("Computing overlay size...")
+    size_calc = SizeCalculator(preset, safety_scale=config.safety_scale, font=font)
+    pipeline = EventPipeline(
+        size_calc,
+        style=style if ext == "srt" or config.reskin else None,
+        animation=animation,
+    )
+    size = pipeline.run(subtitle)
+    progress.step(f"Computed overlay size: {size.width}x{size.height}")
+
+    # Apply positioning
+    position = size_calc.compute_anchor_position(size)
+    subtitle.apply_center_positioning(position, size)
+    subtitle.set_play_resolution(size)
+
+    # Handle placeholder substitution before writing the working ASS
+    content = subtitle.to_string("ass")
+    if (
+        animation is not None
+        and preset.animation.type == "slide_up"
+        and animation.supports_placeholder_substitution()
+    ):
+        content = animation.substitute_placeholders(content, position)
+    ass_path.write_text(content, encoding="utf-8")
+
+    # Calculate duration
+    end_ms = subtitle.get_duration_ms()
+    duration_sec = (end_ms / 1000.0) + 0.25
+    if config.max_duration_sec > 0:
+        duration_sec = min(duration_sec, config.max_duration_sec)
+
+    progress.step(f"Subtitle duration: {end_ms}ms (~{duration_sec:.2f}s)")
+
+    return PreparedSubtitle(
+        ass_path=ass_path,
+        size=size,
+        end_ms=end_ms,
+        duration_sec=duration_sec,
+    )
 
 
 def render_subtitle(
@@ -68,6 +189,8 @@ def render_subtitle(
     on_event: Optional[Callable[[AppEvent], None]] = None,
     emitter: Optional[AppEventEmitter] = None,
     preset_override: Optional["PresetConfig"] = None,
+    delivery_path: Optional[Union[str, Path]] = None,
+    delivery_audio_path: Optional[Union[str, Path]] = None,
 ) -> RenderResult:
     """
     Render a subtitle file to transparent video overlay.
@@ -86,6 +209,9 @@ def render_subtitle(
         on_progress: Simple callback for progress messages
         on_event: Full event callback for detailed progress
         emitter: Optional shared AppEventEmitter used for host-level integration
+        delivery_path: Optional MP4 delivery path. When set, the overlay and
+            the delivery are produced together in a single FFmpeg process.
+        delivery_audio_path: Optional audio muxed into the delivery output
 
     Returns:
         RenderResult with success status and output details
@@ -105,6 +231,10 @@ def render_subtitle(
     config = config or RenderConfig()
     input_path = Path(input_path)
     output_path = Path(output_path)
+    if delivery_path is not None:
+        delivery_path = Path(delivery_path)
+    if delivery_audio_path is not None:
+        delivery_audio_path = Path(delivery_audio_path)
 
     # Setup event emitter
     event_emitter = emitter or AppEventEmitter()
@@ -123,9 +253,9 @@ def render_subtitle(
     try:
         # Validate input
         ext = input_path.suffix.lower().lstrip(".")
-        if ext not in ("srt", "ass", "json"):
+        if ext not in ("srt", "ass", "json", "avbundle"):
             return RenderResult(
-                success=False, error=f"Unsupported format: {ext}. Use .srt, .ass, or .json"
+                success=False, error=f"Unsupported format: {ext}. Use .srt, .ass, .json or .avbundle"
             )
 
         if not input_path.exists():
@@ -141,86 +271,27 @@ def render_subtitle(
         # Setup progress tracker
         progress = ProgressTracker(event_emitter)
 
-        progress.step(f"Loading: {input_path.name}")
-
-        # Load subtitle (SubtitleFile.load handles .json bundles)
-        subtitle = SubtitleFile.load(input_path)
-        if subtitle.has_word_timing:
-            progress.step(
-                f"Loaded {len(subtitle.subs.events)} subtitle events "
-                f"with precise word timing from bundle"
-            )
-        else:
-            progress.step(f"Loaded {len(subtitle.subs.events)} subtitle events")
-
-        # Apply markdown-to-ASS conversion if any events contain markdown
-        from .core.markdownToAss import markdown_to_ass
-        for event in subtitle.subs.events:
-            if hasattr(event, "text") and event.text:
-                converted = markdown_to_ass(event.text)
-                if converted != event.text:
-                    event.text = converted
-
-        # Determine if we should apply animation
-        apply_animation = config.apply_animation
-
         with tempfile.TemporaryDirectory(prefix="audio_visualizer_caption_") as temp_dir:
             temp_path = Path(temp_dir)
             ass_path = temp_path / "work.ass"
 
-            # Build and apply style
-            progress.step("Building ASS style from preset...")
-            style_builder = StyleBuilder(preset)
-            style = style_builder.build("Default")
-
-            # Apply style for SRT or when reskinning
-            if ext == "srt" or config.reskin:
-                subtitle.apply_style(style, preset, wrap_text=True)
-
-            # Apply animation if requested
-            if apply_animation and preset.animation:
-                progress.step(f"Applying animation: {preset.animation.type}")
-                animation = AnimationRegistry.create(
-                    preset.animation.type, preset.animation.params
-                )
-                subtitle.apply_animation(animation)
-
-            # Calculate size
-            progress.step("Computing overlay size...")
-            size_calc = SizeCalculator(preset, safety_scale=config.safety_scale)
-            size = size_calc.compute_size(subtitle.subs)
-            progress.step(f"Computed overlay size: {size.width}x{size.height}")
-
-            # Apply positioning
-            position = size_calc.compute_anchor_position(size)
-            subtitle.apply_center_positioning(position, size)
-            subtitle.set_play_resolution(size)
-
-            # Save working ASS
-            subtitle.save(ass_path)
-
-            # Handle placeholder substitution
-            if apply_animation and preset.animation and preset.animation.type == "slide_up":
-                animation = AnimationRegistry.create(
-                    preset.animation.type, preset.animation.params
-                )
-                if animation.supports_placeholder_substitution():
-                    content = ass_path.read_text(encoding="utf-8")
-                    content = animation.substitute_placeholders(content, position)
-                    ass_path.write_text(content, encoding="utf-8")
-
-            # Calculate duration
-            end_ms = subtitle.get_duration_ms()
-            duration_sec = (end_ms / 1000.0) + 0.25
-            if config.max_duration_sec > 0:
-                duration_sec = min(duration_sec, config.max_duration_sec)
-
-            progress.step(f"Subtitle duration: {end_ms}ms (~{duration_sec:.2f}s)")
+            prepared = prepare_working_ass(
+                input_path=input_path,
+                ass_path=ass_path,
+                config=config,
+                preset=preset,
+                progress=progress,
+            )
+            size = prepared.size
+            end_ms = prepared.end_ms
+            duration_sec = prepared.duration_sec
 
             # Render
             progress.step("Rendering overlay video via FFmpeg...")
 
             output_path.parent.mkdir(parents=True, exist_ok=True)
+            if delivery_path is not None:
+                delivery_path.parent.mkdir(parents=True, exist_ok=True)
 
             renderer = FFmpegRenderer(
                 emitter=event_emitter,
@@ -229,13 +300,24 @@ def render_subtitle(
                 quality=config.quality,
             )
 
-            renderer.render(
-                ass_path=ass_path,
-                output_path=output_path,
-                size=size,
-                fps=config.fps,
-                duration_sec=duration_sec,
-            )
+            if delivery_path is not None:
+                renderer.render_with_delivery(
+                    ass_path=ass_path,
+                    output_path=output_path,
+                    delivery_path=delivery_path,
+                    size=size,
+                    fps=config.fps,
+                    duration_sec=duration_sec,
+                    audio_path=delivery_audio_path,
+                )
+            else:
+                renderer.render(
+                    ass_path=ass_path,
+                    output_path=output_path,
+                    size=size,
+                    fps=config.fps,
+                    duration_sec=duration_sec,
+                )
 
             progress.step("Render complete")
 
@@ -245,6 +327,7 @@ def render_subtitle(
                 width=size.width,
                 height=size.height,
                 duration_ms=end_ms,
+                delivery_path=delivery_path,
             )
 
     except Exception as e:
@@ -0,0 +1,529 @@
+"""
+Batch caption rendering.
+
+This module renders many subtitle files with one preset. The preset, the
+measurement font and the ASS style are resolved once for the whole batch,
+working ASS files are prepared in parallel, and FFmpeg renders are scheduled
+across a bounded pool of processes with per-item retries.
+
+Example:
+    from audio_visualizer.caption.captionBatch import (
+        BatchRenderItem,
+        render_subtitles_batch,
+    )
+
+    items = [
+        BatchRenderItem("ep01.srt", "out/ep01.mov"),
+        BatchRenderItem("ep02.srt", "out/ep02.mov"),
+    ]
+    batch = render_subtitles_batch(
+        items,
+        config=RenderConfig(preset="modern_box"),
+        max_workers=4,
+    )
+    print(f"{batch.succeeded}/{len(batch.items)} rendered")
+
+The module doubles as a command-line tool::
+
+    python -m audio_visualizer.caption.captionBatch captions/*.srt -o out/
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+from audio_visualizer.events import AppEvent, AppEventEmitter, EventLevel, EventType
+
+from .captionApi import PreparedSubtitle, RenderConfig, RenderResult, prepare_working_ass
+from .core.config import PresetConfig
+from .core.sizing import SizeCalculator
+from .core.style import StyleBuilder
+from .presets.loader import PresetLoader
+from .rendering.ffmpegRenderer import FFmpegRenderer
+from .rendering.progressTracker import ProgressTracker
+
+logger = logging.getLogger(__name__)
+
+_SUPPORTED_EXTENSIONS = ("srt", "ass", "json", "avbundle")
+
+
+@dataclass
+class BatchRenderItem:
+    """A single subtitle file to render as part of a batch."""
+
+    input_path: Union[str, Path]
+    output_path: Union[str, Path]
+    delivery_path: Optional[Union[str, Path]] = None
+    delivery_audio_path: Optional[Union[str, Path]] = None
+
+    def __post_init__(self) -> None:
+        self.input_path = Path(self.input_path)
+        self.output_path = Path(self.output_path)
+        if self.delivery_path is not None:
+            self.delivery_path = Path(self.delivery_path)
+        if self.delivery_audio_path is not None:
+            self.delivery_audio_path = Path(self.delivery_audio_path)
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one batch item."""
+
+    item: BatchRenderItem
+    result: RenderResult
+    attempts: int = 0
+    elapsed_sec: float = 0.0
+
+
+@dataclass
+class BatchRenderResult:
+    """Aggregated outcome of a batch render."""
+
+    items: List[BatchItemResult] = field(default_factory=list)
+    elapsed_sec: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        """Number of items that rendered successfully."""
+        return sum(1 for entry in self.items if entry.result.success)
+
+    @property
+    def failed(self) -> int:
+        """Number of items that failed after all retries."""
+        return len(self.items) - self.succeeded
+
+    @property
+    def success(self) -> bool:
+        """True when every item rendered successfully."""
+        return self.failed == 0
+
+
+class _BatchProgress:
+    """Thread-safe aggregation of per-item progress into batch events."""
+
+    def __init__(self, emitter: AppEventEmitter, total: int) -> None:
+        self._emitter = emitter
+        self._total = max(total, 1)
+        self._lock = threading.Lock()
+        self._percent: Dict[int, float] = {}
+        self._completed = 0
+        self._failed = 0
+        self._last_emit = 0.0
+
+    def emit(self, event: AppEvent) -> None:
+        with self._lock:
+            self._emitter.emit(event)
+
+    def item_percent(self, index: int, percent: Optional[float]) -> None:
+        if percent is None:
+            return
+        with self._lock:
+            self._percent[index] = percent
+            now = time.time()
+            if now - self._last_emit < 0.5:
+                return
+            self._last_emit = now
+            self._emit_progress_locked("Batch rendering")
+
+    def item_done(self, index: int, success: bool) -> None:
+        with self._lock:
+            self._percent[index] = 100.0
+            if success:
+                self._completed += 1
+            else:
+                self._failed += 1
+            self._emit_progress_locked(
+                f"Batch rendering ({self._completed + self._failed}/{self._total})"
+            )
+
+    def _emit_progress_locked(self, message: str) -> None:
+        percent = sum(self._percent.values()) / self._total
+        self._emitter.emit(
+            AppEvent(
+                event_type=EventType.RENDER_PROGRESS,
+                message=message,
+                data={
+                    "percent": min(100.0, percent),
+                    "completed": self._completed,
+                    "failed": self._failed,
+                    "total": self._total,
+                },
+            )
+        )
+
+
+def render_subtitles_batch(
+    items: Sequence[BatchRenderItem],
+    config: Optional[RenderConfig] = None,
+    max_workers: Optional[int] = None,
+    prepare_workers: Optional[int] = None,
+    retries: int = 1,
+    on_progress: Optional[Callable[[str], None]] = None,
+    on_event: Optional[Callable[[AppEvent], None]] = None,
+    emitter: Optional[AppEventEmitter] = None,
+    preset_override: Optional[PresetConfig] = None,
+) -> BatchRenderResult:
+    """
+    Render many subtitle files with a shared preset.
+
+    The preset is loaded once, the measurement font is opened once and the
+    ASS style is built once. Working ASS files are prepared on a thread pool
+    and each one is handed to a bounded pool of FFmpeg processes as soon as
+    it is ready. A failed FFmpeg render is retried up to ``retries`` times;
+    preparation errors are not retried. One item failing never stops the
+    rest of the batch.
+
+    Args:
+        items: Files to render
+        config: Render configuration shared by all items (defaults if None)
+        max_workers: Maximum concurrent FFmpeg processes
+                     (default: half the CPU count, at least 1)
+        prepare_workers: Threads used to prepare ASS files
+                         (default: ``max_workers``)
+        retries: Extra render attempts per item after a failure
+        on_progress: Simple callback for batch progress messages
+        on_event: Full event callback for detailed progress
+        emitter: Optional shared AppEventEmitter used for host-level integration
+        preset_override: Use this preset instead of loading ``config.preset``
+
+    Returns:
+        BatchRenderResult with one BatchItemResult per input item, in order.
+        Raises nothing for per-item failures; a preset or font that cannot be
+        loaded marks every item as failed.
+    """
+    config = config or RenderConfig()
+    items = list(items)
+    max_workers = max(1, max_workers or (os.cpu_count() or 2) // 2)
+    prepare_workers = max(1, prepare_workers or max_workers)
+    retries = max(0, retries)
+
+    event_emitter = emitter or AppEventEmitter()
+    if on_event:
+        event_emitter.subscribe(on_event)
+    if on_progress:
+
+        def progress_adapter(event: AppEvent) -> None:
+            if event.event_type in (EventType.STAGE, EventType.RENDER_PROGRESS):
+                on_progress(event.message)
+
+        event_emitter.subscribe(progress_adapter)
+
+    batch_start = time.perf_counter()
+    batch = BatchRenderResult()
+    tracker = _BatchProgress(event_emitter, len(items))
+
+    try:
+        preset = preset_override or PresetLoader().load(config.preset)
+        font = SizeCalculator(preset, safety_scale=config.safety_scale).font
+        style = StyleBuilder(preset).build("Default")
+    except Exception as e:
+        tracker.emit(
+            AppEvent(
+                event_type=EventType.LOG,
+                message=f"Batch setup failed: {e}",
+                level=EventLevel.ERROR,
+            )
+        )
+        batch.items = [
+            BatchItemResult(item=item, result=RenderResult(success=False, error=str(e)))
+            for item in items
+        ]
+        batch.elapsed_sec = time.perf_counter() - batch_start
+        return batch
+
+    tracker.emit(
+        AppEvent(
+            event_type=EventType.JOB_START,
+            message=f"Rendering {len(items)} caption files",
+            data={
+                "total": len(items),
+                "max_workers": max_workers,
+                "prepare_workers": prepare_workers,
+            },
+        )
+    )
+
+    results: List[Optional[BatchItemResult]] = [None] * len(items)
+    silent = AppEventEmitter()
+    silent.disable()
+
+    with tempfile.TemporaryDirectory(prefix="audio_visualizer_caption_batch_") as temp_dir:
+        temp_path = Path(temp_dir)
+
+        def _prepare(index: int) -> PreparedSubtitle:
+            item = items[index]
+            ext = item.input_path.suffix.lower().lstrip(".")
+            if ext not in _SUPPORTED_EXTENSIONS:
+                raise ValueError(f"Unsupported format: {ext}. Use .srt, .ass, .json or .avbundle")
+            if not item.input_path.exists():
+                raise FileNotFoundError(f"Input file not found: {item.input_path}")
+            return prepare_working_ass(
+                input_path=item.input_path,
+                ass_path=temp_path / f"{index:05d}.ass",
+                config=config,
+                preset=preset,
+                progress=ProgressTracker(silent, enabled=False),
+                style=style,
+                font=font,
+            )
+
+        def _render(index: int, prepared: PreparedSubtitle, started: float) -> BatchItemResult:
+            item = items[index]
+            item_emitter = AppEventEmitter()
+
+            def _forward(event: AppEvent) -> None:
+                if event.event_type == EventType.RENDER_PROGRESS:
+                    tracker.item_percent(index, (event.data or {}).get("percent"))
+                elif event.event_type == EventType.LOG and event.level in (
+                    EventLevel.WARNING,
+                    EventLevel.ERROR,
+                ):
+                    tracker.emit(event)
+
+            item_emitter.subscribe(_forward)
+            renderer = FFmpegRenderer(
+                emitter=item_emitter,
+                loglevel="error",
+                show_progress=True,
+                quality=config.quality,
+            )
+
+            attempts = 0
+            error: Optional[str] = None
+            while attempts <= retries:
+                attempts += 1
+                try:
+                    item.output_path.parent.mkdir(parents=True, exist_ok=True)
+                    if item.delivery_path is not None:
+                        item.delivery_path.parent.mkdir(parents=True, exist_ok=True)
+                        renderer.render_with_delivery(
+                            ass_path=prepared.ass_path,
+                            output_path=item.output_path,
+                            delivery_path=item.delivery_path,
+                            size=prepared.size,
+                            fps=config.fps,
+                            duration_sec=prepared.duration_sec,
+                            audio_path=item.delivery_audio_path,
+                        )
+                    else:
+                        renderer.render(
+                            ass_path=prepared.ass_path,
+                            output_path=item.output_path,
+                            size=prepared.size,
+                            fps=config.fps,
+                            duration_sec=prepared.duration_sec,
+                        )
+                    error = None
+                    break
+                except Exception as e:
+                    error = str(e)
+                    if attempts <= retries:
+                        tracker.emit(
+                            AppEvent(
+                                event_type=EventType.LOG,
+                                message=(
+                                    f"Render failed for {item.input_path.name}; "
+                                    f"retrying ({attempts}/{retries})"
+                                ),
+                                level=EventLevel.WARNING,
+                                data={"input_path": str(item.input_path), "error": error},
+                            )
+                        )
+
+            if error is None:
+                result = RenderResult(
+                    success=True,
+                    output_path=item.output_path,
+                    width=prepared.size.width,
+                    height=prepared.size.height,
+                    duration_ms=prepared.end_ms,
+                    delivery_path=item.delivery_path,
+                )
+            else:
+                result = RenderResult(success=False, error=error)
+            return BatchItemResult(
+                item=item,
+                result=result,
+                attempts=attempts,
+                elapsed_sec=time.perf_counter() - started,
+            )
+
+        def _finish(index: int, entry: BatchItemResult) -> None:
+            results[index] = entry
+            tracker.item_done(index, entry.result.success)
+            if not entry.result.success:
+                tracker.emit(
+                    AppEvent(
+                        event_type=EventType.LOG,
+                        message=f"{entry.item.input_path.name}: {entry.result.error}",
+                        level=EventLevel.ERROR,
+                        data={
+                            "input_path": str(entry.item.input_path),
+                            "output_path": str(entry.item.output_path),
+                        },
+                    )
+                )
+
+        with ThreadPoolExecutor(
+            max_workers=prepare_workers, thread_name_prefix="caption-prepare"
+        ) as prepare_pool, ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="caption-render"
+        ) as render_pool:
+            render_futures: List[Future] = []
+            render_lock = threading.Lock()
+
+            def _on_prepared(index: int, started: float, future: Future) -> None:
+                try:
+                    prepared = future.result()
+                except Exception as e:
+                    _finish(
+                        index,
+                        BatchItemResult(
+                            item=items[index],
+                            result=RenderResult(success=False, error=str(e)),
+                            elapsed_sec=time.perf_counter() - started,
+                        ),
+                    )
+                    return
+
+                def _run() -> None:
+                    try:
+                        entry = _render(index, prepared, started)
+                    except Exception as e:
+                        entry = BatchItemResult(
+                            item=items[index],
+                            result=RenderResult(success=False, error=str(e)),
+                            elapsed_sec=time.perf_counter() - started,
+                        )
+                    _finish(index, entry)
+
+                with render_lock:
+                    render_futures.append(render_pool.submit(_run))
+
+            prepare_futures = []
+            for index in range(len(items)):
+                started = time.perf_counter()
+                future = prepare_pool.submit(_prepare, index)
+                future.add_done_callback(
+                    lambda f, i=index, t=started: _on_prepared(i, t, f)
+                )
+                prepare_futures.append(future)
+
+            for future in prepare_futures:
+                future.exception()
+            prepare_pool.shutdown(wait=True)
+            with render_lock:
+                pending = list(render_futures)
+            for future in pending:
+                future.result()
+
+    batch.items = [entry for entry in results if entry is not None]
+    batch.elapsed_sec = time.perf_counter() - batch_start
+
+    tracker.emit(
+        AppEvent(
+            event_type=EventType.JOB_COMPLETE,
+            message=(
+                f"Batch render complete: {batch.succeeded} succeeded, "
+                f"{batch.failed} failed"
+            ),
+            data={
+                "succeeded": batch.succeeded,
+                "failed": batch.failed,
+                "elapsed_sec": batch.elapsed_sec,
+            },
+        )
+    )
+    return batch
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m audio_visualizer.caption.captionBatch",
+        description="Render many subtitle files to caption overlays with one preset.",
+    )
+    parser.add_argument("inputs", nargs="+", type=Path, help="Subtitle files (.srt, .ass, .json, .avbundle)")
+    parser.add_argument("-o", "--output-dir", type=Path, required=True, help="Output directory")
+    parser.add_argument("--preset", default="modern_box", help="Preset name or path")
+    parser.add_argument("--fps", default="30", help="Frame rate")
+    parser.add_argument(
+        "--quality", default="small", choices=("small", "medium", "large"), help="Output quality"
+    )
+    parser.add_argument("--suffix", default=".mov", help="Overlay file extension")
+    parser.add_argument(
+        "--delivery",
+        action="store_true",
+        help="Also write an MP4 delivery next to each overlay",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Concurrent FFmpeg processes")
+    parser.add_argument(
+        "--prepare-workers", type=int, default=None, help="Threads preparing ASS files"
+    )
+    parser.add_argument("--retries", type=int, default=1, help="Render retries per file")
+    parser.add_argument("--no-animation", action="store_true", help="Disable preset animation")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point. Returns 0 when every file rendered."""
+    args = _build_arg_parser().parse_args(argv)
+    output_dir: Path = args.output_dir
+    suffix = args.suffix if args.suffix.startswith(".") else f".{args.suffix}"
+
+    items = [
+        BatchRenderItem(
+            input_path=path,
+            output_path=output_dir / f"{path.stem}{suffix}",
+            delivery_path=(output_dir / f"{path.stem}.mp4") if args.delivery else None,
+        )
+        for path in args.inputs
+    ]
+    config = RenderConfig(
+        preset=args.preset,
+        fps=args.fps,
+        quality=args.quality,
+        apply_animation=not args.no_animation,
+    )
+
+    def _print_event(event: AppEvent) -> None:
+        if event.event_type == EventType.RENDER_PROGRESS:
+            data = event.data or {}
+            print(
+                f"\r{data.get('percent', 0.0):5.1f}% "
+                f"({data.get('completed', 0)} done, {data.get('failed', 0)} failed)",
+                end="",
+                file=sys.stderr,
+                flush=True,
+            )
+        elif event.level in (EventLevel.WARNING, EventLevel.ERROR):
+            print(f"\n[{event.level.value}] {event.message}", file=sys.stderr)
+
+    batch = render_subtitles_batch(
+        items,
+        config=config,
+        max_workers=args.workers,
+        prepare_workers=args.prepare_workers,
+        retries=args.retries,
+        on_event=_print_event,
+    )
+
+    print(file=sys.stderr)
+    for entry in batch.items:
+        status = "ok" if entry.result.success else f"FAILED: {entry.result.error}"
+        print(f"{entry.item.input_path} -> {entry.item.output_path}: {status}")
+    print(
+        f"{batch.succeeded}/{len(batch.items)} rendered in {batch.elapsed_sec:.2f}s"
+    )
+    return 0 if batch.success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Single-pass subtitle event preprocessing.
+
+This module fuses the per-event stages of working-ASS preparation
+(markdown conversion, whitespace normalization and wrapping, animation,
+and size measurement) into one loop over the events. Wrapping and
+measurement share one :class:`~audio_visualizer.caption.text.measurement.CachedFont`,
+so lines measured while wrapping are not measured again while sizing.
+The output is identical to running the stages one after another.
+"""
+
+from typing import Optional
+
+import pysubs2
+
+from ..animations.baseAnimation import BaseAnimation
+from ..text.utils import ass_newlines_to_real, real_newlines_to_ass
+from ..text.wrapper import wrap_text_to_width
+from .markdownToAss import markdown_to_ass
+from .sizing import OverlaySize, SizeCalculator
+from .subtitle import SubtitleFile
+
+
+class EventPipeline:
+    """
+    Compiled event transformation for one preset.
+
+    Build once per preset/animation and call :meth:`run` for each subtitle
+    file. Positioning is not part of the pass because it depends on the
+    overlay size, which is only known after every event is measured.
+
+    Example:
+        size_calc = SizeCalculator(preset)
+        pipeline = EventPipeline(size_calc, style=style, animation=animation)
+        size = pipeline.run(subtitle)
+        subtitle.apply_center_positioning(size_calc.compute_anchor_position(size), size)
+    """
+
+    def __init__(
+        self,
+        size_calculator: SizeCalculator,
+        style: Optional[pysubs2.SSAStyle] = None,
+        animation: Optional[BaseAnimation] = None,
+        convert_markdown: bool = True,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            size_calculator: Calculator for the preset (its font is used for wrapping)
+            style: Style to install as "Default"; events are restyled and
+                wrapped only when a style is given
+            animation: Animation applied to every event, or None
+            convert_markdown: Convert ``**bold**`` / ``*italic*`` to ASS tags
+        """
+        self.size_calculator = size_calculator
+        self.style = style
+        self.animation = animation
+        self.convert_markdown = convert_markdown
+
+    def run(self, subtitle: SubtitleFile) -> OverlaySize:
+        """
+        Transform every event in place and compute the overlay size.
+
+        Args:
+            subtitle: Subtitle file to transform
+
+        Returns:
+            OverlaySize needed for the transformed events
+        """
+        size_calc = self.size_calculator
+        preset = size_calc.preset
+        font = size_calc.measure_font
+        max_width_px = preset.max_width_px
+        restyle = self.style is not None
+        animation = self.animation
+        convert_markdown = self.convert_markdown
+
+        if restyle:
+            subtitle.set_default_style(self.style, preset)
+
+        max_w = 0
+        max_h = 0
+
+        for event in subtitle.subs.events:
+            if not isinstance(event, pysubs2.SSAEvent):
+                continue
+
+            text = event.text
+            if convert_markdown and text:
+                text = markdown_to_ass(text)
+
+            if restyle:
+                event.style = "Default"
+                # wrap_text_to_width normalizes whitespace itself
+                text = ass_newlines_to_real(text)
+                text = wrap_text_to_width(text, font, max_width_px)
+                text = real_newlines_to_ass(text)
+
+            event.text = text
+            if animation is not None:
+                animation.apply_to_event(event)
+
+            w, h = size_calc.measure_text(event.text)
+            max_w = max(max_w, w)
+            max_h = max(max_h, h)
+
+        return size_calc.size_for_extent(max_w, max_h)
@@ -29,6 +29,9 @@ _BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
 # Italic: *text* — single asterisk that is not part of a bold pair.
 _ITALIC_RE = re.compile(r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)")
 
+# ASS override block: {...}
+_ASS_OVERRIDE_RE = re.compile(r"\{[^}]*\}")
+
 
 def markdown_to_ass(text: str) -> str:
     r"""Convert markdown inline styling to ASS override tags.
@@ -53,7 +56,7 @@ def markdown_to_ass(text: str) -> str:
         >>> markdown_to_ass("==important==")
         '==important=='
     """
-    if not text:
+    if not text or ("*" not in text and "==" not in text):
         return text
 
     # Step 1: Protect highlight markers from bold/italic conversion by
@@ -120,7 +123,7 @@ def strip_ass_overrides(text: str) -> str:
     Returns:
         Plain text with all ``{...}`` blocks removed.
     """
-    return re.sub(r"\{[^}]*\}", "", text)
+    return _ASS_OVERRIDE_RE.sub("", text)
 
 
 def tokenize_with_ass_tags(
@@ -140,7 +143,7 @@ def tokenize_with_ass_tags(
     """
     result: List[Tuple[str, bool]] = []
     pos = 0
-    for m in re.finditer(r"\{[^}]*\}", text):
+    for m in _ASS_OVERRIDE_RE.finditer(text):
         if m.start() > pos:
             result.append((text[pos:m.start()], False))
         result.append((m.group(), True))
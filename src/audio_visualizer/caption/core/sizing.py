@@ -7,13 +7,13 @@ without clipping, based on text measurement and preset configuration.
 
 import math
 from dataclasses import dataclass
-from pathlib import Path
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import pysubs2
 
-from ..text.measurement import measure_multiline
-from ..text.utils import normalize_whitespace, strip_ass_tags
+from ..text.fonts import get_font_registry
+from ..text.measurement import CachedFont, measure_multiline
+from ..text.utils import strip_ass_tags
 from ..text.wrapper import wrap_text_to_width
 from .config import PresetConfig
 
@@ -49,49 +49,29 @@ class SizeCalculator:
         print(f"Overlay size: {size.width}x{size.height}")
     """
 
-    def __init__(self, preset: PresetConfig, safety_scale: float = 1.12):
+    def __init__(
+        self,
+        preset: PresetConfig,
+        safety_scale: float = 1.12,
+        font: Optional["ImageFont.FreeTypeFont"] = None,
+    ):
         """
         Initialize size calculator.
 
         Args:
             preset: Preset configuration with font, padding, etc.
             safety_scale: Multiplier to avoid edge clipping (default: 1.12)
+            font: Pre-loaded measurement font for ``preset`` (loaded if None)
         """
         self.preset = preset
         self.safety_scale = safety_scale
-        self.font = self._load_font()
+        self.font = font if font is not None else self._load_font()
+        # Shared by wrapping and measurement so repeated lines are measured once
+        self.measure_font = CachedFont(self.font)
 
     def _load_font(self) -> "ImageFont.FreeTypeFont":
-        """Load the font for text measurement."""
-        from PIL import ImageFont
-
-        font_file = self.preset.font_file
-        font_size = self.preset.font_size
-
-        if font_file:
-            font_path = Path(font_file)
-            if not font_path.exists():
-                raise FileNotFoundError(f"Font file not found: {font_file}")
-            return ImageFont.truetype(str(font_path), size=font_size)
-
-        # Try common fallback fonts
-        candidates = [
-            "arial.ttf",
-            "Arial.ttf",
-            "DejaVuSans.ttf",
-            "LiberationSans-Regular.ttf",
-        ]
-
-        for candidate in candidates:
-            try:
-                return ImageFont.truetype(candidate, size=font_size)
-            except Exception:
-                continue
-
-        raise RuntimeError(
-            "No usable font found. Provide 'font_file' in preset configuration "
-            "pointing to a TTF/OTF file for deterministic measurement."
-        )
+        """Load the font for text measurement (shared process-wide)."""
+        return get_font_registry().load(self.preset.font_file, self.preset.font_size)
 
     def compute_size(self, subs: pysubs2.SSAFile) -> OverlaySize:
         """
@@ -110,8 +90,51 @@ class SizeCalculator:
         Returns:
             OverlaySize with width and height in pixels
         """
-        max_width_px = self.preset.max_width_px
-        line_spacing_px = self.preset.line_spacing
+        max_w = 0
+        max_h = 0
+
+        # Measure all events
+        for event in subs.events:
+            if not isinstance(event, pysubs2.SSAEvent):
+                continue
+
+            w, h = self.measure_text(event.text)
+            max_w = max(max_w, w)
+            max_h = max(max_h, h)
+
+        return self.size_for_extent(max_w, max_h)
+
+    def measure_text(self, text: str) -> Tuple[int, int]:
+        """
+        Measure the rendered extent of one event's ASS text.
+
+        Tags are stripped and the text is wrapped exactly as libass will
+        wrap it before the lines are measured.
+
+        Args:
+            text: Event text, possibly containing ASS override tags
+
+        Returns:
+            Tuple of (width_px, height_px) before padding and allowances
+        """
+        # Strip tags (wrapping normalizes whitespace)
+        text = strip_ass_tags(text)
+        text = wrap_text_to_width(text, self.measure_font, self.preset.max_width_px)
+
+        w, h, _ = measure_multiline(text, self.measure_font, self.preset.line_spacing)
+        return w, h
+
+    def size_for_extent(self, max_w: int, max_h: int) -> OverlaySize:
+        """
+        Compute the overlay size for a measured text extent.
+
+        Args:
+            max_w: Widest measured event in pixels
+            max_h: Tallest measured event in pixels
+
+        Returns:
+            OverlaySize with padding, allowances, and safety scale applied
+        """
         padding = self.preset.padding
 
         if len(padding) != 4:
@@ -125,27 +148,6 @@ class SizeCalculator:
         outline_px = self.preset.outline_px
         shadow_px = self.preset.shadow_px
 
-        max_w = 0
-        max_h = 0
-
-        # Measure all events
-        for event in subs.events:
-            if not isinstance(event, pysubs2.SSAEvent):
-                continue
-
-            # Strip tags and normalize
-            text = strip_ass_tags(event.text)
-            text = normalize_whitespace(text)
-
-            # Apply wrapping
-            text = wrap_text_to_width(text, self.font, max_width_px)
-
-            # Measure dimensions
-            w, h, _ = measure_multiline(text, self.font, line_spacing_px)
-
-            max_w = max(max_w, w)
-            max_h = max(max_h, h)
-
         # Add allowances for outline and shadow
         # Outline expands in all directions; shadow expands bottom-right
         # Conservative estimate: (outline * 2) + (shadow * 2)
@@ -2,7 +2,8 @@
 Subtitle file wrapper.
 
 This module provides a high-level wrapper around pysubs2 for working with
-subtitle files.  Supports loading from .srt, .ass, and JSON bundle files.
+subtitle files.  Supports loading from .srt, .ass, and JSON or columnar
+(.avbundle) bundle files.
 """
 
 from pathlib import Path
@@ -77,7 +78,7 @@ class SubtitleFile:
         Load subtitle file from path.
 
         Args:
-            path: Path to subtitle file (.srt, .ass, or .json bundle)
+            path: Path to subtitle file (.srt, .ass, or .json/.avbundle bundle)
 
         Returns:
             SubtitleFile instance
@@ -85,28 +86,32 @@ class SubtitleFile:
         Raises:
             ValueError: If file format is unsupported
         """
+        from audio_visualizer.srt.io.columnarBundle import is_columnar_bundle
+
         ext = path.suffix.lower().lstrip(".")
 
-        if ext == "json":
+        if ext in ("json", "avbundle") or is_columnar_bundle(path):
             return cls.load_bundle(path)
 
         if ext not in ("srt", "ass"):
-            raise ValueError(f"Unsupported subtitle format: {ext}. Use .srt, .ass, or .json bundle")
+            raise ValueError(f"Unsupported subtitle format: {ext}. Use .srt, .ass, or a .json/.avbundle bundle")
 
         subs = pysubs2.load(str(path))
         return cls(subs, source_format=ext)
 
     @classmethod
     def load_bundle(cls, path: Path) -> "SubtitleFile":
-        """Load a JSON bundle file and convert to subtitle events.
+        """Load a bundle file and convert to subtitle events.
 
-        Uses ``read_json_bundle()`` from the SRT IO package as the
-        sole entry point for bundle reading.  Word-level timing is
-        extracted and stored so that word-aware animations can use
-        precise timestamps instead of estimation.
+        Uses ``read_bundle()`` from the SRT IO package as the sole
+        entry point for bundle reading, so JSON and columnar bundles are
+        both accepted.  Word-level timing is extracted and stored so that
+        word-aware animations can use precise timestamps instead of
+        estimation.  Columnar bundles are read straight from their timing
+        columns, without building ``WordItem`` objects.
 
         Args:
-            path: Path to a ``.json`` bundle file.
+            path: Path to a ``.json`` or ``.avbundle`` bundle file.
 
         Returns:
             SubtitleFile with ``source_format="bundle"`` and
@@ -116,9 +121,12 @@ class SubtitleFile:
             FileNotFoundError: If the file does not exist.
             ValueError: If the file is not a valid JSON bundle.
         """
-        from audio_visualizer.srt.io.bundleReader import read_json_bundle
+        from audio_visualizer.srt.io.bundleReader import read_bundle
+        from audio_visualizer.srt.io.columnarBundle import ColumnarBundle
 
-        bundle = read_json_bundle(path)
+        bundle = read_bundle(path)
+        if isinstance(bundle, ColumnarBundle):
+            return cls._from_columnar_bundle(bundle)
 
         subs = pysubs2.SSAFile()
         word_timing: Dict[int, List[Dict[str, Any]]] = {}
@@ -160,11 +168,34 @@ class SubtitleFile:
         instance._word_timing = word_timing
         return instance
 
+    @classmethod
+    def _from_columnar_bundle(cls, bundle) -> "SubtitleFile":
+        """Build events and word timing from a ``ColumnarBundle``'s columns."""
+        subs = pysubs2.SSAFile()
+        word_timing: Dict[int, List[Dict[str, Any]]] = {}
+        starts = bundle.subtitle_starts.tolist()
+        ends = bundle.subtitle_ends.tolist()
+        texts = bundle.subtitle_texts()
+
+        for idx, wt_list in enumerate(bundle.iter_word_timing()):
+            subs.events.append(pysubs2.SSAEvent(
+                start=int(starts[idx] * 1000),
+                end=int(ends[idx] * 1000),
+                text=texts[idx] or "",
+            ))
+            if wt_list:
+                word_timing[idx] = wt_list
+
+        instance = cls(subs, source_format="bundle")
+        instance._word_timing = word_timing
+        return instance
+
     def apply_style(
         self,
         style: pysubs2.SSAStyle,
         preset: PresetConfig,
-        wrap_text: bool = True
+        wrap_text: bool = True,
+        font=None,
     ) -> None:
         """
         Apply ASS style to all events.
@@ -173,18 +204,14 @@ class SubtitleFile:
             style: The pysubs2 SSAStyle to apply
             preset: Preset config (used for wrapping settings)
             wrap_text: Whether to wrap text to max_width_px
+            font: Pre-loaded wrapping font for ``preset`` (loaded if None)
         """
-        # Set style in stylesheet
-        self.subs.styles["Default"] = style
-
-        # Update script info
-        self.subs.info["WrapStyle"] = str(preset.wrap_style)
-        self.subs.info["ScaledBorderAndShadow"] = "yes"
-        self.subs.info["ScriptType"] = "v4.00+"
+        self.set_default_style(style, preset)
 
         # Assign style to all events and optionally wrap
         if wrap_text:
-            font = self._get_font_for_wrapping(preset)
+            if font is None:
+                font = self._get_font_for_wrapping(preset)
 
             for event in self.subs.events:
                 if not isinstance(event, pysubs2.SSAEvent):
@@ -202,6 +229,24 @@ class SubtitleFile:
                 if isinstance(event, pysubs2.SSAEvent):
                     event.style = "Default"
 
+    def set_default_style(self, style: pysubs2.SSAStyle, preset: PresetConfig) -> None:
+        """
+        Install ``style`` as "Default" and set the matching script info.
+
+        Events are left untouched; see :meth:`apply_style`.
+
+        Args:
+            style: The pysubs2 SSAStyle to install
+            preset: Preset config (used for the wrap style)
+        """
+        # Set style in stylesheet
+        self.subs.styles["Default"] = style
+
+        # Update script info
+        self.subs.info["WrapStyle"] = str(preset.wrap_style)
+        self.subs.info["ScaledBorderAndShadow"] = "yes"
+        self.subs.info["ScriptType"] = "v4.00+"
+
     def apply_animation(
         self,
         animation: BaseAnimation,
@@ -296,6 +341,18 @@ class SubtitleFile:
         """
         self.subs.save(str(path), format_=format)
 
+    def to_string(self, format: str = "ass") -> str:
+        """
+        Serialize the subtitle file.
+
+        Args:
+            format: Output format (default: "ass")
+
+        Returns:
+            File contents as produced by :meth:`save`
+        """
+        return self.subs.to_string(format)
+
     def _get_font_for_wrapping(self, preset: PresetConfig):
         """Get font for text wrapping (imported here to avoid circular deps)."""
         from ..core.sizing import SizeCalculator
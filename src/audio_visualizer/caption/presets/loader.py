@@ -8,11 +8,12 @@ presets, file paths, and multi-preset files with named presets.
 import json
 from importlib import resources
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set
 
 from audio_visualizer.app_paths import get_data_dir
 from ..core.config import PresetConfig
 from .defaults import BUILTIN_PRESETS, get_builtin_preset
+from .registry import get_preset_registry
 
 try:
     import yaml
@@ -46,10 +47,22 @@ def ensure_example_presets(preset_dir: Optional[Path] = None) -> Path:
     return target_dir
 
 
+_SEEDED_PRESET_DIRS: Set[Path] = set()
+
+
 def get_caption_preset_dir() -> Path:
-    """Return the caption preset directory inside the app data dir."""
+    """Return the caption preset directory inside the app data dir.
 
-    return ensure_example_presets()
+    Example presets are seeded the first time a directory is returned in
+    this process, and again only if the directory disappears.
+    """
+
+    target_dir = get_data_dir() / "caption" / "presets"
+    if target_dir in _SEEDED_PRESET_DIRS and target_dir.is_dir():
+        return target_dir
+    target_dir = ensure_example_presets(target_dir)
+    _SEEDED_PRESET_DIRS.add(target_dir)
+    return target_dir
 
 
 class PresetLoader:
@@ -119,17 +132,21 @@ class PresetLoader:
             file_path = Path(file_part)
 
             if file_path.exists():
-                return self._load_named_preset(file_path, name_part)
+                return get_preset_registry().load(
+                    file_path,
+                    lambda path: self._load_named_preset(path, name_part),
+                    name=name_part,
+                )
 
         # 3. Try as direct file path
         file_path = Path(preset_ref)
         if file_path.exists():
-            return self._load_single_preset(file_path)
+            return get_preset_registry().load(file_path, self._load_single_preset)
 
         # 4. Search in preset directories
         resolved = self._resolve_in_directories(preset_ref)
         if resolved:
-            return self._load_single_preset(resolved)
+            return get_preset_registry().load(resolved, self._load_single_preset)
 
         # Not found
         raise ValueError(
@@ -215,20 +232,11 @@ class PresetLoader:
         - name.yaml
         - name.yml
         """
+        registry = get_preset_registry()
         for directory in self.preset_dirs:
-            if not directory.exists() or not directory.is_dir():
-                continue
-
-            # Try exact name
-            candidate = directory / name
-            if candidate.exists() and candidate.is_file():
-                return candidate
-
-            # Try with extensions
-            for ext in [".json", ".yaml", ".yml"]:
-                candidate = directory / (name + ext)
-                if candidate.exists() and candidate.is_file():
-                    return candidate
+            resolved = registry.resolve(directory, name)
+            if resolved is not None:
+                return resolved
 
         return None
 
@@ -245,13 +253,10 @@ class PresetLoader:
         for name in BUILTIN_PRESETS.keys():
             presets[name] = "built-in"
 
-        # Scan preset directories
+        # Scan preset directories (indexed once per directory change)
+        registry = get_preset_registry()
         for directory in self.preset_dirs:
-            if not directory.exists() or not directory.is_dir():
-                continue
-
-            for path in directory.iterdir():
-                if path.is_file() and path.suffix.lower() in (".json", ".yaml", ".yml"):
-                    presets[path.name] = str(path)
+            for path in sorted(registry.list_files(directory)):
+                presets[path.name] = str(path)
 
         return presets
@@ -0,0 +1,209 @@
+"""
+Process-wide preset cache.
+
+Preset directories are indexed once and re-listed only when the directory
+mtime changes (a file was added, removed or renamed). Parsed preset files
+are memoized by path and re-read only when the file's mtime or size
+changes. Hot loads therefore cost one ``stat()`` per directory and file
+instead of a directory probe and a JSON/YAML parse.
+"""
+
+import copy
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..core.config import PresetConfig
+
+PRESET_EXTENSIONS = (".json", ".yaml", ".yml")
+
+_Signature = Tuple[int, int]
+
+
+def _signature(path: Path) -> Optional[_Signature]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class PresetRegistry:
+    """
+    Caches preset directory listings and parsed preset files.
+
+    Example:
+        registry = get_preset_registry()
+        path = registry.resolve(preset_dir, "word_highlight")
+        preset = registry.load(path, parse_preset_file)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._indexes: Dict[Path, Tuple[_Signature, Dict[str, Path]]] = {}
+        self._presets: Dict[Tuple[Path, Optional[str]], Tuple[_Signature, PresetConfig]] = {}
+
+    def resolve(self, directory: Path, name: str) -> Optional[Path]:
+        """
+        Find ``name``, ``name.json``, ``name.yaml`` or ``name.yml`` in ``directory``.
+
+        Args:
+            directory: Preset directory
+            name: Preset file name, with or without extension
+
+        Returns:
+            Path to the preset file, or None
+        """
+        candidate_names = (name, *(name + ext for ext in PRESET_EXTENSIONS))
+        nested = os.sep in name or bool(os.altsep and os.altsep in name)
+        if not nested:
+            index = self._index(directory)
+            for candidate_name in candidate_names:
+                path = index.get(candidate_name)
+                if path is not None:
+                    return path
+
+        # Nested names are not indexed, and a miss may be a file added within
+        # the directory's mtime resolution, so probe directly before giving up
+        for candidate_name in candidate_names:
+            candidate = directory / candidate_name
+            if candidate.is_file():
+                if not nested:
+                    with self._lock:
+                        self._indexes.pop(directory, None)
+                return candidate
+        return None
+
+    def list_files(self, directory: Path) -> List[Path]:
+        """Return the preset files (.json/.yaml/.yml) in ``directory``."""
+        return [
+            path for path in self._index(directory).values()
+            if path.suffix.lower() in PRESET_EXTENSIONS
+        ]
+
+    def load(
+        self,
+        path: Path,
+        factory: Callable[[Path], PresetConfig],
+        name: Optional[str] = None,
+    ) -> PresetConfig:
+        """
+        Return the preset parsed from ``path``, re-parsing only on change.
+
+        Args:
+            path: Preset file
+            factory: Parses ``path`` into a PresetConfig (called on a miss)
+            name: Named preset inside a multi-preset file, if any
+
+        Returns:
+            A private copy of the cached PresetConfig
+        """
+        key = (Path(os.path.abspath(path)), name)
+        signature = _signature(path)
+        with self._lock:
+            cached = self._presets.get(key)
+        if cached is not None and signature is not None and cached[0] == signature:
+            return copy.deepcopy(cached[1])
+
+        preset = factory(path)
+        if signature is not None:
+            with self._lock:
+                self._presets[key] = (signature, copy.deepcopy(preset))
+        return preset
+
+    def clear(self) -> None:
+        """Drop every cached index and preset."""
+        with self._lock:
+            self._indexes.clear()
+            self._presets.clear()
+
+    def _index(self, directory: Path) -> Dict[str, Path]:
+        signature = _signature(directory)
+        if signature is None:
+            return {}
+
+        with self._lock:
+            cached = self._indexes.get(directory)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        index: Dict[str, Path] = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        index[entry.name] = Path(entry.path)
+        except (NotADirectoryError, OSError):
+            return {}
+
+        with self._lock:
+            self._indexes[directory] = (signature, index)
+        return index
+
+
+_REGISTRY = PresetRegistry()
+
+
+def get_preset_registry() -> PresetRegistry:
+    """Return the process-wide preset registry."""
+    return _REGISTRY
+
+
+def warm_caches(
+    preset_refs: Optional[List[str]] = None,
+    preset_dirs: Optional[List[Path]] = None,
+) -> None:
+    """
+    Pre-load presets and their measurement fonts.
+
+    Meant to run on a background thread at startup so the first render or
+    preview does not pay for preset parsing and font discovery. Failures
+    are ignored; the normal load path reports them later.
+
+    Args:
+        preset_refs: Presets to load (defaults to the built-in presets)
+        preset_dirs: Preset directories to index and load (default: none)
+    """
+    from ..text.fonts import get_font_registry
+    from .defaults import list_builtin_presets
+    from .loader import PresetLoader
+
+    loader = PresetLoader(preset_dirs=list(preset_dirs or []))
+    refs = list(preset_refs) if preset_refs is not None else list_builtin_presets()
+    for directory in loader.preset_dirs:
+        refs.extend(str(path) for path in _REGISTRY.list_files(directory))
+
+    fonts = get_font_registry()
+    for ref in refs:
+        try:
+            preset = loader.load(ref)
+            fonts.load(preset.font_file, preset.font_size)
+        except Exception:
+            continue
+
+
+_warmup_lock = threading.Lock()
+_warmup_thread: Optional[threading.Thread] = None
+
+
+def start_cache_warmup(
+    preset_refs: Optional[List[str]] = None,
+    preset_dirs: Optional[List[Path]] = None,
+) -> threading.Thread:
+    """
+    Run :func:`warm_caches` once per process on a daemon thread.
+
+    Later calls return the thread started by the first call.
+    """
+    global _warmup_thread
+    with _warmup_lock:
+        if _warmup_thread is None:
+            _warmup_thread = threading.Thread(
+                target=warm_caches,
+                args=(preset_refs, preset_dirs),
+                daemon=True,
+                name="CaptionCacheWarmup",
+            )
+            _warmup_thread.start()
+        return _warmup_thread
@@ -138,6 +138,48 @@ class FFmpegRenderer:
             "yuva444p10le",
         ]
 
+    def _build_overlay_codec_args(
+        self, encoder_override: str | None = None
+    ) -> tuple[str, list[str], str | None]:
+        """
+        Build the overlay pixel format and codec arguments for the quality preset.
+
+        Returns:
+            Tuple of output pixel format, FFmpeg codec arguments, and the
+            selected H.264 encoder name (``None`` for ProRes output).
+        """
+        if self.quality == "small":
+            # H.264 with transparency support (using overlay)
+            codec_args, selected_encoder = self._build_h264_args(encoder_override)
+            return "yuva420p", codec_args, selected_encoder
+        if self.quality == "medium":
+            # ProRes 422 HQ (no alpha)
+            return "yuv422p10le", self._build_prores_422hq_args(), None
+        # large: ProRes 4444 (with alpha)
+        return "yuva444p10le", self._build_prores_4444_args(), None
+
+    @staticmethod
+    def _build_delivery_args(encoder: str) -> list[str]:
+        """
+        Build codec arguments for the opaque H.264 MP4 delivery output.
+
+        Args:
+            encoder: H.264 encoder name
+
+        Returns:
+            List of FFmpeg arguments for the delivery video stream
+        """
+        return [
+            "-c:v",
+            encoder,
+            "-preset",
+            "medium",
+            "-crf",
+            "18",
+            "-pix_fmt",
+            "yuv420p",
+        ]
+
     def render(
         self,
         ass_path: Path,
@@ -170,32 +212,14 @@ class FFmpegRenderer:
             *,
             encoder_override: str | None = None,
         ) -> tuple[list[str], str | None]:
-            if self.quality == "small":
-                # H.264 with transparency support (using overlay)
-                video_filter = (
-                    f"format=rgba,"
-                    f"subtitles=filename='{ass_escaped}':alpha=1:original_size={w}x{h},"
-                    f"format=yuva420p"
-                )
-                codec_args, selected_encoder = self._build_h264_args(encoder_override)
-            elif self.quality == "medium":
-                # ProRes 422 HQ (no alpha)
-                video_filter = (
-                    f"format=rgba,"
-                    f"subtitles=filename='{ass_escaped}':alpha=1:original_size={w}x{h},"
-                    f"format=yuv422p10le"
-                )
-                codec_args = self._build_prores_422hq_args()
-                selected_encoder = None
-            else:  # large
-                # ProRes 4444 (with alpha)
-                video_filter = (
-                    f"format=rgba,"
-                    f"subtitles=filename='{ass_escaped}':alpha=1:original_size={w}x{h},"
-                    f"format=yuva444p10le"
-                )
-                codec_args = self._build_prores_4444_args()
-                selected_encoder = None
+            pix_fmt, codec_args, selected_encoder = self._build_overlay_codec_args(
+                encoder_override
+            )
+            video_filter = (
+                f"format=rgba,"
+                f"subtitles=filename='{ass_escaped}':alpha=1:original_size={w}x{h},"
+                f"format={pix_fmt}"
+            )
 
             cmd = [
                 self.ffmpeg_path,
@@ -280,6 +304,180 @@ class FFmpegRenderer:
             )
         )
 
+    def render_with_delivery(
+        self,
+        ass_path: Path,
+        output_path: Path,
+        delivery_path: Path,
+        size: OverlaySize,
+        fps: str,
+        duration_sec: float,
+        audio_path: Optional[Path] = None,
+    ) -> None:
+        """
+        Render the overlay and the MP4 delivery in a single FFmpeg process.
+
+        The subtitle canvas is rendered once and split into two branches: the
+        overlay branch is encoded exactly like :meth:`render`, and the delivery
+        branch is flattened to ``yuv420p`` H.264 and muxed with ``audio_path``.
+        This avoids re-decoding the overlay in a second FFmpeg pass.
+
+        The delivery file is written to a temporary sibling and renamed on
+        success. When ``delivery_path`` equals ``output_path`` only the
+        delivery output is produced.
+
+        Args:
+            ass_path: Path to ASS subtitle file
+            output_path: Path for the overlay video file (.mov)
+            delivery_path: Path for the delivery video file (.mp4)
+            size: Overlay dimensions
+            fps: Frame rate (e.g., "30", "60", "30000/1001")
+            duration_sec: Video duration in seconds
+            audio_path: Optional audio file muxed into the delivery output
+
+        Raises:
+            RuntimeError: If rendering fails
+        """
+        from audio_visualizer.hwaccel import is_hardware_encoder, select_encoder
+
+        w, h = size.width, size.height
+        ass_escaped = self._escape_filter_path(ass_path)
+        write_overlay = Path(output_path).resolve() != Path(delivery_path).resolve()
+        delivery_tmp = delivery_path.with_name(
+            f".{delivery_path.stem}.partial{delivery_path.suffix}"
+        )
+
+        def _build_command(
+            *,
+            encoder_override: str | None = None,
+        ) -> tuple[list[str], str | None, str]:
+            delivery_encoder = encoder_override or select_encoder("h264")
+            overlay_encoder: str | None = None
+
+            cmd = [
+                self.ffmpeg_path,
+                "-y",  # Overwrite output
+                "-hide_banner",
+                "-loglevel",
+                self.loglevel,
+                "-f",
+                "lavfi",
+                "-t",
+                f"{duration_sec:.3f}",
+                "-i",
+                f"color=c=black@0.0:s={w}x{h}:r={fps}",
+            ]
+            if audio_path is not None:
+                cmd.extend(["-i", str(audio_path)])
+
+            render_filter = (
+                f"[0:v]format=rgba,"
+                f"subtitles=filename='{ass_escaped}':alpha=1:original_size={w}x{h}"
+            )
+            if write_overlay:
+                pix_fmt, codec_args, overlay_encoder = self._build_overlay_codec_args(
+                    encoder_override
+                )
+                filter_graph = (
+                    f"{render_filter},split=2[ov][dv];"
+                    f"[ov]format={pix_fmt}[overlay];"
+                    f"[dv]format=yuv420p[delivery]"
+                )
+            else:
+                filter_graph = f"{render_filter},format=yuv420p[delivery]"
+            cmd.extend(["-filter_complex", filter_graph])
+
+            if write_overlay:
+                cmd.extend(["-map", "[overlay]"])
+                cmd.extend(codec_args)
+                cmd.extend(["-r", fps, "-an", str(output_path)])
+
+            cmd.extend(["-map", "[delivery]"])
+            if audio_path is not None:
+                cmd.extend(["-map", "1:a:0?"])
+            cmd.extend(self._build_delivery_args(delivery_encoder))
+            cmd.extend(["-r", fps])
+            if audio_path is not None:
+                cmd.extend(["-c:a", "aac", "-b:a", "192k", "-shortest"])
+            else:
+                cmd.append("-an")
+            cmd.extend(["-movflags", "+faststart", "-f", "mp4", str(delivery_tmp)])
+
+            if self.show_progress:
+                cmd.insert(1, "-progress")
+                cmd.insert(2, "pipe:2")
+                cmd.insert(3, "-nostats")
+            return cmd, overlay_encoder, delivery_encoder
+
+        def _run(cmd: list[str]) -> None:
+            self._run_render_command(cmd, delivery_tmp, duration_sec)
+            if write_overlay:
+                self._verify_output(output_path)
+
+        cmd, overlay_encoder, delivery_encoder = _build_command()
+        self._emit_command_log(cmd, overlay_encoder or delivery_encoder)
+
+        self.emitter.emit(
+            AppEvent(
+                event_type=EventType.RENDER_START,
+                message="Starting FFmpeg render",
+                data={"delivery_output": True},
+            )
+        )
+
+        try:
+            try:
+                _run(cmd)
+            except RuntimeError:
+                failed_encoder = next(
+                    (
+                        encoder
+                        for encoder in (overlay_encoder, delivery_encoder)
+                        if encoder and is_hardware_encoder(encoder)
+                    ),
+                    None,
+                )
+                if failed_encoder is None:
+                    raise
+
+                self.emitter.emit(
+                    AppEvent(
+                        event_type=EventType.LOG,
+                        message=(
+                            "Hardware encoder failed; retrying FFmpeg render "
+                            "with software encoder libx264."
+                        ),
+                        level=EventLevel.WARNING,
+                        data={
+                            "failed_encoder": failed_encoder,
+                            "fallback_encoder": "libx264",
+                            "delivery_output": True,
+                        },
+                    )
+                )
+                cmd, overlay_encoder, delivery_encoder = _build_command(
+                    encoder_override="libx264"
+                )
+                self._emit_command_log(cmd, overlay_encoder or delivery_encoder)
+                _run(cmd)
+
+            # Success — atomic rename temp to delivery
+            delivery_tmp.replace(delivery_path)
+        except Exception:
+            delivery_tmp.unlink(missing_ok=True)
+            raise
+
+        data = {"delivery_video_encoder": delivery_encoder}
+        if overlay_encoder:
+            data["video_encoder"] = overlay_encoder
+        self.emitter.emit(
+            AppEvent(
+                event_type=EventType.RENDER_COMPLETE,
+                message="FFmpeg render complete",
+                data=data,
+            )
+        )
+
     def _emit_command_log(self, cmd: list[str], video_encoder: str | None) -> None:
         """Emit diagnostic events describing the FFmpeg command and encoder."""
         if video_encoder:
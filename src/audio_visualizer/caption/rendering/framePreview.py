@@ -0,0 +1,280 @@
+"""
+Single-frame caption preview rendering.
+
+This module keeps a prepared working ASS file resident and renders
+individual RGBA frames from it at arbitrary timestamps. Each frame is a
+one-frame FFmpeg render: a transparent canvas is shifted to the requested
+timestamp with ``setpts`` before libass draws onto it, so no frames before
+the timestamp are generated.
+"""
+
+import logging
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+from audio_visualizer.events import AppEventEmitter
+
+from ..captionApi import PreparedSubtitle, RenderConfig, prepare_working_ass
+from ..core.config import PresetConfig
+from ..presets.loader import PresetLoader
+from .ffmpegRenderer import FFmpegRenderer
+from .progressTracker import ProgressTracker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PreviewFrame:
+    """A rendered RGBA caption frame.
+
+    Attributes:
+        time_ms: Timestamp the frame was rendered at
+        width: Frame width in pixels
+        height: Frame height in pixels
+        rgba: Packed RGBA8888 pixel data (``width * height * 4`` bytes)
+    """
+
+    time_ms: int
+    width: int
+    height: int
+    rgba: bytes
+
+
+class CaptionFramePreviewer:
+    """
+    Renders caption frames at arbitrary timestamps from a resident ASS file.
+
+    ``prepare()`` runs the same preprocessing as a full render and keeps the
+    working ASS in a private temp directory until ``close()`` or the next
+    ``prepare()``. ``render_frame()`` is thread-safe and caches recent frames
+    by frame index, so scrubbing back and forth does not re-run FFmpeg.
+
+    Example:
+        previewer = CaptionFramePreviewer()
+        previewer.prepare("input.srt", RenderConfig(preset="modern_box"))
+        frame = previewer.render_frame(12_500)
+        print(frame.width, frame.height, len(frame.rgba))
+        previewer.close()
+    """
+
+    def __init__(
+        self,
+        ffmpeg_path: Optional[str] = None,
+        cache_size: int = 48,
+        timeout_sec: float = 10.0,
+    ) -> None:
+        """
+        Initialize the previewer.
+
+        Args:
+            ffmpeg_path: Path to ffmpeg binary (if None, searches PATH)
+            cache_size: Number of rendered frames kept in the LRU cache
+            timeout_sec: Per-frame FFmpeg timeout
+        """
+        self._ffmpeg_path = ffmpeg_path
+        self._cache_size = max(0, cache_size)
+        self._timeout_sec = timeout_sec
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[int, PreviewFrame]" = OrderedDict()
+        self._temp_dir: Optional[str] = None
+        self._prepared: Optional[PreparedSubtitle] = None
+        self._fps = "30"
+        self._generation = 0
+
+    @property
+    def prepared(self) -> Optional[PreparedSubtitle]:
+        """The resident working subtitle, or None before ``prepare()``."""
+        return self._prepared
+
+    @property
+    def duration_ms(self) -> int:
+        """Timestamp of the last subtitle event end, or 0 when unprepared."""
+        return self._prepared.end_ms if self._prepared else 0
+
+    @property
+    def generation(self) -> int:
+        """Counter incremented by every ``prepare()`` / ``close()``."""
+        return self._generation
+
+    def prepare(
+        self,
+        input_path: Union[str, Path],
+        config: Optional[RenderConfig] = None,
+        preset_override: Optional[PresetConfig] = None,
+    ) -> PreparedSubtitle:
+        """
+        Prepare and keep a working ASS file for frame rendering.
+
+        Args:
+            input_path: Path to input subtitle file (.srt, .ass, or .json)
+            config: Render configuration (uses defaults if None)
+            preset_override: Use this preset instead of loading ``config.preset``
+
+        Returns:
+            The resident PreparedSubtitle
+
+        Raises:
+            FileNotFoundError: If the input file does not exist
+            RuntimeError: If FFmpeg is not available
+        """
+        config = config or RenderConfig()
+        input_path = Path(input_path)
+        if not input_path.exists():
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+        if self._ffmpeg_path is None:
+            self._ffmpeg_path = shutil.which("ffmpeg")
+            if not self._ffmpeg_path:
+                raise RuntimeError(
+                    "FFmpeg not found on PATH. Please install FFmpeg and ensure "
+                    "it is available in your system PATH."
+                )
+
+        preset = preset_override or PresetLoader().load(config.preset)
+        temp_dir = tempfile.mkdtemp(prefix="audio_visualizer_caption_preview_")
+        try:
+            emitter = AppEventEmitter()
+            prepared = prepare_working_ass(
+                input_path=input_path,
+                ass_path=Path(temp_dir) / "preview.ass",
+                config=config,
+                preset=preset,
+                progress=ProgressTracker(emitter, enabled=False),
+            )
+        except Exception:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+
+        with self._lock:
+            old_temp_dir = self._temp_dir
+            self._temp_dir = temp_dir
+            self._prepared = prepared
+            self._fps = config.fps
+            self._cache.clear()
+            self._generation += 1
+        if old_temp_dir:
+            shutil.rmtree(old_temp_dir, ignore_errors=True)
+        return prepared
+
+    def render_frame(self, time_ms: int) -> PreviewFrame:
+        """
+        Render the caption frame shown at ``time_ms``.
+
+        Args:
+            time_ms: Timestamp in milliseconds
+
+        Returns:
+            PreviewFrame with RGBA pixel data
+
+        Raises:
+            RuntimeError: If nothing is prepared or FFmpeg fails
+        """
+        with self._lock:
+            prepared = self._prepared
+            fps = self._fps
+            if prepared is None:
+                raise RuntimeError("No subtitle prepared for preview")
+            frame_index = self._frame_index(time_ms, fps)
+            cached = self._cache.get(frame_index)
+            if cached is not None:
+                self._cache.move_to_end(frame_index)
+                return cached
+            generation = self._generation
+
+        frame_time_sec = frame_index / self._fps_value(fps)
+        cmd = self._build_command(prepared, fps, frame_time_sec)
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                timeout=self._timeout_sec,
+                check=False,
+            )
+        except subprocess.TimeoutExpired as e:
+            raise RuntimeError(f"FFmpeg preview frame timed out at {time_ms} ms") from e
+
+        width, height = prepared.size.width, prepared.size.height
+        expected = width * height * 4
+        if result.returncode != 0 or len(result.stdout) < expected:
+            detail = (result.stderr or b"").decode("utf-8", errors="replace").strip()
+            raise RuntimeError(
+                f"FFmpeg preview frame failed at {time_ms} ms: "
+                f"{detail[-500:] or 'no frame data returned'}"
+            )
+
+        frame = PreviewFrame(
+            time_ms=int(round(frame_time_sec * 1000)),
+            width=width,
+            height=height,
+            rgba=result.stdout[:expected],
+        )
+        with self._lock:
+            if generation == self._generation and self._cache_size:
+                self._cache[frame_index] = frame
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return frame
+
+    def close(self) -> None:
+        """Drop the resident subtitle, cached frames and temp files."""
+        with self._lock:
+            temp_dir = self._temp_dir
+            self._temp_dir = None
+            self._prepared = None
+            self._cache.clear()
+            self._generation += 1
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _build_command(
+        self, prepared: PreparedSubtitle, fps: str, frame_time_sec: float
+    ) -> list[str]:
+        """Build the one-frame FFmpeg command for ``frame_time_sec``."""
+        w, h = prepared.size.width, prepared.size.height
+        ass_escaped = FFmpegRenderer._escape_filter_path(prepared.ass_path)
+        frame_sec = 1.0 / self._fps_value(fps)
+        return [
+            self._ffmpeg_path or "ffmpeg",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            # Keep the canvas RGBA from the source so the alpha stays transparent
+            f"color=c=black@0.0:s={w}x{h}:r={fps}:d={frame_sec:.6f},format=rgba",
+            "-vf",
+            (
+                f"setpts=PTS+{frame_time_sec:.6f}/TB,"
+                f"subtitles=filename='{ass_escaped}':alpha=1:original_size={w}x{h}"
+            ),
+            "-frames:v",
+            "1",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgba",
+            "pipe:1",
+        ]
+
+    @classmethod
+    def _frame_index(cls, time_ms: int, fps: str) -> int:
+        return max(0, int(round(max(0, time_ms) / 1000.0 * cls._fps_value(fps))))
+
+    @staticmethod
+    def _fps_value(fps: str) -> float:
+        """Parse an FFmpeg frame-rate string ("30", "29.97", "30000/1001")."""
+        try:
+            if "/" in fps:
+                num, den = fps.split("/", 1)
+                value = float(num) / float(den)
+            else:
+                value = float(fps)
+        except (TypeError, ValueError, ZeroDivisionError):
+            value = 30.0
+        return value if value > 0 else 30.0
@@ -0,0 +1,126 @@
+"""
+Process-wide measurement font cache.
+
+Loading a FreeTypeFont parses the font file, and a fallback name such as
+``arial.ttf`` that is not installed makes Pillow walk the system font
+directories before failing. This module keeps one font instance per
+(path, size) for the whole process. Font files are re-opened only when
+their mtime or size changes.
+"""
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from PIL import ImageFont
+
+
+# Fallback fonts tried in order when a preset has no font_file
+FALLBACK_FONT_NAMES = (
+    "arial.ttf",
+    "Arial.ttf",
+    "DejaVuSans.ttf",
+    "LiberationSans-Regular.ttf",
+)
+
+
+class FontRegistry:
+    """
+    Memoizes FreeTypeFont instances by (path, size).
+
+    Example:
+        registry = get_font_registry()
+        font = registry.load("", 64)           # first usable fallback font
+        font = registry.load("my.ttf", 48)     # explicit font file
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._fonts: Dict[Tuple[str, int], Tuple[Optional[Tuple[int, int]], "ImageFont.FreeTypeFont"]] = {}
+        self._fallback_name: Optional[str] = None
+
+    def load(self, font_file: str, font_size: int) -> "ImageFont.FreeTypeFont":
+        """
+        Return the font for ``font_file`` at ``font_size``.
+
+        Args:
+            font_file: Path to a TTF/OTF file, or "" for the fallback fonts
+            font_size: Font size in pixels
+
+        Returns:
+            Shared FreeTypeFont instance
+
+        Raises:
+            FileNotFoundError: If ``font_file`` does not exist
+            RuntimeError: If no fallback font can be loaded
+        """
+        if font_file:
+            return self._load_file(Path(font_file), font_size)
+        return self._load_fallback(font_size)
+
+    def clear(self) -> None:
+        """Drop every cached font."""
+        with self._lock:
+            self._fonts.clear()
+            self._fallback_name = None
+
+    def _load_file(self, path: Path, font_size: int) -> "ImageFont.FreeTypeFont":
+        from PIL import ImageFont
+
+        try:
+            stat = path.stat()
+        except OSError:
+            raise FileNotFoundError(f"Font file not found: {path}") from None
+
+        key = (str(path), font_size)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._fonts.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        font = ImageFont.truetype(str(path), size=font_size)
+        with self._lock:
+            self._fonts[key] = (signature, font)
+        return font
+
+    def _load_fallback(self, font_size: int) -> "ImageFont.FreeTypeFont":
+        from PIL import ImageFont
+
+        key = ("", font_size)
+        with self._lock:
+            cached = self._fonts.get(key)
+            fallback_name = self._fallback_name
+        if cached is not None:
+            return cached[1]
+
+        # Try the name that worked before first so missing fonts are not
+        # searched for again at every new size
+        candidates = list(FALLBACK_FONT_NAMES)
+        if fallback_name:
+            candidates.remove(fallback_name)
+            candidates.insert(0, fallback_name)
+
+        for candidate in candidates:
+            try:
+                font = ImageFont.truetype(candidate, size=font_size)
+            except Exception:
+                continue
+            with self._lock:
+                self._fallback_name = candidate
+                self._fonts[key] = (None, font)
+            return font
+
+        raise RuntimeError(
+            "No usable font found. Provide 'font_file' in preset configuration "
+            "pointing to a TTF/OTF file for deterministic measurement."
+        )
+
+
+_REGISTRY = FontRegistry()
+
+
+def get_font_registry() -> FontRegistry:
+    """Return the process-wide font registry."""
+    return _REGISTRY
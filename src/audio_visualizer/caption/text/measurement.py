@@ -6,7 +6,7 @@ font rendering, which approximates how libass will render the text.
 """
 
 import math
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 if TYPE_CHECKING:
     from PIL import ImageFont
@@ -69,3 +69,101 @@ def measure_single_line(text: str, font: "ImageFont.FreeTypeFont") -> int:
         Width: 85px
     """
     return int(math.ceil(font.getlength(text)))
+
+
+class CachedFont:
+    """
+    Memoizing wrapper around a Pillow font for repeated measurements.
+
+    Wrapping measures every growing line prefix and sizing measures the
+    final lines again, so the same strings are measured many times per
+    subtitle file. This wrapper caches ``getlength()`` by text and
+    ``getmetrics()`` once, and can be passed anywhere a font is used for
+    measurement.
+
+    With Pillow's basic layout every glyph advance is independent of its
+    neighbours except for pair kerning, so :meth:`extend_length` can
+    compute the exact width of ``head + tail`` from the width of ``head``
+    without laying out the whole string again.
+
+    Args:
+        font: Pillow FreeTypeFont to wrap
+        max_entries: Cache size; the cache is cleared when it fills up
+
+    Example:
+        >>> font = CachedFont(ImageFont.truetype("arial.ttf", 64))
+        >>> font.getlength("Hello") == font.getlength("Hello")
+        True
+    """
+
+    def __init__(self, font: "ImageFont.FreeTypeFont", max_entries: int = 65536):
+        self.font = font
+        self._max_entries = max_entries
+        self._lengths: Dict[str, float] = {}
+        self._kerning: Dict[str, float] = {}
+        self._metrics: Optional[Tuple[int, int]] = None
+        self.additive = _has_basic_layout(font)
+
+    def getlength(self, text: str) -> float:
+        """Return the cached advance width of ``text``."""
+        length = self._lengths.get(text)
+        if length is None:
+            length = self.font.getlength(text)
+            self._store(text, length)
+        return length
+
+    def extend_length(self, head: str, head_length: float, tail: str) -> float:
+        """
+        Return the advance width of ``head + tail``.
+
+        Args:
+            head: Text already measured
+            head_length: Advance width of ``head``
+            tail: Text appended to ``head``
+
+        Returns:
+            Width identical to ``getlength(head + tail)``
+        """
+        text = head + tail
+        length = self._lengths.get(text)
+        if length is None:
+            if self.additive and head and tail:
+                length = head_length + self.getlength(tail) + self._pair_kerning(
+                    head[-1] + tail[0]
+                )
+            else:
+                length = self.font.getlength(text)
+            self._store(text, length)
+        return length
+
+    def getmetrics(self) -> Tuple[int, int]:
+        """Return the cached ``(ascent, descent)`` of the font."""
+        if self._metrics is None:
+            self._metrics = self.font.getmetrics()
+        return self._metrics
+
+    def _pair_kerning(self, pair: str) -> float:
+        kerning = self._kerning.get(pair)
+        if kerning is None:
+            kerning = (
+                self.font.getlength(pair)
+                - self.getlength(pair[0])
+                - self.getlength(pair[1])
+            )
+            self._kerning[pair] = kerning
+        return kerning
+
+    def _store(self, text: str, length: float) -> None:
+        if len(self._lengths) >= self._max_entries:
+            self._lengths.clear()
+        self._lengths[text] = length
+
+
+def _has_basic_layout(font) -> bool:
+    """Whether ``font`` lays glyphs out without shaping (Pillow basic layout)."""
+    from PIL import ImageFont
+
+    return (
+        isinstance(font, ImageFont.FreeTypeFont)
+        and font.layout_engine == ImageFont.Layout.BASIC
+    )
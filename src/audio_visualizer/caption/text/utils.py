@@ -7,6 +7,9 @@ newline conversion, and whitespace normalization.
 
 import re
 
+_ASS_TAG_RE = re.compile(r"\{[^}]*\}")
+_HSPACE_RE = re.compile(r"[ \t]+")
+
 
 def strip_ass_tags(text: str) -> str:
     """
@@ -24,7 +27,7 @@ def strip_ass_tags(text: str) -> str:
         >>> strip_ass_tags("{\\fad(120,120)}Hello world")
         'Hello world'
     """
-    return re.sub(r"\{[^}]*\}", "", text)
+    return _ASS_TAG_RE.sub("", text)
 
 
 def ass_newlines_to_real(text: str) -> str:
@@ -92,6 +95,6 @@ def normalize_whitespace(text: str) -> str:
     text = text.replace("\r\n", "\n").replace("\r", "\n")
 
     # Collapse multiple spaces/tabs (but keep newlines)
-    text = re.sub(r"[ \t]+", " ", text)
+    text = _HSPACE_RE.sub(" ", text)
 
     return text.strip()
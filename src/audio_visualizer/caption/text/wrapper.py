@@ -5,7 +5,7 @@ This module provides text wrapping functionality that respects word boundaries
 and maximum line widths.
 """
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 from .utils import normalize_whitespace
 
@@ -45,6 +45,9 @@ def wrap_text_to_width(
     if max_width_px <= 0:
         return text
 
+    # CachedFont measures each candidate incrementally from the line so far
+    extend_length = getattr(font, "extend_length", None)
+
     lines_in = text.split("\n")
     lines_out: List[str] = []
 
@@ -57,27 +60,36 @@ def wrap_text_to_width(
 
         # Split into words
         words = raw_line.split(" ")
-        current: List[str] = []
+        current: Optional[str] = None
+        current_width = 0.0
 
         for word in words:
-            if not current:
+            if current is None:
                 # First word always goes on the line
-                current = [word]
+                current = word
+                if extend_length is not None:
+                    current_width = font.getlength(word)
                 continue
 
             # Try adding this word to the current line
-            candidate = " ".join(current + [word])
+            if extend_length is not None:
+                width = extend_length(current, current_width, " " + word)
+            else:
+                width = font.getlength(current + " " + word)
 
-            if font.getlength(candidate) <= max_width_px:
+            if width <= max_width_px:
                 # Fits! Add it
-                current.append(word)
+                current = current + " " + word
+                current_width = width
             else:
                 # Doesn't fit - flush current line and start new one
-                lines_out.append(" ".join(current))
-                current = [word]
+                lines_out.append(current)
+                current = word
+                if extend_length is not None:
+                    current_width = font.getlength(word)
 
         # Don't forget the last line
-        if current:
-            lines_out.append(" ".join(current))
+        if current is not None:
+            lines_out.append(current)
 
     return "\n".join(lines_out)
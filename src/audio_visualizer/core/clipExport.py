@@ -0,0 +1,301 @@
+"""Grouped audio clip extraction for training dataset export.
+
+Training exports cut one clip per correction, and corrections usually come
+from a handful of long recordings.  Instead of reopening and re-decoding a
+source for every clip, :func:`export_clips` groups the requested clips by
+source media, sorts them by start time and extracts each group in a single
+forward pass: the source is opened once, decoded once through one
+resampler, and every clip is sliced out of the 16 kHz mono stream as the
+pass reaches it.  Stretches with no clip are decoded without resampling,
+and gaps longer than ``seek_gap_ms`` are skipped with a seek.
+
+Groups run in parallel across a process pool, one source per task.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SAMPLE_WIDTH = 2  # s16
+
+
+@dataclass(frozen=True)
+class ClipRequest:
+    """One clip to cut from a source media file.
+
+    Parameters
+    ----------
+    index:
+        Caller-chosen identifier, used to report the result.
+    source_path:
+        Media file to cut from.
+    start_ms, end_ms:
+        Clip range in milliseconds.
+    output_path:
+        WAV file to write.
+    """
+
+    index: int
+    source_path: str
+    start_ms: int
+    end_ms: int
+    output_path: Path
+
+
+def write_wav(
+    path: Path,
+    pcm_data: bytes,
+    sample_rate: int,
+    channels: int,
+    sample_width: int,
+) -> None:
+    """Write raw PCM data as a WAV file."""
+    data_size = len(pcm_data)
+    # RIFF header
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,                            # chunk size
+        1,                             # PCM format
+        channels,
+        sample_rate,
+        sample_rate * channels * sample_width,  # byte rate
+        channels * sample_width,       # block align
+        sample_width * 8,              # bits per sample
+        b"data",
+        data_size,
+    )
+    with open(path, "wb") as f:
+        f.write(header)
+        f.write(pcm_data)
+
+
+class _SourceCutter:
+    """Slice sorted clips out of one source's resampled sample stream."""
+
+    def __init__(self, clips: Sequence[ClipRequest], sample_rate: int) -> None:
+        self.pending = sorted(clips, key=lambda c: (c.start_ms, c.end_ms))
+        self.sample_rate = sample_rate
+        self.next_clip = 0
+        # Clips being filled as [clip, start_sample, end_sample, buffer]
+        self.active: List[list] = []
+        self.results: List[Tuple[int, Optional[str]]] = []
+        self.pos = 0  # Output sample index of the next resampled sample
+
+    def sample(self, ms: int) -> int:
+        return (ms * self.sample_rate) // 1000
+
+    @property
+    def done(self) -> bool:
+        return not self.active and self.next_clip >= len(self.pending)
+
+    def upcoming_start(self) -> Optional[float]:
+        """Start (seconds) of the next clip not yet begun, if any."""
+        if self.next_clip >= len(self.pending):
+            return None
+        return self.pending[self.next_clip].start_ms / 1000.0
+
+    def feed(self, data: bytes, count: int) -> None:
+        """Add ``count`` resampled samples starting at ``self.pos``."""
+        pos, chunk_end = self.pos, self.pos + count
+        while (
+            self.next_clip < len(self.pending)
+            and self.sample(self.pending[self.next_clip].start_ms) < chunk_end
+        ):
+            clip = self.pending[self.next_clip]
+            self.active.append([clip, self.sample(clip.start_ms), self.sample(clip.end_ms), bytearray()])
+            self.next_clip += 1
+        still_active = []
+        for entry in self.active:
+            clip, start, end, buf = entry
+            lo, hi = max(start, pos), min(end, chunk_end)
+            if hi > lo:
+                buf += data[(lo - pos) * _SAMPLE_WIDTH:(hi - pos) * _SAMPLE_WIDTH]
+            if end <= chunk_end:
+                self.finish(clip, buf)
+            else:
+                still_active.append(entry)
+        self.active = still_active
+        self.pos = chunk_end
+
+    def finish(self, clip: ClipRequest, data: bytearray) -> None:
+        try:
+            write_wav(clip.output_path, bytes(data), self.sample_rate, 1, _SAMPLE_WIDTH)
+        except Exception as exc:
+            self.results.append((clip.index, str(exc)))
+            return
+        self.results.append((clip.index, None))
+
+    def end_of_stream(self) -> None:
+        """Write clips cut short by the end of the audio; fail the rest."""
+        for clip, _start, _end, buf in self.active:
+            self.finish(clip, buf)
+        self.active = []
+        for clip in self.pending[self.next_clip:]:
+            self.results.append((clip.index, "clip starts after the end of the audio"))
+        self.next_clip = len(self.pending)
+
+    def fail_remaining(self, error: str) -> None:
+        done = {index for index, _ in self.results}
+        self.results.extend((c.index, error) for c in self.pending if c.index not in done)
+
+
+def extract_source_clips(
+    source_path: str,
+    clips: Sequence[ClipRequest],
+    *,
+    sample_rate: int = 16000,
+    seek_gap_ms: int = 30000,
+) -> List[Tuple[int, Optional[str]]]:
+    """Cut every clip of one source in a single pass.
+
+    Each clip is written as 16-bit mono PCM WAV at *sample_rate*.  A clip
+    running past the end of the audio is cut short.
+
+    Parameters
+    ----------
+    source_path:
+        Media file shared by all *clips*.
+    clips:
+        Clips to cut, in any order.  They may overlap.
+    sample_rate:
+        Output sample rate.
+    seek_gap_ms:
+        Seek instead of decoding when the next clip starts this far ahead.
+
+    Returns
+    -------
+    list of (index, error)
+        *error* is ``None`` for a written clip, otherwise a message.
+    """
+    import av
+
+    cutter = _SourceCutter(clips, sample_rate)
+    if cutter.done:
+        return []
+    try:
+        container = av.open(source_path)
+    except Exception as exc:
+        cutter.fail_remaining(str(exc))
+        return cutter.results
+
+    try:
+        stream = container.streams.audio[0]
+        seek_gap = seek_gap_ms / 1000.0
+        while not cutter.done:
+            # Position just before the next clip, as a single-clip cut would
+            target = cutter.upcoming_start() or 0.0
+            if target > 0:
+                container.seek(max(0, int(target / stream.time_base) - 1), stream=stream)
+            resampler = None
+            reseek = False
+            for frame in container.decode(stream):
+                frame_start = float(frame.pts * stream.time_base) if frame.pts is not None else cutter.pos / sample_rate
+                frame_end = frame_start + frame.samples / frame.sample_rate
+                upcoming = cutter.upcoming_start()
+                if not cutter.active and upcoming is not None and frame_end < upcoming:
+                    # Seek only towards a later clip, so a seek that lands
+                    # early cannot repeat forever
+                    if upcoming - frame_end > seek_gap and upcoming > target:
+                        reseek = True
+                        break
+                    # Nothing to cut here: skip resampling, re-anchor later
+                    resampler = None
+                    continue
+                if resampler is None:
+                    resampler = av.AudioResampler(format="s16", layout="mono", rate=sample_rate)
+                    cutter.pos = round(frame_start * sample_rate)
+                for out in resampler.resample(frame):
+                    cutter.feed(bytes(out.planes[0]), out.samples)
+                if cutter.done:
+                    break
+            else:
+                if resampler is not None:
+                    for out in resampler.resample(None):
+                        cutter.feed(bytes(out.planes[0]), out.samples)
+                cutter.end_of_stream()
+            if not reseek:
+                break
+    except Exception as exc:
+        logger.debug("Clip extraction from %s failed", source_path, exc_info=True)
+        cutter.fail_remaining(str(exc))
+    finally:
+        container.close()
+    return cutter.results
+
+
+def export_clips(
+    requests: Sequence[ClipRequest],
+    *,
+    sample_rate: int = 16000,
+    workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
+) -> Dict[int, Optional[str]]:
+    """Cut many clips, decoding each source once.
+
+    Parameters
+    ----------
+    requests:
+        Clips to cut, from any number of sources.
+    sample_rate:
+        Output sample rate.
+    workers:
+        Processes used across sources.  Defaults to one per CPU (capped
+        at the number of sources); ``1`` runs in this process.
+    progress_callback:
+        Optional ``(clips_done, total, message)`` callback, called after
+        each source.
+
+    Returns
+    -------
+    dict
+        Maps each request's ``index`` to ``None`` (written) or an error.
+    """
+    groups: Dict[str, List[ClipRequest]] = {}
+    for request in requests:
+        groups.setdefault(request.source_path, []).append(request)
+    total = len(requests)
+    results: Dict[int, Optional[str]] = {}
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(groups)))
+
+    def collect(source: str, group_results: List[Tuple[int, Optional[str]]]) -> None:
+        results.update(group_results)
+        if progress_callback:
+            progress_callback(len(results), total, f"Extracted clips from {Path(source).name}")
+
+    if workers == 1:
+        for source, clips in groups.items():
+            collect(source, extract_source_clips(source, clips, sample_rate=sample_rate))
+        return results
+
+    # Largest groups first so one long source does not finish last
+    ordered = sorted(groups.items(), key=lambda item: len(item[1]), reverse=True)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        futures = {
+            pool.submit(extract_source_clips, source, clips, sample_rate=sample_rate): (source, clips)
+            for source, clips in ordered
+        }
+        for future in concurrent.futures.as_completed(futures):
+            source, clips = futures[future]
+            try:
+                group_results = future.result()
+            except Exception as exc:
+                group_results = [(clip.index, str(exc)) for clip in clips]
+            collect(source, group_results)
+    return results
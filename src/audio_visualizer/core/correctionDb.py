@@ -14,18 +14,28 @@ import os
 import sqlite3
 import tempfile
 import threading
+import weakref
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 from audio_visualizer.app_paths import get_data_dir
+from audio_visualizer.core.clipExport import ClipRequest, export_clips, extract_source_clips
+from audio_visualizer.core.replacementRules import ReplacementRuleEngine
 
 logger = logging.getLogger(__name__)
 
 _DB_FILENAME = "corrections.db"
 
+# Compiled replacement rules keyed by (db path, speaker label), holding
+# (rules_version, engine).  Shared across instances so each pipeline run
+# and the SRT editor reuse the same compiled rules.
+_ENGINE_CACHE: dict[tuple[str, Optional[str]], tuple[int, ReplacementRuleEngine]] = {}
+_ENGINE_CACHE_LOCK = threading.Lock()
+
 # Current schema version — bump when migrations are needed.
-_SCHEMA_VERSION = 1
+_SCHEMA_VERSION = 2
 
 
 def _default_db_path() -> Path:
@@ -33,11 +43,30 @@ def _default_db_path() -> Path:
     return get_data_dir() / _DB_FILENAME
 
 
+class _PooledConnection:
+    """Holder for one thread's connection; closes it when the thread ends.
+
+    The thread-local slot owns the holder, so it is dropped when the
+    thread (or the database object) goes away.  ``weakref.finalize`` then
+    closes the connection, which it keeps alive until that point, so the
+    connection is never collected unclosed.
+    """
+
+    __slots__ = ("conn", "close", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+        self.close = weakref.finalize(self, conn.close)
+
+
 class CorrectionDatabase:
     """SQLite-backed store for corrections, prompt terms, and replacement rules.
 
     Thread-safety: a single writer lock serialises all mutating operations.
     Read-only queries are safe to call from any thread thanks to WAL mode.
+    Each thread reuses one connection (opened on first use, closed when the
+    thread exits or :meth:`close` is called), so PRAGMAs run once per
+    thread and SQLite's statement cache keeps repeated statements prepared.
 
     Parameters
     ----------
@@ -49,30 +78,88 @@ class CorrectionDatabase:
     def __init__(self, db_path: Path | str | None = None) -> None:
         self._db_path = Path(db_path) if db_path else _default_db_path()
         self._write_lock = threading.Lock()
+        self._local = threading.local()
+        self._pool: weakref.WeakSet[_PooledConnection] = weakref.WeakSet()
+        self._pool_lock = threading.Lock()
         self._ensure_schema()
 
     # ------------------------------------------------------------------
-    # Schema management
+    # Connections and schema management
     # ------------------------------------------------------------------
 
     def _connect(self) -> sqlite3.Connection:
-        """Open a new connection with WAL mode and foreign keys enabled."""
-        conn = sqlite3.connect(str(self._db_path), timeout=10)
+        """Open a new connection with WAL mode and foreign keys enabled.
+
+        The caller owns (and closes) the connection; queries go through
+        the per-thread connection from :meth:`_connection` instead.
+        """
+        conn = sqlite3.connect(str(self._db_path), timeout=10, check_same_thread=False)
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA foreign_keys=ON")
         conn.row_factory = sqlite3.Row
         return conn
 
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's pooled connection, opening it on first use."""
+        pooled = getattr(self._local, "pooled", None)
+        if pooled is None:
+            pooled = _PooledConnection(self._connect())
+            self._local.pooled = pooled
+            with self._pool_lock:
+                self._pool.add(pooled)
+        return pooled.conn
+
+    @contextmanager
+    def _transaction(self, action: Optional[str] = None) -> Iterator[sqlite3.Connection]:
+        """Run a write under the writer lock; commit on success, else roll back.
+
+        *action* names the operation in the error log on failure.
+        """
+        with self._write_lock:
+            conn = self._connection()
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                if action:
+                    logger.exception("Failed to %s", action)
+                raise
+
+    def close(self) -> None:
+        """Close every pooled connection.
+
+        The database stays usable; threads reconnect on their next query.
+        """
+        with self._pool_lock:
+            pooled = list(self._pool)
+            self._pool = weakref.WeakSet()
+            self._local = threading.local()
+        for holder in pooled:
+            holder.close()
+
     def _ensure_schema(self) -> None:
-        """Create tables if they do not exist."""
+        """Create tables if they do not exist and migrate older files."""
         with self._write_lock:
             conn = self._connect()
             try:
                 conn.executescript(_SCHEMA_SQL)
+                row = conn.execute(
+                    "SELECT value FROM meta WHERE key = 'schema_version'"
+                ).fetchone()
+                version = int(row["value"]) if row else 0
+                for target, statements in _MIGRATIONS:
+                    if version < target:
+                        for statement in statements:
+                            conn.execute(statement)
                 conn.execute(
-                    "INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)",
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
                     ("schema_version", str(_SCHEMA_VERSION)),
                 )
+                conn.execute(
+                    "INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)",
+                    ("rules_version", "0"),
+                )
                 conn.commit()
             except Exception:
                 conn.rollback()
@@ -101,7 +188,8 @@ class CorrectionDatabase:
     ) -> int:
         """Write a single correction row.
 
-        Returns the ``rowid`` of the inserted correction.
+        Returns the ``rowid`` of the inserted correction, or ``-1`` when
+        the text is unchanged or an identical correction already exists.
 
         This is intended to be called on committed action boundaries
         (e.g. when the user finishes editing a cell), **not** on every
@@ -110,98 +198,10 @@ class CorrectionDatabase:
         if original_text == corrected_text:
             return -1  # No actual change — skip silently.
 
-        duplicate_id = self._find_duplicate_correction(
-            source_media_path=source_media_path,
-            time_start_ms=time_start_ms,
-            time_end_ms=time_end_ms,
-            original_text=original_text,
-            corrected_text=corrected_text,
-            speaker_label=speaker_label,
-            model_name=model_name,
-            lora_name=lora_name,
-            confidence=confidence,
-            bundle_entry_id=bundle_entry_id,
-        )
-        if duplicate_id is not None:
-            logger.debug("Skipping duplicate correction row #%d", duplicate_id)
-            return -1
-
         now = datetime.now(timezone.utc).isoformat()
-        with self._write_lock:
-            conn = self._connect()
-            try:
-                cur = conn.execute(
-                    """
-                    INSERT INTO corrections (
-                        source_media_path, time_start_ms, time_end_ms,
-                        original_text, corrected_text, speaker_label,
-                        model_name, lora_name, confidence,
-                        bundle_entry_id, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        source_media_path,
-                        time_start_ms,
-                        time_end_ms,
-                        original_text,
-                        corrected_text,
-                        speaker_label,
-                        model_name,
-                        lora_name,
-                        confidence,
-                        bundle_entry_id,
-                        now,
-                    ),
-                )
-                conn.commit()
-                rowid = cur.lastrowid
-                logger.debug(
-                    "Recorded correction #%d: '%s' -> '%s'",
-                    rowid,
-                    original_text[:40],
-                    corrected_text[:40],
-                )
-                return rowid or -1
-            except Exception:
-                conn.rollback()
-                logger.exception("Failed to record correction")
-                raise
-            finally:
-                conn.close()
-
-    def _find_duplicate_correction(
-        self,
-        *,
-        source_media_path: str,
-        time_start_ms: int,
-        time_end_ms: int,
-        original_text: str,
-        corrected_text: str,
-        speaker_label: Optional[str],
-        model_name: Optional[str],
-        lora_name: Optional[str],
-        confidence: Optional[float],
-        bundle_entry_id: Optional[str],
-    ) -> int | None:
-        """Return an existing correction id when the new row would be identical."""
-        conn = self._connect()
-        try:
-            row = conn.execute(
-                """
-                SELECT id
-                FROM corrections
-                WHERE source_media_path = ?
-                  AND time_start_ms = ?
-                  AND time_end_ms = ?
-                  AND original_text = ?
-                  AND corrected_text = ?
-                  AND speaker_label IS ?
-                  AND model_name IS ?
-                  AND lora_name IS ?
-                  AND confidence IS ?
-                  AND bundle_entry_id IS ?
-                LIMIT 1
-                """,
+        with self._transaction("record correction") as conn:
+            cur = conn.execute(
+                _INSERT_CORRECTION_SQL,
                 (
                     source_media_path,
                     time_start_ms,
@@ -213,11 +213,52 @@ class CorrectionDatabase:
                     lora_name,
                     confidence,
                     bundle_entry_id,
+                    now,
                 ),
-            ).fetchone()
-            return int(row["id"]) if row else None
-        finally:
-            conn.close()
+            )
+        if cur.rowcount == 0:
+            logger.debug("Skipping duplicate correction for '%s'", original_text[:40])
+            return -1
+        rowid = cur.lastrowid
+        logger.debug(
+            "Recorded correction #%d: '%s' -> '%s'",
+            rowid,
+            original_text[:40],
+            corrected_text[:40],
+        )
+        return rowid or -1
+
+    def record_corrections(self, corrections: Iterable[Mapping[str, Any]]) -> int:
+        """Write many correction rows in a single transaction.
+
+        Each item takes the keyword arguments of :meth:`record_correction`.
+        Unchanged text and corrections identical to an existing row are
+        skipped.  Returns the number of rows inserted.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (
+                c["source_media_path"],
+                c["time_start_ms"],
+                c["time_end_ms"],
+                c["original_text"],
+                c["corrected_text"],
+                c.get("speaker_label"),
+                c.get("model_name"),
+                c.get("lora_name"),
+                c.get("confidence"),
+                c.get("bundle_entry_id"),
+                now,
+            )
+            for c in corrections
+            if c["original_text"] != c["corrected_text"]
+        ]
+        if not rows:
+            return 0
+        with self._transaction("record corrections") as conn:
+            cur = conn.executemany(_INSERT_CORRECTION_SQL, rows)
+        logger.debug("Recorded %d of %d corrections", cur.rowcount, len(rows))
+        return cur.rowcount
 
     def query_corrections(
         self,
@@ -248,12 +289,8 @@ class CorrectionDatabase:
         sql = f"SELECT * FROM corrections{where} ORDER BY created_at DESC LIMIT ?"
         params.append(limit)
 
-        conn = self._connect()
-        try:
-            rows = conn.execute(sql, params).fetchall()
-            return [dict(r) for r in rows]
-        finally:
-            conn.close()
+        rows = self._connection().execute(sql, params).fetchall()
+        return [dict(r) for r in rows]
 
     def distinct_speaker_labels(self) -> list[str]:
         """Return all distinct non-null speaker labels across correction data.
@@ -263,21 +300,17 @@ class CorrectionDatabase:
         the union across all three relevant tables instead of just
         ``corrections``.
         """
-        conn = self._connect()
-        try:
-            rows = conn.execute(
-                """
-                SELECT speaker_label FROM corrections WHERE speaker_label IS NOT NULL
-                UNION
-                SELECT speaker_label FROM prompt_terms WHERE speaker_label IS NOT NULL
-                UNION
-                SELECT speaker_label FROM replacement_rules WHERE speaker_label IS NOT NULL
-                ORDER BY speaker_label
-                """
-            ).fetchall()
-            return [r["speaker_label"] for r in rows]
-        finally:
-            conn.close()
+        rows = self._connection().execute(
+            """
+            SELECT speaker_label FROM corrections WHERE speaker_label IS NOT NULL
+            UNION
+            SELECT speaker_label FROM prompt_terms WHERE speaker_label IS NOT NULL
+            UNION
+            SELECT speaker_label FROM replacement_rules WHERE speaker_label IS NOT NULL
+            ORDER BY speaker_label
+            """
+        ).fetchall()
+        return [r["speaker_label"] for r in rows]
 
     # ------------------------------------------------------------------
     # Prompt terms
@@ -296,25 +329,16 @@ class CorrectionDatabase:
         Duplicate (term, speaker_label) pairs are silently skipped.
         """
         now = datetime.now(timezone.utc).isoformat()
-        with self._write_lock:
-            conn = self._connect()
-            try:
-                cur = conn.execute(
-                    """
-                    INSERT OR IGNORE INTO prompt_terms
-                        (term, category, speaker_label, source, created_at)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (term, category, speaker_label, source, now),
-                )
-                conn.commit()
-                return cur.lastrowid or -1
-            except Exception:
-                conn.rollback()
-                logger.exception("Failed to add prompt term")
-                raise
-            finally:
-                conn.close()
+        with self._transaction("add prompt term") as conn:
+            cur = conn.execute(
+                """
+                INSERT OR IGNORE INTO prompt_terms
+                    (term, category, speaker_label, source, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (term, category, speaker_label, source, now),
+            )
+        return cur.lastrowid or -1
 
     def update_prompt_term(
         self,
@@ -340,17 +364,9 @@ class CorrectionDatabase:
             return False
         params.append(term_id)
         sql = f"UPDATE prompt_terms SET {', '.join(sets)} WHERE id = ?"
-        with self._write_lock:
-            conn = self._connect()
-            try:
-                cur = conn.execute(sql, params)
-                conn.commit()
-                return cur.rowcount > 0
-            except Exception:
-                conn.rollback()
-                raise
-            finally:
-                conn.close()
+        with self._transaction() as conn:
+            cur = conn.execute(sql, params)
+        return cur.rowcount > 0
 
     def list_prompt_terms(
         self,
@@ -385,26 +401,14 @@ class CorrectionDatabase:
 
         where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
         sql = f"SELECT * FROM prompt_terms{where} ORDER BY term"
-        conn = self._connect()
-        try:
-            rows = conn.execute(sql, params).fetchall()
-            return [dict(r) for r in rows]
-        finally:
-            conn.close()
+        rows = self._connection().execute(sql, params).fetchall()
+        return [dict(r) for r in rows]
 
     def remove_prompt_term(self, term_id: int) -> bool:
         """Remove a prompt term by its id.  Returns True if a row was deleted."""
-        with self._write_lock:
-            conn = self._connect()
-            try:
-                cur = conn.execute("DELETE FROM prompt_terms WHERE id = ?", (term_id,))
-                conn.commit()
-                return cur.rowcount > 0
-            except Exception:
-                conn.rollback()
-                raise
-            finally:
-                conn.close()
+        with self._transaction() as conn:
+            cur = conn.execute("DELETE FROM prompt_terms WHERE id = ?", (term_id,))
+        return cur.rowcount > 0
 
     def export_prompt_text(
         self,
@@ -428,27 +432,45 @@ class CorrectionDatabase:
         speaker_label: Optional[str] = None,
         source: str = "user",
     ) -> int:
-        """Add a replacement rule.  Returns the rowid."""
+        """Add a replacement rule.  Returns the rowid.
+
+        An identical rule (pattern, replacement, regex flag and speaker)
+        is not added again; ``-1`` is returned instead.
+        """
         now = datetime.now(timezone.utc).isoformat()
-        with self._write_lock:
-            conn = self._connect()
-            try:
-                cur = conn.execute(
-                    """
-                    INSERT INTO replacement_rules
-                        (pattern, replacement, is_regex, speaker_label, source, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (pattern, replacement, int(is_regex), speaker_label, source, now),
-                )
-                conn.commit()
-                return cur.lastrowid or -1
-            except Exception:
-                conn.rollback()
-                logger.exception("Failed to add replacement rule")
-                raise
-            finally:
-                conn.close()
+        with self._transaction("add replacement rule") as conn:
+            cur = conn.execute(
+                _INSERT_RULE_SQL,
+                (pattern, replacement, int(is_regex), speaker_label, source, now),
+            )
+        if cur.rowcount == 0:
+            return -1
+        return cur.lastrowid or -1
+
+    def add_replacement_rules(self, rules: Iterable[Mapping[str, Any]]) -> int:
+        """Add many replacement rules in a single transaction.
+
+        Each item takes ``pattern`` and ``replacement`` plus the optional
+        keyword arguments of :meth:`add_replacement_rule`.  Rules identical
+        to an existing one are skipped.  Returns the number of rules added.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (
+                r["pattern"],
+                r["replacement"],
+                int(bool(r.get("is_regex", False))),
+                r.get("speaker_label"),
+                r.get("source", "user"),
+                now,
+            )
+            for r in rules
+        ]
+        if not rows:
+            return 0
+        with self._transaction("add replacement rules") as conn:
+            cur = conn.executemany(_INSERT_RULE_SQL, rows)
+        return cur.rowcount
 
     def update_replacement_rule(
         self,
@@ -459,7 +481,11 @@ class CorrectionDatabase:
         is_regex: Optional[bool] = None,
         speaker_label: Optional[str] = ...,  # type: ignore[assignment]
     ) -> bool:
-        """Update fields on an existing replacement rule.  Returns True if modified."""
+        """Update fields on an existing replacement rule.  Returns True if modified.
+
+        Raises ``sqlite3.IntegrityError`` if the change would duplicate
+        another rule.
+        """
         sets: list[str] = []
         params: list[Any] = []
         if pattern is not None:
@@ -478,17 +504,9 @@ class CorrectionDatabase:
             return False
         params.append(rule_id)
         sql = f"UPDATE replacement_rules SET {', '.join(sets)} WHERE id = ?"
-        with self._write_lock:
-            conn = self._connect()
-            try:
-                cur = conn.execute(sql, params)
-                conn.commit()
-                return cur.rowcount > 0
-            except Exception:
-                conn.rollback()
-                raise
-            finally:
-                conn.close()
+        with self._transaction() as conn:
+            cur = conn.execute(sql, params)
+        return cur.rowcount > 0
 
     def list_replacement_rules(
         self,
@@ -513,28 +531,64 @@ class CorrectionDatabase:
 
         where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
         sql = f"SELECT * FROM replacement_rules{where} ORDER BY pattern"
-        conn = self._connect()
-        try:
-            rows = conn.execute(sql, params).fetchall()
-            return [dict(r) for r in rows]
-        finally:
-            conn.close()
+        rows = self._connection().execute(sql, params).fetchall()
+        return [dict(r) for r in rows]
 
     def remove_replacement_rule(self, rule_id: int) -> bool:
         """Remove a replacement rule by its id.  Returns True if deleted."""
-        with self._write_lock:
-            conn = self._connect()
-            try:
-                cur = conn.execute(
-                    "DELETE FROM replacement_rules WHERE id = ?", (rule_id,)
-                )
-                conn.commit()
-                return cur.rowcount > 0
-            except Exception:
-                conn.rollback()
-                raise
-            finally:
-                conn.close()
+        with self._transaction() as conn:
+            cur = conn.execute(
+                "DELETE FROM replacement_rules WHERE id = ?", (rule_id,)
+            )
+        return cur.rowcount > 0
+
+    def replacement_rules_version(self) -> int:
+        """Return a counter that changes whenever any replacement rule changes.
+
+        Maintained by triggers on ``replacement_rules``, so edits made
+        through any connection (or another process) are reflected.
+        """
+        row = self._connection().execute(
+            "SELECT value FROM meta WHERE key = 'rules_version'"
+        ).fetchone()
+        return int(row["value"]) if row else 0
+
+    def get_replacement_engine(
+        self,
+        speaker_label: Optional[str] = None,
+    ) -> ReplacementRuleEngine:
+        """Return the compiled rules applied to text from *speaker_label*.
+
+        Per-speaker rules come first, followed by global rules; with no
+        speaker only the global rules apply.  Engines are cached per
+        database file and speaker until the rules version changes.
+        """
+        version = self.replacement_rules_version()
+        key = (str(self._db_path), speaker_label)
+        with _ENGINE_CACHE_LOCK:
+            cached = _ENGINE_CACHE.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        # Read the version and the rows in one snapshot so a concurrent
+        # edit cannot cache old rules under the new version
+        rules: list[dict[str, Any]] = []
+        with self._transaction() as conn:
+            conn.execute("BEGIN")
+            row = conn.execute("SELECT value FROM meta WHERE key = 'rules_version'").fetchone()
+            version = int(row["value"]) if row else 0
+            if speaker_label is not None:
+                rules.extend(dict(r) for r in conn.execute(
+                    "SELECT * FROM replacement_rules WHERE speaker_label = ? ORDER BY pattern",
+                    (speaker_label,),
+                ))
+            rules.extend(dict(r) for r in conn.execute(
+                "SELECT * FROM replacement_rules WHERE speaker_label IS NULL ORDER BY pattern"
+            ))
+        engine = ReplacementRuleEngine(rules)
+        with _ENGINE_CACHE_LOCK:
+            _ENGINE_CACHE[key] = (version, engine)
+        return engine
 
     def export_replacement_dict(
         self,
@@ -579,23 +633,19 @@ class CorrectionDatabase:
             "original_text, corrected_text, speaker_label, model_name "
             f"FROM corrections{where} ORDER BY created_at"
         )
-        conn = self._connect()
-        try:
-            rows = conn.execute(sql, params).fetchall()
-            return [
-                {
-                    "audio_ref": r["source_media_path"],
-                    "time_start_ms": r["time_start_ms"],
-                    "time_end_ms": r["time_end_ms"],
-                    "original_text": r["original_text"],
-                    "corrected_text": r["corrected_text"],
-                    "speaker_label": r["speaker_label"],
-                    "model_name": r["model_name"],
-                }
-                for r in rows
-            ]
-        finally:
-            conn.close()
+        rows = self._connection().execute(sql, params).fetchall()
+        return [
+            {
+                "audio_ref": r["source_media_path"],
+                "time_start_ms": r["time_start_ms"],
+                "time_end_ms": r["time_end_ms"],
+                "original_text": r["original_text"],
+                "corrected_text": r["corrected_text"],
+                "speaker_label": r["speaker_label"],
+                "model_name": r["model_name"],
+            }
+            for r in rows
+        ]
 
     def export_training_dataset(
         self,
@@ -610,7 +660,9 @@ class CorrectionDatabase:
 
         Each correction pair that references an existing source media file
         gets its audio segment extracted using PyAV and written as a 16kHz
-        mono WAV clip.  A ``metadata.csv`` is written with columns:
+        mono WAV clip.  Clips are cut by :func:`export_clips`, which decodes
+        each source once and works on several sources in parallel.  A
+        ``metadata.csv`` is written with columns:
         ``file_name``, ``text``, ``original_text``, ``speaker_label``.
 
         Parameters
@@ -647,11 +699,10 @@ class CorrectionDatabase:
         metadata_rows: List[dict[str, str]] = []
 
         total = len(pairs)
-        for idx, pair in enumerate(pairs):
+        requests: List[ClipRequest] = []
+        request_pairs: List[dict[str, Any]] = []
+        for pair in pairs:
             audio_ref = pair["audio_ref"]
-            if progress_callback:
-                progress_callback(idx, total, f"Processing {Path(audio_ref).name}")
-
             if not os.path.isfile(audio_ref):
                 warnings.append(f"Skipped: source file not found: {audio_ref}")
                 skipped += 1
@@ -666,21 +717,39 @@ class CorrectionDatabase:
                 skipped += 1
                 continue
 
-            clip_name = f"clip_{exported:05d}.wav"
-            clip_path = output_dir / clip_name
+            requests.append(ClipRequest(
+                index=len(requests),
+                source_path=audio_ref,
+                start_ms=start_ms,
+                end_ms=end_ms,
+                output_path=output_dir / f"clip_{len(requests):05d}.wav",
+            ))
+            request_pairs.append(pair)
+
+        # Each source is decoded once for all of its clips
+        invalid = skipped
+        errors = export_clips(
+            requests,
+            progress_callback=(
+                (lambda done, _n, message: progress_callback(invalid + done, total, message))
+                if progress_callback
+                else None
+            ),
+        )
 
-            try:
-                _extract_audio_segment(
-                    source_path=audio_ref,
-                    output_path=clip_path,
-                    start_ms=start_ms,
-                    end_ms=end_ms,
+        for request, pair in zip(requests, request_pairs):
+            error = errors.get(request.index, "not extracted")
+            if error is not None:
+                warnings.append(
+                    f"Skipped: extraction failed for {request.source_path}: {error}"
                 )
-            except Exception as exc:
-                warnings.append(f"Skipped: extraction failed for {audio_ref}: {exc}")
                 skipped += 1
                 continue
 
+            # Number clips contiguously, as if failed ones were never cut
+            clip_name = f"clip_{exported:05d}.wav"
+            if request.output_path.name != clip_name:
+                os.replace(request.output_path, output_dir / clip_name)
             metadata_rows.append({
                 "file_name": clip_name,
                 "text": pair["corrected_text"],
@@ -715,32 +784,20 @@ class CorrectionDatabase:
 
     def correction_count(self) -> int:
         """Return the total number of correction rows."""
-        conn = self._connect()
-        try:
-            row = conn.execute("SELECT COUNT(*) AS cnt FROM corrections").fetchone()
-            return row["cnt"] if row else 0
-        finally:
-            conn.close()
+        row = self._connection().execute("SELECT COUNT(*) AS cnt FROM corrections").fetchone()
+        return row["cnt"] if row else 0
 
     def prompt_term_count(self) -> int:
         """Return the total number of prompt terms."""
-        conn = self._connect()
-        try:
-            row = conn.execute("SELECT COUNT(*) AS cnt FROM prompt_terms").fetchone()
-            return row["cnt"] if row else 0
-        finally:
-            conn.close()
+        row = self._connection().execute("SELECT COUNT(*) AS cnt FROM prompt_terms").fetchone()
+        return row["cnt"] if row else 0
 
     def replacement_rule_count(self) -> int:
         """Return the total number of replacement rules."""
-        conn = self._connect()
-        try:
-            row = conn.execute(
-                "SELECT COUNT(*) AS cnt FROM replacement_rules"
-            ).fetchone()
-            return row["cnt"] if row else 0
-        finally:
-            conn.close()
+        row = self._connection().execute(
+            "SELECT COUNT(*) AS cnt FROM replacement_rules"
+        ).fetchone()
+        return row["cnt"] if row else 0
 
 
 # ------------------------------------------------------------------
@@ -757,105 +814,13 @@ def _extract_audio_segment(
 ) -> None:
     """Extract an audio segment from *source_path* and write a 16kHz mono WAV.
 
-    Uses PyAV for decoding.  The output is always 16kHz mono signed-16-bit PCM,
-    which is the format expected by Whisper-based training pipelines.
+    Cuts a single clip with :func:`extract_source_clips`; exports of many
+    clips go through :func:`export_clips` so each source is decoded once.
     """
-    import array
-    import struct
-    import av
-
-    start_sec = start_ms / 1000.0
-    end_sec = end_ms / 1000.0
-
-    container = av.open(source_path)
-    try:
-        audio_stream = container.streams.audio[0]
-        # Seek to just before the desired start
-        seek_ts = int(start_sec / audio_stream.time_base)
-        container.seek(max(0, seek_ts - 1), stream=audio_stream)
-
-        resampler = av.AudioResampler(
-            format="s16",
-            layout="mono",
-            rate=sample_rate,
-        )
-
-        samples: list[bytes] = []
-        collecting = False
-
-        for frame in container.decode(audio=0):
-            frame_start = float(frame.pts * audio_stream.time_base)
-            frame_end = frame_start + (frame.samples / frame.sample_rate)
-
-            if frame_end < start_sec:
-                continue
-            if frame_start > end_sec:
-                break
-
-            collecting = True
-            resampled = resampler.resample(frame)
-            for r_frame in resampled:
-                raw = bytes(r_frame.planes[0])
-                # Trim to the desired time range
-                frame_sr = r_frame.sample_rate
-                r_start = float(r_frame.pts * audio_stream.time_base) if r_frame.pts is not None else frame_start
-                r_end = r_start + (r_frame.samples / frame_sr)
-
-                if r_start < start_sec:
-                    skip_samples = int((start_sec - r_start) * frame_sr)
-                    raw = raw[skip_samples * 2:]
-                if r_end > end_sec:
-                    keep_samples = int((end_sec - max(r_start, start_sec)) * frame_sr)
-                    raw = raw[:keep_samples * 2]
-                if raw:
-                    samples.append(raw)
-
-        if not collecting:
-            # Flush resampler
-            resampled = resampler.resample(None)
-            for r_frame in resampled:
-                raw = bytes(r_frame.planes[0])
-                if raw:
-                    samples.append(raw)
-    finally:
-        container.close()
-
-    # Write WAV file (PCM s16le mono)
-    pcm_data = b"".join(samples)
-    _write_wav(output_path, pcm_data, sample_rate=sample_rate, channels=1, sample_width=2)
-
-
-def _write_wav(
-    path: Path,
-    pcm_data: bytes,
-    sample_rate: int,
-    channels: int,
-    sample_width: int,
-) -> None:
-    """Write raw PCM data as a WAV file."""
-    import struct
-
-    data_size = len(pcm_data)
-    # RIFF header
-    header = struct.pack(
-        "<4sI4s4sIHHIIHH4sI",
-        b"RIFF",
-        36 + data_size,
-        b"WAVE",
-        b"fmt ",
-        16,                            # chunk size
-        1,                             # PCM format
-        channels,
-        sample_rate,
-        sample_rate * channels * sample_width,  # byte rate
-        channels * sample_width,       # block align
-        sample_width * 8,              # bits per sample
-        b"data",
-        data_size,
-    )
-    with open(path, "wb") as f:
-        f.write(header)
-        f.write(pcm_data)
+    request = ClipRequest(0, str(source_path), start_ms, end_ms, Path(output_path))
+    for _index, error in extract_source_clips(str(source_path), [request], sample_rate=sample_rate):
+        if error is not None:
+            raise RuntimeError(error)
 
 
 # ------------------------------------------------------------------
@@ -917,4 +882,65 @@ CREATE TABLE IF NOT EXISTS replacement_rules (
 
 CREATE INDEX IF NOT EXISTS idx_replacement_rules_speaker
     ON replacement_rules (speaker_label);
+
+CREATE TRIGGER IF NOT EXISTS trg_replacement_rules_insert
+AFTER INSERT ON replacement_rules
+BEGIN
+    INSERT OR IGNORE INTO meta (key, value) VALUES ('rules_version', '0');
+    UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'rules_version';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_replacement_rules_update
+AFTER UPDATE ON replacement_rules
+BEGIN
+    INSERT OR IGNORE INTO meta (key, value) VALUES ('rules_version', '0');
+    UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'rules_version';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_replacement_rules_delete
+AFTER DELETE ON replacement_rules
+BEGIN
+    INSERT OR IGNORE INTO meta (key, value) VALUES ('rules_version', '0');
+    UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'rules_version';
+END;
+"""
+
+# Duplicate detection keys.  NULLs are folded so ``INSERT ... ON CONFLICT``
+# treats a missing speaker (etc.) like any other value.
+_CORRECTION_KEY = """
+    source_media_path, time_start_ms, time_end_ms, original_text, corrected_text,
+    COALESCE(speaker_label, ''), COALESCE(model_name, ''), COALESCE(lora_name, ''),
+    COALESCE(confidence, -1.0), COALESCE(bundle_entry_id, '')
+"""
+_RULE_KEY = "pattern, replacement, is_regex, COALESCE(speaker_label, '')"
+
+# (schema version, statements) applied in order to files older than the
+# version.  Version 2 replaces the correction duplicate lookup with unique
+# indexes, dropping any duplicates recorded before.
+_MIGRATIONS: list[tuple[int, list[str]]] = [
+    (2, [
+        f"""DELETE FROM corrections WHERE id NOT IN (
+            SELECT MIN(id) FROM corrections GROUP BY {_CORRECTION_KEY})""",
+        f"CREATE UNIQUE INDEX IF NOT EXISTS idx_corrections_unique ON corrections ({_CORRECTION_KEY})",
+        f"""DELETE FROM replacement_rules WHERE id NOT IN (
+            SELECT MIN(id) FROM replacement_rules GROUP BY {_RULE_KEY})""",
+        f"CREATE UNIQUE INDEX IF NOT EXISTS idx_replacement_rules_unique ON replacement_rules ({_RULE_KEY})",
+    ]),
+]
+
+_INSERT_CORRECTION_SQL = """
+INSERT INTO corrections (
+    source_media_path, time_start_ms, time_end_ms,
+    original_text, corrected_text, speaker_label,
+    model_name, lora_name, confidence,
+    bundle_entry_id, created_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT DO NOTHING
+"""
+
+_INSERT_RULE_SQL = """
+INSERT INTO replacement_rules
+    (pattern, replacement, is_regex, speaker_label, source, created_at)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT DO NOTHING
 """
@@ -0,0 +1,194 @@
+"""Compiled replacement-rule engine shared by the SRT pipeline and editor.
+
+Replacement rules from the correction database are applied to subtitle
+text in order: each rule sees the output of the rules before it.  With
+thousands of rules, trying every rule on every line dominates the cost
+even though almost none of them match.
+
+``ReplacementRuleEngine`` compiles a rule list once:
+
+* literal patterns go into one Aho-Corasick automaton, so a single pass
+  over a line finds every literal rule that can fire;
+* regex patterns are compiled once (invalid ones are dropped, as the
+  per-call ``re.sub`` used to skip them), and a single alternation of
+  them is searched first: when it finds nothing, no regex rule can match
+  and all of them are skipped for that text.
+
+Application keeps the sequential semantics exactly.  Only rules that can
+change the current text are visited, in rule order, and the automaton is
+re-run on the new text whenever a rule changes it, so chained rules
+(``a -> b`` followed by ``b -> c``) behave as before.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Pattern, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Backreferences and conditionals refer to groups by per-pattern number or
+# name, and global inline flags must lead the pattern, so such regexes
+# cannot join the combined prefilter.
+_NOT_COMBINABLE = re.compile(r"\\\d|\(\?P=|\(\?\(|^\(\?[aiLmsux]+\)")
+
+
+class _LiteralMatcher:
+    """Aho-Corasick automaton reporting which patterns occur in a text."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        out: List[Tuple[str, ...]] = [()]
+        for pattern in set(patterns):
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                node = nxt
+            out[node] = (pattern,)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0)
+                # Patterns ending at the fallback state also end here
+                out[child] = out[child] + out[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def __bool__(self) -> bool:
+        return len(self._goto) > 1
+
+    def find(self, text: str) -> Set[str]:
+        """Return the set of patterns occurring anywhere in ``text``."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[str] = set()
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+
+@dataclass(frozen=True)
+class _CompiledRule:
+    pattern: str
+    replacement: str
+    regex: Optional[Pattern[str]] = None
+
+
+class ReplacementRuleEngine:
+    """Ordered replacement rules compiled for repeated application.
+
+    Args:
+        rules: Rule mappings with ``pattern``, ``replacement`` and
+            ``is_regex`` keys (as returned by
+            ``CorrectionDatabase.list_replacement_rules``), in application
+            order.  Empty patterns and invalid regexes are skipped.
+    """
+
+    def __init__(self, rules: Iterable[Mapping[str, Any]]) -> None:
+        compiled: List[_CompiledRule] = []
+        for rule in rules:
+            pattern = rule.get("pattern", "") or ""
+            replacement = rule.get("replacement", "") or ""
+            if not pattern:
+                continue
+            regex = None
+            if rule.get("is_regex", False):
+                try:
+                    regex = re.compile(pattern)
+                except re.error:
+                    logger.debug("Skipping invalid replacement regex %r", pattern)
+                    continue
+            compiled.append(_CompiledRule(pattern, replacement, regex))
+
+        self._rules: Tuple[_CompiledRule, ...] = tuple(compiled)
+        self._literal_positions: Dict[str, List[int]] = {}
+        self._regex_positions: List[int] = []
+        for pos, rule in enumerate(self._rules):
+            if rule.regex is None:
+                self._literal_positions.setdefault(rule.pattern, []).append(pos)
+            else:
+                self._regex_positions.append(pos)
+        self._matcher = _LiteralMatcher(self._literal_positions)
+        self._regex_filter, self._unfiltered_regex_positions = self._build_regex_filter()
+
+    def _build_regex_filter(self) -> Tuple[Optional[Pattern[str]], List[int]]:
+        """Combine regex rules into one alternation used as a prefilter.
+
+        Returns the combined pattern (or None) and the positions of regex
+        rules it does not cover, which always have to run.
+        """
+        combinable = [
+            pos for pos in self._regex_positions
+            if not _NOT_COMBINABLE.search(self._rules[pos].pattern)
+        ]
+        if len(combinable) < 2:
+            return None, self._regex_positions
+        try:
+            combined = re.compile(
+                "|".join(f"(?:{self._rules[pos].pattern})" for pos in combinable)
+            )
+        except re.error:
+            return None, self._regex_positions
+        covered = set(combinable)
+        return combined, [pos for pos in self._regex_positions if pos not in covered]
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def _candidates(self, text: str, start: int) -> List[int]:
+        """Positions ``>= start`` of rules that may change ``text``, in order."""
+        regex_positions = self._regex_positions
+        if self._regex_filter is not None and self._regex_filter.search(text) is None:
+            regex_positions = self._unfiltered_regex_positions
+        positions = regex_positions[bisect_left(regex_positions, start):]
+        if self._matcher:
+            for pattern in self._matcher.find(text):
+                group = self._literal_positions[pattern]
+                positions.extend(group[bisect_left(group, start):])
+            positions.sort()
+        return positions
+
+    def apply(self, text: str) -> str:
+        """Apply every rule to ``text`` in order and return the result."""
+        if not self._rules:
+            return text
+        start = 0
+        while True:
+            for pos in self._candidates(text, start):
+                rule = self._rules[pos]
+                if rule.regex is None:
+                    new_text = text.replace(rule.pattern, rule.replacement)
+                else:
+                    try:
+                        new_text = rule.regex.sub(rule.replacement, text)
+                    except re.error:
+                        continue  # Invalid replacement template
+                if new_text != text:
+                    # Earlier literal hits may be gone and new ones may
+                    # appear, so rescan for the remaining rules.
+                    text = new_text
+                    start = pos + 1
+                    break
+            else:
+                return text
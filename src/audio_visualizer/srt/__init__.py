@@ -15,11 +15,21 @@ from typing import Dict, Tuple
 _EXPORTS: Dict[str, Tuple[str, str]] = {
     # Public API
     "transcribe_file": (".srtApi", "transcribe_file"),
+    "begin_transcribe_file": (".srtApi", "begin_transcribe_file"),
+    "prepare_audio": (".srtApi", "prepare_audio"),
+    "PreparedAudio": (".srtApi", "PreparedAudio"),
     "load_model": (".srtApi", "load_model"),
+    "preload_model": (".srtApi", "preload_model"),
     "TranscriptionResult": (".srtApi", "TranscriptionResult"),
     # Model manager
     "ModelManager": (".modelManager", "ModelManager"),
     "ModelInfo": (".modelManager", "ModelInfo"),
+    # Model server
+    "ModelServer": (".modelServer", "ModelServer"),
+    "ModelServerClient": (".modelServer", "ModelServerClient"),
+    "ensure_model_server": (".modelServer", "ensure_model_server"),
+    # Transcript cache
+    "TranscriptCache": (".io.transcriptCache", "TranscriptCache"),
     # Data models
     "FormattingConfig": (".models", "FormattingConfig"),
     "TranscriptionConfig": (".models", "TranscriptionConfig"),
@@ -0,0 +1,626 @@
+"""Accuracy and speed benchmarks for SRT generation over a corpus folder.
+
+A corpus is a folder of media files, each with a reference subtitle file
+of the same stem (``talk.mp3`` + ``talk.srt``).  A benchmark matrix lists
+the settings to compare: models, compute types and configurations (a
+preset plus ``ResolvedConfig`` overrides).  Every combination is run over
+the whole corpus through :func:`audio_visualizer.srt.srtApi.transcribe_file`
+and reported with:
+
+* real-time factor (wall time / audio duration) and per-stage timings;
+* model load time and peak resident memory of the run;
+* word error rate of the subtitle text against the reference;
+* cue timing error: start/end offsets of each reference cue against the
+  generated cue that overlaps it most.
+
+Runs execute in separate worker processes so peak memory is measured per
+run and ``--jobs`` controls how many run at once.  The model name
+``"stub"`` replays the reference cues instead of loading Whisper, which
+exercises the whole pipeline and report offline.
+
+Example:
+    python -m audio_visualizer.srt.benchmarkHarness corpus/ --matrix matrix.json \\
+        --jobs 2 --output results.json
+
+Matrix file::
+
+    {
+        "models": ["tiny", "base"],
+        "compute_types": ["int8", "float32"],
+        "device": "cpu",
+        "language": "en",
+        "configs": [
+            {"name": "yt", "preset": "yt"},
+            {"name": "wide", "overrides": {"formatting": {"max_chars": 48}}}
+        ]
+    }
+"""
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import itertools
+import json
+import logging
+import multiprocessing
+import re
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from audio_visualizer.events import AppEvent, AppEventEmitter, EventType
+from audio_visualizer.srt.config import PRESETS, apply_overrides
+from audio_visualizer.srt.core.intervalIndex import IntervalIndex
+from audio_visualizer.srt.io.systemHelpers import probe_duration_seconds
+from audio_visualizer.srt.io.transcriptCache import CachedSegment, CachedWord
+from audio_visualizer.srt.models import PipelineMode, ResolvedConfig, SubtitleBlock
+
+logger = logging.getLogger(__name__)
+
+MEDIA_EXTENSIONS = (".mp3", ".wav", ".flac", ".m4a", ".ogg", ".aac", ".opus", ".mp4", ".mkv", ".mov", ".webm")
+REFERENCE_EXTENSIONS = (".srt", ".vtt", ".ass")
+STUB_MODEL = "stub"
+
+# Pipeline STAGE messages -> report keys
+_STAGE_KEYS = {
+    "Converting audio": "convert",
+    "Transcribing": "transcribe",
+    "Chunking + formatting": "format",
+    "Writing outputs": "write",
+}
+
+_WORD_RE = re.compile(r"[\w']+")
+
+
+# ============================================================
+# Corpus and matrix
+# ============================================================
+
+@dataclass
+class CorpusItem:
+    """A media file and its reference subtitles."""
+
+    media_path: Path
+    reference_path: Path
+
+    @property
+    def name(self) -> str:
+        return self.media_path.stem
+
+
+def discover_corpus(folder: Path, reference_dir: Optional[Path] = None) -> List[CorpusItem]:
+    """Pair media files in ``folder`` with same-stem reference subtitles.
+
+    Args:
+        folder: Folder containing media files
+        reference_dir: Folder containing the references (defaults to ``folder``)
+
+    Returns:
+        Corpus items sorted by name; media without a reference are skipped
+    """
+    folder = Path(folder)
+    reference_dir = Path(reference_dir) if reference_dir is not None else folder
+    items: List[CorpusItem] = []
+    for media in sorted(folder.iterdir()):
+        if not media.is_file() or media.suffix.lower() not in MEDIA_EXTENSIONS:
+            continue
+        reference = next(
+            (reference_dir / f"{media.stem}{ext}" for ext in REFERENCE_EXTENSIONS
+             if (reference_dir / f"{media.stem}{ext}").is_file()),
+            None,
+        )
+        if reference is None:
+            logger.warning("No reference subtitles for %s; skipping", media.name)
+            continue
+        items.append(CorpusItem(media_path=media, reference_path=reference))
+    return items
+
+
+@dataclass
+class BenchmarkRun:
+    """One combination of settings to run over the corpus.
+
+    Attributes:
+        name: Label used in the report
+        model_name: Whisper model name or path, or ``"stub"``
+        device: "auto", "cpu" or "cuda"
+        compute_type: CTranslate2 compute type (None for the device default)
+        preset: Name of a preset in ``PRESETS`` applied first
+        overrides: ``ResolvedConfig`` overrides applied after the preset
+        mode: Pipeline mode value ("general", "shorts", "transcript")
+        language: Language code passed to the model (None to detect)
+    """
+
+    name: str
+    model_name: str = "tiny"
+    device: str = "cpu"
+    compute_type: Optional[str] = None
+    preset: Optional[str] = None
+    overrides: Dict[str, Any] = field(default_factory=dict)
+    mode: str = PipelineMode.GENERAL.value
+    language: Optional[str] = None
+
+    def resolved_config(self) -> ResolvedConfig:
+        cfg = ResolvedConfig()
+        if self.preset:
+            if self.preset not in PRESETS:
+                raise ValueError(f"Unknown preset: {self.preset}")
+            cfg = apply_overrides(cfg, PRESETS[self.preset])
+        return apply_overrides(cfg, self.overrides)
+
+
+def load_matrix(spec: Dict[str, Any]) -> List[BenchmarkRun]:
+    """Expand a matrix specification into benchmark runs.
+
+    ``models`` x ``compute_types`` x ``configs`` are combined; ``device``,
+    ``language`` and ``mode`` apply to all of them.  Entries in ``runs``
+    are added as-is (``BenchmarkRun`` fields).
+
+    Args:
+        spec: Parsed matrix file
+
+    Returns:
+        Runs in matrix order
+    """
+    runs: List[BenchmarkRun] = []
+    models = spec.get("models") or []
+    if models:
+        compute_types = spec.get("compute_types") or [None]
+        configs = spec.get("configs") or [{"name": "default"}]
+        for config, model, compute_type in itertools.product(configs, models, compute_types):
+            runs.append(BenchmarkRun(
+                name=f"{config.get('name', 'default')}/{model}/{compute_type or 'auto'}",
+                model_name=model,
+                device=spec.get("device", "cpu"),
+                compute_type=compute_type,
+                preset=config.get("preset"),
+                overrides=config.get("overrides", {}),
+                mode=spec.get("mode", PipelineMode.GENERAL.value),
+                language=spec.get("language"),
+            ))
+    for entry in spec.get("runs", []):
+        runs.append(BenchmarkRun(**entry))
+    names = [run.name for run in runs]
+    if len(set(names)) != len(names):
+        raise ValueError("Benchmark run names must be unique")
+    return runs
+
+
+# ============================================================
+# Metrics
+# ============================================================
+
+def normalize_words(text: str) -> List[str]:
+    """Lower-case words with punctuation removed, for WER scoring."""
+    return _WORD_RE.findall(text.lower())
+
+
+def word_edit_distance(reference: Sequence[str], hypothesis: Sequence[str]) -> int:
+    """Levenshtein distance between two word sequences.
+
+    The dynamic programme runs one reference word at a time over a NumPy
+    row: substitutions and deletions are elementwise, and the insertion
+    chain ``row[j] = min(row[j], row[j - 1] + 1)`` is a running minimum of
+    ``row - j``.
+    """
+    if not reference:
+        return len(hypothesis)
+    if not hypothesis:
+        return len(reference)
+    vocab: Dict[str, int] = {}
+    ref = np.array([vocab.setdefault(w, len(vocab)) for w in reference], dtype=np.int64)
+    hyp = np.array([vocab.setdefault(w, len(vocab)) for w in hypothesis], dtype=np.int64)
+    offsets = np.arange(len(hyp) + 1, dtype=np.int64)
+    row = offsets.copy()
+    for i, word in enumerate(ref, start=1):
+        cur = np.empty_like(row)
+        cur[0] = i
+        cur[1:] = np.minimum(row[:-1] + (hyp != word), row[1:] + 1)
+        row = offsets + np.minimum.accumulate(cur - offsets)
+    return int(row[-1])
+
+
+def word_error_rate(reference: str, hypothesis: str) -> Tuple[float, int, int]:
+    """Word error rate of ``hypothesis`` against ``reference``.
+
+    Returns:
+        Tuple of (wer, edits, reference word count); WER is 0.0 for an
+        empty reference and empty hypothesis
+    """
+    ref_words = normalize_words(reference)
+    edits = word_edit_distance(ref_words, normalize_words(hypothesis))
+    if not ref_words:
+        return (0.0 if edits == 0 else 1.0), edits, 0
+    return edits / len(ref_words), edits, len(ref_words)
+
+
+def cue_timing_error(
+    reference: Sequence[SubtitleBlock],
+    hypothesis: Sequence[SubtitleBlock],
+) -> Dict[str, Any]:
+    """Compare cue boundaries of generated subtitles with a reference.
+
+    Each reference cue is matched to the generated cue overlapping it the
+    most; reference cues no generated cue overlaps count as unmatched.
+
+    Returns:
+        Dict with ``matched``, ``reference_cues``, ``generated_cues`` and
+        mean/median absolute start and end errors in milliseconds (None
+        when nothing matched)
+    """
+    index = IntervalIndex((sb.start, sb.end, i) for i, sb in enumerate(hypothesis))
+    start_errors: List[float] = []
+    end_errors: List[float] = []
+    for ref in reference:
+        best = max(
+            index.overlapping(ref.start, ref.end),
+            key=lambda iv: min(iv[1], ref.end) - max(iv[0], ref.start),
+            default=None,
+        )
+        if best is None:
+            continue
+        start_errors.append(abs(best[0] - ref.start) * 1000.0)
+        end_errors.append(abs(best[1] - ref.end) * 1000.0)
+
+    def stat(values: List[float], fn) -> Optional[float]:
+        return round(fn(values), 1) if values else None
+
+    return {
+        "matched": len(start_errors),
+        "reference_cues": len(reference),
+        "generated_cues": len(hypothesis),
+        "mean_start_ms": stat(start_errors, statistics.fmean),
+        "mean_end_ms": stat(end_errors, statistics.fmean),
+        "median_start_ms": stat(start_errors, statistics.median),
+        "median_end_ms": stat(end_errors, statistics.median),
+    }
+
+
+def _blocks_text(blocks: Sequence[SubtitleBlock]) -> str:
+    return " ".join(" ".join(sb.lines) for sb in blocks)
+
+
+# ============================================================
+# Stub transcriber
+# ============================================================
+
+class StubTranscriber:
+    """Stand-in for a Whisper model that replays reference cues.
+
+    Each cue becomes one segment with its words spread evenly over the
+    cue, so the pipeline, writers and metrics run without a model.
+
+    Args:
+        blocks: Reference cues to replay
+    """
+
+    def __init__(self, blocks: Sequence[SubtitleBlock]) -> None:
+        self.blocks = list(blocks)
+
+    def _segments(self) -> Iterator[CachedSegment]:
+        for i, sb in enumerate(self.blocks):
+            tokens = " ".join(sb.lines).split()
+            if not tokens:
+                continue
+            step = (sb.end - sb.start) / len(tokens)
+            words = [
+                CachedWord(
+                    start=sb.start + k * step,
+                    end=sb.start + (k + 1) * step,
+                    word=f" {token}",
+                    probability=1.0,
+                )
+                for k, token in enumerate(tokens)
+            ]
+            yield CachedSegment(
+                id=i,
+                start=sb.start,
+                end=sb.end,
+                text="".join(w.word for w in words),
+                words=words,
+            )
+
+    def transcribe(self, _audio: Any, **kwargs: Any) -> Tuple[Iterator[CachedSegment], Any]:
+        from types import SimpleNamespace
+
+        return self._segments(), SimpleNamespace(language=kwargs.get("language") or "en")
+
+
+# ============================================================
+# Running
+# ============================================================
+
+class _StageTimer:
+    """Collect per-stage durations from pipeline STAGE events."""
+
+    def __init__(self) -> None:
+        self.timings: Dict[str, float] = {}
+        self.transcribe_rtf: Optional[float] = None
+        self._current: Optional[Tuple[str, float]] = None
+
+    def __call__(self, event: AppEvent) -> None:
+        if event.event_type == EventType.STAGE and event.message in _STAGE_KEYS:
+            self.finish()
+            self._current = (_STAGE_KEYS[event.message], time.perf_counter())
+        elif event.event_type == EventType.LOG and event.data and "real_time_factor" in event.data:
+            self.transcribe_rtf = event.data["real_time_factor"]
+
+    def finish(self) -> None:
+        if self._current is not None:
+            key, started = self._current
+            self.timings[key] = round(self.timings.get(key, 0.0) + time.perf_counter() - started, 4)
+            self._current = None
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0), 1)
+
+
+def _media_duration(path: Path) -> Optional[float]:
+    duration = probe_duration_seconds(str(path))
+    if duration is not None:
+        return duration
+    # No ffprobe: decode instead (outside the timed region)
+    from audio_visualizer.srt.io.audioHelpers import decode_audio_16k_mono
+
+    try:
+        return decode_audio_16k_mono(str(path)).duration
+    except Exception:
+        logger.warning("Could not determine the duration of %s", path.name)
+        return None
+
+
+def _run_item(
+    run: BenchmarkRun,
+    item: CorpusItem,
+    cfg: ResolvedConfig,
+    model: Any,
+    device_used: str,
+    compute_type_used: str,
+    output_dir: Path,
+) -> Dict[str, Any]:
+    from audio_visualizer.srt.core.alignment import parse_subtitle_file
+    from audio_visualizer.srt.srtApi import transcribe_file
+
+    reference = parse_subtitle_file(item.reference_path)
+    if model is None:
+        model = StubTranscriber(reference)
+    mode = PipelineMode(run.mode)
+    output_path = output_dir / f"{item.name}.srt"
+    timer = _StageTimer()
+    emitter = AppEventEmitter()
+    emitter.subscribe(timer)
+
+    started = time.perf_counter()
+    result = transcribe_file(
+        input_path=item.media_path,
+        output_path=output_path,
+        fmt="srt",
+        cfg=cfg,
+        model=model,
+        device_used=device_used,
+        compute_type_used=compute_type_used,
+        language=run.language,
+        mode=mode,
+        word_output_path=output_dir / f"{item.name}.words.srt" if mode == PipelineMode.SHORTS else None,
+        emitter=emitter,
+    )
+    elapsed = time.perf_counter() - started
+    timer.finish()
+
+    record: Dict[str, Any] = {"file": item.name, "elapsed_s": round(elapsed, 4)}
+    if not result.success:
+        record["error"] = result.error or "Transcription failed"
+        return record
+
+    duration = _media_duration(item.media_path)
+    wer, edits, ref_words = word_error_rate(_blocks_text(reference), _blocks_text(result.subtitles))
+    record.update(
+        duration_s=round(duration, 3) if duration else None,
+        rtf=round(elapsed / duration, 4) if duration else None,
+        transcribe_rtf=timer.transcribe_rtf,
+        stages=timer.timings,
+        wer=round(wer, 4),
+        word_edits=edits,
+        reference_words=ref_words,
+        cue_timing=cue_timing_error(reference, result.subtitles),
+    )
+    return record
+
+
+def _summarize(files: List[Dict[str, Any]]) -> Dict[str, Any]:
+    ok = [f for f in files if "error" not in f]
+    audio = sum(f["duration_s"] or 0.0 for f in ok)
+    elapsed = sum(f["elapsed_s"] for f in ok)
+    ref_words = sum(f["reference_words"] for f in ok)
+    stages: Dict[str, float] = {}
+    for f in ok:
+        for key, value in f["stages"].items():
+            stages[key] = round(stages.get(key, 0.0) + value, 4)
+
+    def mean_of(key: str) -> Optional[float]:
+        values = [f["cue_timing"][key] for f in ok if f["cue_timing"][key] is not None]
+        return round(statistics.fmean(values), 1) if values else None
+
+    return {
+        "files": len(files),
+        "failed": len(files) - len(ok),
+        "audio_s": round(audio, 3),
+        "elapsed_s": round(elapsed, 4),
+        "rtf": round(elapsed / audio, 4) if audio else None,
+        "stages": stages,
+        # Corpus WER weights files by their reference length
+        "wer": round(sum(f["word_edits"] for f in ok) / ref_words, 4) if ref_words else None,
+        "mean_start_ms": mean_of("mean_start_ms"),
+        "mean_end_ms": mean_of("mean_end_ms"),
+    }
+
+
+def run_benchmark(run: BenchmarkRun, items: Sequence[CorpusItem], output_dir: Path) -> Dict[str, Any]:
+    """Run one benchmark configuration over the corpus.
+
+    Args:
+        run: Settings to benchmark
+        items: Corpus to transcribe
+        output_dir: Folder for the generated subtitles
+
+    Returns:
+        Report with the run settings, ``model_load_s``, ``peak_rss_mb``,
+        a corpus ``summary`` and per-file results (or ``error``)
+    """
+    report: Dict[str, Any] = {"run": asdict(run)}
+    try:
+        cfg = run.resolved_config()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+        if run.model_name == STUB_MODEL:
+            model, device_used, compute_type_used = None, "cpu", "stub"
+        else:
+            from audio_visualizer.srt.srtApi import load_model
+
+            model, device_used, compute_type_used = load_model(
+                run.model_name, run.device, strict_cuda=False, compute_type=run.compute_type,
+            )
+        report["model_load_s"] = round(time.perf_counter() - started, 4)
+        report["device_used"] = device_used
+        report["compute_type_used"] = compute_type_used
+        files = [
+            _run_item(run, item, cfg, model, device_used, compute_type_used, output_dir)
+            for item in items
+        ]
+    except Exception as exc:
+        logger.exception("Benchmark run %s failed", run.name)
+        report["error"] = str(exc)
+        report["peak_rss_mb"] = _peak_rss_mb()
+        return report
+    report["peak_rss_mb"] = _peak_rss_mb()
+    report["summary"] = _summarize(files)
+    report["files"] = files
+    return report
+
+
+def _run_slug(name: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", name).strip("_") or "run"
+
+
+def run_matrix(
+    runs: Sequence[BenchmarkRun],
+    items: Sequence[CorpusItem],
+    output_dir: Path,
+    *,
+    jobs: int = 1,
+    isolate: bool = True,
+) -> List[Dict[str, Any]]:
+    """Run every benchmark over the corpus.
+
+    Args:
+        runs: Benchmark runs
+        items: Corpus to transcribe
+        output_dir: Each run writes its subtitles to a subfolder here
+        jobs: Number of runs executed at once
+        isolate: Run each benchmark in a fresh process so peak RSS and
+            model memory are per run.  Without it runs execute in this
+            process, one after another, and peak RSS is cumulative.
+
+    Returns:
+        Reports in the order of ``runs``
+    """
+    dirs = [Path(output_dir) / _run_slug(run.name) for run in runs]
+    if not isolate:
+        return [run_benchmark(run, items, d) for run, d in zip(runs, dirs)]
+    # Spawned single-task workers start from a clean interpreter, so
+    # ru_maxrss reflects only the run they executed
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max(1, jobs),
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=1,
+    ) as pool:
+        futures = [pool.submit(run_benchmark, run, list(items), d) for run, d in zip(runs, dirs)]
+        return [f.result() for f in futures]
+
+
+def format_summary(reports: Sequence[Dict[str, Any]]) -> str:
+    """Render benchmark reports as a plain-text table."""
+
+    def cell(value: Any, spec: str) -> str:
+        return "-" if value is None else format(value, spec)
+
+    header = f"{'run':<32} {'files':>5} {'RTF':>7} {'load s':>7} {'RSS MB':>8} {'WER %':>6} {'start ms':>9} {'end ms':>8}"
+    lines = [header, "-" * len(header)]
+    for report in reports:
+        name = report["run"]["name"]
+        if "error" in report:
+            lines.append(f"{name:<32} error: {report['error']}")
+            continue
+        s = report["summary"]
+        wer = s["wer"] * 100.0 if s["wer"] is not None else None
+        lines.append(
+            f"{name:<32} {s['files'] - s['failed']:>2}/{s['files']:<2} {cell(s['rtf'], '7.3f')} "
+            f"{cell(report['model_load_s'], '7.2f')} {cell(report['peak_rss_mb'], '8.1f')} "
+            f"{cell(wer, '6.1f')} {cell(s['mean_start_ms'], '9.1f')} {cell(s['mean_end_ms'], '8.1f')}"
+        )
+    return "\n".join(lines)
+
+
+# ============================================================
+# Command line
+# ============================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SRT generation over a corpus of media + reference subtitles.")
+    parser.add_argument("corpus", type=Path, help="Folder of media files with same-stem reference subtitles")
+    parser.add_argument("--references", type=Path, default=None, help="Folder of reference subtitles (default: corpus)")
+    parser.add_argument("--matrix", type=Path, default=None, help="JSON matrix of models, compute types and configs")
+    parser.add_argument("--model", default="tiny", help=f"Model when no matrix is given ('{STUB_MODEL}' for offline runs)")
+    parser.add_argument("--compute-type", default=None)
+    parser.add_argument("--device", default="cpu", choices=["auto", "cpu", "cuda"])
+    parser.add_argument("--preset", default=None, choices=sorted(PRESETS))
+    parser.add_argument("--language", default=None)
+    parser.add_argument("--jobs", type=int, default=1, help="Runs executed at once")
+    parser.add_argument("--in-process", action="store_true", help="Run sequentially in this process")
+    parser.add_argument("--work-dir", type=Path, default=None, help="Keep generated subtitles here")
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON report here")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+    items = discover_corpus(args.corpus, args.references)
+    if not items:
+        logger.error("No media files with reference subtitles found in %s", args.corpus)
+        return 1
+    if args.matrix is not None:
+        runs = load_matrix(json.loads(args.matrix.read_text(encoding="utf-8")))
+    else:
+        runs = [BenchmarkRun(
+            name=f"{args.preset or 'default'}/{args.model}/{args.compute_type or 'auto'}",
+            model_name=args.model,
+            device=args.device,
+            compute_type=args.compute_type,
+            preset=args.preset,
+            language=args.language,
+        )]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = args.work_dir or Path(tmp)
+        reports = run_matrix(runs, items, work_dir, jobs=args.jobs, isolate=not args.in_process)
+
+    payload = {"corpus": str(args.corpus), "items": [item.name for item in items], "runs": reports}
+    if args.output is not None:
+        args.output.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(format_summary(reports))
+    return 0 if all("error" not in r for r in reports) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,11 +2,13 @@
 """Alignment utilities for corrected SRT workflows and bundle-from-SRT."""
 from __future__ import annotations
 
+import bisect
 import difflib
 import re
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 from audio_visualizer.srt.models import SubtitleBlock, WordItem
 from audio_visualizer.srt.core.textProcessing import normalize_spaces
@@ -178,14 +180,143 @@ def _tokenize_cue(text: str) -> List[str]:
     return text.split()
 
 
-def _match_ratio(cue_norm: List[str], whisper_norm: List[str]) -> float:
-    """Compute sequence match ratio between two normalized word lists."""
-    if not cue_norm and not whisper_norm:
-        return 1.0
-    if not cue_norm or not whisper_norm:
-        return 0.0
-    matcher = difflib.SequenceMatcher(None, cue_norm, whisper_norm)
-    return matcher.ratio()
+# Minimum half-width of the dynamic-programming band between anchors
+_MIN_BAND = 8
+
+
+def _unique_anchors(
+    a: Sequence[str], a0: int, a1: int, b: Sequence[str], b0: int, b1: int
+) -> List[Tuple[int, int]]:
+    """Return monotonic (i, j) pairs of words that occur exactly once in both ranges.
+
+    Candidates are found by hashing; the longest chain that is increasing in
+    both sequences (patience sorting) is kept so anchors never cross.
+    """
+    counts_a = Counter(a[a0:a1])
+    counts_b = Counter(b[b0:b1])
+    position_b = {b[j]: j for j in range(b0, b1) if counts_b[b[j]] == 1}
+    candidates = [
+        (i, position_b[a[i]])
+        for i in range(a0, a1)
+        if counts_a[a[i]] == 1 and a[i] in position_b
+    ]
+    if not candidates:
+        return []
+
+    # Longest increasing subsequence over j (candidates are ordered by i)
+    tails: List[int] = []
+    tail_index: List[int] = []
+    previous: List[int] = [-1] * len(candidates)
+    for k, (_i, j) in enumerate(candidates):
+        pos = bisect.bisect_left(tails, j)
+        if pos:
+            previous[k] = tail_index[pos - 1]
+        if pos == len(tails):
+            tails.append(j)
+            tail_index.append(k)
+        else:
+            tails[pos] = j
+            tail_index[pos] = k
+    chain: List[Tuple[int, int]] = []
+    k = tail_index[-1]
+    while k >= 0:
+        chain.append(candidates[k])
+        k = previous[k]
+    chain.reverse()
+    return chain
+
+
+def _banded_alignment(
+    a: Sequence[str], a0: int, a1: int, b: Sequence[str], b0: int, b1: int
+) -> List[Tuple[int, int]]:
+    """Pair words of ``a[a0:a1]`` with ``b[b0:b1]`` by banded edit distance.
+
+    Returns the (i, j) pairs of matched and substituted words. The band
+    follows the diagonal of the gap and is wide enough for a path to exist,
+    so the cost is proportional to the longer side times the band width.
+    """
+    n, m = a1 - a0, b1 - b0
+    if n == 0 or m == 0:
+        return []
+    band = _MIN_BAND + -(-max(n, m) // min(n, m))
+    inf = n + m + 1
+
+    # Row 0: only insertions from b
+    lo_prev, hi_prev = 0, min(m, band)
+    prev = list(range(lo_prev, hi_prev + 1))
+    moves: List[Tuple[int, bytearray]] = [(0, bytearray([2]) * (hi_prev + 1))]
+
+    for i in range(1, n + 1):
+        center = i * m // n
+        lo, hi = max(0, center - band), min(m, center + band)
+        row = [inf] * (hi - lo + 1)
+        row_moves = bytearray(hi - lo + 1)
+        word = a[a0 + i - 1]
+        for j in range(lo, hi + 1):
+            best, move = inf, 0
+            if j > 0 and lo_prev <= j - 1 <= hi_prev:
+                best = prev[j - 1 - lo_prev] + (word != b[b0 + j - 1])
+            if lo_prev <= j <= hi_prev and prev[j - lo_prev] + 1 < best:
+                best, move = prev[j - lo_prev] + 1, 1
+            if j > lo and row[j - 1 - lo] + 1 < best:
+                best, move = row[j - 1 - lo] + 1, 2
+            row[j - lo] = best
+            row_moves[j - lo] = move
+        moves.append((lo, row_moves))
+        prev, lo_prev, hi_prev = row, lo, hi
+
+    pairs: List[Tuple[int, int]] = []
+    i, j = n, m
+    while i > 0 and j > 0:
+        lo, row_moves = moves[i]
+        move = row_moves[j - lo]
+        if move == 0:
+            pairs.append((a0 + i - 1, b0 + j - 1))
+            i -= 1
+            j -= 1
+        elif move == 1:
+            i -= 1
+        else:
+            j -= 1
+    pairs.reverse()
+    return pairs
+
+
+def _align_word_sequences(a: Sequence[str], b: Sequence[str]) -> List[Optional[int]]:
+    """Map each word of *a* to the index of its aligned word in *b* (or None).
+
+    Exact-match anchors (unique words, then common prefixes and suffixes)
+    split the problem recursively; gaps without anchors fall back to banded
+    edit-distance alignment, which also pairs substituted words. Runtime is
+    near-linear for transcripts that mostly agree.
+    """
+    mapping: List[Optional[int]] = [None] * len(a)
+    stack = [(0, len(a), 0, len(b))]
+    while stack:
+        a0, a1, b0, b1 = stack.pop()
+        while a0 < a1 and b0 < b1 and a[a0] == b[b0]:
+            mapping[a0] = b0
+            a0 += 1
+            b0 += 1
+        while a0 < a1 and b0 < b1 and a[a1 - 1] == b[b1 - 1]:
+            a1 -= 1
+            b1 -= 1
+            mapping[a1] = b1
+        if a0 == a1 or b0 == b1:
+            continue
+
+        anchors = _unique_anchors(a, a0, a1, b, b0, b1)
+        if not anchors:
+            for i, j in _banded_alignment(a, a0, a1, b, b0, b1):
+                mapping[i] = j
+            continue
+        prev_a, prev_b = a0, b0
+        for i, j in anchors:
+            mapping[i] = j
+            stack.append((prev_a, i, prev_b, j))
+            prev_a, prev_b = i + 1, j + 1
+        stack.append((prev_a, a1, prev_b, b1))
+    return mapping
 
 
 def align_cues_to_whisper_words(
@@ -194,9 +325,10 @@ def align_cues_to_whisper_words(
 ) -> List[AlignedCue]:
     """Align existing subtitle cues to Whisper-produced word-level timing.
 
-    For each cue, finds the best-matching span of Whisper words based on
-    normalized text comparison.  Preserves the original cue text exactly
-    while attaching timing from the Whisper words.
+    The words of all cues are aligned to the Whisper words in one pass
+    (see :func:`_align_word_sequences`), then each cue takes the timing of
+    its aligned words. Preserves the original cue text exactly while
+    attaching timing from the Whisper words.
 
     Handles punctuation and casing differences by normalizing before
     comparison but keeping original text in the output.
@@ -220,20 +352,34 @@ def align_cues_to_whisper_words(
             for cue in cues
         ]
 
-    # Pre-normalize all whisper words
-    w_norm = [_normalize_word(w.text) for w in whisper_words]
-
-    results: List[AlignedCue] = []
-    cursor = 0  # sliding window start position in whisper_words
+    # Whisper words with a non-empty normalization take part in matching
+    w_norm_all = [_normalize_word(w.text) for w in whisper_words]
+    w_index = [i for i, n in enumerate(w_norm_all) if n]
+    w_norm = [w_norm_all[i] for i in w_index]
 
+    # Flatten the normalized words of every cue into one sequence
+    cue_texts: List[str] = []
+    cue_tokens_list: List[List[str]] = []
+    cue_positions: List[List[Tuple[int, int]]] = []
+    flat: List[str] = []
     for cue in cues:
         cue_text = normalize_spaces(" ".join(cue.lines))
         cue_tokens = _tokenize_cue(cue_text)
-        cue_norm = [_normalize_word(t) for t in cue_tokens]
-        # Filter empty normalizations
-        cue_norm_filtered = [n for n in cue_norm if n]
+        positions: List[Tuple[int, int]] = []
+        for k, token in enumerate(cue_tokens):
+            norm = _normalize_word(token)
+            if norm:
+                positions.append((k, len(flat)))
+                flat.append(norm)
+        cue_texts.append(cue_text)
+        cue_tokens_list.append(cue_tokens)
+        cue_positions.append(positions)
+
+    mapping = _align_word_sequences(flat, w_norm)
 
-        if not cue_norm_filtered:
+    results: List[AlignedCue] = []
+    for cue, cue_text, cue_tokens, positions in zip(cues, cue_texts, cue_tokens_list, cue_positions):
+        if not positions:
             # Empty or all-punctuation cue: no alignment possible
             results.append(AlignedCue(
                 cue_text=cue_text,
@@ -244,49 +390,36 @@ def align_cues_to_whisper_words(
             ))
             continue
 
-        # Find best matching span using time-bounded search
-        best_score = 0.0
-        best_start = cursor
-        best_end = cursor
-        span_len = len(cue_norm_filtered)
-
-        # Search in a window around the cursor position
-        search_start = max(0, cursor - span_len)
-        search_end = min(len(whisper_words), cursor + span_len * 4 + 10)
-
-        for i in range(search_start, search_end):
-            # Try spans of varying length around the cue word count
-            for extra in range(max(1, span_len - 1), span_len + 3):
-                j = min(i + extra, len(whisper_words))
-                if j <= i:
-                    continue
-                candidate_norm = [n for n in w_norm[i:j] if n]
-                score = _match_ratio(cue_norm_filtered, candidate_norm)
-
-                # Bonus for time overlap with the cue
-                if j <= len(whisper_words) and i < len(whisper_words):
-                    w_start = whisper_words[i].start
-                    w_end = whisper_words[j - 1].end
-                    overlap_start = max(cue.start, w_start)
-                    overlap_end = min(cue.end, w_end)
-                    cue_dur = max(0.001, cue.end - cue.start)
-                    if overlap_end > overlap_start:
-                        time_bonus = min(0.15, 0.15 * (overlap_end - overlap_start) / cue_dur)
-                        score += time_bonus
-
-                if score > best_score:
-                    best_score = score
-                    best_start = i
-                    best_end = j
-
-        # Build aligned words using the best span
-        matched_whisper = whisper_words[best_start:best_end]
-        aligned_words = _align_cue_words_to_whisper_span(
-            cue_tokens, matched_whisper, cue.start, cue.end
-        )
+        assigned: List[Optional[WordItem]] = [None] * len(cue_tokens)
+        matched = 0
+        first = last = None
+        for k, p in positions:
+            j = mapping[p]
+            if j is None:
+                continue
+            word = whisper_words[w_index[j]]
+            assigned[k] = WordItem(start=word.start, end=word.end, text=cue_tokens[k])
+            matched += flat[p] == w_norm[j]
+            first = j if first is None else first
+            last = j
+
+        if first is None:
+            aligned_words = _align_cue_words_to_whisper_span(cue_tokens, [], cue.start, cue.end)
+            score = 0.0
+        else:
+            aligned_words = _fill_word_gaps(assigned, cue_tokens, cue.start, cue.end)
+            # Same measure as difflib's ratio over the cue and its Whisper span
+            score = 2.0 * matched / (len(positions) + last - first + 1)
+            w_start = whisper_words[w_index[first]].start
+            w_end = whisper_words[w_index[last]].end
+            overlap_start = max(cue.start, w_start)
+            overlap_end = min(cue.end, w_end)
+            cue_dur = max(0.001, cue.end - cue.start)
+            if overlap_end > overlap_start:
+                score += min(0.15, 0.15 * (overlap_end - overlap_start) / cue_dur)
 
         # Determine alignment quality
-        text_score = best_score - 0.15  # remove possible time bonus
+        text_score = score - 0.15  # remove possible time bonus
         text_score = max(0.0, min(1.0, text_score))
 
         if text_score >= 0.85:
@@ -308,10 +441,6 @@ def align_cues_to_whisper_words(
             alignment_confidence=round(confidence, 3),
         ))
 
-        # Advance cursor past matched words
-        if best_end > cursor:
-            cursor = best_end
-
     return results
 
 
@@ -373,7 +502,16 @@ def _align_cue_words_to_whisper_span(
                     text=cue_tokens[ci],
                 )
 
-    # Second pass: fill gaps with distributed timing
+    return _fill_word_gaps(result, cue_tokens, cue_start, cue_end)
+
+
+def _fill_word_gaps(
+    result: List[Optional[WordItem]],
+    cue_tokens: List[str],
+    cue_start: float,
+    cue_end: float,
+) -> List[WordItem]:
+    """Give unassigned cue words timing distributed between their neighbours."""
     for i in range(len(result)):
         if result[i] is not None:
             continue
@@ -0,0 +1,163 @@
+"""Staged execution for multi-file transcription batches.
+
+Processing files strictly one after another leaves the model idle while
+the next input is decoded and the decoder idle during inference. The
+runner here overlaps three stages across consecutive files:
+
+1. **prefetch** -- decode and analyse upcoming inputs on a thread pool
+2. **infer** -- run the model on the calling thread, in job order, taking
+   inputs from a bounded window of prefetched items
+3. **finish** -- post-process and write outputs on a dedicated thread
+
+Stages use threads rather than processes: PyAV decoding and the NumPy
+analysis release the GIL, and decoded arrays (hundreds of MB for long
+recordings) would otherwise have to be pickled between processes. The
+model stays on the calling thread so GPU handles remain thread-local.
+
+Every job is isolated: an exception in any stage becomes that job's
+result via ``on_error`` and the batch continues. Cancellation is checked
+before each inference; jobs already transcribed are still finished.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+J = TypeVar("J")
+P = TypeVar("P")
+R = TypeVar("R")
+
+# Prefetched inputs held ahead of the model (bounds decoded-audio memory)
+DEFAULT_MAX_PREFETCHED = 2
+
+# Threads decoding upcoming inputs
+DEFAULT_PREFETCH_WORKERS = 2
+
+# How often blocked stages re-check the cancel flag (seconds)
+_CANCEL_POLL_SECONDS = 0.2
+
+
+@dataclass
+class BatchOutcome(Generic[R]):
+    """Results of a staged batch run.
+
+    Attributes:
+        results: Results of the jobs that ran, in job order
+        canceled: True if the batch stopped early because of cancellation
+    """
+    results: List[R] = field(default_factory=list)
+    canceled: bool = False
+
+    @property
+    def completed(self) -> int:
+        return len(self.results)
+
+
+def _constant(value: R) -> Callable[[], R]:
+    return lambda: value
+
+
+def run_staged_batch(
+    jobs: Sequence[J],
+    *,
+    prefetch: Callable[[J], P],
+    infer: Callable[[int, J, P], Callable[[], R]],
+    on_error: Callable[[J, BaseException], R],
+    cancel_event: Optional[threading.Event] = None,
+    on_finished: Optional[Callable[[int, R], None]] = None,
+    prefetch_workers: int = DEFAULT_PREFETCH_WORKERS,
+    max_prefetched: int = DEFAULT_MAX_PREFETCHED,
+) -> BatchOutcome[R]:
+    """Run ``jobs`` through overlapped prefetch, inference and finish stages.
+
+    Args:
+        jobs: Jobs in processing order
+        prefetch: Prepares one job's input (runs on the prefetch pool)
+        infer: Runs the model for job ``index`` on the calling thread and
+            returns a callable that finishes it (runs on the finish thread)
+        on_error: Turns a stage exception into the job's result
+        cancel_event: Stops the batch before the next inference when set
+        on_finished: Called on the finish thread with (index, result), in job order
+        prefetch_workers: Threads decoding upcoming inputs
+        max_prefetched: Jobs prefetched ahead of inference, and finish
+            steps allowed to queue behind it
+
+    Returns:
+        BatchOutcome with the results of the jobs that ran
+    """
+    cancel_event = cancel_event or threading.Event()
+    max_prefetched = max(1, max_prefetched)
+    outcome: BatchOutcome[R] = BatchOutcome()
+    if not jobs:
+        return outcome
+
+    def finish_job(index: int, job: J, finish: Callable[[], R]) -> R:
+        try:
+            result = finish()
+        except Exception as exc:
+            logger.exception("Finishing batch job %d failed", index + 1)
+            result = on_error(job, exc)
+        if on_finished is not None:
+            on_finished(index, result)
+        return result
+
+    prefetch_pool = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(1, prefetch_workers), thread_name_prefix="srt-prefetch"
+    )
+    finish_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="srt-finish")
+    prefetched: Deque[Tuple[int, concurrent.futures.Future]] = deque()
+    finishing: Deque[concurrent.futures.Future] = deque()
+    finished: List[concurrent.futures.Future] = []
+    next_prefetch = 0
+
+    def fill_prefetch_window() -> None:
+        nonlocal next_prefetch
+        while next_prefetch < len(jobs) and len(prefetched) < max_prefetched:
+            prefetched.append((next_prefetch, prefetch_pool.submit(prefetch, jobs[next_prefetch])))
+            next_prefetch += 1
+
+    def wait_cancelable(future: concurrent.futures.Future) -> bool:
+        """Block until ``future`` is done; return False if canceled first."""
+        while not future.done():
+            if cancel_event.wait(timeout=_CANCEL_POLL_SECONDS):
+                return False
+        return True
+
+    try:
+        fill_prefetch_window()
+        while prefetched:
+            if cancel_event.is_set():
+                outcome.canceled = True
+                break
+
+            index, future = prefetched.popleft()
+            if not wait_cancelable(future):
+                outcome.canceled = True
+                break
+            fill_prefetch_window()
+            job = jobs[index]
+
+            try:
+                finish = infer(index, job, future.result())
+            except Exception as exc:
+                logger.exception("Batch job %d failed before post-processing", index + 1)
+                finish = _constant(on_error(job, exc))
+
+            # Backpressure: do not let finish steps pile up behind inference
+            while len(finishing) >= max_prefetched:
+                finishing.popleft().result()
+            submitted = finish_pool.submit(finish_job, index, job, finish)
+            finishing.append(submitted)
+            finished.append(submitted)
+    finally:
+        prefetch_pool.shutdown(wait=True, cancel_futures=True)
+        finish_pool.shutdown(wait=True)
+
+    outcome.results = [future.result() for future in finished]
+    return outcome
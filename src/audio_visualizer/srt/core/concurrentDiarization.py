@@ -0,0 +1,240 @@
+"""Speaker diarization running alongside transcription.
+
+Diarization and Whisper both only need the decoded audio, so the pipeline
+starts pyannote in a separate worker process as soon as the audio is ready
+and joins its speaker turns after transcription, instead of running the two
+heavy stages back to back.
+
+* The decoded samples are handed over as a ``.npy`` file in a temporary
+  directory rather than pickled through a pipe; the worker loads the
+  pyannote pipeline itself and sends back only the speaker turns.
+* The worker is a ``spawn`` process, so CUDA and torch state never leak
+  between the two stages.
+* :func:`concurrent_diarization_fits` compares an estimate of the worker's
+  peak memory with a budget (by default the memory currently available),
+  so machines that cannot hold both stages fall back to diarizing after
+  transcription.
+* Cancellation is shared: :meth:`DiarizationJob.cancel` terminates the
+  worker, and a failed diarization is visible through
+  :attr:`DiarizationJob.failed` so transcription can stop early.
+"""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from audio_visualizer.srt.core.diarization import load_diarization_pipeline, run_diarization
+from audio_visualizer.srt.io.audioHelpers import DecodedAudio
+
+logger = logging.getLogger(__name__)
+
+# Resident memory of a loaded pyannote pipeline (torch + models), in MB
+DIARIZATION_BASE_MEMORY_MB = 1200.0
+
+# Worker memory per MB of decoded float32 samples (waveform, tensor and
+# pyannote's sliding-window features)
+DIARIZATION_MEMORY_PER_AUDIO_MB = 4.0
+
+# How often waits re-check the cancel flag (seconds)
+_POLL_SECONDS = 0.2
+
+Turns = List[Tuple[float, float, str]]
+
+
+def estimate_diarization_memory_mb(audio: DecodedAudio) -> float:
+    """Estimate the peak memory of a diarization worker for ``audio``."""
+    audio_mb = audio.samples.nbytes / (1024 * 1024)
+    return DIARIZATION_BASE_MEMORY_MB + DIARIZATION_MEMORY_PER_AUDIO_MB * audio_mb
+
+
+def available_memory_mb() -> Optional[float]:
+    """Return the memory available to new processes in MB, if known."""
+    try:
+        with open("/proc/meminfo", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        pages = os.sysconf("SC_AVPHYS_PAGES")
+        page_size = os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+    return pages * page_size / (1024 * 1024)
+
+
+def concurrent_diarization_fits(
+    audio: DecodedAudio,
+    memory_budget_mb: Optional[float] = None,
+) -> Tuple[bool, float, Optional[float]]:
+    """Check whether a diarization worker fits next to transcription.
+
+    Args:
+        audio: Decoded audio to diarize
+        memory_budget_mb: Memory the worker may use; ``None`` uses the
+            memory currently available, ``0`` disables concurrency
+
+    Returns:
+        (fits, estimated_mb, budget_mb); ``budget_mb`` is None when the
+        available memory cannot be determined, which counts as fitting.
+    """
+    estimate = estimate_diarization_memory_mb(audio)
+    budget = available_memory_mb() if memory_budget_mb is None else memory_budget_mb
+    if budget is None:
+        return True, estimate, None
+    return estimate <= budget, estimate, budget
+
+
+def _diarization_worker(samples_path: str, sample_rate: int, hf_token: str, conn: Any) -> None:
+    """Worker entry point: diarize the samples in ``samples_path``."""
+    import numpy as np
+
+    try:
+        samples = np.load(samples_path)
+        pipeline = load_diarization_pipeline(hf_token)
+        turns = run_diarization(pipeline, DecodedAudio(samples, sample_rate).to_pyannote_input())
+        conn.send(("ok", turns))
+    except BaseException as exc:  # noqa: BLE001 - reported to the parent
+        conn.send(("error", f"{type(exc).__name__}: {exc}"))
+    finally:
+        conn.close()
+
+
+class DiarizationJob:
+    """Diarization of one decoded file, running in the background.
+
+    Args:
+        audio: Decoded audio to diarize
+        hf_token: Hugging Face token for the pyannote pipeline
+        use_process: Run in a spawned worker process (default); threads
+            are used instead when False
+        tmpdir: Directory for the handed-over samples file
+    """
+
+    def __init__(
+        self,
+        audio: DecodedAudio,
+        hf_token: str,
+        *,
+        use_process: bool = True,
+        tmpdir: Optional[Path] = None,
+    ) -> None:
+        self.started = time.time()
+        self.finished: Optional[float] = None
+        self.uses_process = use_process
+        self._turns: Optional[Turns] = None
+        self._error: Optional[str] = None
+        self._done = threading.Event()
+        self._canceled = False
+        self._process = None
+        self._conn = None
+        self._workdir: Optional[str] = None
+
+        if self.uses_process:
+            import numpy as np
+
+            self._workdir = tempfile.mkdtemp(prefix="av_diarize_", dir=str(tmpdir) if tmpdir else None)
+            samples_path = os.path.join(self._workdir, "samples.npy")
+            np.save(samples_path, audio.samples)
+            ctx = multiprocessing.get_context("spawn")
+            self._conn, child_conn = ctx.Pipe(duplex=False)
+            self._process = ctx.Process(
+                target=_diarization_worker,
+                args=(samples_path, audio.sample_rate, hf_token, child_conn),
+                name="diarization",
+                daemon=True,
+            )
+            self._process.start()
+            child_conn.close()
+            threading.Thread(target=self._collect, name="diarization-join", daemon=True).start()
+        else:
+            threading.Thread(
+                target=self._run_inline, args=(audio, hf_token), name="diarization", daemon=True
+            ).start()
+
+    @property
+    def done(self) -> bool:
+        """True once the speaker turns or an error are available."""
+        return self._done.is_set()
+
+    @property
+    def failed(self) -> Optional[str]:
+        """The error message if diarization finished with an error."""
+        return self._error if self._done.is_set() else None
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        """Wall time of the diarization, once finished."""
+        return None if self.finished is None else self.finished - self.started
+
+    def _finish(self, turns: Optional[Turns], error: Optional[str]) -> None:
+        self._turns, self._error = turns, error
+        self.finished = time.time()
+        self._done.set()
+
+    def _run_inline(self, audio: DecodedAudio, hf_token: str) -> None:
+        try:
+            pipeline = load_diarization_pipeline(hf_token)
+            turns = run_diarization(pipeline, audio.to_pyannote_input())
+        except Exception as exc:
+            self._finish(None, f"{type(exc).__name__}: {exc}")
+        else:
+            self._finish(turns, None)
+
+    def _collect(self) -> None:
+        try:
+            status, payload = self._conn.recv()
+        except (EOFError, OSError):
+            code = self._process.exitcode if self._process is not None else None
+            status, payload = "error", f"diarization worker exited unexpectedly (exit code {code})"
+        finally:
+            self._cleanup()
+        if status == "ok":
+            self._finish(payload, None)
+        else:
+            self._finish(None, "canceled" if self._canceled else payload)
+
+    def _cleanup(self) -> None:
+        if self._process is not None:
+            self._process.join(timeout=5)
+        if self._conn is not None:
+            self._conn.close()
+        if self._workdir is not None:
+            shutil.rmtree(self._workdir, ignore_errors=True)
+            self._workdir = None
+
+    def cancel(self) -> None:
+        """Stop the worker; ``result`` then returns None."""
+        self._canceled = True
+        if self._process is not None and self._process.is_alive():
+            self._process.terminate()
+
+    def result(self, cancel_event: Optional[threading.Event] = None) -> Optional[Turns]:
+        """Wait for the speaker turns.
+
+        Args:
+            cancel_event: Cancels the job and returns None when set
+
+        Returns:
+            Speaker turns, or None if canceled.
+
+        Raises:
+            RuntimeError: If diarization failed.
+        """
+        while not self._done.wait(timeout=_POLL_SECONDS):
+            if cancel_event is not None and cancel_event.is_set():
+                self.cancel()
+                return None
+        if self._canceled:
+            return None
+        if self._error is not None:
+            raise RuntimeError(f"Speaker diarization failed: {self._error}")
+        return self._turns
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any, List, Tuple
 
+from audio_visualizer.srt.core.intervalIndex import as_interval_index
+
 
 def is_diarization_available() -> bool:
     """Return True if pyannote.audio is installed."""
@@ -24,9 +26,13 @@ def load_diarization_pipeline(hf_token: str) -> Any:
     return Pipeline.from_pretrained("pyannote/speaker-diarization-3.1", use_auth_token=hf_token)
 
 
-def run_diarization(pipeline: Any, audio_path: str) -> List[Tuple[float, float, str]]:
-    """Run diarization and return (start, end, speaker_label) tuples."""
-    diarization = pipeline(audio_path)
+def run_diarization(pipeline: Any, audio: Any) -> List[Tuple[float, float, str]]:
+    """Run diarization and return (start, end, speaker_label) tuples.
+
+    ``audio`` is a file path or an in-memory ``{"waveform", "sample_rate"}``
+    mapping (see ``DecodedAudio.to_pyannote_input``).
+    """
+    diarization = pipeline(audio)
     results: List[Tuple[float, float, str]] = []
     for segment, _, label in diarization.itertracks(yield_label=True):
         results.append((float(segment.start), float(segment.end), str(label)))
@@ -50,6 +56,7 @@ def assign_speakers(
     diarization: List[Tuple[float, float, str]],
 ) -> List[Any]:
     """Assign speakers to segments based on maximum overlap."""
+    turns = as_interval_index(diarization)
     updated: List[Any] = []
     for seg in segments:
         s_start = float(getattr(seg, "start", 0.0))
@@ -57,7 +64,7 @@ def assign_speakers(
         best_label = None
         best_overlap = 0.0
 
-        for d_start, d_end, label in diarization:
+        for d_start, d_end, label in turns.overlapping(s_start, s_end):
             overlap = max(0.0, min(s_end, d_end) - max(s_start, d_start))
             if overlap > best_overlap:
                 best_overlap = overlap
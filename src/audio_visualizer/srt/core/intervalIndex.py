@@ -0,0 +1,142 @@
+"""Sorted interval index for timing lookups.
+
+Silence detection, diarization and subtitle editing all ask the same
+questions of a list of ``(start, end, ...)`` intervals: which interval
+lies inside a gap, which one contains a time, which ones overlap a span,
+and which edge is nearest to a time. Scanning the whole list for every
+subtitle or word is quadratic on long recordings; ``IntervalIndex`` sorts
+the intervals once and answers each query with a binary search.
+
+Queries return the same interval a front-to-back scan of the sorted list
+would, so results match the linear scans they replace whenever the input
+is sorted by start time (as the silence detectors and ``run_diarization``
+return it). Intervals are expected to satisfy ``start <= end``.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+class IntervalIndex:
+    """Immutable index over ``(start, end, ...)`` tuples.
+
+    Extra tuple fields (e.g. a speaker label) are carried through and
+    returned with the interval.
+    """
+
+    __slots__ = ("_items", "_starts", "_ends", "_max_ends", "_edges")
+
+    def __init__(self, intervals: Iterable[Sequence[Any]]):
+        items = sorted((tuple(iv) for iv in intervals), key=lambda iv: iv[0])
+        self._items: List[Tuple[Any, ...]] = items
+        self._starts: List[float] = [iv[0] for iv in items]
+        self._ends: List[float] = [iv[1] for iv in items]
+        # Running maximum of the ends lets queries skip every interval that
+        # finishes before a time, even when intervals overlap.
+        max_ends: List[float] = []
+        running = float("-inf")
+        for end in self._ends:
+            running = max(running, end)
+            max_ends.append(running)
+        self._max_ends = max_ends
+        self._edges: Optional[List[float]] = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        return iter(self._items)
+
+    def __getitem__(self, position: int) -> Tuple[Any, ...]:
+        return self._items[position]
+
+    def first_within(self, start: float, end: float) -> Optional[Tuple[Any, ...]]:
+        """Return the first interval lying entirely inside ``[start, end]``.
+
+        Args:
+            start: Start of the window
+            end: End of the window
+
+        Returns:
+            The earliest-starting interval with ``s >= start`` and
+            ``e <= end``, or None
+        """
+        j = bisect_left(self._starts, start)
+        n = len(self._items)
+        while j < n and self._starts[j] <= end:
+            if self._ends[j] <= end:
+                return self._items[j]
+            j += 1
+        return None
+
+    def first_containing(self, time: float, lo: int = 0) -> Optional[int]:
+        """Return the position of the first interval containing ``time``.
+
+        Args:
+            time: Time to look up (interval bounds are inclusive)
+            lo: Only consider positions at or after this one
+
+        Returns:
+            Position in sorted order (use ``index[pos]`` for the interval),
+            or None
+        """
+        j = max(lo, bisect_left(self._max_ends, time))
+        hi = bisect_right(self._starts, time)
+        while j < hi:
+            if self._ends[j] >= time:
+                return j
+            j += 1
+        return None
+
+    def overlapping(self, start: float, end: float) -> Iterator[Tuple[Any, ...]]:
+        """Yield intervals overlapping ``(start, end)`` by a positive amount.
+
+        Args:
+            start: Start of the span
+            end: End of the span
+
+        Yields:
+            Intervals with ``min(e, end) > max(s, start)``, in start order
+        """
+        j = bisect_right(self._max_ends, start)
+        hi = bisect_left(self._starts, end)
+        for k in range(j, hi):
+            if min(self._ends[k], end) > max(self._starts[k], start):
+                yield self._items[k]
+
+    def nearest_edge(self, time: float, max_distance: Optional[float] = None) -> Optional[float]:
+        """Return the interval start or end closest to ``time``.
+
+        Args:
+            time: Time to look up
+            max_distance: Ignore edges further away than this
+
+        Returns:
+            The nearest edge (the earlier one on a tie), or None
+        """
+        if self._edges is None:
+            self._edges = sorted(self._starts + self._ends)
+        edges = self._edges
+        if not edges:
+            return None
+        i = bisect_left(edges, time)
+        if i == 0:
+            best = edges[0]
+        elif i == len(edges):
+            best = edges[-1]
+        else:
+            before, after = edges[i - 1], edges[i]
+            best = before if time - before <= after - time else after
+        if max_distance is not None and abs(best - time) > max_distance:
+            return None
+        return best
+
+
+def as_interval_index(
+    intervals: Union[IntervalIndex, Iterable[Sequence[Any]], None],
+) -> IntervalIndex:
+    """Return ``intervals`` as an ``IntervalIndex``, building one if needed."""
+    if isinstance(intervals, IntervalIndex):
+        return intervals
+    return IntervalIndex(intervals or ())
@@ -0,0 +1,394 @@
+"""Chunk-parallel Whisper transcription for long inputs.
+
+``model.transcribe`` over a whole file decodes one 30 s window after
+another on a single model instance. On CPU-only machines that leaves most
+cores idle and long recordings transcribe slower than real time. This
+module splits the decoded audio at silence boundaries and transcribes the
+pieces concurrently:
+
+* ``"batched"`` hands the chunk list to faster-whisper's
+  ``BatchedInferencePipeline``, which decodes up to ``batch_size`` windows
+  per forward pass on one model. With ``vad_filter`` enabled the pipeline
+  finds its own VAD boundaries instead.
+* ``"replicas"`` runs chunks on a thread pool against a model loaded with
+  ``num_workers`` CTranslate2 replicas (see :func:`replica_model_options`),
+  each pinned to its own share of the CPU threads.
+
+Chunks are cut at the longest detected silence near the target length.
+When a stretch has no usable silence the cut is forced and neighbouring
+chunks overlap by a second, so words at the cut are decoded with context
+on both sides; each word is then kept only by the chunk that owns its
+midpoint and straddling segments are trimmed to the kept words.
+Timestamps are shifted back to global time, so callers receive segments
+in the same shape and order as a sequential run.
+"""
+from __future__ import annotations
+
+import bisect
+import concurrent.futures
+import copy
+import dataclasses
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from audio_visualizer.srt.io.audioHelpers import DecodedAudio
+
+logger = logging.getLogger(__name__)
+
+# Supported values of TranscriptionConfig.parallel_mode
+PARALLEL_MODES = ("off", "batched", "replicas")
+
+# Longest span Whisper decodes in one window; batched chunks must fit in it
+WHISPER_WINDOW_SECONDS = 30.0
+
+# Overlap added on both sides of a forced (non-silence) cut
+DEFAULT_OVERLAP_SECONDS = 1.0
+
+# Default batch size for the batched pipeline when no worker count is set
+DEFAULT_BATCH_SIZE = 8
+
+
+@dataclass
+class AudioChunk:
+    """A span of audio transcribed as one unit.
+
+    Attributes:
+        start: Start of the audio fed to the model (seconds)
+        end: End of the audio fed to the model (seconds)
+        keep_start: Start of the span whose segments this chunk owns
+        keep_end: End of the span whose segments this chunk owns
+    """
+    start: float
+    end: float
+    keep_start: float
+    keep_end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def owns(self, t: float, *, last: bool = False) -> bool:
+        """Return True if time ``t`` falls in this chunk's owned span."""
+        if last:
+            return self.keep_start <= t
+        return self.keep_start <= t < self.keep_end
+
+
+@dataclass
+class ParallelTranscriptionStats:
+    """Throughput of one parallel transcription run.
+
+    ``chunks`` is the number of planned chunks; it is 0 for batched runs
+    with ``vad_filter``, where the pipeline picks its own boundaries.
+    """
+
+    mode: str
+    workers: int
+    chunks: int
+    audio_seconds: float
+    wall_seconds: float
+
+    @property
+    def real_time_factor(self) -> float:
+        """Processing time per second of audio (lower is faster)."""
+        if self.audio_seconds <= 0:
+            return 0.0
+        return self.wall_seconds / self.audio_seconds
+
+    @property
+    def speed(self) -> float:
+        """Seconds of audio transcribed per wall-clock second."""
+        return self.audio_seconds / max(self.wall_seconds, 1e-9)
+
+
+def resolve_workers(mode: str, requested: int = 0) -> int:
+    """Return the worker count (replicas or batch size) for ``mode``.
+
+    Args:
+        mode: "batched" or "replicas"
+        requested: Explicit worker count, or 0 to pick one from the CPU count
+
+    Returns:
+        Number of model replicas (replicas mode) or the batch size (batched mode)
+    """
+    if requested > 0:
+        return requested
+    if mode == "batched":
+        return DEFAULT_BATCH_SIZE
+    return max(1, min(4, (os.cpu_count() or 1) // 2))
+
+
+def replica_model_options(workers: int) -> Dict[str, int]:
+    """Return WhisperModel options that partition the CPU across ``workers`` replicas.
+
+    Args:
+        workers: Number of concurrent transcriptions the model should serve
+
+    Returns:
+        Dict with ``num_workers`` and ``cpu_threads`` for the model loader
+    """
+    workers = max(1, workers)
+    return {
+        "num_workers": workers,
+        "cpu_threads": max(1, (os.cpu_count() or 1) // workers),
+    }
+
+
+def plan_chunks(
+    duration: float,
+    silences: Sequence[Tuple[float, float]],
+    *,
+    target_sec: float,
+    max_sec: Optional[float] = None,
+    overlap_sec: float = DEFAULT_OVERLAP_SECONDS,
+) -> List[AudioChunk]:
+    """Split ``[0, duration]`` into chunks cut inside silent regions.
+
+    Each cut is placed at the midpoint of the longest silence whose midpoint
+    lies between half the target length and ``max_sec`` past the current
+    chunk start. With no such silence the cut is forced at the latest point
+    that still fits and the neighbouring chunks overlap by ``overlap_sec``.
+
+    Args:
+        duration: Audio duration in seconds
+        silences: Sorted (start, end) silent regions in seconds
+        target_sec: Preferred chunk length in seconds
+        max_sec: Longest audio span fed to the model (defaults to 1.5 x target)
+        overlap_sec: Overlap on each side of a forced cut
+
+    Returns:
+        Chunks in time order; their owned spans tile ``[0, duration]``
+
+    Raises:
+        ValueError: If target_sec is not positive or max_sec is below target_sec
+    """
+    if target_sec <= 0:
+        raise ValueError("target_sec must be positive")
+    max_sec = target_sec * 1.5 if max_sec is None else max_sec
+    if max_sec < target_sec:
+        raise ValueError("max_sec must not be smaller than target_sec")
+    overlap_sec = max(0.0, min(overlap_sec, max_sec / 4.0))
+
+    mids = [(s + e) / 2.0 for s, e in silences]
+    lengths = [e - s for s, e in silences]
+    chunks: List[AudioChunk] = []
+    start = 0.0      # audio fed to the model
+    keep_start = 0.0  # owned span
+
+    while duration - start > max_sec:
+        low = start + target_sec / 2.0
+        high = start + max_sec
+        best: Optional[Tuple[float, float]] = None
+        for i in range(bisect.bisect_right(mids, low), bisect.bisect_left(mids, high)):
+            if best is None or lengths[i] > best[1]:
+                best = (mids[i], lengths[i])
+
+        if best is not None:
+            cut = best[0]
+            chunks.append(AudioChunk(start, cut, keep_start, cut))
+            start = keep_start = cut
+        else:
+            cut = start + target_sec
+            if max_sec - target_sec < overlap_sec:
+                cut = high - overlap_sec
+            chunks.append(AudioChunk(start, cut + overlap_sec, keep_start, cut))
+            start = cut - overlap_sec
+            keep_start = cut
+
+    chunks.append(AudioChunk(start, duration, keep_start, duration))
+    return chunks
+
+
+def transcribe_parallel(
+    model: Any,
+    audio: DecodedAudio,
+    *,
+    silences: Sequence[Tuple[float, float]],
+    mode: str,
+    workers: int = 0,
+    chunk_sec: float = WHISPER_WINDOW_SECONDS,
+    on_progress: Optional[Callable[[float, int], None]] = None,
+    **transcribe_kwargs: Any,
+) -> Tuple[List[Any], ParallelTranscriptionStats]:
+    """Transcribe ``audio`` in concurrent chunks and stitch the segments.
+
+    Args:
+        model: Loaded faster-whisper model
+        audio: Decoded 16 kHz mono audio
+        silences: Silent regions used as cut points
+        mode: "batched" or "replicas"
+        workers: Batch size or replica count (0 picks a default)
+        chunk_sec: Target chunk length in seconds (capped at 30 s in batched mode)
+        on_progress: Called with (media seconds done, segment count) as chunks finish
+        **transcribe_kwargs: Options forwarded to ``transcribe``
+            (language, vad_filter, thresholds, initial_prompt, ...)
+
+    Returns:
+        Tuple of (segments in global time, throughput stats)
+
+    Raises:
+        ValueError: If mode is not "batched" or "replicas"
+    """
+    if mode not in PARALLEL_MODES or mode == "off":
+        raise ValueError(f"Unknown parallel mode: {mode!r} (expected 'batched' or 'replicas')")
+
+    workers = resolve_workers(mode, workers)
+    started = time.perf_counter()
+    if mode == "batched":
+        chunk_sec = min(chunk_sec, WHISPER_WINDOW_SECONDS)
+        chunks = plan_chunks(
+            audio.duration, silences, target_sec=chunk_sec, max_sec=WHISPER_WINDOW_SECONDS, overlap_sec=0.0
+        )
+        segments = _transcribe_batched(model, audio, chunks, workers, on_progress, transcribe_kwargs)
+        if transcribe_kwargs.get("vad_filter"):
+            # The pipeline ignored the plan and cut at its own VAD boundaries
+            chunks = []
+    else:
+        chunks = plan_chunks(audio.duration, silences, target_sec=chunk_sec)
+        segments = _transcribe_replicas(model, audio, chunks, workers, on_progress, transcribe_kwargs)
+
+    stats = ParallelTranscriptionStats(
+        mode=mode,
+        workers=workers,
+        chunks=len(chunks),
+        audio_seconds=audio.duration,
+        wall_seconds=time.perf_counter() - started,
+    )
+    logger.debug(
+        "Parallel transcription (%s, %d workers): %d chunks, RTF %.3f",
+        mode, workers, stats.chunks, stats.real_time_factor,
+    )
+    return segments, stats
+
+
+def _transcribe_batched(
+    model: Any,
+    audio: DecodedAudio,
+    chunks: List[AudioChunk],
+    batch_size: int,
+    on_progress: Optional[Callable[[float, int], None]],
+    kwargs: Dict[str, Any],
+) -> List[Any]:
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError as exc:
+        raise RuntimeError("Batched transcription requires faster-whisper>=1.1") from exc
+
+    options = dict(kwargs)
+    # The batched pipeline always starts each window from a blank prompt
+    options.pop("condition_on_previous_text", None)
+    if not options.get("vad_filter"):
+        options["vad_filter"] = False
+        # Seconds; the pipeline converts clip timestamps to samples itself
+        options["clip_timestamps"] = [{"start": c.start, "end": c.end} for c in chunks]
+
+    pipeline = BatchedInferencePipeline(model=model)
+    segments_iter, _info = pipeline.transcribe(audio.samples, batch_size=batch_size, **options)
+
+    segments: List[Any] = []
+    for seg in segments_iter:
+        segments.append(seg)
+        if on_progress is not None:
+            on_progress(float(getattr(seg, "end", 0.0)), len(segments))
+    return segments
+
+
+def _transcribe_replicas(
+    model: Any,
+    audio: DecodedAudio,
+    chunks: List[AudioChunk],
+    workers: int,
+    on_progress: Optional[Callable[[float, int], None]],
+    kwargs: Dict[str, Any],
+) -> List[Any]:
+    rate = audio.sample_rate
+    samples = audio.samples
+
+    def run(chunk: AudioChunk) -> List[Any]:
+        piece = samples[int(round(chunk.start * rate)):int(round(chunk.end * rate))]
+        segments_iter, _info = model.transcribe(piece, **kwargs)
+        # Segments are generated lazily; decode on the worker thread
+        return [_shift(seg, chunk.start) for seg in segments_iter]
+
+    results: List[Optional[List[Any]]] = [None] * len(chunks)
+    done_seconds = 0.0
+    done_segments = 0
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(1, min(workers, len(chunks))), thread_name_prefix="whisper-chunk"
+    ) as executor:
+        futures = {executor.submit(run, chunk): i for i, chunk in enumerate(chunks)}
+        for future in concurrent.futures.as_completed(futures):
+            index = futures[future]
+            results[index] = future.result()
+            done_seconds += chunks[index].keep_end - chunks[index].keep_start
+            done_segments += len(results[index])
+            if on_progress is not None:
+                on_progress(done_seconds, done_segments)
+
+    return _stitch(chunks, [r or [] for r in results])
+
+
+def _stitch(chunks: List[AudioChunk], results: List[List[Any]]) -> List[Any]:
+    """Merge per-chunk segments (already in global time) into one list.
+
+    Words are kept by the chunk whose owned span contains their midpoint,
+    so the overlap around a forced cut is transcribed twice but emitted
+    once. Segments without word timings are kept by their own midpoint.
+    """
+    merged: List[Any] = []
+    last_index = len(chunks) - 1
+    for index, (chunk, segments) in enumerate(zip(chunks, results)):
+        last = index == last_index
+        for seg in segments:
+            words = list(getattr(seg, "words", None) or [])
+            if not words:
+                if chunk.owns((float(seg.start) + float(seg.end)) / 2.0, last=last):
+                    merged.append(seg)
+                continue
+
+            owned = [w for w in words if chunk.owns((float(w.start) + float(w.end)) / 2.0, last=last)]
+            if not owned:
+                continue
+            if len(owned) < len(words):
+                seg = _replace(
+                    seg,
+                    start=float(owned[0].start) if owned[0] is not words[0] else float(seg.start),
+                    end=float(owned[-1].end) if owned[-1] is not words[-1] else float(seg.end),
+                    text="".join(getattr(w, "word", "") for w in owned),
+                    words=owned,
+                )
+            merged.append(seg)
+
+    if merged and hasattr(merged[0], "id"):
+        merged = [_replace(seg, id=i) for i, seg in enumerate(merged, start=1)]
+    return merged
+
+
+def _shift(seg: Any, offset: float) -> Any:
+    """Return ``seg`` (and its words) moved ``offset`` seconds later."""
+    words = getattr(seg, "words", None)
+    changes: Dict[str, Any] = {
+        "start": float(seg.start) + offset,
+        "end": float(seg.end) + offset,
+    }
+    if words:
+        changes["words"] = [
+            _replace(w, start=float(w.start) + offset, end=float(w.end) + offset)
+            for w in words
+        ]
+    return _replace(seg, **changes)
+
+
+def _replace(item: Any, **changes: Any) -> Any:
+    """Copy a faster-whisper Segment/Word (dataclass or namedtuple) with new field values."""
+    if dataclasses.is_dataclass(item) and not isinstance(item, type):
+        return dataclasses.replace(item, **changes)
+    if hasattr(item, "_replace"):
+        return item._replace(**changes)
+    clone = copy.copy(item)
+    for name, value in changes.items():
+        setattr(clone, name, value)
+    return clone
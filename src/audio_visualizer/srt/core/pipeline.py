@@ -2,21 +2,29 @@
 """Core transcription logic for the SRT package."""
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
 import tempfile
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from audio_visualizer.srt.io.audioHelpers import detect_silences, to_wav_16k_mono
+from audio_visualizer.srt.io.audioHelpers import DecodedAudio, decode_audio_16k_mono, detect_silences
+from audio_visualizer.core.replacementRules import ReplacementRuleEngine
 from audio_visualizer.events import AppEvent, AppEventEmitter, EventLevel, EventType
 from audio_visualizer.srt.formatHelpers import format_duration
 from audio_visualizer.srt.models import PipelineMode, ResolvedConfig, SubtitleBlock
 from audio_visualizer import __version__ as TOOL_VERSION
-from audio_visualizer.srt.io.outputWriters import segments_to_jsonable, write_ass, write_json_bundle, write_srt, write_txt, write_vtt
+from audio_visualizer.srt.io.outputWriters import (
+    SUBTITLE_FORMATS,
+    segments_to_jsonable,
+    write_srt,
+    write_subtitle_outputs,
+)
 from audio_visualizer.srt.core.subtitleGeneration import (
     apply_silence_alignment,
     chunk_segments_to_transcript_blocks,
@@ -27,9 +35,13 @@ from audio_visualizer.srt.core.subtitleGeneration import (
     words_to_subtitles,
 )
 from audio_visualizer.srt.core.alignment import align_corrected_srt, align_script_to_segments
+from audio_visualizer.srt.core.parallelTranscription import transcribe_parallel
+from audio_visualizer.srt.core.streamingOutput import STREAMABLE_FORMATS, StreamingSubtitleWriter
 from audio_visualizer.srt.core.diarization import assign_speakers, is_diarization_available, load_diarization_pipeline, run_diarization
+from audio_visualizer.srt.core.concurrentDiarization import DiarizationJob, concurrent_diarization_fits
 from audio_visualizer.srt.io.scriptReader import read_docx
-from audio_visualizer.srt.io.systemHelpers import ensure_parent_dir, ffmpeg_ok, probe_duration_seconds
+from audio_visualizer.srt.io.systemHelpers import ensure_parent_dir, ffmpeg_ok
+from audio_visualizer.srt.io.transcriptCache import TranscriptCache, audio_fingerprint, make_cache_key
 
 
 @dataclass
@@ -46,6 +58,11 @@ class CoreTranscriptionResult:
     device_used: str
     compute_type_used: str
     elapsed: float
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+class TranscriptionCanceled(RuntimeError):
+    """Raised when a transcription is canceled through its cancel event."""
 
 
 def _emit(emitter: Optional[AppEventEmitter], event: AppEvent) -> None:
@@ -53,9 +70,20 @@ def _emit(emitter: Optional[AppEventEmitter], event: AppEvent) -> None:
         emitter.emit(event)
 
 
+def _open_correction_db() -> Any:
+    """Open the default correction database, or return None if unavailable."""
+    try:
+        from audio_visualizer.core.correctionDb import CorrectionDatabase
+
+        return CorrectionDatabase()
+    except Exception:
+        return None
+
+
 def _apply_correction_db_replacements(
     subs: List[SubtitleBlock],
     emitter: Optional[AppEventEmitter],
+    db: Any = None,
 ) -> List[SubtitleBlock]:
     """Apply per-speaker replacement rules from the correction database.
 
@@ -64,44 +92,31 @@ def _apply_correction_db_replacements(
     present, only global rules are applied.
 
     This is a best-effort pass: if the correction database is unavailable
-    or empty, subs are returned unmodified.
+    or empty, subs are returned unmodified.  Callers applying rules
+    repeatedly can pass an open ``db``.
     """
-    try:
-        from audio_visualizer.core.correctionDb import CorrectionDatabase
-    except Exception:
-        return subs
+    if db is None:
+        db = _open_correction_db()
+        if db is None:
+            return subs
 
-    try:
-        db = CorrectionDatabase()
-    except Exception:
-        return subs
-
-    # Pre-fetch global rules (speaker_label=None)
-    global_rules = db.list_replacement_rules(speaker_label=None)
-
-    # Collect distinct speaker labels from the subtitle blocks
+    # Compiled engines are cached by the database until its rules change
     speaker_labels = {sub.speaker for sub in subs if sub.speaker}
-    speaker_rules: dict[str, list] = {}
-    for label in speaker_labels:
-        speaker_rules[label] = db.list_replacement_rules(speaker_label=label)
+    engines = {label: db.get_replacement_engine(label) for label in speaker_labels}
+    engines[None] = db.get_replacement_engine(None)
 
-    if not global_rules and not any(speaker_rules.values()):
+    if not any(len(engine) for engine in engines.values()):
         return subs
 
     applied_count = 0
     for sub in subs:
-        # Determine which rules to apply
-        rules_to_apply: list = []
-        if sub.speaker and sub.speaker in speaker_rules:
-            rules_to_apply.extend(speaker_rules[sub.speaker])
-        rules_to_apply.extend(global_rules)
-
-        if not rules_to_apply:
+        engine = engines[sub.speaker or None]
+        if not len(engine):
             continue
 
         new_lines = []
         for line in sub.lines:
-            modified = _apply_rules_to_text(line, rules_to_apply)
+            modified = engine.apply(line)
             new_lines.append(modified)
             if modified != line:
                 applied_count += 1
@@ -119,27 +134,150 @@ def _apply_correction_db_replacements(
     return subs
 
 
-def _apply_rules_to_text(text: str, rules: list) -> str:
-    """Apply a list of replacement rules to a text string."""
-    for rule in rules:
-        pattern = rule.get("pattern", "")
-        replacement = rule.get("replacement", "")
-        is_regex = bool(rule.get("is_regex", False))
+@functools.lru_cache(maxsize=32)
+def _cached_rule_engine(rule_key: Tuple[Tuple[str, str, bool], ...]) -> ReplacementRuleEngine:
+    return ReplacementRuleEngine(
+        {"pattern": pattern, "replacement": replacement, "is_regex": is_regex}
+        for pattern, replacement, is_regex in rule_key
+    )
 
-        if not pattern:
-            continue
 
-        if is_regex:
-            try:
-                text = re.sub(pattern, replacement, text)
-            except re.error:
-                pass  # Skip invalid regex patterns
-        else:
-            text = text.replace(pattern, replacement)
-    return text
+def _apply_rules_to_text(text: str, rules: Any) -> str:
+    """Apply replacement rules (a rule list or a prebuilt engine) to a text string.
+
+    Engines for rule lists are cached by rule content, so per-line
+    callers compile each rule set once.
+    """
+    if not isinstance(rules, ReplacementRuleEngine):
+        rules = _cached_rule_engine(tuple(
+            (rule.get("pattern", "") or "", rule.get("replacement", "") or "", bool(rule.get("is_regex", False)))
+            for rule in rules
+        ))
+    return rules.apply(text)
+
+
+@dataclass
+class PreparedAudio:
+    """Decoded audio and silence analysis for one input, ready for inference."""
+
+    input_path: Path
+    audio: DecodedAudio
+    silences: List[Tuple[float, float]]
+
+
+def prepare_audio(
+    input_path: Path,
+    *,
+    cfg: ResolvedConfig,
+    keep_wav: bool = False,
+    tmpdir: Optional[Path] = None,
+    emitter: Optional[AppEventEmitter] = None,
+) -> PreparedAudio:
+    """Decode ``input_path`` and detect its silences.
+
+    This is the model-independent front of the pipeline, so batch runners
+    can call it for upcoming files while the model works on the current one.
+    """
+    t_decode = time.time()
+    audio = decode_audio_16k_mono(str(input_path))
+    _emit(
+        emitter,
+        AppEvent(
+            event_type=EventType.LOG,
+            message=(
+                f"Decoded {format_duration(audio.duration)} of audio in "
+                f"{format_duration(time.time() - t_decode)}"
+            ),
+        ),
+    )
+    if keep_wav:
+        tmpdir_path = str(tmpdir) if tmpdir else None
+        fd, wav_path = tempfile.mkstemp(prefix="srtgen_", suffix=".wav", dir=tmpdir_path)
+        os.close(fd)
+        audio.write_wav(wav_path)
+        _emit(emitter, AppEvent(event_type=EventType.LOG, message=f"Kept WAV: {wav_path}"))
+
+    # Silences are needed before transcription: they are the chunk cut
+    # points of the parallel mode as well as the chunking/polish input.
+    t_silence = time.time()
+    silences: List[Tuple[float, float]] = detect_silences(
+        audio,
+        min_silence_dur=cfg.silence.silence_min_dur,
+        silence_threshold_db=cfg.silence.silence_threshold_db,
+    )
+    _emit(
+        emitter,
+        AppEvent(
+            event_type=EventType.LOG,
+            message=(
+                f"Silence detection: {len(silences)} region(s) in "
+                f"{format_duration(time.time() - t_silence)}"
+            ),
+        ),
+    )
+    return PreparedAudio(input_path=input_path, audio=audio, silences=silences)
+
+
+def _read_transcript_cache(cache: TranscriptCache, key: str) -> Optional[List[Any]]:
+    """Return cached segments for *key*; cache errors count as a miss."""
+    try:
+        return cache.get(key)
+    except Exception:
+        return None
 
 
-def transcribe_file_internal(
+def _open_stream(
+    *,
+    output_path: Path,
+    fmt: str,
+    cfg: ResolvedConfig,
+    silences: List[Tuple[float, float]],
+    mode: PipelineMode,
+    word_level: bool,
+    script_path: Optional[Path],
+    correction_srt: Optional[Path],
+    emitter: Optional[AppEventEmitter],
+) -> Optional[StreamingSubtitleWriter]:
+    """Create a streaming writer, or log why the output cannot stream.
+
+    Streaming covers the word-chunked output of the general and shorts
+    modes.  Script and correction-SRT alignment and transcript mode need
+    the whole transcript, chunk-parallel inference delivers segments only
+    at the end, and JSON is written in one piece.
+    """
+    reason = None
+    if fmt not in STREAMABLE_FORMATS:
+        reason = f"{fmt} output is written in one piece"
+    elif mode == PipelineMode.TRANSCRIPT:
+        reason = "transcript mode needs the whole transcript"
+    elif script_path or correction_srt:
+        reason = "script/correction alignment needs the whole transcript"
+    elif cfg.transcription.parallel_mode != "off":
+        reason = "parallel transcription delivers segments at the end"
+    if reason is not None:
+        _emit(emitter, AppEvent(
+            event_type=EventType.LOG,
+            message=f"Streaming output disabled: {reason}",
+            level=EventLevel.WARNING,
+        ))
+        return None
+    db = _open_correction_db()
+    writer = StreamingSubtitleWriter(
+        output_path,
+        fmt,
+        cfg,
+        silences,
+        word_level=word_level and mode == PipelineMode.GENERAL,
+        postprocess=(
+            (lambda subs: _apply_correction_db_replacements(subs, None, db=db))
+            if db is not None else None
+        ),
+    )
+    _emit(emitter, AppEvent(event_type=EventType.LOG, message=f"Streaming subtitles to {writer.partial_path}"))
+    return writer
+
+
+def begin_transcription(
     *,
     input_path: Path,
     output_path: Path,
@@ -163,8 +301,42 @@ def transcribe_file_internal(
     keep_wav: bool,
     tmpdir: Optional[Path],
     emitter: Optional[AppEventEmitter],
-) -> CoreTranscriptionResult:
-    """Process a single media file and generate subtitles (no CLI dependencies)."""
+    prepared: Optional[PreparedAudio] = None,
+    transcript_cache: Optional[TranscriptCache] = None,
+    model_name: str = "",
+    lora_name: Optional[str] = None,
+    stream_output: bool = False,
+    cancel_event: Optional[threading.Event] = None,
+    diarization_memory_mb: Optional[float] = None,
+) -> Callable[[], CoreTranscriptionResult]:
+    """Decode and transcribe a media file, deferring post-processing.
+
+    Runs audio preparation (unless ``prepared`` is given) and inference on
+    the calling thread, then returns a ``finish`` callable that performs
+    diarization, alignment, chunking and output writing. Batch runners call
+    ``finish`` on another thread so the model can move on to the next file.
+
+    With a ``transcript_cache`` (and the ``model_name``/``lora_name`` the
+    model was loaded from), a previous transcription of the same audio with
+    the same model and transcription settings is reused instead of running
+    the model, and new transcriptions are stored.
+
+    With ``stream_output``, finished subtitle blocks are appended to a
+    ``.partial`` file next to ``output_path`` while the model runs (see
+    ``core.streamingOutput``); ``finish`` rewrites it from the complete
+    result and moves it onto ``output_path``.  A failed or canceled run
+    removes the partial file and leaves an existing output untouched.
+
+    With ``diarize`` in transcript mode, speaker diarization starts in a
+    worker process as soon as the audio is decoded and runs while the model
+    transcribes (see ``core.concurrentDiarization``); ``finish`` joins it.
+    When the estimated worker memory exceeds ``diarization_memory_mb``
+    (default: the memory currently available; ``0`` disables concurrency)
+    diarization runs after transcription instead. Setting ``cancel_event``
+    stops transcription, diarization and ``finish`` with
+    ``TranscriptionCanceled``. ``CoreTranscriptionResult.timings`` reports
+    the transcription, diarization and diarization-wait times.
+    """
 
     if not ffmpeg_ok():
         raise RuntimeError("ffmpeg not found on PATH. Install it or add it to PATH.")
@@ -179,18 +351,25 @@ def transcribe_file_internal(
     if json_bundle_path:
         ensure_parent_dir(json_bundle_path)
 
-    tmpdir_path = str(tmpdir) if tmpdir else None
-    fd, tmp_wav = tempfile.mkstemp(prefix="srtgen_", suffix=".wav", dir=tmpdir_path)
-    os.close(fd)
-
     started = time.time()
+    timings: Dict[str, float] = {}
+    diarization_job: Optional[DiarizationJob] = None
+    stream: Optional[StreamingSubtitleWriter] = None
+    run_diarization_after = False
+
+    def check_canceled() -> None:
+        if cancel_event is not None and cancel_event.is_set():
+            raise TranscriptionCanceled("Transcription canceled")
+        if diarization_job is not None and diarization_job.failed:
+            raise RuntimeError(f"Speaker diarization failed: {diarization_job.failed}")
+
     try:
         _emit(emitter, AppEvent(event_type=EventType.LOG, message=f"Input: {input_path}"))
         _emit(emitter, AppEvent(event_type=EventType.LOG, message=f"Output: {output_path}"))
 
         if dry_run:
             _emit(emitter, AppEvent(event_type=EventType.LOG, message="Dry run: skipping transcription."))
-            return CoreTranscriptionResult(
+            dry_result = CoreTranscriptionResult(
                 input_path=input_path,
                 output_path=output_path,
                 transcript_path=transcript_path,
@@ -202,260 +381,422 @@ def transcribe_file_internal(
                 compute_type_used=compute_type_used,
                 elapsed=time.time() - started,
             )
+            return lambda: dry_result
 
         _emit(emitter, AppEvent(
             event_type=EventType.STAGE,
             message="Converting audio",
             data={"stage_number": 1, "total_stages": 4},
         ))
-        to_wav_16k_mono(str(input_path), tmp_wav)
+        if prepared is None:
+            prepared = prepare_audio(input_path, cfg=cfg, keep_wav=keep_wav, tmpdir=tmpdir, emitter=emitter)
+        else:
+            _emit(emitter, AppEvent(event_type=EventType.LOG, message="Using prefetched audio"))
+        audio = prepared.audio
+        silences = prepared.silences
+        check_canceled()
+
+        if diarize and mode == PipelineMode.TRANSCRIPT:
+            if not is_diarization_available():
+                raise RuntimeError("pyannote.audio is required for diarization.")
+            if not hf_token:
+                raise ValueError("HF token is required for diarization. Use --hf-token or HF_TOKEN.")
+            fits, estimate_mb, budget_mb = concurrent_diarization_fits(audio, diarization_memory_mb)
+            if fits:
+                diarization_job = DiarizationJob(audio, hf_token, tmpdir=tmpdir)
+                _emit(emitter, AppEvent(
+                    event_type=EventType.LOG,
+                    message="Running speaker diarization alongside transcription...",
+                    data={"diarization_memory_mb": estimate_mb, "memory_budget_mb": budget_mb},
+                ))
+            else:
+                run_diarization_after = True
+                _emit(emitter, AppEvent(
+                    event_type=EventType.LOG,
+                    message=(
+                        f"Diarization needs ~{estimate_mb:.0f} MB but the budget is {budget_mb:.0f} MB; "
+                        "running it after transcription"
+                    ),
+                    level=EventLevel.WARNING,
+                ))
 
         _emit(emitter, AppEvent(
             event_type=EventType.STAGE,
             message="Transcribing",
             data={"stage_number": 2, "total_stages": 4},
         ))
-        t0 = time.time()
-        segments_iter, _info = model.transcribe(
-            tmp_wav,
-            vad_filter=cfg.transcription.vad_filter,
+        tx = cfg.transcription
+        transcribe_kwargs = dict(
+            vad_filter=tx.vad_filter,
             language=language,
             word_timestamps=True,
-            condition_on_previous_text=cfg.transcription.condition_on_previous_text,
-            no_speech_threshold=cfg.transcription.no_speech_threshold,
-            log_prob_threshold=cfg.transcription.log_prob_threshold,
-            compression_ratio_threshold=cfg.transcription.compression_ratio_threshold,
-            initial_prompt=cfg.transcription.initial_prompt or None,
+            condition_on_previous_text=tx.condition_on_previous_text,
+            no_speech_threshold=tx.no_speech_threshold,
+            log_prob_threshold=tx.log_prob_threshold,
+            compression_ratio_threshold=tx.compression_ratio_threshold,
+            initial_prompt=tx.initial_prompt or None,
         )
+        cache_key: Optional[str] = None
+        cached: Optional[List[Any]] = None
+        if transcript_cache is not None:
+            if model_name:
+                cache_key = make_cache_key(
+                    audio_fingerprint(audio.samples),
+                    model_name=model_name,
+                    lora_name=lora_name,
+                    language=language,
+                    compute_type=compute_type_used,
+                    transcription=tx,
+                    silence=cfg.silence,
+                )
+                cached = _read_transcript_cache(transcript_cache, cache_key)
+            else:
+                _emit(emitter, AppEvent(
+                    event_type=EventType.LOG,
+                    message="Transcript cache skipped: no model name given",
+                    level=EventLevel.WARNING,
+                ))
 
-        seg_list: List[Any] = []
-        dur_total = probe_duration_seconds(str(tmp_wav))
-        last_ratio = 0.0
-
-        for idx, seg in enumerate(segments_iter, start=1):
-            seg_list.append(seg)
-
-            now = time.time()
-            elapsed = max(0.001, now - t0)
-            media_t = float(getattr(seg, "end", 0.0))
-
-            percent = 0.0
-            eta_sec: Optional[float] = None
-
-            if dur_total and dur_total > 0:
-                ratio = media_t / dur_total if media_t > 0 else 0.0
-                ratio = max(last_ratio, ratio)
-                ratio = min(1.0, ratio)
-                last_ratio = ratio
-                percent = ratio * 100.0
-
-                if media_t > 0:
-                    rtf = media_t / elapsed
-                    if rtf > 0.01:
-                        remaining_media = max(0.0, dur_total - media_t)
-                        eta_sec = remaining_media / rtf
-
-            _emit(
-                emitter,
-                AppEvent(
-                    event_type=EventType.PROGRESS,
-                    message=f"Transcribing: {percent:.1f}%",
-                    data={
-                        "percent": percent,
-                        "segment_count": idx,
-                        "media_time": media_t,
-                        "elapsed": elapsed,
-                        "eta": eta_sec,
-                    },
-                ),
-            )
-
+        t0 = time.time()
+        dur_total = audio.duration
+        if cached is not None:
+            seg_list: List[Any] = cached
+            _emit(emitter, AppEvent(
+                event_type=EventType.LOG,
+                message=f"Transcript cache hit: reusing {len(seg_list)} segments, skipping the model",
+            ))
+            _emit(emitter, AppEvent(
+                event_type=EventType.PROGRESS,
+                message="Transcribing: 100.0%",
+                data={"percent": 100.0, "segment_count": len(seg_list), "media_time": dur_total,
+                      "elapsed": 0.0, "eta": 0.0},
+            ))
+        else:
+            last_ratio = 0.0
+
+            def report_progress(media_t: float, idx: int) -> None:
+                nonlocal last_ratio
+                check_canceled()
+                now = time.time()
+                elapsed = max(0.001, now - t0)
+
+                percent = 0.0
+                eta_sec: Optional[float] = None
+
+                if dur_total and dur_total > 0:
+                    ratio = media_t / dur_total if media_t > 0 else 0.0
+                    ratio = max(last_ratio, ratio)
+                    ratio = min(1.0, ratio)
+                    last_ratio = ratio
+                    percent = ratio * 100.0
+
+                    if media_t > 0:
+                        rtf = media_t / elapsed
+                        if rtf > 0.01:
+                            remaining_media = max(0.0, dur_total - media_t)
+                            eta_sec = remaining_media / rtf
+
+                _emit(
+                    emitter,
+                    AppEvent(
+                        event_type=EventType.PROGRESS,
+                        message=f"Transcribing: {percent:.1f}%",
+                        data={
+                            "percent": percent,
+                            "segment_count": idx,
+                            "media_time": media_t,
+                            "elapsed": elapsed,
+                            "eta": eta_sec,
+                        },
+                    ),
+                )
+
+            seg_list = []
+            if tx.parallel_mode != "off":
+                seg_list, stats = transcribe_parallel(
+                    model,
+                    audio,
+                    silences=silences,
+                    mode=tx.parallel_mode,
+                    workers=tx.parallel_workers,
+                    chunk_sec=tx.parallel_chunk_sec,
+                    on_progress=report_progress,
+                    **transcribe_kwargs,
+                )
+                _emit(
+                    emitter,
+                    AppEvent(
+                        event_type=EventType.LOG,
+                        message=(
+                            f"Parallel transcription ({stats.mode}, {stats.workers} workers): "
+                            + (f"{stats.chunks} chunks" if stats.chunks else "VAD chunks")
+                        ),
+                    ),
+                )
+            else:
+                if stream_output:
+                    stream = _open_stream(
+                        output_path=output_path,
+                        fmt=fmt,
+                        cfg=cfg,
+                        silences=silences,
+                        mode=mode,
+                        word_level=word_level,
+                        script_path=script_path,
+                        correction_srt=correction_srt,
+                        emitter=emitter,
+                    )
+                segments_iter, _info = model.transcribe(audio.samples, **transcribe_kwargs)
+                try:
+                    for idx, seg in enumerate(segments_iter, start=1):
+                        seg_list.append(seg)
+                        if stream is not None:
+                            try:
+                                stream.add_segment(seg)
+                            except Exception as exc:
+                                # Never fail the transcription over the preview
+                                stream.discard()
+                                stream = None
+                                _emit(emitter, AppEvent(
+                                    event_type=EventType.LOG,
+                                    message=f"Streaming output stopped: {exc}",
+                                    level=EventLevel.WARNING,
+                                ))
+                        report_progress(float(getattr(seg, "end", 0.0)), idx)
+                finally:
+                    if stream is not None:
+                        stream.close()
+                        _emit(emitter, AppEvent(
+                            event_type=EventType.LOG,
+                            message=(
+                                f"Streamed {stream.committed} subtitle blocks "
+                                f"(up to {format_duration(stream.committed_until)})"
+                            ),
+                        ))
+
+            if cache_key is not None:
+                try:
+                    transcript_cache.put(cache_key, seg_list)
+                except Exception as exc:
+                    _emit(emitter, AppEvent(
+                        event_type=EventType.LOG,
+                        message=f"Could not store transcript in cache: {exc}",
+                        level=EventLevel.WARNING,
+                    ))
+
+        tx_elapsed = time.time() - t0
+        timings["transcribe"] = tx_elapsed
+        rtf = tx_elapsed / dur_total if dur_total > 0 else 0.0
         _emit(
             emitter,
             AppEvent(
                 event_type=EventType.LOG,
                 message=(
                     f"Transcription complete: {len(seg_list)} segments in "
-                    f"{format_duration(time.time() - t0)}"
+                    f"{format_duration(tx_elapsed)} (RTF {rtf:.2f})"
                 ),
+                data={"real_time_factor": rtf},
             ),
         )
+    except Exception as exc:
+        if diarization_job is not None:
+            diarization_job.cancel()
+        if stream is not None:
+            stream.discard()
+        _emit(emitter, AppEvent(event_type=EventType.LOG, message=str(exc), level=EventLevel.ERROR))
+        raise
 
-        _emit(emitter, AppEvent(
-            event_type=EventType.STAGE,
-            message="Chunking + formatting",
-            data={"stage_number": 3, "total_stages": 4},
-        ))
-        t1 = time.time()
-        if diarize and mode == PipelineMode.TRANSCRIPT:
-            if not is_diarization_available():
-                raise RuntimeError("pyannote.audio is required for diarization.")
-            if not hf_token:
-                raise ValueError("HF token is required for diarization. Use --hf-token or HF_TOKEN.")
-            _emit(emitter, AppEvent(event_type=EventType.LOG, message="Running speaker diarization..."))
-            pipeline = load_diarization_pipeline(hf_token)
-            diarization = run_diarization(pipeline, tmp_wav)
-            seg_list = assign_speakers(seg_list, diarization)
-
-        script_applied = False
-        if script_path:
-            if script_path.suffix.lower() == ".docx":
-                script_text = read_docx(script_path)
-            else:
-                script_text = script_path.read_text(encoding="utf-8")
-
-            sentence_re = re.compile(r"[^.!?;]+[.!?;]?")
-            sentences = [m.group().strip() for m in sentence_re.finditer(script_text) if m.group().strip()]
-            if sentences:
-                seg_list = align_script_to_segments(sentences, seg_list)
-                script_applied = True
-        silences: List[Tuple[float, float]] = detect_silences(
-            tmp_wav,
-            min_silence_dur=cfg.silence.silence_min_dur,
-            silence_threshold_db=cfg.silence.silence_threshold_db,
-        )
-
-        words = collect_words(seg_list)
-        if correction_srt and words:
-            words = align_corrected_srt(correction_srt, words)
-        word_subs: Optional[List[SubtitleBlock]] = None
-
-        if mode == PipelineMode.SHORTS:
-            if not words:
-                raise ValueError("Shorts mode requires word timestamps but none were returned.")
-            if not word_output_path:
-                raise ValueError("Shorts mode requires a word_output_path.")
-            if script_applied:
-                subs = chunk_segments_to_subtitles(seg_list, cfg)
-            else:
-                subs = chunk_words_to_subtitles(words, cfg, silences)
-            word_subs = words_to_subtitles(words)
-        elif mode == PipelineMode.TRANSCRIPT:
-            subs = chunk_segments_to_transcript_blocks(seg_list, cfg, silences)
-        elif word_level:
-            if not words:
-                raise ValueError("Word-level output requested but no word timestamps are available.")
-            subs = words_to_subtitles(words)
-        else:
-            if script_applied:
-                subs = chunk_segments_to_subtitles(seg_list, cfg)
-            elif words:
-                subs = chunk_words_to_subtitles(words, cfg, silences)
+    def finish() -> CoreTranscriptionResult:
+        nonlocal seg_list
+        try:
+            if diarization_job is not None:
+                wait_started = time.time()
+                if not diarization_job.done:
+                    _emit(emitter, AppEvent(event_type=EventType.LOG, message="Waiting for speaker diarization..."))
+                diarization = diarization_job.result(cancel_event)
+                if diarization is None:
+                    raise TranscriptionCanceled("Transcription canceled")
+                timings["diarize"] = diarization_job.elapsed or 0.0
+                timings["diarize_wait"] = time.time() - wait_started
+                overlap = min(timings["transcribe"], timings["diarize"])
+                _emit(emitter, AppEvent(
+                    event_type=EventType.LOG,
+                    message=(
+                        f"Diarization complete: {len(diarization)} speaker turns in "
+                        f"{format_duration(timings['diarize'])}, waited {format_duration(timings['diarize_wait'])} "
+                        "after transcription"
+                    ),
+                    data={
+                        "diarization_elapsed": timings["diarize"],
+                        "transcription_elapsed": timings["transcribe"],
+                        "diarization_wait": timings["diarize_wait"],
+                        "overlap": overlap,
+                    },
+                ))
+                seg_list = assign_speakers(seg_list, diarization)
+
+            _emit(emitter, AppEvent(
+                event_type=EventType.STAGE,
+                message="Chunking + formatting",
+                data={"stage_number": 3, "total_stages": 4},
+            ))
+            t1 = time.time()
+            if run_diarization_after:
+                _emit(emitter, AppEvent(event_type=EventType.LOG, message="Running speaker diarization..."))
+                pipeline = load_diarization_pipeline(hf_token)
+                diarization = run_diarization(pipeline, audio.to_pyannote_input())
+                timings["diarize"] = time.time() - t1
+                seg_list = assign_speakers(seg_list, diarization)
+
+            script_applied = False
+            if script_path:
+                if script_path.suffix.lower() == ".docx":
+                    script_text = read_docx(script_path)
+                else:
+                    script_text = script_path.read_text(encoding="utf-8")
+
+                sentence_re = re.compile(r"[^.!?;]+[.!?;]?")
+                sentences = [m.group().strip() for m in sentence_re.finditer(script_text) if m.group().strip()]
+                if sentences:
+                    seg_list = align_script_to_segments(sentences, seg_list)
+                    script_applied = True
+
+            words = collect_words(seg_list)
+            if correction_srt and words:
+                words = align_corrected_srt(correction_srt, words)
+            word_subs: Optional[List[SubtitleBlock]] = None
+
+            if mode == PipelineMode.SHORTS:
+                if not words:
+                    raise ValueError("Shorts mode requires word timestamps but none were returned.")
+                if not word_output_path:
+                    raise ValueError("Shorts mode requires a word_output_path.")
+                if script_applied:
+                    subs = chunk_segments_to_subtitles(seg_list, cfg)
+                else:
+                    subs = chunk_words_to_subtitles(words, cfg, silences)
+                word_subs = words_to_subtitles(words)
+            elif mode == PipelineMode.TRANSCRIPT:
+                subs = chunk_segments_to_transcript_blocks(seg_list, cfg, silences)
+            elif word_level:
+                if not words:
+                    raise ValueError("Word-level output requested but no word timestamps are available.")
+                subs = words_to_subtitles(words)
             else:
-                subs = chunk_segments_to_subtitles(seg_list, cfg)
-
-        subs = apply_silence_alignment(subs, silences)
-        subs = hygiene_and_polish(
-            subs,
-            min_gap=cfg.formatting.min_gap,
-            pad=cfg.formatting.pad,
-            silence_intervals=silences,
-        )
+                if script_applied:
+                    subs = chunk_segments_to_subtitles(seg_list, cfg)
+                elif words:
+                    subs = chunk_words_to_subtitles(words, cfg, silences)
+                else:
+                    subs = chunk_segments_to_subtitles(seg_list, cfg)
+
+            subs = apply_silence_alignment(subs, silences)
+            subs = hygiene_and_polish(
+                subs,
+                min_gap=cfg.formatting.min_gap,
+                pad=cfg.formatting.pad,
+                silence_intervals=silences,
+            )
 
-        # Per-speaker adaptation: apply replacement rules from correction DB
-        subs = _apply_correction_db_replacements(subs, emitter)
+            # Per-speaker adaptation: apply replacement rules from correction DB
+            subs = _apply_correction_db_replacements(subs, emitter)
 
-        _emit(
-            emitter,
-            AppEvent(
-                event_type=EventType.LOG,
-                message=(
-                    f"Chunking complete: {len(subs)} subtitle blocks in "
-                    f"{format_duration(time.time() - t1)}"
+            _emit(
+                emitter,
+                AppEvent(
+                    event_type=EventType.LOG,
+                    message=(
+                        f"Chunking complete: {len(subs)} subtitle blocks in "
+                        f"{format_duration(time.time() - t1)}"
+                    ),
                 ),
-            ),
-        )
+            )
 
-        _emit(emitter, AppEvent(
-            event_type=EventType.STAGE,
-            message="Writing outputs",
-            data={"stage_number": 4, "total_stages": 4},
-        ))
-        if fmt == "srt":
-            write_srt(subs, output_path, max_chars=cfg.formatting.max_chars, max_lines=cfg.formatting.max_lines)
-        elif fmt == "vtt":
-            write_vtt(subs, output_path, max_chars=cfg.formatting.max_chars, max_lines=cfg.formatting.max_lines)
-        elif fmt == "ass":
-            write_ass(subs, output_path, max_chars=cfg.formatting.max_chars, max_lines=cfg.formatting.max_lines)
-        elif fmt == "txt":
-            write_txt(subs, output_path)
-        elif fmt == "json":
-            write_json_bundle(
-                output_path,
+            _emit(emitter, AppEvent(
+                event_type=EventType.STAGE,
+                message="Writing outputs",
+                data={"stage_number": 4, "total_stages": 4},
+            ))
+            if fmt not in SUBTITLE_FORMATS:
+                raise ValueError(f"Unknown format: {fmt}")
+            # Every subtitle output in one formatting pass; a streamed
+            # output is rewritten in its partial file and moved into place
+            targets = [(fmt, stream.partial_path if stream is not None else output_path)]
+            if transcript_path:
+                targets.append(("txt", transcript_path))
+            if json_bundle_path:
+                targets.append(("json", json_bundle_path))
+            write_subtitle_outputs(
+                subs,
+                targets,
+                max_chars=cfg.formatting.max_chars,
+                max_lines=cfg.formatting.max_lines,
                 input_file=str(input_path),
                 device_used=device_used,
                 compute_type_used=compute_type_used,
                 cfg=cfg,
                 segments=seg_list,
-                subs=subs,
                 tool_version=TOOL_VERSION,
             )
-        else:
-            raise ValueError(f"Unknown format: {fmt}")
-
-        if transcript_path:
-            write_txt(subs, transcript_path)
-
-        if segments_path:
-            ensure_parent_dir(segments_path)
-            tmp = segments_path.with_suffix(segments_path.suffix + ".tmp")
-            include_words = any(getattr(seg, "words", None) for seg in seg_list)
-            tmp.write_text(
-                json.dumps(
-                    {
-                        "input_file": str(input_path),
-                        "segments": segments_to_jsonable(seg_list, include_words=include_words),
-                    },
-                    ensure_ascii=False,
-                    indent=2,
-                ),
-                encoding="utf-8",
-            )
-            os.replace(tmp, segments_path)
+            if stream is not None:
+                stream.finish()
+
+            if segments_path:
+                ensure_parent_dir(segments_path)
+                tmp = segments_path.with_suffix(segments_path.suffix + ".tmp")
+                include_words = any(getattr(seg, "words", None) for seg in seg_list)
+                tmp.write_text(
+                    json.dumps(
+                        {
+                            "input_file": str(input_path),
+                            "segments": segments_to_jsonable(seg_list, include_words=include_words),
+                        },
+                        ensure_ascii=False,
+                        indent=2,
+                    ),
+                    encoding="utf-8",
+                )
+                os.replace(tmp, segments_path)
+
+            if word_subs and word_output_path:
+                write_srt(
+                    word_subs,
+                    word_output_path,
+                    max_chars=cfg.formatting.max_chars,
+                    max_lines=cfg.formatting.max_lines,
+                )
 
-        if word_subs and word_output_path:
-            write_srt(
-                word_subs,
-                word_output_path,
-                max_chars=cfg.formatting.max_chars,
-                max_lines=cfg.formatting.max_lines,
+            _emit(
+                emitter,
+                AppEvent(event_type=EventType.LOG, message=f"Done: {output_path} (total {format_duration(time.time() - started)})"),
             )
 
-        if json_bundle_path:
-            write_json_bundle(
-                json_bundle_path,
-                input_file=str(input_path),
+            return CoreTranscriptionResult(
+                input_path=input_path,
+                output_path=output_path,
+                transcript_path=transcript_path,
+                segments_path=segments_path,
+                json_bundle_path=json_bundle_path,
+                segments=seg_list,
+                subtitles=subs,
                 device_used=device_used,
                 compute_type_used=compute_type_used,
-                cfg=cfg,
-                segments=seg_list,
-                subs=subs,
-                tool_version=TOOL_VERSION,
+                elapsed=time.time() - started,
+                timings=timings,
             )
+        except Exception as exc:
+            if stream is not None:
+                stream.discard()
+            _emit(emitter, AppEvent(event_type=EventType.LOG, message=str(exc), level=EventLevel.ERROR))
+            raise
 
-        _emit(
-            emitter,
-            AppEvent(event_type=EventType.LOG, message=f"Done: {output_path} (total {format_duration(time.time() - started)})"),
-        )
+    return finish
 
-        return CoreTranscriptionResult(
-            input_path=input_path,
-            output_path=output_path,
-            transcript_path=transcript_path,
-            segments_path=segments_path,
-            json_bundle_path=json_bundle_path,
-            segments=seg_list,
-            subtitles=subs,
-            device_used=device_used,
-            compute_type_used=compute_type_used,
-            elapsed=time.time() - started,
-        )
-    except Exception as exc:
-        _emit(emitter, AppEvent(event_type=EventType.LOG, message=str(exc), level=EventLevel.ERROR))
-        raise
-    finally:
-        if not keep_wav and os.path.exists(tmp_wav):
-            try:
-                os.remove(tmp_wav)
-            except OSError:
-                pass
+
+def transcribe_file_internal(**kwargs: Any) -> CoreTranscriptionResult:
+    """Process a single media file and generate subtitles (no CLI dependencies).
+
+    Takes the keyword arguments of :func:`begin_transcription` and runs
+    every stage on the calling thread.
+    """
+    return begin_transcription(**kwargs)()
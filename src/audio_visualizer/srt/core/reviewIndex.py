@@ -0,0 +1,289 @@
+"""Review navigation index over subtitle words.
+
+Reviewing a long transcript means jumping between low-confidence words,
+speaker changes and ``estimated`` bundle-from-SRT alignments.
+:class:`ReviewIndex` answers those queries without scanning every word:
+
+* words are numbered in document order (subtitle by subtitle); their start
+  times and confidences are NumPy columns, and ``word_offsets`` maps
+  subtitle ``i`` to words ``word_offsets[i]:word_offsets[i + 1]``;
+* confidences are also kept sorted, for counts and "lowest N" lists;
+* min segment trees give the next/previous word below any confidence
+  threshold, the word at a time, and the next/previous speaker change or
+  estimated subtitle in O(log n);
+* per-speaker runs come from the speaker-change flags.
+
+Word time, speaker and alignment-status edits update the index in
+O(log n) (:meth:`ReviewIndex.update_word`, :meth:`ReviewIndex.set_speaker`,
+:meth:`ReviewIndex.set_alignment_status`); edits that add, remove or
+reorder subtitles or words need a rebuild.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# alignment_status of subtitles whose word timing was interpolated
+ESTIMATED_STATUS = "estimated"
+
+
+class _MinTree:
+    """Array segment tree over float values (``inf`` = never matches).
+
+    ``first_below(lo, x)`` / ``last_below(hi, x)`` return the first
+    position ``>= lo`` / last position ``< hi`` whose value is below ``x``
+    (or -1) by descending from the covering nodes, and ``set`` updates one
+    value; all three are O(log n).
+    """
+
+    def __init__(self, values: Any) -> None:
+        import numpy as np
+
+        values = np.asarray(values, dtype=np.float64)
+        n = len(values)
+        size = 1 << max(0, (n - 1).bit_length())
+        tree = np.full(2 * size, np.inf)
+        tree[size:size + n] = values
+        lo = size
+        while lo > 1:
+            np.minimum(tree[lo:2 * lo:2], tree[lo + 1:2 * lo:2], out=tree[lo // 2:lo])
+            lo //= 2
+        self._n = n
+        self._size = size
+        self._tree = tree
+
+    def __len__(self) -> int:
+        return self._n
+
+    def values(self) -> Any:
+        """Leaf values (a view, ``len(self)`` long)."""
+        return self._tree[self._size:self._size + self._n]
+
+    def set(self, pos: int, value: float) -> None:
+        tree = self._tree
+        i = self._size + pos
+        tree[i] = value
+        i >>= 1
+        while i:
+            tree[i] = min(tree[2 * i], tree[2 * i + 1])
+            i >>= 1
+
+    def first_below(self, lo: int, x: float) -> int:
+        if lo < 0:
+            lo = 0
+        if lo >= self._n:
+            return -1
+        tree, size = self._tree, self._size
+        i = lo + size
+        while True:
+            if tree[i] < x:
+                while i < size:
+                    i = 2 * i if tree[2 * i] < x else 2 * i + 1
+                return i - size
+            while i & 1:
+                i >>= 1
+            if i == 0:
+                return -1
+            i += 1
+
+    def last_below(self, hi: int, x: float) -> int:
+        if hi > self._n:
+            hi = self._n
+        if hi <= 0:
+            return -1
+        tree, size = self._tree, self._size
+        i = hi - 1 + size
+        while True:
+            if tree[i] < x:
+                while i < size:
+                    i = 2 * i + 1 if tree[2 * i + 1] < x else 2 * i
+                return i - size
+            while i > 1 and not i & 1:
+                i >>= 1
+            if i == 1:
+                return -1
+            i -= 1
+
+
+def _confidence(word: Any) -> float:
+    value = getattr(word, "confidence", None)
+    if value is None:
+        return math.nan
+    return float(value)
+
+
+class ReviewIndex:
+    """Navigation index over the words of an ordered list of subtitles.
+
+    Args:
+        subtitles: ``(speaker, alignment_status, words)`` per subtitle, in
+            document order.  Words need ``start`` and an optional
+            ``confidence`` attribute (``WordItem``).
+
+    Word positions are document-order numbers; :meth:`word_ref` and
+    :meth:`word_position` convert to and from ``(subtitle, word)`` pairs.
+    Words without a confidence never count as low-confidence.
+    """
+
+    def __init__(self, subtitles: Iterable[Tuple[Optional[str], Optional[str], Sequence[Any]]]) -> None:
+        import numpy as np
+
+        speakers: List[Optional[str]] = []
+        estimated: List[float] = []
+        counts: List[int] = []
+        starts: List[float] = []
+        confidences: List[float] = []
+        for speaker, status, words in subtitles:
+            speakers.append(speaker)
+            estimated.append(0.0 if status == ESTIMATED_STATUS else math.inf)
+            counts.append(len(words))
+            for w in words:
+                starts.append(float(w.start))
+                confidences.append(_confidence(w))
+
+        self._speakers = speakers
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        self.word_offsets = offsets
+        self.starts = np.asarray(starts, dtype=np.float64)
+        self.confidences = np.asarray(confidences, dtype=np.float64)
+
+        known = ~np.isnan(self.confidences)
+        order = np.argsort(self.confidences, kind="stable")
+        self.confidence_order = order[: int(known.sum())]
+        self.sorted_confidences = self.confidences[self.confidence_order]
+
+        self._confidence_tree = _MinTree(np.where(known, self.confidences, np.inf))
+        self._start_tree = _MinTree(self.starts)
+        self._neg_start_tree = _MinTree(-self.starts)
+        self._estimated_tree = _MinTree(estimated)
+        self._change_tree = _MinTree([self._change_flag(i) for i in range(len(speakers))])
+
+    @classmethod
+    def from_entries(cls, entries: Sequence[Any]) -> "ReviewIndex":
+        """Build from SRT Edit ``SubtitleEntry`` objects."""
+        return cls((e.speaker, e.alignment_status, e.words) for e in entries)
+
+    @classmethod
+    def from_bundle(cls, bundle: Mapping[str, Any]) -> "ReviewIndex":
+        """Build from a normalized bundle (``read_bundle`` result)."""
+        return cls(
+            (sub.get("speaker_label"), sub.get("alignment_status"), sub.get("words") or [])
+            for sub in bundle.get("subtitles", [])
+        )
+
+    # ------------------------------------------------------------------
+    # Sizes and position mapping
+    # ------------------------------------------------------------------
+
+    @property
+    def subtitle_count(self) -> int:
+        return len(self._speakers)
+
+    @property
+    def word_count(self) -> int:
+        return len(self.starts)
+
+    def word_position(self, subtitle_index: int, word_index: int) -> int:
+        """Document-order position of a word."""
+        return int(self.word_offsets[subtitle_index]) + word_index
+
+    def word_ref(self, position: int) -> Tuple[int, int]:
+        """``(subtitle_index, word_index)`` of a word position."""
+        import numpy as np
+
+        sub = int(np.searchsorted(self.word_offsets, position, side="right")) - 1
+        return sub, position - int(self.word_offsets[sub])
+
+    # ------------------------------------------------------------------
+    # Time lookup
+    # ------------------------------------------------------------------
+
+    def word_at(self, time: float) -> int:
+        """Last word (in document order) starting at or before *time*, or -1."""
+        return self._start_tree.last_below(self.word_count, math.nextafter(time, math.inf))
+
+    def first_word_after(self, time: float) -> int:
+        """First word (in document order) starting after *time*, or -1."""
+        return self._neg_start_tree.first_below(0, -time)
+
+    # ------------------------------------------------------------------
+    # Confidence queries
+    # ------------------------------------------------------------------
+
+    def next_low_confidence(self, position: int, threshold: float = 0.5) -> int:
+        """First word after *position* with confidence below *threshold*, or -1."""
+        return self._confidence_tree.first_below(position + 1, threshold)
+
+    def prev_low_confidence(self, position: int, threshold: float = 0.5) -> int:
+        """Last word before *position* with confidence below *threshold*, or -1."""
+        return self._confidence_tree.last_below(position, threshold)
+
+    def low_confidence_count(self, threshold: float = 0.5) -> int:
+        """Number of words with confidence below *threshold*."""
+        import numpy as np
+
+        return int(np.searchsorted(self.sorted_confidences, threshold, side="left"))
+
+    def lowest_confidence(self, count: int) -> List[int]:
+        """Positions of the *count* lowest-confidence words, lowest first."""
+        return self.confidence_order[:max(0, count)].tolist()
+
+    # ------------------------------------------------------------------
+    # Subtitle queries
+    # ------------------------------------------------------------------
+
+    def next_speaker_change(self, subtitle_index: int) -> int:
+        """First subtitle after *subtitle_index* whose speaker differs from its predecessor, or -1."""
+        return self._change_tree.first_below(subtitle_index + 1, 0.5)
+
+    def prev_speaker_change(self, subtitle_index: int) -> int:
+        """Last subtitle before *subtitle_index* that starts a speaker run, or -1."""
+        return self._change_tree.last_below(subtitle_index, 0.5)
+
+    def speaker_runs(self) -> List[Tuple[Optional[str], int, int]]:
+        """``(speaker, first_subtitle, length)`` for each run of equal speakers."""
+        import numpy as np
+
+        n = self.subtitle_count
+        if not n:
+            return []
+        flags = self._change_tree.values()
+        firsts = np.flatnonzero(flags < 0.5).tolist()
+        bounds = firsts + [n]
+        return [(self._speakers[a], a, b - a) for a, b in zip(bounds[:-1], bounds[1:])]
+
+    def next_estimated(self, subtitle_index: int) -> int:
+        """First subtitle after *subtitle_index* with estimated alignment, or -1."""
+        return self._estimated_tree.first_below(subtitle_index + 1, 0.5)
+
+    def prev_estimated(self, subtitle_index: int) -> int:
+        """Last subtitle before *subtitle_index* with estimated alignment, or -1."""
+        return self._estimated_tree.last_below(subtitle_index, 0.5)
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+
+    def _change_flag(self, i: int) -> float:
+        speakers = self._speakers
+        return 0.0 if i == 0 or speakers[i] != speakers[i - 1] else 1.0
+
+    def set_speaker(self, subtitle_index: int, speaker: Optional[str]) -> None:
+        """Record a subtitle's new speaker label."""
+        self._speakers[subtitle_index] = speaker
+        for i in (subtitle_index, subtitle_index + 1):
+            if i < len(self._speakers):
+                self._change_tree.set(i, self._change_flag(i))
+
+    def set_alignment_status(self, subtitle_index: int, status: Optional[str]) -> None:
+        """Record a subtitle's new alignment status."""
+        self._estimated_tree.set(subtitle_index, 0.0 if status == ESTIMATED_STATUS else math.inf)
+
+    def update_word(self, subtitle_index: int, word_index: int, start: float) -> None:
+        """Record a word's new start time."""
+        pos = self.word_position(subtitle_index, word_index)
+        start = float(start)
+        self.starts[pos] = start
+        self._start_tree.set(pos, start)
+        self._neg_start_tree.set(pos, -start)
@@ -0,0 +1,206 @@
+"""Incremental subtitle output while transcription is still running.
+
+The pipeline normally writes subtitles only after the whole file has been
+transcribed.  ``StreamingSubtitleWriter`` receives segments as the model
+produces them and appends finished subtitle blocks to the output file, so
+the start of a long recording can be reviewed (for example in the SRT
+Edit tab) while the rest is transcribed.
+
+A block is committed only once nothing after the transcription frontier
+can change it:
+
+* word runs are chunked once a detected silence closes them (chunking
+  never looks across a silence), so the run still being spoken stays
+  pending;
+* silence alignment and timing polish look one block ahead, so the last
+  chunked block is held back until the next one exists.
+
+Committed blocks are appended in the final format (SRT, VTT, ASS or TXT)
+to a ``.partial`` file next to the output, so an existing output survives
+a failed or canceled run.  When transcription ends the pipeline rewrites
+the partial file from the full result, which reconciles the held-back
+boundary blocks and any pass that needs the whole transcript, and
+:meth:`StreamingSubtitleWriter.finish` moves it onto the output path.
+"""
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, List, Optional, TextIO, Tuple
+
+from audio_visualizer.srt.core.intervalIndex import as_interval_index
+from audio_visualizer.srt.core.subtitleGeneration import (
+    apply_silence_alignment,
+    chunk_words_to_subtitles,
+    collect_words,
+    hygiene_and_polish,
+    words_to_subtitles,
+)
+from audio_visualizer.srt.io.outputWriters import (
+    ASS_HEADER,
+    VTT_HEADER,
+    format_ass_dialogue,
+    format_srt_entry,
+    format_txt_line,
+    format_vtt_cue,
+)
+from audio_visualizer.srt.io.systemHelpers import ensure_parent_dir
+from audio_visualizer.srt.models import ResolvedConfig, SubtitleBlock, WordItem
+
+logger = logging.getLogger(__name__)
+
+STREAMABLE_FORMATS = ("srt", "vtt", "ass", "txt")
+
+
+class StreamingSubtitleWriter:
+    """Chunk segments as they arrive and append finished blocks to a file.
+
+    Creating the writer creates ``partial_path`` (writing the format
+    header), so the file can be opened right away; ``output_path`` is only
+    replaced by :meth:`finish`, and :meth:`discard` removes the partial
+    file after a failed or canceled run.
+
+    Args:
+        output_path: Subtitle file to write
+        fmt: One of ``STREAMABLE_FORMATS``
+        cfg: Configuration used for chunking and polish
+        silences: Detected silences of the whole input
+        word_level: Emit one block per word instead of chunking
+        postprocess: Optional hook applied to blocks just before they are
+            written (the pipeline passes the correction-database rules)
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        fmt: str,
+        cfg: ResolvedConfig,
+        silences: List[Tuple[float, float]],
+        *,
+        word_level: bool = False,
+        postprocess: Optional[Callable[[List[SubtitleBlock]], List[SubtitleBlock]]] = None,
+    ) -> None:
+        if fmt not in STREAMABLE_FORMATS:
+            raise ValueError(f"Streaming output is not supported for format: {fmt}")
+        self.output_path = output_path
+        self.partial_path = output_path.with_suffix(output_path.suffix + ".partial")
+        self.fmt = fmt
+        self._cfg = cfg
+        # Built once; the chunking and polish helpers accept the index
+        self._silences = as_interval_index(silences)
+        self._word_level = word_level
+        self._postprocess = postprocess
+
+        self._open_run: List[WordItem] = []
+        # Last committed block and the held-back boundary block, both
+        # silence-aligned but not polished
+        self._context: Optional[SubtitleBlock] = None
+        self._held: Optional[SubtitleBlock] = None
+        self.committed = 0
+        self.committed_until = 0.0
+
+        ensure_parent_dir(output_path)
+        self._fh: Optional[TextIO] = open(self.partial_path, "w", encoding="utf-8")
+        if fmt == "vtt":
+            self._write(VTT_HEADER)
+        elif fmt == "ass":
+            self._write(ASS_HEADER + "\n")
+
+    def _write(self, text: str) -> None:
+        assert self._fh is not None
+        self._fh.write(text)
+        self._fh.flush()
+
+    def _closed_words(self, new_words: List[WordItem]) -> List[WordItem]:
+        """Add words to the open run; return the words of runs now closed."""
+        if self._word_level:
+            return new_words
+        closed: List[WordItem] = []
+        for w in new_words:
+            if (
+                self._open_run
+                and self._silences.first_within(self._open_run[-1].end, w.start) is not None
+            ):
+                closed.extend(self._open_run)
+                self._open_run = []
+            self._open_run.append(w)
+        return closed
+
+    def add_segment(self, segment: Any) -> int:
+        """Feed one transcribed segment.
+
+        Returns:
+            Number of blocks written for this segment
+        """
+        if self._fh is None:
+            raise RuntimeError("StreamingSubtitleWriter is closed")
+        closed = self._closed_words(collect_words([segment]))
+        if not closed:
+            return 0
+        if self._word_level:
+            fresh = words_to_subtitles(closed)
+        else:
+            fresh = chunk_words_to_subtitles(closed, self._cfg, self._silences)
+        return self._commit(fresh)
+
+    def _commit(self, fresh: List[SubtitleBlock]) -> int:
+        if not fresh:
+            return 0
+        head = [b for b in (self._context, self._held) if b is not None]
+        aligned = apply_silence_alignment(head + fresh, self._silences)
+        if len(aligned) < 2:
+            self._held = aligned[-1]
+            return 0
+        fmt_cfg = self._cfg.formatting
+        polished = hygiene_and_polish(
+            aligned,
+            min_gap=fmt_cfg.min_gap,
+            pad=fmt_cfg.pad,
+            silence_intervals=self._silences,
+        )
+        ready = polished[1 if self._context is not None else 0:-1]
+        self._context, self._held = aligned[-2], aligned[-1]
+        if not ready:
+            return 0
+        if self._postprocess is not None:
+            ready = self._postprocess(ready)
+        self._write("".join(self._format(sb) for sb in ready))
+        self.committed_until = ready[-1].end
+        return len(ready)
+
+    def _format(self, sb: SubtitleBlock) -> str:
+        self.committed += 1
+        fmt_cfg = self._cfg.formatting
+        if self.fmt == "srt":
+            entry = format_srt_entry(
+                self.committed, sb, max_chars=fmt_cfg.max_chars, max_lines=fmt_cfg.max_lines
+            )
+            return entry if self.committed == 1 else "\n" + entry
+        if self.fmt == "vtt":
+            return "\n" + format_vtt_cue(sb, max_chars=fmt_cfg.max_chars, max_lines=fmt_cfg.max_lines)
+        if self.fmt == "ass":
+            return format_ass_dialogue(sb, max_chars=fmt_cfg.max_chars, max_lines=fmt_cfg.max_lines) + "\n"
+        return format_txt_line(sb) + "\n"
+
+    def close(self) -> None:
+        """Stop streaming; pending blocks are left to the final rewrite.
+
+        The partial file stays in place for :meth:`finish` or :meth:`discard`.
+        """
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def finish(self) -> None:
+        """Close and move the partial file onto ``output_path``."""
+        self.close()
+        os.replace(self.partial_path, self.output_path)
+
+    def discard(self) -> None:
+        """Close and remove the partial file, leaving ``output_path`` untouched."""
+        self.close()
+        try:
+            self.partial_path.unlink()
+        except OSError:
+            pass
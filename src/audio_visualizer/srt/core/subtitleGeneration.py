@@ -6,9 +6,10 @@ timed and formatted subtitle blocks.
 """
 from __future__ import annotations
 
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Tuple, Union
 
 from audio_visualizer.srt.models import ResolvedConfig, SubtitleBlock, WordItem
+from audio_visualizer.srt.core.intervalIndex import IntervalIndex, as_interval_index
 from audio_visualizer.srt.core.textProcessing import (
     distribute_time,
     enforce_timing,
@@ -17,6 +18,7 @@ from audio_visualizer.srt.core.textProcessing import (
     split_text_into_blocks,
     wrap_text_lines,
 )
+from audio_visualizer.srt.core.wordTable import WordTable
 
 
 # ============================================================
@@ -61,18 +63,21 @@ def words_to_text(words: List[WordItem]) -> str:
 def silence_between(
     start: float,
     end: float,
-    silences: List[Tuple[float, float]],
+    silences: Union[List[Tuple[float, float]], IntervalIndex],
 ) -> Optional[Tuple[float, float]]:
     """Find a silence interval that falls entirely between start and end times.
 
     Args:
         start: Start time to search from
         end: End time to search to
-        silences: List of (start, end) silence intervals
+        silences: List of (start, end) silence intervals, or an
+            ``IntervalIndex`` over them for repeated lookups
 
     Returns:
         First silence interval found within range, or None
     """
+    if isinstance(silences, IntervalIndex):
+        return silences.first_within(start, end)
     for s, e in silences:
         if s >= start and e <= end:
             return (s, e)
@@ -96,10 +101,11 @@ def split_words_on_silence(
         return []
     if not silences:
         return [words]
+    index = as_interval_index(silences)
     runs: List[List[WordItem]] = []
     cur: List[WordItem] = [words[0]]
     for w in words[1:]:
-        gap = silence_between(cur[-1].end, w.start, silences)
+        gap = index.first_within(cur[-1].end, w.start)
         if gap is not None:
             runs.append(cur)
             cur = [w]
@@ -228,6 +234,7 @@ def chunk_segments_to_transcript_blocks(
     and capped by max duration. Text is wrapped into lines based on
     formatting constraints.
     """
+    silence_index = as_interval_index(silences)
     raw_blocks: List[Tuple[float, float, str, Optional[str]]] = []
     cur_start: Optional[float] = None
     cur_end: Optional[float] = None
@@ -260,7 +267,7 @@ def chunk_segments_to_transcript_blocks(
             cur_segments = [seg]
             continue
 
-        if cur_end is not None and silence_between(cur_end, seg_start, silences):
+        if cur_end is not None and silence_index.first_within(cur_end, seg_start):
             raw_blocks.append(
                 (cur_start, cur_end, normalize_spaces(" ".join(cur_text)), dominant_speaker(cur_segments))
             )
@@ -340,29 +347,54 @@ def chunk_words_to_subtitles(
     Returns:
         List of SubtitleBlock objects
     """
-    runs = split_words_on_silence(words, silences)
+    if not words:
+        return []
+    f = cfg.formatting
+    table = WordTable.from_words(words)
+    splitter = table.splitter(
+        f.max_chars,
+        f.max_lines,
+        allow_commas=f.allow_commas,
+        allow_medium=f.allow_medium,
+        prefer_punct_splits=f.prefer_punct_splits,
+    )
+    tokens = table.tokens()
+    token_offsets = table.token_offsets.tolist()
+    starts = table.starts.tolist()
+    ends = table.ends.tolist()
+
     subs: List[SubtitleBlock] = []
-    for run in runs:
-        text = words_to_text(run)
-        parts = split_text_into_blocks(
-            text,
-            cfg.formatting.max_chars,
-            cfg.formatting.max_lines,
-            allow_commas=cfg.formatting.allow_commas,
-            allow_medium=cfg.formatting.allow_medium,
-            prefer_punct_splits=cfg.formatting.prefer_punct_splits,
-        )
-        timed_parts = map_text_blocks_to_word_spans(parts, run)
-        timed_parts = enforce_timing(
-            timed_parts,
-            cfg.formatting.min_dur,
-            cfg.formatting.max_dur,
-            split_long=False,
-        )
-        for s, e, ptxt in timed_parts:
-            lines = wrap_text_lines(ptxt, cfg.formatting.max_chars)
-            if len(lines) > cfg.formatting.max_lines:
-                lines = lines[:cfg.formatting.max_lines]
+    for lo, hi in table.silence_runs(silences or []):
+        # Map each block's token count onto the run's words, as
+        # map_text_blocks_to_word_spans does with the block text
+        timed: List[Tuple[float, float, List[Tuple[int, int]]]] = []
+        idx = lo
+        for a, b in splitter.split(token_offsets[lo], token_offsets[hi]):
+            if idx >= hi:
+                break
+            take = min(b - a, hi - idx)
+            timed.append((starts[idx], ends[idx + take - 1], [(a, b)]))
+            idx += take
+
+        # enforce_timing(split_long=False): merge short blocks into the next
+        i = 0
+        while i < len(timed):
+            s, e, ranges = timed[i]
+            if e - s < f.min_dur and i + 1 < len(timed):
+                e = timed[i + 1][1]
+                ranges = ranges + timed[i + 1][2]
+                i += 2
+            else:
+                i += 1
+            if len(ranges) == 2 and ranges[0][1] == ranges[1][0]:
+                ranges = [(ranges[0][0], ranges[1][1])]
+            if len(ranges) == 1:
+                lines = [" ".join(tokens[p:q]) for p, q in splitter.wrap(*ranges[0])]
+            else:
+                text = " ".join(" ".join(tokens[p:q]) for p, q in ranges)
+                lines = wrap_text_lines(text, f.max_chars)
+            if len(lines) > f.max_lines:
+                lines = lines[:f.max_lines]
             subs.append(SubtitleBlock(start=float(s), end=float(e), lines=lines))
     return subs
 
@@ -389,6 +421,22 @@ def words_to_subtitles(words: List[WordItem]) -> List[SubtitleBlock]:
 # Silence Alignment
 # ============================================================
 
+def _clamp_out_of_silence(t: float, index: IntervalIndex, *, to_end: bool) -> float:
+    """Move ``t`` to the end (or start) of each silence containing it.
+
+    Visits silences in start order and only looks forward after each move,
+    matching a single pass over the sorted silence list.
+    """
+    pos = 0
+    while True:
+        hit = index.first_containing(t, pos)
+        if hit is None:
+            return t
+        ss, ee = index[hit][:2]
+        t = ee if to_end else ss
+        pos = hit + 1
+
+
 def apply_silence_alignment(
     subs: List[SubtitleBlock],
     silences: List[Tuple[float, float]],
@@ -405,21 +453,16 @@ def apply_silence_alignment(
     if not subs or not silences:
         return subs
 
+    index = as_interval_index(silences)
     aligned: List[SubtitleBlock] = []
     for i, sb in enumerate(subs):
-        s = sb.start
-        e = sb.end
-
         # Clamp if start/end sit inside detected silence.
-        for ss, ee in silences:
-            if s >= ss and s <= ee:
-                s = ee
-            if e >= ss and e <= ee:
-                e = ss
+        s = _clamp_out_of_silence(sb.start, index, to_end=True)
+        e = _clamp_out_of_silence(sb.end, index, to_end=False)
 
         # If silence exists between this and next block, align to the gap.
         if i + 1 < len(subs):
-            gap = silence_between(e, subs[i + 1].start, silences)
+            gap = index.first_within(e, subs[i + 1].start)
             if gap is not None:
                 s_start, s_end = gap
                 e = min(e, s_start)
@@ -475,43 +518,51 @@ def hygiene_and_polish(
     Returns:
         List of polished SubtitleBlock objects
     """
-    # Remove empties / normalize
-    cleaned: List[SubtitleBlock] = []
+    # Remove empties / normalize; each block's text is normalized once
+    texts: List[str] = []
+    speakers: List[Optional[str]] = []
+    starts: List[float] = []
+    ends: List[float] = []
     for sb in subs:
         txt = subs_text(sb)
         if not txt:
             continue
         s = max(0.0, float(sb.start))
-        e = max(s + 0.001, float(sb.end))
-        cleaned.append(
-            SubtitleBlock(s, e, wrap_text_lines(txt, 10_000), sb.speaker)
-        )  # keep as single line temporarily
+        texts.append(txt)
+        speakers.append(sb.speaker)
+        starts.append(s)
+        ends.append(max(s + 0.001, float(sb.end)))
 
-    if not cleaned:
+    if not texts:
         return []
 
-    # Sort by time
-    cleaned.sort(key=lambda x: (x.start, x.end))
+    # Sort by time (stable, like list.sort)
+    order = sorted(range(len(texts)), key=lambda k: (starts[k], ends[k]))
+    silence_index = as_interval_index(silence_intervals) if silence_intervals else None
 
     # Merge identical consecutive blocks unless a silence gap is present
-    merged: List[SubtitleBlock] = []
-    for sb in cleaned:
-        if merged and subs_text(merged[-1]) == subs_text(sb) and merged[-1].speaker == sb.speaker:
-            if silence_intervals and silence_between(merged[-1].end, sb.start, silence_intervals):
-                merged.append(sb)
-            else:
-                merged[-1].end = max(merged[-1].end, sb.end)
-        else:
-            merged.append(sb)
+    kept: List[int] = []
+    m_start: List[float] = []
+    m_end: List[float] = []
+    for k in order:
+        if kept and texts[kept[-1]] == texts[k] and speakers[kept[-1]] == speakers[k]:
+            if not (silence_index and silence_index.first_within(m_end[-1], starts[k])):
+                m_end[-1] = max(m_end[-1], ends[k])
+                continue
+        kept.append(k)
+        m_start.append(starts[k])
+        m_end.append(ends[k])
 
-    # Apply padding and enforce gaps without overlap
-    out: List[SubtitleBlock] = []
-    for i, sb in enumerate(merged):
-        prev_end = out[-1].end if out else None
-        next_start = merged[i + 1].start if i + 1 < len(merged) else None
+    # Apply padding and enforce gaps without overlap, then clamp monotonic
+    count = len(kept)
+    final: List[SubtitleBlock] = []
+    prev_end: Optional[float] = None
+    last_end = 0.0
+    for i in range(count):
+        next_start = m_start[i + 1] if i + 1 < count else None
 
-        s = sb.start
-        e = sb.end
+        s = m_start[i]
+        e = m_end[i]
 
         # Pad into silence where possible
         if pad > 0:
@@ -527,7 +578,7 @@ def hygiene_and_polish(
 
         # Enforce min gap to previous unless silence gap already exists
         if prev_end is not None:
-            if not silence_intervals or not silence_between(prev_end, s, silence_intervals):
+            if not silence_index or not silence_index.first_within(prev_end, s):
                 if s < prev_end + min_gap:
                     s = prev_end + min_gap
                     if e < s + 0.001:
@@ -535,19 +586,19 @@ def hygiene_and_polish(
 
         # Enforce min gap to next unless silence gap already exists
         if next_start is not None:
-            if not silence_intervals or not silence_between(e, next_start, silence_intervals):
+            if not silence_index or not silence_index.first_within(e, next_start):
                 if e > next_start - min_gap:
                     e = max(s + 0.001, next_start - min_gap)
+        prev_end = e
 
-        out.append(SubtitleBlock(s, e, sb.lines, sb.speaker))
-
-    # Final monotonic clamp
-    final: List[SubtitleBlock] = []
-    last_end = 0.0
-    for sb in out:
-        s = max(last_end, sb.start)
-        e = max(s + 0.001, sb.end)
-        final.append(SubtitleBlock(s, e, sb.lines, sb.speaker))
+        # Final monotonic clamp
+        s = max(last_end, s)
+        e = max(s + 0.001, e)
         last_end = e
 
+        # Single line; wrap only past the 10k-character line limit
+        txt = texts[kept[i]]
+        lines = [txt] if len(txt) <= 10_000 else wrap_text_lines(txt, 10_000)
+        final.append(SubtitleBlock(s, e, lines, speakers[kept[i]]))
+
     return final
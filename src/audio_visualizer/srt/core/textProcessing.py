@@ -7,7 +7,8 @@ distribution algorithms used for subtitle generation.
 from __future__ import annotations
 
 import re
-from typing import List, Tuple
+from bisect import bisect_right
+from typing import List, Sequence, Tuple
 
 
 # ============================================================
@@ -134,6 +135,157 @@ def split_on_delims(text: str, delims: str) -> List[str]:
     return parts
 
 
+# Split tiers, coarsest first
+_SENTENCE_DELIMS = ".?!"
+_MEDIUM_DELIMS = ";:"
+_COMMA_DELIMS = ","
+
+_WORD_CHAR = re.compile(r"\w")
+
+
+def has_word_char(text: str) -> bool:
+    """Return True if ``text`` contains a word character (``\\w``)."""
+    return _WORD_CHAR.search(text) is not None
+
+
+def split_tiers(allow_commas: bool = True, allow_medium: bool = True) -> List[str]:
+    """Return the delimiter tiers used by ``split_text_into_blocks``.
+
+    Args:
+        allow_commas: Include the comma tier
+        allow_medium: Include the semicolon/colon tier
+
+    Returns:
+        Delimiter strings, coarsest first
+    """
+    tiers: List[str] = [_SENTENCE_DELIMS]
+    if allow_medium:
+        tiers.append(_MEDIUM_DELIMS)
+    if allow_commas:
+        tiers.append(_COMMA_DELIMS)
+    return tiers
+
+
+class TokenSplitter:
+    """``split_text_into_blocks`` over a token sequence.
+
+    Works on token index ranges instead of strings: line wrapping bisects
+    running character offsets, and delimiter splits read per-token flags,
+    so no text is joined, re-normalized or re-wrapped while splitting.
+    The results are the token ranges of exactly the blocks the string
+    algorithm produces (``split_on_delims`` semantics included: a token
+    ending in a tier delimiter closes a part unless it is the last token,
+    or a one-character first token; parts without a word character are
+    dropped).
+
+    Args:
+        lengths: Character length of each token
+        ends_with: For each tier, whether each token ends with one of its
+            delimiters
+        has_word: Whether each token contains a word character
+        max_chars_per_line: Maximum characters per line
+        max_lines: Maximum lines per block
+        prefer_punct_splits: Prefer splitting at punctuation even when
+            text fits
+    """
+
+    def __init__(
+        self,
+        lengths: Sequence[int],
+        ends_with: Sequence[Sequence[bool]],
+        has_word: Sequence[bool],
+        max_chars_per_line: int,
+        max_lines: int,
+        prefer_punct_splits: bool = False,
+    ) -> None:
+        offsets = [0]
+        total = 0
+        for length in lengths:
+            total += length + 1
+            offsets.append(total)
+        # Text of tokens [a, b) is offsets[b] - offsets[a] - 1 characters long
+        self.offsets = offsets
+        self.lengths = lengths
+        self.ends_with = ends_with
+        self.has_word = has_word
+        self.max_chars = max_chars_per_line
+        self.max_lines = max_lines
+        self.prefer = prefer_punct_splits
+
+    def _line_end(self, i: int, b: int) -> int:
+        """End of the greedy line starting at token ``i`` (within ``b``)."""
+        j = bisect_right(self.offsets, self.offsets[i] + self.max_chars + 1, i + 1, b + 1) - 1
+        return j if j > i else i + 1
+
+    def wrap(self, a: int, b: int) -> List[Tuple[int, int]]:
+        """Token ranges of ``wrap_text_lines`` over tokens ``[a, b)``."""
+        lines: List[Tuple[int, int]] = []
+        i = a
+        while i < b:
+            j = self._line_end(i, b)
+            lines.append((i, j))
+            i = j
+        return lines
+
+    def fits(self, a: int, b: int) -> bool:
+        """``block_fits`` over tokens ``[a, b)``, stopping at the first extra line."""
+        i = a
+        lines = 0
+        while i < b:
+            lines += 1
+            if lines > self.max_lines:
+                return False
+            i = self._line_end(i, b)
+        return True
+
+    def fallback(self, a: int, b: int) -> List[Tuple[int, int]]:
+        """Token ranges of ``wrap_fallback_blocks`` over tokens ``[a, b)``."""
+        lines = self.wrap(a, b)
+        step = self.max_lines
+        return [(lines[k][0], lines[min(k + step, len(lines)) - 1][1]) for k in range(0, len(lines), step)]
+
+    def split_on_tier(self, a: int, b: int, tier: int) -> List[Tuple[int, int]]:
+        """Token ranges of ``split_on_delims`` over tokens ``[a, b)``."""
+        ends = self.ends_with[tier]
+        parts: List[Tuple[int, int]] = []
+        lo = a
+        for i in range(a, b - 1):
+            if ends[i] and (i > a or self.lengths[i] > 1):
+                parts.append((lo, i + 1))
+                lo = i + 1
+        parts.append((lo, b))
+        has_word = self.has_word
+        return [(p, q) for p, q in parts if any(has_word[p:q])]
+
+    def _refine(self, a: int, b: int, tier: int, out: List[Tuple[int, int]]) -> None:
+        if a >= b:
+            return
+        if self.fits(a, b) and not (self.prefer and tier == 0):
+            out.append((a, b))
+            return
+        if tier >= len(self.ends_with):
+            out.extend(self.fallback(a, b))
+            return
+        parts = self.split_on_tier(a, b, tier)
+        if len(parts) <= 1:
+            self._refine(a, b, tier + 1, out)
+            return
+        for p, q in parts:
+            self._refine(p, q, tier + 1, out)
+
+    def split(self, a: int, b: int) -> List[Tuple[int, int]]:
+        """Token ranges of ``split_text_into_blocks`` over tokens ``[a, b)``."""
+        blocks: List[Tuple[int, int]] = []
+        self._refine(a, b, 0, blocks)
+        safe: List[Tuple[int, int]] = []
+        for p, q in blocks:
+            if self.fits(p, q):
+                safe.append((p, q))
+            else:
+                safe.extend(self.fallback(p, q))
+        return safe
+
+
 def split_text_into_blocks(
     text: str,
     max_chars_per_line: int,
@@ -159,42 +311,17 @@ def split_text_into_blocks(
     if not text:
         return []
 
-    tiers: List[str] = [".?!"]
-    if allow_medium:
-        tiers.append(";:")
-    if allow_commas:
-        tiers.append(",")
-
-    def refine_chunk(chunk: str, tier_index: int) -> List[str]:
-        chunk = normalize_spaces(chunk)
-        if not chunk:
-            return []
-
-        fits = block_fits(chunk, max_chars_per_line, max_lines)
-        if fits and not (prefer_punct_splits and tier_index == 0):
-            return [chunk]
-
-        if tier_index >= len(tiers):
-            return wrap_fallback_blocks(chunk, max_chars_per_line, max_lines)
-
-        parts = split_on_delims(chunk, tiers[tier_index])
-        if len(parts) <= 1:
-            return refine_chunk(chunk, tier_index + 1)
-
-        out: List[str] = []
-        for p in parts:
-            out.extend(refine_chunk(p, tier_index + 1))
-        return out
-
-    blocks = refine_chunk(text, 0)
-
-    safe: List[str] = []
-    for b in blocks:
-        if block_fits(b, max_chars_per_line, max_lines):
-            safe.append(b)
-        else:
-            safe.extend(wrap_fallback_blocks(b, max_chars_per_line, max_lines))
-    return safe
+    tokens = text.split(" ")
+    tiers = split_tiers(allow_commas, allow_medium)
+    splitter = TokenSplitter(
+        [len(tok) for tok in tokens],
+        [[tok[-1] in delims for tok in tokens] for delims in tiers],
+        [has_word_char(tok) for tok in tokens],
+        max_chars_per_line,
+        max_lines,
+        prefer_punct_splits,
+    )
+    return [" ".join(tokens[a:b]) for a, b in splitter.split(0, len(tokens))]
 
 
 def preferred_split_index(text: str) -> int:
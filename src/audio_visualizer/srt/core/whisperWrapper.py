@@ -68,6 +68,10 @@ def init_whisper_model_internal(
     device: str,               # auto|cpu|cuda
     strict_cuda: bool,
     emitter: Optional[AppEventEmitter] = None,
+    *,
+    num_workers: int = 1,
+    cpu_threads: int = 0,
+    compute_type: Optional[str] = None,
 ) -> Tuple[Any, str, str]:
     """Initialize a Whisper model with appropriate device and compute type.
 
@@ -76,6 +80,10 @@ def init_whisper_model_internal(
         device: Device selection: "auto", "cpu", or "cuda"
         strict_cuda: If True, fail if CUDA requested but unavailable
         emitter: Optional event emitter for log events
+        num_workers: Number of model replicas able to transcribe concurrently
+        cpu_threads: CPU threads per replica (0 lets CTranslate2 decide)
+        compute_type: CTranslate2 compute type to use instead of the device
+            default (int8 on CPU, float16 on CUDA)
 
     Returns:
         Tuple of (model, device_used, compute_type_used)
@@ -85,9 +93,17 @@ def init_whisper_model_internal(
     """
     from faster_whisper import WhisperModel
 
+    # Only pass non-default options so older faster-whisper builds keep working
+    options = {}
+    if num_workers > 1:
+        options["num_workers"] = num_workers
+    if cpu_threads > 0:
+        options["cpu_threads"] = cpu_threads
+    compute_override = compute_type
+
     if device == "cpu":
-        compute_type = "int8"
-        return WhisperModel(model_name, device="cpu", compute_type=compute_type), "cpu", compute_type
+        compute_type = compute_override or "int8"
+        return WhisperModel(model_name, device="cpu", compute_type=compute_type, **options), "cpu", compute_type
 
     if device == "cuda":
         cuda_ok, cuda_diag = _check_cuda_runtime()
@@ -95,32 +111,32 @@ def init_whisper_model_internal(
             if strict_cuda:
                 raise RuntimeError(cuda_diag)
             _emit(emitter, AppEvent(event_type=EventType.LOG, message=cuda_diag))
-            compute_type = "int8"
-            return WhisperModel(model_name, device="cpu", compute_type=compute_type), "cpu", compute_type
+            compute_type = compute_override or "int8"
+            return WhisperModel(model_name, device="cpu", compute_type=compute_type, **options), "cpu", compute_type
         try:
-            compute_type = "float16"
-            m = WhisperModel(model_name, device="cuda", compute_type=compute_type)
-            _emit(emitter, AppEvent(event_type=EventType.LOG, message="Using device=cuda compute_type=float16"))
+            compute_type = compute_override or "float16"
+            m = WhisperModel(model_name, device="cuda", compute_type=compute_type, **options)
+            _emit(emitter, AppEvent(event_type=EventType.LOG, message=f"Using device=cuda compute_type={compute_type}"))
             return m, "cuda", compute_type
         except Exception as e:
             if strict_cuda:
                 raise RuntimeError(f"CUDA requested but init failed: {e}") from e
             _emit(emitter, AppEvent(event_type=EventType.LOG, message=f"CUDA init failed; falling back to CPU. Reason: {e}"))
-            compute_type = "int8"
-            return WhisperModel(model_name, device="cpu", compute_type=compute_type), "cpu", compute_type
+            compute_type = compute_override or "int8"
+            return WhisperModel(model_name, device="cpu", compute_type=compute_type, **options), "cpu", compute_type
 
     # auto
     cuda_ok, cuda_diag = _check_cuda_runtime()
     if not cuda_ok:
         _emit(emitter, AppEvent(event_type=EventType.LOG, message=cuda_diag))
-        compute_type = "int8"
-        return WhisperModel(model_name, device="cpu", compute_type=compute_type), "cpu", compute_type
+        compute_type = compute_override or "int8"
+        return WhisperModel(model_name, device="cpu", compute_type=compute_type, **options), "cpu", compute_type
     try:
-        compute_type = "float16"
-        m = WhisperModel(model_name, device="cuda", compute_type=compute_type)
-        _emit(emitter, AppEvent(event_type=EventType.LOG, message="CUDA available: using device=cuda compute_type=float16"))
+        compute_type = compute_override or "float16"
+        m = WhisperModel(model_name, device="cuda", compute_type=compute_type, **options)
+        _emit(emitter, AppEvent(event_type=EventType.LOG, message=f"CUDA available: using device=cuda compute_type={compute_type}"))
         return m, "cuda", compute_type
     except Exception as e:
         _emit(emitter, AppEvent(event_type=EventType.LOG, message=f"CUDA not available; using CPU. Reason: {e}"))
-        compute_type = "int8"
-        return WhisperModel(model_name, device="cpu", compute_type=compute_type), "cpu", compute_type
+        compute_type = compute_override or "int8"
+        return WhisperModel(model_name, device="cpu", compute_type=compute_type, **options), "cpu", compute_type
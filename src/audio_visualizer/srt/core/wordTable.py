@@ -0,0 +1,217 @@
+"""Column-oriented word tables for subtitle chunking.
+
+Chunking a long transcript one ``WordItem`` at a time spends most of its
+time re-joining, re-normalizing and re-wrapping the same strings at every
+split tier.  A :class:`WordTable` stores the words once as columns instead:
+
+* ``starts`` / ``ends`` -- NumPy float64 timing columns, one row per word;
+* ``token_offsets`` -- the tokens of word ``i`` are
+  ``codes[token_offsets[i]:token_offsets[i + 1]]`` (a word whose text
+  normalizes to several space-separated tokens spans several, an empty
+  word none);
+* ``codes`` / ``lengths`` -- per-token codes into an interned
+  :class:`TextStore` and the token lengths.
+
+Per-token properties (length, trailing delimiter, word characters) are
+computed once per distinct token in the store and gathered with array
+indexing; silence-run boundaries are found for every word gap at once.
+``TokenSplitter`` then chunks index ranges of the table without building
+strings until the final subtitle lines.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from audio_visualizer.srt.core.textProcessing import (
+    TokenSplitter,
+    has_word_char,
+    normalize_spaces,
+    split_tiers,
+)
+
+
+class TextStore:
+    """Interned token texts.
+
+    Each distinct token is stored once; tables refer to it by code, and
+    per-token properties are computed once per distinct token.
+    """
+
+    def __init__(self) -> None:
+        self.texts: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def intern(self, text: str) -> int:
+        """Return the code of ``text``, adding it if new."""
+        code = self._codes.get(text)
+        if code is None:
+            code = len(self.texts)
+            self._codes[text] = code
+            self.texts.append(text)
+        return code
+
+    def lengths(self) -> Any:
+        """Character length of every stored text (int64 array)."""
+        import numpy as np
+
+        return np.fromiter((len(t) for t in self.texts), dtype=np.int64, count=len(self.texts))
+
+    def ends_with(self, delims: str) -> Any:
+        """Whether every stored text ends with one of ``delims`` (bool array)."""
+        import numpy as np
+
+        return np.fromiter((bool(t) and t[-1] in delims for t in self.texts), dtype=bool, count=len(self.texts))
+
+    def has_word(self) -> Any:
+        """Whether every stored text contains a word character (bool array)."""
+        import numpy as np
+
+        return np.fromiter(
+            (has_word_char(t) for t in self.texts), dtype=bool, count=len(self.texts)
+        )
+
+
+@dataclass
+class WordTable:
+    """Words as timing columns plus interned, normalized tokens.
+
+    Attributes:
+        starts: Word start times (float64)
+        ends: Word end times (float64)
+        token_offsets: Token range of each word (int64, ``len(words) + 1``)
+        codes: Token codes into ``store`` (int64)
+        store: Interned token texts
+    """
+
+    starts: Any
+    ends: Any
+    token_offsets: Any
+    codes: Any
+    store: TextStore
+
+    @classmethod
+    def from_words(cls, words: Sequence[Any], store: TextStore | None = None) -> "WordTable":
+        """Build a table from ``WordItem``-like objects (``start``, ``end``, ``text``).
+
+        Word texts are normalized with ``normalize_spaces`` once per
+        distinct raw text, so the tokens of a run are exactly the tokens
+        of ``words_to_text(run)``.
+        """
+        import numpy as np
+
+        store = store if store is not None else TextStore()
+        n = len(words)
+        starts = np.fromiter((w.start for w in words), dtype=np.float64, count=n)
+        ends = np.fromiter((w.end for w in words), dtype=np.float64, count=n)
+
+        # Tokenize each distinct raw text once, then gather per word
+        raw_codes: Dict[str, int] = {}
+        raw = np.fromiter(
+            (raw_codes.setdefault(w.text, len(raw_codes)) for w in words), dtype=np.int64, count=n
+        )
+        raw_tokens: List[int] = []
+        raw_offsets = [0]
+        for text in raw_codes:
+            text = normalize_spaces(text)
+            if text:
+                raw_tokens.extend(store.intern(tok) for tok in text.split(" "))
+            raw_offsets.append(len(raw_tokens))
+        raw_starts = np.asarray(raw_offsets, dtype=np.int64)
+        counts = (raw_starts[1:] - raw_starts[:-1])[raw]
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        gather = np.repeat(raw_starts[:-1][raw] - offsets[:-1], counts) + np.arange(offsets[-1])
+        return cls(
+            starts=starts,
+            ends=ends,
+            token_offsets=offsets,
+            codes=np.asarray(raw_tokens, dtype=np.int64)[gather],
+            store=store,
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @property
+    def lengths(self) -> Any:
+        """Character length of every token (int64 array)."""
+        import numpy as np
+
+        if not len(self.store):
+            return np.zeros(0, dtype=np.int64)
+        return self.store.lengths()[self.codes]
+
+    def tokens(self) -> List[str]:
+        """Token texts in order."""
+        texts = self.store.texts
+        return [texts[c] for c in self.codes.tolist()]
+
+    def splitter(
+        self,
+        max_chars_per_line: int,
+        max_lines: int,
+        *,
+        allow_commas: bool = True,
+        allow_medium: bool = True,
+        prefer_punct_splits: bool = False,
+    ) -> TokenSplitter:
+        """Return a ``TokenSplitter`` over this table's tokens."""
+        codes = self.codes
+        store = self.store
+        if len(store):
+            ends_with = [
+                store.ends_with(delims)[codes].tolist()
+                for delims in split_tiers(allow_commas, allow_medium)
+            ]
+            has_word = store.has_word()[codes].tolist()
+        else:
+            ends_with = [[] for _ in split_tiers(allow_commas, allow_medium)]
+            has_word = []
+        return TokenSplitter(
+            self.lengths.tolist(),
+            ends_with,
+            has_word,
+            max_chars_per_line,
+            max_lines,
+            prefer_punct_splits,
+        )
+
+    def silence_runs(self, silences: Iterable[Sequence[float]]) -> List[Tuple[int, int]]:
+        """Split the words into runs at detected silences.
+
+        Same runs as ``split_words_on_silence``: a run ends wherever a
+        silence lies entirely between a word's end and the next word's
+        start.  All gaps are tested at once: after sorting the silences by
+        start, a gap ``[g0, g1]`` contains one exactly when the minimum of
+        ``max(start, end)`` over the silences starting at or after ``g0``
+        is at most ``g1``.
+
+        Args:
+            silences: ``(start, end)`` silence intervals (or an ``IntervalIndex``)
+
+        Returns:
+            ``(first_word, end_word)`` index ranges covering every word
+        """
+        import numpy as np
+
+        n = len(self)
+        if n == 0:
+            return []
+        intervals = sorted(((iv[0], iv[1]) for iv in silences), key=lambda iv: iv[0])
+        if not intervals or n == 1:
+            return [(0, n)]
+        sil = np.asarray(intervals, dtype=np.float64)
+        sil_starts = sil[:, 0]
+        suffix_min = np.minimum.accumulate(np.maximum(sil_starts, sil[:, 1])[::-1])[::-1]
+        gap_starts = self.ends[:-1]
+        gap_ends = self.starts[1:]
+        first = np.searchsorted(sil_starts, gap_starts, side="left")
+        inside = first < len(sil_starts)
+        breaks = np.zeros(n - 1, dtype=bool)
+        breaks[inside] = suffix_min[first[inside]] <= gap_ends[inside]
+        bounds = [0] + (np.flatnonzero(breaks) + 1).tolist() + [n]
+        return list(zip(bounds[:-1], bounds[1:]))
@@ -1,10 +1,13 @@
 """Subtitle I/O utilities.
 
 Public API:
-    read_json_bundle  — Normalized bundle reader.
+    read_bundle       — Bundle reader for JSON and columnar bundles.
+    read_json_bundle  — Normalized JSON bundle reader.
     write_json_bundle — Bundle writer.
+
+Columnar bundles are written and read by ``srt.io.columnarBundle``.
 """
-from audio_visualizer.srt.io.bundleReader import read_json_bundle
+from audio_visualizer.srt.io.bundleReader import read_bundle, read_json_bundle
 from audio_visualizer.srt.io.outputWriters import write_json_bundle
 
-__all__ = ["read_json_bundle", "write_json_bundle"]
+__all__ = ["read_bundle", "read_json_bundle", "write_json_bundle"]
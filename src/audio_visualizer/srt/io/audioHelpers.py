@@ -1,16 +1,268 @@
 #!/usr/bin/env python3
 """Audio processing utilities for Local SRT.
 
-This module handles audio conversion and silence detection using ffmpeg.
+This module handles audio decoding, conversion and silence detection.
+Media is decoded once with PyAV into an in-memory 16 kHz mono float32
+buffer (:class:`DecodedAudio`) that feeds transcription, silence detection,
+duration and diarization without intermediate files.
 """
 from __future__ import annotations
 
+import logging
 import re
 import subprocess
-from typing import List, Optional, Tuple
+import wave
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from audio_visualizer.srt.io.systemHelpers import ffmpeg_ok, probe_duration_seconds, run_cmd_text
 
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Sample rate expected by Whisper and pyannote
+WHISPER_SAMPLE_RATE = 16000
+
+
+# ============================================================
+# In-Memory Audio
+# ============================================================
+
+@dataclass
+class DecodedAudio:
+    """Mono float32 PCM decoded from a media file.
+
+    Attributes:
+        samples: 1-D float32 array in [-1.0, 1.0]
+        sample_rate: Sample rate of ``samples`` in Hz
+    """
+
+    samples: "np.ndarray"
+    sample_rate: int = WHISPER_SAMPLE_RATE
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds."""
+        return len(self.samples) / float(self.sample_rate)
+
+    def to_pyannote_input(self) -> Dict[str, Any]:
+        """Return the in-memory input mapping accepted by pyannote pipelines."""
+        import torch
+
+        waveform = torch.from_numpy(self.samples).unsqueeze(0)
+        return {"waveform": waveform, "sample_rate": self.sample_rate}
+
+    def write_wav(self, wav_path: str) -> None:
+        """Write the samples as a 16-bit PCM mono WAV file.
+
+        Args:
+            wav_path: Path where the WAV file should be written
+        """
+        import numpy as np
+
+        pcm = np.clip(self.samples, -1.0, 1.0)
+        pcm = (pcm * 32767.0).round().astype("<i2")
+        with wave.open(wav_path, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(self.sample_rate)
+            wav_file.writeframes(pcm.tobytes())
+
+
+# Decoded frames are downmixed and resampled in blocks of this many seconds;
+# pushing codec-sized frames (~1024 samples) through the resampler one at a
+# time costs more than the decode itself
+_RESAMPLE_BLOCK_SECONDS = 10
+
+
+# Little-endian numpy dtypes of FFmpeg sample formats (planar variants end in "p")
+_SAMPLE_DTYPES = {
+    "u8": "u1",
+    "s16": "<i2",
+    "s32": "<i4",
+    "s64": "<i8",
+    "flt": "<f4",
+    "dbl": "<f8",
+}
+
+
+class _MonoBlockResampler:
+    """Downmixes decoded frames by averaging channels and resamples them in blocks.
+
+    Averaging matches ``ffmpeg -ac 1`` for mono and stereo sources (the
+    resampler's own mono downmix is 3 dB louder for stereo, which would
+    shift silence thresholds). Downmixing before resampling gives the same
+    samples as the other way round because both steps are linear. Frame
+    planes are collected as raw bytes and converted once per block.
+    """
+
+    def __init__(self, rate: int) -> None:
+        self.rate = rate
+        self.chunks: List["np.ndarray"] = []
+        self._pending: List[List[memoryview]] = []
+        self._pending_samples = 0
+        self._source: Optional[Tuple[int, int, str]] = None
+        self._resampler: Any = None
+        self._pts = 0
+
+    def push(self, frame: Any) -> None:
+        fmt = frame.format
+        channels = len(frame.layout.channels)
+        source = (frame.sample_rate, channels, fmt.name)
+        if source != self._source:
+            self._flush_block()
+            if self._source is None or source[0] != self._source[0]:
+                self._drain()
+            self._source = source
+            self._pending = [[] for _ in range(channels if fmt.is_planar else 1)]
+
+        samples = frame.samples
+        if fmt.is_planar:
+            size = samples * fmt.bytes
+            for plane, pending in zip(frame.planes, self._pending):
+                pending.append(memoryview(plane)[:size])
+        else:
+            self._pending[0].append(memoryview(frame.planes[0])[: samples * channels * fmt.bytes])
+        self._pending_samples += samples
+        if self._pending_samples >= source[0] * _RESAMPLE_BLOCK_SECONDS:
+            self._flush_block()
+
+    def finish(self) -> None:
+        self._flush_block()
+        self._drain()
+
+    def take(self) -> List["np.ndarray"]:
+        """Return and forget the output produced so far."""
+        chunks, self.chunks = self.chunks, []
+        return chunks
+
+    def _block_to_mono(self) -> "np.ndarray":
+        import numpy as np
+
+        rate, channels, name = self._source
+        planar = name.endswith("p")
+        base = name[:-1] if planar else name
+        dtype = _SAMPLE_DTYPES.get(base)
+        if dtype is None:
+            raise RuntimeError(f"Unsupported audio sample format: {name}")
+
+        planes = [np.frombuffer(b"".join(views), dtype=dtype) for views in self._pending]
+        if not planar:
+            planes = list(planes[0].reshape(-1, channels).T)
+
+        if base == "u8":
+            offset, scale = 128.0, 1.0 / 128.0
+        elif base in ("s16", "s32", "s64"):
+            offset, scale = 0.0, 1.0 / 2 ** (np.dtype(dtype).itemsize * 8 - 1)
+        else:
+            offset, scale = 0.0, 1.0
+
+        mono = planes[0].astype(np.float32)
+        for plane in planes[1:]:
+            mono += plane
+        mono -= offset * len(planes)
+        mono *= scale / len(planes)
+        return mono
+
+    def _flush_block(self) -> None:
+        import av
+        import numpy as np
+
+        if not self._pending_samples:
+            return
+        mono = self._block_to_mono()
+        self._pending = [[] for _ in self._pending]
+        self._pending_samples = 0
+
+        if self._resampler is None:
+            self._resampler = av.AudioResampler(format="flt", layout="mono", rate=self.rate)
+        block = av.AudioFrame.from_ndarray(mono.reshape(1, -1), format="flt", layout="mono")
+        block.sample_rate = self._source[0]
+        block.pts = self._pts
+        self._pts += mono.shape[0]
+        for resampled in self._resampler.resample(block):
+            self.chunks.append(resampled.to_ndarray().reshape(-1).copy())
+
+    def _drain(self) -> None:
+        if self._resampler is None:
+            return
+        for resampled in self._resampler.resample(None):
+            self.chunks.append(resampled.to_ndarray().reshape(-1).copy())
+        self._resampler = None
+        self._pts = 0
+
+
+def iter_audio_blocks(input_path: str, sample_rate: int = WHISPER_SAMPLE_RATE) -> Iterator["np.ndarray"]:
+    """Decode the first audio stream of a media file as mono float32 blocks.
+
+    Blocks are about ten seconds long, so long inputs can be processed
+    while they are decoded.
+
+    Args:
+        input_path: Path to input audio/video file
+        sample_rate: Output sample rate in Hz
+
+    Yields:
+        1-D float32 arrays in [-1.0, 1.0]
+
+    Raises:
+        ValueError: If the file has no audio stream
+        RuntimeError: If the file cannot be decoded
+    """
+    import av
+
+    try:
+        container = av.open(input_path)
+    except av.FFmpegError as exc:
+        raise RuntimeError(f"Could not open {input_path}: {exc}") from exc
+
+    try:
+        if not container.streams.audio:
+            raise ValueError(f"No audio stream found in {input_path}")
+        stream = container.streams.audio[0]
+        resampler = _MonoBlockResampler(sample_rate)
+        try:
+            for frame in container.decode(stream):
+                resampler.push(frame)
+                if resampler.chunks:
+                    yield from resampler.take()
+            resampler.finish()
+        except av.FFmpegError as exc:
+            raise RuntimeError(f"Could not decode audio from {input_path}: {exc}") from exc
+        yield from resampler.take()
+    finally:
+        container.close()
+
+
+def decode_audio_16k_mono(input_path: str) -> DecodedAudio:
+    """Decode and resample the first audio stream of a media file in memory.
+
+    Produces the same samples as :func:`to_wav_16k_mono` for mono and stereo
+    sources (other layouts are downmixed by averaging the channels) without
+    writing a file, so one decode can feed every stage of the SRT pipeline.
+
+    Args:
+        input_path: Path to input audio/video file
+
+    Returns:
+        DecodedAudio at 16 kHz mono
+
+    Raises:
+        ValueError: If the file has no audio stream
+        RuntimeError: If the file cannot be decoded
+    """
+    import numpy as np
+
+    chunks = list(iter_audio_blocks(input_path, WHISPER_SAMPLE_RATE))
+    if chunks:
+        samples = np.concatenate(chunks)
+    else:
+        samples = np.zeros(0, dtype=np.float32)
+    return DecodedAudio(samples=samples, sample_rate=WHISPER_SAMPLE_RATE)
+
 
 # ============================================================
 # Silence Detection
@@ -21,15 +273,63 @@ _SILENCE_END_RE = re.compile(r"silence_end:\s*([0-9.]+)")
 
 
 def detect_silences(
-    wav_path: str,
+    wav_path: Union[str, DecodedAudio],
     *,
     min_silence_dur: float,
     silence_threshold_db: float,
 ) -> List[Tuple[float, float]]:
-    """Detect silent regions in an audio file using ffmpeg's silencedetect filter.
+    """Detect silent regions in audio with the NumPy silence detector.
+
+    Decoded audio is analysed directly; a path is decoded and analysed in
+    blocks, so memory stays flat for long files. Intervals match
+    :func:`detect_silences_ffmpeg` to within one 10 ms analysis frame.
 
     Args:
-        wav_path: Path to WAV file to analyze
+        wav_path: Path to an audio/video file, or already decoded audio
+        min_silence_dur: Minimum duration of silence to detect (seconds)
+        silence_threshold_db: Silence threshold in dB (e.g., -35.0)
+
+    Returns:
+        List of (start_time, end_time) tuples for detected silent regions
+        (empty if the file cannot be decoded)
+    """
+    from audio_visualizer.srt.io.silenceDetection import SilenceDetector, find_silences
+
+    if isinstance(wav_path, DecodedAudio):
+        return find_silences(
+            wav_path.samples,
+            wav_path.sample_rate,
+            min_silence_dur=min_silence_dur,
+            silence_threshold_db=silence_threshold_db,
+        )
+
+    detector = SilenceDetector(
+        WHISPER_SAMPLE_RATE,
+        min_silence_dur=min_silence_dur,
+        silence_threshold_db=silence_threshold_db,
+    )
+    try:
+        for block in iter_audio_blocks(wav_path, WHISPER_SAMPLE_RATE):
+            detector.feed(block)
+    except (RuntimeError, ValueError) as exc:
+        logger.warning("Silence detection failed for %s: %s", wav_path, exc)
+        return []
+    return detector.finish()
+
+
+def detect_silences_ffmpeg(
+    wav_path: Union[str, DecodedAudio],
+    *,
+    min_silence_dur: float,
+    silence_threshold_db: float,
+) -> List[Tuple[float, float]]:
+    """Detect silent regions in audio using ffmpeg's silencedetect filter.
+
+    Reference implementation for :func:`detect_silences`.
+
+    Args:
+        wav_path: Path to WAV file to analyze, or already decoded audio
+            (piped to ffmpeg as raw PCM, so the source is not decoded again)
         min_silence_dur: Minimum duration of silence to detect (seconds)
         silence_threshold_db: Silence threshold in dB (e.g., -35.0)
 
@@ -40,8 +340,23 @@ def detect_silences(
         return []
 
     filt = f"silencedetect=noise={silence_threshold_db}dB:d={min_silence_dur}"
-    cmd = ["ffmpeg", "-i", wav_path, "-af", filt, "-f", "null", "-"]
-    code, _, err = run_cmd_text(cmd)
+    if isinstance(wav_path, DecodedAudio):
+        cmd = [
+            "ffmpeg", "-hide_banner",
+            "-f", "f32le", "-ar", str(wav_path.sample_rate), "-ac", "1",
+            "-i", "pipe:0",
+            "-af", filt, "-f", "null", "-",
+        ]
+        p = subprocess.run(
+            cmd,
+            input=wav_path.samples.astype("<f4", copy=False).tobytes(),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        code, err = p.returncode, p.stderr.decode("utf-8", errors="replace")
+    else:
+        cmd = ["ffmpeg", "-i", wav_path, "-af", filt, "-f", "null", "-"]
+        code, _, err = run_cmd_text(cmd)
     if code != 0:
         return []
 
@@ -62,7 +377,10 @@ def detect_silences(
             pending_start = None
 
     if pending_start is not None:
-        dur = probe_duration_seconds(wav_path)
+        if isinstance(wav_path, DecodedAudio):
+            dur: Optional[float] = wav_path.duration
+        else:
+            dur = probe_duration_seconds(wav_path)
         if dur is not None and dur > pending_start:
             silences.append((pending_start, dur))
 
@@ -1,8 +1,9 @@
-"""Bundle reader for JSON subtitle bundles.
+"""Bundle reader for JSON and columnar subtitle bundles.
 
 Reads bundle files and normalizes them into one in-memory contract that
-downstream code can trust.  This is the only entry point for reading
-bundle files — consumers should never parse raw bundle dicts directly.
+downstream code can trust.  ``read_bundle()`` is the entry point for
+reading bundle files: it detects columnar bundles by content and falls
+back to JSON — consumers should never parse raw bundle dicts directly.
 """
 from __future__ import annotations
 
@@ -10,7 +11,7 @@ import json
 import logging
 import uuid as _uuid
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
 
 from audio_visualizer.srt.models import WordItem
 
@@ -47,6 +48,31 @@ logger = logging.getLogger(__name__)
 # }
 
 
+def read_bundle(path: str | Path) -> Mapping[str, Any]:
+    """Read a bundle file in either format.
+
+    Columnar bundles (see ``columnarBundle``) are detected by their magic
+    bytes and returned as a lazily materialized ``ColumnarBundle``; any
+    other file is read with ``read_json_bundle()``.  Both results follow
+    the normalized bundle structure above.
+
+    Args:
+        path: Filesystem path to the bundle file.
+
+    Returns:
+        Normalized bundle mapping.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file is not a valid bundle.
+    """
+    from audio_visualizer.srt.io.columnarBundle import ColumnarBundle, is_columnar_bundle
+
+    if is_columnar_bundle(path):
+        return ColumnarBundle(path)
+    return read_json_bundle(path)
+
+
 def read_json_bundle(path: str | Path) -> dict[str, Any]:
     """Read and normalize a JSON bundle file.
 
@@ -0,0 +1,502 @@
+"""Columnar subtitle bundles.
+
+A compact binary alternative to JSON bundles for long transcripts.  The
+file holds one contiguous array per field instead of one JSON object per
+word, so it can be memory-mapped and read without parsing::
+
+    magic (8 bytes) | header length (uint64 LE) | JSON header | columns
+
+The JSON header carries the bundle metadata, a table of interned strings
+and the dtype, offset and length of every column.  Columns start on
+64-byte boundaries:
+
+* numbers are little-endian ``float64`` arrays; ``NaN`` stands for ``None``
+  (confidences),
+* free text (ids, subtitle text, word text) is an ``int64`` offset array
+  into a UTF-8 blob, plus a null mask only when some value is ``None``,
+* repeated values (speakers, media paths, model names, alignment status)
+  are ``int32`` codes into the interned string table, ``-1`` for ``None``,
+* ``subtitles.word_offsets`` maps subtitle ``i`` to words
+  ``word_offsets[i]:word_offsets[i + 1]``.
+
+:class:`ColumnarBundle` exposes the same keys as the normalized bundle
+returned by :func:`~audio_visualizer.srt.io.bundleReader.read_json_bundle`,
+but subtitle dicts and ``WordItem`` objects are only built when accessed.
+Timing columns are available directly as NumPy arrays.
+
+Conversion is lossless at the level of the normalized bundle contract:
+``read_bundle(json_path)`` and ``read_bundle(columnar_path).to_dict()``
+compare equal.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import struct
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+import numpy as np
+
+from audio_visualizer.srt.io.systemHelpers import ensure_parent_dir
+from audio_visualizer.srt.models import WordItem
+
+logger = logging.getLogger(__name__)
+
+COLUMNAR_BUNDLE_SUFFIX = ".avbundle"
+COLUMNAR_FORMAT_VERSION = 1
+
+_MAGIC = b"AVBNDL\x00\x01"
+_PREAMBLE = struct.Struct("<8sQ")
+_ALIGN = 64
+# Subtitles materialized together on first access
+_BLOCK = 256
+
+_METADATA_KEYS = ("tool_version", "input_file", "device_used", "compute_type_used", "model_name", "config")
+_BUNDLE_KEYS = _METADATA_KEYS + ("subtitles", "words")
+
+# Subtitle fields stored as interned string codes
+_SUBTITLE_INTERNED = (
+    "speaker_label",
+    "source_media_path",
+    "model_name",
+    "device",
+    "compute_type",
+    "alignment_status",
+)
+
+
+def is_columnar_bundle(path: str | Path) -> bool:
+    """Return True if *path* is a columnar bundle file (checked by content)."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(_MAGIC)) == _MAGIC
+    except OSError:
+        return False
+
+
+# ------------------------------------------------------------------
+# Writing
+# ------------------------------------------------------------------
+
+
+class _ColumnWriter:
+    """Collect columns and interned strings for one file."""
+
+    def __init__(self) -> None:
+        self.columns: dict[str, np.ndarray] = {}
+        self.strings: list[Any] = []
+        self._codes: dict[Any, int] = {}
+
+    def add(self, name: str, array: np.ndarray) -> None:
+        self.columns[name] = np.ascontiguousarray(array)
+
+    def add_floats(self, name: str, values: list[Optional[float]]) -> None:
+        self.add(name, np.array([math.nan if v is None else v for v in values], dtype="<f8"))
+
+    def add_text(self, name: str, values: list[Optional[str]]) -> None:
+        encoded = [b"" if v is None else v.encode("utf-8") for v in values]
+        offsets = np.zeros(len(encoded) + 1, dtype="<i8")
+        offsets[1:] = np.cumsum(np.array([len(b) for b in encoded], dtype=np.int64))
+        self.add(f"{name}.offsets", offsets)
+        self.add(f"{name}.data", np.frombuffer(b"".join(encoded), dtype=np.uint8))
+        if any(v is None for v in values):
+            self.add(f"{name}.null", np.array([v is None for v in values], dtype=np.uint8))
+
+    def add_interned(self, name: str, values: list[Any]) -> None:
+        codes = np.empty(len(values), dtype="<i4")
+        for i, value in enumerate(values):
+            if value is None:
+                codes[i] = -1
+                continue
+            key = (type(value).__name__, value)
+            code = self._codes.get(key)
+            if code is None:
+                code = self._codes[key] = len(self.strings)
+                self.strings.append(value)
+            codes[i] = code
+        self.add(name, codes)
+
+    def write(self, out_path: Path, metadata: dict[str, Any], counts: dict[str, int]) -> None:
+        layout: dict[str, dict[str, Any]] = {}
+        offset = 0
+        for name, array in self.columns.items():
+            layout[name] = {"dtype": array.dtype.str, "offset": offset, "length": int(array.size)}
+            offset += -(-array.nbytes // _ALIGN) * _ALIGN
+        header = json.dumps({
+            "version": COLUMNAR_FORMAT_VERSION,
+            "metadata": metadata,
+            "counts": counts,
+            "strings": self.strings,
+            "columns": layout,
+        }, ensure_ascii=False).encode("utf-8")
+        data_start = -(-(_PREAMBLE.size + len(header)) // _ALIGN) * _ALIGN
+        header += b" " * (data_start - _PREAMBLE.size - len(header))
+
+        ensure_parent_dir(out_path)
+        tmp = out_path.with_suffix(out_path.suffix + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_PREAMBLE.pack(_MAGIC, len(header)))
+            f.write(header)
+            for array in self.columns.values():
+                f.write(array.tobytes())
+                f.write(b"\0" * (-array.nbytes % _ALIGN))
+        os.replace(tmp, out_path)
+
+
+def write_columnar_bundle(bundle: Mapping[str, Any], out_path: str | Path) -> None:
+    """Write a normalized bundle as a columnar bundle file.
+
+    Args:
+        bundle: Normalized bundle, as returned by ``read_bundle()`` or
+            ``normalize_bundle()`` (a ``ColumnarBundle`` works too).
+        out_path: Output file path, conventionally ending in ``.avbundle``.
+    """
+    out_path = Path(out_path)
+    subtitles = list(bundle.get("subtitles", []))
+    words: list[WordItem] = []
+    word_offsets = np.zeros(len(subtitles) + 1, dtype="<i8")
+    for i, sub in enumerate(subtitles):
+        words.extend(sub.get("words", []))
+        word_offsets[i + 1] = len(words)
+
+    w = _ColumnWriter()
+    w.add("subtitles.start", np.array([float(s["start"]) for s in subtitles], dtype="<f8"))
+    w.add("subtitles.end", np.array([float(s["end"]) for s in subtitles], dtype="<f8"))
+    w.add("subtitles.word_offsets", word_offsets)
+    w.add_text("subtitles.id", [s.get("id") for s in subtitles])
+    w.add_text("subtitles.text", [s.get("text") for s in subtitles])
+    w.add_text("subtitles.original_text", [s.get("original_text") for s in subtitles])
+    for key in _SUBTITLE_INTERNED:
+        w.add_interned(f"subtitles.{key}", [s.get(key) for s in subtitles])
+    w.add_floats("subtitles.alignment_confidence", [s.get("alignment_confidence") for s in subtitles])
+
+    w.add("words.start", np.array([float(wi.start) for wi in words], dtype="<f8"))
+    w.add("words.end", np.array([float(wi.end) for wi in words], dtype="<f8"))
+    w.add_text("words.id", [wi.id for wi in words])
+    w.add_text("words.text", [wi.text for wi in words])
+    w.add_floats("words.confidence", [wi.confidence for wi in words])
+    w.add_interned("words.speaker_label", [wi.speaker_label for wi in words])
+    # Words almost always point at their own subtitle; store the
+    # back-references only when one does not
+    parent_ids = [sub.get("id") for sub in subtitles for _ in sub.get("words", [])]
+    if any(wi.subtitle_id != parent for wi, parent in zip(words, parent_ids)):
+        w.add_text("words.subtitle_id", [wi.subtitle_id for wi in words])
+
+    w.write(
+        out_path,
+        {key: bundle.get(key, "" if key != "config" else None) for key in _METADATA_KEYS},
+        {"subtitles": len(subtitles), "words": len(words)},
+    )
+
+
+# ------------------------------------------------------------------
+# Reading
+# ------------------------------------------------------------------
+
+
+class _LazyList(Sequence):
+    """Read-only sequence that builds items on access."""
+
+    def __init__(self, length: int, getter: Callable[[int], Any]) -> None:
+        self._length = length
+        self._getter = getter
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._getter(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("bundle index out of range")
+        return self._getter(index)
+
+
+class ColumnarBundle(Mapping):
+    """A memory-mapped columnar bundle with the normalized bundle keys.
+
+    ``bundle["subtitles"]`` and ``bundle["words"]`` are lazy sequences:
+    a subtitle dict (with its ``WordItem`` list) is built the first time it
+    is accessed and then reused, so flat words and subtitle words are the
+    same objects, as in a JSON bundle.
+
+    Args:
+        path: Path to a columnar bundle file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file is not a valid columnar bundle.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        if not self.path.is_file():
+            raise FileNotFoundError(f"Bundle file not found: {self.path}")
+        with open(self.path, "rb") as f:
+            preamble = f.read(_PREAMBLE.size)
+            if len(preamble) < _PREAMBLE.size:
+                raise ValueError(f"Not a columnar bundle file: {self.path}")
+            magic, header_len = _PREAMBLE.unpack(preamble)
+            if magic != _MAGIC:
+                raise ValueError(f"Not a columnar bundle file: {self.path}")
+            try:
+                header = json.loads(f.read(header_len).decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+                raise ValueError(f"Invalid columnar bundle header: {self.path}") from exc
+        if header.get("version") != COLUMNAR_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported columnar bundle version {header.get('version')!r}: {self.path}"
+            )
+
+        self._metadata: dict[str, Any] = header["metadata"]
+        self._strings: list[Any] = header["strings"]
+        self.subtitle_count: int = header["counts"]["subtitles"]
+        self.word_count: int = header["counts"]["words"]
+
+        data_start = _PREAMBLE.size + header_len
+        file_size = self.path.stat().st_size
+        raw = np.memmap(self.path, dtype=np.uint8, mode="r") if file_size > data_start else np.zeros(0, np.uint8)
+        self._columns: dict[str, np.ndarray] = {}
+        for name, spec in header["columns"].items():
+            dtype = np.dtype(spec["dtype"])
+            start = data_start + spec["offset"]
+            end = start + spec["length"] * dtype.itemsize
+            if end > file_size:
+                raise ValueError(f"Truncated columnar bundle ({name}): {self.path}")
+            self._columns[name] = raw[start:end].view(dtype)
+        self._subtitle_cache: dict[int, dict[str, Any]] = {}
+
+    # -- Mapping interface ---------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "subtitles":
+            return _LazyList(self.subtitle_count, self.subtitle)
+        if key == "words":
+            return _LazyList(self.word_count, self.word)
+        if key in _METADATA_KEYS:
+            return self._metadata.get(key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_BUNDLE_KEYS)
+
+    def __len__(self) -> int:
+        return len(_BUNDLE_KEYS)
+
+    # -- Columns ---------------------------------------------------------
+
+    @property
+    def subtitle_starts(self) -> np.ndarray:
+        """Subtitle start times in seconds (read-only ``float64`` view)."""
+        return self._columns["subtitles.start"]
+
+    @property
+    def subtitle_ends(self) -> np.ndarray:
+        """Subtitle end times in seconds."""
+        return self._columns["subtitles.end"]
+
+    @property
+    def word_offsets(self) -> np.ndarray:
+        """Word range of each subtitle: ``word_offsets[i]:word_offsets[i + 1]``."""
+        return self._columns["subtitles.word_offsets"]
+
+    @property
+    def word_starts(self) -> np.ndarray:
+        """Start times of all words, in subtitle order."""
+        return self._columns["words.start"]
+
+    @property
+    def word_ends(self) -> np.ndarray:
+        """End times of all words, in subtitle order."""
+        return self._columns["words.end"]
+
+    def _texts(self, name: str, lo: int, hi: int) -> list[Optional[str]]:
+        """Decode text values ``lo:hi`` of a text column with one blob read."""
+        offsets = self._columns[f"{name}.offsets"][lo:hi + 1].tolist()
+        blob = self._columns[f"{name}.data"][offsets[0]:offsets[-1]].tobytes()
+        base = offsets[0]
+        values: list[Optional[str]] = [
+            blob[a - base:b - base].decode("utf-8") for a, b in zip(offsets, offsets[1:])
+        ]
+        null = self._columns.get(f"{name}.null")
+        if null is not None:
+            for i in np.flatnonzero(null[lo:hi]).tolist():
+                values[i] = None
+        return values
+
+    def _interned(self, name: str, lo: int, hi: int) -> list[Any]:
+        strings = self._strings
+        return [strings[c] if c >= 0 else None for c in self._columns[name][lo:hi].tolist()]
+
+    def _floats(self, name: str, lo: int, hi: int) -> list[Optional[float]]:
+        return [None if v != v else v for v in self._columns[name][lo:hi].tolist()]
+
+    # -- Materialization -----------------------------------------------
+
+    def subtitle_texts(self) -> list[Optional[str]]:
+        """Return the text of every subtitle without building any words."""
+        return self._texts("subtitles.text", 0, self.subtitle_count)
+
+    def word_timing(self, index: int) -> list[dict[str, Any]]:
+        """Return ``{"start", "end", "text"}`` dicts for one subtitle's words.
+
+        Reads the timing columns directly, without building ``WordItem``
+        objects (used by the caption renderer).
+        """
+        return next(self.iter_word_timing(index, index + 1))
+
+    def iter_word_timing(self, lo: int = 0, hi: Optional[int] = None) -> Iterator[list[dict[str, Any]]]:
+        """Yield the word timing dicts of subtitles ``lo:hi`` in order."""
+        hi = self.subtitle_count if hi is None else hi
+        for block_lo in range(lo, hi, _BLOCK):
+            block_hi = min(block_lo + _BLOCK, hi)
+            offsets = self.word_offsets[block_lo:block_hi + 1].tolist()
+            wlo, whi = offsets[0], offsets[-1]
+            timing = [
+                {"start": s, "end": e, "text": t}
+                for s, e, t in zip(
+                    self.word_starts[wlo:whi].tolist(),
+                    self.word_ends[wlo:whi].tolist(),
+                    self._texts("words.text", wlo, whi),
+                )
+            ]
+            for a, b in zip(offsets, offsets[1:]):
+                yield timing[a - wlo:b - wlo]
+
+    def subtitle(self, index: int) -> dict[str, Any]:
+        """Return the normalized subtitle dict at *index*, building it once.
+
+        Subtitles are built in blocks of neighbouring entries, so reading
+        a bundle front to back decodes each column slice once per block.
+        """
+        cached = self._subtitle_cache.get(index)
+        if cached is None:
+            if not 0 <= index < self.subtitle_count:
+                raise IndexError("bundle index out of range")
+            block_lo = index - index % _BLOCK
+            self._build_block(block_lo, min(block_lo + _BLOCK, self.subtitle_count))
+            cached = self._subtitle_cache[index]
+        return cached
+
+    def _build_block(self, lo: int, hi: int) -> None:
+        offsets = self.word_offsets[lo:hi + 1].tolist()
+        wlo, whi = offsets[0], offsets[-1]
+        sub_ids = self._texts("subtitles.id", lo, hi)
+        if "words.subtitle_id.offsets" in self._columns:
+            word_sub_ids = self._texts("words.subtitle_id", wlo, whi)
+        else:
+            word_sub_ids = [sid for sid, a, b in zip(sub_ids, offsets, offsets[1:]) for _ in range(b - a)]
+        words = [
+            WordItem(start=s, end=e, text=t, id=wid, subtitle_id=sid, confidence=c, speaker_label=spk)
+            for s, e, t, wid, sid, c, spk in zip(
+                self.word_starts[wlo:whi].tolist(),
+                self.word_ends[wlo:whi].tolist(),
+                self._texts("words.text", wlo, whi),
+                self._texts("words.id", wlo, whi),
+                word_sub_ids,
+                self._floats("words.confidence", wlo, whi),
+                self._interned("words.speaker_label", wlo, whi),
+            )
+        ]
+        columns = {
+            "id": sub_ids,
+            "start": self.subtitle_starts[lo:hi].tolist(),
+            "end": self.subtitle_ends[lo:hi].tolist(),
+            "text": self._texts("subtitles.text", lo, hi),
+            "original_text": self._texts("subtitles.original_text", lo, hi),
+        }
+        for key in _SUBTITLE_INTERNED:
+            columns[key] = self._interned(f"subtitles.{key}", lo, hi)
+        columns["alignment_confidence"] = self._floats("subtitles.alignment_confidence", lo, hi)
+
+        for k, (a, b) in enumerate(zip(offsets, offsets[1:])):
+            sub: dict[str, Any] = {
+                "id": columns["id"][k],
+                "start": columns["start"][k],
+                "end": columns["end"][k],
+                "text": columns["text"][k],
+                "original_text": columns["original_text"][k],
+                "words": words[a - wlo:b - wlo],
+            }
+            for key in _SUBTITLE_INTERNED:
+                sub[key] = columns[key][k]
+            sub["alignment_confidence"] = columns["alignment_confidence"][k]
+            self._subtitle_cache[lo + k] = sub
+
+    def word(self, index: int) -> WordItem:
+        """Return the flat word at *index* (shared with its subtitle's list)."""
+        sub_index = int(np.searchsorted(self.word_offsets, index, side="right")) - 1
+        return self.subtitle(sub_index)["words"][index - int(self.word_offsets[sub_index])]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Materialize the whole bundle as a normalized bundle dict."""
+        subtitles = [self.subtitle(i) for i in range(self.subtitle_count)]
+        bundle = {key: self._metadata.get(key) for key in _METADATA_KEYS}
+        bundle["subtitles"] = subtitles
+        bundle["words"] = [w for sub in subtitles for w in sub["words"]]
+        return bundle
+
+
+# ------------------------------------------------------------------
+# Conversion
+# ------------------------------------------------------------------
+
+
+def bundle_to_jsonable(bundle: Mapping[str, Any]) -> dict[str, Any]:
+    """Convert a normalized bundle into the JSON bundle payload layout.
+
+    Args:
+        bundle: Normalized bundle (dict or ``ColumnarBundle``).
+
+    Returns:
+        A JSON-serializable dict in the layout written by
+        ``write_json_bundle()``.
+    """
+    subtitles: list[dict[str, Any]] = []
+    flat_words: list[dict[str, Any]] = []
+    for sub in bundle.get("subtitles", []):
+        words: list[dict[str, Any]] = []
+        for w in sub.get("words", []):
+            w_entry: dict[str, Any] = {
+                "id": w.id,
+                "subtitle_id": w.subtitle_id,
+                "text": w.text,
+                "start": w.start,
+                "end": w.end,
+            }
+            if w.confidence is not None:
+                w_entry["confidence"] = w.confidence
+            if w.speaker_label is not None:
+                w_entry["speaker_label"] = w.speaker_label
+            words.append(w_entry)
+            flat_words.append(w_entry)
+        entry = {key: value for key, value in sub.items() if key != "words"}
+        entry["words"] = words
+        subtitles.append(entry)
+    payload = {key: bundle.get(key) for key in _METADATA_KEYS}
+    payload["subtitles"] = subtitles
+    payload["words"] = flat_words
+    return payload
+
+
+def convert_json_to_columnar(json_path: str | Path, out_path: str | Path) -> None:
+    """Convert a JSON bundle file into a columnar bundle file."""
+    from audio_visualizer.srt.io.bundleReader import read_json_bundle
+
+    write_columnar_bundle(read_json_bundle(json_path), out_path)
+
+
+def convert_columnar_to_json(columnar_path: str | Path, out_path: str | Path) -> None:
+    """Convert a columnar bundle file into a JSON bundle file."""
+    out_path = Path(out_path)
+    payload = bundle_to_jsonable(ColumnarBundle(columnar_path))
+    ensure_parent_dir(out_path)
+    tmp = out_path.with_suffix(out_path.suffix + ".tmp")
+    tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, out_path)
@@ -15,8 +15,9 @@ import dataclasses
 import json
 import os
 import uuid as _uuid_mod
+from bisect import bisect_left, bisect_right
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
 from audio_visualizer.srt.models import ResolvedConfig, SubtitleBlock, WordItem
 from audio_visualizer.srt.io.systemHelpers import ensure_parent_dir
@@ -25,11 +26,29 @@ from audio_visualizer.srt.core.textProcessing import normalize_spaces, wrap_text
 if TYPE_CHECKING:
     from audio_visualizer.srt.core.alignment import AlignedCue
 
+# Formats handled by write_subtitle_outputs
+SUBTITLE_FORMATS = ("srt", "vtt", "ass", "txt", "json")
+
+# Buffer size for streamed output files
+_WRITE_BUFFER = 1 << 20
+
 
 # ============================================================
 # Time Formatters
 # ============================================================
 
+def _clock_ms(seconds: float) -> Tuple[str, int]:
+    """Split a time into its ``HH:MM:SS`` part and milliseconds (SRT/VTT)."""
+    ms = int(round(seconds * 1000))
+    h = ms // 3_600_000
+    ms %= 3_600_000
+    m = ms // 60_000
+    ms %= 60_000
+    s = ms // 1000
+    ms %= 1000
+    return f"{h:02d}:{m:02d}:{s:02d}", ms
+
+
 def format_srt_time(seconds: float) -> str:
     """Format time for SRT format (HH:MM:SS,mmm).
 
@@ -39,14 +58,8 @@ def format_srt_time(seconds: float) -> str:
     Returns:
         Formatted time string (e.g., "00:01:23,456")
     """
-    ms = int(round(seconds * 1000))
-    h = ms // 3_600_000
-    ms %= 3_600_000
-    m = ms // 60_000
-    ms %= 60_000
-    s = ms // 1000
-    ms %= 1000
-    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+    clock, ms = _clock_ms(seconds)
+    return f"{clock},{ms:03d}"
 
 
 def format_vtt_time(seconds: float) -> str:
@@ -58,14 +71,8 @@ def format_vtt_time(seconds: float) -> str:
     Returns:
         Formatted time string (e.g., "00:01:23.456")
     """
-    ms = int(round(seconds * 1000))
-    h = ms // 3_600_000
-    ms %= 3_600_000
-    m = ms // 60_000
-    ms %= 60_000
-    s = ms // 1000
-    ms %= 1000
-    return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
+    clock, ms = _clock_ms(seconds)
+    return f"{clock}.{ms:03d}"
 
 
 def format_ass_time(seconds: float) -> str:
@@ -115,6 +122,77 @@ def _subtitle_text(sb: SubtitleBlock) -> str:
     return text
 
 
+def _wrapped_lines(sb: SubtitleBlock, max_chars: int, max_lines: int) -> List[str]:
+    lines = wrap_text_lines(_subtitle_text(sb), max_chars)
+    if len(lines) > max_lines:
+        lines = lines[:max_lines]
+    return lines
+
+
+def format_srt_entry(index: int, sb: SubtitleBlock, *, max_chars: int, max_lines: int) -> str:
+    """Format one SRT entry (without the blank separator line).
+
+    Args:
+        index: 1-based entry number
+        sb: Subtitle block
+        max_chars: Maximum characters per line
+        max_lines: Maximum lines per subtitle
+
+    Returns:
+        Entry text ending in a newline
+    """
+    lines = _wrapped_lines(sb, max_chars, max_lines)
+    return (
+        f"{index}\n"
+        f"{format_srt_time(sb.start)} --> {format_srt_time(sb.end)}\n"
+        f"{'\n'.join(lines).strip()}\n"
+    )
+
+
+def format_vtt_cue(sb: SubtitleBlock, *, max_chars: int, max_lines: int) -> str:
+    """Format one WebVTT cue (without the blank separator line)."""
+    lines = _wrapped_lines(sb, max_chars, max_lines)
+    return (
+        f"{format_vtt_time(sb.start)} --> {format_vtt_time(sb.end)}\n"
+        f"{'\n'.join(lines).strip()}\n"
+    )
+
+
+def format_ass_dialogue(sb: SubtitleBlock, *, max_chars: int, max_lines: int) -> str:
+    """Format one ASS ``Dialogue:`` event line (no trailing newline)."""
+    ass_text = "\\N".join(_wrapped_lines(sb, max_chars, max_lines)).strip()
+    return f"Dialogue: 0,{format_ass_time(sb.start)},{format_ass_time(sb.end)},Default,,0,0,0,,{ass_text}"
+
+
+def format_txt_line(sb: SubtitleBlock) -> str:
+    """Format one subtitle block as a plain transcript line."""
+    return normalize_spaces(" ".join(sb.lines))
+
+
+VTT_HEADER = "WEBVTT\n"
+
+ASS_HEADER = "\n".join(
+    [
+        "[Script Info]",
+        "ScriptType: v4.00+",
+        "PlayResX: 1920",
+        "PlayResY: 1080",
+        "WrapStyle: 0",
+        "ScaledBorderAndShadow: yes",
+        "",
+        "[V4+ Styles]",
+        "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, "
+        "Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, "
+        "Shadow, Alignment, MarginL, MarginR, MarginV, Encoding",
+        "Style: Default,Arial,48,&H00FFFFFF,&H000000FF,&H00000000,&H64000000,0,0,0,0,100,100,0,0,"
+        "1,2,0,2,80,80,60,1",
+        "",
+        "[Events]",
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+    ]
+)
+
+
 def write_srt(subs: List[SubtitleBlock], out_path: Path, *, max_chars: int, max_lines: int) -> None:
     """Write subtitles in SRT (SubRip) format.
 
@@ -124,18 +202,7 @@ def write_srt(subs: List[SubtitleBlock], out_path: Path, *, max_chars: int, max_
         max_chars: Maximum characters per line
         max_lines: Maximum lines per subtitle
     """
-    chunks: List[str] = []
-    for i, sb in enumerate(subs, start=1):
-        text = _subtitle_text(sb)
-        lines = wrap_text_lines(text, max_chars)
-        if len(lines) > max_lines:
-            lines = lines[:max_lines]
-        chunks.append(
-            f"{i}\n"
-            f"{format_srt_time(sb.start)} --> {format_srt_time(sb.end)}\n"
-            f"{'\n'.join(lines).strip()}\n"
-        )
-    atomic_write_text(out_path, "\n".join(chunks).strip() + "\n")
+    write_subtitle_outputs(subs, [("srt", out_path)], max_chars=max_chars, max_lines=max_lines)
 
 
 def write_vtt(subs: List[SubtitleBlock], out_path: Path, *, max_chars: int, max_lines: int) -> None:
@@ -147,17 +214,7 @@ def write_vtt(subs: List[SubtitleBlock], out_path: Path, *, max_chars: int, max_
         max_chars: Maximum characters per line
         max_lines: Maximum lines per subtitle
     """
-    chunks: List[str] = ["WEBVTT\n"]
-    for sb in subs:
-        text = _subtitle_text(sb)
-        lines = wrap_text_lines(text, max_chars)
-        if len(lines) > max_lines:
-            lines = lines[:max_lines]
-        chunks.append(
-            f"{format_vtt_time(sb.start)} --> {format_vtt_time(sb.end)}\n"
-            f"{'\n'.join(lines).strip()}\n"
-        )
-    atomic_write_text(out_path, "\n".join(chunks).rstrip() + "\n")
+    write_subtitle_outputs(subs, [("vtt", out_path)], max_chars=max_chars, max_lines=max_lines)
 
 
 def write_ass(subs: List[SubtitleBlock], out_path: Path, *, max_chars: int, max_lines: int) -> None:
@@ -169,37 +226,7 @@ def write_ass(subs: List[SubtitleBlock], out_path: Path, *, max_chars: int, max_
         max_chars: Maximum characters per line
         max_lines: Maximum lines per subtitle
     """
-    header = "\n".join(
-        [
-            "[Script Info]",
-            "ScriptType: v4.00+",
-            "PlayResX: 1920",
-            "PlayResY: 1080",
-            "WrapStyle: 0",
-            "ScaledBorderAndShadow: yes",
-            "",
-            "[V4+ Styles]",
-            "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, "
-            "Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, "
-            "Shadow, Alignment, MarginL, MarginR, MarginV, Encoding",
-            "Style: Default,Arial,48,&H00FFFFFF,&H000000FF,&H00000000,&H64000000,0,0,0,0,100,100,0,0,"
-            "1,2,0,2,80,80,60,1",
-            "",
-            "[Events]",
-            "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
-        ]
-    )
-    events: List[str] = [header]
-    for sb in subs:
-        text = _subtitle_text(sb)
-        lines = wrap_text_lines(text, max_chars)
-        if len(lines) > max_lines:
-            lines = lines[:max_lines]
-        ass_text = "\\N".join(lines).strip()
-        events.append(
-            f"Dialogue: 0,{format_ass_time(sb.start)},{format_ass_time(sb.end)},Default,,0,0,0,,{ass_text}"
-        )
-    atomic_write_text(out_path, "\n".join(events).rstrip() + "\n")
+    write_subtitle_outputs(subs, [("ass", out_path)], max_chars=max_chars, max_lines=max_lines)
 
 
 def write_txt(subs: List[SubtitleBlock], out_path: Path) -> None:
@@ -209,10 +236,7 @@ def write_txt(subs: List[SubtitleBlock], out_path: Path) -> None:
         subs: List of SubtitleBlock objects
         out_path: Output file path
     """
-    lines: List[str] = []
-    for sb in subs:
-        lines.append(normalize_spaces(" ".join(sb.lines)))
-    atomic_write_text(out_path, "\n".join(lines).strip() + "\n")
+    write_subtitle_outputs(subs, [("txt", out_path)])
 
 
 # ============================================================
@@ -245,6 +269,81 @@ def segments_to_jsonable(segments: List[Any], *, include_words: bool) -> List[Di
     return out
 
 
+class _SegmentWordIndex:
+    """Segment words keyed by segment start (ms), for subtitle word lookup.
+
+    ``match`` returns the words of the first segment, in segment order,
+    whose start lies within 500 ms of the subtitle start -- the result of
+    scanning every segment per subtitle -- by bisecting the sorted keys.
+    """
+
+    def __init__(self, segments: Sequence[Any]) -> None:
+        by_key: Dict[int, List[Any]] = {}
+        for seg in segments:
+            raw_words = getattr(seg, "words", None) or []
+            if raw_words:
+                by_key[int(round(float(seg.start) * 1000))] = raw_words
+        self._words = list(by_key.values())
+        ordered = sorted((key, pos) for pos, key in enumerate(by_key))
+        self._keys = [key for key, _pos in ordered]
+        self._positions = [pos for _key, pos in ordered]
+        self._sorted = self._positions == list(range(len(ordered)))
+
+    def match(self, start: float) -> List[Any]:
+        sub_key = int(round(start * 1000))
+        lo = bisect_right(self._keys, sub_key - 500)
+        hi = bisect_left(self._keys, sub_key + 500)
+        if lo >= hi:
+            return []
+        pos = self._positions[lo] if self._sorted else min(self._positions[lo:hi])
+        return self._words[pos]
+
+
+def _subtitle_entry(
+    sb: SubtitleBlock,
+    text: str,
+    raw_words: List[Any],
+    *,
+    model_name: str,
+    device_used: str,
+    compute_type_used: str,
+    source_media_path: str,
+) -> Dict[str, Any]:
+    """Build one bundle subtitle entry with its word entries."""
+    sub_id = str(_uuid_mod.uuid4())
+    words: List[Dict[str, Any]] = []
+    for w in raw_words:
+        w_id = str(_uuid_mod.uuid4())
+        w_text = getattr(w, "word", getattr(w, "text", ""))
+        w_entry: Dict[str, Any] = {
+            "id": w_id,
+            "subtitle_id": sub_id,
+            "text": w_text.strip(),
+            "start": float(w.start),
+            "end": float(w.end),
+        }
+        confidence = getattr(w, "probability", None)
+        if confidence is not None:
+            w_entry["confidence"] = float(confidence)
+        words.append(w_entry)
+
+    sub_entry: Dict[str, Any] = {
+        "id": sub_id,
+        "start": sb.start,
+        "end": sb.end,
+        "text": text,
+        "words": words,
+        "original_text": text,
+        "source_media_path": source_media_path,
+        "model_name": model_name,
+        "device": device_used,
+        "compute_type": compute_type_used,
+    }
+    if sb.speaker:
+        sub_entry["speaker_label"] = sb.speaker
+    return sub_entry
+
+
 def _build_subtitles(
     subs: List[SubtitleBlock],
     segments: List[Any],
@@ -258,66 +357,21 @@ def _build_subtitles(
 
     Returns (subtitles_list, flat_words_list).
     """
-    import uuid as _uuid
-
+    index = _SegmentWordIndex(segments)
     subtitles: List[Dict[str, Any]] = []
     flat_words: List[Dict[str, Any]] = []
-
-    # Build a segment index keyed on approximate start time for word lookup
-    seg_words_map: Dict[int, List[Any]] = {}
-    for seg in segments:
-        raw_words = getattr(seg, "words", None) or []
-        if raw_words:
-            key = int(round(float(seg.start) * 1000))
-            seg_words_map[key] = raw_words
-
-    for idx, sb in enumerate(subs):
-        sub_id = str(_uuid.uuid4())
-        text = normalize_spaces(" ".join(sb.lines))
-
-        # Try to find matching segment words for this subtitle
-        sub_key = int(round(sb.start * 1000))
-        matched_raw_words: List[Any] = []
-        # Find closest segment
-        for seg_key, seg_words in seg_words_map.items():
-            if abs(seg_key - sub_key) < 500:  # within 500ms
-                matched_raw_words = seg_words
-                break
-
-        words: List[Dict[str, Any]] = []
-        for w in matched_raw_words:
-            w_id = str(_uuid.uuid4())
-            w_text = getattr(w, "word", getattr(w, "text", ""))
-            w_entry: Dict[str, Any] = {
-                "id": w_id,
-                "subtitle_id": sub_id,
-                "text": w_text.strip(),
-                "start": float(w.start),
-                "end": float(w.end),
-            }
-            confidence = getattr(w, "probability", None)
-            if confidence is not None:
-                w_entry["confidence"] = float(confidence)
-            words.append(w_entry)
-            flat_words.append(w_entry)
-
-        sub_entry: Dict[str, Any] = {
-            "id": sub_id,
-            "start": sb.start,
-            "end": sb.end,
-            "text": text,
-            "words": words,
-            "original_text": text,
-            "source_media_path": source_media_path,
-            "model_name": model_name,
-            "device": device_used,
-            "compute_type": compute_type_used,
-        }
-        if sb.speaker:
-            sub_entry["speaker_label"] = sb.speaker
-
-        subtitles.append(sub_entry)
-
+    for sb in subs:
+        entry = _subtitle_entry(
+            sb,
+            normalize_spaces(" ".join(sb.lines)),
+            index.match(sb.start),
+            model_name=model_name,
+            device_used=device_used,
+            compute_type_used=compute_type_used,
+            source_media_path=source_media_path,
+        )
+        subtitles.append(entry)
+        flat_words.extend(entry["words"])
     return subtitles, flat_words
 
 
@@ -349,29 +403,216 @@ def write_json_bundle(
         tool_version: Tool version string
         model_name: Whisper model name used for transcription
     """
-    subtitles_list, flat_words = _build_subtitles(
+    write_subtitle_outputs(
         subs,
-        segments,
-        model_name=model_name,
+        [("json", out_path)],
+        input_file=input_file,
         device_used=device_used,
         compute_type_used=compute_type_used,
-        source_media_path=input_file,
+        cfg=cfg,
+        segments=segments,
+        tool_version=tool_version,
+        model_name=model_name,
     )
 
-    payload: Dict[str, Any] = {
-        "tool_version": tool_version,
-        "input_file": input_file,
-        "device_used": device_used,
-        "compute_type_used": compute_type_used,
-        "model_name": model_name,
-        "config": dataclasses.asdict(cfg),
-        "subtitles": subtitles_list,
-        "words": flat_words,
-    }
-    ensure_parent_dir(out_path)
-    tmp = out_path.with_suffix(out_path.suffix + ".tmp")
-    tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-    os.replace(tmp, out_path)
+
+# ============================================================
+# Multi-Format Writing
+# ============================================================
+
+def _json_list(items: List[str]) -> str:
+    """Join pre-encoded items of a top-level bundle list (``indent=2``)."""
+    if not items:
+        return "[]"
+    return "[\n    " + ",\n    ".join(items) + "\n  ]"
+
+
+class _OutputStream:
+    """One output format being streamed to its temporary file.
+
+    SRT, VTT and ASS hold back their last chunk so the file can end the
+    way ``"\\n".join(chunks).rstrip() + "\\n"`` did; TXT drops leading and
+    trailing empty lines the way ``strip()`` did.  JSON writes the bundle
+    header up front, streams subtitle entries, and appends the flat
+    ``words`` list on close, byte-identical to ``json.dumps(..., indent=2)``.
+    """
+
+    def __init__(self, fmt: str, path: Path) -> None:
+        self.fmt = fmt
+        self.path = path
+        self.tmp = path.with_suffix(path.suffix + ".tmp")
+        ensure_parent_dir(path)
+        self.file = open(self.tmp, "w", encoding="utf-8", buffering=_WRITE_BUFFER)
+        self.last: Optional[str] = {"vtt": VTT_HEADER, "ass": ASS_HEADER}.get(fmt)
+        self.started = False
+        self.blank_lines = 0
+        self.count = 0
+        self.words: List[str] = []
+
+    def chunk(self, text: str) -> None:
+        """Append an SRT/VTT/ASS chunk (chunks are separated by newlines)."""
+        if self.last is not None:
+            self.file.write(self.last + "\n")
+        self.last = text
+
+    def line(self, text: str) -> None:
+        """Append a TXT line."""
+        if not text:
+            if self.started:
+                self.blank_lines += 1
+            return
+        if self.started:
+            self.file.write("\n" * (self.blank_lines + 1))
+        self.file.write(text)
+        self.started = True
+        self.blank_lines = 0
+
+    def json_header(self, header: Dict[str, Any]) -> None:
+        """Write the bundle fields that precede ``subtitles``."""
+        head = json.dumps(header, ensure_ascii=False, indent=2)
+        self.file.write(head[:-2] + ',\n  "subtitles": ')
+
+    def json_entry(self, entry: Dict[str, Any]) -> None:
+        """Append one subtitle entry and remember its encoded words."""
+        encoded = json.dumps(entry, ensure_ascii=False, indent=2).replace("\n", "\n    ")
+        self.file.write(("[\n    " if not self.count else ",\n    ") + encoded)
+        self.count += 1
+        for w_entry in entry["words"]:
+            self.words.append(json.dumps(w_entry, ensure_ascii=False, indent=2).replace("\n", "\n    "))
+
+    def finish(self) -> None:
+        """Write the format's ending and close the temporary file."""
+        if self.fmt in ("srt", "vtt", "ass"):
+            self.file.write((self.last or "").rstrip() + "\n")
+        elif self.fmt == "txt":
+            self.file.write("\n")
+        elif self.fmt == "json":
+            self.file.write(("\n  ]" if self.count else "[]") + ',\n  "words": ' + _json_list(self.words) + "\n}")
+        self.file.close()
+
+    def discard(self) -> None:
+        self.file.close()
+        try:
+            self.tmp.unlink()
+        except OSError:
+            pass
+
+
+def write_subtitle_outputs(
+    subs: List[SubtitleBlock],
+    targets: Sequence[Tuple[str, Path]],
+    *,
+    max_chars: Optional[int] = None,
+    max_lines: Optional[int] = None,
+    input_file: str = "",
+    device_used: str = "",
+    compute_type_used: str = "",
+    cfg: Optional[ResolvedConfig] = None,
+    segments: Sequence[Any] = (),
+    tool_version: str = "",
+    model_name: str = "",
+) -> None:
+    """Write subtitles to several formats in one pass.
+
+    Each block's text, wrapped lines and timestamps are formatted once and
+    shared by every requested format.  All outputs stream to temporary
+    files through large write buffers and are renamed into place only
+    after every one has been written, so a failure leaves no partial or
+    mismatched set of files.  Output is identical to the single-format
+    writers.
+
+    Args:
+        subs: List of SubtitleBlock objects
+        targets: ``(format, path)`` pairs; formats are ``SUBTITLE_FORMATS``.
+            When two targets share a path the later one wins.
+        max_chars: Maximum characters per line (required for srt/vtt/ass)
+        max_lines: Maximum lines per subtitle (required for srt/vtt/ass)
+        input_file: JSON bundle: input file name
+        device_used: JSON bundle: device used for transcription
+        compute_type_used: JSON bundle: compute type used
+        cfg: JSON bundle: configuration used
+        segments: JSON bundle: transcription segments (for word timing)
+        tool_version: JSON bundle: tool version string
+        model_name: JSON bundle: Whisper model name
+
+    Raises:
+        ValueError: If a format is unknown, or srt/vtt/ass output is
+            requested without ``max_chars``/``max_lines``
+    """
+    by_path: Dict[Path, str] = {}
+    for fmt, path in targets:
+        if fmt not in SUBTITLE_FORMATS:
+            raise ValueError(f"Unknown format: {fmt}")
+        path = Path(path)
+        by_path.pop(path, None)
+        by_path[path] = fmt
+    formats = set(by_path.values())
+    wrapped = bool(formats & {"srt", "vtt", "ass"})
+    if wrapped and (max_chars is None or max_lines is None):
+        raise ValueError("max_chars and max_lines are required for srt, vtt and ass output.")
+
+    streams = [_OutputStream(fmt, path) for path, fmt in by_path.items()]
+    try:
+        srt = [st for st in streams if st.fmt == "srt"]
+        vtt = [st for st in streams if st.fmt == "vtt"]
+        ass = [st for st in streams if st.fmt == "ass"]
+        txt = [st for st in streams if st.fmt == "txt"]
+        bundles = [st for st in streams if st.fmt == "json"]
+        word_index = _SegmentWordIndex(segments) if bundles else None
+        for st in bundles:
+            st.json_header({
+                "tool_version": tool_version,
+                "input_file": input_file,
+                "device_used": device_used,
+                "compute_type_used": compute_type_used,
+                "model_name": model_name,
+                "config": dataclasses.asdict(cfg) if cfg is not None else None,
+            })
+
+        for number, sb in enumerate(subs, start=1):
+            text = normalize_spaces(" ".join(sb.lines))
+            if wrapped:
+                shown = f"{sb.speaker}: {text}".strip() if sb.speaker else text
+                lines = wrap_text_lines(shown, max_chars)
+                if len(lines) > max_lines:
+                    lines = lines[:max_lines]
+            if srt or vtt:
+                start, end = _clock_ms(sb.start), _clock_ms(sb.end)
+                body = "\n".join(lines).strip()
+                for st in srt:
+                    st.chunk(f"{number}\n{start[0]},{start[1]:03d} --> {end[0]},{end[1]:03d}\n{body}\n")
+                for st in vtt:
+                    st.chunk(f"{start[0]}.{start[1]:03d} --> {end[0]}.{end[1]:03d}\n{body}\n")
+            if ass:
+                dialogue = (
+                    f"Dialogue: 0,{format_ass_time(sb.start)},{format_ass_time(sb.end)},Default,,0,0,0,,"
+                    + "\\N".join(lines).strip()
+                )
+                for st in ass:
+                    st.chunk(dialogue)
+            for st in txt:
+                st.line(text)
+            if bundles:
+                entry = _subtitle_entry(
+                    sb,
+                    text,
+                    word_index.match(sb.start),
+                    model_name=model_name,
+                    device_used=device_used,
+                    compute_type_used=compute_type_used,
+                    source_media_path=input_file,
+                )
+                for st in bundles:
+                    st.json_entry(entry)
+
+        for st in streams:
+            st.finish()
+    except BaseException:
+        for st in streams:
+            st.discard()
+        raise
+    for st in streams:
+        os.replace(st.tmp, st.path)
 
 
 def write_bundle_from_srt(
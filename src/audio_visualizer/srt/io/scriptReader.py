@@ -5,9 +5,11 @@ from __future__ import annotations
 from pathlib import Path
 from typing import List
 
-from docx import Document
-
 from audio_visualizer.srt.core.textProcessing import normalize_spaces
+from audio_visualizer.startup import lazy_import
+
+# python-docx is only needed for .docx scripts
+docx = lazy_import("docx")
 
 
 MAX_PROMPT_CHARS = 900
@@ -20,7 +22,7 @@ def read_docx(path: Path) -> str:
     (paragraphs whose style name starts with "List") are treated as
     individual sentence units.
     """
-    doc = Document(str(path))
+    doc = docx.Document(str(path))
     units: List[str] = []
     for para in doc.paragraphs:
         text = normalize_spaces(para.text)
@@ -0,0 +1,270 @@
+"""Persistent cache of raw Whisper transcriptions.
+
+Only the chunking stage depends on the formatting settings (``max_chars``,
+``max_lines``, ``target_cps``, general vs shorts mode), so re-running a
+file with different formatting does not need the model at all.  The cache
+stores the raw segments and words of each transcription, keyed by:
+
+* a hash of the decoded 16 kHz samples (so renaming or re-muxing the
+  file still hits),
+* model name, LoRA, language and compute type,
+* every ``TranscriptionConfig`` field, plus the silence settings when
+  chunk-parallel inference (which cuts at silences) is on.
+
+Entries are gzip-compressed JSON with the words stored column-wise.  The
+cache is bounded by total size; the least recently used entries are
+evicted first.  Pass no cache to the pipeline to bypass it.
+"""
+from __future__ import annotations
+
+import dataclasses
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when the key derivation or entry layout changes
+CACHE_FORMAT_VERSION = 1
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+_SUFFIX = ".json.gz"
+
+
+@dataclass
+class CachedWord:
+    """A cached word timing (mirrors faster-whisper ``Word``)."""
+
+    start: float
+    end: float
+    word: str
+    probability: float = 0.0
+
+
+@dataclass
+class CachedSegment:
+    """A cached segment (mirrors faster-whisper ``Segment``)."""
+
+    id: int = 0
+    seek: int = 0
+    start: float = 0.0
+    end: float = 0.0
+    text: str = ""
+    avg_logprob: float = 0.0
+    compression_ratio: float = 0.0
+    no_speech_prob: float = 0.0
+    words: Optional[List[CachedWord]] = None
+    temperature: Optional[float] = None
+    tokens: List[int] = field(default_factory=list)
+
+
+_SEGMENT_FIELDS = ("id", "seek", "start", "end", "text", "avg_logprob",
+                   "compression_ratio", "no_speech_prob", "temperature")
+
+
+def audio_fingerprint(samples: Any) -> str:
+    """Return a content hash of decoded PCM samples."""
+    import numpy as np
+
+    data = np.ascontiguousarray(samples, dtype=np.float32)
+    return hashlib.blake2b(memoryview(data).cast("B"), digest_size=20).hexdigest()
+
+
+def make_cache_key(
+    fingerprint: str,
+    *,
+    model_name: str,
+    lora_name: Optional[str],
+    language: Optional[str],
+    compute_type: str,
+    transcription: Any,
+    silence: Any = None,
+) -> str:
+    """Build the cache key for one transcription.
+
+    Args:
+        fingerprint: ``audio_fingerprint`` of the decoded audio
+        model_name: Whisper model name or path
+        lora_name: LoRA adapter name, if any
+        language: Requested language (None = auto-detect)
+        compute_type: Compute type the model runs with
+        transcription: The ``TranscriptionConfig`` in effect
+        silence: The ``SilenceConfig``; only used when parallel inference
+            is on, since chunk cuts then depend on detected silences
+
+    Returns:
+        Hex digest identifying the transcription
+    """
+    tx = dataclasses.asdict(transcription)
+    parts: Dict[str, Any] = {
+        "version": CACHE_FORMAT_VERSION,
+        "audio": fingerprint,
+        "model": model_name,
+        "lora": lora_name or None,
+        "language": language or None,
+        "compute_type": compute_type,
+        "transcription": tx,
+    }
+    if silence is not None and tx.get("parallel_mode", "off") != "off":
+        parts["silence"] = dataclasses.asdict(silence)
+    blob = json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+def _encode(segments: List[Any]) -> Dict[str, Any]:
+    """Pack segments into a dict with column-wise word arrays."""
+    seg_rows: List[Dict[str, Any]] = []
+    w_start: List[float] = []
+    w_end: List[float] = []
+    w_word: List[str] = []
+    w_prob: List[float] = []
+    for seg in segments:
+        row = {name: getattr(seg, name, None) for name in _SEGMENT_FIELDS}
+        words = getattr(seg, "words", None)
+        if words is None:
+            row["words"] = None
+        else:
+            row["words"] = [len(w_start), len(words)]
+            for w in words:
+                w_start.append(float(w.start))
+                w_end.append(float(w.end))
+                w_word.append(str(getattr(w, "word", "")))
+                w_prob.append(float(getattr(w, "probability", 0.0) or 0.0))
+        seg_rows.append(row)
+    return {
+        "version": CACHE_FORMAT_VERSION,
+        "segments": seg_rows,
+        "words": {"start": w_start, "end": w_end, "word": w_word, "probability": w_prob},
+    }
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize NumPy scalars that some backends put in segments."""
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _decode(data: Dict[str, Any]) -> List[CachedSegment]:
+    cols = data["words"]
+    out: List[CachedSegment] = []
+    for row in data["segments"]:
+        span = row.pop("words")
+        seg = CachedSegment(**{k: v for k, v in row.items() if v is not None})
+        if span is not None:
+            first, count = span
+            seg.words = [
+                CachedWord(cols["start"][i], cols["end"][i], cols["word"][i], cols["probability"][i])
+                for i in range(first, first + count)
+            ]
+        out.append(seg)
+    return out
+
+
+class TranscriptCache:
+    """Size-bounded on-disk store of raw transcriptions.
+
+    Safe to share between threads; entries are written atomically so
+    several processes can use the same directory.
+
+    Args:
+        root: Cache directory (default ``<data_dir>/transcript_cache``)
+        max_bytes: Total size above which least recently used entries
+            are evicted
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if root is None:
+            from audio_visualizer.app_paths import get_data_dir
+
+            root = get_data_dir() / "transcript_cache"
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> Optional[List[CachedSegment]]:
+        """Return the cached segments for *key*, or None on a miss."""
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as fh:
+                data = json.load(fh)
+            if data.get("version") != CACHE_FORMAT_VERSION:
+                return None
+            segments = _decode(data)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning("Discarding unreadable transcript cache entry %s", path.name)
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            pass
+        return segments
+
+    def put(self, key: str, segments: List[Any]) -> None:
+        """Store *segments* under *key* and evict old entries if needed."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(
+            _encode(segments), separators=(",", ":"), default=_json_default
+        ).encode("utf-8")
+        fd, tmp = tempfile.mkstemp(prefix=".tmp_", suffix=_SUFFIX, dir=str(self.root))
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as fh:
+                fh.write(payload)
+            os.replace(tmp, self._path(key))
+        except Exception:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def _entries(self) -> List[Tuple[Path, os.stat_result]]:
+        entries = []
+        for path in self.root.glob(f"*{_SUFFIX}"):
+            if path.name.startswith(".tmp_"):
+                continue
+            try:
+                entries.append((path, path.stat()))
+            except OSError:
+                continue
+        return entries
+
+    def size_bytes(self) -> int:
+        """Return the total size of all entries."""
+        return sum(st.st_size for _path, st in self._entries())
+
+    def evict(self) -> int:
+        """Remove least recently used entries until under ``max_bytes``.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            entries = sorted(self._entries(), key=lambda item: item[1].st_mtime)
+            total = sum(st.st_size for _path, st in entries)
+            removed = 0
+            for path, st in entries:
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= st.st_size
+                removed += 1
+            return removed
+
+    def clear(self) -> int:
+        """Remove every entry.  Returns the number removed."""
+        with self._lock:
+            entries = self._entries()
+            for path, _st in entries:
+                path.unlink(missing_ok=True)
+            return len(entries)
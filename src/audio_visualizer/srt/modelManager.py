@@ -21,6 +21,8 @@ class ModelInfo:
     device: str
     compute_type: str
     lora_name: Optional[str] = None
+    num_workers: int = 1
+    cpu_threads: int = 0
 
 
 class ModelManager:
@@ -42,22 +44,32 @@ class ModelManager:
         strict_cuda: bool = False,
         emitter: Optional[AppEventEmitter] = None,
         lora_name: Optional[str] = None,
+        *,
+        num_workers: int = 1,
+        cpu_threads: int = 0,
     ) -> Any:
         """Load a Whisper model. Returns the model instance.
 
         If a model with the same name (and same LoRA adapter) is already
         loaded, returns it without reloading.  If a different model is
-        loaded, unloads it first.
+        loaded, unloads it first.  A matching startup preload (see
+        ``srtApi.preload_model``) is taken over; any other preload is
+        discarded.
 
         The *lora_name* parameter is used as part of the cache key so
         that base models and LoRA-merged models are cached separately.
+        *num_workers* and *cpu_threads* select a multi-replica model for
+        chunk-parallel transcription and are part of the key as well.
         """
         # Build a cache key that distinguishes base from LoRA-merged models.
-        cache_key = f"{model_name}|lora={lora_name or ''}"
+        cache_key = f"{model_name}|lora={lora_name or ''}|workers={num_workers}|threads={cpu_threads}"
         event_emitter = emitter or self._emitter
         with self._lock:
             if self._model is not None and self._info is not None:
-                existing_key = f"{self._info.model_name}|lora={self._info.lora_name or ''}"
+                existing_key = (
+                    f"{self._info.model_name}|lora={self._info.lora_name or ''}"
+                    f"|workers={self._info.num_workers}|threads={self._info.cpu_threads}"
+                )
                 if existing_key == cache_key and (
                     device == "auto" or self._info.device == device
                 ):
@@ -70,13 +82,29 @@ class ModelManager:
                     message=f"Loading model '{model_name}'...",
                 ))
 
+            replica_options = {}
+            if num_workers > 1:
+                replica_options["num_workers"] = num_workers
+            if cpu_threads > 0:
+                replica_options["cpu_threads"] = cpu_threads
+
+            # Deferred: srtApi pulls in the whole pipeline
+            from audio_visualizer.srt.srtApi import _take_preloaded
+
             try:
-                model, device_used, compute_type = init_whisper_model_internal(
-                    model_name=model_name,
-                    device=device,
-                    strict_cuda=strict_cuda,
-                    emitter=event_emitter,
+                preloaded = _take_preloaded(
+                    model_name, device, default_options=lora_name is None and not replica_options,
                 )
+                if preloaded is not None:
+                    model, device_used, compute_type = preloaded
+                else:
+                    model, device_used, compute_type = init_whisper_model_internal(
+                        model_name=model_name,
+                        device=device,
+                        strict_cuda=strict_cuda,
+                        emitter=event_emitter,
+                        **replica_options,
+                    )
             except Exception as exc:
                 if event_emitter is not None:
                     event_emitter.emit(AppEvent(
@@ -103,6 +131,8 @@ class ModelManager:
                 device=device_used,
                 compute_type=compute_type,
                 lora_name=lora_name,
+                num_workers=num_workers,
+                cpu_threads=cpu_threads,
             )
 
             if event_emitter is not None:
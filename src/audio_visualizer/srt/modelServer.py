@@ -0,0 +1,937 @@
+"""Long-lived local Whisper model host.
+
+Loading a large Whisper model takes tens of seconds on CPU, and every SRT
+batch used to pay that cost again. The model server keeps warm models
+resident in one background process and serves transcription requests from
+any number of local clients (GUI batches, scripts) over a local socket
+(POSIX) or named pipe (Windows):
+
+- :class:`ModelPool` holds one :class:`~audio_visualizer.srt.modelManager.ModelManager`
+  per model configuration. Models are evicted after an idle timeout, and
+  the number of resident models is capped by count and by an estimate of
+  their memory use against the memory currently available. Requests for a
+  model that cannot fit yet wait until another model goes idle.
+- Each resident model runs its load and its transcriptions on its own
+  executor thread(s), so GPU handles stay on the thread that created them
+  and requests for one model queue behind each other.
+- :class:`ModelServer` accepts connections and streams segments back as
+  faster-whisper yields them; :class:`RemoteModel` exposes the same
+  ``transcribe(audio, **kwargs) -> (segments, info)`` call as a
+  ``WhisperModel`` so the pipeline can use it unchanged.
+
+Start a server with ``python -m audio_visualizer.srt.modelServer`` or let
+:func:`ensure_model_server` spawn one on first use. Connections are
+authenticated with a per-user key stored in the app data directory.
+"""
+from __future__ import annotations
+
+import argparse
+import ctypes
+import dataclasses
+import getpass
+import logging
+import os
+import secrets
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from audio_visualizer.app_paths import get_data_dir
+from audio_visualizer.events import AppEvent, AppEventEmitter
+from audio_visualizer.srt.modelManager import ModelManager
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = 1
+
+# Seconds a model may sit unused before it is unloaded
+DEFAULT_IDLE_TIMEOUT = 600.0
+
+# Models resident at once (each one can be several GB)
+DEFAULT_MAX_MODELS = 2
+
+# Seconds to wait for a spawned server to accept connections
+DEFAULT_STARTUP_TIMEOUT = 30.0
+
+_AUTHKEY_FILE = "model_server.key"
+_SOCKET_FILE = "model_server.sock"
+
+# Approximate host memory (MB) of a loaded CTranslate2 model at int8.
+# Used only to decide whether another model fits; unknown names assume large.
+_RESIDENT_MB: Dict[str, float] = {
+    "tiny": 100.0,
+    "base": 180.0,
+    "small": 450.0,
+    "medium": 1200.0,
+    "large": 2400.0,
+    "turbo": 1300.0,
+    "distil-small": 300.0,
+    "distil-medium": 650.0,
+    "distil-large": 1200.0,
+}
+_UNKNOWN_MODEL_MB = 2400.0
+
+
+# ============================================================
+# Addresses, keys and memory
+# ============================================================
+
+def default_address() -> str:
+    """Return the per-user address the model server listens on."""
+    if os.name == "nt":
+        return rf"\\.\pipe\audio_visualizer-models-{getpass.getuser()}"
+    return str(get_data_dir() / _SOCKET_FILE)
+
+
+def load_authkey(create: bool = False) -> bytes:
+    """Read the shared connection key, creating it first if *create* is set.
+
+    Raises:
+        FileNotFoundError: If the key does not exist and *create* is False
+    """
+    path = get_data_dir() / _AUTHKEY_FILE
+    if create and not path.exists():
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            pass
+        else:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(secrets.token_bytes(32))
+    return path.read_bytes()
+
+
+def available_memory_mb() -> Optional[float]:
+    """Return the memory available for new allocations in MB, or None if unknown."""
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/meminfo", encoding="ascii") as handle:
+                for line in handle:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) / 1024.0
+        elif os.name == "nt":
+            class _MemoryStatus(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", ctypes.c_ulong),
+                    ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong),
+                    ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong),
+                    ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong),
+                    ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+                ]
+
+            status = _MemoryStatus()
+            status.dwLength = ctypes.sizeof(status)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                return status.ullAvailPhys / (1024.0 * 1024.0)
+    except (OSError, ValueError, AttributeError):
+        logger.debug("Could not read available memory", exc_info=True)
+    return None
+
+
+def estimate_model_mb(model_name: str) -> float:
+    """Estimate the resident memory of *model_name* in MB.
+
+    Local model directories (e.g. merged LoRA models) are sized from their
+    weights on disk; known Whisper names use a lookup table.
+    """
+    path = Path(model_name)
+    if path.is_dir():
+        weights = path / "model.bin"
+        if weights.is_file():
+            return weights.stat().st_size / (1024.0 * 1024.0)
+    name = path.name.lower().removesuffix(".en")
+    for prefix in sorted(_RESIDENT_MB, key=len, reverse=True):
+        if name.startswith(prefix):
+            return _RESIDENT_MB[prefix]
+    return _UNKNOWN_MODEL_MB
+
+
+# ============================================================
+# Model pool
+# ============================================================
+
+@dataclass(frozen=True)
+class ModelKey:
+    """Identifies one resident model configuration."""
+
+    model_name: str
+    device: str = "auto"
+    num_workers: int = 1
+    cpu_threads: int = 0
+
+
+@dataclass
+class ResidentModel:
+    """A model held by the pool, with its dedicated executor."""
+
+    key: ModelKey
+    manager: ModelManager
+    executor: ThreadPoolExecutor
+    estimated_mb: float
+    ready: bool = False
+    active: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    device_used: str = ""
+    compute_type: str = ""
+
+    @property
+    def model(self) -> Any:
+        return self.manager.get_model()
+
+
+class ModelPool:
+    """Keeps warm Whisper models resident, bounded by count, memory and idle time.
+
+    Args:
+        max_models: Most models resident at once
+        idle_timeout: Seconds an unused model stays loaded
+        memory_limit_mb: Optional cap on the summed model estimates; the
+            memory currently available is always checked as well
+    """
+
+    def __init__(
+        self,
+        *,
+        max_models: int = DEFAULT_MAX_MODELS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        memory_limit_mb: Optional[float] = None,
+    ) -> None:
+        self.max_models = max(1, max_models)
+        self.idle_timeout = idle_timeout
+        self.memory_limit_mb = memory_limit_mb
+        self._cond = threading.Condition()
+        self._resident: Dict[ModelKey, ResidentModel] = {}
+        self._waiting = 0
+
+    def acquire(
+        self,
+        key: ModelKey,
+        *,
+        strict_cuda: bool = False,
+        emitter: Optional[AppEventEmitter] = None,
+        timeout: Optional[float] = None,
+    ) -> ResidentModel:
+        """Return the resident model for *key*, loading it if needed.
+
+        Blocks while the pool is full and every resident model is busy.
+        Every successful call must be paired with :meth:`release`.
+
+        Raises:
+            TimeoutError: If no room became available within *timeout*
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        estimate = estimate_model_mb(key.model_name)
+        with self._cond:
+            self._waiting += 1
+            try:
+                while True:
+                    resident = self._resident.get(key)
+                    if resident is not None and resident.ready:
+                        resident.active += 1
+                        resident.last_used = time.monotonic()
+                        return resident
+                    if resident is None:
+                        if self._has_room_locked(estimate):
+                            resident = self._reserve_locked(key, estimate)
+                            break
+                        if self._evict_lru_locked():
+                            continue
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"No room to load model '{key.model_name}'")
+                    self._cond.wait(remaining)
+            finally:
+                self._waiting -= 1
+
+        try:
+            resident.executor.submit(
+                resident.manager.load,
+                key.model_name,
+                key.device,
+                strict_cuda,
+                emitter,
+                num_workers=key.num_workers,
+                cpu_threads=key.cpu_threads,
+            ).result()
+        except BaseException:
+            with self._cond:
+                self._resident.pop(key, None)
+                self._cond.notify_all()
+            resident.executor.shutdown(wait=False)
+            raise
+
+        info = resident.manager.model_info()
+        with self._cond:
+            resident.ready = True
+            resident.active += 1
+            resident.last_used = time.monotonic()
+            if info is not None:
+                resident.device_used = info.device
+                resident.compute_type = info.compute_type
+            self._cond.notify_all()
+        return resident
+
+    def release(self, resident: ResidentModel) -> None:
+        """Mark one use of *resident* as finished."""
+        with self._cond:
+            resident.active = max(0, resident.active - 1)
+            resident.last_used = time.monotonic()
+            self._cond.notify_all()
+
+    def submit(self, resident: ResidentModel, fn: Callable[..., Any], *args: Any) -> Future:
+        """Run ``fn(model, *args)`` on the model's executor."""
+        return resident.executor.submit(lambda: fn(resident.model, *args))
+
+    def evict_idle(self, now: Optional[float] = None) -> List[ModelKey]:
+        """Unload models unused for longer than the idle timeout."""
+        now = time.monotonic() if now is None else now
+        with self._cond:
+            expired = [
+                key for key, resident in self._resident.items()
+                if resident.ready and resident.active == 0
+                and now - resident.last_used >= self.idle_timeout
+            ]
+            for key in expired:
+                self._unload_locked(key)
+            if expired:
+                self._cond.notify_all()
+        return expired
+
+    def unload(self, model_name: Optional[str] = None) -> int:
+        """Unload idle models (all of them, or those named *model_name*)."""
+        with self._cond:
+            keys = [
+                key for key, resident in self._resident.items()
+                if resident.ready and resident.active == 0
+                and (model_name is None or key.model_name == model_name)
+            ]
+            for key in keys:
+                self._unload_locked(key)
+            self._cond.notify_all()
+        return len(keys)
+
+    def close(self) -> None:
+        """Unload every model."""
+        with self._cond:
+            for key in list(self._resident):
+                self._unload_locked(key)
+            self._cond.notify_all()
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Describe the resident models."""
+        now = time.monotonic()
+        with self._cond:
+            return [
+                {
+                    **dataclasses.asdict(key),
+                    "ready": resident.ready,
+                    "active": resident.active,
+                    "idle_seconds": round(now - resident.last_used, 1),
+                    "estimated_mb": round(resident.estimated_mb, 1),
+                    "device_used": resident.device_used,
+                    "compute_type": resident.compute_type,
+                }
+                for key, resident in self._resident.items()
+            ]
+
+    @property
+    def waiting(self) -> int:
+        """Requests currently waiting for a model."""
+        with self._cond:
+            return self._waiting
+
+    def _has_room_locked(self, estimate: float) -> bool:
+        if not self._resident:
+            return True
+        if len(self._resident) >= self.max_models:
+            return False
+        reserved = sum(resident.estimated_mb for resident in self._resident.values())
+        if self.memory_limit_mb is not None and reserved + estimate > self.memory_limit_mb:
+            return False
+        available = available_memory_mb()
+        return available is None or estimate <= available
+
+    def _evict_lru_locked(self) -> bool:
+        idle = [r for r in self._resident.values() if r.ready and r.active == 0]
+        if not idle:
+            return False
+        victim = min(idle, key=lambda r: r.last_used)
+        logger.info("Evicting model '%s' to make room", victim.key.model_name)
+        self._unload_locked(victim.key)
+        return True
+
+    def _reserve_locked(self, key: ModelKey, estimate: float) -> ResidentModel:
+        resident = ResidentModel(
+            key=key,
+            manager=ModelManager(),
+            executor=ThreadPoolExecutor(
+                max_workers=max(1, key.num_workers),
+                thread_name_prefix=f"model-{Path(key.model_name).name}",
+            ),
+            estimated_mb=estimate,
+        )
+        self._resident[key] = resident
+        return resident
+
+    def _unload_locked(self, key: ModelKey) -> None:
+        resident = self._resident.pop(key)
+        logger.info("Unloading model '%s'", key.model_name)
+        resident.executor.submit(resident.manager.unload)
+        resident.executor.shutdown(wait=False)
+
+
+# ============================================================
+# Server
+# ============================================================
+
+def _to_plain(item: Any) -> Any:
+    """Convert faster-whisper results to builtin types for the wire."""
+    if dataclasses.is_dataclass(item) and not isinstance(item, type):
+        return {f.name: _to_plain(getattr(item, f.name)) for f in dataclasses.fields(item)}
+    if hasattr(item, "_asdict"):
+        return {name: _to_plain(value) for name, value in item._asdict().items()}
+    if isinstance(item, dict):
+        return {name: _to_plain(value) for name, value in item.items()}
+    if isinstance(item, (list, tuple)):
+        return [_to_plain(value) for value in item]
+    if hasattr(item, "item") and callable(item.item):
+        return item.item()
+    if hasattr(item, "__dict__") and not isinstance(item, type):
+        return {name: _to_plain(value) for name, value in vars(item).items()}
+    return item
+
+
+def _stream_transcription(
+    model: Any,
+    audio: Any,
+    options: Dict[str, Any],
+    send: Callable[[Dict[str, Any]], None],
+) -> int:
+    segments, info = model.transcribe(audio, **options)
+    send({"type": "info", "info": _to_plain(info)})
+    count = 0
+    for segment in segments:
+        send({"type": "segment", "segment": _to_plain(segment)})
+        count += 1
+    return count
+
+
+def _remove_stale_socket(address: str, authkey: bytes) -> None:
+    if os.name == "nt" or not os.path.exists(address):
+        return
+    try:
+        Client(address, authkey=authkey).close()
+    except AuthenticationError:
+        raise RuntimeError(f"Another model server is listening on {address}") from None
+    except (OSError, EOFError):
+        os.unlink(address)
+        return
+    raise RuntimeError(f"A model server is already running on {address}")
+
+
+class ModelServer:
+    """Serves resident Whisper models to local clients.
+
+    Args:
+        address: Socket path or pipe name (defaults to :func:`default_address`)
+        authkey: Connection key (defaults to the per-user key file)
+        max_models: Most models resident at once
+        idle_timeout: Seconds an unused model stays loaded
+        memory_limit_mb: Optional cap on the summed model memory estimates
+
+    Raises:
+        RuntimeError: If a server is already listening on *address*
+    """
+
+    def __init__(
+        self,
+        address: Optional[str] = None,
+        *,
+        authkey: Optional[bytes] = None,
+        max_models: int = DEFAULT_MAX_MODELS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        memory_limit_mb: Optional[float] = None,
+    ) -> None:
+        self._authkey = authkey if authkey is not None else load_authkey(create=True)
+        address = address or default_address()
+        _remove_stale_socket(address, self._authkey)
+        self._listener = Listener(address, authkey=self._authkey)
+        self.pool = ModelPool(
+            max_models=max_models, idle_timeout=idle_timeout, memory_limit_mb=memory_limit_mb,
+        )
+        self._stopping = threading.Event()
+        self._started = time.monotonic()
+
+    @property
+    def address(self) -> str:
+        return self._listener.address
+
+    def serve_forever(self) -> None:
+        """Accept connections until :meth:`shutdown` is called."""
+        reaper = threading.Thread(target=self._reap_idle, name="model-server-reaper", daemon=True)
+        reaper.start()
+        try:
+            while not self._stopping.is_set():
+                try:
+                    conn = self._listener.accept()
+                except (OSError, EOFError, AuthenticationError) as exc:
+                    if self._stopping.is_set():
+                        break
+                    logger.warning("Rejected model server connection: %s", exc)
+                    continue
+                if self._stopping.is_set():
+                    conn.close()
+                    break
+                threading.Thread(
+                    target=self._handle, args=(conn,), name="model-server-client", daemon=True,
+                ).start()
+        finally:
+            self._listener.close()
+            self.pool.close()
+            logger.info("Model server stopped")
+
+    def shutdown(self) -> None:
+        """Stop accepting connections and unload all models."""
+        if self._stopping.is_set():
+            return
+        self._stopping.set()
+        # Wake the blocking accept()
+        try:
+            Client(self.address, authkey=self._authkey).close()
+        except (OSError, EOFError, AuthenticationError):
+            pass
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "uptime": round(time.monotonic() - self._started, 1),
+            "models": self.pool.status(),
+            "waiting": self.pool.waiting,
+            "max_models": self.pool.max_models,
+            "idle_timeout": self.pool.idle_timeout,
+        }
+
+    def _reap_idle(self) -> None:
+        interval = max(1.0, min(30.0, self.pool.idle_timeout / 4.0))
+        while not self._stopping.wait(interval):
+            for key in self.pool.evict_idle():
+                logger.info("Unloaded idle model '%s'", key.model_name)
+
+    def _handle(self, conn: Connection) -> None:
+        send_lock = threading.Lock()
+
+        def send(message: Dict[str, Any]) -> None:
+            with send_lock:
+                conn.send(message)
+
+        try:
+            request = conn.recv()
+            op = request.get("op")
+            if request.get("version") != PROTOCOL_VERSION:
+                send({"type": "error", "message": f"Unsupported protocol version {request.get('version')}"})
+            elif op == "status":
+                send({"type": "status", **self.status()})
+            elif op == "unload":
+                send({"type": "done", "unloaded": self.pool.unload(request.get("model_name"))})
+            elif op == "shutdown":
+                send({"type": "done"})
+                self.shutdown()
+            elif op in ("load", "transcribe"):
+                self._serve_model(conn, request, send)
+            else:
+                send({"type": "error", "message": f"Unknown operation {op!r}"})
+        except (EOFError, OSError):
+            logger.debug("Model server client disconnected", exc_info=True)
+        except Exception as exc:
+            logger.exception("Model server request failed")
+            try:
+                send({"type": "error", "message": str(exc) or type(exc).__name__})
+            except OSError:
+                pass
+        finally:
+            conn.close()
+
+    def _serve_model(
+        self,
+        conn: Connection,
+        request: Dict[str, Any],
+        send: Callable[[Dict[str, Any]], None],
+    ) -> None:
+        spec = dict(request["model"])
+        strict_cuda = bool(spec.pop("strict_cuda", False))
+        key = ModelKey(**spec)
+
+        emitter: Optional[AppEventEmitter] = None
+        if request.get("events"):
+            emitter = AppEventEmitter()
+
+            def forward(event: AppEvent) -> None:
+                try:
+                    send({"type": "event", "event": event})
+                except OSError:
+                    pass
+
+            emitter.subscribe(forward)
+
+        audio = None
+        if request["op"] == "transcribe":
+            audio = request.get("audio")
+            if audio is None:
+                import numpy as np
+
+                audio = np.frombuffer(conn.recv_bytes(), dtype=np.float32)
+
+        resident = self.pool.acquire(key, strict_cuda=strict_cuda, emitter=emitter)
+        try:
+            send({
+                "type": "loaded",
+                "device": resident.device_used,
+                "compute_type": resident.compute_type,
+            })
+            if audio is not None:
+                options = request.get("options") or {}
+                self.pool.submit(resident, _stream_transcription, audio, options, send).result()
+        finally:
+            self.pool.release(resident)
+        send({"type": "done"})
+
+
+# ============================================================
+# Client
+# ============================================================
+
+@dataclass
+class RemoteWord:
+    """A word timing returned by the model server (mirrors faster-whisper ``Word``)."""
+
+    start: float
+    end: float
+    word: str
+    probability: float = 0.0
+
+
+@dataclass
+class RemoteSegment:
+    """A segment returned by the model server (mirrors faster-whisper ``Segment``)."""
+
+    id: int = 0
+    seek: int = 0
+    start: float = 0.0
+    end: float = 0.0
+    text: str = ""
+    tokens: List[int] = field(default_factory=list)
+    avg_logprob: float = 0.0
+    compression_ratio: float = 0.0
+    no_speech_prob: float = 0.0
+    words: Optional[List[RemoteWord]] = None
+    temperature: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RemoteSegment":
+        known = {f.name for f in dataclasses.fields(cls)}
+        values = {name: value for name, value in data.items() if name in known}
+        if values.get("words") is not None:
+            values["words"] = [
+                RemoteWord(**{k: v for k, v in word.items() if k in ("start", "end", "word", "probability")})
+                for word in values["words"]
+            ]
+        return cls(**values)
+
+
+@dataclass
+class RemoteTranscriptionInfo:
+    """Transcription metadata returned by the model server."""
+
+    language: str = ""
+    language_probability: float = 0.0
+    duration: float = 0.0
+    duration_after_vad: float = 0.0
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RemoteTranscriptionInfo":
+        known = {f.name for f in dataclasses.fields(cls)} - {"extra"}
+        info = cls(**{name: data[name] for name in known if name in data})
+        info.extra = {name: value for name, value in data.items() if name not in known}
+        return info
+
+
+def _receive(conn: Connection, emitter: Optional[AppEventEmitter]) -> Dict[str, Any]:
+    """Return the next non-event message, re-emitting forwarded events."""
+    while True:
+        message = conn.recv()
+        kind = message.get("type")
+        if kind == "event":
+            if emitter is not None:
+                emitter.emit(message["event"])
+            continue
+        if kind == "error":
+            raise RuntimeError(f"Model server: {message.get('message')}")
+        return message
+
+
+class ModelServerClient:
+    """Connects to a :class:`ModelServer`.
+
+    Each request uses its own connection, so one client can be shared by
+    several threads.
+    """
+
+    def __init__(self, address: Optional[str] = None, authkey: Optional[bytes] = None) -> None:
+        self.address = address or default_address()
+        self._authkey = authkey
+
+    def is_running(self) -> bool:
+        """Return True if a server answers on this client's address."""
+        try:
+            self.status()
+        except (OSError, EOFError, AuthenticationError, RuntimeError):
+            return False
+        return True
+
+    def status(self) -> Dict[str, Any]:
+        """Return the server's resident models and queue state."""
+        conn = self._request({"op": "status"})
+        try:
+            return _receive(conn, None)
+        finally:
+            conn.close()
+
+    def load(
+        self,
+        model_name: str,
+        device: str = "auto",
+        strict_cuda: bool = False,
+        emitter: Optional[AppEventEmitter] = None,
+        *,
+        num_workers: int = 1,
+        cpu_threads: int = 0,
+    ) -> "RemoteModel":
+        """Make *model_name* resident on the server and return a handle to it.
+
+        Load events (``LOG``, ``MODEL_LOAD``) are re-emitted on *emitter*.
+        """
+        spec = {
+            "model_name": model_name,
+            "device": device,
+            "strict_cuda": strict_cuda,
+            "num_workers": num_workers,
+            "cpu_threads": cpu_threads,
+        }
+        conn = self._request({"op": "load", "model": spec, "events": emitter is not None})
+        try:
+            loaded = _receive(conn, emitter)
+            _receive(conn, emitter)
+        finally:
+            conn.close()
+        return RemoteModel(self, spec, loaded["device"], loaded["compute_type"], emitter)
+
+    def unload(self, model_name: Optional[str] = None) -> int:
+        """Unload idle models on the server; returns how many were unloaded."""
+        conn = self._request({"op": "unload", "model_name": model_name})
+        try:
+            return int(_receive(conn, None).get("unloaded", 0))
+        finally:
+            conn.close()
+
+    def shutdown(self) -> None:
+        """Ask the server to exit."""
+        conn = self._request({"op": "shutdown"})
+        try:
+            _receive(conn, None)
+        finally:
+            conn.close()
+
+    def _request(self, request: Dict[str, Any], payload: Any = None) -> Connection:
+        authkey = self._authkey if self._authkey is not None else load_authkey()
+        conn = Client(self.address, authkey=authkey)
+        try:
+            conn.send({"version": PROTOCOL_VERSION, **request})
+            if payload is not None:
+                conn.send_bytes(payload)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+
+class RemoteModel:
+    """A model resident in the model server, used like a ``WhisperModel``.
+
+    If the server evicted the model in the meantime, the next
+    :meth:`transcribe` call loads it again.
+    """
+
+    def __init__(
+        self,
+        client: ModelServerClient,
+        spec: Dict[str, Any],
+        device_used: str,
+        compute_type: str,
+        emitter: Optional[AppEventEmitter] = None,
+    ) -> None:
+        self.client = client
+        self.model_name = spec["model_name"]
+        self.device_used = device_used
+        self.compute_type = compute_type
+        self._spec = dict(spec)
+        self._emitter = emitter
+
+    def transcribe(
+        self, audio: Any, **options: Any
+    ) -> Tuple[Iterator[RemoteSegment], RemoteTranscriptionInfo]:
+        """Transcribe *audio* (a file path or 16 kHz float32 samples) on the server.
+
+        Segments are yielded as the server produces them. Closing the
+        iterator early closes the connection, which stops the server-side
+        transcription.
+        """
+        request: Dict[str, Any] = {
+            "op": "transcribe",
+            "model": self._spec,
+            "options": options,
+            "events": self._emitter is not None,
+        }
+        payload = None
+        if isinstance(audio, (str, os.PathLike)):
+            request["audio"] = os.fspath(audio)
+        else:
+            import numpy as np
+
+            payload = np.ascontiguousarray(audio, dtype=np.float32)
+
+        conn = self.client._request(request, payload)
+        try:
+            message = _receive(conn, self._emitter)
+            while message.get("type") != "info":
+                if message.get("type") == "done":
+                    raise RuntimeError("Model server returned no transcription")
+                message = _receive(conn, self._emitter)
+        except BaseException:
+            conn.close()
+            raise
+        return self._segments(conn), RemoteTranscriptionInfo.from_dict(message["info"])
+
+    def _segments(self, conn: Connection) -> Iterator[RemoteSegment]:
+        try:
+            while True:
+                message = _receive(conn, self._emitter)
+                if message.get("type") == "segment":
+                    yield RemoteSegment.from_dict(message["segment"])
+                elif message.get("type") == "done":
+                    return
+        finally:
+            conn.close()
+
+
+def ensure_model_server(
+    address: Optional[str] = None,
+    *,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    max_models: int = DEFAULT_MAX_MODELS,
+    startup_timeout: float = DEFAULT_STARTUP_TIMEOUT,
+) -> ModelServerClient:
+    """Return a client for the model server, starting a server if none is running.
+
+    The server is spawned as a detached ``python -m`` process that outlives
+    the caller and exits on ``shutdown`` (models unload after
+    *idle_timeout* seconds unused).
+
+    Raises:
+        RuntimeError: If the server cannot be started (e.g. in a frozen build)
+        TimeoutError: If it does not answer within *startup_timeout* seconds
+    """
+    load_authkey(create=True)
+    client = ModelServerClient(address)
+    if client.is_running():
+        return client
+    # A frozen executable is the app itself, not an interpreter that can
+    # run ``-m``; start the server from a Python install instead
+    if getattr(sys, "frozen", False):
+        raise RuntimeError(
+            "The model server cannot be started from a frozen build; "
+            "run 'python -m audio_visualizer.srt.modelServer' instead"
+        )
+
+    from audio_visualizer.app_logging import get_log_file_path
+
+    package_root = str(Path(__file__).resolve().parents[2])
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+    command = [
+        sys.executable, "-m", "audio_visualizer.srt.modelServer",
+        "--address", client.address,
+        "--idle-timeout", str(idle_timeout),
+        "--max-models", str(max_models),
+        "--log-file", str(get_log_file_path().with_name("model_server.log")),
+    ]
+    popen_options: Dict[str, Any] = {
+        "stdin": subprocess.DEVNULL,
+        "stdout": subprocess.DEVNULL,
+        "stderr": subprocess.DEVNULL,
+        "env": env,
+    }
+    if os.name == "nt":
+        popen_options["creationflags"] = (
+            subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        )
+    else:
+        popen_options["start_new_session"] = True
+    logger.info("Starting model server on %s", client.address)
+    process = subprocess.Popen(command, **popen_options)
+
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        if client.is_running():
+            return client
+        if process.poll() is not None:
+            # Another client may have started a server first
+            if client.is_running():
+                return client
+            raise RuntimeError(f"Model server exited with code {process.returncode}")
+        time.sleep(0.1)
+    raise TimeoutError(f"Model server did not start within {startup_timeout:.0f}s")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve Whisper models to local clients.")
+    parser.add_argument("--address", default=None, help="Socket path or pipe name")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+    parser.add_argument("--max-models", type=int, default=DEFAULT_MAX_MODELS)
+    parser.add_argument("--memory-limit-mb", type=float, default=None)
+    parser.add_argument("--log-file", default=None)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        filename=args.log_file,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    try:
+        server = ModelServer(
+            args.address,
+            max_models=args.max_models,
+            idle_timeout=args.idle_timeout,
+            memory_limit_mb=args.memory_limit_mb,
+        )
+    except RuntimeError as exc:
+        logger.error("%s", exc)
+        return 1
+    logger.info("Model server listening on %s (pid %d)", server.address, os.getpid())
+    server.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -54,6 +54,11 @@ class TranscriptionConfig:
     compression_ratio_threshold: float = 2.4
     initial_prompt: str = ""
 
+    # chunk-parallel inference: "off", "batched" or "replicas"
+    parallel_mode: str = "off"
+    parallel_workers: int = 0  # batch size / replica count, 0 = auto
+    parallel_chunk_sec: float = 30.0
+
 
 @dataclass
 class SilenceConfig:
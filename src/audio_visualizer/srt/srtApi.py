@@ -2,14 +2,21 @@
 """Public library API for the SRT package."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from audio_visualizer.srt.core.pipeline import CoreTranscriptionResult, transcribe_file_internal
+from audio_visualizer.srt.core.pipeline import (
+    CoreTranscriptionResult,
+    PreparedAudio,
+    begin_transcription,
+    prepare_audio,
+)
 from audio_visualizer.events import AppEvent, AppEventEmitter, EventLevel, EventType
 from audio_visualizer.srt.models import PipelineMode, ResolvedConfig, SubtitleBlock
 from audio_visualizer.srt.core.whisperWrapper import init_whisper_model_internal
+from audio_visualizer.srt.io.transcriptCache import TranscriptCache
 
 
 @dataclass
@@ -28,6 +35,7 @@ class TranscriptionResult:
     segments_path: Optional[Path] = None
     json_bundle_path: Optional[Path] = None
     elapsed: Optional[float] = None
+    timings: Dict[str, float] = field(default_factory=dict)
 
 
 def _emit(emitter: Optional[AppEventEmitter], event: AppEvent) -> None:
@@ -35,22 +43,143 @@ def _emit(emitter: Optional[AppEventEmitter], event: AppEvent) -> None:
         emitter.emit(event)
 
 
+# Models loaded ahead of the first transcription, keyed by (model_name,
+# requested device); the first model load hands one out or discards them.
+# Discarding bumps the generation so a preload still running is dropped
+# when it finishes instead of being parked.
+_preload_lock = threading.Lock()
+_preloaded: Dict[Tuple[str, str], Tuple[Any, str, str]] = {}
+_preloading: Dict[Tuple[str, str], threading.Event] = {}
+_preload_generation = 0
+
+
+def preload_model(model_name: str, device: str = "auto") -> Optional[Any]:
+    """Load *model_name* ahead of the first transcription.
+
+    Always imports faster-whisper and probes the CUDA runtime, so the
+    first :func:`load_model` skips both.  The model itself is only
+    loaded when it is already on disk (no download at startup) and will
+    run on the CPU -- a CUDA model keeps its GPU handles on the thread
+    that transcribes.  The next :func:`load_model` call for the same
+    model and device with default options takes the preloaded model
+    instead of loading it again (waiting if the preload is still
+    running); any other model load, or :func:`discard_preloaded_models`,
+    releases it.
+
+    Returns:
+        The preloaded model, or None when no model was loaded.
+    """
+    from faster_whisper import WhisperModel  # noqa: F401
+    from faster_whisper.utils import download_model
+
+    from audio_visualizer.srt.core.whisperWrapper import _check_cuda_runtime
+
+    key = (model_name, device)
+    if device == "cuda" or (device == "auto" and _check_cuda_runtime()[0]):
+        return None
+    if not Path(model_name).is_dir():
+        try:
+            download_model(model_name, local_files_only=True)
+        except Exception:
+            return None
+
+    with _preload_lock:
+        if key in _preloaded or key in _preloading:
+            return None
+        done = _preloading[key] = threading.Event()
+        generation = _preload_generation
+    try:
+        loaded = init_whisper_model_internal(model_name=model_name, device="cpu", strict_cuda=False)
+        with _preload_lock:
+            if generation != _preload_generation:
+                return None
+            _preloaded[key] = loaded
+        return loaded[0]
+    finally:
+        with _preload_lock:
+            _preloading.pop(key, None)
+        done.set()
+
+
+def discard_preloaded_models() -> None:
+    """Drop preloaded models that were never handed out.
+
+    A preload still running is dropped when it finishes.
+    """
+    global _preload_generation
+    with _preload_lock:
+        _preload_generation += 1
+        _preloaded.clear()
+
+
+def _take_preloaded(
+    model_name: str,
+    device: str,
+    *,
+    default_options: bool = True,
+) -> Optional[Tuple[Any, str, str]]:
+    """Hand out the preloaded ``(model, device_used, compute_type)`` for a load.
+
+    Called by every model load.  A preload for the same model and device
+    is returned (waiting for it if still running) when the load uses
+    *default_options*; in every other case preloaded models are
+    discarded, so they never stay in memory next to a second copy.
+    """
+    key = (model_name, device)
+    if default_options:
+        with _preload_lock:
+            pending = _preloading.get(key)
+        if pending is not None:
+            pending.wait()
+        with _preload_lock:
+            taken = _preloaded.pop(key, None)
+    else:
+        taken = None
+    discard_preloaded_models()
+    return taken
+
+
 def load_model(
     model_name: str,
     device: str,
     strict_cuda: bool,
     emitter: Optional[AppEventEmitter] = None,
+    *,
+    num_workers: int = 1,
+    cpu_threads: int = 0,
+    compute_type: Optional[str] = None,
 ) -> Tuple[Any, str, str]:
-    """Load a faster-whisper model for reuse across transcriptions."""
+    """Load a faster-whisper model for reuse across transcriptions.
+
+    ``num_workers`` > 1 loads that many replicas so chunks of one file can
+    be transcribed concurrently (``TranscriptionConfig.parallel_mode =
+    "replicas"``); ``cpu_threads`` sets the threads each replica uses.
+    ``compute_type`` overrides the device default (int8 on CPU, float16
+    on CUDA).  A model from :func:`preload_model` with the same name and
+    device is used when the options are left at their defaults; otherwise
+    preloaded models are discarded.
+    """
 
     _emit(emitter, AppEvent(event_type=EventType.LOG, message=f"Loading model '{model_name}'..."))
     try:
-        model, device_used, compute_type = init_whisper_model_internal(
-            model_name=model_name,
-            device=device,
-            strict_cuda=strict_cuda,
-            emitter=emitter,
+        preloaded = _take_preloaded(
+            model_name,
+            device,
+            default_options=num_workers == 1 and cpu_threads == 0 and compute_type is None,
         )
+        if preloaded is not None:
+            model, device_used, compute_type = preloaded
+            _emit(emitter, AppEvent(event_type=EventType.LOG, message=f"Using preloaded model '{model_name}'"))
+        else:
+            model, device_used, compute_type = init_whisper_model_internal(
+                model_name=model_name,
+                device=device,
+                strict_cuda=strict_cuda,
+                emitter=emitter,
+                num_workers=num_workers,
+                cpu_threads=cpu_threads,
+                compute_type=compute_type,
+            )
         _emit(
             emitter,
             AppEvent(
@@ -92,7 +221,7 @@ def load_model(
         raise
 
 
-def transcribe_file(
+def begin_transcribe_file(
     *,
     input_path: Path,
     output_path: Path,
@@ -117,26 +246,75 @@ def transcribe_file(
     keep_wav: bool = False,
     tmpdir: Optional[Path] = None,
     emitter: Optional[AppEventEmitter] = None,
-) -> TranscriptionResult:
-    """Transcribe a single media file and write outputs."""
+    prepared: Optional[PreparedAudio] = None,
+    transcript_cache: Optional[TranscriptCache] = None,
+    model_name: str = "",
+    lora_name: Optional[str] = None,
+    stream_output: bool = False,
+    cancel_event: Optional[threading.Event] = None,
+    diarization_memory_mb: Optional[float] = None,
+) -> Callable[[], TranscriptionResult]:
+    """Decode and transcribe a media file; return a callable that writes outputs.
+
+    Takes the arguments of :func:`transcribe_file` plus ``prepared`` audio
+    from :func:`prepare_audio`. Inference runs on the calling thread; the
+    returned callable runs post-processing and output writing and returns
+    the ``TranscriptionResult``. Neither step raises: failures are reported
+    through the result.
+    """
 
     if initial_prompt is not None:
         cfg.transcription.initial_prompt = initial_prompt
 
-    try:
+    _emit(
+        emitter,
+        AppEvent(
+            event_type=EventType.JOB_START,
+            message=f"Starting transcription for {input_path.name}",
+            data={
+                "input_path": str(input_path),
+                "output_path": str(output_path),
+                "format": fmt,
+            },
+        ),
+    )
+
+    def failed(exc: Exception) -> TranscriptionResult:
         _emit(
             emitter,
             AppEvent(
-                event_type=EventType.JOB_START,
-                message=f"Starting transcription for {input_path.name}",
+                event_type=EventType.JOB_COMPLETE,
+                message=f"Transcription failed for {input_path.name}",
+                level=EventLevel.ERROR,
                 data={
                     "input_path": str(input_path),
                     "output_path": str(output_path),
-                    "format": fmt,
+                    "success": False,
+                    "error": str(exc),
                 },
             ),
         )
-        result: CoreTranscriptionResult = transcribe_file_internal(
+        _emit(
+            emitter,
+            AppEvent(
+                event_type=EventType.LOG,
+                message=str(exc),
+                level=EventLevel.ERROR,
+            ),
+        )
+        return TranscriptionResult(
+            success=False,
+            input_path=input_path,
+            output_path=output_path,
+            subtitles=[],
+            segments=[],
+            device_used=device_used,
+            compute_type_used=compute_type_used,
+            error=str(exc),
+        )
+
+    try:
+        finish_core = begin_transcription(
             input_path=input_path,
             output_path=output_path,
             word_output_path=word_output_path,
@@ -159,7 +337,23 @@ def transcribe_file(
             keep_wav=keep_wav,
             tmpdir=tmpdir,
             emitter=emitter,
+            prepared=prepared,
+            transcript_cache=transcript_cache,
+            model_name=model_name,
+            lora_name=lora_name,
+            stream_output=stream_output,
+            cancel_event=cancel_event,
+            diarization_memory_mb=diarization_memory_mb,
         )
+    except Exception as exc:
+        result = failed(exc)
+        return lambda: result
+
+    def finish() -> TranscriptionResult:
+        try:
+            result: CoreTranscriptionResult = finish_core()
+        except Exception as exc:
+            return failed(exc)
         _emit(
             emitter,
             AppEvent(
@@ -185,37 +379,84 @@ def transcribe_file(
             segments_path=result.segments_path,
             json_bundle_path=result.json_bundle_path,
             elapsed=result.elapsed,
+            timings=result.timings,
         )
-    except Exception as exc:
-        _emit(
-            emitter,
-            AppEvent(
-                event_type=EventType.JOB_COMPLETE,
-                message=f"Transcription failed for {input_path.name}",
-                level=EventLevel.ERROR,
-                data={
-                    "input_path": str(input_path),
-                    "output_path": str(output_path),
-                    "success": False,
-                    "error": str(exc),
-                },
-            ),
-        )
-        _emit(
-            emitter,
-            AppEvent(
-                event_type=EventType.LOG,
-                message=str(exc),
-                level=EventLevel.ERROR,
-            ),
-        )
-        return TranscriptionResult(
-            success=False,
-            input_path=input_path,
-            output_path=output_path,
-            subtitles=[],
-            segments=[],
-            device_used=device_used,
-            compute_type_used=compute_type_used,
-            error=str(exc),
-        )
+
+    return finish
+
+
+def transcribe_file(
+    *,
+    input_path: Path,
+    output_path: Path,
+    fmt: str,
+    cfg: ResolvedConfig,
+    model: Any,
+    device_used: str,
+    compute_type_used: str,
+    language: Optional[str] = None,
+    initial_prompt: str = "",
+    word_level: bool = False,
+    mode: PipelineMode = PipelineMode.GENERAL,
+    word_output_path: Optional[Path] = None,
+    transcript_path: Optional[Path] = None,
+    segments_path: Optional[Path] = None,
+    json_bundle_path: Optional[Path] = None,
+    correction_srt: Optional[Path] = None,
+    script_path: Optional[Path] = None,
+    diarize: bool = False,
+    hf_token: Optional[str] = None,
+    dry_run: bool = False,
+    keep_wav: bool = False,
+    tmpdir: Optional[Path] = None,
+    emitter: Optional[AppEventEmitter] = None,
+    transcript_cache: Optional[TranscriptCache] = None,
+    model_name: str = "",
+    lora_name: Optional[str] = None,
+    stream_output: bool = False,
+    cancel_event: Optional[threading.Event] = None,
+    diarization_memory_mb: Optional[float] = None,
+) -> TranscriptionResult:
+    """Transcribe a single media file and write outputs.
+
+    With a ``transcript_cache``, ``model_name`` (and ``lora_name``) should
+    name the loaded model so cached transcriptions are matched to it.
+    ``stream_output`` appends finished subtitle blocks to a ``.partial``
+    file next to ``output_path`` during transcription; the complete file
+    replaces ``output_path`` at the end (a failed run removes it).
+    With ``diarize``, diarization runs in a worker process alongside
+    transcription when ``diarization_memory_mb`` (default: available
+    memory) allows; ``cancel_event`` stops both. ``timings`` on the result
+    reports the stage times.
+    """
+    return begin_transcribe_file(
+        input_path=input_path,
+        output_path=output_path,
+        fmt=fmt,
+        cfg=cfg,
+        model=model,
+        device_used=device_used,
+        compute_type_used=compute_type_used,
+        language=language,
+        initial_prompt=initial_prompt,
+        word_level=word_level,
+        mode=mode,
+        word_output_path=word_output_path,
+        transcript_path=transcript_path,
+        segments_path=segments_path,
+        json_bundle_path=json_bundle_path,
+        correction_srt=correction_srt,
+        script_path=script_path,
+        diarize=diarize,
+        hf_token=hf_token,
+        dry_run=dry_run,
+        keep_wav=keep_wav,
+        tmpdir=tmpdir,
+        emitter=emitter,
+        transcript_cache=transcript_cache,
+        model_name=model_name,
+        lora_name=lora_name,
+        stream_output=stream_output,
+        cancel_event=cancel_event,
+        diarization_memory_mb=diarization_memory_mb,
+    )()
@@ -0,0 +1,327 @@
+"""Precomputed log-mel features for LoRA training.
+
+Without a cache, every epoch decodes each clip and recomputes its Whisper
+log-mel features in the dataset's ``__getitem__``.  :func:`precompute_features`
+does that work once per clip, in parallel across a process pool, and
+appends the features to a :class:`FeatureShard`: one flat float32 file per
+feature-extractor configuration, memory-mapped for reading, plus a JSON
+index keyed by a hash of the clip's bytes.  Clips that are already in the
+shard are skipped, so re-running training on the same export (or on an
+export that shares clips) only processes new clips.
+
+Whisper pads every clip to 30 s, so most of each feature matrix is the
+constant log-mel value of silence.  Only the frames before that constant
+tail are stored; :meth:`FeatureShard.get` restores the full matrix
+exactly.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored layout or the feature computation changes
+FEATURE_CACHE_VERSION = 1
+
+_DATA_FILE = "features.f32"
+_INDEX_FILE = "index.json"
+
+# Clips per pool task: large enough to amortise pickling the extractor
+_CHUNK_SIZE = 16
+
+# Extractor config entries that are derived arrays, not settings
+_DERIVED_CONFIG_KEYS = {"mel_filters", "window"}
+
+
+def clip_hash(path: str | Path) -> str:
+    """Return a hash of a clip file's bytes."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def feature_config_key(processor: Any) -> str:
+    """Return a key identifying the feature extractor's configuration.
+
+    Parameters
+    ----------
+    processor:
+        A ``WhisperProcessor`` or its ``feature_extractor``.
+    """
+    extractor = getattr(processor, "feature_extractor", processor)
+    config = extractor.to_dict() if hasattr(extractor, "to_dict") else dict(vars(extractor))
+    settings = {
+        key: value
+        for key, value in config.items()
+        if key not in _DERIVED_CONFIG_KEYS and not hasattr(value, "shape")
+    }
+    payload = json.dumps(
+        {"version": FEATURE_CACHE_VERSION, "type": type(extractor).__name__, "config": settings},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def compute_features(extractor: Any, audio: Any, sampling_rate: int = 16000) -> Any:
+    """Compute the log-mel input features of one clip as float32 ``(n_mels, frames)``."""
+    import numpy as np
+
+    features = extractor(audio, sampling_rate=sampling_rate, return_tensors="np").input_features[0]
+    return np.ascontiguousarray(features, dtype=np.float32)
+
+
+def _trim_padding(features: Any) -> Tuple[Any, float]:
+    """Split off the constant tail that Whisper's 30 s padding produces.
+
+    Returns the leading frames and the tail value; the full matrix is the
+    leading frames followed by columns filled with that value.
+    """
+    import numpy as np
+
+    fill = float(features[0, -1])
+    varying = np.flatnonzero(np.any(features != np.float32(fill), axis=0))
+    frames = int(varying[-1]) + 1 if varying.size else 0
+    return np.ascontiguousarray(features[:, :frames]), fill
+
+
+def _compute_chunk(
+    extractor: Any,
+    paths: Sequence[str],
+    load_audio: Callable[[str], Any],
+) -> List[Tuple[Any, float, int]]:
+    """Worker task: ``(trimmed, fill, total_frames)`` for each clip."""
+    results = []
+    for path in paths:
+        try:
+            features = compute_features(extractor, load_audio(path))
+        except Exception as exc:
+            raise RuntimeError(f"Feature extraction failed for {Path(path).name}: {exc}") from exc
+        trimmed, fill = _trim_padding(features)
+        results.append((trimmed, fill, features.shape[1]))
+    return results
+
+
+class FeatureShard:
+    """Memory-mapped log-mel features for one extractor configuration.
+
+    Parameters
+    ----------
+    directory:
+        Shard directory (created on first write).  Holds the flat float32
+        data file and the JSON index.
+
+    The memory map is opened on first read and is not pickled, so the
+    shard can be handed to DataLoader worker processes, which map the
+    file themselves.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._data: Any = None
+        index_path = self.directory / _INDEX_FILE
+        if index_path.is_file():
+            try:
+                index = json.loads(index_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                logger.warning("Ignoring unreadable feature index %s: %s", index_path, exc)
+            else:
+                if index.get("version") == FEATURE_CACHE_VERSION:
+                    self._entries = index.get("entries", {})
+        if self._entries and not (self.directory / _DATA_FILE).is_file():
+            self._entries = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_data"] = None
+        return state
+
+    def _map(self) -> Any:
+        if self._data is None:
+            import numpy as np
+
+            self._data = np.memmap(self.directory / _DATA_FILE, dtype=np.float32, mode="r")
+        return self._data
+
+    def get(self, key: str) -> Any:
+        """Return the full ``(n_mels, frames)`` feature matrix for a clip hash."""
+        import numpy as np
+
+        entry = self._entries[key]
+        n_mels, frames, total = entry["n_mels"], entry["frames"], entry["total_frames"]
+        out = np.full((n_mels, total), entry["fill"], dtype=np.float32)
+        if frames:
+            offset = entry["offset"]
+            out[:, :frames] = self._map()[offset:offset + n_mels * frames].reshape(n_mels, frames)
+        return out
+
+    def append(self, items: Sequence[Tuple[str, Any, float, int]]) -> None:
+        """Append ``(key, trimmed_features, fill, total_frames)`` items and save the index."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        data_path = self.directory / _DATA_FILE
+        with open(data_path, "ab") as f:
+            offset = f.tell() // 4
+            for key, trimmed, fill, total in items:
+                f.write(trimmed.tobytes())
+                self._entries[key] = {
+                    "offset": offset,
+                    "n_mels": int(trimmed.shape[0]),
+                    "frames": int(trimmed.shape[1]),
+                    "total_frames": int(total),
+                    "fill": fill,
+                }
+                offset += trimmed.size
+        self._data = None  # Remap to see the new data
+        tmp_path = self.directory / (_INDEX_FILE + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"version": FEATURE_CACHE_VERSION, "entries": self._entries}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.directory / _INDEX_FILE)
+
+
+def precompute_features(
+    clip_paths: Sequence[str | Path],
+    processor: Any,
+    cache_dir: str | Path,
+    *,
+    load_audio: Callable[[str], Any],
+    workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    cancel_flag: Any = None,
+) -> Tuple[FeatureShard, List[str]]:
+    """Compute the features of every clip not yet in the cache.
+
+    Parameters
+    ----------
+    clip_paths:
+        Audio clips to cover.
+    processor:
+        A ``WhisperProcessor`` or its ``feature_extractor``.
+    cache_dir:
+        Cache root; the shard lives in a subdirectory named after
+        :func:`feature_config_key`.
+    load_audio:
+        Module-level ``path -> float32 16 kHz samples`` function (it is
+        pickled into the worker processes).
+    workers:
+        Processes used for missing clips.  Defaults to one per CPU;
+        ``1`` runs in this process.
+    progress_callback:
+        Optional ``(clips_done, total, message)`` callback.
+    cancel_flag:
+        Optional ``threading.Event``; when set, remaining chunks are
+        skipped and ``RuntimeError`` is raised.
+
+    Returns
+    -------
+    tuple
+        The shard and the clip hash of each path, in order.
+    """
+    extractor = getattr(processor, "feature_extractor", processor)
+    shard = FeatureShard(Path(cache_dir) / feature_config_key(extractor))
+    keys = [clip_hash(path) for path in clip_paths]
+
+    missing: Dict[str, str] = {}
+    for path, key in zip(clip_paths, keys):
+        if key not in shard and key not in missing:
+            missing[key] = str(path)
+    total = len(keys)
+    done = total - len(missing)
+    if progress_callback:
+        progress_callback(done, total, f"{done} cached clip features, {len(missing)} to compute")
+    if not missing:
+        return shard, keys
+
+    items = list(missing.items())
+    chunks = [items[i:i + _CHUNK_SIZE] for i in range(0, len(items), _CHUNK_SIZE)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(chunks)))
+
+    def collect(chunk: List[Tuple[str, str]], results: List[Tuple[Any, float, int]]) -> None:
+        nonlocal done
+        shard.append([(key, *result) for (key, _path), result in zip(chunk, results)])
+        done += len(chunk)
+        if progress_callback:
+            progress_callback(done, total, f"Computed features for {done}/{total} clips")
+
+    def check_cancel() -> None:
+        if cancel_flag is not None and cancel_flag.is_set():
+            raise RuntimeError("Training cancelled during feature precomputation.")
+
+    if workers == 1:
+        for chunk in chunks:
+            check_cancel()
+            collect(chunk, _compute_chunk(extractor, [path for _key, path in chunk], load_audio))
+        return shard, keys
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        futures = {
+            pool.submit(_compute_chunk, extractor, [path for _key, path in chunk], load_audio): chunk
+            for chunk in chunks
+        }
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                check_cancel()
+                collect(futures[future], future.result())
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return shard, keys
+
+
+class CachedFeatureDataset:
+    """Map-style training dataset reading features from a :class:`FeatureShard`.
+
+    Parameters
+    ----------
+    shard:
+        Shard holding every clip's features.
+    keys:
+        Clip hash of each sample.
+    labels:
+        Token ids of each sample's transcript.
+
+    ``__getitem__`` returns ``{"input_features", "labels"}`` torch tensors,
+    like the dataset it replaces.  The class lives at module level so
+    DataLoader workers can unpickle it under ``spawn``.
+    """
+
+    def __init__(self, shard: FeatureShard, keys: Sequence[str], labels: Sequence[Sequence[int]]) -> None:
+        if len(keys) != len(labels):
+            raise ValueError("Every sample needs one clip key and one label sequence.")
+        self.shard = shard
+        self.keys = list(keys)
+        self.labels = [list(ids) for ids in labels]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __getitem__(self, idx: int) -> Dict[str, Any]:
+        import torch
+
+        return {
+            "input_features": torch.from_numpy(self.shard.get(self.keys[idx])),
+            "labels": torch.tensor(self.labels[idx], dtype=torch.long),
+        }
@@ -4,6 +4,9 @@ Provides a typed training configuration and a ``train_lora()`` entry point
 that loads a base Whisper model through Transformers, applies PEFT LoRA
 training, and emits progress via the shared app event system.
 
+Log-mel features are computed once per clip before training and read
+from a memory-mapped cache during every epoch (see ``featureCache``).
+
 Training is guarded behind ``has_training_stack()`` and ``has_cuda()``
 capability checks.  When the training stack is unavailable, functions
 raise clear errors rather than importing heavy dependencies.
@@ -11,6 +14,7 @@ raise clear errors rather than importing heavy dependencies.
 from __future__ import annotations
 
 import csv
+import dataclasses
 import json
 import logging
 import os
@@ -73,6 +77,12 @@ class LoraTrainingConfig:
     gradient_accumulation_steps: int = 1
     max_grad_norm: float = 1.0
     fp16: bool = True
+    # Feature cache location; None uses <dataset_dir>/.feature_cache
+    feature_cache_dir: Optional[Path] = None
+    # Processes computing missing features; 0 uses one per CPU
+    feature_workers: int = 0
+    # DataLoader worker processes prefetching cached features
+    dataloader_workers: int = 2
 
 
 def validate_training_config(config: LoraTrainingConfig) -> List[str]:
@@ -128,6 +138,9 @@ def validate_training_config(config: LoraTrainingConfig) -> List[str]:
     if config.lora_rank < 1:
         errors.append("LoRA rank must be at least 1.")
 
+    if config.feature_workers < 0 or config.dataloader_workers < 0:
+        errors.append("Worker counts must not be negative.")
+
     return errors
 
 
@@ -251,7 +264,13 @@ def train_lora(
 
     # Load dataset from metadata.csv
     dataset = _load_training_dataset(
-        config.dataset_dir, processor, model.config
+        config.dataset_dir,
+        processor,
+        model.config,
+        cache_dir=config.feature_cache_dir,
+        workers=config.feature_workers or None,
+        emitter=emitter,
+        cancel_flag=cancel_flag,
     )
 
     if cancel_flag and cancel_flag.is_set():
@@ -270,6 +289,7 @@ def train_lora(
 
     # Training arguments
     training_args = Seq2SeqTrainingArguments(
+        **_dataloader_arguments(Seq2SeqTrainingArguments, config.dataloader_workers),
         output_dir=str(adapter_dir),
         num_train_epochs=config.num_epochs,
         per_device_train_batch_size=config.batch_size,
@@ -343,19 +363,44 @@ def train_lora(
     return ct2_dir
 
 
+def _dataloader_arguments(args_class: Any, workers: int) -> dict:
+    """Return DataLoader prefetch settings supported by *args_class*.
+
+    Worker processes read the memory-mapped features ahead of the training
+    step; persistent workers keep their mappings open across epochs.
+    Older transformers releases lack the prefetch/persistence arguments.
+    """
+    if workers < 1:
+        return {"dataloader_num_workers": 0}
+    supported = {f.name for f in dataclasses.fields(args_class)}
+    kwargs: dict = {"dataloader_num_workers": workers}
+    if "dataloader_prefetch_factor" in supported:
+        kwargs["dataloader_prefetch_factor"] = 4
+    if "dataloader_persistent_workers" in supported:
+        kwargs["dataloader_persistent_workers"] = True
+    return kwargs
+
+
 def _load_training_dataset(
     dataset_dir: Path,
     processor: Any,
     model_config: Any,
+    *,
+    cache_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+    emitter: Optional[AppEventEmitter] = None,
+    cancel_flag: Optional[threading.Event] = None,
 ) -> Any:
     """Load a training dataset from metadata.csv and audio clips.
 
-    Returns a torch Dataset suitable for Seq2SeqTrainer.
+    Features of clips missing from the feature cache are computed first
+    (in parallel), and transcripts are tokenized once.
+
+    Returns a ``CachedFeatureDataset`` suitable for Seq2SeqTrainer.
     """
-    import torch
-    from torch.utils.data import Dataset as TorchDataset
-    import numpy as np
+    from audio_visualizer.srt.training.featureCache import CachedFeatureDataset, precompute_features
 
+    dataset_dir = Path(dataset_dir)
     metadata_path = dataset_dir / "metadata.csv"
     samples: List[dict] = []
     with open(metadata_path, "r", encoding="utf-8") as f:
@@ -371,37 +416,25 @@ def _load_training_dataset(
     if not samples:
         raise ValueError("No valid audio samples found in the dataset.")
 
-    class WhisperLoraDataset(TorchDataset):
-        def __init__(self, samples, processor, model_config):
-            self.samples = samples
-            self.processor = processor
-            self.model_config = model_config
-
-        def __len__(self):
-            return len(self.samples)
-
-        def __getitem__(self, idx):
-            sample = self.samples[idx]
-            # Load audio
-            audio = _load_audio_file(sample["audio_path"])
-            # Process
-            input_features = self.processor(
-                audio,
-                sampling_rate=16000,
-                return_tensors="pt",
-            ).input_features.squeeze(0)
-            # Tokenize text
-            labels = self.processor.tokenizer(
-                sample["text"],
-                return_tensors="pt",
-            ).input_ids.squeeze(0)
-
-            return {
-                "input_features": input_features,
-                "labels": labels,
-            }
-
-    return WhisperLoraDataset(samples, processor, model_config)
+    def report(done: int, total: int, message: str) -> None:
+        _emit(emitter, AppEvent(
+            event_type=EventType.PROGRESS,
+            message=message,
+            data={"percent": done / total * 100 if total else 100.0},
+        ))
+
+    shard, keys = precompute_features(
+        [sample["audio_path"] for sample in samples],
+        processor,
+        cache_dir if cache_dir is not None else dataset_dir / ".feature_cache",
+        load_audio=_load_audio_file,
+        workers=workers,
+        progress_callback=report,
+        cancel_flag=cancel_flag,
+    )
+    labels = [processor.tokenizer(sample["text"]).input_ids for sample in samples]
+    logger.info("Training dataset: %d clips, feature cache %s", len(samples), shard.directory)
+    return CachedFeatureDataset(shard, keys, labels)
 
 
 def _load_audio_file(path: str) -> Any:
@@ -0,0 +1,289 @@
+"""Startup timing, lazy imports and background warm-up.
+
+Keeps heavy optional dependencies (numpy, PyAV, librosa, faster-whisper,
+torch, ...) off the path to the first window:
+
+* :func:`lazy_import` returns a module proxy that imports on first
+  attribute access, so module-level ``np = lazy_import("numpy")`` costs
+  nothing until a function actually uses it;
+* :func:`measure_import` / :func:`import_costs` record what each import
+  cost (lazy proxies and warm-up tasks record theirs automatically);
+* :func:`mark` / :func:`startup_marks` time startup milestones;
+* :func:`run_warmup` runs the selected :data:`WARMUP_TASKS` (librosa,
+  encoder probes, the default Whisper model, the training stack) on a
+  background thread once the window is visible, so the first render,
+  waveform or transcription does not pay for them on the GUI thread.
+"""
+from __future__ import annotations
+
+import importlib
+import logging
+import sys
+import threading
+import time
+import types
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Reference point for startup marks (this module is imported first by main())
+_T0 = time.perf_counter()
+
+_marks: dict[str, float] = {}
+_costs: list["ImportCost"] = []
+_costs_lock = threading.Lock()
+
+# Heavy optional dependencies; none of them may load before the first window
+HEAVY_MODULES: tuple[str, ...] = (
+    "numpy",
+    "av",
+    "librosa",
+    "faster_whisper",
+    "ctranslate2",
+    "torch",
+    "transformers",
+    "pyannote.audio",
+)
+
+
+# ------------------------------------------------------------------
+# Startup marks
+# ------------------------------------------------------------------
+
+def mark(name: str) -> float:
+    """Record milestone *name*; return seconds since startup began."""
+    elapsed = time.perf_counter() - _T0
+    _marks.setdefault(name, elapsed)
+    logger.debug("Startup mark %s: %.1f ms", name, elapsed * 1000)
+    return elapsed
+
+
+def startup_marks() -> dict[str, float]:
+    """Return recorded milestones (seconds since startup began)."""
+    return dict(_marks)
+
+
+# ------------------------------------------------------------------
+# Import cost
+# ------------------------------------------------------------------
+
+@dataclass
+class ImportCost:
+    """Wall time spent importing one module.
+
+    ``already_loaded`` is True when the module was imported before the
+    measurement (cost ~0); ``error`` holds the exception text when the
+    import failed.
+    """
+
+    module: str
+    seconds: float
+    already_loaded: bool = False
+    error: Optional[str] = None
+
+
+def _record(cost: ImportCost) -> ImportCost:
+    with _costs_lock:
+        _costs.append(cost)
+    logger.debug("Import %s: %.1f ms%s", cost.module, cost.seconds * 1000,
+                 f" (failed: {cost.error})" if cost.error else "")
+    return cost
+
+
+def measure_import(name: str) -> ImportCost:
+    """Import *name*, recording and returning what it cost.
+
+    Never raises; a failed import is reported through ``error``.
+    """
+    if name in sys.modules:
+        return _record(ImportCost(name, 0.0, already_loaded=True))
+    start = time.perf_counter()
+    try:
+        importlib.import_module(name)
+    except Exception as exc:
+        return _record(ImportCost(name, time.perf_counter() - start, error=str(exc)))
+    return _record(ImportCost(name, time.perf_counter() - start))
+
+
+def measure_imports(names: Iterable[str]) -> list[ImportCost]:
+    """Import each module in turn; each cost excludes modules loaded earlier."""
+    return [measure_import(name) for name in names]
+
+
+def import_costs() -> list[ImportCost]:
+    """Return every import cost recorded so far, in order."""
+    with _costs_lock:
+        return list(_costs)
+
+
+def loaded_heavy_modules() -> list[str]:
+    """Return the :data:`HEAVY_MODULES` that are currently imported."""
+    return [name for name in HEAVY_MODULES if name in sys.modules]
+
+
+# ------------------------------------------------------------------
+# Lazy modules
+# ------------------------------------------------------------------
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access.
+
+    The import runs once (under a lock, so warm-up threads and the GUI
+    thread can race for it) and its cost is recorded; attributes are
+    copied onto the proxy as they are first looked up.  Import errors
+    surface at the first attribute access, as they would at the call
+    site of a function-level import.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_lock"] = threading.Lock()
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is not None:
+            return module
+        with self.__dict__["_lazy_lock"]:
+            module = self.__dict__["_lazy_module"]
+            if module is None:
+                name = self.__name__
+                loaded = name in sys.modules
+                start = time.perf_counter()
+                module = importlib.import_module(name)
+                _record(ImportCost(name, time.perf_counter() - start, already_loaded=loaded))
+                self.__dict__["_lazy_module"] = module
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the real module has been imported through this proxy."""
+        return self.__dict__["_lazy_module"] is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only called on a miss: cache the value so later lookups (np.mean
+        # in per-frame loops) are plain module attribute reads
+        value = getattr(self._load(), attr)
+        self.__dict__[attr] = value
+        return value
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> Any:
+    """Return *name* if already imported, else a :class:`LazyModule` proxy."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+# ------------------------------------------------------------------
+# Warm-up
+# ------------------------------------------------------------------
+
+@dataclass
+class WarmupResult:
+    """Outcome of one warm-up task."""
+
+    task: str
+    seconds: float
+    ok: bool
+    detail: str = ""
+
+
+def _warm_librosa(options: dict[str, Any]) -> str:
+    # librosa resolves its submodules lazily; touch the ones the app uses
+    import librosa
+
+    for path in ("load", "feature.chroma_stft", "feature.rms", "beat.beat_track"):
+        target: Any = librosa
+        for part in path.split("."):
+            target = getattr(target, part)
+    return "librosa " + getattr(librosa, "__version__", "")
+
+
+def _warm_encoders(options: dict[str, Any]) -> str:
+    from audio_visualizer import hwaccel
+
+    encoders = hwaccel.detect_working_subprocess_encoders()
+    pyav = hwaccel.detect_pyav_encoders()
+    return f"ffmpeg: {', '.join(encoders)}; pyav: {', '.join(pyav)}"
+
+
+def _warm_whisper(options: dict[str, Any]) -> str:
+    from audio_visualizer.srt.srtApi import preload_model
+
+    model_name = options.get("model_name") or "base"
+    device = options.get("device") or "auto"
+    if not options.get("preload", True):
+        import faster_whisper  # noqa: F401
+
+        return "imports ready"
+    model = preload_model(model_name, device)
+    if model is None:
+        return f"imports ready; '{model_name}' not preloaded"
+    return f"'{model_name}' preloaded on cpu"
+
+
+def _warm_training(options: dict[str, Any]) -> str:
+    from audio_visualizer.capabilities import has_cuda, has_training_stack
+
+    return f"training stack: {has_training_stack()}, cuda: {has_cuda()}"
+
+
+# Task name -> callable(options) returning a short detail string.
+# ``whisper`` options: model_name, device, preload (False = imports only).
+WARMUP_TASKS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "librosa": _warm_librosa,
+    "encoders": _warm_encoders,
+    "whisper": _warm_whisper,
+    "training": _warm_training,
+}
+
+DEFAULT_WARMUP_TASKS: tuple[str, ...] = ("librosa", "encoders", "whisper")
+
+
+def run_warmup(
+    tasks: Iterable[str],
+    options: Optional[dict[str, dict[str, Any]]] = None,
+    *,
+    cancel_event: Optional[threading.Event] = None,
+    on_result: Optional[Callable[[WarmupResult], None]] = None,
+) -> list[WarmupResult]:
+    """Run warm-up *tasks* in order on the calling thread.
+
+    ``options`` maps a task name to its keyword options (``whisper``
+    takes ``model_name`` and ``device``).  Unknown task names are
+    skipped with a warning, failures are logged and reported, and
+    ``cancel_event`` stops before the next task.
+    """
+    options = options or {}
+    results: list[WarmupResult] = []
+    for task in tasks:
+        if cancel_event is not None and cancel_event.is_set():
+            break
+        fn = WARMUP_TASKS.get(task)
+        if fn is None:
+            logger.warning("Unknown warm-up task: %s", task)
+            continue
+        start = time.perf_counter()
+        try:
+            detail = fn(options.get(task, {}))
+            result = WarmupResult(task, time.perf_counter() - start, True, detail)
+        except Exception as exc:
+            result = WarmupResult(task, time.perf_counter() - start, False, str(exc))
+        logger.info(
+            "Warm-up %s: %.0f ms (%s)%s",
+            task, result.seconds * 1000, result.detail, "" if result.ok else " failed",
+        )
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return results
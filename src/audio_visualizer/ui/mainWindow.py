@@ -23,18 +23,19 @@ SOFTWARE.
 '''
 from __future__ import annotations
 
-from PySide6.QtCore import QObject, QRunnable, QThreadPool, QUrl, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, QUrl, Signal
 from PySide6.QtGui import QAction, QDesktopServices
 from PySide6.QtWidgets import QFileDialog, QHBoxLayout, QMainWindow, QMessageBox, QStackedWidget, QVBoxLayout, QWidget
 
 import logging
+import threading
 import time
 from fractions import Fraction
 from pathlib import Path
 
 from audio_visualizer.app_logging import get_log_file_path, install_process_diagnostics
 from audio_visualizer.app_paths import get_config_dir
-from audio_visualizer import updater
+from audio_visualizer import startup, updater
 from audio_visualizer.ui.workspaceContext import WorkspaceContext
 from audio_visualizer.ui.navigationSidebar import NavigationSidebar
 from audio_visualizer.ui.jobStatusWidget import JobStatusWidget
@@ -79,6 +80,9 @@ class MainWindow(QMainWindow):
         self._busy_owner_tab_id: str | None = None
         self._current_theme_mode = "auto"
         self._startup_settings_data: dict | None = None
+        self._startup_warmup_tasks: list[str] = list(startup.DEFAULT_WARMUP_TASKS)
+        self._startup_warmup_worker: StartupWarmupWorker | None = None
+        self._first_show_done = False
 
         # Tab registry
         self._tabs: list[BaseTab] = []
@@ -121,6 +125,10 @@ class MainWindow(QMainWindow):
             return
         app_data = self._startup_settings_data.get("app", {})
         self._apply_theme(app_data.get("theme_mode", "auto"))
+        self._set_startup_warmup_tasks(app_data.get("startup_warmup", startup.DEFAULT_WARMUP_TASKS))
+
+    def _set_startup_warmup_tasks(self, tasks) -> None:
+        self._startup_warmup_tasks = [t for t in tasks if t in startup.WARMUP_TASKS]
 
     def _build_shell(self) -> None:
         """Build the central QStackedWidget + NavigationSidebar + JobStatusWidget."""
@@ -710,6 +718,8 @@ class MainWindow(QMainWindow):
             app_settings = result.get("app", {})
             theme_mode = app_settings.get("theme_mode", "auto")
             self._apply_theme(theme_mode)
+            if "startup_warmup" in app_settings:
+                self._set_startup_warmup_tasks(app_settings["startup_warmup"])
             # Apply project folder
             project_folder = result.get("project_folder", "")
             if project_folder:
@@ -801,6 +811,7 @@ class MainWindow(QMainWindow):
         schema = create_default_schema()
         # App settings
         schema["app"]["theme_mode"] = self._current_theme_mode
+        schema["app"]["startup_warmup"] = list(self._startup_warmup_tasks)
         # UI state
         active = self.active_tab()
         schema["ui"]["last_active_tab"] = active.tab_id if active else "audio_visualizer"
@@ -829,6 +840,7 @@ class MainWindow(QMainWindow):
         app_data = data.get("app", {})
         theme_mode = app_data.get("theme_mode", "auto")
         self._apply_theme(theme_mode)
+        self._set_startup_warmup_tasks(app_data.get("startup_warmup", startup.DEFAULT_WARMUP_TASKS))
 
         # UI state
         ui_state = data.get("ui", {})
@@ -922,7 +934,49 @@ class MainWindow(QMainWindow):
                     "Unable to load the project file.",
                 ).exec()
 
+    # ------------------------------------------------------------------
+    # Startup warm-up
+    # ------------------------------------------------------------------
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if not self._first_show_done:
+            self._first_show_done = True
+            logger.info("First window shown: %.1f ms after launch", startup.mark("window_shown") * 1000)
+            # Let the first frame paint before starting background work
+            QTimer.singleShot(0, self._start_startup_warmup)
+
+    def _srt_gen_settings(self) -> dict:
+        tab = self._tab_map.get("srt_gen")
+        if tab is not None:
+            return tab.collect_settings()
+        return self._pending_tab_settings.get("srt_gen", {})
+
+    def _start_startup_warmup(self) -> None:
+        """Warm the selected heavy dependencies on a background thread."""
+        if not self._startup_warmup_tasks or self._startup_warmup_worker is not None:
+            return
+        worker = StartupWarmupWorker(self._startup_warmup_tasks, self._srt_gen_settings())
+        worker.signals.finished.connect(self._on_startup_warmup_finished)
+        self._startup_warmup_worker = worker
+        self._background_thread_pool.start(worker)
+
+    def _on_startup_warmup_finished(self, results: list) -> None:
+        failed = [r.task for r in results if not r.ok]
+        logger.info(
+            "Startup warm-up finished: %.1f ms after launch (%s)%s",
+            startup.mark("warmup_done") * 1000,
+            ", ".join(f"{r.task} {r.seconds * 1000:.0f} ms" for r in results),
+            f"; failed: {', '.join(failed)}" if failed else "",
+        )
+
     def closeEvent(self, event) -> None:
+        if self._startup_warmup_worker is not None:
+            self._startup_warmup_worker.cancel()
+            if "whisper" in self._startup_warmup_worker._tasks:
+                from audio_visualizer.srt.srtApi import discard_preloaded_models
+
+                discard_preloaded_models()
         self._save_settings_to_path(self._default_settings_path())
         super().closeEvent(event)
 
@@ -952,6 +1006,52 @@ class UpdateCheckWorker(QRunnable):
             self.signals.error.emit(str(exc))
 
 
+class StartupWarmupWorker(QRunnable):
+    """Run the selected startup warm-up tasks off the GUI thread.
+
+    The Whisper task preloads the SRT Gen tab's selected model and device
+    (importing the tab module on the way, so opening the tab is quick
+    too); with a LoRA adapter or the shared model server selected the
+    worker would not use an in-process base model, so only the imports
+    are warmed.
+    """
+
+    def __init__(self, tasks: list[str], srt_gen_settings: dict) -> None:
+        super().__init__()
+
+        class WarmupSignals(QObject):
+            finished = Signal(list)
+
+        self.signals = WarmupSignals()
+        self._tasks = list(tasks)
+        self._srt_gen_settings = dict(srt_gen_settings)
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def _whisper_options(self) -> dict:
+        from audio_visualizer.ui.tabs.srtGenTab import _MODEL_MAP
+
+        settings = self._srt_gen_settings
+        display_name = settings.get("model") or "base"
+        return {
+            "model_name": _MODEL_MAP.get(display_name, display_name),
+            "device": settings.get("device") or "auto",
+            "preload": not (settings.get("lora_name") or settings.get("use_model_server")),
+        }
+
+    def run(self) -> None:
+        options = {}
+        if "whisper" in self._tasks:
+            try:
+                options["whisper"] = self._whisper_options()
+            except Exception:
+                logger.exception("Could not resolve the Whisper warm-up model")
+        results = startup.run_warmup(self._tasks, options, cancel_event=self._cancel)
+        self.signals.finished.emit(results)
+
+
 class RenderWorker(QRunnable):
     """Render worker for the Audio Visualizer tab.
 
@@ -11,6 +11,7 @@ import threading
 
 from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtWidgets import (
+    QCheckBox,
     QComboBox,
     QDialog,
     QDialogButtonBox,
@@ -29,6 +30,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from audio_visualizer.startup import DEFAULT_WARMUP_TASKS
+
 logger = logging.getLogger(__name__)
 
 _THEME_OPTIONS = [
@@ -37,6 +40,14 @@ _THEME_OPTIONS = [
     ("auto", "Auto"),
 ]
 
+# Startup warm-up task -> checkbox label
+_WARMUP_OPTIONS = [
+    ("librosa", "Audio analysis (librosa)"),
+    ("encoders", "Video encoder probes"),
+    ("whisper", "Default Whisper model"),
+    ("training", "Training stack (torch)"),
+]
+
 
 class _ModelActionSignals(QObject):
     """Signals emitted by the background model download/delete worker."""
@@ -111,6 +122,20 @@ class SettingsDialog(QDialog):
         theme_group.setLayout(theme_layout)
         layout.addWidget(theme_group)
 
+        # Startup warm-up group
+        warmup_group = QGroupBox("Startup")
+        warmup_layout = QVBoxLayout()
+        warmup_layout.addWidget(QLabel("Load in the background after the window opens:"))
+        current_warmup = settings.get("app", {}).get("startup_warmup", DEFAULT_WARMUP_TASKS)
+        self._warmup_checks: dict[str, QCheckBox] = {}
+        for task, label in _WARMUP_OPTIONS:
+            check = QCheckBox(label)
+            check.setChecked(task in current_warmup)
+            warmup_layout.addWidget(check)
+            self._warmup_checks[task] = check
+        warmup_group.setLayout(warmup_layout)
+        layout.addWidget(warmup_group)
+
         # Project folder group
         folder_group = QGroupBox("Project")
         folder_layout = QFormLayout()
@@ -317,6 +342,9 @@ class SettingsDialog(QDialog):
         self._result_settings = {
             "app": {
                 "theme_mode": self._theme_combo.currentData() or "auto",
+                "startup_warmup": [
+                    task for task, check in self._warmup_checks.items() if check.isChecked()
+                ],
             },
             "project_folder": self._project_folder_edit.text().strip(),
         }
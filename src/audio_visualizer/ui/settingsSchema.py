@@ -10,6 +10,8 @@ import json
 import logging
 from pathlib import Path
 
+from audio_visualizer.startup import DEFAULT_WARMUP_TASKS
+
 logger = logging.getLogger(__name__)
 
 # ------------------------------------------------------------------
@@ -47,6 +49,9 @@ def create_default_schema() -> dict:
         "version": CURRENT_SCHEMA_VERSION,
         "app": {
             "theme_mode": "auto",  # "off", "on", "auto"
+            # Background warm-up tasks run after the window appears
+            # (see audio_visualizer.startup.WARMUP_TASKS)
+            "startup_warmup": list(DEFAULT_WARMUP_TASKS),
         },
         "ui": {
             "last_active_tab": "audio_visualizer",
@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -27,6 +28,7 @@ from PySide6.QtWidgets import (
     QProgressBar,
     QPushButton,
     QScrollArea,
+    QSlider,
     QSpinBox,
     QVBoxLayout,
     QWidget,
@@ -36,6 +38,7 @@ from audio_visualizer.events import AppEventEmitter
 from audio_visualizer.caption.captionApi import RenderConfig
 from audio_visualizer.caption.core.config import AnimationConfig, PresetConfig
 from audio_visualizer.caption.presets.defaults import list_builtin_presets
+from audio_visualizer.caption.presets.registry import start_cache_warmup
 from audio_visualizer.caption.presets.loader import (
     PresetLoader,
     ensure_example_presets,
@@ -45,6 +48,7 @@ from audio_visualizer.caption.animations import AnimationRegistry
 from audio_visualizer.ui.workspaceContext import SessionAsset, WorkspaceContext
 from audio_visualizer.ui.sessionFilePicker import pick_session_or_file
 from audio_visualizer.ui.tabs.baseTab import BaseTab
+from audio_visualizer.ui.tabs.captionPreviewService import CaptionPreviewService
 from audio_visualizer.ui.workers.captionRenderWorker import (
     CaptionRenderJobSpec,
     CaptionRenderWorker,
@@ -53,10 +57,11 @@ from audio_visualizer.ui.workers.captionRenderWorker import (
 logger = logging.getLogger(__name__)
 
 _SUBTITLE_FILTERS = (
-    "Subtitle files (*.srt *.ass *.json);;"
+    "Subtitle files (*.srt *.ass *.json *.avbundle);;"
     "SRT files (*.srt);;"
     "ASS files (*.ass);;"
     "JSON bundle files (*.json);;"
+    "Columnar bundle files (*.avbundle);;"
     "All files (*)"
 )
 
@@ -91,6 +96,12 @@ _WRAP_STYLE_OPTIONS = [
 _PRESET_SOURCES = ["Built-in", "File", "App-data library"]
 
 
+def _format_scrub_time(ms: int) -> str:
+    """Format a scrubber position as ``MM:SS.mmm``."""
+    minutes, rem = divmod(max(0, int(ms)), 60_000)
+    return f"{minutes:02d}:{rem / 1000:06.3f}"
+
+
 class CaptionAnimateTab(BaseTab):
     """Full-surface Caption Animate tab with preset management and rendering."""
 
@@ -118,6 +129,9 @@ class CaptionAnimateTab(BaseTab):
         self._is_preview_render = False
         self._preview_temp_dir: Optional[str] = None
         self._build_ui()
+        # Parse built-in presets and load their fonts off the GUI thread so
+        # the first preview or render finds them cached
+        start_cache_warmup()
 
     # ------------------------------------------------------------------
     # UI construction
@@ -164,7 +178,7 @@ class CaptionAnimateTab(BaseTab):
         sub_row = QHBoxLayout()
         sub_row.addWidget(QLabel("Subtitle file:"))
         self._subtitle_edit = QLineEdit()
-        self._subtitle_edit.setPlaceholderText("Select a .srt, .ass, or .json bundle file")
+        self._subtitle_edit.setPlaceholderText("Select a .srt, .ass, or .json/.avbundle bundle file")
         sub_row.addWidget(self._subtitle_edit)
         self._subtitle_browse_btn = QPushButton("Browse...")
         self._subtitle_browse_btn.clicked.connect(self._browse_subtitle)
@@ -605,6 +619,33 @@ class CaptionAnimateTab(BaseTab):
         ctrl_row.addStretch()
         layout.addLayout(ctrl_row)
 
+        # Instant single-frame preview driven by a timeline scrubber
+        self._frame_preview_service: CaptionPreviewService | None = None
+        frame_row = QHBoxLayout()
+        self._frame_preview_btn = QPushButton("Load Frame Preview")
+        self._frame_preview_btn.setToolTip(
+            "Prepare the current subtitle and style once, then scrub to any "
+            "timestamp to see the exact rendered caption frame."
+        )
+        self._frame_preview_btn.clicked.connect(self._load_frame_preview)
+        frame_row.addWidget(self._frame_preview_btn)
+
+        self._frame_scrubber = QSlider(Qt.Orientation.Horizontal)
+        self._frame_scrubber.setRange(0, 0)
+        self._frame_scrubber.setEnabled(False)
+        self._frame_scrubber.valueChanged.connect(self._on_frame_scrubbed)
+        frame_row.addWidget(self._frame_scrubber, 1)
+
+        self._frame_time_label = QLabel(_format_scrub_time(0))
+        frame_row.addWidget(self._frame_time_label)
+        layout.addLayout(frame_row)
+
+        self._frame_preview_label = QLabel("Load a frame preview to scrub captions.")
+        self._frame_preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._frame_preview_label.setMinimumHeight(120)
+        self._frame_preview_label.setStyleSheet("background-color: #333333;")
+        layout.addWidget(self._frame_preview_label)
+
         # Media player for preview playback
         try:
             from PySide6.QtMultimediaWidgets import QVideoWidget
@@ -999,7 +1040,7 @@ class CaptionAnimateTab(BaseTab):
     def _update_word_timing_indicator(self, path: Path | str) -> None:
         """Show word-timing quality label for the selected subtitle file."""
         p = Path(path) if not isinstance(path, Path) else path
-        if p.suffix.lower() == ".json":
+        if p.suffix.lower() in (".json", ".avbundle"):
             self._word_timing_label.setText(
                 "Bundle loaded — precise word timing available for word-aware animations"
             )
@@ -1308,6 +1349,68 @@ class CaptionAnimateTab(BaseTab):
             self._preview_play_btn.setEnabled(True)
             self._preview_stop_btn.setEnabled(True)
 
+    # ------------------------------------------------------------------
+    # Frame preview (timeline scrubber)
+    # ------------------------------------------------------------------
+
+    def _ensure_frame_preview_service(self) -> CaptionPreviewService:
+        if self._frame_preview_service is None:
+            service = CaptionPreviewService(parent=self)
+            service.prepared.connect(self._on_frame_preview_prepared)
+            service.frame_ready.connect(self._on_frame_preview_ready)
+            service.failed.connect(self._on_frame_preview_failed)
+            self._frame_preview_service = service
+        return self._frame_preview_service
+
+    def _load_frame_preview(self) -> None:
+        """Prepare the current subtitle and style for frame scrubbing."""
+        valid, msg = self.validate_settings()
+        if not valid:
+            QMessageBox.warning(self, "Validation Error", msg)
+            return
+
+        subtitle_path = Path(self._subtitle_edit.text().strip())
+        config = RenderConfig(
+            preset=self._current_preset_name(),
+            fps=self._fps_combo.currentText(),
+            safety_scale=self._safety_scale_spin.value(),
+            apply_animation=self._apply_animation_cb.isChecked(),
+            reskin=self._reskin_cb.isChecked(),
+        )
+        service = self._ensure_frame_preview_service()
+        service.prepare(subtitle_path, config, self._collect_preset_config())
+        self._frame_preview_label.setText("Preparing frame preview...")
+
+    def _on_frame_preview_prepared(self, duration_ms: int) -> None:
+        position = min(self._frame_scrubber.value(), duration_ms)
+        self._frame_scrubber.blockSignals(True)
+        self._frame_scrubber.setRange(0, max(0, duration_ms))
+        self._frame_scrubber.setSingleStep(100)
+        self._frame_scrubber.setPageStep(1000)
+        self._frame_scrubber.setValue(position)
+        self._frame_scrubber.blockSignals(False)
+        self._frame_scrubber.setEnabled(True)
+        self._on_frame_scrubbed(position)
+
+    def _on_frame_scrubbed(self, value: int) -> None:
+        self._frame_time_label.setText(_format_scrub_time(value))
+        if self._frame_preview_service is not None and self._frame_scrubber.isEnabled():
+            self._frame_preview_service.request_frame(value)
+
+    def _on_frame_preview_ready(self, time_ms: int, image: QImage) -> None:
+        pixmap = QPixmap.fromImage(image)
+        target = self._frame_preview_label.size()
+        if pixmap.width() > target.width() or pixmap.height() > target.height():
+            pixmap = pixmap.scaled(
+                target,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        self._frame_preview_label.setPixmap(pixmap)
+
+    def _on_frame_preview_failed(self, message: str) -> None:
+        self._frame_preview_label.setText(f"Frame preview failed: {message}")
+
     def _on_preview_play(self) -> None:
         if self._preview_available:
             self._preview_media_player.play()
@@ -1601,8 +1704,8 @@ class CaptionAnimateTab(BaseTab):
         if not sub_path:
             return False, "No subtitle file selected."
         p = Path(sub_path)
-        if p.suffix.lower() not in (".srt", ".ass", ".json"):
-            return False, "Subtitle file must be .srt, .ass, or .json bundle."
+        if p.suffix.lower() not in (".srt", ".ass", ".json", ".avbundle"):
+            return False, "Subtitle file must be .srt, .ass, or a .json/.avbundle bundle."
         if self._mux_audio_cb.isChecked() and not self._input_audio_edit.text().strip():
             return False, "Select an audio file before enabling delivery audio mux."
         return True, ""
@@ -1833,5 +1936,8 @@ class CaptionAnimateTab(BaseTab):
                 self._preview_media_player.stop()
             except Exception:
                 pass
+        if self._frame_preview_service is not None:
+            self._frame_preview_service.close()
+            self._frame_preview_service = None
         self._cleanup_preview_temp()
         super().closeEvent(event)
@@ -0,0 +1,160 @@
+"""Caption frame preview service for the Caption Animate tab.
+
+Owns a :class:`CaptionFramePreviewer` and a single background thread that
+prepares the working ASS and renders frames off the GUI thread. Frame
+requests are coalesced: while a frame is rendering only the most recent
+scrubber position is kept, so dragging never builds up a backlog.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QImage
+
+from audio_visualizer.caption.captionApi import RenderConfig
+from audio_visualizer.caption.core.config import PresetConfig
+from audio_visualizer.caption.rendering.framePreview import (
+    CaptionFramePreviewer,
+    PreviewFrame,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _PrepareRequest:
+    input_path: Path
+    config: RenderConfig
+    preset_override: Optional[PresetConfig]
+
+
+def preview_frame_to_qimage(frame: PreviewFrame) -> QImage:
+    """Convert an RGBA preview frame to a detached QImage."""
+    return QImage(
+        frame.rgba,
+        frame.width,
+        frame.height,
+        frame.width * 4,
+        QImage.Format.Format_RGBA8888,
+    ).copy()
+
+
+class CaptionPreviewService(QObject):
+    """Prepares caption previews and renders scrubbed frames in the background.
+
+    Signals
+    -------
+    prepared(int):
+        Emitted with the subtitle duration in ms after ``prepare()`` finishes.
+    frame_ready(int, QImage):
+        Emitted with the rendered timestamp and frame.
+    failed(str):
+        Emitted when preparation or a frame render fails.
+    """
+
+    prepared = Signal(int)
+    frame_ready = Signal(int, QImage)
+    failed = Signal(str)
+
+    def __init__(
+        self,
+        previewer: CaptionFramePreviewer | None = None,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._previewer = previewer or CaptionFramePreviewer()
+        self._condition = threading.Condition()
+        self._pending_prepare: _PrepareRequest | None = None
+        self._pending_frame_ms: int | None = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run,
+            daemon=True,
+            name="CaptionFramePreview",
+        )
+        self._thread.start()
+
+    @property
+    def is_prepared(self) -> bool:
+        return self._previewer.prepared is not None
+
+    def prepare(
+        self,
+        input_path: Path,
+        config: RenderConfig,
+        preset_override: PresetConfig | None = None,
+    ) -> None:
+        """Queue a (re)preparation of the working ASS for ``input_path``."""
+        with self._condition:
+            self._pending_prepare = _PrepareRequest(
+                Path(input_path), config, preset_override
+            )
+            self._condition.notify()
+
+    def request_frame(self, time_ms: int) -> None:
+        """Queue a frame render, replacing any frame request not yet started."""
+        with self._condition:
+            self._pending_frame_ms = max(0, int(time_ms))
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Stop the worker thread and release the resident preview files."""
+        with self._condition:
+            self._closed = True
+            self._pending_prepare = None
+            self._pending_frame_ms = None
+            self._condition.notify()
+        self._thread.join(timeout=2.0)
+        self._previewer.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while (
+                    not self._closed
+                    and self._pending_prepare is None
+                    and self._pending_frame_ms is None
+                ):
+                    self._condition.wait()
+                if self._closed:
+                    return
+                prepare_request = self._pending_prepare
+                self._pending_prepare = None
+                frame_ms = None
+                if prepare_request is None:
+                    frame_ms = self._pending_frame_ms
+                    self._pending_frame_ms = None
+
+            if prepare_request is not None:
+                self._do_prepare(prepare_request)
+            elif frame_ms is not None:
+                self._do_render(frame_ms)
+
+    def _do_prepare(self, request: _PrepareRequest) -> None:
+        try:
+            prepared = self._previewer.prepare(
+                request.input_path,
+                request.config,
+                preset_override=request.preset_override,
+            )
+        except Exception as exc:
+            logger.warning("Caption frame preview preparation failed: %s", exc)
+            self.failed.emit(str(exc))
+            return
+        self.prepared.emit(int(prepared.end_ms))
+
+    def _do_render(self, time_ms: int) -> None:
+        if self._previewer.prepared is None:
+            return
+        try:
+            frame = self._previewer.render_frame(time_ms)
+        except Exception as exc:
+            logger.warning("Caption frame preview failed at %d ms: %s", time_ms, exc)
+            self.failed.emit(str(exc))
+            return
+        self.frame_ready.emit(frame.time_ms, preview_frame_to_qimage(frame))
@@ -334,3 +334,32 @@ class BatchResyncCommand(QUndoCommand):
         for idx, old_s, old_e, _new_s, _new_e in self._changes:
             if 0 <= idx < len(self._document.entries):
                 self._document.update_entry(idx, start_ms=old_s, end_ms=old_e)
+
+
+class BatchEditTextCommand(QUndoCommand):
+    """Apply bulk text changes, e.g. from replacement rules.
+
+    Expects a list of (index, old_text, new_text) tuples.
+    """
+
+    def __init__(
+        self,
+        document: SubtitleDocument,
+        changes: list[tuple[int, str, str]],
+        description: str = "Batch text edit",
+        parent: QUndoCommand | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._document = document
+        self._changes = changes
+        self.setText(description)
+
+    def redo(self) -> None:
+        for idx, _old_text, new_text in self._changes:
+            if 0 <= idx < len(self._document.entries):
+                self._document.update_entry(idx, text=new_text)
+
+    def undo(self) -> None:
+        for idx, old_text, _new_text in self._changes:
+            if 0 <= idx < len(self._document.entries):
+                self._document.update_entry(idx, text=old_text)
@@ -54,12 +54,16 @@ class SubtitleDocument:
     """Ordered collection of subtitle entries with mutation helpers.
 
     Supports load/save via pysubs2, add/remove/update/split/merge
-    operations, timestamp normalization, and dirty tracking.
+    operations, timestamp normalization, dirty tracking, and review
+    navigation (low-confidence words, speaker changes, estimated
+    alignments) through a lazily built ``ReviewIndex``.
     """
 
     def __init__(self) -> None:
         self._entries: list[SubtitleEntry] = []
         self._dirty: bool = False
+        self._review_index: Any = None
+        self._review_entries: list[SubtitleEntry] | None = None
 
     # ------------------------------------------------------------------
     # Properties
@@ -77,6 +81,25 @@ class SubtitleDocument:
             return True
         return any(e.dirty for e in self._entries)
 
+    @property
+    def review_index(self) -> Any:
+        """Return the review navigation index, building it if stale.
+
+        Speaker and word-timing edits made through ``update_entry`` and
+        ``update_word`` are applied to the index in place; structural
+        edits (add/remove/split/merge/re-sort, undo of those) reset it
+        via ``_reindex`` and it is rebuilt on next access.  Replacing the
+        entries list or changing its length also forces a rebuild.
+        """
+        index = self._live_review_index()
+        if index is None:
+            from audio_visualizer.srt.core.reviewIndex import ReviewIndex
+
+            index = ReviewIndex.from_entries(self._entries)
+            self._review_index = index
+            self._review_entries = self._entries
+        return index
+
     # ------------------------------------------------------------------
     # File I/O
     # ------------------------------------------------------------------
@@ -178,6 +201,9 @@ class SubtitleDocument:
         if text is not None:
             entry.text = text
         if speaker is not ...:
+            review = self._live_review_index()
+            if review is not None and speaker != entry.speaker:
+                review.set_speaker(index, speaker)
             entry.speaker = speaker  # type: ignore[assignment]
         entry.dirty = True
         self._dirty = True
@@ -331,11 +357,57 @@ class SubtitleDocument:
             word.text = text
         if start is not None:
             word.start = start
+            review = self._live_review_index()
+            if review is not None:
+                review.update_word(entry_index, word_index, start)
         if end is not None:
             word.end = end
         entry.dirty = True
         self._dirty = True
 
+    def next_low_confidence_word(
+        self, entry_index: int, word_index: int = -1, threshold: float = 0.5
+    ) -> tuple[int, int] | None:
+        """Find the next word with confidence below *threshold*.
+
+        Args:
+            entry_index: 0-based subtitle index of the cursor, or -1 to
+                search from the start of the document.
+            word_index: Word index of the cursor within the entry; -1
+                searches the entry's own words too.
+            threshold: Confidence threshold (exclusive).
+
+        Returns:
+            ``(entry_index, word_index)`` of the match, or None.
+        """
+        index = self.review_index
+        pos = index.word_position(entry_index, word_index) if entry_index >= 0 else -1
+        found = index.next_low_confidence(pos, threshold)
+        return index.word_ref(found) if found >= 0 else None
+
+    def prev_low_confidence_word(
+        self, entry_index: int, word_index: int = 0, threshold: float = 0.5
+    ) -> tuple[int, int] | None:
+        """Find the previous word with confidence below *threshold*.
+
+        Args:
+            entry_index: 0-based subtitle index of the cursor, or
+                ``len(entries)`` to search from the end of the document.
+            word_index: Word index of the cursor within the entry; 0
+                skips the entry's own words.
+            threshold: Confidence threshold (exclusive).
+
+        Returns:
+            ``(entry_index, word_index)`` of the match, or None.
+        """
+        index = self.review_index
+        if entry_index >= index.subtitle_count:
+            pos = index.word_count
+        else:
+            pos = index.word_position(entry_index, word_index)
+        found = index.prev_low_confidence(pos, threshold)
+        return index.word_ref(found) if found >= 0 else None
+
     def clamp_segment_bounds(self, index: int, new_start_ms: int, new_end_ms: int) -> tuple[int, int]:
         """Clamp proposed segment bounds so they do not overlap neighbors.
 
@@ -405,16 +477,17 @@ class SubtitleDocument:
     # ------------------------------------------------------------------
 
     def load_bundle(self, path: str) -> None:
-        """Load a JSON bundle file and populate entries with word data.
+        """Load a bundle file and populate entries with word data.
 
-        Uses the normalized bundle reader as the single entry point.
+        Uses the normalized bundle reader as the single entry point, so
+        JSON and columnar bundles are both accepted.
 
         Args:
-            path: Filesystem path to the .json or .bundle.json file.
+            path: Filesystem path to the .json, .bundle.json or .avbundle file.
         """
-        from audio_visualizer.srt.io import read_json_bundle
+        from audio_visualizer.srt.io import read_bundle
 
-        bundle = read_json_bundle(path)
+        bundle = read_bundle(path)
         entries: list[SubtitleEntry] = []
         for i, sub in enumerate(bundle.get("subtitles", []), start=1):
             entry = SubtitleEntry(
@@ -438,17 +511,22 @@ class SubtitleDocument:
         logger.info("Loaded bundle with %d entries from %s", len(self._entries), path)
 
     def save_bundle(self, path: str) -> None:
-        """Save the current document as a JSON bundle.
+        """Save the current document as a bundle.
 
-        Preserves word timing data and provenance fields.
+        Preserves word timing data and provenance fields.  Paths ending in
+        ``.avbundle`` are written as a columnar bundle, anything else as
+        JSON.
 
         Args:
-            path: Filesystem path for the output .json file.
+            path: Filesystem path for the output .json or .avbundle file.
         """
         import json
         import os
         from pathlib import Path as _Path
 
+        from audio_visualizer.srt.io.bundleReader import normalize_bundle
+        from audio_visualizer.srt.io.columnarBundle import COLUMNAR_BUNDLE_SUFFIX, write_columnar_bundle
+
         subtitles = []
         flat_words = []
         for entry in self._entries:
@@ -494,6 +572,11 @@ class SubtitleDocument:
         }
 
         out = _Path(path)
+        if out.suffix.lower() == COLUMNAR_BUNDLE_SUFFIX:
+            write_columnar_bundle(normalize_bundle(payload), out)
+            self.mark_clean()
+            logger.info("Saved columnar bundle with %d entries to %s", len(self._entries), path)
+            return
         out.parent.mkdir(parents=True, exist_ok=True)
         tmp = out.with_suffix(out.suffix + ".tmp")
         tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -506,9 +589,21 @@ class SubtitleDocument:
     # ------------------------------------------------------------------
 
     def _reindex(self) -> None:
-        """Re-number entries starting from 1."""
+        """Re-number entries starting from 1 and drop the review index."""
         for i, entry in enumerate(self._entries):
             entry.index = i + 1
+        self._review_index = None
+
+    def _live_review_index(self) -> Any:
+        """Return the review index if it still matches the entries, else None."""
+        index = self._review_index
+        if (
+            index is None
+            or self._review_entries is not self._entries
+            or index.subtitle_count != len(self._entries)
+        ):
+            return None
+        return index
 
     def _ensure_sorted(self) -> None:
         """Re-sort entries by start_ms if ordering has been violated."""
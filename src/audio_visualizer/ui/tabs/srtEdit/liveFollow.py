@@ -0,0 +1,72 @@
+"""Change detection for subtitle files that are still being written.
+
+The SRT Gen tab can stream subtitles into ``<output>.partial`` while the
+model runs; when the job finishes the reconciled file replaces the output
+(or the partial file is removed if the job fails).  ``FileFollower`` lets
+the SRT Edit tab poll the output cheaply: it reads the partial file while
+it exists, switches back to the output when it disappears, and reports
+a change only when the followed file grew or was replaced.
+"""
+from __future__ import annotations
+
+import logging
+import os
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Suffix of the file a streaming SRT Gen job writes next to its output
+# (``StreamingSubtitleWriter.partial_path``)
+PARTIAL_SUFFIX = ".partial"
+
+
+def output_path_for(path: str) -> str:
+    """Return the output a streaming ``.partial`` file will replace (else *path*)."""
+    if path.endswith(PARTIAL_SUFFIX):
+        return path[: -len(PARTIAL_SUFFIX)]
+    return path
+
+
+class FileFollower:
+    """Report when a subtitle output or its streaming partial file changes.
+
+    Args:
+        path: Output file to follow (a ``.partial`` path follows its output).
+        loaded_path: File whose current state counts as seen; defaults to
+            the file being followed right now.
+
+    ``path`` is the file to read after :meth:`poll` reports a change:
+    ``<output>.partial`` while a streaming job writes it, the output
+    otherwise.
+    """
+
+    def __init__(self, path: str, loaded_path: Optional[str] = None) -> None:
+        self.output_path = output_path_for(path)
+        self.partial_path = self.output_path + PARTIAL_SUFFIX
+        self.path = loaded_path if loaded_path is not None else self._source()
+        self._signature = self._stat(self.path)
+
+    def _source(self) -> str:
+        return self.partial_path if os.path.exists(self.partial_path) else self.output_path
+
+    @staticmethod
+    def _stat(path: str) -> Optional[tuple[int, int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+    def poll(self) -> bool:
+        """Return True if the followed file changed since the last poll.
+
+        A missing file (for example mid-rename) is not a change; the
+        partial file being renamed onto the output is.
+        """
+        source = self._source()
+        signature = self._stat(source)
+        if signature is None or (source == self.path and signature == self._signature):
+            return False
+        self.path = source
+        self._signature = signature
+        return True
@@ -1,7 +1,8 @@
 """Parser helpers for subtitle file I/O.
 
 Provides functions to read and write subtitle files in SRT, ASS, and
-VTT formats using pysubs2, and JSON bundle files via the srt.io reader.
+VTT formats using pysubs2, and JSON or columnar bundle files via the
+srt.io reader.
 Also includes a markdown-stripping helper for plain-text export paths.
 """
 from __future__ import annotations
@@ -37,35 +38,39 @@ def strip_markdown(text: str) -> str:
 
 
 def is_bundle_file(path: str) -> bool:
-    """Return True if the path looks like a JSON bundle file.
+    """Return True if the path looks like a bundle file.
 
-    Recognizes ``.json`` and ``.bundle.json`` extensions.
+    Recognizes ``.json``, ``.bundle.json`` and ``.avbundle`` extensions, and
+    columnar bundles by content.
     """
+    from audio_visualizer.srt.io.columnarBundle import COLUMNAR_BUNDLE_SUFFIX, is_columnar_bundle
+
     p = Path(path)
-    if p.suffix.lower() == ".json":
+    if p.suffix.lower() in (".json", COLUMNAR_BUNDLE_SUFFIX):
         return True
     # Handle .bundle.json (double suffix)
     if p.name.lower().endswith(".bundle.json"):
         return True
-    return False
+    return is_columnar_bundle(p)
 
 
 def parse_bundle_file(path: str) -> list:
-    """Parse a JSON bundle file into a list of SubtitleEntry objects.
+    """Parse a bundle file into a list of SubtitleEntry objects.
 
-    Uses ``read_json_bundle()`` as the single bundle entry point and
-    populates entries with word-level data and provenance fields.
+    Uses ``read_bundle()`` as the single bundle entry point (JSON or
+    columnar) and populates entries with word-level data and provenance
+    fields.
 
     Args:
-        path: Filesystem path to the .json bundle file.
+        path: Filesystem path to the .json or .avbundle bundle file.
 
     Returns:
         Ordered list of SubtitleEntry instances with words populated.
     """
-    from audio_visualizer.srt.io import read_json_bundle
+    from audio_visualizer.srt.io import read_bundle
     from audio_visualizer.ui.tabs.srtEdit.document import SubtitleEntry
 
-    bundle = read_json_bundle(path)
+    bundle = read_bundle(path)
     entries: list[SubtitleEntry] = []
     for i, sub in enumerate(bundle.get("subtitles", []), start=1):
         entry = SubtitleEntry(
@@ -0,0 +1,47 @@
+"""Apply correction-database replacement rules to an SRT Edit document.
+
+Uses the same compiled rule engines as the SRT generation pipeline, so a
+subtitle file edited here gets exactly the replacements a fresh
+transcription would.  Like the resync tools, this only computes the
+changes; the caller applies them through ``BatchEditTextCommand`` for
+undo support.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from audio_visualizer.ui.tabs.srtEdit.document import SubtitleDocument
+
+logger = logging.getLogger(__name__)
+
+# Type alias for a single text change record: (index, old_text, new_text)
+TextChange = tuple[int, str, str]
+
+
+def replacement_rule_changes(document: SubtitleDocument, db: Any) -> list[TextChange]:
+    """Compute the text changes the replacement rules make to each entry.
+
+    Rules are applied line by line, per-speaker rules before global ones,
+    matching the pipeline.
+
+    Args:
+        document: The subtitle document.
+        db: A ``CorrectionDatabase`` providing ``get_replacement_engine``.
+
+    Returns:
+        List of text change tuples for entries whose text changes.
+    """
+    engines: dict[str | None, Any] = {}
+    changes: list[TextChange] = []
+    for i, entry in enumerate(document.entries):
+        speaker = entry.speaker or None
+        engine = engines.get(speaker)
+        if engine is None:
+            engine = engines[speaker] = db.get_replacement_engine(speaker)
+        if not len(engine):
+            continue
+        new_text = "\n".join(engine.apply(line) for line in entry.text.split("\n"))
+        if new_text != entry.text:
+            changes.append((i, entry.text, new_text))
+    return changes
@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
+from audio_visualizer.srt.core.intervalIndex import IntervalIndex
 from audio_visualizer.ui.tabs.srtEdit.document import SubtitleDocument
 
 logger = logging.getLogger(__name__)
@@ -165,23 +166,14 @@ def silence_snap(
     if not silence_intervals:
         return []
 
-    # Convert silence intervals to ms
-    silence_edges_ms: list[int] = []
-    for s, e in silence_intervals:
-        silence_edges_ms.append(int(round(s * 1000)))
-        silence_edges_ms.append(int(round(e * 1000)))
-    silence_edges_ms.sort()
+    # Index silence edges in ms for nearest-edge lookups
+    silences_ms = IntervalIndex(
+        (int(round(s * 1000)), int(round(e * 1000))) for s, e in silence_intervals
+    )
 
     def _nearest_edge(time_ms: int) -> Optional[int]:
         """Find the nearest silence edge within threshold."""
-        best: Optional[int] = None
-        best_dist = snap_threshold_ms + 1
-        for edge in silence_edges_ms:
-            dist = abs(edge - time_ms)
-            if dist < best_dist:
-                best_dist = dist
-                best = edge
-        return best if best_dist <= snap_threshold_ms else None
+        return silences_ms.nearest_edge(time_ms, snap_threshold_ms)
 
     changes: list[TimingChange] = []
     for i, entry in enumerate(document.entries):
@@ -18,6 +18,7 @@ from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, QUrl, Si
 from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
 from PySide6.QtWidgets import (
+    QCheckBox,
     QComboBox,
     QFileDialog,
     QGroupBox,
@@ -41,6 +42,7 @@ from audio_visualizer.ui.workspaceContext import SessionAsset
 from audio_visualizer.ui.sessionFilePicker import pick_session_or_file
 from audio_visualizer.ui.tabs.srtEdit.commands import (
     AddEntryCommand,
+    BatchEditTextCommand,
     BatchResyncCommand,
     EditSpeakerCommand,
     EditTextCommand,
@@ -52,12 +54,14 @@ from audio_visualizer.ui.tabs.srtEdit.commands import (
     SplitEntryCommand,
 )
 from audio_visualizer.ui.tabs.srtEdit.document import SubtitleDocument, SubtitleEntry
+from audio_visualizer.ui.tabs.srtEdit.liveFollow import FileFollower, output_path_for
 from audio_visualizer.ui.tabs.srtEdit.lint import (
     BUILTIN_PROFILES,
     LintIssue,
     run_lint,
 )
 from audio_visualizer.ui.tabs.srtEdit.parser import is_bundle_file
+from audio_visualizer.ui.tabs.srtEdit.replacements import replacement_rule_changes
 from audio_visualizer.ui.tabs.srtEdit.resync import (
     fps_drift_correction,
     global_shift,
@@ -72,10 +76,12 @@ logger = logging.getLogger(__name__)
 
 _AUDIO_FILTERS = "Audio Files (*.wav *.mp3 *.flac *.ogg *.aac *.m4a);;All Files (*)"
 _SUBTITLE_FILTERS = (
-    "Subtitle Files (*.srt *.ass *.vtt *.json);;JSON Bundles (*.json *.bundle.json)"
+    "Subtitle Files (*.srt *.ass *.vtt *.json *.avbundle);;Bundles (*.json *.bundle.json *.avbundle)"
     ";;SRT Files (*.srt);;All Files (*)"
 )
-_BUNDLE_FILTERS = "JSON Bundles (*.json *.bundle.json);;All Files (*)"
+_BUNDLE_FILTERS = "JSON Bundles (*.json *.bundle.json);;Columnar Bundles (*.avbundle);;All Files (*)"
+# Words below this confidence are visited by F8 / Shift+F8
+_LOW_CONFIDENCE_THRESHOLD = 0.5
 
 
 class _WaveformLoadSignals(QObject):
@@ -129,6 +135,9 @@ class SrtEditTab(BaseTab):
         self._table_model = SubtitleTableModel(self._document)
         self._audio_path: Optional[str] = None
         self._subtitle_path: Optional[str] = None
+        # File the document was last read from (a streaming ``.partial``
+        # while SRT Gen writes it); saves go to ``_subtitle_path``
+        self._subtitle_source: Optional[str] = None
         self._bundle_path: Optional[str] = None  # Tracks loaded bundle file
         self._lint_profile_key: str = "pipeline_default"
         self._lint_issues: list[LintIssue] = []
@@ -136,11 +145,13 @@ class SrtEditTab(BaseTab):
         self._waveform_request_id: int = 0
         self._pending_highlight_row: int | None = None
         self._correction_db: Any = None  # Lazy CorrectionDatabase
+        self._follower: Optional[FileFollower] = None
 
         self._build_ui()
         self._connect_signals()
         self._setup_shortcuts()
         self._setup_playback_timer()
+        self._setup_follow_timer()
 
     # ------------------------------------------------------------------
     # UI construction
@@ -181,6 +192,13 @@ class SrtEditTab(BaseTab):
         picker_layout.addWidget(self._subtitle_combo)
         self._browse_subtitle_btn = QPushButton("Browse...")
         picker_layout.addWidget(self._browse_subtitle_btn)
+        self._follow_cb = QCheckBox("Follow")
+        self._follow_cb.setToolTip(
+            "Reload the subtitle file when it changes on disk. While SRT Gen streams "
+            "into this output, its .partial file is shown until the job replaces the "
+            "output (paused while you have unsaved edits)"
+        )
+        picker_layout.addWidget(self._follow_cb)
 
         root_layout.addLayout(picker_layout)
 
@@ -348,6 +366,11 @@ class SrtEditTab(BaseTab):
 
         self._lint_list = QListWidget()
         qa_layout.addWidget(self._lint_list)
+        self._apply_rules_btn = QPushButton("Apply Replacement Rules")
+        self._apply_rules_btn.setToolTip(
+            "Apply the correction database's replacement rules to every entry"
+        )
+        qa_layout.addWidget(self._apply_rules_btn)
         qa_group.setLayout(qa_layout)
         layout.addWidget(qa_group)
 
@@ -359,6 +382,7 @@ class SrtEditTab(BaseTab):
         """Wire up all signal/slot connections."""
         self._browse_audio_btn.clicked.connect(self._on_browse_audio)
         self._browse_subtitle_btn.clicked.connect(self._on_browse_subtitle)
+        self._follow_cb.toggled.connect(self._on_follow_toggled)
         self._audio_combo.currentIndexChanged.connect(self._on_audio_asset_selected)
         self._subtitle_combo.currentIndexChanged.connect(self._on_subtitle_asset_selected)
 
@@ -373,6 +397,7 @@ class SrtEditTab(BaseTab):
 
         self._run_lint_btn.clicked.connect(self._on_run_lint)
         self._lint_list.itemClicked.connect(self._on_lint_item_clicked)
+        self._apply_rules_btn.clicked.connect(self._on_apply_replacement_rules)
 
         self._global_shift_btn.clicked.connect(self._on_global_shift)
         self._shift_cursor_btn.clicked.connect(self._on_shift_from_cursor)
@@ -410,6 +435,10 @@ class SrtEditTab(BaseTab):
         undo_shortcut.activated.connect(self._on_undo)
         redo_shortcut = QShortcut(QKeySequence.StandardKey.Redo, self)
         redo_shortcut.activated.connect(self._on_redo)
+        next_low_shortcut = QShortcut(QKeySequence("F8"), self)
+        next_low_shortcut.activated.connect(lambda: self._on_jump_low_confidence(forward=True))
+        prev_low_shortcut = QShortcut(QKeySequence("Shift+F8"), self)
+        prev_low_shortcut.activated.connect(lambda: self._on_jump_low_confidence(forward=False))
 
     def _setup_playback_timer(self) -> None:
         """Timer to update playback cursor on the waveform."""
@@ -417,6 +446,12 @@ class SrtEditTab(BaseTab):
         self._playback_timer.setInterval(50)
         self._playback_timer.timeout.connect(self._on_playback_tick)
 
+    def _setup_follow_timer(self) -> None:
+        """Timer polling the followed subtitle file for changes."""
+        self._follow_timer = QTimer(self)
+        self._follow_timer.setInterval(1000)
+        self._follow_timer.timeout.connect(self._on_follow_tick)
+
     # ------------------------------------------------------------------
     # Audio loading
     # ------------------------------------------------------------------
@@ -487,33 +522,42 @@ class SrtEditTab(BaseTab):
         if path is not None:
             self._load_subtitle(str(path))
 
+    def _read_subtitle_file(self, path: str) -> None:
+        """Parse a subtitle or bundle file into the document."""
+        if is_bundle_file(path):
+            self._document.load_bundle(path)
+            self._bundle_path = path
+        else:
+            self._bundle_path = None
+            ext = Path(output_path_for(path)).suffix.lower()
+            if ext == ".ass":
+                from audio_visualizer.ui.tabs.srtEdit.parser import parse_ass_file
+                entries = parse_ass_file(path)
+                self._document._entries = entries
+                self._document._dirty = False
+            elif ext == ".vtt":
+                from audio_visualizer.ui.tabs.srtEdit.parser import parse_vtt_file
+                entries = parse_vtt_file(path)
+                self._document._entries = entries
+                self._document._dirty = False
+            else:
+                self._document.load_srt(path)
+
     def _load_subtitle(self, path: str) -> None:
-        """Load a subtitle or bundle file into the document."""
-        self._subtitle_path = path
+        """Load a subtitle or bundle file into the document.
+
+        A streaming ``<output>.partial`` file is read as is, but the tab
+        then refers to (and saves) the output it will become.
+        """
+        self._subtitle_path = output_path_for(path)
+        self._subtitle_source = path
         self._subtitle_combo.blockSignals(True)
         self._subtitle_combo.clear()
-        self._subtitle_combo.addItem(os.path.basename(path), path)
+        self._subtitle_combo.addItem(os.path.basename(self._subtitle_path), self._subtitle_path)
         self._subtitle_combo.blockSignals(False)
 
         try:
-            if is_bundle_file(path):
-                self._document.load_bundle(path)
-                self._bundle_path = path
-            else:
-                self._bundle_path = None
-                ext = Path(path).suffix.lower()
-                if ext == ".ass":
-                    from audio_visualizer.ui.tabs.srtEdit.parser import parse_ass_file
-                    entries = parse_ass_file(path)
-                    self._document._entries = entries
-                    self._document._dirty = False
-                elif ext == ".vtt":
-                    from audio_visualizer.ui.tabs.srtEdit.parser import parse_vtt_file
-                    entries = parse_vtt_file(path)
-                    self._document._entries = entries
-                    self._document._dirty = False
-                else:
-                    self._document.load_srt(path)
+            self._read_subtitle_file(path)
         except Exception:
             logger.exception("Failed to load subtitle file %s", path)
             QMessageBox.warning(self, "Load Error", f"Could not load subtitle file:\n{path}")
@@ -524,9 +568,48 @@ class SrtEditTab(BaseTab):
         if self._table_view.currentIndex().isValid():
             self._waveform_view.highlight_region(self._table_view.currentIndex().row())
         self._clear_undo_stack()
+        self._follower = None
         logger.info("Subtitle loaded: %s (%d entries)", path, len(self._document.entries))
         self.settings_changed.emit()
 
+    def _on_follow_toggled(self, checked: bool) -> None:
+        # The first tick starts following the current file
+        self._follower = None
+        if checked:
+            self._follow_timer.start()
+        else:
+            self._follow_timer.stop()
+
+    def _on_follow_tick(self) -> None:
+        """Reload the followed file if it changed and there are no unsaved edits.
+
+        While SRT Gen streams into ``<output>.partial`` the partial file is
+        shown; once it is renamed onto the output (or removed after a
+        failed job) the output is reloaded.
+        """
+        if self._subtitle_path is None:
+            return
+        if self._follower is None or self._follower.output_path != self._subtitle_path:
+            self._follower = FileFollower(self._subtitle_path, loaded_path=self._subtitle_source)
+        if self._document.is_dirty or not self._follower.poll():
+            return
+        current = self._table_view.currentIndex()
+        row = current.row() if current.isValid() else None
+        source = self._follower.path
+        try:
+            self._read_subtitle_file(source)
+        except Exception:
+            # A write may be in progress; the next change retries.
+            logger.debug("Could not reload followed file %s", source, exc_info=True)
+            return
+        self._subtitle_source = source
+        self._table_model.refresh()
+        self._waveform_view.set_regions(self._document.entries)
+        if row is not None and row < len(self._document.entries):
+            self._table_view.selectRow(row)
+        self._clear_undo_stack()
+        logger.debug("Reloaded followed file %s (%d entries)", source, len(self._document.entries))
+
     # ------------------------------------------------------------------
     # Playback controls
     # ------------------------------------------------------------------
@@ -837,6 +920,24 @@ class SrtEditTab(BaseTab):
         if display_row >= 0:
             self._table_view.selectRow(display_row)
 
+    def _on_jump_low_confidence(self, *, forward: bool) -> None:
+        """Select the next/previous word below the low-confidence threshold."""
+        row = self._selected_row()
+        mapping = self._table_model.row_mapping(row) if row >= 0 else None
+        if mapping is None:
+            entry_idx = -1 if forward else len(self._document.entries)
+            word_idx = -1 if forward else 0
+        else:
+            entry_idx = mapping.entry_index
+            word_idx = mapping.word_index if mapping.is_word_row else (-1 if forward else 0)
+        if forward:
+            found = self._document.next_low_confidence_word(entry_idx, word_idx, _LOW_CONFIDENCE_THRESHOLD)
+        else:
+            found = self._document.prev_low_confidence_word(entry_idx, word_idx, _LOW_CONFIDENCE_THRESHOLD)
+        if found is not None:
+            self._on_word_region_clicked(*found)
+            self._waveform_view.highlight_region(found[0])
+
     def _on_table_clicked(self, index) -> None:
         """Handle click on a table row -- toggle expand on index column."""
         from audio_visualizer.ui.tabs.srtEdit.tableModel import COL_INDEX
@@ -998,6 +1099,32 @@ class SrtEditTab(BaseTab):
                 except Exception:
                     logger.debug("Could not add prompt term '%s'", clean)
 
+    def _on_apply_replacement_rules(self) -> None:
+        """Apply correction-database replacement rules as one undoable edit."""
+        db = self._get_correction_db()
+        if db is None:
+            QMessageBox.warning(
+                self, "Replacement Rules", "The correction database is unavailable."
+            )
+            return
+
+        try:
+            changes = replacement_rule_changes(self._document, db)
+        except Exception:
+            logger.exception("Failed to apply replacement rules")
+            QMessageBox.warning(self, "Replacement Rules", "Applying replacement rules failed.")
+            return
+
+        if not changes:
+            QMessageBox.information(self, "Replacement Rules", "No replacement rules matched.")
+            return
+
+        cmd = BatchEditTextCommand(
+            self._document, changes, f"Apply replacement rules ({len(changes)} entries)"
+        )
+        self._push_command(cmd)
+        self._refresh_after_edit()
+
     # ------------------------------------------------------------------
     # Lint
     # ------------------------------------------------------------------
@@ -1132,11 +1259,7 @@ class SrtEditTab(BaseTab):
             return
 
         try:
-            from audio_visualizer.srt.io.audioHelpers import detect_silences
-
-            silences = detect_silences(
-                self._audio_path, min_silence_dur=0.2, silence_threshold_db=-35.0
-            )
+            silences = self._detect_silences(self._audio_path)
         except Exception:
             logger.exception("Failed to detect silences")
             QMessageBox.warning(self, "Silence Snap", "Silence detection failed.")
@@ -1175,6 +1298,7 @@ class SrtEditTab(BaseTab):
         try:
             self._document.save_srt(path)
             self._subtitle_path = path
+            self._subtitle_source = path
             asset_id = self._publish_subtitle_asset(path)
             logger.info("Saved to %s", path)
             mw = self.parent()
@@ -1402,6 +1526,22 @@ class SrtEditTab(BaseTab):
             ctx.store_analysis(cache_key, (samples, sr))
         return samples, sr
 
+    def _detect_silences(self, path: str) -> list[tuple[float, float]]:
+        """Find silences, reusing the decoded waveform when it is cached."""
+        from audio_visualizer.srt.io.audioHelpers import detect_silences
+        from audio_visualizer.srt.io.silenceDetection import find_silences
+
+        ctx = self.workspace_context
+        if ctx is not None:
+            cache_key = ctx.make_analysis_cache_key(path, "waveform", "mono@native_sr")
+            cached = ctx.get_analysis(cache_key)
+            if cached is not None:
+                samples, sr = cached
+                return find_silences(
+                    samples, sr, min_silence_dur=0.2, silence_threshold_db=-35.0
+                )
+        return detect_silences(path, min_silence_dur=0.2, silence_threshold_db=-35.0)
+
     def _publish_subtitle_asset(self, path: str | Path) -> str | None:
         ctx = self.workspace_context
         if ctx is None:
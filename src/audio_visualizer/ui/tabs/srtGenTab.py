@@ -349,6 +349,28 @@ class SrtGenTab(BaseTab):
         lora_row.addStretch()
         layout.addLayout(lora_row)
 
+        self._model_server_cb = QCheckBox("Keep model warm in shared server")
+        self._model_server_cb.setToolTip(
+            "Run transcription in a background model server that keeps the model "
+            "loaded between batches (unloaded after 10 minutes idle)"
+        )
+        layout.addWidget(self._model_server_cb)
+
+        self._transcript_cache_cb = QCheckBox("Reuse cached transcripts")
+        self._transcript_cache_cb.setToolTip(
+            "Keep raw transcriptions on disk so re-running a file with only "
+            "formatting changes skips the model"
+        )
+        self._transcript_cache_cb.setChecked(True)
+        layout.addWidget(self._transcript_cache_cb)
+
+        self._stream_output_cb = QCheckBox("Write subtitles while transcribing")
+        self._stream_output_cb.setToolTip(
+            "Append finished subtitles to a .partial file next to the output as the "
+            "model runs so it can be opened in SRT Edit; it replaces the output when the job ends"
+        )
+        layout.addWidget(self._stream_output_cb)
+
         self._model_status_label = QLabel("No model loaded")
         layout.addWidget(self._model_status_label)
 
@@ -546,9 +568,42 @@ class SrtGenTab(BaseTab):
         row3.addWidget(self._tx_initial_prompt, 1)
         layout.addLayout(row3)
 
+        row4 = QHBoxLayout()
+        row4.addWidget(QLabel("Parallel:"))
+        self._tx_parallel_mode = QComboBox()
+        self._tx_parallel_mode.addItem("Off", "off")
+        self._tx_parallel_mode.addItem("Batched", "batched")
+        self._tx_parallel_mode.addItem("Model replicas", "replicas")
+        self._tx_parallel_mode.setToolTip(
+            "Split long files at silences and transcribe the chunks concurrently"
+        )
+        self._set_parallel_mode(defaults.parallel_mode)
+        row4.addWidget(self._tx_parallel_mode)
+
+        row4.addWidget(QLabel("Workers:"))
+        self._tx_parallel_workers = QSpinBox()
+        self._tx_parallel_workers.setRange(0, 64)
+        self._tx_parallel_workers.setSpecialValueText("Auto")
+        self._tx_parallel_workers.setValue(defaults.parallel_workers)
+        row4.addWidget(self._tx_parallel_workers)
+
+        row4.addWidget(QLabel("Chunk (s):"))
+        self._tx_parallel_chunk = QDoubleSpinBox()
+        self._tx_parallel_chunk.setRange(5.0, 600.0)
+        self._tx_parallel_chunk.setDecimals(0)
+        self._tx_parallel_chunk.setSingleStep(5.0)
+        self._tx_parallel_chunk.setValue(defaults.parallel_chunk_sec)
+        row4.addWidget(self._tx_parallel_chunk)
+        row4.addStretch()
+        layout.addLayout(row4)
+
         group.setLayout(layout)
         parent_layout.addWidget(group)
 
+    def _set_parallel_mode(self, mode: str) -> None:
+        idx = self._tx_parallel_mode.findData(mode)
+        self._tx_parallel_mode.setCurrentIndex(idx if idx >= 0 else 0)
+
     # -- Silence -------------------------------------------------------
 
     def _build_silence_group(self, parent_layout: QVBoxLayout) -> None:
@@ -1004,6 +1059,12 @@ class SrtGenTab(BaseTab):
                 self._tx_compression.setValue(float(tx["compression_ratio_threshold"]))
             if "initial_prompt" in tx:
                 self._tx_initial_prompt.setText(str(tx["initial_prompt"]))
+            if "parallel_mode" in tx:
+                self._set_parallel_mode(str(tx["parallel_mode"]))
+            if "parallel_workers" in tx:
+                self._tx_parallel_workers.setValue(int(tx["parallel_workers"]))
+            if "parallel_chunk_sec" in tx:
+                self._tx_parallel_chunk.setValue(float(tx["parallel_chunk_sec"]))
 
         sil = data.get("silence", {})
         if sil:
@@ -1034,6 +1095,9 @@ class SrtGenTab(BaseTab):
                 log_prob_threshold=self._tx_log_prob.value(),
                 compression_ratio_threshold=self._tx_compression.value(),
                 initial_prompt=self._tx_initial_prompt.text(),
+                parallel_mode=self._tx_parallel_mode.currentData(),
+                parallel_workers=self._tx_parallel_workers.value(),
+                parallel_chunk_sec=self._tx_parallel_chunk.value(),
             ),
             silence=SilenceConfig(
                 silence_min_dur=self._sil_min_dur.value(),
@@ -1084,6 +1148,9 @@ class SrtGenTab(BaseTab):
             "model": self._model_combo.currentText(),
             "device": self._device_combo.currentText(),
             "lora_name": self._selected_lora_name(),
+            "use_model_server": self._model_server_cb.isChecked(),
+            "use_transcript_cache": self._transcript_cache_cb.isChecked(),
+            "stream_output": self._stream_output_cb.isChecked(),
             "mode": self._mode_combo.currentText(),
             "language": self._language_edit.text(),
             "word_level": self._word_level_cb.isChecked(),
@@ -1107,6 +1174,9 @@ class SrtGenTab(BaseTab):
                 "log_prob_threshold": self._tx_log_prob.value(),
                 "compression_ratio_threshold": self._tx_compression.value(),
                 "initial_prompt": self._tx_initial_prompt.text(),
+                "parallel_mode": self._tx_parallel_mode.currentData(),
+                "parallel_workers": self._tx_parallel_workers.value(),
+                "parallel_chunk_sec": self._tx_parallel_chunk.value(),
             },
             "silence": {
                 "silence_min_dur": self._sil_min_dur.value(),
@@ -1162,6 +1232,10 @@ class SrtGenTab(BaseTab):
             if idx >= 0:
                 self._lora_combo.setCurrentIndex(idx)
 
+        self._model_server_cb.setChecked(data.get("use_model_server", False))
+        self._transcript_cache_cb.setChecked(data.get("use_transcript_cache", True))
+        self._stream_output_cb.setChecked(data.get("stream_output", False))
+
         # General
         mode = data.get("mode", "general")
         idx = self._mode_combo.findText(mode)
@@ -1200,6 +1274,9 @@ class SrtGenTab(BaseTab):
             self._tx_log_prob.setValue(tx_data.get("log_prob_threshold", -1.0))
             self._tx_compression.setValue(tx_data.get("compression_ratio_threshold", 2.4))
             self._tx_initial_prompt.setText(tx_data.get("initial_prompt", ""))
+            self._set_parallel_mode(tx_data.get("parallel_mode", "off"))
+            self._tx_parallel_workers.setValue(tx_data.get("parallel_workers", 0))
+            self._tx_parallel_chunk.setValue(tx_data.get("parallel_chunk_sec", 30.0))
 
         # Silence
         sil_data = data.get("silence", {})
@@ -1315,6 +1392,9 @@ class SrtGenTab(BaseTab):
                 lora_name=lora_name,
                 script_path=Path(script_path_str) if script_path_str else None,
                 existing_srt_path=Path(existing_srt_str) if existing_srt_str else None,
+                use_model_server=self._model_server_cb.isChecked(),
+                use_transcript_cache=self._transcript_cache_cb.isChecked(),
+                stream_output=self._stream_output_cb.isChecked(),
             ))
 
         emitter = AppEventEmitter()
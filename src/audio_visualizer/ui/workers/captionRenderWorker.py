@@ -2,7 +2,9 @@
 
 Wraps render_subtitle() from captionApi in a QRunnable, forwarding
 progress via AppEventEmitter + WorkerBridge.  Supports cancellation
-by terminating the FFmpeg subprocess.
+by terminating the FFmpeg subprocess.  When a delivery MP4 is requested
+the overlay and delivery are rendered in a single FFmpeg pass unless
+``RenderConfig.single_pass_delivery`` is disabled.
 """
 from __future__ import annotations
 
@@ -120,6 +122,20 @@ class CaptionRenderWorker(QRunnable):
 
             subprocess.Popen = _CapturingPopen  # type: ignore[misc]
 
+            wants_delivery = (
+                self._spec.delivery_output_path is not None
+                or self._spec.delivery_audio_path is not None
+            )
+            render_kwargs = {}
+            if wants_delivery and self._spec.config.single_pass_delivery:
+                # Produce overlay and delivery together in one FFmpeg process
+                render_kwargs = {
+                    "delivery_path": (
+                        self._spec.delivery_output_path or self._spec.output_path
+                    ),
+                    "delivery_audio_path": self._spec.delivery_audio_path,
+                }
+
             try:
                 result = render_subtitle(
                     input_path=self._spec.subtitle_path,
@@ -127,6 +143,7 @@ class CaptionRenderWorker(QRunnable):
                     config=self._spec.config,
                     emitter=self._emitter,
                     preset_override=self._spec.preset_override,
+                    **render_kwargs,
                 )
             finally:
                 subprocess.Popen = original_popen  # type: ignore[misc]
@@ -149,10 +166,7 @@ class CaptionRenderWorker(QRunnable):
                 if delivery_path is None:
                     raise RuntimeError("Caption render did not produce an output path.")
 
-                if (
-                    self._spec.delivery_output_path is not None
-                    or self._spec.delivery_audio_path is not None
-                ):
+                if wants_delivery and result.delivery_path is None:
                     self._create_delivery_output(
                         overlay_path=result.output_path,
                         delivery_path=delivery_path,
@@ -1,13 +1,23 @@
 """SRT Gen worker — batch transcription QRunnable.
 
-Iterates through a queue of input files, calling transcribe_file for each.
-Uses AppEventEmitter + WorkerBridge for progress forwarding. Supports batch
-cancel (stops before next file) by checking a threading flag between items.
+Runs a queue of input files through a staged pipeline
+(``srt.core.batchPipeline``): upcoming files are decoded on prefetch
+threads, inference runs on the worker thread, and post-processing plus
+output writing run on a finish thread behind it. Uses AppEventEmitter +
+WorkerBridge for progress forwarding. Supports batch cancel (stops before
+the next file) by checking a threading flag between items; the same flag
+is passed to the pipeline, so the current file's transcription and
+diarization stop as well.
 
 The worker always loads the model on its own thread to ensure GPU handles
 (CUDA/cuBLAS) stay on the same thread that performs inference.  This avoids
 cross-thread cublas errors and hangs that occur when a model is loaded on one
 thread (e.g. the _ModelLoadWorker UI preload) and used on another.
+With ``use_model_server`` the model instead lives in the shared model server
+process (``srt.modelServer``), which stays warm across batches.
+With ``use_transcript_cache`` raw transcriptions are kept in a
+``TranscriptCache``, so re-running a file with only formatting changes
+skips the model.
 """
 from __future__ import annotations
 
@@ -16,16 +26,29 @@ import logging
 import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
 from PySide6.QtCore import QRunnable
 
 from audio_visualizer.events import AppEvent, AppEventEmitter, EventLevel, EventType
 from audio_visualizer.srt.models import PipelineMode, ResolvedConfig
-from audio_visualizer.srt.srtApi import TranscriptionResult, load_model, transcribe_file
+from audio_visualizer.srt.core.parallelTranscription import replica_model_options, resolve_workers
+from audio_visualizer.srt.core.batchPipeline import run_staged_batch
+from audio_visualizer.srt.io.transcriptCache import TranscriptCache
+from audio_visualizer.srt.modelServer import ensure_model_server
+from audio_visualizer.srt.srtApi import (
+    TranscriptionResult,
+    begin_transcribe_file,
+    load_model,
+    prepare_audio,
+)
 from audio_visualizer.ui.workers.workerBridge import WorkerBridge, WorkerSignals
 from audio_visualizer import __version__ as TOOL_VERSION
 
+if TYPE_CHECKING:
+    from audio_visualizer.srt.core.pipeline import PreparedAudio
+    from audio_visualizer.srt.io.audioHelpers import DecodedAudio
+
 logger = logging.getLogger(__name__)
 
 
@@ -68,6 +91,9 @@ class SrtGenJobSpec:
     lora_name: Optional[str] = None
     script_path: Optional[Path] = None
     existing_srt_path: Optional[Path] = None
+    use_model_server: bool = False
+    use_transcript_cache: bool = False
+    stream_output: bool = False
 
 
 class SrtGenWorker(QRunnable):
@@ -81,7 +107,7 @@ class SrtGenWorker(QRunnable):
     jobs:
         Ordered list of job specs to process.
     emitter:
-        Shared event emitter that transcribe_file writes into.
+        Shared event emitter that the transcription stages write into.
     """
 
     def __init__(
@@ -98,13 +124,16 @@ class SrtGenWorker(QRunnable):
         self.signals = WorkerSignals()
         self._bridge = WorkerBridge(emitter, self.signals)
         self._results: List[TranscriptionResult] = []
+        self._transcript_cache: Optional[TranscriptCache] = None
+        self._model_name = ""
+        self._lora_name: Optional[str] = None
 
     # ------------------------------------------------------------------
     # Cancel support
     # ------------------------------------------------------------------
 
     def cancel(self) -> None:
-        """Request cancellation. Checked between queue items."""
+        """Request cancellation. Checked between queue items and during transcription."""
         self._cancel_flag.set()
 
     @property
@@ -122,12 +151,14 @@ class SrtGenWorker(QRunnable):
         model: Any,
         device_used: str,
         compute_type_used: str,
+        audio: Optional["DecodedAudio"] = None,
     ) -> TranscriptionResult:
         """Process a bundle-from-SRT job.
 
         Runs Whisper for word-level timing, parses the existing subtitle
         file, aligns cues to Whisper words, and writes a bundle that
         preserves the original subtitle text with attached word timing.
+        *audio* is the prefetched decode of the input, if available.
         """
         import os
         import tempfile
@@ -137,7 +168,7 @@ class SrtGenWorker(QRunnable):
             align_cues_to_whisper_words,
             parse_subtitle_file,
         )
-        from audio_visualizer.srt.io.audioHelpers import to_wav_16k_mono
+        from audio_visualizer.srt.io.audioHelpers import decode_audio_16k_mono
         from audio_visualizer.srt.io.outputWriters import write_bundle_from_srt
         from audio_visualizer.srt.io.systemHelpers import ensure_parent_dir
         from audio_visualizer.srt.models import WordItem
@@ -166,29 +197,25 @@ class SrtGenWorker(QRunnable):
                 event_type=EventType.LOG,
                 message="Running Whisper for word-level timing...",
             ))
-            fd, tmp_wav = tempfile.mkstemp(prefix="srtgen_bundle_", suffix=".wav")
-            os.close(fd)
-
-            try:
-                to_wav_16k_mono(str(job.input_path), tmp_wav)
-                segments_iter, _info = model.transcribe(
-                    tmp_wav,
-                    vad_filter=job.cfg.transcription.vad_filter,
-                    language=job.language,
-                    word_timestamps=True,
-                    condition_on_previous_text=job.cfg.transcription.condition_on_previous_text,
-                    no_speech_threshold=job.cfg.transcription.no_speech_threshold,
-                    log_prob_threshold=job.cfg.transcription.log_prob_threshold,
-                    compression_ratio_threshold=job.cfg.transcription.compression_ratio_threshold,
-                    initial_prompt=job.cfg.transcription.initial_prompt or None,
-                )
-                seg_list = list(segments_iter)
-            finally:
-                if not job.keep_wav and os.path.exists(tmp_wav):
-                    try:
-                        os.remove(tmp_wav)
-                    except OSError:
-                        pass
+            if audio is None:
+                audio = decode_audio_16k_mono(str(job.input_path))
+            if job.keep_wav:
+                fd, tmp_wav = tempfile.mkstemp(prefix="srtgen_bundle_", suffix=".wav")
+                os.close(fd)
+                audio.write_wav(tmp_wav)
+
+            segments_iter, _info = model.transcribe(
+                audio.samples,
+                vad_filter=job.cfg.transcription.vad_filter,
+                language=job.language,
+                word_timestamps=True,
+                condition_on_previous_text=job.cfg.transcription.condition_on_previous_text,
+                no_speech_threshold=job.cfg.transcription.no_speech_threshold,
+                log_prob_threshold=job.cfg.transcription.log_prob_threshold,
+                compression_ratio_threshold=job.cfg.transcription.compression_ratio_threshold,
+                initial_prompt=job.cfg.transcription.initial_prompt or None,
+            )
+            seg_list = list(segments_iter)
 
             # Collect all word-level timing
             whisper_words: list[WordItem] = []
@@ -280,6 +307,156 @@ class SrtGenWorker(QRunnable):
                 elapsed=time.time() - started,
             )
 
+    # ------------------------------------------------------------------
+    # Shared model server
+    # ------------------------------------------------------------------
+
+    def _load_shared_model(
+        self,
+        model_name: str,
+        device: str,
+        strict_cuda: bool,
+        emitter: AppEventEmitter,
+        **options: Any,
+    ) -> tuple[Any, str, str]:
+        """Get *model_name* from the shared model server.
+
+        The server keeps the model warm between batches. Falls back to
+        loading the model in this process if the server is unavailable.
+        """
+        try:
+            client = ensure_model_server()
+            model = client.load(model_name, device, strict_cuda, emitter, **options)
+            emitter.emit(AppEvent(
+                event_type=EventType.LOG,
+                message=f"Using shared model server ({client.address})",
+            ))
+            return model, model.device_used, model.compute_type
+        except Exception as exc:
+            logger.warning("Model server unavailable: %s", exc)
+            emitter.emit(AppEvent(
+                event_type=EventType.LOG,
+                message=f"Model server unavailable ({exc}); loading the model in-process",
+                level=EventLevel.WARNING,
+            ))
+        return load_model(
+            model_name=model_name,
+            device=device,
+            strict_cuda=strict_cuda,
+            emitter=emitter,
+            **options,
+        )
+
+    # ------------------------------------------------------------------
+    # Batch stages
+    # ------------------------------------------------------------------
+
+    def _prefetch_job(self, job: SrtGenJobSpec) -> Optional["PreparedAudio"]:
+        """Decode and analyse *job*'s input ahead of inference.
+
+        Returns None for dry runs and on failure; the inference stage then
+        decodes the file itself and reports any error for that job.
+        """
+        if job.dry_run:
+            return None
+        try:
+            return prepare_audio(
+                job.input_path,
+                cfg=job.cfg,
+                keep_wav=job.keep_wav and not job.existing_srt_path,
+                emitter=self._emitter,
+            )
+        except Exception:
+            logger.debug("Prefetch failed for %s", job.input_path, exc_info=True)
+            return None
+
+    def _begin_job(
+        self,
+        idx: int,
+        job: SrtGenJobSpec,
+        prepared: Optional["PreparedAudio"],
+        model: Any,
+        device_used: str,
+        compute_type_used: str,
+    ) -> Callable[[], TranscriptionResult]:
+        """Run inference for *job* and return the callable that writes its outputs."""
+        total = len(self._jobs)
+        if job.existing_srt_path:
+            self._emitter.emit(AppEvent(
+                event_type=EventType.STAGE,
+                message=f"Bundle from SRT: {job.input_path.name} ({idx + 1}/{total})",
+                data={"stage_number": idx + 1, "total_stages": total + 1},
+            ))
+            result = self._run_bundle_from_srt(
+                job, model, device_used, compute_type_used,
+                audio=prepared.audio if prepared is not None else None,
+            )
+            return lambda: result
+
+        self._emitter.emit(AppEvent(
+            event_type=EventType.STAGE,
+            message=f"Transcribing {job.input_path.name} ({idx + 1}/{total})",
+            data={"stage_number": idx + 1, "total_stages": total + 1},
+        ))
+        return begin_transcribe_file(
+            input_path=job.input_path,
+            output_path=job.output_path,
+            fmt=job.fmt,
+            cfg=job.cfg,
+            model=model,
+            device_used=device_used,
+            compute_type_used=compute_type_used,
+            language=job.language,
+            word_level=job.word_level,
+            mode=job.mode,
+            transcript_path=job.transcript_path,
+            segments_path=job.segments_path,
+            json_bundle_path=job.json_bundle_path,
+            diarize=job.diarize,
+            hf_token=job.hf_token,
+            dry_run=job.dry_run,
+            keep_wav=job.keep_wav,
+            script_path=job.script_path,
+            emitter=self._emitter,
+            prepared=prepared,
+            transcript_cache=self._transcript_cache if job.use_transcript_cache else None,
+            model_name=self._model_name,
+            lora_name=self._lora_name,
+            stream_output=job.stream_output,
+            cancel_event=self._cancel_flag,
+        )
+
+    def _failed_result(
+        self,
+        job: SrtGenJobSpec,
+        exc: BaseException,
+        device_used: str,
+        compute_type_used: str,
+    ) -> TranscriptionResult:
+        self._emitter.emit(AppEvent(
+            event_type=EventType.LOG,
+            message=f"{job.input_path.name} failed: {exc}",
+            level=EventLevel.ERROR,
+        ))
+        return TranscriptionResult(
+            success=False,
+            input_path=job.input_path,
+            output_path=job.output_path,
+            subtitles=[],
+            segments=[],
+            device_used=device_used,
+            compute_type_used=compute_type_used,
+            error=str(exc),
+        )
+
+    def _on_job_finished(self, idx: int, result: TranscriptionResult) -> None:
+        total = len(self._jobs)
+        self._emitter.emit(AppEvent(
+            event_type=EventType.PROGRESS,
+            message=f"Completed {idx + 1}/{total}",
+            data={"percent": ((idx + 1) / total) * 100},
+        ))
+
     # ------------------------------------------------------------------
     # Execution
     # ------------------------------------------------------------------
@@ -319,10 +496,12 @@ class SrtGenWorker(QRunnable):
             # Resolve model name: if a LoRA adapter is selected, use the
             # merged CTranslate2 model path instead of the base model name.
             effective_model_name = first.model_name
+            self._lora_name = None
             if first.lora_name:
                 lora_model_path = _resolve_lora_ct2_path(first.lora_name)
                 if lora_model_path is not None:
                     effective_model_name = str(lora_model_path)
+                    self._lora_name = first.lora_name
                     self._emitter.emit(AppEvent(
                         event_type=EventType.LOG,
                         message=f"Using LoRA model: {first.lora_name}",
@@ -337,16 +516,43 @@ class SrtGenWorker(QRunnable):
                         level=EventLevel.WARNING,
                     ))
 
+            # Every job runs on this one model, so cached transcripts are
+            # keyed by it.
+            self._model_name = effective_model_name
+            if any(job.use_transcript_cache for job in self._jobs):
+                self._transcript_cache = TranscriptCache()
+
             # Always load the model on THIS thread so GPU handles (CUDA /
             # cuBLAS) stay thread-local.  We wrap in a ThreadPoolExecutor so
             # we can poll for cancel while the blocking load_model runs.
+            # Chunk-parallel "replicas" mode needs a model that serves
+            # several transcriptions at once.
+            model_options = {}
+            tx = first.cfg.transcription
+            if tx.parallel_mode == "replicas":
+                model_options = replica_model_options(
+                    resolve_workers(tx.parallel_mode, tx.parallel_workers)
+                )
+
+            loader = load_model
+            if first.use_model_server:
+                if tx.parallel_mode == "batched":
+                    self._emitter.emit(AppEvent(
+                        event_type=EventType.LOG,
+                        message="Batched parallel mode needs an in-process model; not using the model server",
+                        level=EventLevel.WARNING,
+                    ))
+                else:
+                    loader = self._load_shared_model
+
             with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
                 future = executor.submit(
-                    load_model,
+                    loader,
                     model_name=effective_model_name,
                     device=first.device,
                     strict_cuda=False,
                     emitter=self._emitter,
+                    **model_options,
                 )
                 while not future.done():
                     if self._cancel_flag.wait(timeout=0.5):
@@ -359,59 +565,30 @@ class SrtGenWorker(QRunnable):
                 self.signals.canceled.emit("Cancelled after model load")
                 return
 
-            for idx, job in enumerate(self._jobs):
-                if self._cancel_flag.is_set():
-                    logger.info("Batch cancelled before file %d/%d", idx + 1, total)
-                    self.signals.canceled.emit(
-                        f"Cancelled after {idx}/{total} files"
-                    )
-                    return
-
-                if job.existing_srt_path:
-                    self._emitter.emit(AppEvent(
-                        event_type=EventType.STAGE,
-                        message=f"Bundle from SRT: {job.input_path.name} ({idx + 1}/{total})",
-                        data={"stage_number": idx + 1, "total_stages": total + 1},
-                    ))
-                    result = self._run_bundle_from_srt(
-                        job, model, device_used, compute_type_used
-                    )
-                else:
-                    self._emitter.emit(AppEvent(
-                        event_type=EventType.STAGE,
-                        message=f"Transcribing {job.input_path.name} ({idx + 1}/{total})",
-                        data={"stage_number": idx + 1, "total_stages": total + 1},
-                    ))
+            # Decode upcoming files while the model works on the current
+            # one and write outputs on a separate thread behind it.
+            outcome = run_staged_batch(
+                self._jobs,
+                prefetch=self._prefetch_job,
+                infer=lambda idx, job, prepared: self._begin_job(
+                    idx, job, prepared, model, device_used, compute_type_used
+                ),
+                on_error=lambda job, exc: self._failed_result(
+                    job, exc, device_used, compute_type_used
+                ),
+                cancel_event=self._cancel_flag,
+                on_finished=self._on_job_finished,
+            )
+            self._results = outcome.results
 
-                    result = transcribe_file(
-                        input_path=job.input_path,
-                        output_path=job.output_path,
-                        fmt=job.fmt,
-                        cfg=job.cfg,
-                        model=model,
-                        device_used=device_used,
-                        compute_type_used=compute_type_used,
-                        language=job.language,
-                        word_level=job.word_level,
-                        mode=job.mode,
-                        transcript_path=job.transcript_path,
-                        segments_path=job.segments_path,
-                        json_bundle_path=job.json_bundle_path,
-                        diarize=job.diarize,
-                        hf_token=job.hf_token,
-                        dry_run=job.dry_run,
-                        keep_wav=job.keep_wav,
-                        script_path=job.script_path,
-                        emitter=self._emitter,
-                    )
-                self._results.append(result)
-
-                # Emit per-file progress
-                self._emitter.emit(AppEvent(
-                    event_type=EventType.PROGRESS,
-                    message=f"Completed {idx + 1}/{total}",
-                    data={"percent": ((idx + 1) / total) * 100},
-                ))
+            if outcome.canceled:
+                logger.info(
+                    "Batch cancelled before file %d/%d", outcome.completed + 1, total
+                )
+                self.signals.canceled.emit(
+                    f"Cancelled after {outcome.completed}/{total} files"
+                )
+                return
 
             # All done — emit batch completion
             self.signals.completed.emit({
@@ -68,6 +68,7 @@ _IMPORTABLE_EXTENSIONS: dict[str, str] = {
     ".ass": "subtitle",
     ".vtt": "subtitle",
     ".json": "json_bundle",
+    ".avbundle": "json_bundle",
 }
 
 
@@ -1,9 +1,12 @@
 import json
 import os
 import urllib.error
-import urllib.request
 
 from audio_visualizer import __version__
+from audio_visualizer.startup import lazy_import
+
+# http.client/ssl are only needed when checking for updates
+urllib_request = lazy_import("urllib.request")
 
 DEFAULT_REPO_OWNER = "pulsence"
 DEFAULT_REPO_NAME = "audio-visualizer"
@@ -43,7 +46,7 @@ def is_update_available(current_version: str, latest_version: str) -> bool:
 def fetch_latest_release(timeout_seconds: int = 8) -> dict:
     owner, repo = _get_repo()
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/releases/latest"
-    request = urllib.request.Request(
+    request = urllib_request.Request(
         url,
         headers={
             "Accept": "application/vnd.github+json",
@@ -51,7 +54,7 @@ def fetch_latest_release(timeout_seconds: int = 8) -> dict:
         },
     )
     try:
-        with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
+        with urllib_request.urlopen(request, timeout=timeout_seconds) as response:
             payload = response.read().decode("utf-8")
     except urllib.error.URLError as exc:
         raise RuntimeError(f"Unable to reach GitHub: {exc}") from exc
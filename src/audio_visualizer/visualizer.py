@@ -21,9 +21,13 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 '''
+import multiprocessing
 import sys
 from pathlib import Path
 
+# Imported first: its load time is the reference for startup marks
+from audio_visualizer import startup
+
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication
 from audio_visualizer.app_logging import install_process_diagnostics
@@ -44,9 +48,13 @@ def _resolve_icon_path() -> Path | None:
     return None
 
 def main():
+    # Frozen builds re-run this executable for spawn worker processes
+    # (clip export, feature caching, diarization); let those run the worker
+    multiprocessing.freeze_support()
     install_process_diagnostics()
 
     app = QApplication([])
+    startup.mark("qt_app")
 
     # Use Fusion style so custom palettes are respected by all widgets
     # including menus, tooltips, combo popups, and context menus.
@@ -60,6 +68,7 @@ def main():
     if icon_path is not None:
         app.setWindowIcon(QIcon(str(icon_path)))
     main_window = MainWindow()
+    startup.mark("window_built")
     main_window.show()
     return app.exec()
 
@@ -26,10 +26,14 @@ Utility functions
 '''
 import math
 from pathlib import Path
-import numpy as np
 
 from enum import Enum
 
+from audio_visualizer.startup import lazy_import
+
+# Deferred so the first window does not wait for numpy
+np = lazy_import("numpy")
+
 class VisualizerFlow(Enum):
     LEFT_TO_RIGHT = "Left to Right"
     OUT_FROM_CENTER = "Out from Center"
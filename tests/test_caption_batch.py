@@ -0,0 +1,192 @@
+"""Tests for batch caption rendering in audio_visualizer.caption.captionBatch."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from audio_visualizer.caption.captionApi import RenderConfig, render_subtitle
+from audio_visualizer.caption.captionBatch import (
+    BatchRenderItem,
+    main,
+    render_subtitles_batch,
+)
+from audio_visualizer.caption.core.sizing import SizeCalculator
+from audio_visualizer.caption.presets.loader import PresetLoader
+from audio_visualizer.caption.rendering.ffmpegRenderer import FFmpegRenderer
+from audio_visualizer.events import AppEvent, AppEventEmitter, EventLevel, EventType
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURE_SRT = ROOT / "tests" / "fixtures" / "caption" / "sample.srt"
+
+
+@pytest.fixture
+def srt_inputs(tmp_path):
+    inputs = []
+    for index in range(5):
+        path = tmp_path / "in" / f"clip_{index}.srt"
+        path.parent.mkdir(exist_ok=True)
+        shutil.copy(FIXTURE_SRT, path)
+        inputs.append(path)
+    return inputs
+
+
+@pytest.fixture
+def fake_renderer(monkeypatch):
+    calls = []
+
+    monkeypatch.setattr(FFmpegRenderer, "_find_ffmpeg", lambda self: "ffmpeg")
+
+    def fake_render(self, ass_path, output_path, size, fps, duration_sec):
+        calls.append({"ass_text": ass_path.read_text(encoding="utf-8"), "output": output_path})
+        self.emitter.emit(
+            AppEvent(
+                event_type=EventType.RENDER_PROGRESS,
+                message="FFmpeg rendering",
+                data={"percent": 50.0},
+            )
+        )
+        output_path.write_bytes(b"0" * 2048)
+
+    monkeypatch.setattr(FFmpegRenderer, "render", fake_render)
+    return calls
+
+
+class TestRenderSubtitlesBatch:
+    def test_renders_every_item_in_order(self, tmp_path, srt_inputs, fake_renderer):
+        items = [
+            BatchRenderItem(path, tmp_path / "out" / f"{path.stem}.mov")
+            for path in srt_inputs
+        ]
+
+        batch = render_subtitles_batch(items, config=RenderConfig(), max_workers=3)
+
+        assert batch.success is True
+        assert batch.succeeded == 5
+        assert [entry.item.input_path for entry in batch.items] == srt_inputs
+        assert all(entry.result.output_path.exists() for entry in batch.items)
+        assert all(entry.attempts == 1 for entry in batch.items)
+        assert len(fake_renderer) == 5
+
+    def test_loads_preset_and_font_once(self, monkeypatch, tmp_path, srt_inputs, fake_renderer):
+        preset_loads = []
+        font_loads = []
+        original_load = PresetLoader.load
+        original_font = SizeCalculator._load_font
+
+        def counting_load(self, ref):
+            preset_loads.append(ref)
+            return original_load(self, ref)
+
+        def counting_font(self):
+            font_loads.append(self.preset.font_size)
+            return original_font(self)
+
+        monkeypatch.setattr(PresetLoader, "load", counting_load)
+        monkeypatch.setattr(SizeCalculator, "_load_font", counting_font)
+
+        items = [BatchRenderItem(path, tmp_path / f"{path.stem}.mov") for path in srt_inputs]
+        batch = render_subtitles_batch(items, max_workers=2, prepare_workers=2)
+
+        assert batch.success is True
+        assert preset_loads == ["modern_box"]
+        assert len(font_loads) == 1
+
+    def test_working_ass_matches_single_render(self, monkeypatch, tmp_path, fake_renderer):
+        render_subtitle(FIXTURE_SRT, tmp_path / "single.mov", config=RenderConfig())
+        render_subtitles_batch(
+            [BatchRenderItem(FIXTURE_SRT, tmp_path / "batch.mov")],
+            config=RenderConfig(),
+        )
+
+        assert fake_renderer[0]["ass_text"] == fake_renderer[1]["ass_text"]
+
+    def test_failed_item_is_retried_and_isolated(self, monkeypatch, tmp_path, srt_inputs):
+        monkeypatch.setattr(FFmpegRenderer, "_find_ffmpeg", lambda self: "ffmpeg")
+        attempts: dict[str, int] = {}
+
+        def flaky_render(self, ass_path, output_path, size, fps, duration_sec):
+            attempts[output_path.stem] = attempts.get(output_path.stem, 0) + 1
+            if output_path.stem == "clip_1" and attempts[output_path.stem] == 1:
+                raise RuntimeError("transient failure")
+            if output_path.stem == "clip_3":
+                raise RuntimeError("permanent failure")
+            output_path.write_bytes(b"0" * 2048)
+
+        monkeypatch.setattr(FFmpegRenderer, "render", flaky_render)
+
+        events = []
+        items = [BatchRenderItem(path, tmp_path / f"{path.stem}.mov") for path in srt_inputs]
+        batch = render_subtitles_batch(items, retries=2, on_event=events.append)
+
+        by_name = {entry.item.input_path.stem: entry for entry in batch.items}
+        assert by_name["clip_1"].result.success is True
+        assert by_name["clip_1"].attempts == 2
+        assert by_name["clip_3"].result.success is False
+        assert by_name["clip_3"].attempts == 3
+        assert "permanent failure" in by_name["clip_3"].result.error
+        assert batch.succeeded == 4
+        assert batch.failed == 1
+        assert any(
+            event.level == EventLevel.WARNING and "retrying" in event.message
+            for event in events
+        )
+
+    def test_missing_input_fails_without_rendering(self, tmp_path, fake_renderer):
+        batch = render_subtitles_batch(
+            [
+                BatchRenderItem(tmp_path / "missing.srt", tmp_path / "missing.mov"),
+                BatchRenderItem(FIXTURE_SRT, tmp_path / "ok.mov"),
+            ]
+        )
+
+        assert batch.items[0].result.success is False
+        assert "not found" in batch.items[0].result.error
+        assert batch.items[0].attempts == 0
+        assert batch.items[1].result.success is True
+        assert len(fake_renderer) == 1
+
+    def test_unknown_preset_fails_every_item(self, tmp_path, fake_renderer):
+        batch = render_subtitles_batch(
+            [BatchRenderItem(FIXTURE_SRT, tmp_path / "a.mov")],
+            config=RenderConfig(preset="does_not_exist"),
+        )
+
+        assert batch.failed == 1
+        assert "does_not_exist" in batch.items[0].result.error
+        assert fake_renderer == []
+
+    def test_emits_aggregated_progress(self, tmp_path, srt_inputs, fake_renderer):
+        emitter = AppEventEmitter()
+        events = []
+        emitter.subscribe(events.append)
+
+        items = [BatchRenderItem(path, tmp_path / f"{path.stem}.mov") for path in srt_inputs]
+        render_subtitles_batch(items, emitter=emitter)
+
+        progress = [e for e in events if e.event_type == EventType.RENDER_PROGRESS]
+        assert progress
+        assert progress[-1].data["completed"] == 5
+        assert progress[-1].data["total"] == 5
+        assert progress[-1].data["percent"] == pytest.approx(100.0)
+        assert events[0].event_type == EventType.JOB_START
+        assert events[-1].event_type == EventType.JOB_COMPLETE
+
+
+class TestCaptionBatchCli:
+    def test_cli_renders_inputs_to_output_dir(self, tmp_path, srt_inputs, fake_renderer, capsys):
+        out_dir = tmp_path / "cli_out"
+
+        code = main([*map(str, srt_inputs[:2]), "-o", str(out_dir), "--workers", "2"])
+
+        assert code == 0
+        assert (out_dir / "clip_0.mov").exists()
+        assert (out_dir / "clip_1.mov").exists()
+        assert "2/2 rendered" in capsys.readouterr().out
+
+    def test_cli_returns_nonzero_on_failure(self, tmp_path, fake_renderer):
+        code = main([str(tmp_path / "missing.srt"), "-o", str(tmp_path)])
+
+        assert code == 1
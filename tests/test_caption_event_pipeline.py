@@ -0,0 +1,158 @@
+"""Golden-file tests for the compiled caption event pipeline.
+
+The ``.ass`` files under ``tests/fixtures/caption/golden`` were produced by
+the original staged preprocessing (markdown pass, ``apply_style``,
+``apply_animation``, ``compute_size``, positioning) using a deterministic
+stand-in font, so the compiled pipeline must reproduce them byte-for-byte.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pysubs2
+import pytest
+
+from audio_visualizer.caption.animations import AnimationRegistry
+from audio_visualizer.caption.captionApi import RenderConfig, prepare_working_ass
+from audio_visualizer.caption.core.config import PresetConfig
+from audio_visualizer.caption.core.markdownToAss import markdown_to_ass
+from audio_visualizer.caption.core.sizing import SizeCalculator
+from audio_visualizer.caption.core.style import StyleBuilder
+from audio_visualizer.caption.core.subtitle import SubtitleFile
+from audio_visualizer.caption.presets.defaults import get_builtin_preset
+from audio_visualizer.caption.rendering.progressTracker import ProgressTracker
+from audio_visualizer.events import AppEventEmitter
+
+ROOT = Path(__file__).resolve().parents[1]
+GOLDEN_DIR = ROOT / "tests" / "fixtures" / "caption" / "golden"
+GOLDEN_SRT = GOLDEN_DIR / "input.srt"
+
+
+class _FixedWidthFont:
+    """Deterministic stand-in for a Pillow FreeTypeFont."""
+
+    def getlength(self, text: str) -> float:
+        width = 0.0
+        for char in text:
+            if char.isupper():
+                width += 27.5
+            elif char.isalnum():
+                width += 18.25
+            else:
+                width += 9.0
+        return width
+
+    def getmetrics(self) -> tuple[int, int]:
+        return (46, 12)
+
+
+_CASES = {
+    "no_animation": ("modern_box", None, {"apply_animation": False}),
+    "fade": ("clean_outline", None, {}),
+    "slide_up": ("modern_box", None, {}),
+    "word_reveal": (
+        "modern_box",
+        {"type": "word_reveal", "mode": "weighted", "min_word_ms": 60, "max_word_ms": 350},
+        {},
+    ),
+    "word_reveal_even": ("clean_outline", {"type": "word_reveal", "lead_in_ms": 100}, {}),
+    "word_highlight": ("modern_box", {"type": "word_highlight", "normal_color": "#FFFFFF"}, {}),
+    "word_highlight_narrow": (
+        "clean_outline",
+        {"type": "word_highlight", "mode": "weighted"},
+        {"max_width_px": 260},
+    ),
+    "typewriter": ("modern_box", {"type": "typewriter"}, {}),
+    "scale_settle": ("modern_box", {"type": "scale_settle"}, {}),
+    "blur_settle": ("modern_box", {"type": "blur_settle"}, {}),
+    "pulse": ("modern_box", {"type": "pulse"}, {}),
+    "beat_pop": ("modern_box", {"type": "beat_pop"}, {}),
+    "emphasis_glow": ("modern_box", {"type": "emphasis_glow"}, {}),
+}
+
+
+def _build_case(name: str) -> tuple[PresetConfig, RenderConfig]:
+    base, animation, overrides = _CASES[name]
+    data = get_builtin_preset(base)
+    if animation is not None:
+        data["animation"] = {
+            **AnimationRegistry.get_defaults(animation["type"]),
+            **animation,
+        }
+    config_kwargs = {}
+    for key, value in overrides.items():
+        if key in RenderConfig.__dataclass_fields__:
+            config_kwargs[key] = value
+        else:
+            data[key] = value
+    return PresetConfig.from_dict(data), RenderConfig(**config_kwargs)
+
+
+def _prepare(name: str, input_path: Path, ass_path: Path, font) -> str:
+    preset, config = _build_case(name)
+    prepare_working_ass(
+        input_path=input_path,
+        ass_path=ass_path,
+        config=config,
+        preset=preset,
+        progress=ProgressTracker(AppEventEmitter(), enabled=False),
+        font=font,
+    )
+    return ass_path.read_text(encoding="utf-8")
+
+
+def _prepare_staged(name: str, input_path: Path, ass_path: Path, font) -> str:
+    """Reference implementation: one full pass over the events per stage."""
+    preset, config = _build_case(name)
+    subtitle = SubtitleFile.load(input_path)
+    for event in subtitle.subs.events:
+        if event.text:
+            event.text = markdown_to_ass(event.text)
+    style = StyleBuilder(preset).build("Default")
+    if input_path.suffix.lower() == ".srt" or config.reskin:
+        subtitle.apply_style(style, preset, wrap_text=True, font=font)
+    animation = None
+    if config.apply_animation and preset.animation:
+        animation = AnimationRegistry.create(preset.animation.type, preset.animation.params)
+        subtitle.apply_animation(animation)
+    size_calc = SizeCalculator(preset, safety_scale=config.safety_scale, font=font)
+    size = size_calc.compute_size(subtitle.subs)
+    position = size_calc.compute_anchor_position(size)
+    subtitle.apply_center_positioning(position, size)
+    subtitle.set_play_resolution(size)
+    subtitle.save(ass_path)
+    content = ass_path.read_text(encoding="utf-8")
+    if animation is not None and animation.supports_placeholder_substitution():
+        content = animation.substitute_placeholders(content, position)
+    return content
+
+
+@pytest.mark.parametrize("name", sorted(_CASES))
+def test_matches_golden_output(name, tmp_path):
+    golden = GOLDEN_DIR / f"{name}.ass"
+    produced = _prepare(name, GOLDEN_SRT, tmp_path / "working.ass", _FixedWidthFont())
+
+    assert produced == golden.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("name", ["slide_up", "word_reveal", "word_highlight_narrow"])
+def test_matches_staged_reference_with_real_font(name, tmp_path):
+    preset, _ = _build_case(name)
+    font = SizeCalculator(preset).font
+
+    produced = _prepare(name, GOLDEN_SRT, tmp_path / "a.ass", font)
+    reference = _prepare_staged(name, GOLDEN_SRT, tmp_path / "b.ass", font)
+
+    assert produced == reference
+
+
+def test_ass_input_without_reskin_keeps_text_unwrapped(tmp_path):
+    source = pysubs2.load(str(GOLDEN_SRT))
+    ass_input = tmp_path / "input.ass"
+    source.save(str(ass_input))
+
+    produced = _prepare("word_reveal", ass_input, tmp_path / "a.ass", _FixedWidthFont())
+    reference = _prepare_staged("word_reveal", ass_input, tmp_path / "b.ass", _FixedWidthFont())
+
+    assert produced == reference
@@ -59,3 +59,148 @@ class TestFFmpegRenderer:
             and event.data == {"video_encoder": "libx264"}
             for event in events
         )
+
+    def test_render_with_delivery_uses_single_split_command(self, monkeypatch, tmp_path):
+        events = []
+        emitter = AppEventEmitter()
+        emitter.subscribe(events.append)
+        renderer = FFmpegRenderer(
+            emitter,
+            ffmpeg_path="ffmpeg",
+            quality="large",
+            show_progress=False,
+        )
+
+        monkeypatch.setattr(
+            "audio_visualizer.hwaccel.select_encoder",
+            lambda codec: "libx264",
+        )
+
+        commands: list[list[str]] = []
+
+        def _fake_run(cmd, output_path, duration_sec):
+            commands.append(cmd)
+            Path(cmd[-1]).write_bytes(b"mp4")
+
+        monkeypatch.setattr(renderer, "_run_render_command", _fake_run)
+        monkeypatch.setattr(renderer, "_verify_output", lambda path: None)
+
+        overlay_path = tmp_path / "captions.mov"
+        delivery_path = tmp_path / "captions.mp4"
+        audio_path = tmp_path / "audio.wav"
+        renderer.render_with_delivery(
+            ass_path=tmp_path / "captions.ass",
+            output_path=overlay_path,
+            delivery_path=delivery_path,
+            size=OverlaySize(1280, 720),
+            fps="30",
+            duration_sec=5.0,
+            audio_path=audio_path,
+        )
+
+        assert len(commands) == 1
+        cmd = commands[0]
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert "split=2[ov][dv]" in graph
+        assert "[ov]format=yuva444p10le[overlay]" in graph
+        assert "[dv]format=yuv420p[delivery]" in graph
+        assert cmd[cmd.index("-i", cmd.index("-i") + 1) + 1] == str(audio_path)
+        assert str(overlay_path) in cmd
+        assert "1:a:0?" in cmd
+        assert delivery_path.read_bytes() == b"mp4"
+        assert not list(tmp_path.glob(".*partial*"))
+        assert any(
+            event.event_type == EventType.RENDER_COMPLETE
+            and event.data == {"delivery_video_encoder": "libx264"}
+            for event in events
+        )
+
+    def test_render_with_delivery_same_path_writes_single_output(self, monkeypatch, tmp_path):
+        renderer = FFmpegRenderer(
+            AppEventEmitter(),
+            ffmpeg_path="ffmpeg",
+            quality="small",
+            show_progress=False,
+        )
+        monkeypatch.setattr(
+            "audio_visualizer.hwaccel.select_encoder",
+            lambda codec: "libx264",
+        )
+
+        commands: list[list[str]] = []
+
+        def _fake_run(cmd, output_path, duration_sec):
+            commands.append(cmd)
+            Path(cmd[-1]).write_bytes(b"mp4")
+
+        monkeypatch.setattr(renderer, "_run_render_command", _fake_run)
+
+        preview_path = tmp_path / "preview.mp4"
+        renderer.render_with_delivery(
+            ass_path=tmp_path / "captions.ass",
+            output_path=preview_path,
+            delivery_path=preview_path,
+            size=OverlaySize(640, 360),
+            fps="30",
+            duration_sec=5.0,
+        )
+
+        cmd = commands[0]
+        assert "split" not in cmd[cmd.index("-filter_complex") + 1]
+        assert cmd.count("-map") == 1
+        assert "-an" in cmd
+        assert preview_path.exists()
+
+    def test_render_with_delivery_falls_back_to_software_encoder(self, monkeypatch, tmp_path):
+        events = []
+        emitter = AppEventEmitter()
+        emitter.subscribe(events.append)
+        renderer = FFmpegRenderer(
+            emitter,
+            ffmpeg_path="ffmpeg",
+            quality="small",
+            show_progress=False,
+        )
+        monkeypatch.setattr(
+            "audio_visualizer.hwaccel.select_encoder",
+            lambda codec: "h264_nvenc",
+        )
+
+        attempted: list[list[str]] = []
+
+        def _fake_run(cmd, output_path, duration_sec):
+            encoders = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-c:v"]
+            attempted.append(encoders)
+            if "h264_nvenc" in encoders:
+                raise RuntimeError("hardware encoder failed")
+            Path(cmd[-1]).write_bytes(b"mp4")
+
+        monkeypatch.setattr(renderer, "_run_render_command", _fake_run)
+        monkeypatch.setattr(renderer, "_verify_output", lambda path: None)
+
+        delivery_path = tmp_path / "captions.mp4"
+        renderer.render_with_delivery(
+            ass_path=tmp_path / "captions.ass",
+            output_path=tmp_path / "captions.mov",
+            delivery_path=delivery_path,
+            size=OverlaySize(1920, 1080),
+            fps="30",
+            duration_sec=5.0,
+        )
+
+        assert attempted == [["h264_nvenc", "h264_nvenc"], ["libx264", "libx264"]]
+        assert delivery_path.exists()
+        assert any(
+            event.event_type == EventType.LOG
+            and event.level == EventLevel.WARNING
+            and "retrying ffmpeg render with software encoder libx264" in event.message.lower()
+            for event in events
+        )
+        assert any(
+            event.event_type == EventType.RENDER_COMPLETE
+            and event.data == {
+                "video_encoder": "libx264",
+                "delivery_video_encoder": "libx264",
+            }
+            for event in events
+        )
@@ -0,0 +1,135 @@
+"""Tests for single-frame caption previews (caption.rendering.framePreview)."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from audio_visualizer.caption.captionApi import RenderConfig
+from audio_visualizer.caption.rendering.framePreview import CaptionFramePreviewer
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURE_SRT = ROOT / "tests" / "fixtures" / "caption" / "sample.srt"
+
+
+class _FakeRun:
+    def __init__(self):
+        self.commands: list[list[str]] = []
+        self.returncode = 0
+
+    def __call__(self, cmd, **kwargs):
+        self.commands.append(cmd)
+        size = cmd[cmd.index("-i") + 1].split(":s=")[1].split(":")[0]
+        width, height = (int(v) for v in size.split("x"))
+        stdout = b"\x00" * (width * height * 4) if self.returncode == 0 else b""
+        return subprocess.CompletedProcess(cmd, self.returncode, stdout, b"boom")
+
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    fake = _FakeRun()
+    monkeypatch.setattr(
+        "audio_visualizer.caption.rendering.framePreview.subprocess.run", fake
+    )
+    return fake
+
+
+class TestCaptionFramePreviewer:
+    def test_render_before_prepare_raises(self):
+        previewer = CaptionFramePreviewer(ffmpeg_path="ffmpeg")
+        with pytest.raises(RuntimeError, match="No subtitle prepared"):
+            previewer.render_frame(0)
+
+    def test_prepare_keeps_working_ass_resident(self):
+        previewer = CaptionFramePreviewer(ffmpeg_path="ffmpeg")
+        prepared = previewer.prepare(FIXTURE_SRT, RenderConfig())
+
+        assert prepared.ass_path.exists()
+        assert previewer.duration_ms == 12000
+
+        previewer.close()
+        assert not prepared.ass_path.exists()
+        assert previewer.prepared is None
+
+    def test_reprepare_replaces_previous_working_ass(self):
+        previewer = CaptionFramePreviewer(ffmpeg_path="ffmpeg")
+        first = previewer.prepare(FIXTURE_SRT, RenderConfig())
+        second = previewer.prepare(FIXTURE_SRT, RenderConfig(preset="clean_outline"))
+
+        assert not first.ass_path.exists()
+        assert second.ass_path.exists()
+        previewer.close()
+
+    def test_render_frame_seeks_canvas_to_timestamp(self, fake_run):
+        previewer = CaptionFramePreviewer(ffmpeg_path="ffmpeg")
+        prepared = previewer.prepare(FIXTURE_SRT, RenderConfig(fps="25"))
+
+        frame = previewer.render_frame(6000)
+
+        cmd = fake_run.commands[0]
+        assert "setpts=PTS+6.000000/TB" in cmd[cmd.index("-vf") + 1]
+        assert cmd[cmd.index("-frames:v") + 1] == "1"
+        assert cmd[-4:] == ["rawvideo", "-pix_fmt", "rgba", "pipe:1"]
+        assert frame.time_ms == 6000
+        assert (frame.width, frame.height) == (prepared.size.width, prepared.size.height)
+        assert len(frame.rgba) == frame.width * frame.height * 4
+        previewer.close()
+
+    def test_frames_are_cached_per_frame_index(self, fake_run):
+        previewer = CaptionFramePreviewer(ffmpeg_path="ffmpeg")
+        previewer.prepare(FIXTURE_SRT, RenderConfig(fps="30"))
+
+        first = previewer.render_frame(1000)
+        # 1010 ms rounds to the same 30 fps frame as 1000 ms
+        second = previewer.render_frame(1010)
+
+        assert first is second
+        assert len(fake_run.commands) == 1
+
+        previewer.prepare(FIXTURE_SRT, RenderConfig(fps="30"))
+        previewer.render_frame(1000)
+        assert len(fake_run.commands) == 2
+        previewer.close()
+
+    def test_cache_is_bounded(self, fake_run):
+        previewer = CaptionFramePreviewer(ffmpeg_path="ffmpeg", cache_size=2)
+        previewer.prepare(FIXTURE_SRT, RenderConfig(fps="10"))
+
+        for ms in (0, 100, 200, 0):
+            previewer.render_frame(ms)
+
+        assert len(fake_run.commands) == 4
+        previewer.close()
+
+    def test_ffmpeg_failure_raises(self, fake_run):
+        fake_run.returncode = 1
+        previewer = CaptionFramePreviewer(ffmpeg_path="ffmpeg")
+        previewer.prepare(FIXTURE_SRT, RenderConfig())
+
+        with pytest.raises(RuntimeError, match="boom"):
+            previewer.render_frame(2000)
+        previewer.close()
+
+    def test_fps_value_parsing(self):
+        assert CaptionFramePreviewer._fps_value("30") == 30.0
+        assert CaptionFramePreviewer._fps_value("30000/1001") == pytest.approx(29.97, rel=1e-3)
+        assert CaptionFramePreviewer._fps_value("bad") == 30.0
+
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="requires ffmpeg")
+    def test_real_frame_has_transparent_canvas_and_caption(self):
+        previewer = CaptionFramePreviewer()
+        previewer.prepare(FIXTURE_SRT, RenderConfig(apply_animation=False))
+        try:
+            try:
+                shown = previewer.render_frame(2500)
+            except RuntimeError as exc:
+                pytest.skip(f"ffmpeg cannot render subtitles here: {exc}")
+            hidden = previewer.render_frame(4500)
+        finally:
+            previewer.close()
+
+        assert any(shown.rgba[3::4])
+        assert not any(hidden.rgba[3::4])
@@ -6,7 +6,11 @@ Tests for text measurement functionality.
 import pytest
 from PIL import ImageFont
 
-from audio_visualizer.caption.text.measurement import measure_multiline, measure_single_line
+from audio_visualizer.caption.text.measurement import (
+    CachedFont,
+    measure_multiline,
+    measure_single_line,
+)
 
 
 class TestMeasureSingleLine:
@@ -163,3 +167,50 @@ class TestMeasureMultiline:
         _, height_neg, _ = measure_multiline(text, mock_font, -5)
 
         assert height_neg < height_zero
+
+
+class TestCachedFont:
+    """Test suite for the CachedFont measurement wrapper."""
+
+    def test_matches_wrapped_font(self, mock_font):
+        """Cached lengths and metrics match the wrapped font."""
+        cached = CachedFont(mock_font)
+        for text in ("", "Hello", "Hello World", "café, naïve!"):
+            assert cached.getlength(text) == mock_font.getlength(text)
+        assert cached.getmetrics() == mock_font.getmetrics()
+
+    def test_extend_length_is_exact(self, mock_font):
+        """Incremental widths equal measuring the joined string."""
+        cached = CachedFont(mock_font)
+        words = "AV To Wa yo LT fi café don't — ... ?! 1234 Hello World".split()
+        line = words[0]
+        width = cached.getlength(line)
+        for word in words[1:]:
+            width = cached.extend_length(line, width, " " + word)
+            line = line + " " + word
+            assert width == mock_font.getlength(line)
+
+    def test_extend_length_without_basic_layout_measures_directly(self):
+        """Fonts that are not Pillow basic-layout fonts are measured in full."""
+
+        class _Font:
+            def __init__(self):
+                self.calls = []
+
+            def getlength(self, text):
+                self.calls.append(text)
+                return float(len(text))
+
+        font = _Font()
+        cached = CachedFont(font)
+
+        assert cached.additive is False
+        assert cached.extend_length("ab", 2.0, " cd") == 5.0
+        assert font.calls == ["ab cd"]
+
+    def test_cache_is_bounded(self, mock_font):
+        """The cache is cleared instead of growing past max_entries."""
+        cached = CachedFont(mock_font, max_entries=4)
+        for text in ("a", "b", "c", "d", "e"):
+            cached.getlength(text)
+        assert len(cached._lengths) <= 4
@@ -91,3 +91,125 @@ class TestPresetLoaderDataDir:
         result = loader.list_available()
         assert "modern_box" in result
         assert "clean_outline" in result
+
+
+class TestPresetRegistryCache:
+    """Tests for the process-wide preset cache behind PresetLoader."""
+
+    def _write(self, path, font_size):
+        path.write_text(json.dumps({"font_size": font_size, "padding": [1, 2, 3, 4]}), encoding="utf-8")
+
+    def test_repeated_load_does_not_rescan_or_reparse(self, monkeypatch, tmp_path):
+        """Warm loads from a preset directory skip scandir and parsing."""
+        import os
+
+        presets_dir = tmp_path / "presets"
+        presets_dir.mkdir()
+        self._write(presets_dir / "custom.json", 50)
+        loader = PresetLoader(preset_dirs=[presets_dir])
+        assert loader.load("custom").font_size == 50
+
+        scans = []
+        parses = []
+        real_scandir = os.scandir
+        monkeypatch.setattr(
+            "audio_visualizer.caption.presets.registry.os.scandir",
+            lambda path: scans.append(path) or real_scandir(path),
+        )
+        real_load_file = PresetLoader._load_file
+        monkeypatch.setattr(
+            PresetLoader,
+            "_load_file",
+            lambda self, path: parses.append(path) or real_load_file(self, path),
+        )
+
+        for _ in range(3):
+            assert loader.load("custom").font_size == 50
+        assert scans == []
+        assert parses == []
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        """A preset file whose mtime or size changes is parsed again."""
+        import os
+
+        path = tmp_path / "change.json"
+        self._write(path, 50)
+        loader = PresetLoader(preset_dirs=[])
+        assert loader.load(str(path)).font_size == 50
+
+        self._write(path, 120)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert loader.load(str(path)).font_size == 120
+
+    def test_added_file_is_found(self, tmp_path):
+        """Files added after the directory was indexed are resolved."""
+        presets_dir = tmp_path / "presets"
+        presets_dir.mkdir()
+        self._write(presets_dir / "first.json", 40)
+        loader = PresetLoader(preset_dirs=[presets_dir])
+        assert loader.load("first").font_size == 40
+
+        self._write(presets_dir / "second.json", 44)
+        assert loader.load("second").font_size == 44
+        assert "second.json" in loader.list_available()
+
+    def test_cached_presets_are_private_copies(self, tmp_path):
+        """Mutating a loaded preset does not leak into later loads."""
+        path = tmp_path / "copy.json"
+        self._write(path, 50)
+        loader = PresetLoader(preset_dirs=[])
+
+        first = loader.load(str(path))
+        first.padding[0] = 999
+        first.font_size = 1
+
+        second = loader.load(str(path))
+        assert second.padding == [1, 2, 3, 4]
+        assert second.font_size == 50
+
+    def test_named_presets_are_cached_per_name(self, tmp_path):
+        """Named presets from one multi-preset file do not collide."""
+        path = tmp_path / "multi.json"
+        path.write_text(
+            json.dumps({"small": {"font_size": 20}, "large": {"font_size": 90}}),
+            encoding="utf-8",
+        )
+        loader = PresetLoader(preset_dirs=[])
+
+        assert loader.load(f"{path}:small").font_size == 20
+        assert loader.load(f"{path}:large").font_size == 90
+        assert loader.load(f"{path}:small").font_size == 20
+
+    def test_default_preset_dir_is_seeded_once(self, monkeypatch, tmp_path):
+        """get_caption_preset_dir seeds examples only on first use."""
+        from audio_visualizer.caption.presets import loader as loader_module
+
+        fake_data = tmp_path / "app_data"
+        fake_data.mkdir()
+        monkeypatch.setattr(loader_module, "get_data_dir", lambda: fake_data)
+        seeds = []
+        real_ensure = loader_module.ensure_example_presets
+        monkeypatch.setattr(
+            loader_module,
+            "ensure_example_presets",
+            lambda preset_dir=None: seeds.append(preset_dir) or real_ensure(preset_dir),
+        )
+
+        PresetLoader()
+        PresetLoader()
+        assert len(seeds) == 1
+
+    def test_warm_caches_loads_presets_and_fonts(self, monkeypatch):
+        """warm_caches parses the requested presets and loads their fonts."""
+        from audio_visualizer.caption.presets import registry as registry_module
+
+        loaded = []
+        monkeypatch.setattr(
+            "audio_visualizer.caption.text.fonts.FontRegistry.load",
+            lambda self, font_file, font_size: loaded.append((font_file, font_size)),
+        )
+
+        registry_module.warm_caches(["modern_box", "does_not_exist"])
+
+        assert loaded == [("", PresetLoader(preset_dirs=[]).load("modern_box").font_size)]
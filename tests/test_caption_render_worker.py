@@ -397,3 +397,77 @@ class TestCaptionRenderWorkerConfig:
             for event in events
         )
         assert delivery_path.exists()
+
+    def test_single_pass_delivery_skips_second_ffmpeg_pass(self, monkeypatch, tmp_path):
+        overlay_path = tmp_path / "overlay.mov"
+        delivery_path = tmp_path / "delivery.mp4"
+        audio_path = tmp_path / "audio.wav"
+        spec = CaptionRenderJobSpec(
+            subtitle_path=Path("/tmp/test.srt"),
+            output_path=overlay_path,
+            delivery_output_path=delivery_path,
+            delivery_audio_path=audio_path,
+            config=RenderConfig(),
+        )
+        emitter = AppEventEmitter()
+        worker = CaptionRenderWorker(spec=spec, emitter=emitter)
+
+        calls = []
+
+        def _fake_render(**kwargs):
+            calls.append(kwargs)
+            return RenderResult(
+                success=True,
+                output_path=overlay_path,
+                width=1280,
+                height=180,
+                duration_ms=4000,
+                delivery_path=kwargs["delivery_path"],
+            )
+
+        completed = []
+        worker.signals.completed.connect(completed.append)
+        monkeypatch.setattr(
+            "audio_visualizer.ui.workers.captionRenderWorker.render_subtitle",
+            _fake_render,
+        )
+
+        with patch.object(worker, "_create_delivery_output") as mock_delivery:
+            worker.run()
+            mock_delivery.assert_not_called()
+
+        assert calls[0]["delivery_path"] == delivery_path
+        assert calls[0]["delivery_audio_path"] == audio_path
+        assert completed[0]["delivery_path"] == str(delivery_path)
+        assert completed[0]["delivery_has_audio"] is True
+
+    def test_two_pass_delivery_when_single_pass_disabled(self, monkeypatch, tmp_path):
+        overlay_path = tmp_path / "overlay.mov"
+        delivery_path = tmp_path / "delivery.mp4"
+        spec = CaptionRenderJobSpec(
+            subtitle_path=Path("/tmp/test.srt"),
+            output_path=overlay_path,
+            delivery_output_path=delivery_path,
+            config=RenderConfig(single_pass_delivery=False),
+        )
+        emitter = AppEventEmitter()
+        worker = CaptionRenderWorker(spec=spec, emitter=emitter)
+
+        calls = []
+        monkeypatch.setattr(
+            "audio_visualizer.ui.workers.captionRenderWorker.render_subtitle",
+            lambda **kwargs: calls.append(kwargs) or RenderResult(
+                success=True,
+                output_path=overlay_path,
+            ),
+        )
+
+        with patch.object(worker, "_create_delivery_output") as mock_delivery:
+            worker.run()
+            mock_delivery.assert_called_once_with(
+                overlay_path=overlay_path,
+                delivery_path=delivery_path,
+                audio_path=None,
+            )
+
+        assert "delivery_path" not in calls[0]
@@ -307,3 +307,38 @@ class TestSizeCalculatorCompute:
         # Width should be approximately max_width_px plus padding and safety
         assert size.width < 600  # Should be constrained
         assert size.height > 100  # Should be taller due to wrapping
+
+
+class TestFontRegistry:
+    """Tests for the process-wide measurement font cache."""
+
+    def test_calculators_share_font_instance(self):
+        """SizeCalculators for the same font and size reuse one font."""
+        preset = PresetConfig(font_size=37)
+        assert SizeCalculator(preset).font is SizeCalculator(preset).font
+
+    def test_font_file_is_cached_until_it_changes(self, tmp_path):
+        """Explicit font files are reopened only after they change."""
+        import os
+        import shutil
+
+        from audio_visualizer.caption.text.fonts import FontRegistry
+
+        source = SizeCalculator(PresetConfig(font_size=30)).font.path
+        font_path = tmp_path / "font.ttf"
+        shutil.copy(source, font_path)
+        registry = FontRegistry()
+
+        first = registry.load(str(font_path), 30)
+        assert registry.load(str(font_path), 30) is first
+        assert registry.load(str(font_path), 31) is not first
+
+        stat = font_path.stat()
+        os.utime(font_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert registry.load(str(font_path), 30) is not first
+
+    def test_missing_font_file_raises(self, tmp_path):
+        """A missing explicit font file raises FileNotFoundError."""
+        preset = PresetConfig(font_file=str(tmp_path / "missing.ttf"))
+        with pytest.raises(FileNotFoundError, match="Font file not found"):
+            SizeCalculator(preset)
@@ -6,6 +6,7 @@ Tests for text wrapping functionality.
 import pytest
 from PIL import ImageFont
 
+from audio_visualizer.caption.text.measurement import CachedFont
 from audio_visualizer.caption.text.wrapper import wrap_text_to_width
 
 
@@ -115,3 +116,14 @@ class TestWrapTextToWidth:
         for line in result.split("\n"):
             if line:  # Skip empty lines
                 assert line == line.strip()
+
+    def test_cached_font_wraps_identically(self, mock_font):
+        """Test that a CachedFont produces the same wrapping as the raw font."""
+        text = (
+            "The quick brown fox jumps over the lazy dog while the band plays\n"
+            "a slow song, don't stop — café naïve"
+        )
+        for max_width in (150, 400, 900):
+            assert wrap_text_to_width(text, CachedFont(mock_font), max_width) == (
+                wrap_text_to_width(text, mock_font, max_width)
+            )
@@ -0,0 +1,119 @@
+"""Tests for grouped training clip extraction."""
+from __future__ import annotations
+
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from audio_visualizer.core.clipExport import (
+    ClipRequest,
+    export_clips,
+    extract_source_clips,
+    write_wav,
+)
+from audio_visualizer.core.correctionDb import CorrectionDatabase
+
+SR = 16000
+
+
+def _ramp_wav(path: Path, seconds: float) -> np.ndarray:
+    """16 kHz mono WAV whose samples encode their own position."""
+    samples = (np.arange(int(seconds * SR)) % 30000 - 15000).astype("<i2")
+    write_wav(path, samples.tobytes(), SR, 1, 2)
+    return samples
+
+
+def _read(path: Path) -> np.ndarray:
+    with wave.open(str(path)) as w:
+        return np.frombuffer(w.readframes(w.getnframes()), "<i2")
+
+
+class TestExtractSourceClips:
+    def test_clips_match_the_source_samples(self, tmp_path):
+        source = tmp_path / "source.wav"
+        samples = _ramp_wav(source, 20.0)
+        ranges = [(15000, 16500), (500, 2000), (1000, 1200), (19500, 25000)]  # Unsorted, overlapping, past the end
+        clips = [
+            ClipRequest(i, str(source), start, end, tmp_path / f"clip{i}.wav")
+            for i, (start, end) in enumerate(ranges)
+        ]
+
+        results = extract_source_clips(str(source), clips)
+
+        assert sorted(results) == [(0, None), (1, None), (2, None), (3, None)]
+        for clip in clips:
+            expected = samples[clip.start_ms * 16:clip.end_ms * 16]
+            np.testing.assert_array_equal(_read(clip.output_path), expected)
+
+    def test_seeks_over_long_gaps(self, tmp_path):
+        source = tmp_path / "source.wav"
+        samples = _ramp_wav(source, 30.0)
+        clips = [
+            ClipRequest(0, str(source), 200, 700, tmp_path / "a.wav"),
+            ClipRequest(1, str(source), 25000, 25300, tmp_path / "b.wav"),
+        ]
+
+        results = extract_source_clips(str(source), clips, seek_gap_ms=1000)
+
+        assert sorted(results) == [(0, None), (1, None)]
+        np.testing.assert_array_equal(_read(tmp_path / "b.wav"), samples[25000 * 16:25300 * 16])
+
+    def test_failures_are_reported_per_clip(self, tmp_path):
+        source = tmp_path / "source.wav"
+        _ramp_wav(source, 2.0)
+        late = ClipRequest(0, str(source), 5000, 6000, tmp_path / "late.wav")
+        assert extract_source_clips(str(source), [late])[0][1] == "clip starts after the end of the audio"
+
+        broken = tmp_path / "broken.wav"
+        broken.write_bytes(b"not audio")
+        results = extract_source_clips(
+            str(broken), [ClipRequest(1, str(broken), 0, 100, tmp_path / "x.wav")]
+        )
+        assert results[0][0] == 1 and results[0][1]
+
+
+class TestExportClips:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_groups_by_source(self, tmp_path, workers):
+        sources = [tmp_path / "a.wav", tmp_path / "b.wav"]
+        for source in sources:
+            _ramp_wav(source, 3.0)
+        requests = [
+            ClipRequest(i, str(sources[i % 2]), i * 200, i * 200 + 300, tmp_path / f"c{i}.wav")
+            for i in range(6)
+        ]
+        progress = []
+
+        results = export_clips(
+            requests, workers=workers, progress_callback=lambda done, total, _msg: progress.append((done, total))
+        )
+
+        assert results == {i: None for i in range(6)}
+        assert progress[-1] == (6, 6)
+        assert all(len(_read(r.output_path)) == 300 * 16 for r in requests)
+
+
+def test_training_export_numbers_clips_contiguously(tmp_path):
+    db = CorrectionDatabase(db_path=tmp_path / "corrections.db")
+    broken = tmp_path / "broken.wav"
+    broken.write_bytes(b"not audio")
+    source = tmp_path / "source.wav"
+    samples = _ramp_wav(source, 3.0)
+    for path, text in ((broken, "first"), (source, "second")):
+        db.record_correction(
+            source_media_path=str(path),
+            time_start_ms=1000,
+            time_end_ms=1500,
+            original_text="wrong",
+            corrected_text=text,
+        )
+
+    exported, skipped, warnings = db.export_training_dataset(tmp_path / "export")
+
+    assert (exported, skipped) == (1, 1)
+    assert any("extraction failed" in w for w in warnings)
+    assert sorted(p.name for p in (tmp_path / "export").glob("*.wav")) == ["clip_00000.wav"]
+    np.testing.assert_array_equal(_read(tmp_path / "export" / "clip_00000.wav"), samples[16000:24000])
+    assert "clip_00000.wav,second" in (tmp_path / "export" / "metadata.csv").read_text(encoding="utf-8")
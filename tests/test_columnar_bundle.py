@@ -0,0 +1,147 @@
+"""Tests for columnar (.avbundle) subtitle bundles."""
+import json
+
+import pytest
+
+from audio_visualizer.caption.core.subtitle import SubtitleFile
+from audio_visualizer.srt.io.bundleReader import normalize_bundle, read_bundle, read_json_bundle
+from audio_visualizer.srt.io.columnarBundle import (
+    ColumnarBundle,
+    convert_columnar_to_json,
+    convert_json_to_columnar,
+    write_columnar_bundle,
+)
+from audio_visualizer.ui.tabs.srtEdit.document import SubtitleDocument
+from audio_visualizer.ui.tabs.srtEdit.parser import is_bundle_file
+
+
+def _raw_bundle(subtitle_count: int = 3) -> dict:
+    subtitles = []
+    for i in range(subtitle_count):
+        sub_id = f"sub-{i}"
+        words = [
+            {
+                "id": f"w-{i}-{j}",
+                "subtitle_id": sub_id,
+                "text": ["héllo", "wörld", "日本"][j],
+                "start": i * 3 + j * 0.7,
+                "end": i * 3 + j * 0.7 + 0.5,
+                "confidence": 0.5 + j / 10,
+                "speaker_label": "SPEAKER_00" if i % 2 == 0 else None,
+            }
+            for j in range(3 if i != 1 else 0)
+        ]
+        subtitles.append({
+            "id": sub_id,
+            "start": i * 3.0,
+            "end": i * 3.0 + 2.5,
+            "text": f"line {i}",
+            "original_text": f"orig {i}",
+            "words": words,
+            "speaker_label": "Speaker 1" if i % 2 == 0 else None,
+            "source_media_path": "talk.mp3",
+            "model_name": "large-v3",
+            "device": "cuda",
+            "compute_type": "float16",
+            "alignment_status": "aligned" if i == 2 else None,
+            "alignment_confidence": 0.75 if i == 2 else None,
+        })
+    return {
+        "tool_version": "0.7.0",
+        "input_file": "talk.mp3",
+        "device_used": "cuda",
+        "compute_type_used": "float16",
+        "model_name": "large-v3",
+        "config": {"formatting": {"max_chars": 42}},
+        "subtitles": subtitles,
+    }
+
+
+@pytest.fixture
+def bundle_paths(tmp_path):
+    json_path = tmp_path / "talk.bundle.json"
+    json_path.write_text(json.dumps(_raw_bundle()), encoding="utf-8")
+    columnar_path = tmp_path / "talk.avbundle"
+    convert_json_to_columnar(json_path, columnar_path)
+    return json_path, columnar_path
+
+
+class TestRoundTrip:
+    def test_columnar_matches_normalized_json(self, bundle_paths):
+        json_path, columnar_path = bundle_paths
+        bundle = read_bundle(columnar_path)
+        assert isinstance(bundle, ColumnarBundle)
+        assert bundle.to_dict() == read_json_bundle(json_path)
+
+    def test_json_round_trip(self, bundle_paths, tmp_path):
+        json_path, columnar_path = bundle_paths
+        back = tmp_path / "back.json"
+        convert_columnar_to_json(columnar_path, back)
+        assert read_json_bundle(back) == read_json_bundle(json_path)
+
+    def test_nulls_and_foreign_subtitle_ids(self, tmp_path):
+        raw = _raw_bundle(2)
+        raw["subtitles"][0]["original_text"] = None
+        raw["subtitles"][0]["words"][1]["subtitle_id"] = "elsewhere"
+        raw["subtitles"][0]["words"][2]["id"] = None
+        bundle = normalize_bundle(raw)
+        write_columnar_bundle(bundle, tmp_path / "x.avbundle")
+        assert ColumnarBundle(tmp_path / "x.avbundle").to_dict() == bundle
+
+    def test_empty_bundle(self, tmp_path):
+        write_columnar_bundle(normalize_bundle({}), tmp_path / "empty.avbundle")
+        bundle = ColumnarBundle(tmp_path / "empty.avbundle")
+        assert list(bundle["subtitles"]) == [] and list(bundle["words"]) == []
+        assert bundle["config"] is None
+
+
+class TestLazyAccess:
+    def test_words_are_shared_with_subtitles(self, bundle_paths):
+        bundle = read_bundle(bundle_paths[1])
+        assert len(bundle["words"]) == 6
+        last = bundle["words"][-1]
+        assert last is bundle["subtitles"][2]["words"][-1]
+        assert (last.text, last.subtitle_id, last.speaker_label) == ("日本", "sub-2", "SPEAKER_00")
+        assert bundle["subtitles"][1]["words"] == []
+        with pytest.raises(IndexError):
+            bundle["subtitles"][3]
+
+    def test_columns(self, bundle_paths):
+        bundle = read_bundle(bundle_paths[1])
+        assert bundle.subtitle_starts.tolist() == [0.0, 3.0, 6.0]
+        assert bundle.word_offsets.tolist() == [0, 3, 3, 6]
+        assert bundle.word_timing(2)[0] == {"start": 6.0, "end": 6.5, "text": "héllo"}
+
+    def test_detected_by_content(self, bundle_paths, tmp_path):
+        renamed = tmp_path / "renamed.json"
+        renamed.write_bytes(bundle_paths[1].read_bytes())
+        assert isinstance(read_bundle(renamed), ColumnarBundle)
+        assert is_bundle_file(str(bundle_paths[1]))
+
+    def test_rejects_corrupt_files(self, bundle_paths, tmp_path):
+        truncated = tmp_path / "truncated.avbundle"
+        truncated.write_bytes(bundle_paths[1].read_bytes()[:200])
+        with pytest.raises(ValueError):
+            ColumnarBundle(truncated)
+        with pytest.raises(ValueError):
+            ColumnarBundle(bundle_paths[0])
+
+
+class TestConsumers:
+    def test_subtitle_file_load(self, bundle_paths):
+        from_json = SubtitleFile.load(bundle_paths[0])
+        from_columnar = SubtitleFile.load(bundle_paths[1])
+        assert [e.text for e in from_columnar.subs.events] == [e.text for e in from_json.subs.events]
+        assert from_columnar._word_timing == from_json._word_timing
+        assert from_columnar.get_word_timing(1) is None
+
+    def test_document_load_and_save(self, bundle_paths, tmp_path):
+        doc = SubtitleDocument()
+        doc.load_bundle(str(bundle_paths[1]))
+        assert [e.speaker for e in doc.entries] == ["Speaker 1", None, "Speaker 1"]
+        assert doc.entries[0].words[0].text == "héllo"
+
+        doc.save_bundle(str(tmp_path / "saved.avbundle"))
+        saved = read_bundle(tmp_path / "saved.avbundle")
+        assert isinstance(saved, ColumnarBundle)
+        assert saved["subtitles"][2]["words"] == doc.entries[2].words
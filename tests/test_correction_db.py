@@ -1,9 +1,12 @@
 """Tests for the correction database (CorrectionDatabase)."""
 from __future__ import annotations
 
+import sqlite3
+import threading
+
 import pytest
 
-from audio_visualizer.core.correctionDb import CorrectionDatabase
+from audio_visualizer.core.correctionDb import _SCHEMA_SQL, CorrectionDatabase
 
 
 @pytest.fixture
@@ -43,6 +46,42 @@ class TestSchema:
         db2 = CorrectionDatabase(db_path=path)
         assert db2.prompt_term_count() == 1
 
+    def test_migration_drops_duplicates_and_adds_unique_indexes(self, tmp_path):
+        path = tmp_path / "v1.db"
+        conn = sqlite3.connect(str(path))
+        conn.executescript(_SCHEMA_SQL)
+        conn.execute("INSERT INTO meta (key, value) VALUES ('schema_version', '1')")
+        for _ in range(2):
+            conn.execute(
+                "INSERT INTO corrections (source_media_path, time_start_ms, time_end_ms, "
+                "original_text, corrected_text, created_at) VALUES ('/a.wav', 0, 10, 'a', 'b', 'now')"
+            )
+            conn.execute(
+                "INSERT INTO replacement_rules (pattern, replacement, created_at) VALUES ('x', 'y', 'now')"
+            )
+        conn.commit()
+        conn.close()
+
+        db = CorrectionDatabase(db_path=path)
+
+        assert db.correction_count() == 1
+        assert db.replacement_rule_count() == 1
+        assert db.add_replacement_rule("x", "y") == -1
+
+    def test_connections_are_pooled_per_thread(self, db):
+        conn = db._connection()
+        assert db._connection() is conn
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(db._connection()))
+        thread.start()
+        thread.join()
+        assert other[0] is not conn
+
+        db.close()
+        assert db._connection() is not conn
+        assert db.correction_count() == 0
+
 
 # ------------------------------------------------------------------
 # Corrections CRUD
@@ -137,6 +176,37 @@ class TestCorrections:
         self._record(db)
         assert db.correction_count() == 1
 
+    def test_record_corrections_batch(self, db):
+        self._record(db, corrected_text="existing")
+        batch = [
+            dict(source_media_path="/a.wav", time_start_ms=i, time_end_ms=i + 10,
+                 original_text="a", corrected_text=f"b{i}")
+            for i in range(5)
+        ]
+        batch.append(dict(batch[0]))  # Duplicate within the batch
+        batch.append(dict(batch[1], corrected_text="a"))  # Unchanged text
+        batch.append(dict(
+            source_media_path="/media/audio.wav", time_start_ms=1000, time_end_ms=3000,
+            original_text="hello world", corrected_text="existing", speaker_label="SPEAKER_00",
+            model_name="large-v3", bundle_entry_id="entry-001",
+        ))  # Duplicate of an existing row
+
+        assert db.record_corrections(batch) == 5
+        assert db.correction_count() == 6
+        assert db.record_corrections(batch) == 0
+        assert db.record_corrections([]) == 0
+
+    def test_record_corrections_is_one_transaction(self, db):
+        batch = [
+            dict(source_media_path="/a.wav", time_start_ms=0, time_end_ms=10,
+                 original_text="a", corrected_text="b"),
+            dict(source_media_path="/a.wav", time_start_ms=None, time_end_ms=10,
+                 original_text="a", corrected_text="c"),
+        ]
+        with pytest.raises(sqlite3.IntegrityError):
+            db.record_corrections(batch)
+        assert db.correction_count() == 0
+
 
 # ------------------------------------------------------------------
 # Prompt terms CRUD
@@ -293,11 +363,74 @@ class TestReplacementRules:
         assert len(exported) == 1
         assert exported[0]["pattern"] == "x"
 
+    def test_identical_rule_not_added_twice(self, db):
+        assert db.add_replacement_rule("p", "r") > 0
+        assert db.add_replacement_rule("p", "r") == -1
+        assert db.add_replacement_rule("p", "r", speaker_label="A") > 0
+        assert db.replacement_rule_count() == 2
+
+    def test_add_replacement_rules_batch(self, db):
+        db.add_replacement_rule("gonna", "going to")
+        v0 = db.replacement_rules_version()
+
+        added = db.add_replacement_rules([
+            {"pattern": "gonna", "replacement": "going to"},
+            {"pattern": "wanna", "replacement": "want to", "speaker_label": "A"},
+            {"pattern": r"\bum+\b", "replacement": "", "is_regex": True, "source": "import"},
+        ])
+
+        assert added == 2
+        assert db.replacement_rules_version() > v0
+        regex = db.list_replacement_rules(filter_text="um")[0]
+        assert (regex["is_regex"], regex["source"]) == (1, "import")
+
     def test_replacement_rule_count(self, db):
         assert db.replacement_rule_count() == 0
         db.add_replacement_rule("p", "r")
         assert db.replacement_rule_count() == 1
 
+    def test_rules_version_changes_on_every_write(self, db):
+        v0 = db.replacement_rules_version()
+        rid = db.add_replacement_rule("p", "r")
+        v1 = db.replacement_rules_version()
+        db.update_replacement_rule(rid, replacement="s")
+        v2 = db.replacement_rules_version()
+        db.remove_replacement_rule(rid)
+        v3 = db.replacement_rules_version()
+        assert v0 < v1 < v2 < v3
+
+    def test_replacement_engine_is_cached_until_rules_change(self, db, tmp_path):
+        db.add_replacement_rule("gonna", "going to", speaker_label="Alice")
+        db.add_replacement_rule("um", "")
+
+        alice = db.get_replacement_engine("Alice")
+        assert alice.apply("um gonna") == " going to"
+        assert db.get_replacement_engine(None).apply("um gonna") == " gonna"
+        # Another instance on the same file shares the compiled rules
+        other = CorrectionDatabase(db_path=tmp_path / "test_corrections.db")
+        assert other.get_replacement_engine("Alice") is alice
+
+        other.add_replacement_rule("go", "GO", speaker_label="Alice")
+        refreshed = db.get_replacement_engine("Alice")
+        assert refreshed is not alice
+        assert refreshed.apply("gonna") == "GOnna"
+
+    def test_replacement_engine_caches_rules_with_their_version(self, db, tmp_path, monkeypatch):
+        db.add_replacement_rule("um", "")
+        other = CorrectionDatabase(db_path=tmp_path / "test_corrections.db")
+        check_version = db.replacement_rules_version
+
+        def edit_after_check():
+            version = check_version()
+            monkeypatch.setattr(db, "replacement_rules_version", check_version)
+            other.add_replacement_rule("uh", "")
+            return version
+
+        monkeypatch.setattr(db, "replacement_rules_version", edit_after_check)
+        engine = db.get_replacement_engine(None)
+        assert engine.apply("um uh") == " "
+        assert db.get_replacement_engine(None) is engine
+
 
 # ------------------------------------------------------------------
 # Training export
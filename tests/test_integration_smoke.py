@@ -8,6 +8,8 @@ import logging
 from pathlib import Path
 from types import SimpleNamespace
 
+import numpy as np
+
 from audio_visualizer.caption import RenderConfig, render_subtitle
 from audio_visualizer.events import (
     AppEvent,
@@ -17,6 +19,7 @@ from audio_visualizer.events import (
     LoggingBridge,
 )
 from audio_visualizer.srt import transcribe_file
+from audio_visualizer.srt.io.audioHelpers import DecodedAudio
 from audio_visualizer.srt.models import ResolvedConfig
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -44,10 +47,9 @@ def _patch_srt_pipeline(monkeypatch) -> None:
     monkeypatch.setattr(pipeline_module, "ffmpeg_ok", lambda: True)
     monkeypatch.setattr(
         pipeline_module,
-        "to_wav_16k_mono",
-        lambda _input_path, output_path: Path(output_path).write_bytes(b"RIFFFAKEWAVE"),
+        "decode_audio_16k_mono",
+        lambda _input_path: DecodedAudio(samples=np.zeros(16000, dtype=np.float32)),
     )
-    monkeypatch.setattr(pipeline_module, "probe_duration_seconds", lambda _path: 1.0)
     monkeypatch.setattr(pipeline_module, "detect_silences", lambda *_args, **_kwargs: [])
 
 
@@ -0,0 +1,156 @@
+"""Tests for the precomputed LoRA training feature cache."""
+from __future__ import annotations
+
+import dataclasses
+import pickle
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from audio_visualizer.core.clipExport import write_wav
+from audio_visualizer.srt.training.featureCache import (
+    CachedFeatureDataset,
+    FeatureShard,
+    compute_features,
+    feature_config_key,
+    precompute_features,
+)
+from audio_visualizer.srt.training.loraTrainer import (
+    _dataloader_arguments,
+    _load_audio_file,
+    _load_training_dataset,
+)
+
+
+class _Extractor:
+    """Whisper-like extractor: frame log-energies, padded to 30 s."""
+
+    calls = 0
+
+    def __init__(self, n_mels: int = 8, hop_length: int = 160):
+        self.n_mels = n_mels
+        self.hop_length = hop_length
+        self.mel_filters = np.ones((n_mels, 4))
+
+    def to_dict(self):
+        return {"feature_size": self.n_mels, "hop_length": self.hop_length, "mel_filters": self.mel_filters}
+
+    def __call__(self, audio, sampling_rate, return_tensors):
+        type(self).calls += 1
+        padded = np.zeros(30 * sampling_rate, dtype=np.float32)
+        padded[:len(audio)] = audio[:len(padded)]
+        energy = (padded.reshape(-1, self.hop_length) ** 2).mean(axis=1)
+        weights = np.linspace(0.5, 2.0, self.n_mels)[:, None]
+        features = np.log10(np.maximum(energy[None, :] * weights, 1e-10))
+        return SimpleNamespace(input_features=features[None])
+
+
+def _clips(directory: Path, count: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    paths = []
+    for i in range(count):
+        samples = (rng.standard_normal(int(16000 * rng.uniform(0.3, 2.0))) * 3000).astype("<i2")
+        path = directory / f"clip_{i:05d}.wav"
+        write_wav(path, samples.tobytes(), 16000, 1, 2)
+        paths.append(str(path))
+    return paths
+
+
+class TestPrecompute:
+    def test_cached_features_match_and_are_reused(self, tmp_path):
+        paths = _clips(tmp_path, 5)
+        paths.append(paths[0])  # Duplicate clip, computed once
+        extractor = _Extractor()
+        _Extractor.calls = 0
+
+        shard, keys = precompute_features(paths, extractor, tmp_path / "cache", load_audio=_load_audio_file, workers=1)
+
+        assert _Extractor.calls == 5 and len(shard) == 5 and keys[0] == keys[-1]
+        for path, key in zip(paths, keys):
+            np.testing.assert_array_equal(shard.get(key), compute_features(extractor, _load_audio_file(path)))
+        data_bytes = (shard.directory / "features.f32").stat().st_size
+        assert data_bytes < 5 * 8 * 3000 * 4 / 5  # Padding tail not stored
+
+        progress = []
+        _Extractor.calls = 0
+        again, _ = precompute_features(
+            paths, extractor, tmp_path / "cache", load_audio=_load_audio_file,
+            progress_callback=lambda done, total, _msg: progress.append((done, total)),
+        )
+        assert _Extractor.calls == 0 and progress == [(6, 6)]
+        np.testing.assert_array_equal(again.get(keys[2]), shard.get(keys[2]))
+
+    def test_process_pool(self, tmp_path):
+        paths = _clips(tmp_path, 40)
+        extractor = _Extractor()
+        shard, keys = precompute_features(paths, extractor, tmp_path / "cache", load_audio=_load_audio_file, workers=2)
+        reopened = FeatureShard(shard.directory)
+        for path, key in zip(paths[::7], keys[::7]):
+            np.testing.assert_array_equal(reopened.get(key), compute_features(extractor, _load_audio_file(path)))
+
+    def test_config_selects_shard(self, tmp_path):
+        assert feature_config_key(_Extractor()) == feature_config_key(SimpleNamespace(feature_extractor=_Extractor()))
+        assert feature_config_key(_Extractor()) != feature_config_key(_Extractor(n_mels=4))
+
+    def test_cancel(self, tmp_path):
+        flag = SimpleNamespace(is_set=lambda: True)
+        with pytest.raises(RuntimeError, match="cancelled"):
+            precompute_features(
+                _clips(tmp_path, 2), _Extractor(), tmp_path / "cache",
+                load_audio=_load_audio_file, workers=1, cancel_flag=flag,
+            )
+
+
+class TestDataset:
+    def test_shard_pickles_without_its_map(self, tmp_path):
+        shard, keys = precompute_features(
+            _clips(tmp_path, 2), _Extractor(), tmp_path / "cache", load_audio=_load_audio_file, workers=1
+        )
+        expected = shard.get(keys[1])
+        clone = pickle.loads(pickle.dumps(shard))
+        assert clone._data is None
+        np.testing.assert_array_equal(clone.get(keys[1]), expected)
+
+    def test_load_training_dataset(self, tmp_path):
+        _clips(tmp_path, 3)
+        (tmp_path / "metadata.csv").write_text(
+            "file_name,text\nclip_00000.wav,hello\nclip_00001.wav,there\nmissing.wav,skip\nclip_00002.wav,you\n",
+            encoding="utf-8",
+        )
+        tokenized = []
+        processor = SimpleNamespace(
+            feature_extractor=_Extractor(),
+            tokenizer=lambda text: tokenized.append(text) or SimpleNamespace(input_ids=[1, len(text), 2]),
+        )
+
+        dataset = _load_training_dataset(tmp_path, processor, None, workers=1)
+
+        assert isinstance(dataset, CachedFeatureDataset) and len(dataset) == 3
+        assert tokenized == ["hello", "there", "you"]
+        assert dataset.labels[1] == [1, 5, 2]
+        assert (tmp_path / ".feature_cache").is_dir()
+
+        torch = pytest.importorskip("torch")
+        item = dataset[0]
+        assert item["input_features"].shape == (8, 3000) and item["labels"].dtype == torch.long
+
+
+def test_dataloader_arguments():
+    @dataclasses.dataclass
+    class OldArgs:
+        dataloader_num_workers: int = 0
+
+    @dataclasses.dataclass
+    class NewArgs(OldArgs):
+        dataloader_prefetch_factor: int = 2
+        dataloader_persistent_workers: bool = False
+
+    assert _dataloader_arguments(OldArgs, 2) == {"dataloader_num_workers": 2}
+    assert _dataloader_arguments(NewArgs, 2) == {
+        "dataloader_num_workers": 2,
+        "dataloader_prefetch_factor": 4,
+        "dataloader_persistent_workers": True,
+    }
+    assert _dataloader_arguments(NewArgs, 0) == {"dataloader_num_workers": 0}
@@ -537,6 +537,17 @@ class TestPerSpeakerReplacement:
         assert _apply_rules_to_text("I'm gonna do it", rules) == "I'm going to do it"
         assert _apply_rules_to_text("I wanna go", rules) == "I want to go"
 
+    def test_apply_rules_reuses_compiled_engine(self):
+        from audio_visualizer.core.replacementRules import ReplacementRuleEngine
+        from audio_visualizer.srt.core.pipeline import _apply_rules_to_text, _cached_rule_engine
+
+        rules = [{"pattern": "gonna", "replacement": "going to", "is_regex": False}]
+        _apply_rules_to_text("gonna", rules)
+        hits = _cached_rule_engine.cache_info().hits
+        assert _apply_rules_to_text("gonna go", [dict(r) for r in rules]) == "going to go"
+        assert _cached_rule_engine.cache_info().hits == hits + 1
+        assert _apply_rules_to_text("gonna", ReplacementRuleEngine(rules)) == "going to"
+
     def test_apply_regex_rules(self):
         from audio_visualizer.srt.core.pipeline import _apply_rules_to_text
 
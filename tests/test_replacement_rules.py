@@ -0,0 +1,87 @@
+"""Tests for the compiled replacement-rule engine."""
+import random
+import re
+
+from audio_visualizer.core.replacementRules import ReplacementRuleEngine
+
+
+def _sequential(text, rules):
+    """Rule-by-rule reference (the pre-engine implementation)."""
+    for rule in rules:
+        pattern = rule.get("pattern", "")
+        if not pattern:
+            continue
+        if rule.get("is_regex"):
+            try:
+                text = re.sub(pattern, rule.get("replacement", ""), text)
+            except re.error:
+                pass
+        else:
+            text = text.replace(pattern, rule.get("replacement", ""))
+    return text
+
+
+def _rule(pattern, replacement, is_regex=False):
+    return {"pattern": pattern, "replacement": replacement, "is_regex": is_regex}
+
+
+class TestReplacementRuleEngine:
+    def test_literal_and_regex_rules(self):
+        engine = ReplacementRuleEngine([
+            _rule("gonna", "going to"),
+            _rule(r"\bum+\b", "", is_regex=True),
+        ])
+        assert engine.apply("umm I'm gonna go") == " I'm going to go"
+        assert len(engine) == 2
+
+    def test_rules_see_output_of_earlier_rules(self):
+        engine = ReplacementRuleEngine([_rule("a", "b"), _rule("b", "c")])
+        assert engine.apply("a") == "c"
+        # Reverse order: "b -> c" runs before "a" becomes "b"
+        assert ReplacementRuleEngine([_rule("b", "c"), _rule("a", "b")]).apply("ab") == "bc"
+
+    def test_overlapping_and_nested_patterns(self):
+        rules = [_rule("she", "X"), _rule("he", "Y"), _rule("hers", "Z"), _rule("his", "W")]
+        for text in ("ushers", "she sells his hers", "hhe"):
+            assert ReplacementRuleEngine(rules).apply(text) == _sequential(text, rules)
+
+    def test_invalid_and_empty_rules_are_skipped(self):
+        engine = ReplacementRuleEngine([
+            _rule("[invalid", "", is_regex=True),
+            _rule("", "x"),
+            _rule(r"(a)", r"\2", is_regex=True),  # bad group reference
+        ])
+        assert len(engine) == 1
+        assert engine.apply("test a") == "test a"
+
+    def test_regex_can_match_empty_text(self):
+        engine = ReplacementRuleEngine([_rule("^$", "(blank)", is_regex=True)])
+        assert engine.apply("") == "(blank)"
+
+    def test_regex_prefilter_keeps_backreference_rules(self):
+        rules = [
+            _rule(r"(\w+) \1", r"\1", is_regex=True),
+            _rule(r"(?i)hello", "hi", is_regex=True),
+            _rule(r"\bum\b", "", is_regex=True),
+            _rule(r"(?P<w>x)y", r"\g<w>", is_regex=True),
+        ]
+        engine = ReplacementRuleEngine(rules)
+        for text in ("the the cat", "HELLO there", "um what", "xy", "nothing here"):
+            assert engine.apply(text) == _sequential(text, rules)
+
+    def test_matches_sequential_application(self):
+        rng = random.Random(9)
+        alphabet = "abcde "
+        for _ in range(200):
+            rules = []
+            for _ in range(rng.randint(1, 12)):
+                pattern = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 3)))
+                replacement = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 3)))
+                if rng.random() < 0.2:
+                    rules.append(_rule(re.escape(pattern) + "+", replacement, is_regex=True))
+                else:
+                    rules.append(_rule(pattern, replacement))
+            engine = ReplacementRuleEngine(rules)
+            for _ in range(5):
+                text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+                assert engine.apply(text) == _sequential(text, rules)
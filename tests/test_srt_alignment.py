@@ -10,6 +10,7 @@ from audio_visualizer.srt.core.alignment import (
     align_cues_to_whisper_words,
     align_script_to_segments,
     _align_cue_words_to_whisper_span,
+    _align_word_sequences,
 )
 from audio_visualizer.srt.models import SubtitleBlock, WordItem
 
@@ -267,6 +268,61 @@ class TestAlignCuesToWhisperWords:
         assert result[0].alignment_status == "estimated"
 
 
+class TestAnchorAlignment:
+    def test_word_sequences_map_matches_and_substitutions(self):
+        cue = ["the", "quick", "brown", "fox", "jumps"]
+        whisper = ["uh", "the", "quick", "crown", "fox", "jumps", "over"]
+        assert _align_word_sequences(cue, whisper) == [1, 2, 3, 4, 5]
+
+    def test_repeated_words_without_unique_anchors(self):
+        """Sequences of identical words fall back to banded alignment."""
+        cues = [
+            SubtitleBlock(start=0.0, end=1.5, lines=["la la la"]),
+            SubtitleBlock(start=1.5, end=3.0, lines=["la la la"]),
+        ]
+        whisper = [WordItem(i * 0.5, i * 0.5 + 0.4, "la") for i in range(6)]
+        result = align_cues_to_whisper_words(cues, whisper)
+
+        starts = [w.start for cue in result for w in cue.words]
+        assert starts == [0.0, 0.5, 1.0, 1.5, 2.0, 2.5]
+        assert all(cue.alignment_status == "matched" for cue in result)
+
+    def test_substituted_word_takes_whisper_timing(self):
+        cues = [SubtitleBlock(start=0.0, end=1.5, lines=["Hello brave world"])]
+        whisper = [
+            WordItem(0.0, 0.4, "Hello"),
+            WordItem(0.5, 0.9, "grave"),
+            WordItem(1.0, 1.4, "world"),
+        ]
+        result = align_cues_to_whisper_words(cues, whisper)
+
+        assert [w.start for w in result[0].words] == [0.0, 0.5, 1.0]
+        assert result[0].words[1].text == "brave"
+        assert result[0].alignment_status == "partial"
+
+    def test_long_transcript_keeps_cues_in_order(self):
+        """Cues that drop, add or change words still align across a long transcript."""
+        vocab = [f"w{i}" for i in range(40)]
+        whisper = [WordItem(i * 0.5, i * 0.5 + 0.4, vocab[(i * 7) % 40]) for i in range(3000)]
+        cues = []
+        for c in range(0, 3000, 6):
+            tokens = [w.text for w in whisper[c:c + 6]]
+            if c % 60 == 0:
+                tokens[2] = "extra"
+            if c % 90 == 0:
+                del tokens[4]
+            cues.append(SubtitleBlock(start=whisper[c].start, end=whisper[c + 5].end, lines=[" ".join(tokens)]))
+
+        result = align_cues_to_whisper_words(cues, whisper)
+
+        assert len(result) == len(cues)
+        starts = [w.start for cue in result for w in cue.words]
+        assert starts == sorted(starts)
+        for c, cue in zip(range(0, 3000, 6), result):
+            assert cue.words[0].start == whisper[c].start
+            assert cue.alignment_status in {"matched", "partial"}
+
+
 class TestAlignCueWordsToWhisperSpan:
     def test_exact_tokens(self):
         """When tokens match exactly, timing comes from Whisper."""
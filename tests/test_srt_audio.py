@@ -1,14 +1,34 @@
 """Tests for the srt.io.audioHelpers module."""
 import subprocess
+import wave
+from pathlib import Path
+
+import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock
 from audio_visualizer.srt.io.audioHelpers import (
     _SILENCE_START_RE,
     _SILENCE_END_RE,
+    DecodedAudio,
+    decode_audio_16k_mono,
     detect_silences,
+    detect_silences_ffmpeg,
     to_wav_16k_mono,
 )
 
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURE_AUDIO = ROOT / "tests" / "fixtures" / "srt" / "audio" / "single_sentence.wav"
+
+
+def _write_stereo_wav(path, left, right, rate=44100):
+    pcm = np.stack([left, right], axis=1)
+    pcm = (np.clip(pcm, -1.0, 1.0) * 32767).astype("<i2")
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(rate)
+        wav_file.writeframes(pcm.tobytes())
+
 
 class TestSilenceRegex:
     """Tests for silence detection regex patterns."""
@@ -34,15 +54,15 @@ class TestSilenceRegex:
         assert _SILENCE_END_RE.search(line) is None
 
 
-class TestDetectSilences:
-    """Tests for detect_silences function."""
+class TestDetectSilencesFfmpeg:
+    """Tests for detect_silences_ffmpeg function."""
 
     @patch('audio_visualizer.srt.io.audioHelpers.ffmpeg_ok')
     def test_detect_silences_ffmpeg_not_available(self, mock_ffmpeg_ok):
         """Test detect_silences when ffmpeg is not available."""
         mock_ffmpeg_ok.return_value = False
 
-        result = detect_silences("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
+        result = detect_silences_ffmpeg("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
 
         assert result == []
 
@@ -53,7 +73,7 @@ class TestDetectSilences:
         mock_ffmpeg_ok.return_value = True
         mock_run_cmd.return_value = (1, "", "error")
 
-        result = detect_silences("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
+        result = detect_silences_ffmpeg("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
 
         assert result == []
 
@@ -65,7 +85,7 @@ class TestDetectSilences:
         stderr = "silence_start: 1.0\nsilence_end: 2.0\n"
         mock_run_cmd.return_value = (0, "", stderr)
 
-        result = detect_silences("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
+        result = detect_silences_ffmpeg("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
 
         assert len(result) == 1
         assert result[0] == (1.0, 2.0)
@@ -81,7 +101,7 @@ class TestDetectSilences:
         )
         mock_run_cmd.return_value = (0, "", stderr)
 
-        result = detect_silences("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
+        result = detect_silences_ffmpeg("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
 
         assert len(result) == 2
         assert result[0] == (1.0, 2.0)
@@ -97,7 +117,7 @@ class TestDetectSilences:
         stderr = "silence_start: 8.0\n"  # No end
         mock_run_cmd.return_value = (0, "", stderr)
 
-        result = detect_silences("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
+        result = detect_silences_ffmpeg("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
 
         # Should extend to file duration
         assert len(result) == 1
@@ -115,7 +135,7 @@ class TestDetectSilences:
         )
         mock_run_cmd.return_value = (0, "", stderr)
 
-        result = detect_silences("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
+        result = detect_silences_ffmpeg("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
 
         # Should be merged into one silence period
         assert len(result) == 1
@@ -133,7 +153,7 @@ class TestDetectSilences:
         )
         mock_run_cmd.return_value = (0, "", stderr)
 
-        result = detect_silences("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
+        result = detect_silences_ffmpeg("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
 
         # Should be sorted
         assert result[0][0] < result[1][0]
@@ -146,7 +166,7 @@ class TestDetectSilences:
         stderr = "silence_start: 2.0\nsilence_end: 2.0\n"  # Zero duration
         mock_run_cmd.return_value = (0, "", stderr)
 
-        result = detect_silences("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
+        result = detect_silences_ffmpeg("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
 
         # Zero duration silence should be filtered out
         assert len(result) == 0
@@ -158,7 +178,7 @@ class TestDetectSilences:
         mock_ffmpeg_ok.return_value = True
         mock_run_cmd.return_value = (0, "", "")
 
-        result = detect_silences("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
+        result = detect_silences_ffmpeg("test.wav", min_silence_dur=0.5, silence_threshold_db=-35.0)
 
         assert result == []
 
@@ -260,3 +280,120 @@ class TestToWav16kMono:
         # Check for loglevel error
         assert "-loglevel" in args
         assert "error" in args
+
+
+class TestDecodeAudio16kMono:
+    """Tests for the in-memory PyAV decoder."""
+
+    def test_decodes_fixture_to_float32_16k(self):
+        """A 16 kHz mono WAV decodes to the same samples, as float32."""
+        audio = decode_audio_16k_mono(str(FIXTURE_AUDIO))
+
+        with wave.open(str(FIXTURE_AUDIO), "rb") as wav_file:
+            expected = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype="<i2")
+        expected = expected.astype(np.float32) / 32768.0
+
+        assert audio.sample_rate == 16000
+        assert audio.samples.dtype == np.float32
+        assert audio.samples.ndim == 1
+        assert len(audio.samples) == len(expected)
+        assert np.allclose(audio.samples, expected, atol=1e-4)
+
+    def test_resamples_and_averages_stereo(self, tmp_path):
+        """Stereo input is resampled to 16 kHz and downmixed by averaging."""
+        rate = 44100
+        t = np.arange(rate * 2) / rate
+        tone = 0.5 * np.sin(2 * np.pi * 220 * t)
+        path = tmp_path / "stereo.wav"
+        _write_stereo_wav(path, tone, np.zeros_like(tone), rate=rate)
+
+        audio = decode_audio_16k_mono(str(path))
+
+        assert audio.duration == pytest.approx(2.0, abs=0.01)
+        # Averaging one silent channel halves the peak amplitude
+        assert np.abs(audio.samples).max() == pytest.approx(0.25, abs=0.01)
+
+    def test_missing_file_raises(self, tmp_path):
+        """Unreadable input raises RuntimeError."""
+        with pytest.raises(RuntimeError):
+            decode_audio_16k_mono(str(tmp_path / "missing.wav"))
+
+
+class TestDecodedAudio:
+    """Tests for the DecodedAudio buffer."""
+
+    def test_duration(self):
+        """Duration is derived from the sample count."""
+        audio = DecodedAudio(samples=np.zeros(24000, dtype=np.float32))
+        assert audio.duration == 1.5
+
+    def test_write_wav_round_trip(self, tmp_path):
+        """write_wav produces a 16-bit mono WAV that decodes back."""
+        samples = (0.3 * np.sin(np.linspace(0, 200, 8000))).astype(np.float32)
+        path = tmp_path / "out.wav"
+
+        DecodedAudio(samples=samples).write_wav(str(path))
+
+        with wave.open(str(path), "rb") as wav_file:
+            assert wav_file.getnchannels() == 1
+            assert wav_file.getsampwidth() == 2
+            assert wav_file.getframerate() == 16000
+            assert wav_file.getnframes() == len(samples)
+        assert np.allclose(decode_audio_16k_mono(str(path)).samples, samples, atol=1e-4)
+
+
+class TestDetectSilencesFfmpegInMemory:
+    """Tests for detect_silences_ffmpeg with decoded audio."""
+
+    @patch('audio_visualizer.srt.io.audioHelpers.ffmpeg_ok', return_value=True)
+    @patch('audio_visualizer.srt.io.audioHelpers.probe_duration_seconds')
+    @patch('audio_visualizer.srt.io.audioHelpers.subprocess.run')
+    def test_pipes_raw_pcm_and_uses_buffer_duration(self, mock_run, mock_probe, _mock_ok):
+        """Decoded audio is piped to ffmpeg; open silences end at the buffer's end."""
+        mock_run.return_value = MagicMock(returncode=0, stderr=b"silence_start: 2.5\n")
+        audio = DecodedAudio(samples=np.zeros(16000 * 4, dtype=np.float32))
+
+        result = detect_silences_ffmpeg(audio, min_silence_dur=0.5, silence_threshold_db=-35.0)
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("-i") + 1] == "pipe:0"
+        assert cmd[cmd.index("-f") + 1] == "f32le"
+        assert mock_run.call_args[1]["input"] == audio.samples.tobytes()
+        mock_probe.assert_not_called()
+        assert result == [(2.5, 4.0)]
+
+
+class TestDetectSilences:
+    """Tests for the native detect_silences."""
+
+    def _gap_audio(self):
+        rate = 16000
+        tone = 0.4 * np.sin(2 * np.pi * 300 * np.arange(rate) / rate)
+        samples = np.concatenate([tone, np.zeros(rate), tone]).astype(np.float32)
+        return DecodedAudio(samples=samples)
+
+    @patch('audio_visualizer.srt.io.audioHelpers.subprocess.run')
+    def test_decoded_audio_needs_no_subprocess(self, mock_run):
+        """Decoded audio is analysed in process."""
+        result = detect_silences(self._gap_audio(), min_silence_dur=0.5, silence_threshold_db=-35.0)
+
+        mock_run.assert_not_called()
+        assert len(result) == 1
+        assert result[0] == pytest.approx((1.0, 2.0), abs=0.011)
+
+    def test_path_is_streamed_from_file(self, tmp_path):
+        """A path gives the same intervals as its decoded samples."""
+        audio = self._gap_audio()
+        wav_path = tmp_path / "gap.wav"
+        audio.write_wav(str(wav_path))
+
+        from_file = detect_silences(str(wav_path), min_silence_dur=0.5, silence_threshold_db=-35.0)
+
+        assert from_file == detect_silences(audio, min_silence_dur=0.5, silence_threshold_db=-35.0)
+
+    def test_undecodable_path_returns_empty(self, tmp_path):
+        """Files that cannot be decoded yield no silences."""
+        path = tmp_path / "broken.wav"
+        path.write_bytes(b"not audio")
+
+        assert detect_silences(str(path), min_silence_dur=0.5, silence_threshold_db=-35.0) == []
@@ -0,0 +1,143 @@
+"""Tests for the staged multi-file batch runner."""
+
+import threading
+import time
+
+from audio_visualizer.srt.core.batchPipeline import run_staged_batch
+
+
+def _on_error(job, exc):
+    return ("error", job, str(exc))
+
+
+class TestRunStagedBatch:
+    def test_results_are_in_job_order(self):
+        finished = []
+        outcome = run_staged_batch(
+            [3, 1, 2],
+            prefetch=lambda job: job * 10,
+            infer=lambda idx, job, prepared: (lambda: (idx, prepared)),
+            on_error=_on_error,
+            on_finished=lambda idx, result: finished.append(idx),
+        )
+
+        assert outcome.results == [(0, 30), (1, 10), (2, 20)]
+        assert outcome.canceled is False
+        assert outcome.completed == 3
+        assert finished == [0, 1, 2]
+
+    def test_empty_batch(self):
+        outcome = run_staged_batch([], prefetch=lambda j: j, infer=lambda i, j, p: (lambda: j), on_error=_on_error)
+        assert outcome.results == []
+        assert outcome.canceled is False
+
+    def test_next_input_is_prefetched_during_inference(self):
+        prefetched = {0: threading.Event(), 1: threading.Event()}
+        overlapped = []
+
+        def prefetch(job):
+            prefetched[job].set()
+            return job
+
+        def infer(idx, job, prepared):
+            if idx == 0:
+                overlapped.append(prefetched[1].wait(timeout=5))
+            return lambda: job
+
+        outcome = run_staged_batch([0, 1], prefetch=prefetch, infer=infer, on_error=_on_error)
+
+        assert outcome.results == [0, 1]
+        assert overlapped == [True]
+
+    def test_prefetch_window_is_bounded(self):
+        in_flight = []
+        lock = threading.Lock()
+        max_seen = [0]
+
+        def prefetch(job):
+            with lock:
+                in_flight.append(job)
+                max_seen[0] = max(max_seen[0], len(in_flight))
+            return job
+
+        def infer(idx, job, prepared):
+            with lock:
+                in_flight.remove(job)
+            return lambda: job
+
+        outcome = run_staged_batch(
+            list(range(8)), prefetch=prefetch, infer=infer, on_error=_on_error, max_prefetched=2,
+        )
+
+        assert outcome.results == list(range(8))
+        # Two queued ahead plus the one being transcribed
+        assert max_seen[0] <= 3
+
+    def test_errors_are_isolated_per_stage(self):
+        def prefetch(job):
+            if job == "bad-decode":
+                raise ValueError("decode")
+            return job
+
+        def infer(idx, job, prepared):
+            if job == "bad-infer":
+                raise RuntimeError("infer")
+            if job == "bad-finish":
+                return lambda: 1 / 0
+            return lambda: job
+
+        outcome = run_staged_batch(
+            ["ok", "bad-decode", "bad-infer", "bad-finish", "last"],
+            prefetch=prefetch,
+            infer=infer,
+            on_error=_on_error,
+        )
+
+        assert outcome.results[0] == "ok"
+        assert outcome.results[1] == ("error", "bad-decode", "decode")
+        assert outcome.results[2] == ("error", "bad-infer", "infer")
+        assert outcome.results[3][:2] == ("error", "bad-finish")
+        assert outcome.results[4] == "last"
+
+    def test_cancel_stops_before_next_inference_but_finishes_inferred_jobs(self):
+        cancel = threading.Event()
+        inferred = []
+
+        def infer(idx, job, prepared):
+            inferred.append(job)
+            if idx == 1:
+                cancel.set()
+
+            def finish():
+                time.sleep(0.01)
+                return job
+
+            return finish
+
+        outcome = run_staged_batch(
+            ["a", "b", "c", "d"], prefetch=lambda j: j, infer=infer, on_error=_on_error, cancel_event=cancel,
+        )
+
+        assert outcome.canceled is True
+        assert inferred == ["a", "b"]
+        assert outcome.results == ["a", "b"]
+
+    def test_cancel_while_waiting_for_prefetch(self):
+        cancel = threading.Event()
+        release = threading.Event()
+
+        def prefetch(job):
+            if job == 1:
+                release.wait(timeout=5)
+            return job
+
+        def infer(idx, job, prepared):
+            if idx == 0:
+                threading.Timer(0.05, cancel.set).start()
+                threading.Timer(0.5, release.set).start()
+            return lambda: job
+
+        outcome = run_staged_batch([0, 1], prefetch=prefetch, infer=infer, on_error=_on_error, cancel_event=cancel)
+
+        assert outcome.canceled is True
+        assert outcome.results == [0]
@@ -0,0 +1,155 @@
+"""Tests for the SRT corpus benchmark harness."""
+
+from __future__ import annotations
+
+import json
+import random
+import shutil
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from audio_visualizer.srt.benchmarkHarness import (
+    BenchmarkRun,
+    cue_timing_error,
+    discover_corpus,
+    format_summary,
+    load_matrix,
+    main,
+    run_matrix,
+    word_edit_distance,
+    word_error_rate,
+)
+from audio_visualizer.srt.models import SubtitleBlock
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURES = ROOT / "tests" / "fixtures" / "srt"
+
+
+def _reference_distance(ref, hyp):
+    prev = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, start=1):
+        cur = [i]
+        for j, h in enumerate(hyp, start=1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (r != h)))
+        prev = cur
+    return prev[-1]
+
+
+class TestMetrics:
+    def test_word_error_rate_counts_edits(self):
+        assert word_error_rate("Hello, world!", "hello world") == (0.0, 0, 2)
+        # One substitution, one deletion, one insertion
+        wer, edits, ref_words = word_error_rate("the quick brown fox", "the slow fox jumps")
+        assert (edits, ref_words) == (3, 4)
+        assert wer == pytest.approx(0.75)
+        assert word_error_rate("", "") == (0.0, 0, 0)
+        assert word_error_rate("", "extra")[:2] == (1.0, 1)
+
+    def test_edit_distance_matches_the_textbook_recurrence(self):
+        rng = random.Random(4)
+        vocab = ["a", "b", "c", "d"]
+        for _ in range(200):
+            ref = [rng.choice(vocab) for _ in range(rng.randint(0, 12))]
+            hyp = [rng.choice(vocab) for _ in range(rng.randint(0, 12))]
+            assert word_edit_distance(ref, hyp) == _reference_distance(ref, hyp)
+
+    def test_cue_timing_error_matches_by_overlap(self):
+        reference = [
+            SubtitleBlock(start=0.0, end=2.0, lines=["one"]),
+            SubtitleBlock(start=3.0, end=5.0, lines=["two"]),
+            SubtitleBlock(start=9.0, end=10.0, lines=["missing"]),
+        ]
+        hypothesis = [
+            SubtitleBlock(start=0.1, end=1.0, lines=["x"]),
+            SubtitleBlock(start=1.0, end=2.2, lines=["x"]),
+            SubtitleBlock(start=2.8, end=5.0, lines=["x"]),
+        ]
+        result = cue_timing_error(reference, hypothesis)
+        assert (result["matched"], result["reference_cues"], result["generated_cues"]) == (2, 3, 3)
+        # Cue one matches [1.0, 2.2] (overlap 1.0s beats 0.9s)
+        assert result["mean_start_ms"] == pytest.approx(600.0)
+        assert result["mean_end_ms"] == pytest.approx(100.0)
+        assert cue_timing_error(reference, [])["mean_start_ms"] is None
+
+
+class TestMatrix:
+    def test_product_and_explicit_runs(self):
+        runs = load_matrix({
+            "models": ["tiny", "base"],
+            "compute_types": ["int8", "float32"],
+            "language": "en",
+            "configs": [{"name": "yt", "preset": "yt"}, {"name": "wide", "overrides": {"formatting": {"max_chars": 48}}}],
+            "runs": [{"name": "offline", "model_name": "stub"}],
+        })
+        assert len(runs) == 9
+        assert runs[0].name == "yt/tiny/int8" and runs[0].language == "en"
+        assert runs[-1].model_name == "stub"
+        wide = next(r for r in runs if r.name == "wide/base/float32")
+        assert wide.resolved_config().formatting.max_chars == 48
+
+    def test_rejects_duplicates_and_unknown_presets(self):
+        with pytest.raises(ValueError, match="unique"):
+            load_matrix({"runs": [{"name": "a"}, {"name": "a"}]})
+        with pytest.raises(ValueError, match="preset"):
+            BenchmarkRun(name="x", preset="nope").resolved_config()
+
+
+class TestCorpusRuns:
+    def test_discover_pairs_media_with_references(self, tmp_path):
+        items = discover_corpus(FIXTURES / "audio", FIXTURES / "baselines")
+        assert [item.name for item in items] == [
+            "continuous_speech", "descending_speech", "multi_sentence", "paused_speech", "single_sentence",
+        ]
+
+        shutil.copy(FIXTURES / "audio" / "single_sentence.wav", tmp_path / "a.wav")
+        shutil.copy(FIXTURES / "audio" / "single_sentence.wav", tmp_path / "b.wav")
+        shutil.copy(FIXTURES / "baselines" / "single_sentence.srt", tmp_path / "a.srt")
+        assert [item.name for item in discover_corpus(tmp_path)] == ["a"]
+
+    def test_stub_run_reports_speed_and_accuracy(self, tmp_path):
+        items = discover_corpus(FIXTURES / "audio", FIXTURES / "baselines")[-2:]
+        runs = [BenchmarkRun(name="stub", model_name="stub"), BenchmarkRun(name="bad", preset="nope")]
+
+        reports = run_matrix(runs, items, tmp_path, isolate=False)
+
+        summary = reports[0]["summary"]
+        assert (summary["files"], summary["failed"]) == (2, 0)
+        assert summary["wer"] == 0.0
+        assert summary["rtf"] > 0
+        assert set(summary["stages"]) == {"convert", "transcribe", "format", "write"}
+        assert reports[0]["files"][0]["cue_timing"]["matched"] > 0
+        assert (tmp_path / "stub" / "single_sentence.srt").exists()
+        assert "preset" in reports[1]["error"]
+        table = format_summary(reports)
+        assert "stub" in table and "error" in table
+
+    def test_cli_writes_json_report(self, tmp_path, capsys):
+        corpus = tmp_path / "corpus"
+        corpus.mkdir()
+        shutil.copy(FIXTURES / "audio" / "single_sentence.wav", corpus)
+        shutil.copy(FIXTURES / "baselines" / "single_sentence.srt", corpus)
+        output = tmp_path / "results.json"
+
+        code = main([str(corpus), "--model", "stub", "--preset", "yt", "--in-process", "--output", str(output)])
+
+        assert code == 0
+        report = json.loads(output.read_text(encoding="utf-8"))
+        assert report["items"] == ["single_sentence"]
+        assert report["runs"][0]["run"]["preset"] == "yt"
+        assert "yt/stub/auto" in capsys.readouterr().out
+
+
+def test_load_model_compute_type_override(monkeypatch):
+    from audio_visualizer.srt.srtApi import load_model
+
+    created = []
+    monkeypatch.setitem(
+        sys.modules,
+        "faster_whisper",
+        SimpleNamespace(WhisperModel=lambda name, device, compute_type: created.append(compute_type)),
+    )
+    _model, device_used, compute_type = load_model("tiny", "cpu", False, compute_type="float32")
+    assert (device_used, compute_type, created) == ("cpu", "float32", ["float32"])
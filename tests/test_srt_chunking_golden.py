@@ -0,0 +1,211 @@
+"""Golden tests for subtitle chunking and timing polish.
+
+``tests/fixtures/srt/baselines/chunking_golden.json`` holds the output of
+the list-and-string implementation of chunking, splitting, timing
+enforcement and hygiene on seeded synthetic transcripts (punctuation-only
+tokens, non-breaking spaces, multi-word "words", over-long words, speakers,
+duplicate and unsorted blocks).  The word-table implementation must
+reproduce it exactly.  Regenerate (only for intentional output changes)
+with ``python tests/test_srt_chunking_golden.py``.
+"""
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from audio_visualizer.srt.config import PRESETS, apply_overrides
+from audio_visualizer.srt.core.subtitleGeneration import (
+    apply_silence_alignment,
+    chunk_segments_to_subtitles,
+    chunk_segments_to_transcript_blocks,
+    chunk_words_to_subtitles,
+    hygiene_and_polish,
+    split_words_on_silence,
+    words_to_text,
+)
+from audio_visualizer.srt.core.intervalIndex import IntervalIndex
+from audio_visualizer.srt.core.textProcessing import enforce_timing, split_text_into_blocks
+from audio_visualizer.srt.core.wordTable import WordTable
+from audio_visualizer.srt.models import ResolvedConfig, SubtitleBlock, WordItem
+
+GOLDEN = Path(__file__).resolve().parent / "fixtures" / "srt" / "baselines" / "chunking_golden.json"
+
+PRESET_NAMES = ["shorts", "yt", "podcast", "transcript"]
+SEEDS = [1, 2, 3]
+
+_VOCAB = (
+    "the quick brown fox jumps over a lazy dog and then it said hello to everyone here "
+    "well, so; yes: no. maybe? really! okay... Dr. Smith e.g. U.S. - -- , . ?! "
+    "café naïve 日本語 x I a supercalifragilisticexpialidocious-antidisestablishmentarianism"
+).split() + ["New York", "a b", " padded ", "", "end. ", "(aside)", "'quoted'"]
+
+
+def _words(seed: int, count: int = 250):
+    rng = random.Random(seed)
+    words, silences, t = [], [], 0.0
+    for _ in range(count):
+        dur = rng.uniform(0.05, 0.6)
+        words.append(WordItem(start=round(t, 3), end=round(t + dur, 3), text=rng.choice(_VOCAB)))
+        t += dur
+        roll = rng.random()
+        if roll < 0.08:
+            pause = rng.uniform(0.25, 1.5)
+            silences.append((round(t + 0.02, 3), round(t + pause - 0.02, 3)))
+            t += pause
+        elif roll < 0.1:
+            t -= rng.uniform(0.0, 0.2)  # Overlapping words
+        else:
+            t += rng.uniform(0.0, 0.1)
+    return words, silences
+
+
+def _segments(words, seed: int):
+    rng = random.Random(seed)
+    segments, i = [], 0
+    speakers = ["SPEAKER_00", "SPEAKER_01", None]
+    while i < len(words):
+        n = rng.randint(1, 25)
+        chunk = words[i:i + n]
+        segments.append(SimpleNamespace(
+            start=chunk[0].start,
+            end=chunk[-1].end,
+            text=" ".join(w.text for w in chunk),
+            speaker=rng.choice(speakers),
+        ))
+        i += n
+    return segments
+
+
+def _messy_blocks(seed: int, count: int = 200):
+    rng = random.Random(seed)
+    texts = ["hello there", "hello  there", " ", "", "again", "ok then", "x" * 30]
+    blocks, t = [], 0.0
+    for _ in range(count):
+        start = round(t + rng.uniform(-0.3, 0.5), 3)
+        end = round(start + rng.uniform(-0.1, 3.0), 3)
+        lines = [rng.choice(texts) for _ in range(rng.randint(0, 2))]
+        blocks.append(SubtitleBlock(start, end, lines, rng.choice(["A", "B", None])))
+        t = max(t, end) if rng.random() < 0.7 else t
+    return blocks
+
+
+_TEXTS = [
+    "",
+    "   ",
+    "hello world",
+    ". leading dot and more words here. and then a tail",
+    ".. double dot start. next",
+    "a. b. c. d. e. f. g. h. i. j. k. l. m. n. o. p. q. r. s. t.",
+    "one, two, three, four, five, six, seven, eight, nine, ten, eleven, twelve, thirteen",
+    "semi; colon: mixed, punctuation. all? over! the place... and - dashes -- too",
+    "- . , ? ! ... -- ; :",
+    "supercalifragilisticexpialidocious-antidisestablishmentarianism is a long word, right?",
+    "no punctuation at all in this rather long line of text that keeps going and going on",
+    "ends with delimiter.",
+    "x",
+    "?! what. really? yes! no.",
+    "tab\tand\nnewline nbsp   spaces",
+]
+
+
+def _sub(sb: SubtitleBlock):
+    return [sb.start, sb.end, sb.lines, sb.speaker]
+
+
+def _cfg(preset: str) -> ResolvedConfig:
+    return apply_overrides(ResolvedConfig(), PRESETS[preset])
+
+
+def _compute() -> dict:
+    out: dict = {"words": {}, "segments": {}, "split": [], "enforce": [], "hygiene": []}
+    for preset in PRESET_NAMES:
+        cfg = _cfg(preset)
+        f = cfg.formatting
+        for seed in SEEDS:
+            words, silences = _words(seed)
+            chunked = chunk_words_to_subtitles(words, cfg, silences)
+            aligned = apply_silence_alignment([SubtitleBlock(s.start, s.end, s.lines) for s in chunked], silences)
+            polished = hygiene_and_polish(aligned, min_gap=f.min_gap, pad=f.pad, silence_intervals=silences)
+            padded = hygiene_and_polish(aligned, min_gap=f.min_gap, pad=0.15, silence_intervals=silences)
+            out["words"][f"{preset}-{seed}"] = {
+                "chunked": [_sub(s) for s in chunked],
+                "polished": [_sub(s) for s in polished],
+                "padded": [_sub(s) for s in padded],
+            }
+            segments = _segments(words, seed)
+            out["segments"][f"{preset}-{seed}"] = {
+                "subtitles": [_sub(s) for s in chunk_segments_to_subtitles(segments, cfg)],
+                "transcript": [_sub(s) for s in chunk_segments_to_transcript_blocks(segments, cfg, silences)],
+            }
+    for text in _TEXTS:
+        for max_chars, max_lines in ((18, 1), (42, 2), (10, 3)):
+            for commas, medium, prefer in ((True, True, False), (False, False, False), (True, True, True)):
+                out["split"].append(split_text_into_blocks(
+                    text, max_chars, max_lines,
+                    allow_commas=commas, allow_medium=medium, prefer_punct_splits=prefer,
+                ))
+    for seed in SEEDS:
+        rng = random.Random(seed)
+        blocks, t = [], 0.0
+        for _ in range(60):
+            dur = rng.uniform(0.1, 12.0)
+            text = " ".join(rng.choice(_VOCAB) for _ in range(rng.randint(1, 40)))
+            blocks.append((t, t + dur, text))
+            t += dur + rng.uniform(0.0, 0.5)
+        out["enforce"].append([list(b) for b in enforce_timing(blocks, 1.0, 6.0)])
+        out["enforce"].append([list(b) for b in enforce_timing(blocks, 1.0, 6.0, split_long=False)])
+        messy = _messy_blocks(seed)
+        silences = _words(seed)[1]
+        for pad in (0.0, 0.2):
+            for sil in (None, silences):
+                copy = [SubtitleBlock(b.start, b.end, list(b.lines), b.speaker) for b in messy]
+                out["hygiene"].append([_sub(s) for s in hygiene_and_polish(
+                    copy, min_gap=0.08, pad=pad, silence_intervals=sil,
+                )])
+    return out
+
+
+@pytest.fixture(scope="module")
+def golden():
+    return json.loads(GOLDEN.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="module")
+def computed():
+    return json.loads(json.dumps(_compute()))
+
+
+@pytest.mark.parametrize("section", ["words", "segments", "split", "enforce", "hygiene"])
+def test_matches_golden(golden, computed, section):
+    if isinstance(golden[section], dict):
+        assert golden[section].keys() == computed[section].keys()
+        for key in golden[section]:
+            assert computed[section][key] == golden[section][key], key
+    else:
+        assert len(computed[section]) == len(golden[section])
+        for i, (got, expected) in enumerate(zip(computed[section], golden[section])):
+            assert got == expected, i
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_word_table_runs_and_tokens(seed):
+    words, silences = _words(seed)
+    silences = silences + [(5.0, 4.0), (0.0, 0.0)]  # Inverted and degenerate intervals
+    table = WordTable.from_words(words)
+    runs = [words[lo:hi] for lo, hi in table.silence_runs(IntervalIndex(silences))]
+    assert runs == split_words_on_silence(words, silences)
+    offsets = table.token_offsets.tolist()
+    tokens = table.tokens()
+    for lo, hi in table.silence_runs(silences):
+        assert " ".join(tokens[offsets[lo]:offsets[hi]]) == words_to_text(words[lo:hi])
+    assert table.silence_runs([]) == [(0, len(words))]
+    assert WordTable.from_words([]).silence_runs(silences) == []
+
+
+if __name__ == "__main__":
+    GOLDEN.write_text(json.dumps(_compute(), ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    print(f"wrote {GOLDEN}")
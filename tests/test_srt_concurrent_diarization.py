@@ -0,0 +1,217 @@
+"""Tests for speaker diarization running alongside transcription."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from audio_visualizer.srt import transcribe_file
+from audio_visualizer.srt.core import concurrentDiarization
+from audio_visualizer.srt.core.concurrentDiarization import DiarizationJob, concurrent_diarization_fits
+from audio_visualizer.srt.io.audioHelpers import DecodedAudio
+from audio_visualizer.srt.models import PipelineMode, ResolvedConfig
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURE_AUDIO = ROOT / "tests" / "fixtures" / "srt" / "audio" / "single_sentence.wav"
+
+# Stand-ins for torch and pyannote.audio, importable from a spawned worker
+_FAKE_TORCH = '''
+class _Tensor:
+    def __init__(self, array):
+        self.array = array
+
+    def unsqueeze(self, _dim):
+        return self
+
+
+def from_numpy(array):
+    return _Tensor(array)
+'''
+
+_FAKE_PYANNOTE = '''
+import time
+
+
+class _Segment:
+    def __init__(self, start, end):
+        self.start, self.end = start, end
+
+
+class _Annotation:
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def itertracks(self, yield_label=False):
+        half = self.seconds / 2
+        yield _Segment(half, self.seconds), None, "SPEAKER_01"
+        yield _Segment(0.0, half), None, "SPEAKER_00"
+
+
+class Pipeline:
+    @classmethod
+    def from_pretrained(cls, _name, use_auth_token=None):
+        if use_auth_token == "bad-token":
+            raise RuntimeError("invalid token")
+        return cls()
+
+    def __call__(self, audio):
+        time.sleep(float(__import__("os").environ.get("FAKE_DIARIZATION_SECONDS", "0")))
+        samples = audio["waveform"].array
+        return _Annotation(len(samples) / audio["sample_rate"])
+'''
+
+
+@pytest.fixture
+def fake_pyannote(tmp_path, monkeypatch):
+    """Put stand-in torch/pyannote packages on sys.path (spawned workers inherit it)."""
+    site = tmp_path / "site"
+    (site / "pyannote" / "audio").mkdir(parents=True)
+    (site / "pyannote" / "__init__.py").write_text("", encoding="utf-8")
+    (site / "pyannote" / "audio" / "__init__.py").write_text(_FAKE_PYANNOTE, encoding="utf-8")
+    (site / "torch").mkdir()
+    (site / "torch" / "__init__.py").write_text(_FAKE_TORCH, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(site))
+    return site
+
+
+def _audio(seconds: float) -> DecodedAudio:
+    return DecodedAudio(samples=np.zeros(int(seconds * 16000), dtype=np.float32))
+
+
+class TestMemoryBudget:
+    def test_budget(self):
+        audio = _audio(60.0)
+        fits, estimate, budget = concurrent_diarization_fits(audio, 0)
+        assert not fits and budget == 0 and estimate > concurrentDiarization.DIARIZATION_BASE_MEMORY_MB
+        assert concurrent_diarization_fits(audio, 1e9)[0]
+
+    def test_unknown_available_memory_counts_as_fitting(self, monkeypatch):
+        monkeypatch.setattr(concurrentDiarization, "available_memory_mb", lambda: None)
+        assert concurrent_diarization_fits(_audio(1.0)) == (True, pytest.approx(1200.0, abs=1), None)
+
+
+class TestDiarizationJob:
+    def test_worker_process(self, fake_pyannote, tmp_path):
+        job = DiarizationJob(_audio(4.0), "token", tmpdir=tmp_path)
+        assert job.uses_process
+        assert job.result() == [(0.0, 2.0, "SPEAKER_00"), (2.0, 4.0, "SPEAKER_01")]
+        assert job.elapsed is not None
+        assert not list(tmp_path.glob("av_diarize_*"))  # Samples file removed
+
+    def test_worker_failure(self, fake_pyannote):
+        job = DiarizationJob(_audio(1.0), "bad-token")
+        with pytest.raises(RuntimeError, match="invalid token"):
+            job.result()
+        assert "invalid token" in job.failed
+
+    def test_worker_cancel(self, fake_pyannote, monkeypatch):
+        monkeypatch.setenv("FAKE_DIARIZATION_SECONDS", "30")
+        job = DiarizationJob(_audio(1.0), "token")
+        cancel = threading.Event()
+        threading.Timer(0.3, cancel.set).start()
+        started = time.time()
+        assert job.result(cancel) is None
+        assert time.time() - started < 10
+
+    def test_thread_fallback(self, monkeypatch):
+        release = threading.Event()
+        monkeypatch.setattr(concurrentDiarization, "load_diarization_pipeline", lambda _token: "pipeline")
+
+        def run(_pipeline, _audio):
+            release.wait(5)
+            return [(0.0, 1.0, "A")]
+
+        monkeypatch.setattr(concurrentDiarization, "run_diarization", run)
+        monkeypatch.setattr(DecodedAudio, "to_pyannote_input", lambda self: {})
+        job = DiarizationJob(_audio(1.0), "token", use_process=False)
+        assert not job.uses_process and not job.done
+        release.set()
+        assert job.result() == [(0.0, 1.0, "A")]
+
+
+class _SlowModel:
+    """Two segments, each taking ``delay`` seconds to transcribe."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    def transcribe(self, *_args, **_kwargs):
+        def gen():
+            for start, text in ((0.2, " hello there."), (8.2, " general kenobi.")):
+                time.sleep(self.delay)
+                first, second = text.split()
+                yield SimpleNamespace(
+                    start=start,
+                    end=start + 1.5,
+                    text=text,
+                    words=[
+                        SimpleNamespace(start=start, end=start + 0.7, word=" " + first),
+                        SimpleNamespace(start=start + 0.8, end=start + 1.5, word=" " + second),
+                    ],
+                )
+        return gen(), SimpleNamespace(language="en")
+
+
+class TestPipelineDiarization:
+    def _patch(self, monkeypatch):
+        from audio_visualizer.srt.core import pipeline as pipeline_module
+
+        monkeypatch.setattr(pipeline_module, "ffmpeg_ok", lambda: True)
+        monkeypatch.setattr(pipeline_module, "decode_audio_16k_mono", lambda _path: _audio(12.0))
+        monkeypatch.setattr(pipeline_module, "detect_silences", lambda *_args, **_kwargs: [])
+        monkeypatch.setattr(pipeline_module, "_open_correction_db", lambda: None)
+
+    def _run(self, tmp_path, model, **kwargs):
+        return transcribe_file(
+            input_path=FIXTURE_AUDIO,
+            output_path=tmp_path / "out.srt",
+            fmt="srt",
+            cfg=ResolvedConfig(),
+            model=model,
+            device_used="cpu",
+            compute_type_used="int8",
+            mode=PipelineMode.TRANSCRIPT,
+            diarize=True,
+            hf_token="token",
+            json_bundle_path=tmp_path / "out.json",
+            **kwargs,
+        )
+
+    @pytest.mark.parametrize("memory_mb", [1e9, 0])
+    def test_speakers_assigned(self, fake_pyannote, monkeypatch, tmp_path, memory_mb):
+        import json
+
+        self._patch(monkeypatch)
+        result = self._run(tmp_path, _SlowModel(), diarization_memory_mb=memory_mb)
+
+        assert result.success, result.error
+        bundle = json.loads((tmp_path / "out.json").read_text(encoding="utf-8"))
+        assert [s["speaker_label"] for s in bundle["subtitles"]] == ["SPEAKER_00", "SPEAKER_01"]
+        assert {"transcribe", "diarize"} <= set(result.timings)
+        assert ("diarize_wait" in result.timings) == (memory_mb > 0)
+
+    def test_diarization_overlaps_transcription(self, fake_pyannote, monkeypatch, tmp_path):
+        monkeypatch.setenv("FAKE_DIARIZATION_SECONDS", "1.5")
+        self._patch(monkeypatch)
+        result = self._run(tmp_path, _SlowModel(delay=1.0), diarization_memory_mb=1e9)
+
+        assert result.success, result.error
+        timings = result.timings
+        assert timings["diarize_wait"] < timings["diarize"]
+
+    def test_cancel_event(self, fake_pyannote, monkeypatch, tmp_path):
+        monkeypatch.setenv("FAKE_DIARIZATION_SECONDS", "30")
+        self._patch(monkeypatch)
+        cancel = threading.Event()
+        threading.Timer(0.5, cancel.set).start()
+        started = time.time()
+        result = self._run(tmp_path, _SlowModel(delay=0.2), cancel_event=cancel, diarization_memory_mb=1e9)
+
+        assert not result.success
+        assert "canceled" in result.error.lower()
+        assert time.time() - started < 10
@@ -294,3 +294,36 @@ class TestDocumentCorrectionIntegration:
 
         # Should NOT have recorded — provenance check fails
         assert db.correction_count() == 0
+
+
+# ------------------------------------------------------------------
+# Replacement rules
+# ------------------------------------------------------------------
+
+
+class TestReplacementRuleChanges:
+    """Replacement rules applied to an editor document as one batch edit."""
+
+    def test_changes_follow_speaker_rules_and_undo(self, tmp_path):
+        from audio_visualizer.ui.tabs.srtEdit.commands import BatchEditTextCommand
+        from audio_visualizer.ui.tabs.srtEdit.replacements import replacement_rule_changes
+
+        db = CorrectionDatabase(db_path=tmp_path / "corrections.db")
+        db.add_replacement_rule("gonna", "going to", speaker_label="Alice")
+        db.add_replacement_rule("um ", "")
+
+        doc = SubtitleDocument()
+        doc._entries = [
+            SubtitleEntry(index=1, start_ms=0, end_ms=2000, text="um I'm gonna\num go", speaker="Alice"),
+            SubtitleEntry(index=2, start_ms=3000, end_ms=5000, text="gonna stay"),
+            SubtitleEntry(index=3, start_ms=6000, end_ms=7000, text="unchanged"),
+        ]
+
+        changes = replacement_rule_changes(doc, db)
+        assert changes == [(0, "um I'm gonna\num go", "I'm going to\ngo")]
+
+        cmd = BatchEditTextCommand(doc, changes, "Apply replacement rules")
+        cmd.redo()
+        assert doc.entries[0].text == "I'm going to\ngo"
+        cmd.undo()
+        assert doc.entries[0].text == "um I'm gonna\num go"
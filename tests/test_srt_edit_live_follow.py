@@ -0,0 +1,65 @@
+"""Tests for following a subtitle file that is still being written."""
+
+from __future__ import annotations
+
+import os
+
+from audio_visualizer.ui.tabs.srtEdit.liveFollow import FileFollower, output_path_for
+from audio_visualizer.ui.tabs.srtEdit.parser import parse_srt_file
+
+
+class TestFileFollower:
+    def test_reports_appends_and_replacement(self, tmp_path):
+        path = tmp_path / "live.srt"
+        path.write_text("1\n00:00:00,000 --> 00:00:01,000\nHello\n", encoding="utf-8")
+        follower = FileFollower(str(path))
+        assert follower.poll() is False
+
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write("\n2\n00:00:01,500 --> 00:00:02,000\nWorld\n")
+        assert follower.poll() is True
+        assert follower.poll() is False
+        assert [e.text for e in parse_srt_file(str(path))] == ["Hello", "World"]
+
+        tmp = tmp_path / "live.srt.tmp"
+        tmp.write_text("1\n00:00:00,000 --> 00:00:01,000\nHi\n", encoding="utf-8")
+        os.replace(tmp, path)
+        assert follower.poll() is True
+
+    def test_missing_file_is_not_a_change(self, tmp_path):
+        path = tmp_path / "later.srt"
+        follower = FileFollower(str(path))
+        assert follower.poll() is False
+
+        path.write_text("", encoding="utf-8")
+        assert follower.poll() is True
+        path.unlink()
+        assert follower.poll() is False
+
+    def test_follows_partial_file_until_it_replaces_the_output(self, tmp_path):
+        output = tmp_path / "out.srt"
+        partial = tmp_path / "out.srt.partial"
+        output.write_text("1\n00:00:00,000 --> 00:00:01,000\nOld\n", encoding="utf-8")
+        follower = FileFollower(str(output))
+        assert follower.path == str(output)
+
+        partial.write_text("1\n00:00:00,000 --> 00:00:01,000\nNew\n", encoding="utf-8")
+        assert follower.poll() is True
+        assert follower.path == str(partial)
+        assert follower.poll() is False
+
+        os.replace(partial, output)
+        assert follower.poll() is True
+        assert follower.path == str(output)
+        assert [e.text for e in parse_srt_file(follower.path)] == ["New"]
+
+    def test_partial_path_follows_its_output(self, tmp_path):
+        partial = tmp_path / "out.vtt.partial"
+        partial.write_text("WEBVTT\n", encoding="utf-8")
+        follower = FileFollower(str(partial))
+        assert follower.output_path == str(tmp_path / "out.vtt")
+        assert follower.poll() is False
+
+        partial.unlink()  # Failed job: the previous output (none) stays
+        assert follower.poll() is False
+        assert output_path_for(str(partial)) == str(tmp_path / "out.vtt")
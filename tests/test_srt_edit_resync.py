@@ -8,6 +8,7 @@ from audio_visualizer.ui.tabs.srtEdit.resync import (
     fps_drift_correction,
     global_shift,
     shift_from_cursor,
+    silence_snap,
     two_point_stretch,
 )
 
@@ -221,3 +222,26 @@ class TestFpsDriftCorrection:
         doc = _make_doc()
         changes = fps_drift_correction(doc, 25.0, 30.0)
         assert changes == []
+
+
+class TestSilenceSnap:
+    """Test silence_snap resync tool."""
+
+    def test_snaps_boundaries_to_nearest_edge(self):
+        doc = _make_doc(
+            (1100, 2950, "First"),
+            (3500, 5000, "Second"),
+        )
+        changes = silence_snap(doc, [(1.0, 1.05), (3.0, 3.4)], snap_threshold_ms=200)
+
+        assert changes == [(0, 1100, 2950, 1050, 3000), (1, 3500, 5000, 3400, 5000)]
+
+    def test_equidistant_edges_prefer_earlier(self):
+        doc = _make_doc((1500, 4000, "Test"))
+        changes = silence_snap(doc, [(0.5, 1.4), (1.6, 2.0)], snap_threshold_ms=200)
+
+        assert changes[0][3] == 1400
+
+    def test_no_silences_returns_empty(self):
+        doc = _make_doc((0, 1000, "Test"))
+        assert silence_snap(doc, []) == []
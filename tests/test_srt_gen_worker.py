@@ -21,7 +21,7 @@ def _make_job(**overrides):
         input_path=Path("/tmp/test.mp3"),
         output_path=Path("/tmp/test.srt"),
         fmt="srt",
-        cfg=MagicMock(spec=ResolvedConfig),
+        cfg=ResolvedConfig(),
         model_name="tiny",
         device="cpu",
         language=None,
@@ -151,10 +151,10 @@ class TestSrtGenWorkerUsesLoadModelDirectly:
     """The worker must call load_model directly, never via ModelManager."""
 
     @patch("audio_visualizer.ui.workers.srtGenWorker.load_model")
-    @patch("audio_visualizer.ui.workers.srtGenWorker.transcribe_file")
+    @patch("audio_visualizer.ui.workers.srtGenWorker.begin_transcribe_file")
     def test_load_model_called_directly(self, mock_transcribe, mock_load):
         mock_load.return_value = (MagicMock(), "cpu", "int8")
-        mock_transcribe.return_value = MagicMock(
+        mock_transcribe.return_value.return_value = MagicMock(
             success=True,
             input_path=Path("/tmp/test.mp3"),
             output_path=Path("/tmp/test.srt"),
@@ -183,6 +183,30 @@ class TestSrtGenWorkerUsesLoadModelDirectly:
         assert len(completed) == 1
         assert completed[0]["total"] == 1
 
+    @patch("audio_visualizer.ui.workers.srtGenWorker.load_model")
+    @patch("audio_visualizer.ui.workers.srtGenWorker.begin_transcribe_file")
+    def test_replicas_mode_loads_multi_worker_model(self, mock_transcribe, mock_load, monkeypatch):
+        monkeypatch.setattr("os.cpu_count", lambda: 8)
+        mock_load.return_value = (MagicMock(), "cpu", "int8")
+        mock_transcribe.return_value.return_value = MagicMock(success=True, error=None, elapsed=1.0)
+
+        cfg = ResolvedConfig()
+        cfg.transcription.parallel_mode = "replicas"
+        cfg.transcription.parallel_workers = 2
+        emitter = AppEventEmitter()
+        worker = SrtGenWorker(jobs=[_make_job(cfg=cfg)], emitter=emitter)
+
+        worker.run()
+
+        mock_load.assert_called_once_with(
+            model_name="tiny",
+            device="cpu",
+            strict_cuda=False,
+            emitter=emitter,
+            num_workers=2,
+            cpu_threads=4,
+        )
+
 
 class TestSrtGenJobSpecFields:
     def test_script_path_field_defaults_to_none(self):
@@ -206,10 +230,10 @@ class TestSrtGenWorkerPassesScriptPath:
     """The worker passes script_path to transcribe_file."""
 
     @patch("audio_visualizer.ui.workers.srtGenWorker.load_model")
-    @patch("audio_visualizer.ui.workers.srtGenWorker.transcribe_file")
+    @patch("audio_visualizer.ui.workers.srtGenWorker.begin_transcribe_file")
     def test_script_path_forwarded(self, mock_transcribe, mock_load):
         mock_load.return_value = (MagicMock(), "cpu", "int8")
-        mock_transcribe.return_value = MagicMock(
+        mock_transcribe.return_value.return_value = MagicMock(
             success=True,
             input_path=Path("/tmp/test.mp3"),
             output_path=Path("/tmp/test.srt"),
@@ -233,11 +257,87 @@ class TestSrtGenWorkerPassesScriptPath:
         assert call_kwargs["script_path"] == Path("/tmp/script.txt")
 
 
+class TestSrtGenWorkerPrefetch:
+    """Inputs are decoded ahead of inference and handed to the pipeline."""
+
+    @patch("audio_visualizer.ui.workers.srtGenWorker.prepare_audio")
+    @patch("audio_visualizer.ui.workers.srtGenWorker.load_model")
+    @patch("audio_visualizer.ui.workers.srtGenWorker.begin_transcribe_file")
+    def test_prefetched_audio_is_passed_to_pipeline(self, mock_transcribe, mock_load, mock_prepare):
+        mock_load.return_value = (MagicMock(), "cpu", "int8")
+        mock_transcribe.return_value.return_value = MagicMock(success=True, error=None, elapsed=1.0)
+        prepared = [MagicMock(name="prepared-a"), MagicMock(name="prepared-b")]
+        mock_prepare.side_effect = prepared
+
+        emitter = AppEventEmitter()
+        jobs = [_make_job(input_path=Path("/tmp/a.mp3")), _make_job(input_path=Path("/tmp/b.mp3"))]
+        worker = SrtGenWorker(jobs=jobs, emitter=emitter)
+
+        completed = []
+        worker.signals.completed.connect(lambda data: completed.append(data))
+        worker.run()
+
+        assert [c.args[0] for c in mock_prepare.call_args_list] == [Path("/tmp/a.mp3"), Path("/tmp/b.mp3")]
+        assert [c.kwargs["prepared"] for c in mock_transcribe.call_args_list] == prepared
+        assert completed[0]["total"] == 2
+        assert len(completed[0]["results"]) == 2
+
+    @patch("audio_visualizer.ui.workers.srtGenWorker.prepare_audio")
+    @patch("audio_visualizer.ui.workers.srtGenWorker.load_model")
+    @patch("audio_visualizer.ui.workers.srtGenWorker.begin_transcribe_file")
+    def test_failed_prefetch_falls_back_to_inline_decode(self, mock_transcribe, mock_load, mock_prepare):
+        mock_load.return_value = (MagicMock(), "cpu", "int8")
+        mock_transcribe.return_value.return_value = MagicMock(success=True, error=None, elapsed=1.0)
+        mock_prepare.side_effect = RuntimeError("decode failed")
+
+        worker = SrtGenWorker(jobs=[_make_job()], emitter=AppEventEmitter())
+        worker.run()
+
+        assert mock_transcribe.call_args.kwargs["prepared"] is None
+
+
+class TestSrtGenWorkerModelServer:
+    """use_model_server routes model loading through the shared server."""
+
+    @patch("audio_visualizer.ui.workers.srtGenWorker.ensure_model_server")
+    @patch("audio_visualizer.ui.workers.srtGenWorker.load_model")
+    @patch("audio_visualizer.ui.workers.srtGenWorker.begin_transcribe_file")
+    def test_remote_model_is_used(self, mock_transcribe, mock_load, mock_ensure):
+        remote = MagicMock(device_used="cpu", compute_type="int8")
+        mock_ensure.return_value.load.return_value = remote
+        mock_transcribe.return_value.return_value = MagicMock(success=True, error=None, elapsed=1.0)
+
+        emitter = AppEventEmitter()
+        worker = SrtGenWorker(jobs=[_make_job(use_model_server=True)], emitter=emitter)
+        worker.run()
+
+        mock_load.assert_not_called()
+        mock_ensure.return_value.load.assert_called_once_with("tiny", "cpu", False, emitter)
+        assert mock_transcribe.call_args.kwargs["model"] is remote
+
+    @patch("audio_visualizer.ui.workers.srtGenWorker.ensure_model_server")
+    @patch("audio_visualizer.ui.workers.srtGenWorker.load_model")
+    @patch("audio_visualizer.ui.workers.srtGenWorker.begin_transcribe_file")
+    def test_falls_back_to_in_process_model(self, mock_transcribe, mock_load, mock_ensure):
+        mock_ensure.side_effect = RuntimeError("cannot start")
+        mock_load.return_value = (MagicMock(), "cpu", "int8")
+        mock_transcribe.return_value.return_value = MagicMock(success=True, error=None, elapsed=1.0)
+
+        emitter = AppEventEmitter()
+        messages = []
+        emitter.subscribe(lambda event: messages.append(event.message))
+        worker = SrtGenWorker(jobs=[_make_job(use_model_server=True)], emitter=emitter)
+        worker.run()
+
+        mock_load.assert_called_once()
+        assert any("Model server unavailable" in m for m in messages)
+
+
 class TestSrtGenWorkerBundleFromSrt:
     """Bundle-from-SRT mode uses _run_bundle_from_srt instead of transcribe_file."""
 
     @patch("audio_visualizer.ui.workers.srtGenWorker.load_model")
-    @patch("audio_visualizer.ui.workers.srtGenWorker.transcribe_file")
+    @patch("audio_visualizer.ui.workers.srtGenWorker.begin_transcribe_file")
     def test_existing_srt_path_triggers_bundle_mode(self, mock_transcribe, mock_load):
         """When existing_srt_path is set, transcribe_file should NOT be called."""
         mock_model = MagicMock()
@@ -274,11 +374,11 @@ class TestSrtGenWorkerBundleFromSrt:
         worker._run_bundle_from_srt.assert_called_once()
 
     @patch("audio_visualizer.ui.workers.srtGenWorker.load_model")
-    @patch("audio_visualizer.ui.workers.srtGenWorker.transcribe_file")
+    @patch("audio_visualizer.ui.workers.srtGenWorker.begin_transcribe_file")
     def test_normal_job_still_uses_transcribe_file(self, mock_transcribe, mock_load):
         """Jobs without existing_srt_path should use transcribe_file normally."""
         mock_load.return_value = (MagicMock(), "cpu", "int8")
-        mock_transcribe.return_value = MagicMock(
+        mock_transcribe.return_value.return_value = MagicMock(
             success=True,
             input_path=Path("/tmp/test.mp3"),
             output_path=Path("/tmp/test.srt"),
@@ -306,10 +406,10 @@ class TestSrtGenWorkerDeviceMetadata:
     """Completed payload must include device_used and compute_type_used."""
 
     @patch("audio_visualizer.ui.workers.srtGenWorker.load_model")
-    @patch("audio_visualizer.ui.workers.srtGenWorker.transcribe_file")
+    @patch("audio_visualizer.ui.workers.srtGenWorker.begin_transcribe_file")
     def test_completed_payload_includes_device_metadata(self, mock_transcribe, mock_load):
         mock_load.return_value = (MagicMock(), "cuda", "float16")
-        mock_transcribe.return_value = MagicMock(
+        mock_transcribe.return_value.return_value = MagicMock(
             success=True,
             input_path=Path("/tmp/test.mp3"),
             output_path=Path("/tmp/test.srt"),
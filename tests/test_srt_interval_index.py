@@ -0,0 +1,138 @@
+"""Tests for the sorted interval index and the timing helpers built on it."""
+import random
+from types import SimpleNamespace
+
+from audio_visualizer.srt.core.diarization import assign_speakers
+from audio_visualizer.srt.core.intervalIndex import IntervalIndex, as_interval_index
+from audio_visualizer.srt.core.subtitleGeneration import (
+    apply_silence_alignment,
+    silence_between,
+    split_words_on_silence,
+)
+from audio_visualizer.srt.models import SubtitleBlock, WordItem
+
+
+def _random_intervals(rng, count, overlapping=False):
+    out, t = [], 0.0
+    for _ in range(count):
+        t += rng.uniform(0.0, 2.0)
+        length = rng.uniform(0.0, 4.0 if overlapping else 1.0)
+        out.append((round(t, 2), round(t + length, 2)))
+        if not overlapping:
+            t += length
+    return sorted(out, key=lambda iv: iv[0])
+
+
+class TestIntervalIndexQueries:
+    def test_empty_index(self):
+        index = IntervalIndex([])
+        assert len(index) == 0
+        assert index.first_within(0.0, 10.0) is None
+        assert index.first_containing(1.0) is None
+        assert list(index.overlapping(0.0, 10.0)) == []
+        assert index.nearest_edge(1.0) is None
+
+    def test_sorts_and_carries_extra_fields(self):
+        index = IntervalIndex([(5.0, 6.0, "B"), (1.0, 2.0, "A")])
+        assert list(index) == [(1.0, 2.0, "A"), (5.0, 6.0, "B")]
+        assert list(index.overlapping(1.5, 5.5)) == [(1.0, 2.0, "A"), (5.0, 6.0, "B")]
+
+    def test_as_interval_index_reuses_index(self):
+        index = IntervalIndex([(0.0, 1.0)])
+        assert as_interval_index(index) is index
+        assert len(as_interval_index(None)) == 0
+
+    def test_queries_match_linear_scan(self):
+        rng = random.Random(3)
+        for overlapping in (False, True):
+            intervals = _random_intervals(rng, 200, overlapping)
+            index = IntervalIndex(intervals)
+            for _ in range(500):
+                a = rng.uniform(-1.0, 320.0)
+                b = a + rng.uniform(0.0, 6.0)
+                lo = rng.randrange(len(intervals))
+
+                within = next((iv for iv in intervals if iv[0] >= a and iv[1] <= b), None)
+                assert index.first_within(a, b) == within
+
+                containing = next(
+                    (k for k in range(lo, len(intervals)) if intervals[k][0] <= a <= intervals[k][1]), None
+                )
+                assert index.first_containing(a, lo) == containing
+
+                overlaps = [iv for iv in intervals if min(b, iv[1]) - max(a, iv[0]) > 0]
+                assert list(index.overlapping(a, b)) == overlaps
+
+    def test_nearest_edge_prefers_earlier_edge_on_tie(self):
+        index = IntervalIndex([(1000, 2000), (3000, 4000)])
+        assert index.nearest_edge(2500) == 2000
+        assert index.nearest_edge(2501) == 3000
+        assert index.nearest_edge(2900, max_distance=50) is None
+        assert index.nearest_edge(5000) == 4000
+
+
+def _linear_apply_silence_alignment(subs, silences):
+    """Pre-index implementation kept as a reference."""
+    aligned = []
+    for i, sb in enumerate(subs):
+        s, e = sb.start, sb.end
+        for ss, ee in silences:
+            if ss <= s <= ee:
+                s = ee
+            if ss <= e <= ee:
+                e = ss
+        if i + 1 < len(subs):
+            gap = silence_between(e, subs[i + 1].start, silences)
+            if gap is not None:
+                e = min(e, gap[0])
+                subs[i + 1].start = max(subs[i + 1].start, gap[1])
+        if e < s + 0.001:
+            e = s + 0.001
+        aligned.append(SubtitleBlock(s, e, sb.lines, sb.speaker))
+    return aligned
+
+
+class TestIndexedCallSites:
+    def test_silence_between_accepts_index(self):
+        silences = [(1.0, 1.5), (3.0, 3.2)]
+        assert silence_between(2.0, 4.0, IntervalIndex(silences)) == (3.0, 3.2)
+        assert silence_between(2.0, 4.0, silences) == (3.0, 3.2)
+
+    def test_apply_silence_alignment_matches_linear_scan(self):
+        rng = random.Random(11)
+        for overlapping in (False, True):
+            silences = _random_intervals(rng, 150, overlapping)
+            spans = _random_intervals(rng, 120, overlapping=True)
+            make = lambda: [SubtitleBlock(s, e, ["x"]) for s, e in spans]  # noqa: E731
+
+            got = apply_silence_alignment(make(), silences)
+            want = _linear_apply_silence_alignment(make(), silences)
+            assert [(b.start, b.end) for b in got] == [(b.start, b.end) for b in want]
+
+    def test_touching_silences_chain_like_linear_scan(self):
+        silences = [(1.0, 2.0), (2.0, 3.0)]
+        got = apply_silence_alignment([SubtitleBlock(1.5, 5.0, ["x"])], silences)
+        assert (got[0].start, got[0].end) == (3.0, 5.0)
+
+    def test_split_words_on_silence_uses_gaps(self):
+        words = [WordItem(0.0, 0.5, "a"), WordItem(0.6, 1.0, "b"), WordItem(2.0, 2.5, "c")]
+        runs = split_words_on_silence(words, [(1.1, 1.8), (5.0, 6.0)])
+        assert [[w.text for w in run] for run in runs] == [["a", "b"], ["c"]]
+
+    def test_assign_speakers_matches_linear_scan(self):
+        rng = random.Random(5)
+        turns = [(s, e, f"S{k % 3}") for k, (s, e) in enumerate(_random_intervals(rng, 200, True))]
+        spans = _random_intervals(rng, 150, overlapping=True)
+        segments = [SimpleNamespace(start=s, end=e) for s, e in spans]
+
+        got = [seg.speaker for seg in assign_speakers(segments, turns)]
+
+        want = []
+        for s_start, s_end in spans:
+            best_label, best_overlap = None, 0.0
+            for d_start, d_end, label in turns:
+                overlap = max(0.0, min(s_end, d_end) - max(s_start, d_start))
+                if overlap > best_overlap:
+                    best_overlap, best_label = overlap, label
+            want.append(best_label)
+        assert got == want
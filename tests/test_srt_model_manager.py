@@ -30,6 +30,28 @@ class TestModelManager:
         assert manager.model_info() is not None
         assert manager.model_info().device == "cuda"
 
+    def test_replica_options_are_part_of_cache_key(self, monkeypatch):
+        calls = []
+
+        def fake_init(model_name, device, strict_cuda, emitter, **options):
+            calls.append(options)
+            return object(), device, "int8"
+
+        monkeypatch.setattr(
+            "audio_visualizer.srt.modelManager.init_whisper_model_internal",
+            fake_init,
+        )
+
+        manager = ModelManager()
+        single = manager.load("base", device="cpu")
+        replicas = manager.load("base", device="cpu", num_workers=4, cpu_threads=2)
+        again = manager.load("base", device="cpu", num_workers=4, cpu_threads=2)
+
+        assert single is not replicas
+        assert replicas is again
+        assert calls == [{}, {"num_workers": 4, "cpu_threads": 2}]
+        assert manager.model_info().num_workers == 4
+
     def test_emits_model_load_events_for_success_and_failure(self, monkeypatch):
         emitter = AppEventEmitter()
         seen = []
@@ -0,0 +1,284 @@
+"""Tests for the persistent local Whisper model server."""
+
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pytest
+
+from audio_visualizer.events import AppEventEmitter, EventType
+from audio_visualizer.srt import modelServer
+from audio_visualizer.srt.modelServer import (
+    ModelKey,
+    ModelPool,
+    ModelServer,
+    ModelServerClient,
+    RemoteSegment,
+    ensure_model_server,
+    estimate_model_mb,
+)
+
+
+@dataclass
+class _Word:
+    start: float
+    end: float
+    word: str
+    probability: float = 0.9
+
+
+@dataclass
+class _Segment:
+    id: int
+    seek: int
+    start: float
+    end: float
+    text: str
+    tokens: List[int] = field(default_factory=list)
+    avg_logprob: float = -0.2
+    compression_ratio: float = 1.2
+    no_speech_prob: float = 0.01
+    words: Optional[List[_Word]] = None
+    temperature: Optional[float] = 0.0
+
+
+@dataclass
+class _Info:
+    language: str
+    language_probability: float
+    duration: float
+    duration_after_vad: float
+
+
+class _FakeModel:
+    def __init__(self, name):
+        self.name = name
+        self.calls = []
+
+    def transcribe(self, audio, **options):
+        self.calls.append((audio, options))
+        if self.name == "broken":
+            raise ValueError("decoder exploded")
+        duration = len(audio) / 16000 if not isinstance(audio, str) else 1.0
+        segments = [
+            _Segment(1, 0, 0.0, 0.5, " Hello", words=[_Word(0.0, 0.5, " Hello")]),
+            _Segment(2, 0, 0.5, 1.0, " world.", words=[_Word(0.5, 1.0, " world.")]),
+        ]
+        return iter(segments), _Info("en", 0.99, duration, duration)
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Replace the Whisper loader with fakes and record each load."""
+    calls = []
+
+    def fake_init(model_name, device, strict_cuda, emitter, **options):
+        if model_name == "missing":
+            raise RuntimeError("no such model")
+        calls.append(model_name)
+        return _FakeModel(model_name), "cpu", "int8"
+
+    monkeypatch.setattr("audio_visualizer.srt.modelManager.init_whisper_model_internal", fake_init)
+    monkeypatch.setattr(modelServer, "available_memory_mb", lambda: 64000.0)
+    return calls
+
+
+@pytest.fixture
+def server(loads, monkeypatch):
+    if sys.platform == "win32":
+        pytest.skip("uses a Unix socket address")
+    data_dir = Path(tempfile.mkdtemp(prefix="avms"))
+    monkeypatch.setattr(modelServer, "get_data_dir", lambda: data_dir)
+    srv = ModelServer(str(data_dir / "s.sock"), idle_timeout=60.0)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    thread.join(timeout=5)
+
+
+class TestModelPool:
+    def test_reuses_resident_model(self, loads):
+        pool = ModelPool()
+        first = pool.acquire(ModelKey("tiny", "cpu"))
+        pool.release(first)
+        second = pool.acquire(ModelKey("tiny", "cpu"))
+        pool.release(second)
+
+        assert first is second
+        assert loads == ["tiny"]
+        assert second.device_used == "cpu"
+        assert second.compute_type == "int8"
+
+    def test_evicts_least_recently_used_idle_model_when_full(self, loads):
+        pool = ModelPool(max_models=2)
+        for name in ("tiny", "base", "tiny", "small"):
+            pool.release(pool.acquire(ModelKey(name)))
+
+        assert loads == ["tiny", "base", "small"]
+        assert sorted(m["model_name"] for m in pool.status()) == ["small", "tiny"]
+
+    def test_request_waits_until_busy_model_is_released(self, loads):
+        pool = ModelPool(max_models=1)
+        busy = pool.acquire(ModelKey("tiny"))
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire(ModelKey("base"))))
+        waiter.start()
+
+        time.sleep(0.2)
+        assert acquired == []
+        assert pool.waiting == 1
+
+        pool.release(busy)
+        waiter.join(timeout=5)
+        assert [r.key.model_name for r in acquired] == ["base"]
+        assert loads == ["tiny", "base"]
+
+    def test_acquire_times_out_when_no_room(self, loads):
+        pool = ModelPool(max_models=1)
+        pool.acquire(ModelKey("tiny"))
+        with pytest.raises(TimeoutError):
+            pool.acquire(ModelKey("base"), timeout=0.1)
+
+    def test_memory_limit_forces_eviction(self, loads):
+        pool = ModelPool(max_models=4, memory_limit_mb=500.0)
+        pool.release(pool.acquire(ModelKey("small")))
+        pool.release(pool.acquire(ModelKey("base")))
+
+        assert [m["model_name"] for m in pool.status()] == ["base"]
+
+    def test_available_memory_limits_residency(self, loads, monkeypatch):
+        monkeypatch.setattr(modelServer, "available_memory_mb", lambda: 300.0)
+        pool = ModelPool(max_models=4)
+        pool.release(pool.acquire(ModelKey("tiny")))
+        pool.release(pool.acquire(ModelKey("small")))
+
+        assert [m["model_name"] for m in pool.status()] == ["small"]
+
+    def test_idle_models_are_evicted(self, loads):
+        pool = ModelPool(idle_timeout=10.0)
+        pool.release(pool.acquire(ModelKey("tiny")))
+
+        assert pool.evict_idle() == []
+        assert pool.evict_idle(now=time.monotonic() + 11.0) == [ModelKey("tiny")]
+        assert pool.status() == []
+
+    def test_failed_load_frees_the_slot(self, loads):
+        pool = ModelPool(max_models=1)
+        with pytest.raises(RuntimeError, match="no such model"):
+            pool.acquire(ModelKey("missing"))
+        assert pool.status() == []
+        pool.release(pool.acquire(ModelKey("tiny")))
+
+
+class TestEstimateModelMb:
+    def test_known_names(self):
+        assert estimate_model_mb("large-v3") == 2400.0
+        assert estimate_model_mb("small.en") == 450.0
+        assert estimate_model_mb("distil-large-v3") == 1200.0
+
+    def test_local_model_directory_uses_weights_size(self, tmp_path):
+        (tmp_path / "model.bin").write_bytes(b"\0" * (3 * 1024 * 1024))
+        assert estimate_model_mb(str(tmp_path)) == pytest.approx(3.0)
+
+
+class TestModelServer:
+    def test_load_and_stream_transcription(self, server):
+        emitter = AppEventEmitter()
+        events = []
+        emitter.subscribe(events.append)
+        client = ModelServerClient(server.address)
+
+        model = client.load("tiny", "cpu", emitter=emitter)
+        segments, info = model.transcribe(np.zeros(32000, dtype=np.float32), language="en", word_timestamps=True)
+        received = list(segments)
+
+        assert (model.device_used, model.compute_type) == ("cpu", "int8")
+        assert info.language == "en"
+        assert info.duration == pytest.approx(2.0)
+        assert all(isinstance(seg, RemoteSegment) for seg in received)
+        assert [seg.text for seg in received] == [" Hello", " world."]
+        assert received[1].words[0].start == pytest.approx(0.5)
+        assert any(e.event_type is EventType.MODEL_LOAD for e in events)
+
+        fake = server.pool.status()
+        assert fake[0]["model_name"] == "tiny"
+        assert fake[0]["active"] == 0
+
+    def test_model_loaded_once_across_clients(self, server, loads):
+        for _ in range(3):
+            model = ModelServerClient(server.address).load("base", "cpu")
+            list(model.transcribe(np.zeros(1600, dtype=np.float32))[0])
+
+        assert loads == ["base"]
+        assert ModelServerClient(server.address).status()["models"][0]["model_name"] == "base"
+
+    def test_transcription_error_is_raised_on_client(self, server):
+        model = ModelServerClient(server.address).load("broken", "cpu")
+        with pytest.raises(RuntimeError, match="decoder exploded"):
+            model.transcribe(np.zeros(1600, dtype=np.float32))
+        assert server.pool.status()[0]["active"] == 0
+
+    def test_unload_and_shutdown(self, server):
+        client = ModelServerClient(server.address)
+        client.load("tiny", "cpu")
+        assert client.unload() == 1
+        assert client.status()["models"] == []
+
+        client.shutdown()
+        deadline = time.monotonic() + 5
+        while client.is_running() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert client.is_running() is False
+
+    def test_wrong_key_is_rejected(self, server):
+        assert ModelServerClient(server.address, authkey=b"not-the-key").is_running() is False
+
+    def test_remote_model_drives_the_pipeline(self, server, monkeypatch, tmp_path):
+        from audio_visualizer.srt import transcribe_file
+        from audio_visualizer.srt.core import pipeline as pipeline_module
+        from audio_visualizer.srt.io.audioHelpers import DecodedAudio
+        from audio_visualizer.srt.models import ResolvedConfig
+
+        monkeypatch.setattr(pipeline_module, "ffmpeg_ok", lambda: True)
+        monkeypatch.setattr(
+            pipeline_module, "decode_audio_16k_mono",
+            lambda _path: DecodedAudio(samples=np.zeros(16000, dtype=np.float32)),
+        )
+        monkeypatch.setattr(pipeline_module, "detect_silences", lambda *_a, **_k: [])
+
+        model = ModelServerClient(server.address).load("tiny", "cpu")
+        output = tmp_path / "out.srt"
+        result = transcribe_file(
+            input_path=tmp_path / "in.wav",
+            output_path=output,
+            fmt="srt",
+            cfg=ResolvedConfig(),
+            model=model,
+            device_used=model.device_used,
+            compute_type_used=model.compute_type,
+        )
+
+        assert result.success is True, result.error
+        assert "Hello world." in output.read_text(encoding="utf-8")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a Unix socket address")
+def test_ensure_model_server_spawns_detached_server(monkeypatch):
+    base = Path(tempfile.mkdtemp(prefix="avms"))
+    monkeypatch.setenv("XDG_DATA_HOME", str(base / "data"))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(base / "config"))
+    address = str(base / "s.sock")
+
+    client = ensure_model_server(address, startup_timeout=60.0)
+    try:
+        status = client.status()
+        assert status["models"] == []
+        assert ensure_model_server(address).status()["pid"] == status["pid"]
+    finally:
+        client.shutdown()
@@ -15,6 +15,7 @@ from audio_visualizer.srt.io.outputWriters import (
     segments_to_jsonable,
     write_json_bundle,
     write_bundle_from_srt,
+    write_subtitle_outputs,
 )
 from audio_visualizer.srt.core.alignment import AlignedCue
 from audio_visualizer.srt.models import SubtitleBlock, ResolvedConfig, WordItem
@@ -599,3 +600,102 @@ class TestWriteBundleFromSrt:
         data = json.loads(out_path.read_text(encoding="utf-8"))
         word_ids = [w["id"] for w in data["words"]]
         assert len(word_ids) == len(set(word_ids))
+
+
+class TestWriteSubtitleOutputs:
+    """Tests for write_subtitle_outputs function."""
+
+    @staticmethod
+    def _subs():
+        return [
+            SubtitleBlock(0.0, 2.0, ["Hello there,", "general"], "SPEAKER_00"),
+            SubtitleBlock(2.5, 4.25, [""]),
+            SubtitleBlock(5.0, 7.0, ["a much longer line that needs wrapping into several lines"]),
+            SubtitleBlock(3661.456, 3662.0, ["caf\u00e9 \u65e5\u672c"]),
+        ]
+
+    def test_matches_single_format_writers(self, tmp_path):
+        """Test every format equals its single-format writer's output."""
+        subs = self._subs()
+        write_subtitle_outputs(
+            subs,
+            [(fmt, tmp_path / f"multi.{fmt}") for fmt in ("srt", "vtt", "ass", "txt")],
+            max_chars=20,
+            max_lines=2,
+        )
+        write_srt(subs, tmp_path / "single.srt", max_chars=20, max_lines=2)
+        write_vtt(subs, tmp_path / "single.vtt", max_chars=20, max_lines=2)
+        write_ass(subs, tmp_path / "single.ass", max_chars=20, max_lines=2)
+        write_txt(subs, tmp_path / "single.txt")
+
+        for fmt in ("srt", "vtt", "ass", "txt"):
+            assert (tmp_path / f"multi.{fmt}").read_bytes() == (tmp_path / f"single.{fmt}").read_bytes()
+        srt = (tmp_path / "multi.srt").read_text(encoding="utf-8")
+        assert srt.startswith("1\n00:00:00,000 --> 00:00:02,000\nSPEAKER_00: Hello\nthere, general\n\n2\n")
+        assert srt.endswith("01:01:01,456 --> 01:01:02,000\ncaf\u00e9 \u65e5\u672c\n")
+        assert (tmp_path / "multi.txt").read_text(encoding="utf-8").splitlines()[1] == ""
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_json_bundle_layout(self, tmp_path):
+        """Test the streamed bundle equals json.dumps(indent=2) of its data."""
+        words = [WordItem(0.1, 0.5, "Hello"), WordItem(0.6, 1.0, "there")]
+        segments = [
+            MagicMock(start=9.0, words=[MagicMock(start=9.0, end=9.5, word=" late", probability=0.5)]),
+            MagicMock(start=0.2, words=[MagicMock(start=w.start, end=w.end, word=w.text, probability=None) for w in words]),
+            MagicMock(start=0.0, words=[]),
+        ]
+        out_path = tmp_path / "bundle.json"
+
+        write_subtitle_outputs(
+            self._subs(),
+            [("json", out_path)],
+            input_file="in.wav",
+            device_used="cpu",
+            compute_type_used="int8",
+            cfg=ResolvedConfig(),
+            segments=segments,
+            tool_version="0.1.0",
+        )
+
+        content = out_path.read_text(encoding="utf-8")
+        data = json.loads(content)
+        assert content == json.dumps(data, ensure_ascii=False, indent=2)
+        assert [sub["text"] for sub in data["subtitles"]][:2] == ["Hello there, general", ""]
+        assert [w["text"] for w in data["subtitles"][0]["words"]] == ["Hello", "there"]
+        assert data["subtitles"][0]["speaker_label"] == "SPEAKER_00"
+        assert data["subtitles"][2]["words"] == []
+        assert [w["subtitle_id"] for w in data["words"]] == [data["subtitles"][0]["id"]] * 2
+
+        write_subtitle_outputs([], [("json", out_path)], cfg=ResolvedConfig())
+        empty = out_path.read_text(encoding="utf-8")
+        assert empty == json.dumps(json.loads(empty), ensure_ascii=False, indent=2)
+        assert json.loads(empty)["subtitles"] == []
+
+    def test_later_target_wins_same_path(self, tmp_path):
+        """Test two targets on one path behave like sequential writes."""
+        out_path = tmp_path / "out.txt"
+        write_subtitle_outputs(self._subs(), [("srt", out_path), ("txt", out_path)], max_chars=42, max_lines=2)
+        assert out_path.read_text(encoding="utf-8").startswith("SPEAKER_00") is False
+        assert out_path.read_text(encoding="utf-8").startswith("Hello there, general\n")
+
+    def test_failure_replaces_nothing(self, tmp_path):
+        """Test a failed write leaves existing outputs and no temp files."""
+        srt_path = tmp_path / "out.srt"
+        srt_path.write_text("old", encoding="utf-8")
+        bad = [SubtitleBlock(0.0, 1.0, ["ok"]), SubtitleBlock(float("nan"), 2.0, ["bad"])]
+
+        with pytest.raises(ValueError):
+            write_subtitle_outputs(bad, [("srt", srt_path), ("txt", tmp_path / "out.txt")], max_chars=42, max_lines=2)
+
+        assert srt_path.read_text(encoding="utf-8") == "old"
+        assert not (tmp_path / "out.txt").exists()
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_validation(self, tmp_path):
+        """Test unknown formats and missing wrap limits are rejected."""
+        with pytest.raises(ValueError, match="Unknown format"):
+            write_subtitle_outputs([], [("docx", tmp_path / "out.docx")])
+        with pytest.raises(ValueError, match="max_chars"):
+            write_subtitle_outputs([], [("vtt", tmp_path / "out.vtt")])
+        write_subtitle_outputs([], [("txt", tmp_path / "out.txt")])
+        assert (tmp_path / "out.txt").read_text(encoding="utf-8") == "\n"
@@ -0,0 +1,303 @@
+"""Tests for chunk-parallel transcription (srt.core.parallelTranscription)."""
+import sys
+import threading
+import types
+from collections import namedtuple
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+import pytest
+
+from audio_visualizer.srt.core.parallelTranscription import (
+    ParallelTranscriptionStats,
+    plan_chunks,
+    replica_model_options,
+    resolve_workers,
+    transcribe_parallel,
+)
+from audio_visualizer.srt.io.audioHelpers import DecodedAudio
+from audio_visualizer.srt.io.silenceDetection import find_silences
+
+RATE = 16000
+TOLERANCE = 0.05
+
+Word = namedtuple("Word", ["start", "end", "word", "probability"])
+Segment = namedtuple("Segment", ["id", "start", "end", "text", "words"])
+
+
+@dataclass
+class DataclassWord:
+    start: float
+    end: float
+    word: str
+    probability: float = 1.0
+
+
+@dataclass
+class DataclassSegment:
+    id: int
+    start: float
+    end: float
+    text: str
+    words: Optional[List[DataclassWord]] = field(default=None)
+
+
+def _speech_audio(pattern, seed=3):
+    """Build audio from (tone_seconds, gap_seconds) pairs; words are 0.3 s tone blips."""
+    rng = np.random.default_rng(seed)
+    parts = []
+    for tone, gap in pattern:
+        n_words = max(1, int(tone / 0.4))
+        for _ in range(n_words):
+            t = np.arange(int(0.3 * RATE)) / RATE
+            parts.append((0.3 * np.sin(2 * np.pi * rng.uniform(200, 400) * t)).astype(np.float32))
+            parts.append(np.zeros(int(0.1 * RATE), dtype=np.float32))
+        parts.append(np.zeros(int(gap * RATE), dtype=np.float32))
+    return DecodedAudio(np.concatenate(parts))
+
+
+class _FakeWhisper:
+    """Deterministic stand-in for WhisperModel.
+
+    Every tone blip becomes a word and words separated by more than 0.5 s
+    of silence start a new segment, so the output depends only on the audio
+    content and not on where the chunk starts.
+    """
+
+    def __init__(self, word_cls=Word, segment_cls=Segment):
+        self.word_cls = word_cls
+        self.segment_cls = segment_cls
+        self.calls = []
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio, **kwargs):
+        with self._lock:
+            self.calls.append((len(audio), kwargs))
+            self.threads.add(threading.get_ident())
+        return self._segments(np.asarray(audio)), None
+
+    def _segments(self, samples):
+        duration = len(samples) / RATE
+        gaps = find_silences(samples, RATE, min_silence_dur=0.05, silence_threshold_db=-35.0)
+        bounds = [0.0] + [t for gap in gaps for t in gap] + [duration]
+        spans = [(bounds[i], bounds[i + 1]) for i in range(0, len(bounds), 2) if bounds[i + 1] - bounds[i] > 0.01]
+
+        groups = []
+        for start, end in spans:
+            word = self.word_cls(start=start, end=end, word=f" w{int(start * 1000)}", probability=0.9)
+            if groups and start - groups[-1][-1].end <= 0.5:
+                groups[-1].append(word)
+            else:
+                groups.append([word])
+        for i, words in enumerate(groups, start=1):
+            yield self.segment_cls(
+                id=i,
+                start=words[0].start,
+                end=words[-1].end,
+                text="".join(w.word for w in words),
+                words=words,
+            )
+
+
+def _sequential(model, audio):
+    segments, _info = model.transcribe(audio.samples)
+    return list(segments)
+
+
+def _silences(audio):
+    return find_silences(audio.samples, RATE, min_silence_dur=0.2, silence_threshold_db=-35.0)
+
+
+class TestPlanChunks:
+    def test_cuts_inside_silences(self):
+        silences = [(9.0, 10.0), (19.5, 20.5), (33.0, 34.0), (41.0, 41.5)]
+        chunks = plan_chunks(60.0, silences, target_sec=20.0, max_sec=30.0)
+
+        cuts = [c.keep_end for c in chunks[:-1]]
+        assert cuts == [20.0, 33.5]
+        assert all(c.start == c.keep_start for c in chunks)
+        assert chunks[-1].end == 60.0
+
+    def test_owned_spans_tile_duration(self):
+        rng = np.random.default_rng(1)
+        starts = np.sort(rng.uniform(0, 600, 80))
+        silences = [(float(s), float(s) + 0.4) for s in starts]
+        chunks = plan_chunks(600.0, silences, target_sec=30.0, max_sec=30.0)
+
+        assert chunks[0].keep_start == 0.0
+        assert chunks[-1].keep_end == 600.0
+        for prev, nxt in zip(chunks, chunks[1:]):
+            assert prev.keep_end == nxt.keep_start
+        assert all(c.duration <= 30.0 + 1e-9 for c in chunks)
+
+    def test_forced_cut_overlaps_neighbours(self):
+        chunks = plan_chunks(100.0, [], target_sec=30.0, max_sec=45.0, overlap_sec=1.0)
+
+        assert len(chunks) == 3
+        first, second = chunks[0], chunks[1]
+        assert first.keep_end == 30.0
+        assert first.end == pytest.approx(31.0)
+        assert second.start == pytest.approx(29.0)
+        assert second.keep_start == 30.0
+
+    def test_forced_cut_respects_max(self):
+        chunks = plan_chunks(100.0, [], target_sec=30.0, max_sec=30.0, overlap_sec=1.0)
+
+        assert all(c.duration <= 30.0 + 1e-9 for c in chunks)
+
+    def test_short_audio_is_one_chunk(self):
+        chunks = plan_chunks(12.0, [(5.0, 6.0)], target_sec=30.0)
+
+        assert len(chunks) == 1
+        assert (chunks[0].start, chunks[0].end) == (0.0, 12.0)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            plan_chunks(10.0, [], target_sec=0.0)
+        with pytest.raises(ValueError):
+            plan_chunks(10.0, [], target_sec=20.0, max_sec=10.0)
+
+
+class TestReplicasMode:
+    PATTERN = [(2.4, 0.8), (1.6, 0.3), (3.2, 1.2), (0.8, 0.7), (2.0, 0.9)] * 8
+
+    @pytest.mark.parametrize("word_cls, segment_cls", [(Word, Segment), (DataclassWord, DataclassSegment)])
+    def test_matches_sequential_segment_boundaries(self, word_cls, segment_cls):
+        audio = _speech_audio(self.PATTERN)
+        model = _FakeWhisper(word_cls, segment_cls)
+        expected = _sequential(model, audio)
+
+        segments, stats = transcribe_parallel(
+            model, audio, silences=_silences(audio), mode="replicas", workers=3, chunk_sec=10.0,
+            language="en", word_timestamps=True,
+        )
+
+        assert stats.chunks > 3
+        assert len(segments) == len(expected)
+        for got, ref in zip(segments, expected):
+            assert got.start == pytest.approx(ref.start, abs=TOLERANCE)
+            assert got.end == pytest.approx(ref.end, abs=TOLERANCE)
+            assert len(got.words) == len(ref.words)
+        assert [s.id for s in segments] == list(range(1, len(segments) + 1))
+        assert all(kwargs["language"] == "en" for _n, kwargs in model.calls[1:])
+
+    def test_forced_cuts_keep_each_word_once(self):
+        # 0.2 s pauses are below the 0.5 s grouping gap: one long run with
+        # no silence the planner may cut at
+        audio = _speech_audio([(0.8, 0.2)] * 60)
+        model = _FakeWhisper()
+        expected_words = [w for seg in _sequential(model, audio) for w in seg.words]
+
+        segments, stats = transcribe_parallel(
+            model, audio, silences=[], mode="replicas", workers=2, chunk_sec=8.0,
+        )
+        words = [w for seg in segments for w in seg.words]
+
+        assert stats.chunks > 2
+        assert len(words) == len(expected_words)
+        for got, ref in zip(words, expected_words):
+            assert got.start == pytest.approx(ref.start, abs=TOLERANCE)
+            assert got.end == pytest.approx(ref.end, abs=TOLERANCE)
+        for seg in segments:
+            assert seg.start == pytest.approx(seg.words[0].start)
+            assert seg.end == pytest.approx(seg.words[-1].end)
+            assert seg.text == "".join(w.word for w in seg.words)
+
+    def test_reports_progress_and_real_time_factor(self):
+        audio = _speech_audio(self.PATTERN)
+        progress = []
+
+        segments, stats = transcribe_parallel(
+            _FakeWhisper(), audio, silences=_silences(audio), mode="replicas", workers=2,
+            chunk_sec=10.0, on_progress=lambda media_t, count: progress.append((media_t, count)),
+        )
+
+        assert len(progress) == stats.chunks
+        assert progress[-1][0] == pytest.approx(audio.duration)
+        assert progress[-1][1] >= len(segments)
+        assert stats.audio_seconds == pytest.approx(audio.duration)
+        assert stats.real_time_factor == pytest.approx(stats.wall_seconds / audio.duration)
+        assert stats.speed == pytest.approx(1.0 / stats.real_time_factor)
+
+
+class TestBatchedMode:
+    def test_passes_silence_chunks_as_clip_timestamps(self, monkeypatch):
+        audio = _speech_audio(TestReplicasMode.PATTERN)
+        model = _FakeWhisper()
+        seen = {}
+
+        class FakeBatchedPipeline:
+            def __init__(self, model):
+                seen["model"] = model
+
+            def transcribe(self, audio_arr, **kwargs):
+                seen.update(kwargs)
+                return model.transcribe(audio_arr)
+
+        monkeypatch.setitem(
+            sys.modules, "faster_whisper", types.SimpleNamespace(BatchedInferencePipeline=FakeBatchedPipeline)
+        )
+
+        segments, stats = transcribe_parallel(
+            model, audio, silences=_silences(audio), mode="batched", workers=4,
+            vad_filter=False, condition_on_previous_text=True,
+        )
+
+        assert seen["model"] is model
+        assert seen["batch_size"] == 4
+        assert seen["vad_filter"] is False
+        assert "condition_on_previous_text" not in seen
+        clips = seen["clip_timestamps"]
+        assert len(clips) == stats.chunks
+        assert clips[0]["start"] == 0.0
+        assert clips[-1]["end"] == pytest.approx(audio.duration)
+        assert all(isinstance(c["start"], float) and isinstance(c["end"], float) for c in clips)
+        assert all(c["end"] - c["start"] <= 30.0 for c in clips)
+        assert len(segments) == len(_sequential(model, audio))
+
+    def test_vad_filter_lets_pipeline_choose_boundaries(self, monkeypatch):
+        audio = _speech_audio([(2.0, 1.0)] * 3)
+        seen = {}
+
+        class FakeBatchedPipeline:
+            def __init__(self, model):
+                pass
+
+            def transcribe(self, audio_arr, **kwargs):
+                seen.update(kwargs)
+                return iter([]), None
+
+        monkeypatch.setitem(
+            sys.modules, "faster_whisper", types.SimpleNamespace(BatchedInferencePipeline=FakeBatchedPipeline)
+        )
+
+        _segments, stats = transcribe_parallel(_FakeWhisper(), audio, silences=[], mode="batched", vad_filter=True)
+
+        assert stats.chunks == 0
+        assert seen["vad_filter"] is True
+        assert "clip_timestamps" not in seen
+        assert seen["batch_size"] == resolve_workers("batched")
+
+
+class TestOptions:
+    def test_unknown_mode_raises(self):
+        with pytest.raises(ValueError):
+            transcribe_parallel(_FakeWhisper(), DecodedAudio(np.zeros(RATE)), silences=[], mode="off")
+
+    def test_resolve_workers(self):
+        assert resolve_workers("replicas", 3) == 3
+        assert resolve_workers("batched") == 8
+        assert resolve_workers("replicas") >= 1
+
+    def test_replica_model_options_partition_threads(self, monkeypatch):
+        monkeypatch.setattr("os.cpu_count", lambda: 16)
+
+        assert replica_model_options(4) == {"num_workers": 4, "cpu_threads": 4}
+        assert replica_model_options(32)["cpu_threads"] == 1
+
+    def test_stats_with_empty_audio(self):
+        stats = ParallelTranscriptionStats("replicas", 2, 1, 0.0, 0.5)
+
+        assert stats.real_time_factor == 0.0
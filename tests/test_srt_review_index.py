@@ -0,0 +1,185 @@
+"""Tests for the review navigation index over subtitle words."""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from audio_visualizer.srt.core.reviewIndex import ReviewIndex
+from audio_visualizer.srt.models import WordItem
+from audio_visualizer.ui.tabs.srtEdit.document import SubtitleDocument, SubtitleEntry
+
+
+def _entries(count: int, seed: int = 3) -> list[SubtitleEntry]:
+    rng = random.Random(seed)
+    entries, t = [], 0.0
+    for i in range(count):
+        words = []
+        for j in range(rng.randint(0, 5)):
+            conf = None if rng.random() < 0.1 else round(rng.random(), 2)
+            words.append(WordItem(start=round(t, 3), end=round(t + 0.2, 3), text=f"w{i}_{j}", confidence=conf))
+            t += 0.25
+        entries.append(SubtitleEntry(
+            index=i + 1,
+            start_ms=int(t * 1000),
+            end_ms=int(t * 1000) + 500,
+            text=" ".join(w.text for w in words),
+            speaker=rng.choice(["A", "B", None]),
+            words=words,
+            alignment_status=rng.choice([None, "matched", "estimated"]),
+        ))
+        t += 0.5
+    return entries
+
+
+def _flat(entries):
+    return [(e, w, word) for e, entry in enumerate(entries) for w, word in enumerate(entry.words)]
+
+
+class TestReviewIndexQueries:
+    """Index answers match linear scans."""
+
+    def test_low_confidence_navigation(self):
+        entries = _entries(300)
+        index = ReviewIndex.from_entries(entries)
+        flat = _flat(entries)
+        assert index.word_count == len(flat)
+        for threshold in (0.1, 0.5, 0.9):
+            low = [p for p, (_, _, w) in enumerate(flat) if w.confidence is not None and w.confidence < threshold]
+            assert index.low_confidence_count(threshold) == len(low)
+            for pos in range(-1, len(flat) + 1):
+                expect_next = next((p for p in low if p > pos), -1)
+                expect_prev = next((p for p in reversed(low) if p < pos), -1)
+                assert index.next_low_confidence(pos, threshold) == expect_next
+                assert index.prev_low_confidence(pos, threshold) == expect_prev
+
+    def test_position_mapping_and_lowest(self):
+        entries = _entries(120)
+        index = ReviewIndex.from_entries(entries)
+        for pos, (e, w, _) in enumerate(_flat(entries)):
+            assert index.word_ref(pos) == (e, w)
+            assert index.word_position(e, w) == pos
+        confs = [word.confidence for _, _, word in _flat(entries)]
+        lowest = index.lowest_confidence(10)
+        assert [confs[p] for p in lowest] == sorted(c for c in confs if c is not None)[:10]
+
+    def test_time_lookup(self):
+        entries = _entries(100)
+        index = ReviewIndex.from_entries(entries)
+        starts = [word.start for _, _, word in _flat(entries)]
+        for t in (-1.0, 0.0, 0.1, 3.75, starts[len(starts) // 2], starts[-1], starts[-1] + 10):
+            assert index.word_at(t) == max((p for p, s in enumerate(starts) if s <= t), default=-1)
+            assert index.first_word_after(t) == next((p for p, s in enumerate(starts) if s > t), -1)
+
+    def test_speakers_and_estimated(self):
+        entries = _entries(200)
+        index = ReviewIndex.from_entries(entries)
+        speakers = [e.speaker for e in entries]
+        changes = [i for i in range(len(speakers)) if i == 0 or speakers[i] != speakers[i - 1]]
+        estimated = [i for i, e in enumerate(entries) if e.alignment_status == "estimated"]
+        for i in range(-1, len(entries) + 1):
+            assert index.next_speaker_change(i) == next((c for c in changes if c > i), -1)
+            assert index.prev_speaker_change(i) == next((c for c in reversed(changes) if c < i), -1)
+            assert index.next_estimated(i) == next((c for c in estimated if c > i), -1)
+            assert index.prev_estimated(i) == next((c for c in reversed(estimated) if c < i), -1)
+        runs = index.speaker_runs()
+        assert sum(length for _, _, length in runs) == len(entries)
+        assert [first for _, first, _ in runs] == changes
+        assert all(speakers[first] == spk for spk, first, _ in runs)
+
+    def test_empty(self):
+        index = ReviewIndex.from_entries([])
+        assert index.next_low_confidence(-1) == -1
+        assert index.prev_low_confidence(0) == -1
+        assert index.word_at(1.0) == -1
+        assert index.speaker_runs() == []
+
+    def test_from_bundle(self):
+        entries = _entries(20)
+        bundle = {"subtitles": [
+            {"speaker_label": e.speaker, "alignment_status": e.alignment_status, "words": e.words}
+            for e in entries
+        ]}
+        a, b = ReviewIndex.from_bundle(bundle), ReviewIndex.from_entries(entries)
+        assert a.word_offsets.tolist() == b.word_offsets.tolist()
+        assert a.speaker_runs() == b.speaker_runs()
+
+
+class TestIncrementalUpdates:
+    """Edits update the index in place or invalidate it."""
+
+    def test_speaker_and_word_updates_match_rebuild(self):
+        entries = _entries(80)
+        index = ReviewIndex.from_entries(entries)
+        rng = random.Random(11)
+        for _ in range(60):
+            e = rng.randrange(len(entries))
+            speaker = rng.choice(["A", "B", None])
+            entries[e].speaker = speaker
+            index.set_speaker(e, speaker)
+            if entries[e].words:
+                w = rng.randrange(len(entries[e].words))
+                entries[e].words[w].start = rng.uniform(0, 100)
+                index.update_word(e, w, entries[e].words[w].start)
+        fresh = ReviewIndex.from_entries(entries)
+        assert index.speaker_runs() == fresh.speaker_runs()
+        for t in (0.0, 25.0, 50.0, 99.0):
+            assert index.word_at(t) == fresh.word_at(t)
+            assert index.first_word_after(t) == fresh.first_word_after(t)
+
+    def test_document_updates_in_place(self):
+        doc = SubtitleDocument()
+        doc._entries = _entries(50)
+        index = doc.review_index
+        doc.update_entry(3, speaker="Z")
+        assert doc.review_index is index
+        assert index.next_speaker_change(2) == 3
+        e = next(i for i, entry in enumerate(doc.entries) if entry.words)
+        doc.update_word(e, 0, start=500.0)
+        assert doc.review_index is index
+        assert index.first_word_after(400.0) == index.word_position(e, 0)
+        assert index.speaker_runs() == ReviewIndex.from_entries(doc.entries).speaker_runs()
+
+    def test_document_structural_edits_rebuild(self):
+        doc = SubtitleDocument()
+        doc._entries = _entries(50)
+        index = doc.review_index
+        doc.remove_entry(0)
+        assert doc.review_index is not index
+        assert doc.review_index.subtitle_count == 49
+        index = doc.review_index
+        doc._entries = _entries(10)
+        assert doc.review_index is not index
+        assert doc.review_index.subtitle_count == 10
+
+    def test_document_low_confidence_navigation(self):
+        words = [
+            WordItem(start=0.0, end=0.2, text="a", confidence=0.9),
+            WordItem(start=0.3, end=0.5, text="b", confidence=0.2),
+        ]
+        more = [WordItem(start=1.0, end=1.2, text="c", confidence=0.4)]
+        doc = SubtitleDocument()
+        doc.add_entry(SubtitleEntry(index=1, start_ms=0, end_ms=500, text="a b", words=words))
+        doc.add_entry(SubtitleEntry(index=2, start_ms=1000, end_ms=1200, text="c", words=more))
+        assert doc.next_low_confidence_word(-1) == (0, 1)
+        assert doc.next_low_confidence_word(0, 1) == (1, 0)
+        assert doc.next_low_confidence_word(1, 0) is None
+        assert doc.next_low_confidence_word(1, -1) == (1, 0)
+        assert doc.prev_low_confidence_word(2) == (1, 0)
+        assert doc.prev_low_confidence_word(1) == (0, 1)
+        assert doc.prev_low_confidence_word(0, 1) is None
+        assert doc.next_low_confidence_word(0, 1, threshold=0.3) is None
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 7, 8, 9])
+def test_small_sizes(count):
+    entries = [
+        SubtitleEntry(index=i + 1, start_ms=i * 1000, end_ms=i * 1000 + 500, text="x",
+                      words=[WordItem(start=float(i), end=i + 0.5, text="x", confidence=0.1 * i)])
+        for i in range(count)
+    ]
+    index = ReviewIndex.from_entries(entries)
+    assert [index.next_low_confidence(p, 0.35) for p in range(-1, count)] == [
+        next((q for q in range(p + 1, count) if 0.1 * q < 0.35), -1) for p in range(-1, count)
+    ]
+    assert index.prev_low_confidence(count, 1.0) == count - 1
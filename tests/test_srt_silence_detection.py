@@ -0,0 +1,130 @@
+"""Tests for the srt.io.silenceDetection module."""
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from audio_visualizer.srt.io.audioHelpers import decode_audio_16k_mono, detect_silences_ffmpeg
+from audio_visualizer.srt.io.silenceDetection import SilenceDetector, find_silences
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURE_DIR = ROOT / "tests" / "fixtures" / "srt" / "audio"
+RATE = 16000
+
+
+def _tone(seconds, amplitude=0.4, freq=300.0):
+    t = np.arange(int(seconds * RATE)) / RATE
+    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+
+def _quiet(seconds, amplitude=0.0):
+    return np.full(int(seconds * RATE), amplitude, dtype=np.float32)
+
+
+class TestFindSilences:
+    """Tests for find_silences."""
+
+    def test_detects_gap_between_tones(self):
+        samples = np.concatenate([_tone(1.0), _quiet(0.8), _tone(1.0)])
+
+        result = find_silences(samples, RATE, min_silence_dur=0.5, silence_threshold_db=-35.0)
+
+        assert len(result) == 1
+        assert result[0] == pytest.approx((1.0, 1.8), abs=0.011)
+
+    def test_drops_silences_shorter_than_min_duration(self):
+        samples = np.concatenate([_tone(1.0), _quiet(0.3), _tone(1.0)])
+
+        assert find_silences(samples, RATE, min_silence_dur=0.5, silence_threshold_db=-35.0) == []
+
+    def test_leading_and_trailing_silence(self):
+        samples = np.concatenate([_quiet(0.6), _tone(1.0), _quiet(0.7)])
+
+        result = find_silences(samples, RATE, min_silence_dur=0.5, silence_threshold_db=-35.0)
+
+        assert len(result) == 2
+        assert result[0] == pytest.approx((0.0, 0.6), abs=0.011)
+        assert result[1] == pytest.approx((1.6, 2.3), abs=0.011)
+        assert result[1][1] == pytest.approx(len(samples) / RATE)
+
+    def test_all_silent_input(self):
+        result = find_silences(_quiet(2.0), RATE, min_silence_dur=0.5, silence_threshold_db=-35.0)
+
+        assert result == [(0.0, 2.0)]
+
+    def test_empty_input(self):
+        assert find_silences(np.zeros(0, dtype=np.float32), RATE, min_silence_dur=0.1, silence_threshold_db=-35.0) == []
+
+    def test_hysteresis_bridges_level_flicker(self):
+        # -34 dB blips sit between the threshold (-35) and threshold + 2 dB
+        blip = _tone(0.05, amplitude=10 ** (-34 / 20))
+        gap = np.concatenate([_quiet(0.4), blip, _quiet(0.4)])
+        samples = np.concatenate([_tone(1.0), gap, _tone(1.0)])
+
+        split = find_silences(samples, RATE, min_silence_dur=0.3, silence_threshold_db=-35.0, hysteresis_db=0.0)
+        bridged = find_silences(samples, RATE, min_silence_dur=0.3, silence_threshold_db=-35.0, hysteresis_db=2.0)
+
+        assert len(split) == 2
+        assert len(bridged) == 1
+        assert bridged[0] == pytest.approx((1.0, 1.85), abs=0.011)
+
+    def test_rms_level_is_more_permissive_than_peak(self):
+        # Sparse clicks: peak level -20 dB, RMS level far below -35 dB
+        noise = _quiet(1.0)
+        noise[::800] = 0.1
+        samples = np.concatenate([_tone(1.0), noise, _tone(1.0)])
+
+        peak = find_silences(samples, RATE, min_silence_dur=0.5, silence_threshold_db=-35.0)
+        rms = find_silences(samples, RATE, min_silence_dur=0.5, silence_threshold_db=-35.0, level="rms")
+
+        assert peak == []
+        assert len(rms) == 1
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            SilenceDetector(0, min_silence_dur=0.5, silence_threshold_db=-35.0)
+        with pytest.raises(ValueError):
+            SilenceDetector(RATE, min_silence_dur=0.5, silence_threshold_db=-35.0, hysteresis_db=-1.0)
+        with pytest.raises(ValueError):
+            SilenceDetector(RATE, min_silence_dur=0.5, silence_threshold_db=-35.0, level="lufs")
+
+
+class TestSilenceDetectorStreaming:
+    """Tests for block-wise feeding."""
+
+    @pytest.mark.parametrize("block_size", [1, 97, 160, 4096, 16000])
+    def test_blocks_match_single_pass(self, block_size):
+        rng = np.random.default_rng(7)
+        parts = []
+        for _ in range(6):
+            parts.append(_tone(rng.uniform(0.3, 1.0)))
+            parts.append(_quiet(rng.uniform(0.1, 0.9), amplitude=1e-4))
+        samples = np.concatenate(parts)
+        expected = find_silences(samples, RATE, min_silence_dur=0.2, silence_threshold_db=-35.0)
+
+        detector = SilenceDetector(RATE, min_silence_dur=0.2, silence_threshold_db=-35.0)
+        for start in range(0, len(samples), block_size):
+            detector.feed(samples[start:start + block_size])
+
+        assert detector.finish() == expected
+        assert len(expected) >= 3
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="requires ffmpeg")
+class TestMatchesFfmpegSilencedetect:
+    """The native detector reproduces FFmpeg's intervals within one frame."""
+
+    @pytest.mark.parametrize("name", sorted(p.name for p in FIXTURE_DIR.glob("*.wav")))
+    @pytest.mark.parametrize("threshold_db, min_dur", [(-35.0, 0.2), (-40.0, 0.3), (-30.0, 0.5), (-25.0, 0.3)])
+    def test_fixture_intervals(self, name, threshold_db, min_dur):
+        audio = decode_audio_16k_mono(str(FIXTURE_DIR / name))
+
+        expected = detect_silences_ffmpeg(audio, min_silence_dur=min_dur, silence_threshold_db=threshold_db)
+        result = find_silences(
+            audio.samples, audio.sample_rate, min_silence_dur=min_dur, silence_threshold_db=threshold_db
+        )
+
+        assert len(result) == len(expected)
+        for got, ref in zip(result, expected):
+            assert got == pytest.approx(ref, abs=0.011)
@@ -5,12 +5,16 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
+import wave
 from pathlib import Path
 from types import SimpleNamespace
 
+import numpy as np
+
 from audio_visualizer.events import AppEventEmitter, EventType
 from audio_visualizer.srt import ModelManager, transcribe_file
 from audio_visualizer.srt.config import PRESETS, apply_overrides
+from audio_visualizer.srt.io.audioHelpers import DecodedAudio
 from audio_visualizer.srt.models import ResolvedConfig
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -62,10 +66,9 @@ def _patch_srt_pipeline(monkeypatch) -> None:
     monkeypatch.setattr(pipeline_module, "ffmpeg_ok", lambda: True)
     monkeypatch.setattr(
         pipeline_module,
-        "to_wav_16k_mono",
-        lambda _input_path, output_path: Path(output_path).write_bytes(b"RIFFFAKEWAVE"),
+        "decode_audio_16k_mono",
+        lambda _input_path: DecodedAudio(samples=np.zeros(19200, dtype=np.float32)),
     )
-    monkeypatch.setattr(pipeline_module, "probe_duration_seconds", lambda _path: 1.2)
     monkeypatch.setattr(pipeline_module, "detect_silences", lambda *_args, **_kwargs: [])
 
 
@@ -163,6 +166,92 @@ class TestSrtApiSmoke:
         assert EventType.PROGRESS in event_types
         assert EventType.JOB_COMPLETE in event_types
 
+    def test_transcribe_file_decodes_once_in_memory(self, monkeypatch, tmp_path):
+        """The model receives the decoded array and no WAV is written by default."""
+        _patch_srt_pipeline(monkeypatch)
+        model = _FakeModel()
+        calls = []
+        original = model.transcribe
+        monkeypatch.setattr(model, "transcribe", lambda audio, **kw: calls.append(audio) or original())
+
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+        result = transcribe_file(
+            input_path=FIXTURE_AUDIO,
+            output_path=tmp_path / "output.srt",
+            fmt="srt",
+            cfg=ResolvedConfig(),
+            model=model,
+            device_used="cpu",
+            compute_type_used="int8",
+            tmpdir=work_dir,
+        )
+
+        assert result.success is True
+        assert isinstance(calls[0], np.ndarray)
+        assert list(work_dir.iterdir()) == []
+
+    def test_transcribe_file_keep_wav_writes_decoded_audio(self, monkeypatch, tmp_path):
+        _patch_srt_pipeline(monkeypatch)
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+
+        result = transcribe_file(
+            input_path=FIXTURE_AUDIO,
+            output_path=tmp_path / "output.srt",
+            fmt="srt",
+            cfg=ResolvedConfig(),
+            model=_FakeModel(),
+            device_used="cpu",
+            compute_type_used="int8",
+            keep_wav=True,
+            tmpdir=work_dir,
+        )
+
+        assert result.success is True
+        kept = list(work_dir.glob("srtgen_*.wav"))
+        assert len(kept) == 1
+        with wave.open(str(kept[0]), "rb") as wav_file:
+            assert wav_file.getframerate() == 16000
+            assert wav_file.getnframes() == 19200
+
+    def test_transcribe_file_parallel_mode_reports_real_time_factor(self, monkeypatch, tmp_path):
+        from audio_visualizer.srt.core import pipeline as pipeline_module
+
+        _patch_srt_pipeline(monkeypatch)
+        calls = []
+
+        def fake_parallel(model, audio, **kwargs):
+            calls.append(kwargs)
+            segments, _info = model.transcribe(audio.samples)
+            return list(segments), SimpleNamespace(mode="replicas", workers=2, chunks=3)
+
+        monkeypatch.setattr(pipeline_module, "transcribe_parallel", fake_parallel)
+        emitter = AppEventEmitter()
+        received = []
+        emitter.subscribe(received.append)
+
+        cfg = apply_overrides(ResolvedConfig(), {"transcription": {"parallel_mode": "replicas", "parallel_workers": 2}})
+        result = transcribe_file(
+            input_path=FIXTURE_AUDIO,
+            output_path=tmp_path / "output.srt",
+            fmt="srt",
+            cfg=cfg,
+            model=_FakeModel(),
+            device_used="cpu",
+            compute_type_used="int8",
+            emitter=emitter,
+        )
+
+        assert result.success is True
+        assert calls[0]["mode"] == "replicas"
+        assert calls[0]["workers"] == 2
+        assert calls[0]["silences"] == []
+        assert calls[0]["word_timestamps"] is True
+        complete = [e for e in received if e.message.startswith("Transcription complete")]
+        assert "RTF" in complete[0].message
+        assert "real_time_factor" in complete[0].data
+
 
 class TestSrtMissingBinarySmoke:
     def test_transcribe_file_reports_missing_ffmpeg(self, monkeypatch, tmp_path):
@@ -0,0 +1,251 @@
+"""Tests for streaming subtitle output during transcription."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from audio_visualizer.srt import transcribe_file
+from audio_visualizer.srt.config import PRESETS, apply_overrides
+from audio_visualizer.srt.core.streamingOutput import StreamingSubtitleWriter
+from audio_visualizer.srt.core.subtitleGeneration import (
+    apply_silence_alignment,
+    chunk_words_to_subtitles,
+    collect_words,
+    hygiene_and_polish,
+)
+from audio_visualizer.srt.io.audioHelpers import DecodedAudio
+from audio_visualizer.srt.io.outputWriters import write_ass, write_srt, write_vtt
+from audio_visualizer.srt.models import ResolvedConfig
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURE_AUDIO = ROOT / "tests" / "fixtures" / "srt" / "audio" / "single_sentence.wav"
+
+_VOCAB = "the quick brown fox jumps over a lazy dog. Hello, world! yes no maybe".split()
+
+
+def _recording(seed: int, segment_count: int = 80):
+    """Segments with word timing plus silences between some words."""
+    rng = random.Random(seed)
+    segments, silences, t = [], [], 0.0
+    for _ in range(segment_count):
+        words = []
+        for _ in range(rng.randint(3, 12)):
+            dur = rng.uniform(0.15, 0.5)
+            words.append(SimpleNamespace(start=t, end=t + dur, word=" " + rng.choice(_VOCAB)))
+            t += dur
+            if rng.random() < 0.1:
+                pause = rng.uniform(0.3, 1.2)
+                silences.append((t + 0.02, t + pause - 0.02))
+                t += pause
+            else:
+                t += rng.uniform(0.0, 0.1)
+        segments.append(SimpleNamespace(
+            start=words[0].start, end=words[-1].end,
+            text="".join(w.word for w in words), words=words,
+        ))
+    return segments, silences
+
+
+def _final_subs(segments, silences, cfg):
+    subs = chunk_words_to_subtitles(collect_words(segments), cfg, silences)
+    subs = apply_silence_alignment(subs, silences)
+    return hygiene_and_polish(
+        subs, min_gap=cfg.formatting.min_gap, pad=cfg.formatting.pad, silence_intervals=silences,
+    )
+
+
+class TestStreamingSubtitleWriter:
+    @pytest.mark.parametrize("preset", ["yt", "shorts", "podcast"])
+    def test_streamed_srt_is_a_prefix_of_the_final_output(self, tmp_path, preset):
+        cfg = apply_overrides(ResolvedConfig(), PRESETS[preset])
+        segments, silences = _recording(seed=3)
+
+        writer = StreamingSubtitleWriter(tmp_path / "stream.srt", "srt", cfg, silences)
+        for seg in segments:
+            writer.add_segment(seg)
+        writer.close()
+
+        write_srt(_final_subs(segments, silences, cfg), tmp_path / "final.srt",
+                  max_chars=cfg.formatting.max_chars, max_lines=cfg.formatting.max_lines)
+        streamed = writer.partial_path.read_text(encoding="utf-8")
+        final = (tmp_path / "final.srt").read_text(encoding="utf-8")
+
+        assert writer.committed > 10
+        assert final.startswith(streamed)
+
+    @pytest.mark.parametrize("fmt, write", [("vtt", write_vtt), ("ass", write_ass)])
+    def test_headers_and_entries_match_the_batch_writers(self, tmp_path, fmt, write):
+        cfg = ResolvedConfig()
+        segments, silences = _recording(seed=5)
+
+        writer = StreamingSubtitleWriter(tmp_path / f"stream.{fmt}", fmt, cfg, silences)
+        for seg in segments:
+            writer.add_segment(seg)
+        writer.close()
+
+        write(_final_subs(segments, silences, cfg), tmp_path / f"final.{fmt}",
+              max_chars=cfg.formatting.max_chars, max_lines=cfg.formatting.max_lines)
+        final = (tmp_path / f"final.{fmt}").read_text(encoding="utf-8")
+        assert writer.committed > 0
+        assert final.startswith(writer.partial_path.read_text(encoding="utf-8"))
+
+    def test_open_run_is_not_committed(self, tmp_path):
+        segments, _silences = _recording(seed=1, segment_count=10)
+        writer = StreamingSubtitleWriter(tmp_path / "stream.srt", "srt", ResolvedConfig(), [])
+        for seg in segments:
+            assert writer.add_segment(seg) == 0  # No silence ever closes the run
+        writer.close()
+        assert writer.partial_path.read_text(encoding="utf-8") == ""
+
+    def test_existing_output_is_replaced_only_on_finish(self, tmp_path):
+        segments, silences = _recording(seed=3)
+        output = tmp_path / "stream.srt"
+        output.write_text("previous", encoding="utf-8")
+
+        writer = StreamingSubtitleWriter(output, "srt", ResolvedConfig(), silences)
+        for seg in segments:
+            writer.add_segment(seg)
+        assert writer.partial_path == tmp_path / "stream.srt.partial"
+        assert output.read_text(encoding="utf-8") == "previous"
+        writer.discard()
+        assert output.read_text(encoding="utf-8") == "previous"
+        assert not writer.partial_path.exists()
+
+        writer = StreamingSubtitleWriter(output, "srt", ResolvedConfig(), silences)
+        for seg in segments:
+            writer.add_segment(seg)
+        streamed = writer.partial_path.read_text(encoding="utf-8")
+        writer.finish()
+        assert output.read_text(encoding="utf-8") == streamed
+        assert not writer.partial_path.exists()
+
+    def test_rejects_json(self, tmp_path):
+        with pytest.raises(ValueError, match="json"):
+            StreamingSubtitleWriter(tmp_path / "out.json", "json", ResolvedConfig(), [])
+
+
+class _StreamingModel:
+    """Yields segments, recording the output file size before each one."""
+
+    def __init__(self, segments, output_path):
+        self.segments = segments
+        self.output_path = output_path
+        self.sizes = []
+
+    def transcribe(self, *_args, **_kwargs):
+        def gen():
+            for seg in self.segments:
+                self.sizes.append(self.output_path.stat().st_size if self.output_path.exists() else -1)
+                yield seg
+        return gen(), SimpleNamespace(language="en")
+
+
+class TestPipelineStreaming:
+    def _patch(self, monkeypatch, silences, duration):
+        from audio_visualizer.srt.core import pipeline as pipeline_module
+
+        monkeypatch.setattr(pipeline_module, "ffmpeg_ok", lambda: True)
+        monkeypatch.setattr(
+            pipeline_module,
+            "decode_audio_16k_mono",
+            lambda _input_path: DecodedAudio(samples=np.zeros(int(duration * 16000), dtype=np.float32)),
+        )
+        monkeypatch.setattr(pipeline_module, "detect_silences", lambda *_args, **_kwargs: silences)
+        monkeypatch.setattr(pipeline_module, "_open_correction_db", lambda: None)
+
+    def test_output_grows_during_transcription_and_matches_batch_run(self, monkeypatch, tmp_path):
+        segments, silences = _recording(seed=7, segment_count=40)
+        self._patch(monkeypatch, silences, segments[-1].end + 1.0)
+
+        results = {}
+        for name, stream in (("streamed.srt", True), ("batch.srt", False)):
+            output = tmp_path / name
+            model = _StreamingModel(segments, tmp_path / f"{name}.partial" if stream else output)
+            results[name] = (
+                transcribe_file(
+                    input_path=FIXTURE_AUDIO,
+                    output_path=output,
+                    fmt="srt",
+                    cfg=ResolvedConfig(),
+                    model=model,
+                    device_used="cpu",
+                    compute_type_used="int8",
+                    stream_output=stream,
+                ),
+                model.sizes,
+            )
+
+        streamed_result, sizes = results["streamed.srt"]
+        assert streamed_result.success
+        assert sizes[0] == 0 and sizes[-1] > 0  # Partial output while the model ran
+        assert results["batch.srt"][1][-1] == -1
+        assert (tmp_path / "streamed.srt").read_text(encoding="utf-8") == (
+            tmp_path / "batch.srt"
+        ).read_text(encoding="utf-8")
+        assert not (tmp_path / "streamed.srt.partial").exists()
+
+    def test_failed_run_keeps_previous_output(self, monkeypatch, tmp_path):
+        segments, silences = _recording(seed=7, segment_count=40)
+        self._patch(monkeypatch, silences, segments[-1].end + 1.0)
+        output = tmp_path / "out.srt"
+        output.write_text("previous", encoding="utf-8")
+
+        class FailingModel(_StreamingModel):
+            def transcribe(self, *args, **kwargs):
+                inner, info = super().transcribe(*args, **kwargs)
+
+                def gen():
+                    for i, seg in enumerate(inner):
+                        if i == 30:
+                            raise RuntimeError("decoder failed")
+                        yield seg
+                return gen(), info
+
+        model = FailingModel(segments, tmp_path / "out.srt.partial")
+        result = transcribe_file(
+            input_path=FIXTURE_AUDIO,
+            output_path=output,
+            fmt="srt",
+            cfg=ResolvedConfig(),
+            model=model,
+            device_used="cpu",
+            compute_type_used="int8",
+            stream_output=True,
+        )
+
+        assert not result.success
+        assert model.sizes[-1] > 0
+        assert output.read_text(encoding="utf-8") == "previous"
+        assert not (tmp_path / "out.srt.partial").exists()
+
+    def test_unsupported_configuration_logs_and_writes_at_end(self, monkeypatch, tmp_path):
+        from audio_visualizer.events import AppEventEmitter
+
+        segments, silences = _recording(seed=7, segment_count=5)
+        self._patch(monkeypatch, silences, segments[-1].end + 1.0)
+        emitter = AppEventEmitter()
+        messages = []
+        emitter.subscribe(lambda event: messages.append(event.message))
+
+        output = tmp_path / "out.json"
+        model = _StreamingModel(segments, output)
+        result = transcribe_file(
+            input_path=FIXTURE_AUDIO,
+            output_path=output,
+            fmt="json",
+            cfg=ResolvedConfig(),
+            model=model,
+            device_used="cpu",
+            compute_type_used="int8",
+            emitter=emitter,
+            stream_output=True,
+        )
+
+        assert result.success
+        assert set(model.sizes) == {-1}
+        assert any(m.startswith("Streaming output disabled") for m in messages)
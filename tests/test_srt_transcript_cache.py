@@ -0,0 +1,175 @@
+"""Tests for the persistent transcript cache."""
+
+from __future__ import annotations
+
+import dataclasses
+import gzip
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from audio_visualizer.srt import transcribe_file
+from audio_visualizer.srt.io.audioHelpers import DecodedAudio
+from audio_visualizer.srt.io.transcriptCache import (
+    TranscriptCache,
+    audio_fingerprint,
+    make_cache_key,
+)
+from audio_visualizer.srt.models import ResolvedConfig, SilenceConfig, TranscriptionConfig
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURE_AUDIO = ROOT / "tests" / "fixtures" / "srt" / "audio" / "single_sentence.wav"
+
+
+def _segments():
+    return [
+        SimpleNamespace(
+            id=1, seek=0, start=0.0, end=1.2, text=" Hello world.",
+            avg_logprob=-0.2, compression_ratio=1.1, no_speech_prob=0.01,
+            temperature=0.0,
+            words=[
+                SimpleNamespace(start=0.0, end=0.5, word=" Hello", probability=0.9),
+                SimpleNamespace(start=0.5, end=1.2, word=" world.", probability=np.float32(0.75)),
+            ],
+        ),
+        SimpleNamespace(id=2, seek=0, start=1.5, end=2.0, text=" Bye.", words=None),
+    ]
+
+
+def _key(**overrides):
+    kwargs = dict(
+        model_name="small",
+        lora_name=None,
+        language="en",
+        compute_type="int8",
+        transcription=TranscriptionConfig(),
+        silence=SilenceConfig(),
+    )
+    kwargs.update(overrides)
+    return make_cache_key("abc", **kwargs)
+
+
+class TestCacheKey:
+    def test_fingerprint_depends_on_samples(self):
+        a = np.zeros(1600, dtype=np.float32)
+        b = a.copy()
+        b[10] = 0.5
+        assert audio_fingerprint(a) == audio_fingerprint(a.copy())
+        assert audio_fingerprint(a) != audio_fingerprint(b)
+
+    def test_model_and_transcription_settings_change_the_key(self):
+        base = _key()
+        assert _key() == base
+        assert _key(model_name="medium") != base
+        assert _key(lora_name="my-voice") != base
+        assert _key(language=None) != base
+        assert _key(compute_type="float16") != base
+        assert _key(transcription=TranscriptionConfig(vad_filter=False)) != base
+        assert _key(transcription=TranscriptionConfig(initial_prompt="Names")) != base
+
+    def test_silence_settings_only_matter_for_parallel_inference(self):
+        quiet = SilenceConfig(silence_min_dur=0.9)
+        assert _key(silence=quiet) == _key()
+
+        parallel = TranscriptionConfig(parallel_mode="replicas")
+        assert _key(transcription=parallel, silence=quiet) != _key(transcription=parallel)
+
+
+class TestTranscriptCache:
+    def test_roundtrip(self, tmp_path):
+        cache = TranscriptCache(tmp_path)
+        assert cache.get("k") is None
+
+        cache.put("k", _segments())
+        got = cache.get("k")
+
+        assert [s.text for s in got] == [" Hello world.", " Bye."]
+        assert got[0].avg_logprob == -0.2
+        assert [(w.start, w.end, w.word) for w in got[0].words] == [
+            (0.0, 0.5, " Hello"), (0.5, 1.2, " world."),
+        ]
+        assert got[0].words[1].probability == 0.75
+        assert got[1].words is None
+        got[0].speaker = "SPEAKER_00"  # Diarization annotates segments
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = TranscriptCache(tmp_path)
+        for i, key in enumerate(("a", "b", "c")):
+            cache.put(key, _segments())
+            os.utime(cache._path(key), (1000 + i, 1000 + i))
+        cache.get("a")  # Now the most recently used
+
+        cache.max_bytes = cache.size_bytes() - 1
+        assert cache.evict() == 1
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_corrupt_entry_is_discarded(self, tmp_path):
+        cache = TranscriptCache(tmp_path)
+        cache.put("k", _segments())
+        with gzip.open(cache._path("k"), "wb") as fh:
+            fh.write(b"{not json")
+
+        assert cache.get("k") is None
+        assert not cache._path("k").exists()
+
+    def test_clear(self, tmp_path):
+        cache = TranscriptCache(tmp_path)
+        cache.put("a", _segments())
+        cache.put("b", _segments())
+        assert cache.clear() == 2
+        assert cache.size_bytes() == 0
+
+
+class _CountingModel:
+    def __init__(self):
+        self.calls = 0
+
+    def transcribe(self, *_args, **_kwargs):
+        self.calls += 1
+        return iter(_segments()), SimpleNamespace(language="en")
+
+
+class TestPipelineCache:
+    def _run(self, tmp_path, model, cache, cfg, name):
+        return transcribe_file(
+            input_path=FIXTURE_AUDIO,
+            output_path=tmp_path / name,
+            fmt="srt",
+            cfg=cfg,
+            model=model,
+            device_used="cpu",
+            compute_type_used="int8",
+            transcript_cache=cache,
+            model_name="small",
+        )
+
+    def test_formatting_only_rerun_skips_the_model(self, monkeypatch, tmp_path):
+        from audio_visualizer.srt.core import pipeline as pipeline_module
+
+        monkeypatch.setattr(pipeline_module, "ffmpeg_ok", lambda: True)
+        monkeypatch.setattr(
+            pipeline_module,
+            "decode_audio_16k_mono",
+            lambda _input_path: DecodedAudio(samples=np.zeros(32000, dtype=np.float32)),
+        )
+        monkeypatch.setattr(pipeline_module, "detect_silences", lambda *_args, **_kwargs: [])
+
+        cache = TranscriptCache(tmp_path / "cache")
+        model = _CountingModel()
+        first = self._run(tmp_path, model, cache, ResolvedConfig(), "first.srt")
+
+        cfg = ResolvedConfig()
+        cfg.formatting = dataclasses.replace(cfg.formatting, max_chars=12)
+        second = self._run(tmp_path, model, cache, cfg, "second.srt")
+
+        assert first.success and second.success
+        assert model.calls == 1
+        assert "Hello" in (tmp_path / "second.srt").read_text(encoding="utf-8")
+
+        cfg.transcription.vad_filter = not cfg.transcription.vad_filter
+        assert self._run(tmp_path, model, cache, cfg, "third.srt").success
+        assert model.calls == 2
@@ -0,0 +1,205 @@
+"""Tests for audio_visualizer.startup (lazy imports, import costs, warm-up)."""
+import os
+import subprocess
+import sys
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+from audio_visualizer import startup
+from audio_visualizer.srt import srtApi
+
+
+@pytest.fixture
+def fake_module(tmp_path, monkeypatch):
+    name = "_startup_fake_heavy"
+    (tmp_path / f"{name}.py").write_text("VALUE = 42\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, name, raising=False)
+    yield name
+    sys.modules.pop(name, None)
+
+
+class TestLazyImport:
+    def test_defers_until_attribute_access(self, fake_module):
+        proxy = startup.lazy_import(fake_module)
+        assert isinstance(proxy, startup.LazyModule)
+        assert fake_module not in sys.modules
+        assert not proxy.is_loaded
+        assert proxy.VALUE == 42
+        assert proxy.is_loaded
+        assert fake_module in sys.modules
+        recorded = [c for c in startup.import_costs() if c.module == fake_module]
+        assert recorded and not recorded[-1].already_loaded
+
+    def test_caches_looked_up_attributes(self, fake_module):
+        proxy = startup.lazy_import(fake_module)
+        assert "VALUE" not in proxy.__dict__
+        assert proxy.VALUE == 42
+        assert proxy.__dict__["VALUE"] == 42
+
+    def test_returns_loaded_module_directly(self):
+        assert startup.lazy_import("json") is sys.modules["json"]
+
+    def test_missing_module_raises_on_access(self):
+        proxy = startup.lazy_import("_startup_missing_module")
+        with pytest.raises(ImportError):
+            proxy.anything
+
+    def test_concurrent_access_imports_once(self, fake_module):
+        before = len(startup.import_costs())
+        proxy = startup.lazy_import(fake_module)
+        values = []
+        threads = [threading.Thread(target=lambda: values.append(proxy.VALUE)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert values == [42] * 8
+        assert [c.module for c in startup.import_costs()[before:]] == [fake_module]
+
+
+class TestImportCosts:
+    def test_measure_import(self, fake_module):
+        cost = startup.measure_import(fake_module)
+        assert cost.module == fake_module and cost.error is None and not cost.already_loaded
+        again = startup.measure_import(fake_module)
+        assert again.already_loaded and again.seconds == 0.0
+
+    def test_measure_import_failure_is_reported(self):
+        cost = startup.measure_import("_startup_missing_module")
+        assert cost.error
+
+    def test_marks(self):
+        first = startup.mark("test_mark")
+        assert startup.mark("test_mark") >= first
+        assert startup.startup_marks()["test_mark"] == first
+
+
+class TestRunWarmup:
+    def test_runs_tasks_and_reports(self, monkeypatch):
+        def boom(options):
+            raise RuntimeError("no encoder")
+
+        monkeypatch.setitem(startup.WARMUP_TASKS, "a", lambda options: f"a {options.get('x')}")
+        monkeypatch.setitem(startup.WARMUP_TASKS, "b", boom)
+        seen = []
+        results = startup.run_warmup(["a", "unknown", "b"], {"a": {"x": 1}}, on_result=seen.append)
+        assert [(r.task, r.ok, r.detail) for r in results] == [("a", True, "a 1"), ("b", False, "no encoder")]
+        assert seen == results
+
+    def test_cancel_stops_before_next_task(self, monkeypatch):
+        cancel = threading.Event()
+
+        def first(options):
+            cancel.set()
+            return ""
+
+        monkeypatch.setitem(startup.WARMUP_TASKS, "a", first)
+        monkeypatch.setitem(startup.WARMUP_TASKS, "b", lambda options: "")
+        results = startup.run_warmup(["a", "b"], cancel_event=cancel)
+        assert [r.task for r in results] == ["a"]
+
+
+class TestPreloadModel:
+    @pytest.fixture
+    def fake_whisper(self, monkeypatch):
+        fw = types.ModuleType("faster_whisper")
+        fw.WhisperModel = object
+        utils = types.ModuleType("faster_whisper.utils")
+        utils.download_model = lambda name, local_files_only=False: "/models/" + name
+        fw.utils = utils
+        monkeypatch.setitem(sys.modules, "faster_whisper", fw)
+        monkeypatch.setitem(sys.modules, "faster_whisper.utils", utils)
+        monkeypatch.setattr(
+            "audio_visualizer.srt.core.whisperWrapper._check_cuda_runtime", lambda: (False, "no cuda")
+        )
+        loads = []
+
+        def fake_init(model_name, device, strict_cuda, emitter=None, **options):
+            loads.append((model_name, device, options))
+            return object(), "cpu", "int8"
+
+        monkeypatch.setattr(srtApi, "init_whisper_model_internal", fake_init)
+        yield loads
+        srtApi.discard_preloaded_models()
+
+    def test_load_model_takes_preloaded_once(self, fake_whisper):
+        model = srtApi.preload_model("base", "auto")
+        assert model is not None
+        assert srtApi.load_model("base", "auto", False)[0] is model
+        assert len(fake_whisper) == 1
+        assert srtApi.load_model("base", "auto", False)[0] is not model
+        assert len(fake_whisper) == 2
+
+    def test_other_loads_discard_the_preload(self, fake_whisper):
+        model = srtApi.preload_model("base", "auto")
+        assert srtApi.load_model("base", "auto", False, num_workers=2)[0] is not model
+        assert srtApi._preloaded == {}
+
+        srtApi.preload_model("base", "auto")
+        assert srtApi.load_model("small", "auto", False)[0] is not model
+        assert srtApi._preloaded == {}
+
+    def test_model_manager_takes_or_discards_the_preload(self, fake_whisper, monkeypatch):
+        from audio_visualizer.srt.modelManager import ModelManager
+
+        monkeypatch.setattr(
+            "audio_visualizer.srt.modelManager.init_whisper_model_internal",
+            srtApi.init_whisper_model_internal,
+        )
+        model = srtApi.preload_model("base", "cpu")
+        assert ModelManager().load("base", "cpu") is model
+        assert len(fake_whisper) == 1
+
+        srtApi.preload_model("base", "cpu")
+        assert ModelManager().load("base", "cpu", num_workers=2) is not model
+        assert srtApi._preloaded == {}
+        assert fake_whisper[-1][2] == {"num_workers": 2}
+
+    def test_discard_drops_a_preload_still_running(self, fake_whisper, monkeypatch):
+        started, release = threading.Event(), threading.Event()
+
+        def slow_init(model_name, device, strict_cuda, emitter=None, **options):
+            started.set()
+            release.wait(5)
+            return object(), "cpu", "int8"
+
+        monkeypatch.setattr(srtApi, "init_whisper_model_internal", slow_init)
+        results = []
+        thread = threading.Thread(target=lambda: results.append(srtApi.preload_model("base", "cpu")))
+        thread.start()
+        assert started.wait(5)
+        srtApi.discard_preloaded_models()
+        release.set()
+        thread.join(5)
+        assert results == [None]
+        assert srtApi._preloaded == {}
+
+    def test_skips_cuda_and_missing_models(self, fake_whisper, monkeypatch):
+        assert srtApi.preload_model("base", "cuda") is None
+
+        def missing(name, local_files_only=False):
+            raise FileNotFoundError(name)
+
+        monkeypatch.setattr(sys.modules["faster_whisper.utils"], "download_model", missing)
+        assert srtApi.preload_model("large-v3", "cpu") is None
+        assert fake_whisper == []
+
+
+def test_window_modules_do_not_import_heavy_dependencies():
+    """The modules imported before the first window stay free of heavy deps."""
+    code = (
+        "import audio_visualizer.visualizer, audio_visualizer.ui.mainWindow, "
+        "audio_visualizer.ui.views.general.generalVisualizerView, audio_visualizer.ui.settingsDialog\n"
+        "from audio_visualizer import startup\n"
+        "print(','.join(startup.loaded_heavy_modules()))\n"
+    )
+    src = Path(__file__).resolve().parents[1] / "src"
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen",
+               PYTHONPATH=os.pathsep.join([str(src), os.environ.get("PYTHONPATH", "")]))
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, timeout=120)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == ""
@@ -795,6 +795,95 @@ class TestCaptionAnimateRenderPreview:
         assert tab._preview_render_btn.isEnabled() is True
 
 
+class _FakeFramePreviewer:
+    def __init__(self):
+        self.prepared = None
+        self.rendered: list[int] = []
+        self.closed = False
+
+    def prepare(self, input_path, config, preset_override=None):
+        from audio_visualizer.caption.captionApi import PreparedSubtitle
+        from audio_visualizer.caption.core.sizing import OverlaySize
+
+        self.prepared = PreparedSubtitle(
+            ass_path=Path(input_path),
+            size=OverlaySize(4, 2),
+            end_ms=9000,
+            duration_sec=9.25,
+        )
+        return self.prepared
+
+    def render_frame(self, time_ms):
+        from audio_visualizer.caption.rendering.framePreview import PreviewFrame
+
+        self.rendered.append(time_ms)
+        return PreviewFrame(time_ms=time_ms, width=4, height=2, rgba=b"\xff" * 32)
+
+    def close(self):
+        self.closed = True
+
+
+class TestCaptionAnimateFramePreview:
+    """Timeline scrubber driving single-frame caption previews."""
+
+    def test_scrubber_disabled_until_prepared(self):
+        tab = CaptionAnimateTab()
+        assert tab._frame_scrubber.isEnabled() is False
+        assert tab._frame_preview_service is None
+
+    def test_prepared_enables_scrubber_with_duration(self):
+        tab = CaptionAnimateTab()
+        requested = []
+        tab._frame_preview_service = MagicMock()
+        tab._frame_preview_service.request_frame.side_effect = requested.append
+
+        tab._on_frame_preview_prepared(12000)
+
+        assert tab._frame_scrubber.isEnabled() is True
+        assert tab._frame_scrubber.maximum() == 12000
+        assert requested == [0]
+
+        tab._frame_scrubber.setValue(4500)
+        assert requested[-1] == 4500
+        assert tab._frame_time_label.text() == "00:04.500"
+
+    def test_frame_ready_shows_pixmap(self):
+        from PySide6.QtGui import QImage
+
+        tab = CaptionAnimateTab()
+        image = QImage(8, 4, QImage.Format.Format_RGBA8888)
+        image.fill(0)
+
+        tab._on_frame_preview_ready(1000, image)
+
+        assert tab._frame_preview_label.pixmap() is not None
+        assert not tab._frame_preview_label.pixmap().isNull()
+
+    def test_failed_frame_reports_message(self):
+        tab = CaptionAnimateTab()
+        tab._on_frame_preview_failed("ffmpeg missing")
+        assert "ffmpeg missing" in tab._frame_preview_label.text()
+
+    def test_service_prepares_and_renders_in_background(self, qtbot, tmp_path):
+        from audio_visualizer.caption.captionApi import RenderConfig
+        from audio_visualizer.ui.tabs.captionPreviewService import CaptionPreviewService
+
+        previewer = _FakeFramePreviewer()
+        service = CaptionPreviewService(previewer=previewer)
+        try:
+            with qtbot.waitSignal(service.prepared, timeout=2000) as prepared:
+                service.prepare(tmp_path / "sample.srt", RenderConfig())
+            assert prepared.args == [9000]
+
+            with qtbot.waitSignal(service.frame_ready, timeout=2000) as ready:
+                service.request_frame(2500)
+            assert ready.args[0] == 2500
+            assert ready.args[1].width() == 4
+        finally:
+            service.close()
+        assert previewer.closed is True
+
+
 class TestCaptionAnimateTabBundleInput:
     """Phase 10.1: Bundle file input support."""
 
@@ -96,6 +96,14 @@ class TestSettingsDialogAccept:
         dialog._on_accept()
         assert dialog.result_settings["project_folder"] == "/tmp/project"
 
+    def test_on_accept_includes_startup_warmup(self):
+        dialog = SettingsDialog({"app": {"startup_warmup": ["encoders"]}})
+        assert dialog._warmup_checks["encoders"].isChecked()
+        assert not dialog._warmup_checks["whisper"].isChecked()
+        dialog._warmup_checks["librosa"].setChecked(True)
+        dialog._on_accept()
+        assert dialog.result_settings["app"]["startup_warmup"] == ["librosa", "encoders"]
+
 
 # ------------------------------------------------------------------
 # Whisper model management section
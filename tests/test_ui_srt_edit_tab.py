@@ -87,6 +87,32 @@ class TestSrtEditTabSessionIntegration:
         assert np.array_equal(first[0], second[0])
         assert first[1] == second[1] == 44100
 
+    def test_silence_detection_reuses_cached_waveform(self, monkeypatch):
+        tab = SrtEditTab()
+        ctx = WorkspaceContext()
+        tab.set_workspace_context(ctx)
+
+        audio_path = "/tmp/cached-silence.wav"
+        sr = 8000
+        tone = 0.5 * np.sin(np.arange(sr) * 0.3)
+        samples = np.concatenate([tone, np.zeros(sr), tone]).astype(np.float32)
+        ctx.store_analysis(
+            ctx.make_analysis_cache_key(audio_path, "waveform", "mono@native_sr"),
+            (samples, sr),
+        )
+
+        def fail_decode(*_args, **_kwargs):
+            raise AssertionError("cached waveform should be reused")
+
+        monkeypatch.setattr(
+            "audio_visualizer.srt.io.audioHelpers.detect_silences", fail_decode
+        )
+        silences = tab._detect_silences(audio_path)
+
+        assert len(silences) == 1
+        assert abs(silences[0][0] - 1.0) < 0.02
+        assert abs(silences[0][1] - 2.0) < 0.02
+
     def test_save_registers_subtitle_asset(self, tmp_path):
         tab = SrtEditTab()
         ctx = WorkspaceContext()
@@ -1015,3 +1041,50 @@ class TestHoverableRegionItem:
         region.hoverLeaveEvent(None)
         for line in region.lines:
             assert line.pen.width() == _NORMAL_BORDER_WIDTH
+
+
+class TestFollowStreamingOutput:
+    """Follow shows SRT Gen's .partial file, then the reconciled output."""
+
+    def test_stream_then_finish_reloads_the_output(self, tmp_path):
+        from types import SimpleNamespace
+
+        from audio_visualizer.srt.core.streamingOutput import StreamingSubtitleWriter
+        from audio_visualizer.srt.io.outputWriters import write_srt
+        from audio_visualizer.srt.models import ResolvedConfig, SubtitleBlock
+
+        segments, silences, t = [], [], 0.0
+        for i in range(12):
+            words = [SimpleNamespace(start=t + 0.4 * j, end=t + 0.4 * j + 0.3, word=f" w{i}_{j}") for j in range(4)]
+            segments.append(SimpleNamespace(start=t, end=words[-1].end, text="", words=words))
+            silences.append((words[-1].end + 0.05, words[-1].end + 0.95))
+            t = words[-1].end + 1.0
+
+        output = tmp_path / "out.srt"
+        output.write_text("1\n00:00:00,000 --> 00:00:01,000\nPrevious run\n", encoding="utf-8")
+        tab = SrtEditTab()
+        tab._load_subtitle(str(output))
+        tab._follow_cb.setChecked(True)
+        tab._on_follow_tick()
+        assert [e.text for e in tab._document.entries] == ["Previous run"]
+
+        writer = StreamingSubtitleWriter(output, "srt", ResolvedConfig(), silences)
+        for seg in segments:
+            writer.add_segment(seg)
+        writer.close()
+        tab._on_follow_tick()
+        streamed = len(tab._document.entries)
+        assert 0 < streamed < len(segments)
+        assert tab._subtitle_path == str(output)
+        assert tab._subtitle_source == str(writer.partial_path)
+
+        final = [SubtitleBlock(start=s.start, end=s.words[-1].end, lines=[f"final {i}"]) for i, s in enumerate(segments)]
+        write_srt(final, writer.partial_path, max_chars=42, max_lines=2)
+        writer.finish()
+        tab._on_follow_tick()
+        assert [e.text for e in tab._document.entries] == [f"final {i}" for i in range(len(segments))]
+        assert tab._subtitle_source == str(output)
+
+        tab._on_save()
+        assert not writer.partial_path.exists()
+        assert "final 11" in output.read_text(encoding="utf-8")
@@ -39,6 +39,9 @@ class TestSrtGenTabSettings:
             "model",
             "device",
             "lora_name",
+            "use_model_server",
+            "use_transcript_cache",
+            "stream_output",
             "mode",
             "language",
             "word_level",
@@ -67,6 +70,7 @@ class TestSrtGenTabSettings:
             "vad_filter", "condition_on_previous_text",
             "no_speech_threshold", "log_prob_threshold",
             "compression_ratio_threshold", "initial_prompt",
+            "parallel_mode", "parallel_workers", "parallel_chunk_sec",
         }
         assert set(settings["transcription"].keys()) == tx_keys
 
@@ -92,6 +96,9 @@ class TestSrtGenTabSettings:
             "format": "vtt",
             "model": "medium",
             "device": "cuda",
+            "use_model_server": True,
+            "use_transcript_cache": False,
+            "stream_output": True,
             "mode": "shorts",
             "language": "en",
             "word_level": False,
@@ -115,6 +122,9 @@ class TestSrtGenTabSettings:
                 "log_prob_threshold": -0.5,
                 "compression_ratio_threshold": 3.0,
                 "initial_prompt": "test prompt",
+                "parallel_mode": "replicas",
+                "parallel_workers": 3,
+                "parallel_chunk_sec": 60.0,
             },
             "silence": {
                 "silence_min_dur": 0.3,
@@ -142,6 +152,9 @@ class TestSrtGenTabSettings:
         assert restored["format"] == custom["format"]
         assert restored["model"] == custom["model"]
         assert restored["device"] == custom["device"]
+        assert restored["use_model_server"] is True
+        assert restored["use_transcript_cache"] is False
+        assert restored["stream_output"] is True
         assert restored["mode"] == custom["mode"]
         assert restored["language"] == custom["language"]
         assert restored["word_level"] == custom["word_level"]
@@ -149,6 +162,9 @@ class TestSrtGenTabSettings:
         assert restored["transcription"]["vad_filter"] == custom["transcription"]["vad_filter"]
         assert restored["transcription"]["condition_on_previous_text"] == custom["transcription"]["condition_on_previous_text"]
         assert restored["transcription"]["initial_prompt"] == custom["transcription"]["initial_prompt"]
+        assert restored["transcription"]["parallel_mode"] == "replicas"
+        assert restored["transcription"]["parallel_workers"] == 3
+        assert restored["transcription"]["parallel_chunk_sec"] == 60.0
         assert restored["silence"] == custom["silence"]
         assert restored["side_outputs"] == custom["side_outputs"]
         assert restored["diarize"] == custom["diarize"]